@@ -1,6 +1,7 @@
 from conan import ConanFile, tools
-from conan.errors import ConanException
-import os, glob
+from conan.errors import ConanException, ConanInvalidConfiguration
+from io import StringIO
+import os, glob, hashlib, json, re, shutil, time
 
 class PcreConan(ConanFile):
     name = "pcre2"
@@ -22,11 +23,21 @@ class PcreConan(ConanFile):
         "build_pcre2_16": [True, False],
         "build_pcre2_32": [True, False],
         "build_pcre2grep": [True, False],
+        "build_pcre2precompile": [True, False],
+        "build_pcre2analyze": [True, False],
         "with_zlib": [True, False],
         "with_bzip2": [True, False],
         "support_jit": [True, False],
+        "jit_chunk_size": [65536, 131072, 262144, 524288, 1048576, 2097152, 4194304, 8388608, 16777216],
+        "instrumentation": [True, False],
         "grep_support_callout_fork": [True, False],
+        "grep_support_parallel": [True, False],
         "link_size": [2, 3, 4],
+        "unity_build": [True, False],
+        "ucd_tables": ["full", "no_bidi", "no_bprops", "scripts", "categories"],
+        "relro": ["default", "none", "partial", "full"],
+        "hash_style": ["default", "gnu", "sysv", "both"],
+        "symbolic_functions": [True, False],
     }
     default_options = {
         "ninja": True,
@@ -38,11 +49,21 @@ class PcreConan(ConanFile):
         "build_pcre2_16": True,
         "build_pcre2_32": False,
         "build_pcre2grep": False,
+        "build_pcre2precompile": True,
+        "build_pcre2analyze": False,
         "with_zlib": False,
         "with_bzip2": False,
         "support_jit": True,
+        "jit_chunk_size": 65536,
+        "instrumentation": False,
         "grep_support_callout_fork": True,
+        "grep_support_parallel": True,
         "link_size": 2,
+        "unity_build": False,
+        "ucd_tables": "full",
+        "relro": "default",
+        "hash_style": "default",
+        "symbolic_functions": False,
     }
 
     exports_sources = "src/*", "regex.h"
@@ -60,14 +81,24 @@ class PcreConan(ConanFile):
             self.options.rm_safe("fPIC")
         self.settings.rm_safe("compiler.cppstd")
         self.settings.rm_safe("compiler.libcxx")
+        if not self.options.support_jit:
+            self.options.rm_safe("jit_chunk_size")
+        if not self.options.shared or not self._is_elf:
+            self.options.rm_safe("relro")
+            self.options.rm_safe("hash_style")
+            self.options.rm_safe("symbolic_functions")
         if not self.options.build_pcre2grep:
             self.options.rm_safe("with_zlib")
             self.options.rm_safe("with_bzip2")
             self.options.rm_safe("grep_support_callout_fork")
+        if not self.options.build_pcre2grep or self.settings.os == "Windows":
+            self.options.rm_safe("grep_support_parallel")
         if not self.options.build_pcre2_8 and not self.options.build_pcre2_16 and not self.options.build_pcre2_32:
             raise ConanInvalidConfiguration("At least one of build_pcre2_8, build_pcre2_16 or build_pcre2_32 must be enabled")
         if self.options.build_pcre2grep and not self.options.build_pcre2_8:
             raise ConanInvalidConfiguration("build_pcre2_8 must be enabled for the pcre2grep program")
+        if self.options.build_pcre2analyze and not self.options.build_pcre2_8:
+            raise ConanInvalidConfiguration("build_pcre2_8 must be enabled for the pcre2analyze program")
 
     def build_requirements(self):
         if self.options.ninja:
@@ -94,12 +125,21 @@ class PcreConan(ConanFile):
         if self.settings.os != "Windows":
             tc.variables["CMAKE_POSITION_INDEPENDENT_CODE"] = "ON"
         
-        tc.variables["BUILD_SHARED_LIBS"] = self.options.shared
-        tc.variables["BUILD_STATIC_LIBS"] = not self.options.shared
-        #
-        tc.variables["PCRE2_BUILD_PCRE2_8"] = self.options.build_pcre2_8
-        tc.variables["PCRE2_BUILD_PCRE2_16"] = self.options.build_pcre2_16
-        tc.variables["PCRE2_BUILD_PCRE2_32"] = self.options.build_pcre2_32
+        if self._multi_variant_folder:
+            # One tree builds every width and both linkages; package() picks out this variant
+            tc.blocks.remove("shared")
+            tc.variables["BUILD_SHARED_LIBS"] = True
+            tc.variables["BUILD_STATIC_LIBS"] = True
+            tc.variables["PCRE2_BUILD_PCRE2_8"] = True
+            tc.variables["PCRE2_BUILD_PCRE2_16"] = True
+            tc.variables["PCRE2_BUILD_PCRE2_32"] = True
+        else:
+            tc.variables["BUILD_SHARED_LIBS"] = self.options.shared
+            tc.variables["BUILD_STATIC_LIBS"] = not self.options.shared
+            #
+            tc.variables["PCRE2_BUILD_PCRE2_8"] = self.options.build_pcre2_8
+            tc.variables["PCRE2_BUILD_PCRE2_16"] = self.options.build_pcre2_16
+            tc.variables["PCRE2_BUILD_PCRE2_32"] = self.options.build_pcre2_32
         
         tc.variables["PCRE2_EBCDIC"] = "OFF"
         tc.variables["PCRE2_EBCDIC_NL25"] = "OFF"
@@ -108,40 +148,216 @@ class PcreConan(ConanFile):
         tc.variables["PCRE2_SUPPORT_LIBBZ2"] = self.options.get_safe("with_bzip2", False)
 
         tc.variables["PCRE2_BUILD_PCRE2GREP"] = self.options.build_pcre2grep
+        tc.variables["PCRE2_BUILD_PCRE2PRECOMPILE"] = self.options.build_pcre2precompile
+        tc.variables["PCRE2_BUILD_PCRE2ANALYZE"] = self.options.build_pcre2analyze
         tc.variables["PCRE2_BUILD_TESTS"] = "OFF"
         
         tc.variables["PCRE2_SUPPORT_LIBEDIT"] = "OFF"
         tc.variables["PCRE2_SUPPORT_LIBREADLINE"] = "OFF"
         
         tc.variables["PCRE2_SUPPORT_JIT"] = self.options.support_jit
+        tc.variables["PCRE2_JIT_CHUNK_SIZE"] = self.options.get_safe("jit_chunk_size", 65536)
+        tc.variables["PCRE2_SUPPORT_INSTRUMENTATION"] = self.options.instrumentation
 
         tc.variables["PCRE2_LINK_SIZE"] = self.options.link_size
+        tc.variables["PCRE2_UNITY_BUILD"] = self.options.unity_build
+        tc.variables["PCRE2_UCD_OMIT"] = ";".join(self._ucd_omit[str(self.options.ucd_tables)])
+        tc.variables["PCRE2_SYMBOLIC_FUNCTIONS"] = self.options.get_safe("symbolic_functions", False)
+        tc.extra_sharedlinkflags.extend(self._shared_link_flags)
         tc.variables["PCRE2GREP_SUPPORT_CALLOUT_FORK"] = self.options.get_safe("grep_support_callout_fork", False)
+        tc.variables["PCRE2GREP_SUPPORT_PARALLEL"] = self.options.get_safe("grep_support_parallel", False)
 
         if tools.microsoft.is_msvc(self):
             tc.variables["PCRE2_STATIC_RUNTIME"] = tools.microsoft.is_msvc_static_runtime(self)
             tc.variables["INSTALL_MSVC_PDB"] = "ON"
         tc.generate()
 
+    # Unicode properties left out of the UCD tables for each ucd_tables value.
+    # "scripts" keeps scripts and general categories, "categories" keeps only
+    # the general categories (plus the case and grapheme break data that every
+    # library needs). Patterns using an omitted property fail to compile.
+    _ucd_omit = {
+        "full": [],
+        "no_bidi": ["bidi"],
+        "no_bprops": ["bprops"],
+        "scripts": ["bidi", "bprops"],
+        "categories": ["scripts", "bidi", "bprops"],
+    }
+
+    @property
+    def _is_elf(self):
+        return self.settings.os not in ("Windows", "WindowsStore", "Macos", "iOS", "tvOS", "watchOS")
+
+    # Linker flags for the relro and hash_style options. Full RELRO binds every
+    # symbol when the library is loaded, which costs a little more at startup
+    # than lazy binding; symbolic_functions reduces the number of symbols to bind.
+    @property
+    def _shared_link_flags(self):
+        relro = {
+            "none": ["-Wl,-z,norelro"],
+            "partial": ["-Wl,-z,relro", "-Wl,-z,lazy"],
+            "full": ["-Wl,-z,relro", "-Wl,-z,now"],
+        }
+        flags = list(relro.get(str(self.options.get_safe("relro", "default")), []))
+        hash_style = str(self.options.get_safe("hash_style", "default"))
+        if hash_style != "default":
+            flags.append(f"-Wl,--hash-style={hash_style}")
+        return flags
+
+    # Multi-variant mode. When the conf item user.pcre2:multi_variant_folder names a
+    # folder, every package that shares settings and the options below builds in one
+    # CMake tree there, configured once with all widths and both shared and static
+    # libraries. Later packages find the tree already built, and each package copies
+    # out only its own libraries. Link size, JIT and the other options that change the
+    # compiled code get a tree of their own. Requires the ninja option, and packages
+    # must not be built concurrently. pcre2_config(PCRE2_CONFIG_COMPILED_WIDTHS) reports
+    # all three widths in packages built this way.
+    _multi_variant_options = ("shared", "fPIC", "dll_sign", "pcre2posix",
+                              "build_pcre2_8", "build_pcre2_16", "build_pcre2_32")
+    # Options of shared packages only. Static packages count as having their default
+    # values, and those are left out of the key, so that both still share one tree.
+    _shared_link_options = ("relro", "hash_style", "symbolic_functions")
+
+    @property
+    def _multi_variant_folder(self):
+        folder = self.conf.get("user.pcre2:multi_variant_folder")
+        if folder and not self.options.ninja:
+            self.output.warning("user.pcre2:multi_variant_folder is ignored without the ninja option")
+            return None
+        return folder
+
+    def _multi_variant_tree(self):
+        items = [f"{key}={value}" for key, value in self.settings.items()]
+        items += [f"{key}={value}" for key, value in self.options.items()
+                  if key not in self._multi_variant_options + self._shared_link_options]
+        items += [f"{key}={self.options.get_safe(key)}" for key in self._shared_link_options
+                  if str(self.options.get_safe(key, self.default_options[key])) != str(self.default_options[key])]
+        items.append(f"version={self.version}")
+        key = hashlib.sha1("\n".join(sorted(items)).encode()).hexdigest()[:16]
+        return os.path.join(self._multi_variant_folder, key)
+
+    def _build_multi_variant(self):
+        tree = self._multi_variant_tree()
+        build_folder = os.path.join(tree, "build")
+        if not os.path.isfile(os.path.join(build_folder, "CMakeCache.txt")):
+            # Keep a copy of the toolchain: this package's generators folder may be removed
+            # while later packages still rebuild the tree
+            generators = os.path.join(tree, "generators")
+            tools.files.copy(self, "*", src=self.generators_folder, dst=generators)
+            toolchain = os.path.join(generators, "conan_toolchain.cmake")
+            self.run(f'cmake -G Ninja -S "{self.source_folder}" -B "{build_folder}" '
+                     f'-DCMAKE_TOOLCHAIN_FILE="{toolchain}" -DCMAKE_BUILD_TYPE={self.settings.build_type}')
+        else:
+            self.output.info(f"Reusing the multi-variant build in {build_folder}")
+        self.run(f'cmake --build "{build_folder}"')
+        self.run(f'cmake --install "{build_folder}" --prefix "{os.path.join(tree, "install")}"')
+
+    def _package_multi_variant(self):
+        install = os.path.join(self._multi_variant_tree(), "install")
+        bin_folder = os.path.join(self.package_folder, "bin")
+        lib_folder = os.path.join(self.package_folder, "lib")
+        tools.files.copy(self, "*", src=os.path.join(install, "include"), dst=os.path.join(self.package_folder, "include"))
+        tools.files.copy(self, "*", src=os.path.join(install, "bin"), dst=bin_folder, excludes=("*.dll", "*.pdb"))
+        names = ["pcre2-%d" % width for width in (8, 16, 32) if self.options.get_safe("build_pcre2_%d" % width)]
+        if self.options.build_pcre2_8:
+            names.append("pcre2-posix")
+        for name in names:
+            if self.options.shared:
+                for pattern in (f"lib{name}.so*", f"lib{name}.*dylib", f"lib{name}*.dll.a", f"{name}*.lib"):
+                    tools.files.copy(self, pattern, src=os.path.join(install, "lib"), dst=lib_folder, excludes="*-static*")
+                for pattern in (f"*{name}*.dll", f"{name}*.pdb"):
+                    tools.files.copy(self, pattern, src=os.path.join(install, "bin"), dst=bin_folder)
+            else:
+                for pattern in (f"lib{name}.a", f"{name}-static*.lib"):
+                    tools.files.copy(self, pattern, src=os.path.join(install, "lib"), dst=lib_folder)
+
     def build(self):
-        cmake = tools.cmake.CMake(self)
-        cmake.configure()
-        cmake.build()
+        start = time.monotonic()
+        if self._multi_variant_folder:
+            self._build_multi_variant()
+        else:
+            cmake = tools.cmake.CMake(self)
+            cmake.configure()
+            configured = time.monotonic()
+            cmake.build()
+        # Build times go in the package metadata, to compare options such as unity_build
+        times = {
+            "unity_build": bool(self.options.unity_build),
+            "multi_variant": bool(self._multi_variant_folder),
+            "total_seconds": round(time.monotonic() - start, 1),
+        }
+        if not self._multi_variant_folder:
+            times["configure_seconds"] = round(configured - start, 1)
+        tools.files.save(self, os.path.join(self.package_metadata_folder, "build-times.json"), json.dumps(times, indent=2))
 
     def package(self):
-        cmake = tools.cmake.CMake(self)
-        cmake.install()
+        if self._multi_variant_folder:
+            self._package_multi_variant()
+        else:
+            cmake = tools.cmake.CMake(self)
+            cmake.install()
         tools.files.rmdir(self, os.path.join(self.package_folder, "cmake"))
         tools.files.rmdir(self, os.path.join(self.package_folder, "man"))
         tools.files.rmdir(self, os.path.join(self.package_folder, "share"))
         tools.files.rmdir(self, os.path.join(self.package_folder, "lib", "pkgconfig"))
         tools.files.rmdir(self, os.path.join(self.package_folder, "lib", "cmake"))
+        if self.options.build_pcre2precompile:
+            tools.files.copy(self, "pcre2-precompile.cmake", src=os.path.join(self.source_folder, "cmake"), dst=os.path.join(self.package_folder, "lib", "cmake"))
         if self.options.get_safe("pcre2posix"):
             tools.files.copy(self, "regex.h", src=self.export_sources_folder, dst=os.path.join(self.package_folder, "include"), keep_path=False)
+        if self.options.shared and self._is_elf:
+            self._check_shared_libraries()
         # Sign DLL
         if self.options.get_safe("dll_sign"):
             self.python_requires["windows_signtool"].module.sign(self, [os.path.join(self.package_folder, "bin", "*.dll")])
         
+    def _readelf(self, readelf, args, path):
+        output = StringIO()
+        self.run(f'"{readelf}" {args} "{path}"', stdout=output, quiet=True)
+        return output.getvalue()
+
+    # Counts the dynamic relocations and exported symbols of each shared library, which
+    # decide what loading it costs, and saves them in the package metadata as
+    # elf-check.json for comparing builds. Text relocations, or exports other than the
+    # pcre2_ functions, fail the package.
+    def _check_shared_libraries(self):
+        readelf = shutil.which("readelf")
+        if not readelf:
+            self.output.warning("readelf not found, the shared libraries are not checked")
+            return
+        report = {}
+        for path in sorted(glob.glob(os.path.join(self.package_folder, "lib", "*.so*"))):
+            if os.path.islink(path):
+                continue
+            relocations = {}
+            for line in self._readelf(readelf, "-rW", path).splitlines():
+                fields = line.split()
+                if len(fields) > 2 and fields[2].startswith("R_"):
+                    relocations[fields[2]] = relocations.get(fields[2], 0) + 1
+            exports = []
+            for line in self._readelf(readelf, "--dyn-syms -W", path).splitlines():
+                fields = line.split()
+                if len(fields) > 7 and fields[4] in ("GLOBAL", "WEAK") and fields[6] != "UND":
+                    exports.append(fields[7].split("@")[0])
+            dynamic = self._readelf(readelf, "-dW", path)
+            name = os.path.basename(path)
+            report[name] = {
+                "relocations": relocations,
+                "exports": len(exports),
+                "textrel": "TEXTREL" in dynamic,
+                "relro": "GNU_RELRO" in self._readelf(readelf, "-lW", path),
+                "bind_now": "BIND_NOW" in dynamic or re.search(r"Flags:.*\bNOW\b", dynamic) is not None,
+                "gnu_hash": "(GNU_HASH)" in dynamic,
+                "sysv_hash": "(HASH)" in dynamic,
+            }
+            self.output.info(f"{name}: {sum(relocations.values())} relocations, {len(exports)} exports")
+            if report[name]["textrel"]:
+                raise ConanException(f"{name} has text relocations")
+            others = [symbol for symbol in exports if not symbol.startswith("pcre2_")]
+            if others:
+                raise ConanException(f"{name} exports symbols outside the pcre2_ API: {', '.join(others)}")
+        tools.files.save(self, os.path.join(self.package_metadata_folder, "elf-check.json"), json.dumps(report, indent=2))
+
     def _lib_name(self, name):
         libname = name
         if tools.scm.Version(self.version) >= "10.38" and tools.microsoft.is_msvc(self) and not self.options.shared:
@@ -158,6 +374,9 @@ class PcreConan(ConanFile):
         self.cpp_info.set_property("cmake_file_name", "PCRE2")
         self.cpp_info.set_property("pkg_config_name", "libpcre2")
         self.cpp_info.set_property("cmake_target_name", "PCRE2::PCRE2")
+        if self.options.build_pcre2precompile:
+            # Provides pcre2_precompile_patterns(), which runs bin/pcre2precompile
+            self.cpp_info.set_property("cmake_build_modules", [os.path.join("lib", "cmake", "pcre2-precompile.cmake")])
         if self.options.build_pcre2_8:
             # pcre2-8
             self.cpp_info.components["pcre2-8"].set_property("cmake_target_name", "PCRE2::8BIT")
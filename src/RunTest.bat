@@ -67,6 +67,12 @@ set support16=%ERRORLEVEL%
 set support32=%ERRORLEVEL%
 %pcre2test% -C unicode >NUL
 set unicode=%ERRORLEVEL%
+%pcre2test% -C ucd-scripts >NUL
+set ucdscripts=%ERRORLEVEL%
+%pcre2test% -C ucd-bidi >NUL
+set ucdbidi=%ERRORLEVEL%
+%pcre2test% -C ucd-bprops >NUL
+set ucdbprops=%ERRORLEVEL%
 %pcre2test% -C jit >NUL
 set jit=%ERRORLEVEL%
 %pcre2test% -C backslash-C >NUL
@@ -329,6 +335,10 @@ goto :eof
 if %unicode% EQU 0 (
   echo Test 4 Skipped due to absence of Unicode support.
   goto :eof
+)
+if %ucdscripts%%ucdbidi%%ucdbprops% NEQ 111 (
+  echo Test 4 Skipped because some Unicode property data was omitted.
+  goto :eof
 )
   call :runsub 4 testout "UTF-%bits% and Unicode property support - (Compatible with Perl >= 5.10)" -q
   if %jit% EQU 1 call :runsub 4 testoutjit "Test with JIT Override" -q -jit
@@ -338,6 +348,10 @@ goto :eof
 if %unicode% EQU 0 (
   echo Test 5 Skipped due to absence of Unicode support.
   goto :eof
+)
+if %ucdscripts%%ucdbidi%%ucdbprops% NEQ 111 (
+  echo Test 5 Skipped because some Unicode property data was omitted.
+  goto :eof
 )
   call :runsub 5 testout "API, internals, and non-Perl stuff for UTF-%bits% and UCP" -q
   if %jit% EQU 1 call :runsub 5 testoutjit "Test with JIT Override" -q -jit
@@ -351,6 +365,10 @@ goto :eof
 if %unicode% EQU 0 (
   echo Test 7 Skipped due to absence of Unicode support.
   goto :eof
+)
+if %ucdscripts%%ucdbidi%%ucdbprops% NEQ 111 (
+  echo Test 7 Skipped because some Unicode property data was omitted.
+  goto :eof
 )
   call :runsub 7 testout "DFA matching with UTF-%bits% and Unicode property support" -q
   goto :eof
@@ -406,6 +424,10 @@ if %bits% EQU 8 (
 if %unicode% EQU 0 (
   echo Test 12 Skipped due to absence of Unicode support.
   goto :eof
+)
+if %ucdscripts% EQU 0 (
+  echo Test 12 Skipped because the Unicode script data was omitted.
+  goto :eof
 )
   call :runsub 12 testout "Specials for the 16/32-bit library with Unicode support" -q
   if %jit% EQU 1 call :runsub 12 testoutjit "Test with JIT Override" -q -jit
@@ -526,6 +548,10 @@ goto :eof
 if %unicode% EQU 0 (
   echo Test 26 Skipped due to absence of Unicode support.
   goto :eof
+)
+if %ucdscripts% EQU 0 (
+  echo Test 26 Skipped because the Unicode script data was omitted.
+  goto :eof
 )
   call :runsub 26 testout "Unicode property tests (Compatible with Perl >= 5.38)" -q
   if %jit% EQU 1 call :runsub 26 testoutjit "Test with JIT Override" -q -jit
@@ -535,6 +561,10 @@ goto :eof
 if %unicode% EQU 0 (
   echo Test 27 Skipped due to absence of Unicode support.
   goto :eof
+)
+if %ucdscripts% EQU 0 (
+  echo Test 27 Skipped because the Unicode script data was omitted.
+  goto :eof
 )
   call :runsub 27 testout "Auto-generated unicode property tests" -q
   if %jit% EQU 1 call :runsub 27 testoutjit "Test with JIT Override" -q -jit
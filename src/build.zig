@@ -81,18 +81,22 @@ pub fn build(b: *std.Build) !void {
             "src/pcre2_context.c",
             "src/pcre2_convert.c",
             "src/pcre2_dfa_match.c",
+            "src/pcre2_engine.c",
             "src/pcre2_error.c",
             "src/pcre2_extuni.c",
             "src/pcre2_find_bracket.c",
+            "src/pcre2_instrument.c",
             "src/pcre2_jit_compile.c",
             "src/pcre2_maketables.c",
             "src/pcre2_match.c",
+            "src/pcre2_match_batch.c",
             "src/pcre2_match_data.c",
             "src/pcre2_newline.c",
             "src/pcre2_ord2utf.c",
             "src/pcre2_pattern_info.c",
             "src/pcre2_script_run.c",
             "src/pcre2_serialize.c",
+            "src/pcre2_stream.c",
             "src/pcre2_string_utils.c",
             "src/pcre2_study.c",
             "src/pcre2_substitute.c",
@@ -0,0 +1,68 @@
+# pcre2_precompile_patterns(<target> PATTERNS <file>
+#                           [NAME <symbol>] [WIDTH 8|16|32] [OPTIONS <flag>...])
+#
+# Compile the patterns listed in <file> (one per line) at build time with
+# pcre2precompile, and add the serialized result to <target> as a generated C
+# source file. A header called <symbol>.h is generated alongside it and its
+# directory is added to the target's include path. At run time the patterns are
+# restored with:
+#
+#   pcre2_code *codes[<symbol>_COUNT];
+#   <symbol>_decode(codes, NULL);
+#
+# which checks that the library is the version of PCRE2 recorded in the header
+# (<symbol>_PCRE2_MAJOR and <symbol>_PCRE2_MINOR) before decoding the patterns.
+# Call pcre2_jit_compile() on them afterwards if required. NAME defaults to
+# pcre2_patterns, WIDTH to 8. OPTIONS are passed to pcre2precompile, for
+# example -i or -u.
+#
+# Serialized patterns can only be decoded by the PCRE2 library they were made
+# with, so pcre2precompile must come from the same build of PCRE2 as the
+# libraries that the target links with. When cross-compiling, set
+# PCRE2_PRECOMPILE_EXECUTABLE to a pcre2precompile that runs on the build
+# machine and was built with the same configuration (including pointer size).
+
+if(NOT PCRE2_PRECOMPILE_EXECUTABLE)
+  find_program(
+    PCRE2_PRECOMPILE_EXECUTABLE
+    pcre2precompile
+    HINTS "${CMAKE_CURRENT_LIST_DIR}/../../bin" "${CMAKE_CURRENT_LIST_DIR}/../../../bin"
+    NO_DEFAULT_PATH
+  )
+endif()
+
+function(pcre2_precompile_patterns target)
+  cmake_parse_arguments(PARSE_ARGV 1 arg "" "PATTERNS;NAME;WIDTH" "OPTIONS")
+
+  if(NOT arg_PATTERNS)
+    message(FATAL_ERROR "pcre2_precompile_patterns: PATTERNS is required")
+  endif()
+  if(NOT arg_NAME)
+    set(arg_NAME pcre2_patterns)
+  endif()
+  if(NOT arg_WIDTH)
+    set(arg_WIDTH 8)
+  endif()
+  if(NOT PCRE2_PRECOMPILE_EXECUTABLE)
+    message(FATAL_ERROR "pcre2_precompile_patterns: pcre2precompile was not found; set PCRE2_PRECOMPILE_EXECUTABLE")
+  endif()
+
+  get_filename_component(patterns "${arg_PATTERNS}" ABSOLUTE)
+  set(outdir "${CMAKE_CURRENT_BINARY_DIR}/pcre2_precompiled")
+  set(source "${outdir}/${arg_NAME}.c")
+  set(header "${outdir}/${arg_NAME}.h")
+
+  add_custom_command(
+    OUTPUT "${source}" "${header}"
+    COMMAND ${CMAKE_COMMAND} -E make_directory "${outdir}"
+    COMMAND
+      "${PCRE2_PRECOMPILE_EXECUTABLE}" -w ${arg_WIDTH} -n ${arg_NAME} ${arg_OPTIONS} "${patterns}" "${source}"
+      "${header}"
+    DEPENDS "${patterns}" "${PCRE2_PRECOMPILE_EXECUTABLE}"
+    COMMENT "Precompiling PCRE2 patterns from ${arg_PATTERNS}"
+    VERBATIM
+  )
+
+  target_sources(${target} PRIVATE "${source}" "${header}")
+  target_include_directories(${target} PRIVATE "${outdir}")
+endfunction()
@@ -118,6 +118,7 @@ struct free_block {
 static struct free_block* free_blocks;
 static sljit_uw allocated_size;
 static sljit_uw total_size;
+static sljit_uw chunk_count;
 
 static SLJIT_INLINE void sljit_insert_free_block(struct free_block *free_block, sljit_uw size)
 {
@@ -208,6 +209,7 @@ SLJIT_API_FUNC_ATTRIBUTE void* sljit_malloc_exec(sljit_uw size)
 
 	chunk_size -= CHUNK_EXTRA_SIZE;
 	total_size += chunk_size;
+	chunk_count++;
 
 	header = (struct block_header*)(((sljit_u8*)chunk_header) + CHUNK_HEADER_SIZE);
 
@@ -285,6 +287,7 @@ SLJIT_API_FUNC_ATTRIBUTE void sljit_free_exec(void *ptr)
 		/* If this block is freed, we still have (allocated_size / 2) free space. */
 		if (total_size - free_block->size > (allocated_size * 3 / 2)) {
 			total_size -= free_block->size;
+			chunk_count--;
 			sljit_remove_free_block(free_block);
 			free_chunk(free_block, free_block->size + CHUNK_EXTRA_SIZE);
 		}
@@ -308,6 +311,7 @@ SLJIT_API_FUNC_ATTRIBUTE void sljit_free_unused_memory_exec(void)
 		if (!free_block->header.prev_size &&
 				AS_BLOCK_HEADER(free_block, free_block->size)->size == 1) {
 			total_size -= free_block->size;
+			chunk_count--;
 			sljit_remove_free_block(free_block);
 			free_chunk(free_block, free_block->size + CHUNK_EXTRA_SIZE);
 		}
@@ -319,6 +323,25 @@ SLJIT_API_FUNC_ATTRIBUTE void sljit_free_unused_memory_exec(void)
 	SLJIT_ALLOCATOR_UNLOCK();
 }
 
+SLJIT_API_FUNC_ATTRIBUTE void sljit_get_exec_allocator_stats(struct sljit_exec_allocator_stats *stats)
+{
+	struct free_block* free_block;
+
+	SLJIT_ALLOCATOR_LOCK();
+	stats->chunk_count = chunk_count;
+	stats->total_size = total_size;
+	stats->allocated_size = allocated_size;
+	stats->free_block_count = 0;
+	stats->largest_free_block = 0;
+
+	for (free_block = free_blocks; free_block; free_block = free_block->next) {
+		stats->free_block_count++;
+		if (free_block->size > stats->largest_free_block)
+			stats->largest_free_block = free_block->size;
+	}
+	SLJIT_ALLOCATOR_UNLOCK();
+}
+
 #ifdef SLJIT_HAS_EXECUTABLE_OFFSET
 SLJIT_API_FUNC_ATTRIBUTE sljit_sw sljit_exec_offset(void *code)
 {
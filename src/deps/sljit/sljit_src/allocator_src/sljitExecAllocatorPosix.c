@@ -27,6 +27,11 @@
 #include <sys/types.h>
 #include <sys/mman.h>
 
+#ifndef SLJIT_HUGE_PAGE_SIZE
+/* 2 MByte if not specified. */
+#define SLJIT_HUGE_PAGE_SIZE	((sljit_uw)0x200000)
+#endif /* SLJIT_HUGE_PAGE_SIZE */
+
 static SLJIT_INLINE void* alloc_chunk(sljit_uw size)
 {
 	void *retval;
@@ -47,6 +52,28 @@ static SLJIT_INLINE void* alloc_chunk(sljit_uw size)
 	fd = dev_zero;
 #endif /* MAP_ANON */
 
+#if defined(__linux__) && defined(MADV_HUGEPAGE)
+	/* When chunks are a multiple of the huge page size, align them so
+	   that the kernel can back them with huge pages, which reduces the
+	   iTLB pressure of many small JIT compiled functions. */
+	if (!(size & (SLJIT_HUGE_PAGE_SIZE - 1))) {
+		sljit_uw head;
+
+		retval = mmap(NULL, size + SLJIT_HUGE_PAGE_SIZE, prot, flags, fd, 0);
+		if (retval == MAP_FAILED)
+			return NULL;
+
+		head = (sljit_uw)(-(sljit_sw)retval) & (SLJIT_HUGE_PAGE_SIZE - 1);
+		if (head)
+			munmap(retval, head);
+		retval = (sljit_u8*)retval + head;
+		munmap((sljit_u8*)retval + size, SLJIT_HUGE_PAGE_SIZE - head);
+
+		madvise(retval, size, MADV_HUGEPAGE);
+		return retval;
+	}
+#endif /* __linux__ && MADV_HUGEPAGE */
+
 	retval = mmap(NULL, size, prot, flags, fd, 0);
 	if (retval == MAP_FAILED)
 		return NULL;
@@ -2577,6 +2577,23 @@ SLJIT_API_FUNC_ATTRIBUTE void sljit_set_function_context(void** func_ptr, struct
    it is sometimes desired to free all unused memory regions, e.g.
    before the application terminates. */
 SLJIT_API_FUNC_ATTRIBUTE void sljit_free_unused_memory_exec(void);
+
+#if !(defined SLJIT_WX_EXECUTABLE_ALLOCATOR && SLJIT_WX_EXECUTABLE_ALLOCATOR)
+/* Usage statistics of the executable allocator. The allocator carves
+   blocks out of chunks, which are obtained from the OS in multiples of
+   CHUNK_SIZE bytes. Sizes exclude the chunk headers. A large number of
+   free blocks compared to the size of the largest one means the free
+   space is fragmented. */
+struct sljit_exec_allocator_stats {
+	sljit_uw chunk_count;
+	sljit_uw total_size;
+	sljit_uw allocated_size;
+	sljit_uw free_block_count;
+	sljit_uw largest_free_block;
+};
+
+SLJIT_API_FUNC_ATTRIBUTE void sljit_get_exec_allocator_stats(struct sljit_exec_allocator_stats *stats);
+#endif /* !SLJIT_WX_EXECUTABLE_ALLOCATOR */
 #endif /* SLJIT_EXECUTABLE_ALLOCATOR */
 
 #ifdef __cplusplus
@@ -111,6 +111,15 @@
 # 14-January-2022:   Enlarge Boolean property offset to 12 bits
 # 28-January-2023:   Remove ASCII "other case" from non-ASCII character that
 #                      are present in caseless sets.
+# 19-October-2026:   Add code point range tables for scripts, general
+#                      categories, and Boolean properties.
+#                    Add the ucd_latin1_records table.
+#                    Add the ucd_fold_stage1 and ucd_fold_stage2 tables.
+#                    Add the --nocase-min-length and --nocase-sweep options,
+#                      and keep caseless set members out of nocase ranges.
+#                    Add a check of UCD_GB_SIMPLE_LIMIT.
+#                    Add the ucd_digit_set_blocks table.
+#                    Add the --omit option.
 #
 # ----------------------------------------------------------------------------
 #
@@ -141,6 +150,8 @@
 # each set of 10 decimal digits in Unicode. This is used to ensure that digits
 # in script runs all come from the same set. The first element in the vector
 # contains the number of subsequent elements, which are in ascending order.
+# The ucd_digit_set_blocks table gives, for each block of 256 characters, the
+# offset in ucd_digit_sets of the first set that ends in or after the block.
 #
 # Scripts are partitioned into two groups. Scripts that appear in at least one
 # character's script extension list come first, followed by "Unknown" and then
@@ -160,6 +171,16 @@
 # properties. Each bitmap consists of a fixed number of unsigned 32-bit
 # numbers, enough to allocate a bit for each supported Boolean property.
 #
+# The ucd_script_ranges, ucd_type_ranges, and ucd_boolprop_ranges tables list
+# the code points that have each script, general category (character type),
+# and Boolean property, as sorted ranges. Each range is one 32-bit value: the
+# first code point is in the top 21 bits and the length of the range less one
+# is in the bottom 11 bits, so a longer range takes more than one entry. The
+# ranges for value n are those from index[n] up to index[n+1] in each table's
+# companion index table. The two-stage lookup below remains the way to find the
+# properties of a single character; the range tables are for the compiler,
+# which can fold a whole property into a character class with them.
+#
 # The ucd_records table contains one instance of every unique character record
 # that is required. The ucd_stage1 table is indexed by a character's block
 # number, which is the character's code point divided by 128, since 128 is the
@@ -170,6 +191,31 @@
 # the offset of a character within its own block, and the result is the index
 # number of the required record in the ucd_records vector.
 #
+# The ucd_fold_stage1 and ucd_fold_stage2 tables are a two-stage table that
+# maps each character to the smallest code point that it matches caselessly,
+# as an offset. It stops at the block after the last character that has another
+# case; UCD_FOLD_LIMIT in pcre2_internal.h must match.
+#
+# The ucd_latin1_records table holds copies of the records for the first 256
+# characters, in code point order, so that the library can find them without
+# going through the two stages.
+#
+# The --omit option leaves out some of the columns, for libraries that do not
+# need all the Unicode properties. Its value is a comma-separated list of:
+#
+#   scripts   Script and Script_Extensions (the script field is kept, holding
+#               ucp_Unknown, because it costs no space)
+#   bidi      Bidi_Class
+#   bprops    Boolean properties
+#
+# The tables for the omitted properties are reduced to their minimum, and
+# records that differed only in an omitted column are merged, which makes the
+# stage 2 table smaller too. The record has no scriptx_bidiclass field when
+# both scripts and bidi are omitted, and no bprops field when bprops are
+# omitted. The library must be compiled with a PCRE2_UCD_OMIT_xxx macro for
+# each omitted column (the output checks this), and then does not recognize
+# those properties, nor script runs when scripts are omitted.
+#
 # The following examples are correct for the Unicode 14.0.0 database. Future
 # updates may make change the actual lookup values.
 #
@@ -266,6 +312,16 @@ MAX_LIST = 8             # keep on sync with the value in pcre2_auto_possess.c
 MAX_UNICODE = 0x110000
 NOTACHAR = 0xffffffff
 
+# The shortest run of characters with no other case that is listed in the
+# ucd_nocase_ranges table. Compiling a caseless class skips the listed runs and
+# checks the other characters one by one, so a smaller value makes the table
+# bigger but leaves fewer characters to check. The value was chosen by running
+# maint/NocaseRangesBench: below 8 the table grows quickly (1144 bytes at 1)
+# for no measurable gain, while above 16 compiling wide caseless classes gets
+# slower, by about 10% at 64 and 15% at 128.
+
+NOCASE_MIN_LENGTH = 8
+
 
 # ---------------------------------------------------------------------------
 #                         DEFINE FUNCTIONS
@@ -398,7 +454,7 @@ def compress_table(table, block_size):
 
 # Output a table
 
-def write_table(table, table_name, block_size = None):
+def write_table(table, table_name, block_size = None, limit = MAX_UNICODE):
   type, size = get_type_size(table)
   ELEMS_PER_LINE = 16
 
@@ -409,7 +465,7 @@ def write_table(table, table_name, block_size = None):
   table = tuple(table)
   if block_size is None:
     fmt = "%3d," * ELEMS_PER_LINE + " /* U+%04X */\n"
-    mult = MAX_UNICODE / len(table)
+    mult = limit / len(table)
     for i in range(0, len(table), ELEMS_PER_LINE):
       f.write(fmt % (table[i:i+ELEMS_PER_LINE] + (int(i * mult),)))
   else:
@@ -451,10 +507,11 @@ def get_record_size_struct(records):
     size += slice_size
     structure += '%s property_%d;\n' % (slice_type, i)
 
-  # round up to the first item of the next structure in array
-  record_slice = [record[0] for record in records]
-  slice_type, slice_size = get_type_size(record_slice)
-  size = (size + slice_size - 1) & -slice_size
+  # round up to the alignment of the structure, which is that of its largest
+  # item, so that the next structure in the array is aligned
+  align = max(get_type_size([record[i] for record in records])[1]
+    for i in range(len(records[0])))
+  size = (size + align - 1) & -align
 
   structure += '} ucd_record;\n*/\n'
   return size, structure
@@ -472,6 +529,21 @@ def write_records(records, record_size):
   f.write('};\n\n')
 
 
+# Write copies of the records for the first 256 characters, so that these
+# characters can be looked up directly
+
+def write_latin1_records(table, records, record_size):
+  record_list = [None] * len(records)
+  for record, i in records.items():
+    record_list[i] = record
+  f.write('const ucd_record PRIV(ucd_latin1_records)[] = { ' + \
+    '/* %d bytes, record size %d */\n' % (256 * record_size, record_size))
+  for c in range(256):
+    record = record_list[table[c]]
+    f.write(('  {' + '%6d, ' * len(record) + '}, /* U+%04X */\n') % (record + (c,)))
+  f.write('};\n\n')
+
+
 # Write a bit set
 
 def write_bitsets(list, item_size):
@@ -488,6 +560,27 @@ def write_bitsets(list, item_size):
   f.write("};\n\n")
 
 
+# Find the ranges of characters that have no other case and are at least
+# min_length characters long. Each range is returned as a (start, end) pair,
+# where neither start nor end is in the range. Characters in a caseless set
+# are not in any range, even if their other case has been removed, nor are
+# U+0130 and U+0131, which gain casing in Turkish.
+
+def get_nocase_ranges(other_case, caseless_offsets, min_length):
+  ranges = []
+  range_start = 0
+  for c in range(1, MAX_UNICODE):
+    if other_case[c] != 0 or caseless_offsets[c] != 0 or c in [0x0130, 0x0131]:
+      if c - range_start > min_length:
+        ranges.append((range_start, c))
+      range_start = c
+
+  # The else case is unlikely
+  if other_case[MAX_UNICODE - 1] == 0 and MAX_UNICODE - range_start > min_length:
+    ranges.append((range_start, MAX_UNICODE))
+  return ranges
+
+
 # ---------------------------------------------------------------------------
 # This bit of code must have been useful when the original script was being
 # developed. Retain it just in case it is ever needed again.
@@ -517,6 +610,38 @@ def write_bitsets(list, item_size):
 
 unicode_version = ""
 
+# Options must come before the optional output file name. The value for the
+# nocase ranges can be changed, --nocase-sweep lists the size of that table for
+# a number of values instead of writing a file, and --omit leaves out columns.
+
+OMITTABLE = ['scripts', 'bidi', 'bprops']
+
+nocase_min_length = NOCASE_MIN_LENGTH
+nocase_sweep = False
+omit = []
+
+while len(sys.argv) > 1 and sys.argv[1].startswith('--'):
+  option = sys.argv.pop(1)
+  if option.startswith('--nocase-min-length='):
+    try:
+      nocase_min_length = int(option[20:])
+    except ValueError:
+      nocase_min_length = 0
+    if nocase_min_length < 1:
+      print('** Bad value in %s' % option)
+      sys.exit(1)
+  elif option == '--nocase-sweep':
+    nocase_sweep = True
+  elif option.startswith('--omit='):
+    omit = [x for x in option[7:].split(',') if x != '']
+    for x in omit:
+      if x not in OMITTABLE:
+        print('** Bad value in %s: %s is not one of %s' % (option, x, ', '.join(OMITTABLE)))
+        sys.exit(1)
+  else:
+    print('** Unknown option %s' % option)
+    sys.exit(1)
+
 # Some of the tables imported from GenerateCommon.py have alternate comment
 # strings for use by GenerateUcpHeader. The comments are not wanted here, so
 # remove them.
@@ -529,10 +654,14 @@ category_names = category_names[::2]
 # Create the various tables from Unicode data files
 
 script = read_table('Unicode.tables/Scripts.txt', make_get_names(script_names), script_names.index('Unknown'))
+if 'scripts' in omit:
+  script = [script_names.index('Unknown')] * MAX_UNICODE
 category = read_table('Unicode.tables/DerivedGeneralCategory.txt', make_get_names(category_names), category_names.index('Cn'))
 break_props = read_table('Unicode.tables/GraphemeBreakProperty.txt', make_get_names(break_properties), break_properties.index('Other'))
 other_case = read_table('Unicode.tables/CaseFolding.txt', get_other_case, 0)
 bidi_class = read_table('Unicode.tables/DerivedBidiClass.txt', get_bidi, bidi_classes_short.index('L'))
+if 'bidi' in omit:
+  bidi_class = [0] * MAX_UNICODE
 
 # The grapheme breaking rules were changed for Unicode 11.0.0 (June 2018). Now
 # we need to find the Extended_Pictographic property for emoji characters. This
@@ -568,6 +697,9 @@ file.close()
 
 script_lists = [[]]
 scriptx_bidi_class = read_table('Unicode.tables/ScriptExtensions.txt', get_script_extension, 0)
+if 'scripts' in omit:
+  script_lists = [[]]
+  scriptx_bidi_class = [0] * MAX_UNICODE
 
 for idx in range(len(scriptx_bidi_class)):
   scriptx_bidi_class[idx] = scriptx_bidi_class[idx] | (bidi_class[idx] << 11)
@@ -639,6 +771,9 @@ for line in file:
 
 file.close()
 
+if 'bprops' in omit:
+  bprops = [[] for _ in range(MAX_UNICODE)]
+
 # Scan each character's boolean property list and created a list of unique
 # lists, at the same time, setting the index in that list for each property in
 # the bool_props vector.
@@ -737,22 +872,55 @@ for s in caseless_sets:
     if x > 127 and x + other_case[x] < 128:
       other_case[x] = 0  
 
+# Create a table of case folds. Each character is mapped to the smallest code
+# point that it matches caselessly, leaving aside the optional Turkish
+# equivalences, so two characters match caselessly if their folds are the same.
+# The table holds the offset from each character to its fold.
+
+case_fold = [0] * MAX_UNICODE
+for c in range(MAX_UNICODE):
+  if other_case[c] < 0:
+    case_fold[c] = other_case[c]
+for s in caseless_sets:
+  for x in s:
+    case_fold[x] = min(s) - x
+
 # Append a couple of extra caseless sets (unreferenced by the record objects)
 # to hold the optional Turkish case equivalences.
 turkish_dotted_i_index = offset
 caseless_sets.append([0x69, 0x0130])
 caseless_sets.append([0x49, 0x0131])
 
-# Combine all the tables
+# Combine all the tables, leaving out the fields that have been omitted
+# entirely. The names are those of the fields of ucd_record.
+
+columns = [('script', script), ('chartype', category), ('gbprop', break_props),
+  ('caseset', caseless_offsets), ('other_case', other_case)]
+if 'scripts' not in omit or 'bidi' not in omit:
+  columns.append(('scriptx_bidiclass', scriptx_bidi_class))
+if 'bprops' not in omit:
+  columns.append(('bprops', bool_props))
 
-table, records = combine_tables(script, category, break_props,
-  caseless_offsets, other_case, scriptx_bidi_class, bool_props)
+table, records = combine_tables(*[column for name, column in columns])
 
 # Find the record size and create a string definition of the structure for
 # outputting as a comment.
 
 record_size, record_struct = get_record_size_struct(list(records.keys()))
 
+# With --nocase-sweep, list the size of the nocase ranges table for a number of
+# minimum range lengths, and the number of characters that a caseless class
+# covering all of Unicode would have to check one by one, then stop.
+
+if nocase_sweep:
+  print("min_length  ranges   bytes  unlisted")
+  for min_length in [1, 2, 3, 4, 6, 8, 12, 16, 24, 32, 48, 64, 128]:
+    ranges = get_nocase_ranges(other_case, caseless_offsets, min_length)
+    listed = sum(end - start - 1 for start, end in ranges)
+    print("%10d %7d %7d %9d" % (min_length, len(ranges), (2 * len(ranges) + 2) * 4,
+      MAX_UNICODE - listed))
+  sys.exit(0)
+
 # Find the optimum block size for the two-stage table
 
 min_size = sys.maxsize
@@ -805,19 +973,22 @@ the tables when not needed. But don't leave a totally empty module because some
 compilers barf at that. Instead, just supply some small dummy tables. */
 
 #ifndef SUPPORT_UNICODE
-const ucd_record PRIV(ucd_records)[] = {{0,0,0,0,0,0,0}};
+const ucd_record PRIV(ucd_records)[] = {{ZEROS}};
+const ucd_record PRIV(ucd_latin1_records)[] = {{ZEROS}};
 const uint16_t PRIV(ucd_stage1)[] = {0};
 const uint16_t PRIV(ucd_stage2)[] = {0};
 const uint32_t PRIV(ucd_caseless_sets)[] = {0};
 const uint32_t PRIV(ucd_nocase_ranges)[] = {0};
 const uint32_t PRIV(ucd_nocase_ranges_size) = 0;
 #else
-\n""")
+\n""".replace('ZEROS', ','.join(['0'] * len(columns))))
 
 # --- Output some variable heading stuff ---
 
 f.write("/* Total size: %d bytes, block size: %d. */\n\n" % (min_size, min_block_size))
-f.write('const char *PRIV(unicode_version) = "{}";\n\n'.format(unicode_version))
+if omit:
+  f.write("/* Generated with --omit=%s. */\n\n" % ','.join(omit))
+f.write('const char PRIV(unicode_version)[] = "{}";\n\n'.format(unicode_version))
 
 f.write("""\
 /* When recompiling tables with a new Unicode version, please check the types
@@ -826,23 +997,7 @@ names will be different).
 \n""")
 
 f.write(record_struct)
-
-f.write("""
-/* If the 32-bit library is run in non-32-bit mode, character values greater
-than 0x10ffff may be encountered. For these we set up a special record. */
-
-#if PCRE2_CODE_UNIT_WIDTH == 32
-const ucd_record PRIV(dummy_ucd_record)[] = {{
-  ucp_Unknown,    /* script */
-  ucp_Cn,         /* type unassigned */
-  ucp_gbOther,    /* grapheme break property */
-  0,              /* case set */
-  0,              /* other case */
-  0 | (ucp_bidiL << UCD_BIDICLASS_SHIFT), /* script extension and bidi class */
-  0,              /* bool properties offset */
-  }};
-#endif
-\n""")
+f.write("\n")
 
 # --- Output the table of caseless character sets ---
 
@@ -881,6 +1036,59 @@ the large main UCD tables. */
 #ifndef PCRE2_PCRE2TEST
 \n""")
 
+# --- Check that the library is compiled for the same columns ---
+
+f.write("""\
+/* The library must be compiled with a PCRE2_UCD_OMIT_xxx macro for each
+column that maint/GenerateUcd.py was told to omit, and no others. */
+\n""")
+
+omit_checks = []
+for name in OMITTABLE:
+  omit_checks.append("%sdefined PCRE2_UCD_OMIT_%s" %
+    ("!" if name in omit else "", name.upper()))
+f.write("#if %s\n" % " || \\\n    ".join(omit_checks))
+f.write("#error The PCRE2_UCD_OMIT_xxx macros do not match the tables in pcre2_ucd.c\n")
+f.write("#endif\n\n")
+
+f.write("#if UCD_RECORD_SIZE != %d\n" % record_size)
+f.write("""\
+#error Please correct UCD_RECORD_SIZE in pcre2_internal.h
+#endif
+
+""")
+
+# --- Output the dummy record ---
+
+dummy_fields = {
+  'script':            ('ucp_Unknown,', 'script'),
+  'chartype':          ('ucp_Cn,', 'type unassigned'),
+  'gbprop':            ('ucp_gbOther,', 'grapheme break property'),
+  'caseset':           ('0,', 'case set'),
+  'other_case':        ('0,', 'other case'),
+  'scriptx_bidiclass': ('0 | (ucp_bidiL << UCD_BIDICLASS_SHIFT),', 'script extension and bidi class'),
+  'bprops':            ('0,', 'bool properties offset'),
+  }
+
+f.write("""\
+/* If the 32-bit library is run in non-32-bit mode, character values greater
+than 0x10ffff may be encountered. For these we set up a special record. */
+
+#if PCRE2_CODE_UNIT_WIDTH == 32
+const ucd_record PRIV(dummy_ucd_record)[] = {{
+""")
+for name, column in columns:
+  value, comment = dummy_fields[name]
+  if len(value) < 16:
+    f.write("  %-16s/* %s */\n" % (value, comment))
+  else:
+    f.write("  %s /* %s */\n" % (value, comment))
+f.write("""\
+  }};
+#endif
+
+""")
+
 # --- Output the nocase sets ---
 
 f.write("""\
@@ -890,30 +1098,19 @@ no other case. Both start and end values are excluded from the range. */
 const uint32_t PRIV(ucd_nocase_ranges)[] = {
 """)
 
-range_start = 0
-size = 0
-# The range size is bigger than eight characters.
-expected_size = 8
+nocase_ranges = get_nocase_ranges(other_case, caseless_offsets, nocase_min_length)
 total = 0
 
-for c in range(1, MAX_UNICODE):
-  if other_case[c] != 0 or c in [0x0130, 0x0131]: # add the two chars that gain casing in Turkish
-    if c - range_start > expected_size:
-      range_size = c - range_start - 1
-      f.write('  0x%04x, 0x%04x, /* %d */\n' % (range_start, c, range_size))
-      total += range_size
-      size += 2
-    range_start = c
-
-# The else case is unlikely
-if other_case[MAX_UNICODE - 1] == 0 and MAX_UNICODE - range_start > expected_size:
-  range_size = MAX_UNICODE - range_start - 1
-  f.write('  0x%04x, 0x%04x, /* %d */\n' % (range_start, MAX_UNICODE, range_size))
+for range_start, range_end in nocase_ranges:
+  range_size = range_end - range_start - 1
+  f.write('  0x%04x, 0x%04x, /* %d */\n' % (range_start, range_end, range_size))
   total += range_size
-  size += 2
 
 f.write('  0xffffffff, 0xffffffff /* terminator */\n};\n\n');
-f.write('/* Total: %d characters. */\nconst uint32_t PRIV(ucd_nocase_ranges_size) = %d;\n\n' % (total, size))
+f.write('/* Total: %d characters in %d ranges of at least %d, %d bytes. */\n'
+  'const uint32_t PRIV(ucd_nocase_ranges_size) = %d;\n\n' %
+  (total, len(nocase_ranges), nocase_min_length,
+  (2 * len(nocase_ranges) + 2) * 4, 2 * len(nocase_ranges)))
 
 # --- Read Scripts.txt again for the sets of 10 digits. ---
 
@@ -953,6 +1150,27 @@ for d in digitsets:
   count += 1
 f.write("\n};\n\n")
 
+# For each block of 256 characters up to the last digit, find the first digit
+# set whose '9' is in or after the block. No block holds more than a few sets,
+# so a short forward scan from here finds the set for any digit. The table is
+# padded to whole lines with the last set.
+
+digit_set_blocks = []
+i = 0
+for block in range((digitsets[-1] >> 8) + 1):
+  while digitsets[i] < block << 8:
+    i += 1
+  digit_set_blocks.append(i + 1)
+digit_set_blocks += [len(digitsets)] * (-len(digit_set_blocks) % 16)
+
+f.write("""\
+/* This table is indexed by a digit's code point shifted right by 8 bits. It
+holds the offset in ucd_digit_sets of the first set of digits that ends in or
+after that block of 256 characters. */
+\n""")
+
+write_table(digit_set_blocks, 'PRIV(ucd_digit_set_blocks)', limit = len(digit_set_blocks) << 8)
+
 f.write("""\
 /* This vector is a list of script bitsets for the Script Extension property.
 The number of 32-bit words in each bitset is #defined in pcre2_ucp.h as
@@ -972,6 +1190,80 @@ const uint32_t PRIV(ucd_boolprop_sets)[] = {
 write_bitsets(bool_props_lists, bool_props_list_item_size)
 
 
+# --- Output the range tables for scripts, types, and Boolean properties ---
+
+UCD_RANGE_LENGTH_BITS = 11
+UCD_RANGE_MAX_LENGTH = 1 << UCD_RANGE_LENGTH_BITS
+
+# Add a range to a list, splitting it into pieces that each fit in one entry.
+
+def add_range(ranges, start, end):
+  while start <= end:
+    length = min(end - start + 1, UCD_RANGE_MAX_LENGTH)
+    ranges.append((start << UCD_RANGE_LENGTH_BITS) | (length - 1))
+    start += length
+
+# Find the ranges for each value of a property that every character has
+# exactly one value of.
+
+def get_value_ranges(table, count):
+  value_ranges = [[] for _ in range(count)]
+  start = 0
+  for c in range(1, MAX_UNICODE + 1):
+    if c == MAX_UNICODE or table[c] != table[start]:
+      add_range(value_ranges[table[start]], start, c - 1)
+      start = c
+  return value_ranges
+
+# Find the ranges for each Boolean property.
+
+def get_bool_ranges():
+  value_ranges = [[] for _ in bool_properties]
+  starts = {}
+  for c in range(MAX_UNICODE + 1):
+    current = set(bprops[c]) if c < MAX_UNICODE else set()
+    for ix in list(starts):
+      if ix not in current:
+        add_range(value_ranges[ix], starts.pop(ix), c - 1)
+    for ix in current:
+      if ix not in starts:
+        starts[ix] = c
+  return value_ranges
+
+def write_ranges(value_ranges, table_name, names):
+  index = [0]
+  f.write("const uint32_t PRIV(%s)[] = {\n" % table_name)
+  for n, ranges in enumerate(value_ranges):
+    f.write("  /* %s */\n" % names[n])
+    for i in range(0, len(ranges), 6):
+      f.write(" " + "".join(" 0x%08x," % r for r in ranges[i:i+6]) + "\n")
+    index.append(index[-1] + len(ranges))
+  if index[-1] == 0:
+    f.write("  0\n")
+  f.write("};\n\n")
+  f.write("const uint16_t PRIV(%s_index)[] = {\n" % table_name)
+  for i in range(0, len(index), 8):
+    f.write(" " + "".join(" %5d," % x for x in index[i:i+8]) + "\n")
+  f.write("};\n\n")
+
+f.write("""\
+/* These tables list the code points that have each script, general category
+(character type), and Boolean property, as sorted ranges. Each entry holds the
+first code point of a range in its top 21 bits and the length of the range less
+one in its bottom 11 bits; see UCD_RANGE_START() and UCD_RANGE_END() in
+pcre2_internal.h. The ranges for value n of a property are those from index[n]
+up to index[n+1], using the table's index table. */
+\n""")
+
+if 'scripts' in omit:
+  write_ranges([[] for _ in script_names], 'ucd_script_ranges', script_names)
+else:
+  write_ranges(get_value_ranges(script, len(script_names)), 'ucd_script_ranges',
+    script_names)
+write_ranges(get_value_ranges(category, len(category_names)), 'ucd_type_ranges',
+  category_names)
+write_ranges(get_bool_ranges(), 'ucd_boolprop_ranges', bool_properties)
+
 # Output the main UCD tables.
 
 f.write("""\
@@ -986,6 +1278,65 @@ write_records(records, record_size)
 write_table(min_stage1, 'PRIV(ucd_stage1)')
 write_table(min_stage2, 'PRIV(ucd_stage2)', min_block_size)
 
+# Find the smallest two-stage table for the case folds, stopping after the
+# last character that has a fold. The stage 1 table is padded to whole lines.
+
+fold_end = max(c for c in range(MAX_UNICODE) if case_fold[c] != 0) + 1
+min_fold_size = sys.maxsize
+for block_size in [2 ** i for i in range(5,9)]:
+  limit = (fold_end + 16 * block_size - 1) // (16 * block_size) * 16 * block_size
+  stage1, stage2 = compress_table(case_fold[:limit], block_size)
+  size = get_tables_size(stage1, stage2)
+  if size < min_fold_size:
+    min_fold_size = size
+    fold_stage1, fold_stage2 = stage1, stage2
+    fold_block_size, fold_limit = block_size, limit
+
+f.write("""\
+/* These tables map each character to the smallest code point that it matches
+caselessly, leaving aside the optional Turkish equivalences, so that comparing
+two characters' folds tests whether they match caselessly. The stage 2 table
+holds the offset from a character to its fold. Characters from UCD_FOLD_LIMIT
+onwards have no other case and are not in the tables. */
+\n""")
+
+write_table(fold_stage1, 'PRIV(ucd_fold_stage1)', limit = fold_limit)
+write_table(fold_stage2, 'PRIV(ucd_fold_stage2)', fold_block_size)
+
+f.write("#if UCD_FOLD_BLOCK_SIZE != %d || UCD_FOLD_LIMIT != 0x%x\n" %
+  (fold_block_size, fold_limit))
+f.write("""\
+#error Please correct UCD_FOLD_BLOCK_SIZE or UCD_FOLD_LIMIT in pcre2_internal.h
+#endif
+
+""")
+
+# Find the first character whose grapheme break property is not one of those
+# that never join each other, apart from CR followed by LF. The \X code uses
+# this to skip looking up the properties of most characters. The limit is
+# rounded down to a multiple of 64, so that a UTF-8 character can be checked
+# by its first byte.
+
+simple_breaks = [break_properties.index(name) for name in
+  ('CR', 'LF', 'Control', 'Other', 'Extended_Pictographic')]
+gb_simple_limit = next(c for c in range(MAX_UNICODE)
+  if break_props[c] not in simple_breaks) & ~63
+
+f.write("#if UCD_GB_SIMPLE_LIMIT != 0x%x\n" % gb_simple_limit)
+f.write("""\
+#error Please correct UCD_GB_SIMPLE_LIMIT in pcre2_internal.h
+#endif
+
+""")
+
+f.write("""\
+/* This table holds copies of the records for the first 256 characters, so
+that GET_UCD() can find them with one lookup instead of three. These characters
+are by far the most common in most subjects. */
+\n""")
+
+write_latin1_records(table, records, record_size)
+
 f.write("#if UCD_BLOCK_SIZE != %d\n" % min_block_size)
 f.write("""\
 #error Please correct UCD_BLOCK_SIZE in pcre2_internal.h
@@ -0,0 +1,502 @@
+#! /usr/bin/env python3
+
+# Script to run ManyConfigTests concurrently, for the use of PCRE2 maintainers.
+#
+# ManyConfigTests configures, builds, and tests PCRE2 in the source directory
+# with one set of configuration options after another. This script runs the
+# same configurations, but builds each one in its own directory outside the
+# source tree, and runs several of them at once. When all the builds have
+# finished, a table shows the time taken to configure, make, and test each one,
+# and how many compilations came from the object cache (see below). The output
+# of any that failed is shown, and the build directory is kept for inspection.
+# This script should be run in the PCRE2 source directory, which must not have
+# been configured, because configure will not then build in other directories.
+#
+# The selection options are the same as for ManyConfigTests (-noasan, +jit,
+# -dummy, -v, and so on). Because every build is outside the source directory,
+# there is no separate set of tests in a temporary directory, and the "tmp" and
+# "tmpjit" selectors are accepted but ignored. There are also these options:
+#
+# -j N        run N configurations at once (default: the number of CPUs)
+# -m N        use "make -jN" for each build (default: CPUs divided by -j)
+# -matrix     instead of the usual configurations, build every combination of
+#             link size (2, 3, 4), JIT (off, on), and code unit width (8, 16,
+#             32), with Unicode support and static libraries only
+# -keep       keep the build directories of configurations that passed
+# -cache DIR  use DIR for the object cache (default /tmp/pcre2cache)
+# -nocache    do not use an object cache
+#
+# The object cache works like ccache in its "preprocessor" mode. Each build is
+# configured with a small wrapper as its compiler. When it is asked to compile
+# a C file to an object, the wrapper runs the preprocessor, and looks up a hash
+# of the preprocessed text, the compiler's version, and the options that are
+# not preprocessor options. If it has compiled the same text with the same
+# options before, it copies the stored object (and replays any warnings).
+# Otherwise it compiles the file and stores the result. Changing a define or a
+# config.h setting only misses the cache for files whose preprocessed text it
+# changes, so files such as pcre2_ucd.c and pcre2_tables.c are compiled only
+# once for each set of compiler flags and width. The cache is never pruned;
+# remove the directory to empty it. Objects from the cache contain debugging
+# information that refers to the directory they were first built in. Builds
+# are configured with --disable-dependency-tracking, which is not needed for a
+# build that is made only once, and which would make the cache less useful.
+
+import hashlib
+import os
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+# This is a temporary directory for the builds, as in ManyConfigTests.
+
+TMP = '/tmp/pcre2testing'
+DEFAULT_CACHE = '/tmp/pcre2cache'
+
+# Compiler flags, as in ManyConfigTests.
+
+CFLAGS = '-g'
+OFLAGS = '-O0'
+GCC_WARNINGS = ' '.join([
+    '-Wall', '-Wno-overlength-strings', '-Wpointer-arith', '-Wwrite-strings',
+    '-Wundef -Wshadow', '-Wmissing-field-initializers', '-Wunused-parameter',
+    '-Wextra -Wformat', '-Wbad-function-cast', '-Wmissing-declarations',
+    '-Wnested-externs', '-pedantic', '-Wuninitialized', '-Wmaybe-uninitialized',
+    '-Wmissing-prototypes', '-Wstrict-prototypes', '-Warray-bounds',
+    '-Wformat-overflow=2'])
+
+MAXIMAL = '--disable-shared %s --enable-pcre2-16 --enable-pcre2-32'
+
+MAIN_CONFIGS = [
+    '',
+    '--disable-static',
+    '--disable-shared',
+    '--disable-unicode --disable-shared --enable-never-backslash-C',
+    '--with-link-size=3 --disable-shared --disable-pcre2grep-callout',
+    '--disable-unicode --enable-rebuild-chartables --disable-shared',
+    '--disable-unicode --enable-newline-is-any --disable-shared',
+    '--disable-unicode --enable-newline-is-cr --disable-shared',
+    '--disable-unicode --enable-newline-is-crlf --disable-shared',
+    '--disable-unicode --enable-newline-is-anycrlf --enable-bsr-anycrlf --disable-shared',
+    '--enable-newline-is-any --disable-static',
+    '--disable-unicode --enable-pcre2-16 --enable-debug',
+    '--enable-pcre2-16 --disable-shared',
+    '--disable-unicode --enable-pcre2-32',
+    '--enable-pcre2-32 --disable-shared',
+    '--disable-unicode --enable-pcre2-32 --enable-pcre2-16 --disable-shared',
+    '--disable-unicode --enable-pcre2-32 --enable-pcre2-16 --disable-pcre2-8 --disable-shared',
+]
+
+JIT_CONFIGS = [
+    '--disable-unicode --enable-jit --disable-shared',
+    '--enable-jit --disable-shared',
+    '--enable-jit --with-link-size=3 --disable-shared',
+    '--enable-jit --enable-pcre2-16 --disable-shared',
+    '--disable-unicode --enable-jit --enable-pcre2-16 --disable-pcre2-8 --disable-shared',
+    '--enable-jit --enable-pcre2-16 --disable-pcre2-8 --disable-shared',
+    '--enable-jit --enable-pcre2-16 --with-link-size=3 --disable-shared',
+    '--enable-jit --enable-pcre2-16 --with-link-size=4 --disable-shared',
+    '--enable-jit --enable-pcre2-32 --disable-shared',
+    '--disable-unicode --enable-jit --enable-pcre2-32 --disable-pcre2-8 --disable-shared',
+    '--enable-jit --enable-pcre2-32 --disable-pcre2-8 --disable-shared',
+    '--enable-jit --enable-pcre2-32 --with-link-size=4 --disable-shared',
+    '--enable-jit --enable-pcre2-32 --enable-pcre2-16 --disable-pcre2-8 --enable-newline-is-anycrlf --enable-bsr-anycrlf --disable-shared',
+]
+
+MAIN_VALGRIND_CONFIGS = [
+    '--disable-shared',
+    '--with-link-size=3 --enable-pcre2-16 --enable-pcre2-32 --disable-shared',
+]
+
+JIT_VALGRIND_CONFIGS = [
+    '--enable-jit --disable-shared',
+    '--enable-jit --enable-pcre2-16 --enable-pcre2-32',
+]
+
+JIT_VALGRIND = ('valgrind --tool=memcheck -q --smc-check=all-non-file '
+    '--suppressions=%s/testdata/valgrind-jit.supp')
+
+# ------ The compiler wrapper ------
+
+# When this script is run as "ParallelManyConfigTests.py -cc <args>", it acts
+# as a caching compiler. The real compiler, its identity, and the cache
+# directory are passed in the environment, along with a file to which "hit" or
+# "miss" is appended for each cacheable compilation.
+
+def compiler_wrapper(args):
+    cc = shlex.split(os.environ['PCRE2_CACHE_CC'])
+    source = None
+    output = None
+    key_args = []
+    cacheable = '-c' in args
+
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == '-o' and i + 1 < len(args):
+            output = args[i + 1]
+            i += 1
+        elif arg.endswith('.c') and not arg.startswith('-'):
+            if source is not None:
+                cacheable = False
+            source = arg
+        elif arg.startswith('-M') or arg == '-':
+            cacheable = False
+        elif arg in ('-I', '-D', '-U', '-include'):
+            i += 1
+        elif not arg.startswith(('-I', '-D', '-U')):
+            key_args.append(arg)
+        i += 1
+
+    if not cacheable or source is None or output is None:
+        os.execvp(cc[0], cc + args)
+
+    pre_args = [a for a in args if a != '-c']
+    o = pre_args.index('-o')
+    del pre_args[o:o + 2]
+    # The line markers stay in the preprocessed text, because the line numbers
+    # and file names that they carry end up in the object file (in debugging
+    # information and in __LINE__), so they must be part of the key.
+    pre = subprocess.run(cc + pre_args + ['-E'], capture_output=True)
+    if pre.returncode != 0:
+        os.execvp(cc[0], cc + args)
+
+    digest = hashlib.sha256()
+    digest.update(os.environ['PCRE2_CACHE_CCID'].encode())
+    digest.update('\0'.join(key_args).encode() + b'\0')
+    digest.update(pre.stdout)
+    key = digest.hexdigest()
+    base = os.path.join(os.environ['PCRE2_CACHE_DIR'], key[:2], key[2:])
+
+    if os.path.exists(base + '.o'):
+        shutil.copyfile(base + '.o', output)
+        if os.path.exists(base + '.err'):
+            with open(base + '.err', 'rb') as f:
+                sys.stderr.buffer.write(f.read())
+        result = 'hit'
+        rc = 0
+    else:
+        compiled = subprocess.run(cc + args, stderr=subprocess.PIPE)
+        sys.stderr.buffer.write(compiled.stderr)
+        rc = compiled.returncode
+        result = 'miss'
+        if rc == 0:
+            os.makedirs(os.path.dirname(base), exist_ok=True)
+            store(output, base + '.o')
+            if compiled.stderr:
+                with tempfile.NamedTemporaryFile(dir=os.path.dirname(base),
+                        delete=False) as f:
+                    f.write(compiled.stderr)
+                os.replace(f.name, base + '.err')
+
+    log = os.environ.get('PCRE2_CACHE_LOG')
+    if log:
+        with open(log, 'a') as f:
+            f.write(result + '\n')
+    return rc
+
+# Copy a file into the cache so that another build never sees part of it.
+
+def store(source, target):
+    fd, name = tempfile.mkstemp(dir=os.path.dirname(target))
+    os.close(fd)
+    shutil.copyfile(source, name)
+    os.replace(name, target)
+
+# ------ Choosing the configurations ------
+
+GROUPS = ['asan', 'usan', 'debug', 'jit', 'jitvalgrind', 'main',
+    'mainvalgrind', 'tmp', 'tmpjit', 'valgrind']
+
+# The groups that each selector turns off (with "-no") or on (with "+"). The
+# "jit" group is the main set of JIT tests, which is selected by "jitmain".
+
+NO_SELECTORS = {
+    'asan': ['asan'], 'usan': ['usan'], 'debug': ['debug'],
+    'jit': ['jit', 'jitvalgrind', 'tmpjit'], 'jitmain': ['jit'],
+    'jitvalgrind': ['jitvalgrind'], 'main': ['main', 'mainvalgrind'],
+    'mainvalgrind': ['mainvalgrind'], 'tmp': ['tmp', 'tmpjit'],
+    'tmpjit': ['tmpjit'], 'valgrind': ['valgrind'],
+}
+
+PLUS_SELECTORS = dict(NO_SELECTORS, tmp=['tmp'],
+    valgrind=['valgrind', 'jitvalgrind', 'mainvalgrind'])
+
+# Process the command line. The selectors work as in ManyConfigTests: the
+# first "+" selector turns all the groups off, and each selector then turns
+# some of them on or off again.
+
+def parse_args(argv):
+    use = dict.fromkeys(GROUPS, True)
+    opts = {'dummy': False, 'verbose': False, 'jobs': os.cpu_count() or 1,
+        'make_jobs': None, 'matrix': False, 'keep': False,
+        'cache': DEFAULT_CACHE}
+    seenplus = False
+
+    args = list(argv)
+    while args:
+        arg = args.pop(0)
+        if arg.startswith('+') and not seenplus:
+            use = dict.fromkeys(GROUPS, False)
+            seenplus = True
+
+        if arg in ('-j', '-m', '-cache'):
+            if not args:
+                usage_error('%s needs an argument' % arg)
+            value = args.pop(0)
+            if arg == '-cache':
+                opts['cache'] = value
+            elif not value.isdigit() or int(value) < 1:
+                usage_error('%s must be followed by a positive number' % arg)
+            else:
+                opts['jobs' if arg == '-j' else 'make_jobs'] = int(value)
+        elif arg == '-nocache':
+            opts['cache'] = None
+        elif arg in ('-dummy', '-keep', '-matrix'):
+            opts[arg[1:]] = True
+        elif arg == '-v':
+            opts['verbose'] = True
+        elif arg.startswith('-no') and arg[3:] in NO_SELECTORS:
+            for group in NO_SELECTORS[arg[3:]]:
+                use[group] = False
+        elif arg.startswith('+') and arg[1:] in PLUS_SELECTORS:
+            for group in PLUS_SELECTORS[arg[1:]]:
+                use[group] = True
+        else:
+            usage_error("Unknown option '%s'" % arg)
+
+    if not use['jitvalgrind'] and not use['mainvalgrind']:
+        use['valgrind'] = False
+    return opts, use
+
+def usage_error(message):
+    print(message)
+    sys.exit(1)
+
+# Make the list of configurations, in the same order as ManyConfigTests. Each
+# is a tuple of CFLAGS, configure options, and valgrind command (empty for
+# none), plus a separate valgrind command for pcre2_jit_test.
+
+def make_configs(opts, use, isgcc):
+    configs = []
+    cflags = CFLAGS + (' ' + GCC_WARNINGS if isgcc else '')
+    plain = OFLAGS + ' ' + cflags
+
+    if opts['matrix']:
+        for link_size in (2, 3, 4):
+            for jit in ('', '--enable-jit '):
+                for width in (8, 16, 32):
+                    options = '%s--with-link-size=%d --disable-shared' % (jit, link_size)
+                    if width != 8:
+                        options += ' --enable-pcre2-%d --disable-pcre2-8' % width
+                    configs.append((plain, options, '', ''))
+        return configs
+
+    enable_jit = '--enable-jit' if use['jit'] else ''
+    maximal = MAXIMAL % enable_jit
+
+    if isgcc and use['main']:
+        configs.append(('-O2 ' + cflags, maximal, '', ''))
+        if use['asan']:
+            configs.append((plain + ' -no-pie -fno-PIE -fsanitize=address',
+                maximal, '', ''))
+        if use['usan']:
+            configs.append((plain + ' -no-pie -fno-PIE -fsanitize=undefined '
+                '-fno-sanitize=alignment -std=gnu99', maximal, '', ''))
+
+    if use['main']:
+        if use['debug']:
+            configs.append((plain, maximal + ' --enable-debug', '', ''))
+        configs += [(plain, o, '', '') for o in MAIN_CONFIGS]
+
+    if use['jit']:
+        configs += [(plain, o, '', '') for o in JIT_CONFIGS]
+
+    if use['valgrind']:
+        if use['mainvalgrind']:
+            configs += [(plain, '--enable-valgrind ' + o, 'valgrind', '')
+                for o in MAIN_VALGRIND_CONFIGS]
+        if use['jitvalgrind']:
+            jrvalgrind = JIT_VALGRIND % os.getcwd()
+            configs += [(plain, '--enable-valgrind ' + o, 'valgrind', jrvalgrind)
+                for o in JIT_VALGRIND_CONFIGS]
+
+    return configs
+
+# ------ Building and testing one configuration ------
+
+# Run a command, adding its output to the record for the configuration. The
+# result is the exit code, and whether anything was written to stderr.
+
+def run(record, args, cwd, env, stdout=True):
+    result = subprocess.run(args, cwd=cwd, env=env, capture_output=True)
+    err = result.stderr.decode(errors='replace')
+    # Ignore the message that some versions of ar output while linking, as
+    # ManyConfigTests does.
+    err = '\n'.join(line for line in err.splitlines()
+        if "`u' modifier ignored since `D' is the default" not in line)
+    if stdout:
+        record['log'] += result.stdout.decode(errors='replace')
+    record['log'] += err
+    return result.returncode, err.strip() != ''
+
+def build_and_test(number, config, opts, env):
+    cflags, options, valgrind, jrvalgrind = config
+    srcdir = env['srcdir']
+    builddir = os.path.join(TMP, str(number))
+    record = {'number': number, 'options': options, 'cflags': cflags,
+        'valgrind': valgrind, 'times': [0.0, 0.0, 0.0], 'hits': 0,
+        'misses': 0, 'failed': None, 'log': '', 'dir': builddir}
+
+    shutil.rmtree(builddir, ignore_errors=True)
+    os.makedirs(builddir)
+    env = dict(env, CFLAGS=cflags)
+    if opts['cache'] is not None:
+        env['CC'] = env['PCRE2_CACHE_WRAPPER']
+        env['PCRE2_CACHE_LOG'] = os.path.join(builddir, 'cachelog')
+
+    def step(index, name, args, check_stderr=True, stdout=True):
+        start = time.perf_counter()
+        rc, err = run(record, args, builddir, env, stdout)
+        record['times'][index] += time.perf_counter() - start
+        if rc != 0 or (check_stderr and err):
+            record['failed'] = name
+        return record['failed'] is None
+
+    ok = step(0, 'configure', ['sh', os.path.join(srcdir, 'configure')] +
+        shlex.split(options) + ['--disable-dependency-tracking'], stdout=False)
+    if ok:
+        ok = step(1, 'make', ['make', '-j%d' % opts['make_jobs']], stdout=False)
+    if opts['cache'] is not None and os.path.exists(env['PCRE2_CACHE_LOG']):
+        with open(env['PCRE2_CACHE_LOG']) as f:
+            results = f.read().split()
+        record['hits'] = results.count('hit')
+        record['misses'] = results.count('miss')
+    if not ok:
+        return record
+
+    if opts['verbose']:
+        run(record, ['./pcre2test', '-C'], builddir, env)
+
+    def config(name):
+        return subprocess.run(['./pcre2test', '-C', name], cwd=builddir,
+            stdout=subprocess.DEVNULL).returncode
+
+    jit = config('jit')
+    pcre2_8 = config('pcre2-8')
+    vopt = [valgrind] if valgrind else []
+
+    ok = step(2, 'RunTest', ['sh', os.path.join(srcdir, 'RunTest')] + vopt)
+    if ok and pcre2_8:
+        ok = step(2, 'RunGrepTest', ['sh', os.path.join(srcdir, 'RunGrepTest')] + vopt)
+        if ok:
+            ok = step(2, 'pcre2posix_test', vopt + ['./pcre2posix_test'],
+                check_stderr=False)
+    if ok and jit:
+        step(2, 'pcre2_jit_test', shlex.split(jrvalgrind) + ['./pcre2_jit_test'])
+
+    if record['failed'] is None and not opts['keep']:
+        shutil.rmtree(builddir, ignore_errors=True)
+    return record
+
+# ------ Main program ------
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == '-cc':
+        return compiler_wrapper(sys.argv[2:])
+
+    opts, use = parse_args(sys.argv[1:])
+    srcdir = os.getcwd()
+    if not os.path.exists(os.path.join(srcdir, 'configure')) or \
+       not os.path.isdir(os.path.join(srcdir, 'testdata')):
+        usage_error('Run this script in the PCRE2 source directory.')
+    if os.path.exists(os.path.join(srcdir, 'config.status')):
+        usage_error("The source directory has been configured; run 'make distclean' first.")
+
+    cc = os.environ.get('CC', 'cc')
+    version = subprocess.run(shlex.split(cc) + ['--version'], capture_output=True,
+        text=True)
+    isgcc = version.returncode == 0 and 'GCC' in version.stdout
+
+    configs = make_configs(opts, use, isgcc)
+    if not configs:
+        usage_error('** No tests selected')
+    if opts['make_jobs'] is None:
+        opts['make_jobs'] = max(1, (os.cpu_count() or 1) // opts['jobs'])
+
+    for number, (cflags, options, valgrind, _) in enumerate(configs, 1):
+        print('[%d/%d] %s%s' % (number, len(configs), options or 'default settings',
+            ' (with valgrind)' if valgrind else ''))
+        print('  CFLAGS=%s' % cflags)
+    if opts['dummy']:
+        return 0
+
+    env = dict(os.environ, srcdir=srcdir)
+    if opts['cache'] is not None:
+        cache = os.path.abspath(opts['cache'])
+        os.makedirs(cache, exist_ok=True)
+        wrapper = os.path.join(cache, 'bin', 'cc')
+        os.makedirs(os.path.dirname(wrapper), exist_ok=True)
+        with open(wrapper, 'w') as f:
+            f.write('#! /bin/sh\nexec %s %s -cc "$@"\n' % (
+                shlex.quote(sys.executable), shlex.quote(os.path.abspath(__file__))))
+        os.chmod(wrapper, 0o755)
+        env.update(PCRE2_CACHE_CC=cc, PCRE2_CACHE_DIR=cache,
+            PCRE2_CACHE_CCID=version.stdout + version.stderr,
+            PCRE2_CACHE_WRAPPER=wrapper)
+
+    os.makedirs(TMP, exist_ok=True)
+    print('')
+    print('Building %d configurations in %s, %d at a time, with make -j%d' % (
+        len(configs), TMP, opts['jobs'], opts['make_jobs']))
+
+    wall = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=opts['jobs']) as pool:
+        futures = [pool.submit(build_and_test, number, config, opts, env)
+            for number, config in enumerate(configs, 1)]
+        records = []
+        for future in futures:
+            record = future.result()
+            records.append(record)
+            print('[%d/%d] %s' % (record['number'], len(configs),
+                'OK' if record['failed'] is None else
+                '%s FAILED' % record['failed']), flush=True)
+    wall = time.perf_counter() - wall
+
+    failed = [r for r in records if r['failed'] is not None]
+    for record in failed:
+        print('')
+        print('**** [%d] %s failed with: %s' % (record['number'], record['failed'],
+            record['options'] or 'default settings'))
+        print('  CFLAGS=%s' % record['cflags'])
+        print('  Build directory: %s' % record['dir'])
+        print(record['log'].rstrip())
+
+    print('')
+    print('   #  configure     make     test   cache  result  options')
+    for r in records:
+        print('%4d %10.1f %8.1f %8.1f %4d/%-3d %-7s %s%s' % (r['number'],
+            r['times'][0], r['times'][1], r['times'][2], r['hits'],
+            r['hits'] + r['misses'], 'ok' if r['failed'] is None else 'FAILED',
+            r['options'] or 'default settings',
+            ' (valgrind)' if r['valgrind'] else ''))
+
+    serial = sum(sum(r['times']) for r in records)
+    hits = sum(r['hits'] for r in records)
+    compiles = hits + sum(r['misses'] for r in records)
+    print('')
+    print('%d configurations, %d failed; %.0fs elapsed, %.0fs if run one at a time' % (
+        len(records), len(failed), wall, serial))
+    if opts['cache'] is not None:
+        print('%d of %d compilations came from the cache in %s' % (hits, compiles,
+            opts['cache']))
+    if not failed and not os.listdir(TMP):
+        os.rmdir(TMP)
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
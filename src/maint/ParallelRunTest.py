@@ -0,0 +1,435 @@
+#! /usr/bin/env python3
+
+# Script to run the pcre2test tests in parallel, for the use of PCRE2
+# maintainers and for long jobs that test many configurations.
+#
+# RunTest runs each testinput file through pcre2test once for each code unit
+# width and, where JIT is supported, once with and once without JIT, one after
+# another. This script runs the same set of tests, with the same skipping
+# rules, but treats each combination of test file, width, and mode as a
+# separate job, and runs the jobs concurrently. Each job runs in a private
+# temporary directory, because some tests write files in the current
+# directory. The longest jobs are started first. The output of each job is
+# compared with the appropriate testoutput file, and any differences are shown
+# when all the jobs have finished. Then the time taken by each job is listed,
+# together with a summary for each test file.
+#
+# The arguments are the same as for RunTest, except that the ebcdic test is not
+# supported:
+#
+#   maint/ParallelRunTest.py [-j N] [-8] [-16] [-32] [-nojit] [-bigstack]
+#     [-valgrind] [-sim "command"] [test selectors]
+#
+# Test selectors are test numbers, ranges such as 3-6 or 3-, "~N" to skip a
+# test, or "heap". If there are none, all the numbered tests are run. The
+# number of concurrent jobs defaults to the number of CPUs. As in RunTest, the
+# pcre2test program and the source directory may be given by the "pcre2test"
+# and "srcdir" environment variables; the defaults are ./pcre2test and the
+# directory above this script. The script can therefore be run from a build
+# directory, for example:
+#
+#   ../maint/ParallelRunTest.py -j 8 ~27
+#
+# If a test fails, its output is written to a file called testtry-N-BITS in
+# the current directory, with "-jit" or "-dfa" added when appropriate. The exit
+# code is 0 if all the tests passed, and 1 otherwise.
+
+import difflib
+import os
+import re
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+MAXTEST = 27
+
+# These are the arguments that test 2 passes to pcre2test's -error option after
+# the main test, appending the output to the results.
+
+ERROR_ARGS = '-80,-62,-2,-1,0,100,101,191,300'
+
+# The locales that are tried for test 3, in the same order as RunTest.
+
+LOCALES = ['fr_FR', 'french', 'fr', 'fr_CA']
+
+def usage_error(message):
+    print(message)
+    sys.exit(1)
+
+# Process the command line. Test selections are collected as a set of numbers
+# (or "heap").
+
+def parse_args(argv):
+    opts = {'jobs': os.cpu_count() or 1, 'widths': [], 'nojit': False,
+            'bigstack': False, 'valgrind': [], 'sim': []}
+    tests = set()
+    skip = set()
+
+    args = list(argv)
+    while args:
+        arg = args.pop(0)
+        if arg == '-j' or arg.startswith('-j') and arg[2:].isdigit():
+            value = arg[2:] if arg != '-j' else (args.pop(0) if args else '')
+            if not value.isdigit() or int(value) < 1:
+                usage_error('-j must be followed by a positive number')
+            opts['jobs'] = int(value)
+        elif arg in ('-8', '-16', '-32'):
+            opts['widths'].append(int(arg[1:]))
+        elif arg in ('nojit', '-nojit'):
+            opts['nojit'] = True
+        elif arg in ('bigstack', '-bigstack'):
+            opts['bigstack'] = True
+        elif arg in ('valgrind', '-valgrind'):
+            opts['valgrind'] = ['valgrind', '--tool=memcheck', '-q',
+                '--smc-check=all-non-file', '--error-exitcode=70']
+        elif arg in ('sim', '-sim'):
+            if not args:
+                usage_error('-sim must be followed by a command')
+            opts['sim'] = shlex.split(args.pop(0))
+        elif arg == 'heap':
+            tests.add('heap')
+        elif re.fullmatch(r'\d+', arg) and int(arg) <= MAXTEST:
+            tests.add(int(arg))
+        elif re.fullmatch(r'~\d+', arg):
+            skip.add(int(arg[1:]))
+        elif re.fullmatch(r'\d+-\d*', arg):
+            first, last = arg.split('-')
+            last = int(last) if last else MAXTEST
+            if last > MAXTEST:
+                usage_error("Invalid test range '%s'" % arg)
+            tests.update(range(int(first), last + 1))
+        else:
+            usage_error("Unknown option or test selector '%s'" % arg)
+
+    if not tests:
+        tests = set(range(MAXTEST + 1))
+    tests -= skip
+    return opts, tests
+
+# ------ Finding out about the build ------
+
+# pcre2test -C <option> reports a feature in its exit code.
+
+def config(base, name):
+    return subprocess.run(base + ['-C', name], stdout=subprocess.DEVNULL).returncode
+
+# Find a French locale that pcre2test can set, as RunTest does. The result is
+# None if there is none.
+
+def find_locale(base):
+    try:
+        available = subprocess.run(['locale', '-a'], capture_output=True,
+            text=True).stdout.split()
+    except OSError:
+        return None
+    for loc in LOCALES:
+        if loc not in available:
+            continue
+        result = subprocess.run(base + ['-q'], input='/a/locale=%s\n' % loc,
+            capture_output=True, text=True)
+        if 'Failed to set locale' not in result.stdout:
+            return loc
+    return None
+
+# ------ Building the list of jobs ------
+
+# Each job is a dictionary with the test name, the width, the pcre2test mode
+# option ('' or -jit or -dfa), and the names of the input file and the
+# acceptable output files, relative to the testdata directory. A job with no
+# output files is run but not checked. Jobs that are skipped are recorded with
+# the reason, once for each test and width.
+
+def make_jobs(tests, widths, features):
+    jobs = []
+    skipped = []
+    utf = features['utf']
+    jit = features['jit']
+    jitopts = [''] + (['-jit'] if jit and not features['nojit'] else [])
+
+    def add(test, bits, opts, suffix, infile=None):
+        for opt in opts:
+            jobs.append({'test': test, 'bits': bits, 'opt': opt,
+                'infile': 'testinput%s' % test if infile is None else infile,
+                'outfiles': ['testoutput%s' % suffix] if suffix else []})
+
+    def skip(test, bits, reason):
+        skipped.append('Test %s (%d-bit): skipped because %s' % (test, bits, reason))
+
+    for bits in widths:
+        wide = bits != 8
+
+        for test in sorted(t for t in tests if t != 'heap'):
+            if test == 0:
+                add(0, bits, [''], None, '')
+            elif test in (1, 2):
+                add(test, bits, jitopts, test)
+            elif test == 3:
+                if features['locale'] is None:
+                    skip(3, bits, 'no French locale can be set')
+                else:
+                    for opt in jitopts:
+                        jobs.append({'test': 3, 'bits': bits, 'opt': opt,
+                            'infile': 'testinput3', 'outfiles': ['testoutput3',
+                            'testoutput3A', 'testoutput3B']})
+            elif test in (9, 10, 18, 19) and wide:
+                skip(test, bits, 'it is for the 8-bit library')
+            elif test in (11, 12, 13) and not wide:
+                skip(test, bits, 'it is for the 16/32-bit libraries')
+            elif test in (21, 22) and not features['bsc']:
+                skip(test, bits, '\\C is disabled')
+            elif test in (4, 5, 7, 8, 10, 12, 14, 19, 22, 25, 26, 27) and not utf:
+                skip(test, bits, 'UTF-%d support is not available' % bits)
+            elif test in (4, 5, 7) and not features['ucdfull']:
+                skip(test, bits, 'some Unicode property data was omitted')
+            elif test in (12, 26, 27) and not features['ucdscripts']:
+                skip(test, bits, 'the Unicode script data was omitted')
+            elif test in (4, 5, 9, 10, 26, 27):
+                add(test, bits, jitopts, test)
+            elif test in (6, 7, 13, 15, 18, 19, 20, 24, 25):
+                add(test, bits, [''], test)
+            elif test == 8:
+                add(8, bits, [''], '8-%d-%d' % (bits, features['link_size']))
+            elif test in (11, 12, 22):
+                add(test, bits, jitopts, '%d-%d' % (test, bits))
+            elif test == 14:
+                add(14, bits, [''], '14-%d' % bits)
+            elif test == 16:
+                if jit:
+                    skip(16, bits, 'JIT is available')
+                else:
+                    add(16, bits, [''], 16)
+            elif test == 17:
+                if not jit or features['nojit']:
+                    skip(17, bits, 'JIT is not available or nojit was specified')
+                else:
+                    jobs.append({'test': 17, 'bits': bits, 'opt': '',
+                        'infile': 'testinput17', 'outfiles': ['testoutput17'],
+                        'jitvalgrind': True})
+            elif test == 21:
+                add(21, bits, jitopts + ['-dfa'], 21)
+            elif test == 23:
+                if features['bsc']:
+                    skip(23, bits, '\\C is not disabled')
+                else:
+                    add(23, bits, [''], 23)
+
+        if 'heap' in tests:
+            add('heap', bits, [''], 'heap-%d' % bits)
+
+    return jobs, skipped
+
+# ------ Running a job ------
+
+# Run one job in its own directory, and return the job with its output, the
+# time it took, and a list of problems, which is empty if the test passed.
+
+def run_job(job, env):
+    testdata = env['testdata']
+    base = env['sim'] + env['valgrind']
+    if env['valgrind'] and env['vjs'] and (job['opt'] or job.get('jitvalgrind')):
+        base = base + [env['vjs']]
+    base = base + [env['pcre2test']]
+    bmode = ['-%d' % job['bits']]
+    opt = [job['opt']] if job['opt'] else []
+    start = time.perf_counter()
+    problems = []
+    output = ''
+
+    with tempfile.TemporaryDirectory(prefix='pcre2test-') as workdir:
+        def run(args):
+            return subprocess.run(base + args, cwd=workdir, capture_output=True)
+
+        if job['test'] == 0:
+            with open(os.path.join(workdir, 'testSinput'), 'w') as f:
+                f.write('/abc/jit,memory,framesize\n   abc\n')
+            specials = [['-C'], ['--help']]
+            if env['setstack_ok']:
+                specials.append(['-S', '1', '-t', '10', 'testSinput'])
+            for args in specials:
+                result = run(args)
+                if result.returncode != 0:
+                    problems.append('pcre2test %s failed' % ' '.join(args))
+                    break
+        else:
+            infile = os.path.join(testdata, job['infile'])
+            expected = [os.path.join(testdata, f) for f in job['outfiles']]
+            if job['test'] == 2:
+                with open(os.path.join(testdata, 'testbtables'), 'rb') as src, \
+                     open(os.path.join(workdir, 'testbtables'), 'wb') as dst:
+                    dst.write(src.read())
+            if job['test'] == 3 and env['locale'] != 'fr_FR':
+                infile = os.path.join(workdir, 'test3input')
+                with open(os.path.join(testdata, 'testinput3')) as f:
+                    text = f.read().replace('fr_FR', env['locale'])
+                with open(infile, 'w') as f:
+                    f.write(text)
+
+            result = run(['-q'] + env['setstack'] + bmode + opt + [infile, 'testtry'])
+            if result.returncode == 0 and job['test'] == 2:
+                extra = run(['-q'] + bmode + opt + ['-error', ERROR_ARGS])
+                result = extra
+                with open(os.path.join(workdir, 'testtry'), 'ab') as f:
+                    f.write(extra.stdout)
+
+            try:
+                with open(os.path.join(workdir, 'testtry'), errors='replace') as f:
+                    output = f.read()
+            except OSError:
+                pass
+
+            if result.returncode != 0:
+                problems.append('pcre2test failed with exit code %d' % result.returncode)
+                if result.stderr:
+                    problems.append(result.stderr.decode(errors='replace').rstrip())
+            else:
+                problems = compare(output, expected, env['locale'] if job['test'] == 3 else None)
+
+    job['time'] = time.perf_counter() - start
+    job['output'] = output
+    job['problems'] = problems
+    return job
+
+# Compare the output with each acceptable output file, returning an empty list
+# if one of them matches, or the differences from the first one if none does.
+
+def compare(output, expected, locale):
+    first_diff = None
+    for name in expected:
+        with open(name, errors='replace') as f:
+            text = f.read()
+        if locale is not None:
+            text = text.replace('fr_FR', locale)
+        if text == output:
+            return []
+        if first_diff is None:
+            first_diff = ''.join(difflib.unified_diff(text.splitlines(True),
+                output.splitlines(True), name, 'testtry'))
+    return [first_diff]
+
+def job_name(job):
+    return 'Test %s %d-bit%s' % (job['test'], job['bits'],
+        ' ' + job['opt'] if job['opt'] else '')
+
+# ------ Main program ------
+
+def main():
+    opts, tests = parse_args(sys.argv[1:])
+
+    srcdir = os.environ.get('srcdir') or \
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    testdata = os.path.join(srcdir, 'testdata')
+    if not os.path.isdir(testdata):
+        usage_error('Cannot find the testdata directory')
+    pcre2test = os.path.abspath(os.environ.get('pcre2test') or './pcre2test')
+    if not os.access(pcre2test, os.X_OK):
+        usage_error('** %s does not exist or is not executable.' % pcre2test)
+
+    base = opts['sim'] + [pcre2test]
+    link_size = config(base, 'linksize')
+    if link_size < 2 or link_size > 4:
+        usage_error('ParallelRunTest: Failed to find internal link size')
+
+    setstack_ok = subprocess.run(base + ['-S', '32', os.devnull, os.devnull],
+        stdout=subprocess.DEVNULL).returncode == 0
+    supported = [w for w in (8, 16, 32) if config(base, 'pcre2-%d' % w) != 0]
+    widths = opts['widths'] or supported
+    for w in widths:
+        if w not in supported:
+            usage_error('Cannot run %d-bit library tests: %d-bit library not compiled' % (w, w))
+
+    features = {
+        'link_size': link_size,
+        'utf': config(base, 'unicode') != 0,
+        'jit': config(base, 'jit') != 0,
+        'bsc': config(base, 'backslash-C') != 0,
+        'ucdfull': all(config(base, 'ucd-' + column) != 0
+            for column in ('scripts', 'bidi', 'bprops')),
+        'ucdscripts': config(base, 'ucd-scripts') != 0,
+        'nojit': opts['nojit'],
+        'locale': find_locale(base) if 3 in tests else None,
+    }
+
+    env = {
+        'testdata': testdata,
+        'pcre2test': pcre2test,
+        'sim': opts['sim'],
+        'valgrind': opts['valgrind'],
+        'vjs': '--suppressions=%s' % os.path.join(testdata, 'valgrind-jit.supp')
+            if features['jit'] and not opts['nojit'] else None,
+        'setstack': ['-S', '32'] if setstack_ok and opts['bigstack'] else [],
+        'setstack_ok': setstack_ok,
+        'locale': features['locale'],
+    }
+
+    jobs, skipped = make_jobs(tests, sorted(widths), features)
+
+    print('PCRE2 C library tests using test data from %s' % testdata)
+    print(subprocess.run(base + [os.devnull], capture_output=True,
+        text=True).stdout.strip())
+    print('Running %d jobs for the %s-bit libraries with %d workers' % (len(jobs),
+        '/'.join(str(w) for w in sorted(widths)), opts['jobs']))
+    for line in skipped:
+        print('  ' + line)
+    print('')
+
+    # Start the biggest input files first, so that a long job is not left
+    # running on its own at the end.
+
+    def size(job):
+        name = os.path.join(testdata, job['infile'])
+        return os.path.getsize(name) if job['infile'] else 0
+
+    jobs.sort(key=size, reverse=True)
+    wall = time.perf_counter()
+    failed = []
+    with ThreadPoolExecutor(max_workers=opts['jobs']) as pool:
+        futures = [pool.submit(run_job, job, env) for job in jobs]
+        for future in futures:
+            job = future.result()
+            if job['problems']:
+                failed.append(job)
+    wall = time.perf_counter() - wall
+
+    # Show the details of any failures, keeping the output for inspection.
+
+    for job in failed:
+        name = 'testtry-%s-%d%s' % (job['test'], job['bits'], job['opt'])
+        with open(name, 'w') as f:
+            f.write(job['output'])
+        print('** %s failed (output is in %s)' % (job_name(job), name))
+        for problem in job['problems']:
+            print(problem.rstrip())
+        print('')
+
+    # List the times for each job, in test order, then the total for each test
+    # file.
+
+    jobs.sort(key=lambda job: (job['test'] == 'heap',
+        0 if job['test'] == 'heap' else job['test'], job['bits'], job['opt']))
+    print('Time (s)  Job')
+    for job in jobs:
+        print('%8.2f  %s %s' % (job['time'], job_name(job),
+            'FAILED' if job['problems'] else 'OK'))
+
+    print('')
+    print('Time (s)  Jobs  Test file')
+    totals = {}
+    for job in jobs:
+        name = job['infile'] or 'test 0'
+        count, total = totals.get(name, (0, 0.0))
+        totals[name] = (count + 1, total + job['time'])
+    for name, (count, total) in sorted(totals.items(), key=lambda x: -x[1][1]):
+        print('%8.2f  %4d  %s' % (total, count, name))
+
+    serial = sum(job['time'] for job in jobs)
+    print('')
+    print('%d jobs, %d failed; %.2fs elapsed, %.2fs if run one at a time' % (
+        len(jobs), len(failed), wall, serial))
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,143 @@
+/***************************************************
+* A program for timing caseless character classes  *
+***************************************************/
+
+/* Copyright (c) University of Cambridge 2026 */
+
+/* Compile thus, against the 8-bit library in a CMake build directory:
+
+   gcc -O2 -I<build> -I<build>/interface -o nocasebench nocasebench.c \
+     <build>/libpcre2-8.a
+
+For a configure build, use -I<build>/src and <build>/.libs/libpcre2-8.a. The
+NocaseRangesBench script does this for each value of GenerateUcd.py's
+--nocase-min-length option.
+
+The ucd_nocase_ranges table lists long runs of characters that have no other
+case. When a caseless class is compiled in UTF mode, the characters in those
+runs are skipped; all other characters are checked one by one for other cases.
+Fewer, longer ranges make the table smaller but leave more characters to be
+checked. This program times the compilation of some wide caseless classes and
+also matches them, to show whether the compiled code changes. Its output is one
+line: the time in microseconds to compile all the patterns, the matching speed
+in megabytes per second, and the number of matches. The times are the best of
+several batches, since interference from other processes can only slow a run
+down. */
+
+#define PCRE2_CODE_UNIT_WIDTH 8
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "pcre2.h"
+
+#define BATCHES       10
+#define COMPILE_LOOPS 20
+#define MATCH_LOOPS   4
+
+static const char *patterns[] = {
+  "[\\x{100}-\\x{10ffff}]+",
+  "[^\\x{0}-\\x{40}]+",
+  "[\\x{370}-\\x{52f}\\x{1e00}-\\x{1fff}]+",
+  "[\\x{2000}-\\x{2fff}\\x{a640}-\\x{a7ff}]+",
+  "[\\x{3000}-\\x{9fff}\\x{ac00}-\\x{d7a3}]+",
+  "[\\x{10000}-\\x{1ffff}]+",
+};
+
+#define PATTERN_COUNT (sizeof(patterns)/sizeof(patterns[0]))
+
+/* Greek, Cyrillic, Latin with diacritics, Han, and Deseret (U+10400) */
+
+static const char *words[] = {
+  "\xce\x95\xce\xbb\xce\xbb\xce\xb7\xce\xbd\xce\xb9\xce\xba\xce\xac",
+  "\xd0\x9a\xd0\x98\xd0\xa0\xd0\x98\xd0\x9b\xd0\x9b\xd0\x98\xd0\xa6\xd0\x90",
+  "\xe1\xb8\x82\xe1\xb8\x83\xe1\xbb\xb2", "\xe6\xbc\xa2\xe5\xad\x97",
+  "\xf0\x90\x90\x80\xf0\x90\x90\xa8", "ASCII",
+};
+
+#define WORD_COUNT (sizeof(words)/sizeof(words[0]))
+
+static double
+seconds(clock_t start)
+{
+return (double)(clock() - start) / CLOCKS_PER_SEC;
+}
+
+int
+main(void)
+{
+char *subject;
+size_t length = 0;
+unsigned int seed = 1;
+pcre2_code *codes[PATTERN_COUNT];
+pcre2_match_data *md;
+double compile_time, match_time;
+long matches = 0;
+clock_t start;
+int errcode, batch;
+size_t i, j;
+PCRE2_SIZE erroffset;
+
+subject = malloc(20000 * 20);
+if (subject == NULL) return 1;
+for (i = 0; i < 20000; i++)
+  {
+  seed = seed * 1103515245u + 12345u;
+  length += (size_t)sprintf(subject + length, "%s ", words[(seed >> 16) % WORD_COUNT]);
+  }
+
+compile_time = match_time = 1e9;
+md = pcre2_match_data_create(1, NULL);
+
+for (batch = 0; batch < BATCHES; batch++)
+  {
+  double t;
+
+  start = clock();
+  for (i = 0; i < COMPILE_LOOPS; i++)
+    {
+    for (j = 0; j < PATTERN_COUNT; j++)
+      {
+      codes[j] = pcre2_compile((PCRE2_SPTR)patterns[j], PCRE2_ZERO_TERMINATED,
+        PCRE2_UTF|PCRE2_CASELESS, &errcode, &erroffset, NULL);
+      if (codes[j] == NULL)
+        {
+        printf("** Failed to compile %s\n", patterns[j]);
+        return 1;
+        }
+      if (i < COMPILE_LOOPS - 1) pcre2_code_free(codes[j]);
+      }
+    }
+  t = seconds(start);
+  if (t < compile_time) compile_time = t;
+
+  matches = 0;
+  start = clock();
+  for (i = 0; i < MATCH_LOOPS; i++)
+    {
+    for (j = 0; j < PATTERN_COUNT; j++)
+      {
+      PCRE2_SIZE offset = 0;
+      while (pcre2_match(codes[j], (PCRE2_SPTR)subject, length, offset,
+          PCRE2_NO_UTF_CHECK, md, NULL) >= 0)
+        {
+        offset = pcre2_get_ovector_pointer(md)[1];
+        matches++;
+        }
+      }
+    }
+  t = seconds(start);
+  if (t < match_time) match_time = t;
+
+  for (j = 0; j < PATTERN_COUNT; j++) pcre2_code_free(codes[j]);
+  }
+
+printf("%9.1f %9.1f %8ld\n", compile_time * 1e6 / COMPILE_LOOPS,
+  (double)length * MATCH_LOOPS * PATTERN_COUNT / match_time / 1e6,
+  matches / MATCH_LOOPS);
+
+pcre2_match_data_free(md);
+free(subject);
+return 0;
+}
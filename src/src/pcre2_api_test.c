@@ -0,0 +1,767 @@
+/*************************************************
+*      PCRE2 test program for API extensions     *
+*************************************************/
+
+/*
+Copyright (c) 2026 University of Cambridge
+
+This program tests library functions that pcre2test has no way of calling,
+such as those that work on arrays of subjects or on a sequence of calls. Each
+group of tests is a function that is compiled only when the library it needs
+has been built.
+
+If run with no options, there is no output on success, and the return code is
+zero. If any test fails there is output to stderr, and the return code is 1.
+The "-v" option causes the name of each group of tests to be written to
+stdout. */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#define PCRE2_CODE_UNIT_WIDTH 0
+#include "pcre2.h"
+
+#define PRINTF if (v) printf     /* Shorthand for testing output */
+#define CHECK(x) check((x), #x, __LINE__)
+
+static int v;
+static int failures;
+
+/* Report a failed check, but carry on with the others. */
+
+static void
+check(int ok, const char *text, int line)
+{
+if (ok) return;
+fprintf(stderr, "pcre2_api_test: line %d: check failed: %s\n", line, text);
+failures++;
+}
+
+
+
+#ifdef SUPPORT_PCRE2_8
+/*************************************************
+*           Tests of pcre2_match_batch()         *
+*************************************************/
+
+static void
+test_match_batch(void)
+{
+static const char *subjects[] = { "abba", "xyz", "", NULL, "bbc" };
+static const PCRE2_SIZE lengths[] = { 4, 3, 0, 0, 1 };
+PCRE2_SPTR8 sp[5];
+PCRE2_SIZE offsets[10];
+int results[5];
+int errcode, rc, i;
+PCRE2_SIZE erroffset;
+pcre2_code_8 *code, *empty;
+pcre2_match_data_8 *md;
+
+PRINTF("pcre2_match_batch\n");
+
+for (i = 0; i < 5; i++) sp[i] = (PCRE2_SPTR8)subjects[i];
+code = pcre2_compile_8((PCRE2_SPTR8)"b+", PCRE2_ZERO_TERMINATED, 0, &errcode,
+  &erroffset, NULL);
+empty = pcre2_compile_8((PCRE2_SPTR8)"^$", PCRE2_ZERO_TERMINATED, 0, &errcode,
+  &erroffset, NULL);
+md = pcre2_match_data_create_8(3, NULL);
+CHECK(code != NULL && empty != NULL && md != NULL);
+if (code == NULL || empty == NULL || md == NULL) return;
+
+/* Mixed matching and non-matching subjects, with explicit lengths. The empty
+subject and the NULL one of length zero do not match "b+", and the last subject
+is cut to its first character. Failures leave unset offsets. */
+
+for (i = 0; i < 10; i++) offsets[i] = 99;
+rc = pcre2_match_batch_8(code, sp, lengths, 5, 0, md, NULL, results, offsets);
+CHECK(rc == 2);
+CHECK(results[0] == 1 && offsets[0] == 1 && offsets[1] == 3);
+CHECK(results[1] == PCRE2_ERROR_NOMATCH);
+CHECK(offsets[2] == PCRE2_UNSET && offsets[3] == PCRE2_UNSET);
+CHECK(results[2] == PCRE2_ERROR_NOMATCH);
+CHECK(offsets[4] == PCRE2_UNSET && offsets[5] == PCRE2_UNSET);
+CHECK(results[3] == PCRE2_ERROR_NOMATCH);
+CHECK(offsets[6] == PCRE2_UNSET && offsets[7] == PCRE2_UNSET);
+CHECK(results[4] == 1 && offsets[8] == 0 && offsets[9] == 1);
+
+/* The empty subject and the NULL one of length zero are both empty strings,
+and the same results come with a private match data block and no offsets. */
+
+rc = pcre2_match_batch_8(empty, sp, lengths, 5, 0, NULL, NULL, results, NULL);
+CHECK(rc == 2);
+CHECK(results[0] == PCRE2_ERROR_NOMATCH && results[1] == PCRE2_ERROR_NOMATCH);
+CHECK(results[2] == 1 && results[3] == 1);
+CHECK(results[4] == PCRE2_ERROR_NOMATCH);
+
+/* Without lengths the subjects are zero-terminated, so the NULL subject is an
+error for that subject only, and the last one is matched in full. */
+
+rc = pcre2_match_batch_8(code, sp, NULL, 5, 0, md, NULL, results, offsets);
+CHECK(rc == 2);
+CHECK(results[3] == PCRE2_ERROR_NULL);
+CHECK(offsets[6] == PCRE2_UNSET && offsets[7] == PCRE2_UNSET);
+CHECK(results[4] == 1 && offsets[8] == 0 && offsets[9] == 2);
+
+/* Errors that apply to the whole batch, and an empty batch. */
+
+CHECK(pcre2_match_batch_8(NULL, sp, NULL, 5, 0, md, NULL, results, NULL) ==
+  PCRE2_ERROR_NULL);
+CHECK(pcre2_match_batch_8(code, sp, NULL, 5, 0, md, NULL, NULL, NULL) ==
+  PCRE2_ERROR_NULL);
+CHECK(pcre2_match_batch_8(code, NULL, NULL, 5, 0, md, NULL, results, NULL) ==
+  PCRE2_ERROR_NULL);
+CHECK(pcre2_match_batch_8(code, NULL, NULL, 0, 0, md, NULL, results, NULL) ==
+  0);
+
+pcre2_match_data_free_8(md);
+pcre2_code_free_8(empty);
+pcre2_code_free_8(code);
+}
+
+
+
+/*************************************************
+*      Tests of the stream matching functions    *
+*************************************************/
+
+/* The stream callbacks record the stream offsets of each match. */
+
+typedef struct {
+  int count;
+  PCRE2_SIZE starts[8];
+  PCRE2_SIZE ends[8];
+} found_matches;
+
+static void
+record_match(found_matches *found, PCRE2_SIZE *ovector, PCRE2_SIZE base)
+{
+if (found->count < 8)
+  {
+  found->starts[found->count] = base + ovector[0];
+  found->ends[found->count] = base + ovector[1];
+  }
+found->count++;
+}
+
+static int
+stream_callback_8(pcre2_match_data_8 *md, PCRE2_SIZE base, void *data)
+{
+record_match((found_matches *)data, pcre2_get_ovector_pointer_8(md), base);
+return 0;
+}
+
+static pcre2_stream_8 *
+stream_create_8(const char *pattern, uint32_t options, PCRE2_SIZE bufsize,
+  found_matches *found, pcre2_code_8 **code)
+{
+int errcode;
+PCRE2_SIZE erroffset;
+pcre2_stream_8 *stream;
+
+found->count = 0;
+*code = pcre2_compile_8((PCRE2_SPTR8)pattern, PCRE2_ZERO_TERMINATED, options,
+  &errcode, &erroffset, NULL);
+CHECK(*code != NULL);
+if (*code == NULL) return NULL;
+stream = pcre2_stream_create_8(*code, bufsize, stream_callback_8, found, NULL);
+CHECK(stream != NULL);
+if (stream == NULL) pcre2_code_free_8(*code);
+return stream;
+}
+
+static int
+feed_8(pcre2_stream_8 *stream, const char *chunk)
+{
+return pcre2_stream_feed_8(stream, (PCRE2_SPTR8)chunk, PCRE2_ZERO_TERMINATED,
+  0, NULL);
+}
+
+static void
+test_stream_8(void)
+{
+found_matches found;
+pcre2_code_8 *code;
+pcre2_stream_8 *stream;
+
+PRINTF("pcre2_stream (8-bit)\n");
+
+/* A match that is split across three chunks is held back until its end has
+arrived, and is reported with stream offsets. */
+
+stream = stream_create_8("hello world", 0, 64, &found, &code);
+if (stream == NULL) return;
+CHECK(feed_8(stream, "say hel") == 0);
+CHECK(feed_8(stream, "lo wor") == 0);
+CHECK(feed_8(stream, "ld! hello world") == 2);
+CHECK(pcre2_stream_finish_8(stream, 0, NULL) == 0);
+CHECK(found.count == 2);
+CHECK(found.starts[0] == 4 && found.ends[0] == 15);
+CHECK(found.starts[1] == 17 && found.ends[1] == 28);
+pcre2_stream_free_8(stream);
+pcre2_code_free_8(code);
+
+/* The characters before each chunk are kept for lookbehinds and for \b, which
+must not match at the start of a chunk that continues a word. */
+
+stream = stream_create_8("(?<=abc)d", 0, 16, &found, &code);
+if (stream == NULL) return;
+CHECK(feed_8(stream, "xxxxxxxxxxabc") == 0);
+CHECK(feed_8(stream, "dabc") == 1);
+CHECK(feed_8(stream, "d") == 1);
+CHECK(pcre2_stream_finish_8(stream, 0, NULL) == 0);
+CHECK(found.count == 2 && found.starts[0] == 13 && found.starts[1] == 17);
+pcre2_stream_free_8(stream);
+pcre2_code_free_8(code);
+
+stream = stream_create_8("\\bcat", 0, 16, &found, &code);
+if (stream == NULL) return;
+CHECK(feed_8(stream, "con") == 0);
+CHECK(feed_8(stream, "cat cat") == 1);
+CHECK(pcre2_stream_finish_8(stream, 0, NULL) == 0);
+CHECK(found.count == 1 && found.starts[0] == 7);
+pcre2_stream_free_8(stream);
+pcre2_code_free_8(code);
+
+/* A UTF-8 character that is cut by the end of a chunk is completed by the
+next one. A pattern that can match at the end of the subject does so only when
+the stream is finished. */
+
+#ifdef SUPPORT_UNICODE
+stream = stream_create_8("\\x{e9}+|z$", PCRE2_UTF, 16, &found, &code);
+if (stream == NULL) return;
+CHECK(feed_8(stream, "caf\xc3") == 0);
+CHECK(feed_8(stream, "\xa9\xc3") == 0);
+CHECK(feed_8(stream, "\xa9!z") == 1);
+CHECK(found.count == 1 && found.starts[0] == 3 && found.ends[0] == 7);
+CHECK(pcre2_stream_finish_8(stream, 0, NULL) == 1);
+CHECK(found.count == 2 && found.starts[1] == 8 && found.ends[1] == 9);
+pcre2_stream_free_8(stream);
+pcre2_code_free_8(code);
+#endif
+
+/* A partial match that fills the buffer stops the stream. Finishing it then
+searches what was kept, and the stream can be used again. */
+
+stream = stream_create_8("<[^>]*>", 0, 8, &found, &code);
+if (stream == NULL) return;
+CHECK(feed_8(stream, "ab<cdefghijk") == PCRE2_ERROR_NOMEMORY);
+CHECK(pcre2_stream_finish_8(stream, 0, NULL) == 0);
+CHECK(feed_8(stream, "<ok>") == 1);
+CHECK(pcre2_stream_finish_8(stream, 0, NULL) == 0);
+CHECK(found.count == 1 && found.starts[0] == 0 && found.ends[0] == 4);
+
+/* Bad arguments */
+
+CHECK(pcre2_stream_feed_8(stream, NULL, 0, 0, NULL) == 0);
+CHECK(pcre2_stream_feed_8(stream, NULL, 1, 0, NULL) == PCRE2_ERROR_NULL);
+CHECK(pcre2_stream_feed_8(stream, (PCRE2_SPTR8)"x", 1, PCRE2_PARTIAL_SOFT,
+  NULL) == PCRE2_ERROR_BADOPTION);
+CHECK(pcre2_stream_finish_8(NULL, 0, NULL) == PCRE2_ERROR_NULL);
+CHECK(pcre2_stream_create_8(code, 4, NULL, NULL, NULL) == NULL);
+CHECK(pcre2_stream_create_8(NULL, 64, NULL, NULL, NULL) == NULL);
+pcre2_stream_free_8(stream);
+pcre2_stream_free_8(NULL);
+pcre2_code_free_8(code);
+}
+#endif  /* SUPPORT_PCRE2_8 */
+
+
+#ifdef SUPPORT_PCRE2_8
+/*************************************************
+*   Tests of JIT stack pools and JIT memory info  *
+*************************************************/
+
+#ifdef SUPPORT_JIT
+/* Memory functions that count the blocks outstanding, to check that freeing a
+pool frees everything that it and its stacks obtained. */
+
+static int blocks;
+
+static void *
+counting_malloc(size_t size, void *data)
+{
+(void)data;
+blocks++;
+return malloc(size);
+}
+
+static void
+counting_free(void *block, void *data)
+{
+(void)data;
+if (block != NULL) blocks--;
+free(block);
+}
+#endif  /* SUPPORT_JIT */
+
+static void
+test_jit_pool(void)
+{
+#ifdef SUPPORT_JIT
+pcre2_general_context_8 *gcontext;
+pcre2_jit_stack_pool_8 *pool;
+pcre2_jit_stack_8 *s1, *s2, *s3;
+pcre2_code_8 *code;
+pcre2_match_data_8 *md;
+pcre2_match_context_8 *mcontext;
+PCRE2_SIZE chunks, total, used, value;
+int errcode, rc;
+PCRE2_SIZE erroffset;
+#endif
+
+PRINTF("pcre2_jit_stack_pool\n");
+
+#ifndef SUPPORT_JIT
+CHECK(pcre2_jit_stack_pool_create_8(1024, 4096, 1, NULL) == NULL);
+CHECK(pcre2_jit_stack_pool_get_8(NULL) == NULL);
+pcre2_jit_stack_pool_free_8(NULL);
+CHECK(pcre2_jit_memory_info_8(PCRE2_JIT_MEMINFO_CHUNKS, NULL) ==
+  PCRE2_ERROR_JIT_BADOPTION);
+#else
+
+/* Sizes are checked as for pcre2_jit_stack_create(), except that a starting
+size larger than the maximum is reduced to the maximum. */
+
+CHECK(pcre2_jit_stack_pool_create_8(0, 4096, 1, NULL) == NULL);
+CHECK(pcre2_jit_stack_pool_create_8(1024, 0, 1, NULL) == NULL);
+CHECK(pcre2_jit_stack_pool_get_8(NULL) == NULL);
+pcre2_jit_stack_pool_put_8(NULL, NULL);
+pcre2_jit_stack_pool_free_8(NULL);
+
+pool = pcre2_jit_stack_pool_create_8(64*1024, 32*1024, 0, NULL);
+CHECK(pool != NULL);
+if (pool != NULL)
+  {
+  s1 = pcre2_jit_stack_pool_get_8(pool);
+  CHECK(s1 != NULL);
+  pcre2_jit_stack_pool_put_8(pool, s1);   /* keep is 0, so it is freed */
+  pcre2_jit_stack_pool_free_8(pool);
+  }
+
+/* Up to "keep" returned stacks are kept, and handed out again. */
+
+gcontext = pcre2_general_context_create_8(counting_malloc, counting_free, NULL);
+CHECK(gcontext != NULL);
+if (gcontext == NULL) return;
+blocks = 0;
+pool = pcre2_jit_stack_pool_create_8(1024, 64*1024, 1, gcontext);
+CHECK(pool != NULL);
+if (pool == NULL)
+  {
+  pcre2_general_context_free_8(gcontext);
+  return;
+  }
+s1 = pcre2_jit_stack_pool_get_8(pool);
+s2 = pcre2_jit_stack_pool_get_8(pool);
+CHECK(s1 != NULL && s2 != NULL && s1 != s2);
+pcre2_jit_stack_pool_put_8(pool, s1);
+pcre2_jit_stack_pool_put_8(pool, s2);   /* The pool is full; s2 is freed */
+s3 = pcre2_jit_stack_pool_get_8(pool);
+CHECK(s3 == s1);
+
+/* A stack from the pool is used like any other. */
+
+code = pcre2_compile_8((PCRE2_SPTR8)"(a|b)*c", PCRE2_ZERO_TERMINATED, 0,
+  &errcode, &erroffset, NULL);
+md = pcre2_match_data_create_8(2, NULL);
+mcontext = pcre2_match_context_create_8(NULL);
+CHECK(code != NULL && md != NULL && mcontext != NULL);
+if (code != NULL && md != NULL && mcontext != NULL &&
+    pcre2_jit_compile_8(code, PCRE2_JIT_COMPLETE) == 0)
+  {
+  pcre2_jit_stack_assign_8(mcontext, NULL, s3);
+  rc = pcre2_match_8(code, (PCRE2_SPTR8)"xababc", 6, 0, 0, md, mcontext);
+  CHECK(rc == 2 && pcre2_get_ovector_pointer_8(md)[0] == 1);
+
+  /* With a JIT-compiled pattern in existence, the executable allocator has
+  at least one chunk in use, unless it does not keep the numbers. */
+
+  rc = pcre2_jit_memory_info_8(PCRE2_JIT_MEMINFO_CHUNKS, &chunks);
+  if (rc != PCRE2_ERROR_JIT_BADOPTION)
+    {
+    CHECK(rc == 0 && chunks >= 1);
+    CHECK(pcre2_jit_memory_info_8(PCRE2_JIT_MEMINFO_TOTALSIZE, &total) == 0);
+    CHECK(pcre2_jit_memory_info_8(PCRE2_JIT_MEMINFO_USEDSIZE, &used) == 0);
+    CHECK(used > 0 && used <= total);
+    CHECK(pcre2_jit_memory_info_8(PCRE2_JIT_MEMINFO_FREEBLOCKS, &value) == 0);
+    CHECK(pcre2_jit_memory_info_8(PCRE2_JIT_MEMINFO_LARGESTFREE, &value) == 0);
+    CHECK(value <= total - used);
+    CHECK(pcre2_jit_memory_info_8(PCRE2_JIT_MEMINFO_CHUNKS, NULL) ==
+      PCRE2_ERROR_NULL);
+    CHECK(pcre2_jit_memory_info_8(99, &value) == PCRE2_ERROR_BADOPTION);
+    }
+  }
+pcre2_match_context_free_8(mcontext);
+pcre2_match_data_free_8(md);
+pcre2_code_free_8(code);
+
+/* Stacks that are handed out when the pool is freed are freed separately;
+everything that was obtained from the general context is then given back. */
+
+pcre2_jit_stack_pool_put_8(pool, s3);
+s1 = pcre2_jit_stack_pool_get_8(pool);
+pcre2_jit_stack_pool_free_8(pool);
+pcre2_jit_stack_free_8(s1);
+CHECK(blocks == 0);
+pcre2_general_context_free_8(gcontext);
+#endif  /* SUPPORT_JIT */
+}
+#endif  /* SUPPORT_PCRE2_8 */
+
+
+#ifdef SUPPORT_PCRE2_8
+/*************************************************
+*         Tests of match instrumentation         *
+*************************************************/
+
+/* The slow match callback records the number of calls and the last block. */
+
+typedef struct slow_matches {
+  int count;
+  pcre2_slow_match_block_8 last;
+} slow_matches;
+
+static void
+slow_match_callback(pcre2_slow_match_block_8 *block, void *data)
+{
+slow_matches *slow = (slow_matches *)data;
+slow->count++;
+slow->last = *block;
+}
+
+static uint64_t
+total(uint32_t what)
+{
+uint64_t value = 0;
+CHECK(pcre2_instrumentation_info_8(what, &value) == 0);
+return value;
+}
+
+static void
+test_instrumentation(void)
+{
+pcre2_code_8 *code;
+pcre2_match_data_8 *md;
+pcre2_match_context_8 *mcontext;
+slow_matches slow;
+uint32_t instrumented = 0;
+uint64_t value;
+int errcode, rc;
+PCRE2_SIZE erroffset;
+
+PRINTF("instrumentation\n");
+
+(void)pcre2_config_8(PCRE2_CONFIG_INSTRUMENTATION, &instrumented);
+mcontext = pcre2_match_context_create_8(NULL);
+CHECK(mcontext != NULL);
+if (mcontext == NULL) return;
+
+if (!instrumented)
+  {
+  CHECK(pcre2_instrumentation_info_8(PCRE2_INSTR_CALLS, &value) ==
+    PCRE2_ERROR_BADOPTION);
+  CHECK(pcre2_set_slow_match_callback_8(mcontext, slow_match_callback, 0,
+    &slow) == PCRE2_ERROR_BADOPTION);
+  pcre2_match_context_free_8(mcontext);
+  return;
+  }
+
+CHECK(pcre2_instrumentation_info_8(PCRE2_INSTR_CALLS, NULL) ==
+  (int)sizeof(uint64_t));
+CHECK(pcre2_instrumentation_info_8(PCRE2_INSTR_COUNTERS, &value) ==
+  PCRE2_ERROR_BADOPTION);
+CHECK(pcre2_instrumentation_info_8(0x0400u, &value) == PCRE2_ERROR_BADOPTION);
+
+/* Nested quantifiers backtrack until the match limit is reached. The pattern
+is not JIT-compiled, so all the counts are for the interpreter. */
+
+pcre2_instrumentation_reset_8();
+code = pcre2_compile_8((PCRE2_SPTR8)"^(a+)+$", PCRE2_ZERO_TERMINATED, 0,
+  &errcode, &erroffset, NULL);
+md = pcre2_match_data_create_8(4, NULL);
+CHECK(code != NULL && md != NULL);
+if (code == NULL || md == NULL) goto EXIT;
+
+pcre2_set_match_limit_8(mcontext, 1000);
+rc = pcre2_match_8(code, (PCRE2_SPTR8)"aaaaaaaaaaaaaaaaaaaab", 21, 0, 0, md,
+  mcontext);
+CHECK(rc == PCRE2_ERROR_MATCHLIMIT);
+CHECK(total(PCRE2_INSTR_CALLS) == 1);
+CHECK(total(PCRE2_INSTR_MATCHLIMIT_HITS) == 1);
+CHECK(total(PCRE2_INSTR_BACKTRACKS) > 0);
+CHECK(total(PCRE2_INSTR_DFA|PCRE2_INSTR_CALLS) == 0);
+CHECK(total(PCRE2_INSTR_ALL|PCRE2_INSTR_CALLS) == 1);
+CHECK(total(PCRE2_INSTR_SLOW_MATCHES) == 0);
+pcre2_code_free_8(code);
+
+/* The start-of-match optimization skips to the first "x", and when there is
+no "q" at all, the whole subject is skipped without running the matcher. */
+
+pcre2_instrumentation_reset_8();
+CHECK(total(PCRE2_INSTR_CALLS) == 0);
+code = pcre2_compile_8((PCRE2_SPTR8)"xyz", PCRE2_ZERO_TERMINATED, 0, &errcode,
+  &erroffset, NULL);
+CHECK(code != NULL);
+if (code == NULL) goto EXIT;
+rc = pcre2_match_8(code, (PCRE2_SPTR8)"abcdefgxyz", 10, 0, 0, md, NULL);
+CHECK(rc == 1);
+CHECK(total(PCRE2_INSTR_START_SKIPS) == 7);
+rc = pcre2_match_8(code, (PCRE2_SPTR8)"abcdef", 6, 0, 0, md, NULL);
+CHECK(rc == PCRE2_ERROR_NOMATCH);
+CHECK(total(PCRE2_INSTR_START_SKIPS) == 13);
+CHECK(total(PCRE2_INSTR_CALLS) == 2);
+
+/* With a threshold of zero, the slow match callback is called for every
+match, with the counts for that call. */
+
+slow.count = 0;
+CHECK(pcre2_set_slow_match_callback_8(mcontext, slow_match_callback, 0,
+  &slow) == 0);
+rc = pcre2_match_8(code, (PCRE2_SPTR8)"--xyz", 5, 1, 0, md, mcontext);
+CHECK(rc == 1);
+CHECK(slow.count == 1);
+CHECK(slow.last.matcher == PCRE2_INSTR_INTERPRETER);
+CHECK(slow.last.rc == 1 && slow.last.code == code);
+CHECK(slow.last.subject_length == 5 && slow.last.start_offset == 1);
+CHECK(slow.last.counters[PCRE2_INSTR_CALLS] == 1);
+CHECK(slow.last.counters[PCRE2_INSTR_START_SKIPS] == 1);
+CHECK(slow.last.counters[PCRE2_INSTR_SLOW_MATCHES] == 1);
+CHECK(total(PCRE2_INSTR_SLOW_MATCHES) == 1);
+
+/* A threshold that no match reaches turns the callback off in effect. */
+
+CHECK(pcre2_set_slow_match_callback_8(mcontext, slow_match_callback,
+  UINT32_MAX, &slow) == 0);
+rc = pcre2_match_8(code, (PCRE2_SPTR8)"xyz", 3, 0, 0, md, mcontext);
+CHECK(rc == 1 && slow.count == 1);
+pcre2_code_free_8(code);
+
+pcre2_instrumentation_reset_8();
+CHECK(total(PCRE2_INSTR_ALL|PCRE2_INSTR_CALLS) == 0);
+
+EXIT:
+pcre2_match_data_free_8(md);
+pcre2_match_context_free_8(mcontext);
+}
+#endif  /* SUPPORT_PCRE2_8 */
+
+
+#ifdef SUPPORT_PCRE2_8
+/*************************************************
+*    Tests of matching with a chosen engine      *
+*************************************************/
+
+static uint64_t
+engine_total(uint32_t what)
+{
+uint64_t value = 0;
+CHECK(pcre2_engine_info_8(what, &value) == 0);
+return value;
+}
+
+/* Check that a match by the DFA matcher looks like one by pcre2_match() for a
+pattern with two capture groups: the result is 1 and only the first pair of
+the ovector is set. */
+
+static int
+dfa_result(int rc, pcre2_match_data_8 *md, PCRE2_SIZE start, PCRE2_SIZE end)
+{
+PCRE2_SIZE *ovector = pcre2_get_ovector_pointer_8(md);
+return rc == 1 && ovector[0] == start && ovector[1] == end &&
+  ovector[2] == PCRE2_UNSET && ovector[3] == PCRE2_UNSET &&
+  ovector[4] == PCRE2_UNSET && ovector[5] == PCRE2_UNSET;
+}
+
+static pcre2_code_8 *
+compile_8(const char *pattern)
+{
+int errcode;
+PCRE2_SIZE erroffset;
+pcre2_code_8 *code = pcre2_compile_8((PCRE2_SPTR8)pattern,
+  PCRE2_ZERO_TERMINATED, 0, &errcode, &erroffset, NULL);
+CHECK(code != NULL);
+return code;
+}
+
+static void
+test_engine(void)
+{
+pcre2_code_8 *code;
+pcre2_match_data_8 *md;
+pcre2_match_context_8 *mcontext;
+uint64_t value;
+int rc;
+
+PRINTF("pcre2_engine\n");
+
+md = pcre2_match_data_create_8(3, NULL);
+mcontext = pcre2_match_context_create_8(NULL);
+CHECK(md != NULL && mcontext != NULL);
+if (md == NULL || mcontext == NULL) goto EXIT;
+
+CHECK(pcre2_engine_select_8(NULL, 0) == PCRE2_ERROR_NULL);
+CHECK(pcre2_engine_match_8(NULL, (PCRE2_SPTR8)"", 0, 0, 0, md, NULL) ==
+  PCRE2_ERROR_NULL);
+CHECK(pcre2_engine_info_8(PCRE2_ENGINE_DFA, NULL) == (int)sizeof(uint64_t));
+CHECK(pcre2_engine_info_8(PCRE2_ENGINE_SWITCHES + 1, &value) ==
+  PCRE2_ERROR_BADOPTION);
+pcre2_engine_reset_8();
+CHECK(engine_total(PCRE2_ENGINE_INTERPRETER) == 0);
+
+/* An unlimited repeat inside a repeated group sends every match to the DFA
+matcher, if captured substrings are not needed. The DFA matcher finds the
+longest match, not the leftmost-first one, and its other matches are not
+returned as if they were captured substrings. */
+
+code = compile_8("(a|ab)(?:x+)+|(ab)");
+if (code == NULL) goto EXIT;
+CHECK(pcre2_engine_select_8(code, 0x80) == PCRE2_ERROR_BADOPTION);
+CHECK(pcre2_engine_select_8(code, 0) == PCRE2_ENGINE_INTERPRETER);
+CHECK(pcre2_engine_select_8(code, PCRE2_SELECT_NOCAPTURE) ==
+  PCRE2_ENGINE_DFA);
+rc = pcre2_engine_match_8(code, (PCRE2_SPTR8)"-abxxx", 6, 0, 0, md, NULL);
+CHECK(dfa_result(rc, md, 1, 6));
+CHECK(pcre2_substring_length_bynumber_8(md, 1, NULL) == PCRE2_ERROR_UNSET);
+rc = pcre2_engine_match_8(code, (PCRE2_SPTR8)"-a-", 3, 0, 0, md, NULL);
+CHECK(rc == PCRE2_ERROR_NOMATCH);
+CHECK(engine_total(PCRE2_ENGINE_DFA) == 2);
+CHECK(engine_total(PCRE2_ENGINE_SWITCHES) == 0);
+
+/* Partial matching always uses pcre2_match(). */
+
+rc = pcre2_engine_match_8(code, (PCRE2_SPTR8)"-a", 2, 0, PCRE2_PARTIAL_HARD,
+  md, NULL);
+CHECK(rc == PCRE2_ERROR_PARTIAL);
+CHECK(engine_total(PCRE2_ENGINE_INTERPRETER) == 1);
+pcre2_code_free_8(code);
+
+/* Repeats in sequence are not caught by the scan, so the interpreter goes
+first. When it reaches the switch limit the match is passed to the DFA
+matcher, which finds the "x" near the end. */
+
+pcre2_engine_reset_8();
+code = compile_8("^(a*)a*a*a*a*$|(x)");
+if (code == NULL) goto EXIT;
+CHECK(pcre2_engine_select_8(code, PCRE2_SELECT_NOCAPTURE) ==
+  PCRE2_ENGINE_INTERPRETER);
+CHECK(pcre2_set_engine_switch_limit_8(mcontext, 100) == 0);
+rc = pcre2_engine_match_8(code, (PCRE2_SPTR8)"aaaa", 4, 0, 0, md, mcontext);
+CHECK(rc == 2);
+rc = pcre2_engine_match_8(code,
+  (PCRE2_SPTR8)"aaaaaaaaaaaaaaaaaaaaaaaaaaaaaxa", 31, 0, 0, md, mcontext);
+CHECK(dfa_result(rc, md, 29, 30));
+CHECK(engine_total(PCRE2_ENGINE_INTERPRETER) == 1);
+CHECK(engine_total(PCRE2_ENGINE_SWITCHES) == 1);
+CHECK(engine_total(PCRE2_ENGINE_DFA) == 1);
+
+/* With the match limit itself lower than the switch limit, pcre2_match() is
+stopped by the match limit, and the DFA matcher is still tried. */
+
+CHECK(pcre2_set_match_limit_8(mcontext, 50) == 0);
+rc = pcre2_engine_match_8(code,
+  (PCRE2_SPTR8)"aaaaaaaaaaaaaaaaaaaaaaaaaaaaaxa", 31, 0, 0, md, mcontext);
+CHECK(dfa_result(rc, md, 29, 30));
+CHECK(engine_total(PCRE2_ENGINE_SWITCHES) == 2);
+
+/* A pattern that has not been passed to pcre2_engine_select(), or whose
+captures are wanted, is matched by pcre2_match() alone, which fails at the
+match limit. */
+
+CHECK(pcre2_engine_select_8(code, 0) == PCRE2_ENGINE_INTERPRETER);
+rc = pcre2_engine_match_8(code,
+  (PCRE2_SPTR8)"aaaaaaaaaaaaaaaaaaaaaaaaaaaaaxa", 31, 0, 0, md, mcontext);
+CHECK(rc == PCRE2_ERROR_MATCHLIMIT);
+CHECK(engine_total(PCRE2_ENGINE_SWITCHES) == 2);
+CHECK(engine_total(PCRE2_ENGINE_INTERPRETER) == 2);
+pcre2_code_free_8(code);
+
+pcre2_engine_reset_8();
+CHECK(engine_total(PCRE2_ENGINE_DFA) == 0);
+
+EXIT:
+pcre2_match_context_free_8(mcontext);
+pcre2_match_data_free_8(md);
+}
+#endif  /* SUPPORT_PCRE2_8 */
+
+
+#if defined SUPPORT_PCRE2_16 && defined SUPPORT_UNICODE
+static int
+stream_callback_16(pcre2_match_data_16 *md, PCRE2_SIZE base, void *data)
+{
+record_match((found_matches *)data, pcre2_get_ovector_pointer_16(md), base);
+return 0;
+}
+
+/* A UTF-16 surrogate pair that is cut by the end of a chunk. */
+
+static void
+test_stream_16(void)
+{
+static const PCRE2_UCHAR16 pattern[] = { '\\', 'x', '{', '1', 'f', '6', '0',
+  '0', '}', 0 };
+static const PCRE2_UCHAR16 chunk1[] = { 'a', 0xd83d };
+static const PCRE2_UCHAR16 chunk2[] = { 0xde00, 'b' };
+found_matches found;
+int errcode;
+PCRE2_SIZE erroffset;
+pcre2_code_16 *code;
+pcre2_stream_16 *stream;
+
+PRINTF("pcre2_stream (16-bit)\n");
+
+found.count = 0;
+code = pcre2_compile_16(pattern, PCRE2_ZERO_TERMINATED, PCRE2_UTF, &errcode,
+  &erroffset, NULL);
+CHECK(code != NULL);
+if (code == NULL) return;
+stream = pcre2_stream_create_16(code, 16, stream_callback_16, &found, NULL);
+CHECK(stream != NULL);
+if (stream != NULL)
+  {
+  CHECK(pcre2_stream_feed_16(stream, chunk1, 2, 0, NULL) == 0);
+  CHECK(pcre2_stream_feed_16(stream, chunk2, 2, 0, NULL) == 1);
+  CHECK(pcre2_stream_finish_16(stream, 0, NULL) == 0);
+  CHECK(found.count == 1 && found.starts[0] == 1 && found.ends[0] == 3);
+  pcre2_stream_free_16(stream);
+  }
+pcre2_code_free_16(code);
+}
+#endif  /* SUPPORT_PCRE2_16 && SUPPORT_UNICODE */
+
+
+
+/*************************************************
+*                Main program                    *
+*************************************************/
+
+int
+main(int argc, char **argv)
+{
+v = argc > 1 && strcmp(argv[1], "-v") == 0;
+
+#ifdef SUPPORT_PCRE2_8
+test_match_batch();
+test_stream_8();
+test_jit_pool();
+test_instrumentation();
+test_engine();
+#endif
+#if defined SUPPORT_PCRE2_16 && defined SUPPORT_UNICODE
+test_stream_16();
+#endif
+
+if (failures > 0)
+  {
+  fprintf(stderr, "pcre2_api_test: %d check(s) failed\n", failures);
+  return 1;
+  }
+return 0;
+}
+
+/* End of pcre2_api_test.c */
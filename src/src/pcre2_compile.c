@@ -70,17 +70,20 @@ POSSIBILITY OF SUCH DAMAGE.
 by defining macros in order to minimize #if usage. */
 
 #if PCRE2_CODE_UNIT_WIDTH == 8
-#define STRING_UTFn_RIGHTPAR     STRING_UTF8_RIGHTPAR, 5
+#define STRING_UTFn_RIGHTPAR     STRING_UTF8_RIGHTPAR
+#define STRING_UTFn_RIGHTPAR_LEN 5
 #define XDIGIT(c)                xdigitab[c]
 
 #else  /* Either 16-bit or 32-bit */
 #define XDIGIT(c)                (MAX_255(c)? xdigitab[c] : 0xff)
 
 #if PCRE2_CODE_UNIT_WIDTH == 16
-#define STRING_UTFn_RIGHTPAR     STRING_UTF16_RIGHTPAR, 6
+#define STRING_UTFn_RIGHTPAR     STRING_UTF16_RIGHTPAR
+#define STRING_UTFn_RIGHTPAR_LEN 6
 
 #else  /* 32-bit */
-#define STRING_UTFn_RIGHTPAR     STRING_UTF32_RIGHTPAR, 6
+#define STRING_UTFn_RIGHTPAR     STRING_UTF32_RIGHTPAR
+#define STRING_UTFn_RIGHTPAR_LEN 6
 #endif
 #endif
 
@@ -696,38 +699,67 @@ enum { PSO_OPT,     /* Value is an option bit */
      };
 
 typedef struct pso {
-  const char *name;
   uint16_t length;
   uint16_t type;
   uint32_t value;
 } pso;
 
-/* NB: STRING_UTFn_RIGHTPAR contains the length as well */
+/* The names of the pattern start options are all in a single string, to
+reduce the number of relocations when a shared library is dynamically loaded.
+Each name is followed by a binary zero, and they are in the same order as the
+entries in pso_list, which give their lengths. */
+
+static const char pso_names[] =
+  STRING_UTFn_RIGHTPAR "\0"
+  STRING_UTF_RIGHTPAR "\0"
+  STRING_UCP_RIGHTPAR "\0"
+  STRING_NOTEMPTY_RIGHTPAR "\0"
+  STRING_NOTEMPTY_ATSTART_RIGHTPAR "\0"
+  STRING_NO_AUTO_POSSESS_RIGHTPAR "\0"
+  STRING_NO_CLASS_MAPS_RIGHTPAR "\0"
+  STRING_NO_DOTSTAR_ANCHOR_RIGHTPAR "\0"
+  STRING_NO_JIT_RIGHTPAR "\0"
+  STRING_NO_START_OPT_RIGHTPAR "\0"
+  STRING_CASELESS_RESTRICT_RIGHTPAR "\0"
+  STRING_TURKISH_CASING_RIGHTPAR "\0"
+  STRING_LIMIT_HEAP_EQ "\0"
+  STRING_LIMIT_MATCH_EQ "\0"
+  STRING_LIMIT_DEPTH_EQ "\0"
+  STRING_LIMIT_RECURSION_EQ "\0"
+  STRING_CR_RIGHTPAR "\0"
+  STRING_LF_RIGHTPAR "\0"
+  STRING_CRLF_RIGHTPAR "\0"
+  STRING_ANY_RIGHTPAR "\0"
+  STRING_NUL_RIGHTPAR "\0"
+  STRING_ANYCRLF_RIGHTPAR "\0"
+  STRING_BSR_ANYCRLF_RIGHTPAR "\0"
+  STRING_BSR_UNICODE_RIGHTPAR;
 
 static const pso pso_list[] = {
-  { STRING_UTFn_RIGHTPAR,                  PSO_OPT, PCRE2_UTF },
-  { STRING_UTF_RIGHTPAR,                4, PSO_OPT, PCRE2_UTF },
-  { STRING_UCP_RIGHTPAR,                4, PSO_OPT, PCRE2_UCP },
-  { STRING_NOTEMPTY_RIGHTPAR,           9, PSO_FLG, PCRE2_NOTEMPTY_SET },
-  { STRING_NOTEMPTY_ATSTART_RIGHTPAR,  17, PSO_FLG, PCRE2_NE_ATST_SET },
-  { STRING_NO_AUTO_POSSESS_RIGHTPAR,   16, PSO_OPTMZ, PCRE2_OPTIM_AUTO_POSSESS },
-  { STRING_NO_DOTSTAR_ANCHOR_RIGHTPAR, 18, PSO_OPTMZ, PCRE2_OPTIM_DOTSTAR_ANCHOR },
-  { STRING_NO_JIT_RIGHTPAR,             7, PSO_FLG, PCRE2_NOJIT },
-  { STRING_NO_START_OPT_RIGHTPAR,      13, PSO_OPTMZ, PCRE2_OPTIM_START_OPTIMIZE },
-  { STRING_CASELESS_RESTRICT_RIGHTPAR, 18, PSO_XOPT, PCRE2_EXTRA_CASELESS_RESTRICT },
-  { STRING_TURKISH_CASING_RIGHTPAR,    15, PSO_XOPT, PCRE2_EXTRA_TURKISH_CASING },
-  { STRING_LIMIT_HEAP_EQ,              11, PSO_LIMH, 0 },
-  { STRING_LIMIT_MATCH_EQ,             12, PSO_LIMM, 0 },
-  { STRING_LIMIT_DEPTH_EQ,             12, PSO_LIMD, 0 },
-  { STRING_LIMIT_RECURSION_EQ,         16, PSO_LIMD, 0 },
-  { STRING_CR_RIGHTPAR,                 3, PSO_NL,  PCRE2_NEWLINE_CR },
-  { STRING_LF_RIGHTPAR,                 3, PSO_NL,  PCRE2_NEWLINE_LF },
-  { STRING_CRLF_RIGHTPAR,               5, PSO_NL,  PCRE2_NEWLINE_CRLF },
-  { STRING_ANY_RIGHTPAR,                4, PSO_NL,  PCRE2_NEWLINE_ANY },
-  { STRING_NUL_RIGHTPAR,                4, PSO_NL,  PCRE2_NEWLINE_NUL },
-  { STRING_ANYCRLF_RIGHTPAR,            8, PSO_NL,  PCRE2_NEWLINE_ANYCRLF },
-  { STRING_BSR_ANYCRLF_RIGHTPAR,       12, PSO_BSR, PCRE2_BSR_ANYCRLF },
-  { STRING_BSR_UNICODE_RIGHTPAR,       12, PSO_BSR, PCRE2_BSR_UNICODE }
+  { STRING_UTFn_RIGHTPAR_LEN, PSO_OPT, PCRE2_UTF },  /* UTFn) */
+  {  4, PSO_OPT,   PCRE2_UTF },                      /* UTF) */
+  {  4, PSO_OPT,   PCRE2_UCP },                      /* UCP) */
+  {  9, PSO_FLG,   PCRE2_NOTEMPTY_SET },             /* NOTEMPTY) */
+  { 17, PSO_FLG,   PCRE2_NE_ATST_SET },              /* NOTEMPTY_ATSTART) */
+  { 16, PSO_OPTMZ, PCRE2_OPTIM_AUTO_POSSESS },       /* NO_AUTO_POSSESS) */
+  { 14, PSO_OPTMZ, PCRE2_OPTIM_CLASS_MAPS },         /* NO_CLASS_MAPS) */
+  { 18, PSO_OPTMZ, PCRE2_OPTIM_DOTSTAR_ANCHOR },     /* NO_DOTSTAR_ANCHOR) */
+  {  7, PSO_FLG,   PCRE2_NOJIT },                    /* NO_JIT) */
+  { 13, PSO_OPTMZ, PCRE2_OPTIM_START_OPTIMIZE },     /* NO_START_OPT) */
+  { 18, PSO_XOPT,  PCRE2_EXTRA_CASELESS_RESTRICT },  /* CASELESS_RESTRICT) */
+  { 15, PSO_XOPT,  PCRE2_EXTRA_TURKISH_CASING },     /* TURKISH_CASING) */
+  { 11, PSO_LIMH,  0 },                              /* LIMIT_HEAP= */
+  { 12, PSO_LIMM,  0 },                              /* LIMIT_MATCH= */
+  { 12, PSO_LIMD,  0 },                              /* LIMIT_DEPTH= */
+  { 16, PSO_LIMD,  0 },                              /* LIMIT_RECURSION= */
+  {  3, PSO_NL,    PCRE2_NEWLINE_CR },               /* CR) */
+  {  3, PSO_NL,    PCRE2_NEWLINE_LF },               /* LF) */
+  {  5, PSO_NL,    PCRE2_NEWLINE_CRLF },             /* CRLF) */
+  {  4, PSO_NL,    PCRE2_NEWLINE_ANY },              /* ANY) */
+  {  4, PSO_NL,    PCRE2_NEWLINE_NUL },              /* NUL) */
+  {  8, PSO_NL,    PCRE2_NEWLINE_ANYCRLF },          /* ANYCRLF) */
+  { 12, PSO_BSR,   PCRE2_BSR_ANYCRLF },              /* BSR_ANYCRLF) */
+  { 12, PSO_BSR,   PCRE2_BSR_UNICODE }               /* BSR_UNICODE) */
 };
 
 /* This table is used when converting repeating opcodes into possessified
@@ -2355,7 +2387,8 @@ while (bot < top)
   r = PRIV(strcmp_c8)(name, PRIV(utt_names) + PRIV(utt)[i].name_offset);
 
   /* When a matching property is found, some extra checking is needed when the
-  \p{xx:yy} syntax is used and xx is either sc or scx. */
+  \p{xx:yy} syntax is used and xx is either sc or scx. A property whose column
+  was omitted from the UCD tables is treated as unrecognized. */
 
   if (r == 0)
     {
@@ -2363,6 +2396,7 @@ while (bot < top)
     if (vptr == NULL || ptscript == PT_NOTSCRIPT)
       {
       *ptypeptr = PRIV(utt)[i].type;
+      if (UCD_PTYPE_OMITTED(*ptypeptr)) break;
       return TRUE;
       }
 
@@ -2370,14 +2404,16 @@ while (bot < top)
       {
       case PT_SC:
       *ptypeptr = PT_SC;
+      if (UCD_PTYPE_OMITTED(PT_SC)) break;
       return TRUE;
 
       case PT_SCX:
       *ptypeptr = ptscript;
+      if (UCD_PTYPE_OMITTED(ptscript)) break;
       return TRUE;
       }
 
-    break;  /* Non-script found */
+    break;  /* Non-script or omitted property found */
     }
 
   if (r > 0) bot = i + 1; else top = i;
@@ -4706,14 +4742,15 @@ while (ptr < ptrend)
           ptr--;
           goto POST_LOOKBEHIND;
 
-          /* The script run facilities are handled here. Unicode support is
-          required (give an error if not, as this is a security issue). Always
+          /* The script run facilities are handled here. Unicode support,
+          including the script columns of the UCD tables, is required (give an
+          error if not, as this is a security issue). Always
           record a META_SCRIPT_RUN item. Then, for the atomic version, insert
           META_ATOMIC and remember that we need two META_KETs at the end. */
 
           case META_SCRIPT_RUN:
           case META_ATOMIC_SCRIPT_RUN:
-#ifdef SUPPORT_UNICODE
+#if defined SUPPORT_UNICODE && !defined PCRE2_UCD_OMIT_SCRIPTS
           *parsed_pattern++ = META_SCRIPT_RUN;
           nest_depth++;
           ptr++;
@@ -4738,7 +4775,10 @@ while (ptr < ptrend)
 #endif
             }
           break;
-#else  /* SUPPORT_UNICODE */
+#elif defined SUPPORT_UNICODE  /* Script data omitted */
+          errorcode = ERR117;
+          goto FAILED;
+#else   /* SUPPORT_UNICODE */
           errorcode = ERR96;
           goto FAILED;
 #endif
@@ -10062,6 +10102,37 @@ return 0;
 
 
 
+#ifdef SUPPORT_WIDE_CHARS
+/*************************************************
+*           Free maps for character classes      *
+*************************************************/
+
+/* The maps that were built for classes in the pre-compile phase are kept with
+the character ranges that are still to be used. This function frees them, on
+error, or when they are not wanted after all.
+
+Argument:   the compile block
+Returns:    nothing
+*/
+
+static void
+free_class_maps(compile_block *cb)
+{
+class_ranges *cranges;
+
+for (cranges = cb->cranges; cranges != NULL; cranges = cranges->next)
+  {
+  if (cranges->class_map != NULL)
+    {
+    cb->cx->memctl.free(cranges->class_map, cb->cx->memctl.memory_data);
+    cranges->class_map = NULL;
+    }
+  }
+}
+#endif
+
+
+
 /*************************************************
 *     External function to compile a pattern     *
 *************************************************/
@@ -10249,6 +10320,8 @@ cb.workspace_size = COMPILE_WORK_SIZE;
 cb.cranges = NULL;
 cb.next_cranges = NULL;
 cb.char_lists_size = 0;
+cb.class_maps_size = 0;
+cb.class_maps = FALSE;
 #endif
 
 /* Maximum back reference and backref bitmap. The bitmap records up to 31 back
@@ -10293,12 +10366,15 @@ if ((options & PCRE2_LITERAL) == 0)
          ptr[skipatstart] == CHAR_LEFT_PARENTHESIS &&
          ptr[skipatstart+1] == CHAR_ASTERISK)
     {
+    const char *pso_name = pso_names;
+
     for (i = 0; i < sizeof(pso_list)/sizeof(pso); i++)
       {
       const pso *p = pso_list + i;
 
+      PCRE2_ASSERT(pso_name[p->length] == 0);
       if (patlen - skipatstart - 2 >= p->length &&
-          PRIV(strncmp_c8)(ptr + skipatstart + 2, p->name, p->length) == 0)
+          PRIV(strncmp_c8)(ptr + skipatstart + 2, pso_name, p->length) == 0)
         {
         uint32_t c, pp;
 
@@ -10381,6 +10457,7 @@ if ((options & PCRE2_LITERAL) == 0)
           }
         break;   /* Out of the table scan loop */
         }
+      pso_name += p->length + 1;
       }
     if (i >= sizeof(pso_list)/sizeof(pso)) break;   /* Out of pso loop */
     }
@@ -10611,6 +10688,9 @@ but we still have to pass a separate options variable (the first argument)
 because the options may change as the pattern is processed. */
 
 cb.erroroffset = patlen;   /* For any subsequent errors that do not set it */
+#ifdef SUPPORT_WIDE_CHARS
+cb.class_maps = (optim_flags & PCRE2_OPTIM_CLASS_MAPS) != 0;
+#endif
 pptr = cb.parsed_pattern;
 code = cworkspace;
 *code = OP_BRA;
@@ -10621,10 +10701,32 @@ code = cworkspace;
 
 if (errorcode != 0) goto HAD_CB_ERROR;  /* Offset is in cb.erroroffset */
 
-/* This should be caught in compile_regex(), but just in case... */
+/* Class maps are an optimization, so if they make the pattern too large, they
+are discarded. The space for their offsets in the code is then left unused. */
 
 #if defined SUPPORT_WIDE_CHARS
 PCRE2_ASSERT((cb.char_lists_size & 0x3) == 0);
+if (cb.class_maps_size != 0)
+  {
+  PCRE2_SIZE size = (PCRE2_SIZE)CLIST_ALIGN_TO(
+    CU2BYTES((PCRE2_SIZE)cb.names_found * (PCRE2_SIZE)cb.name_entry_size),
+    sizeof(uint32_t)) + cb.char_lists_size + cb.class_maps_size +
+    CU2BYTES(length);
+
+  if (length > MAX_PATTERN_SIZE ||
+      MAX_PATTERN_SIZE - length <
+        ((cb.char_lists_size + cb.class_maps_size) / sizeof(PCRE2_UCHAR)) ||
+      size > ccontext->max_pattern_compiled_length)
+    {
+    free_class_maps(&cb);
+    cb.class_maps_size = 0;
+    }
+  }
+#endif
+
+/* This should be caught in compile_regex(), but just in case... */
+
+#if defined SUPPORT_WIDE_CHARS
 if (length > MAX_PATTERN_SIZE ||
     MAX_PATTERN_SIZE - length < (cb.char_lists_size / sizeof(PCRE2_UCHAR)))
 #else
@@ -10644,14 +10746,14 @@ re_blocksize =
   CU2BYTES((PCRE2_SIZE)cb.names_found * (PCRE2_SIZE)cb.name_entry_size);
 
 #if defined SUPPORT_WIDE_CHARS
-if (cb.char_lists_size != 0)
+if (cb.char_lists_size + cb.class_maps_size != 0)
   {
 #if PCRE2_CODE_UNIT_WIDTH != 32
   /* Align to 32 bit first. This ensures the
   allocated area will also be 32 bit aligned. */
   re_blocksize = (PCRE2_SIZE)CLIST_ALIGN_TO(re_blocksize, sizeof(uint32_t));
 #endif
-  re_blocksize += cb.char_lists_size;
+  re_blocksize += cb.char_lists_size + cb.class_maps_size;
   }
 #endif
 
@@ -11080,6 +11182,7 @@ re = NULL;
 if (cb.cranges != NULL)
   {
   class_ranges* cranges = cb.cranges;
+  free_class_maps(&cb);
   do
     {
     class_ranges* next_cranges = cranges->next;
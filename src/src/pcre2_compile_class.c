@@ -548,6 +548,8 @@ cranges->range_list_size = (uint16_t)range_list_size;
 cranges->char_lists_types = 0;
 cranges->char_lists_size = 0;
 cranges->char_lists_start = 0;
+cranges->class_map = NULL;
+cranges->class_map_size = 0;
 
 if (range_list_size == 0) return cranges;
 
@@ -856,6 +858,441 @@ for (c = 0; c < 256; c++)
   }
 }
 
+
+/* Characters above 255 that PRIV(xclass)() tests individually for the space,
+POSIX and PT_UCNC properties; keep in step with that function. */
+
+static const uint32_t class_map_singles[] = {
+  0x061c, 0x061c, 0x1680, 0x1680, 0x180e, 0x180e, 0x2000, 0x200a,
+  0x2028, 0x2029, 0x202f, 0x202f, 0x205f, 0x205f, 0x2066, 0x2069,
+  0x3000, 0x3000, 0xd800, 0xdfff, 0xff10, 0xff19, 0xff21, 0xff26,
+  0xff41, 0xff46, NOTACHAR, NOTACHAR };
+
+/* Maximum number of properties and of distinct 32-byte blocks in a map;
+classes that need more are left alone. */
+
+#define CLASS_MAP_MAX_PROPS 16
+#define CLASS_MAP_MAX_BLOCKS 64
+
+/* Copy a property item for a map, noting whether it tests individual
+characters. */
+
+static void
+add_map_prop(PCRE2_UCHAR *props, uint32_t *countptr, BOOL *dependentptr,
+  BOOL isprop, uint32_t ptype, uint32_t pdata)
+{
+uint32_t count = (*countptr)++;
+
+if (count < CLASS_MAP_MAX_PROPS)
+  {
+  props += 1 + 3 * count;
+  props[0] = isprop? XCL_PROP : XCL_NOTPROP;
+  props[1] = (PCRE2_UCHAR)ptype;
+  props[2] = (PCRE2_UCHAR)pdata;
+  }
+
+switch(ptype)
+  {
+  case PT_SPACE:
+  case PT_PXSPACE:
+  case PT_UCNC:
+  case PT_PXGRAPH:
+  case PT_PXPRINT:
+  case PT_PXPUNCT:
+  case PT_PXXDIGIT:
+  *dependentptr = TRUE;
+  break;
+
+  default:
+  break;
+  }
+}
+
+/* Set the bits for a range of characters in a map, ignoring any part of the
+range that is not below XCL_BMPMAP_LIMIT. */
+
+static void
+class_map_set_range(uint8_t *bits, uint32_t start, uint32_t end)
+{
+uint32_t first, last;
+
+if (end >= XCL_BMPMAP_LIMIT) end = XCL_BMPMAP_LIMIT - 1;
+if (start > end) return;
+
+first = start >> 3;
+last = end >> 3;
+
+if (first == last)
+  {
+  bits[first] |= (uint8_t)((0xffu << (start & 7)) & (0xffu >> (7 - (end & 7))));
+  return;
+  }
+
+bits[first] |= (uint8_t)(0xffu << (start & 7));
+memset(bits + first + 1, 0xff, last - first - 1);
+bits[last] |= (uint8_t)(0xffu >> (7 - (end & 7)));
+}
+
+/* Add a range of characters from the class itself. Those less than 256 are
+in the class's 32-byte map. */
+
+static void
+class_map_add_range(uint8_t *bits, uint32_t start, uint32_t end)
+{
+if (start < 256) start = 256;
+class_map_set_range(bits, start, end);
+}
+
+/* Set the bits for the characters in entry n of one of the range tables from
+GenerateUcd. */
+
+static void
+class_map_set_ucd_ranges(uint8_t *bits, const uint32_t *ranges,
+  const uint16_t *index, uint32_t n)
+{
+const uint32_t *range = ranges + index[n];
+const uint32_t *end = ranges + index[n + 1];
+
+for (; range < end && UCD_RANGE_START(*range) < XCL_BMPMAP_LIMIT; range++)
+  class_map_set_range(bits, UCD_RANGE_START(*range), UCD_RANGE_END(*range));
+}
+
+/* Work out the character types for which a property is true, for properties
+that depend only on the character type. Characters that PRIV(xclass)() treats
+specially, such as those in class_map_singles, are put right afterwards.
+
+Arguments:
+  ptype      the property type
+  pdata      the property data
+  maskptr    where to return a bit for each character type
+
+Returns:     TRUE if the property depends only on the character type
+*/
+
+static BOOL
+class_map_type_mask(uint32_t ptype, uint32_t pdata, uint32_t *maskptr)
+{
+uint32_t mask = 0;
+uint32_t chartype;
+
+for (chartype = ucp_Cc; chartype <= ucp_Zs; chartype++)
+  {
+  uint32_t gentype = PRIV(ucp_gentype)[chartype];
+  BOOL set_bit;
+
+  switch(ptype)
+    {
+    case PT_LAMP:
+    set_bit = chartype == ucp_Lu || chartype == ucp_Ll || chartype == ucp_Lt;
+    break;
+
+    case PT_GC:
+    set_bit = gentype == pdata;
+    break;
+
+    case PT_PC:
+    set_bit = chartype == pdata;
+    break;
+
+    case PT_ALNUM:
+    set_bit = gentype == ucp_L || gentype == ucp_N;
+    break;
+
+    case PT_SPACE:
+    case PT_PXSPACE:
+    set_bit = gentype == ucp_Z;
+    break;
+
+    case PT_WORD:
+    set_bit = gentype == ucp_L || gentype == ucp_N ||
+              chartype == ucp_Mn || chartype == ucp_Pc;
+    break;
+
+    case PT_UCNC:
+    set_bit = TRUE;
+    break;
+
+    case PT_PXGRAPH:
+    set_bit = gentype != ucp_Z && (gentype != ucp_C || chartype == ucp_Cf);
+    break;
+
+    case PT_PXPRINT:
+    set_bit = chartype != ucp_Zl && chartype != ucp_Zp &&
+              (gentype != ucp_C || chartype == ucp_Cf);
+    break;
+
+    case PT_PXPUNCT:
+    set_bit = gentype == ucp_P;
+    break;
+
+    case PT_PXXDIGIT:
+    set_bit = FALSE;
+    break;
+
+    default:
+    return FALSE;
+    }
+
+  if (set_bit) mask |= 1u << chartype;
+  }
+
+*maskptr = mask;
+return TRUE;
+}
+
+/* Evaluate the properties of a class from the range tables, if they are all
+scripts, Boolean properties, or properties that depend only on the character
+type. This is quicker than evaluating them for each UCD record.
+
+Arguments:
+  props      property items in XCLASS format, as for build_class_map()
+  bits       the map, which must be zero on entry
+  temp       a zeroed work area the size of the map
+
+Returns:     TRUE if the map was built, FALSE if some property needs UCD records
+*/
+
+static BOOL
+class_map_from_ranges(PCRE2_SPTR props, uint8_t *bits, uint8_t *temp)
+{
+PCRE2_SPTR item;
+uint32_t mask, chartype, i;
+
+for (item = props + 1; *item != XCL_END; item += 3)
+  if (item[1] != PT_SC && item[1] != PT_BOOL &&
+      !class_map_type_mask(item[1], item[2], &mask))
+    return FALSE;
+
+for (item = props + 1; *item != XCL_END; item += 3)
+  {
+  /* A positive property's characters go straight into the map; a negative
+  one is built separately so that it can be inverted. */
+
+  uint8_t *target = (item[0] == XCL_PROP)? bits : temp;
+
+  switch(item[1])
+    {
+    case PT_SC:
+    class_map_set_ucd_ranges(target, PRIV(ucd_script_ranges),
+      PRIV(ucd_script_ranges_index), item[2]);
+    break;
+
+    case PT_BOOL:
+    class_map_set_ucd_ranges(target, PRIV(ucd_boolprop_ranges),
+      PRIV(ucd_boolprop_ranges_index), item[2]);
+    break;
+
+    default:
+    (void)class_map_type_mask(item[1], item[2], &mask);
+    for (chartype = ucp_Cc; chartype <= ucp_Zs; chartype++)
+      if ((mask & (1u << chartype)) != 0)
+        class_map_set_ucd_ranges(target, PRIV(ucd_type_ranges),
+          PRIV(ucd_type_ranges_index), chartype);
+    break;
+    }
+
+  if (target == temp)
+    {
+    for (i = 0; i < XCL_BMPMAP_LIMIT / 8; i++) bits[i] |= (uint8_t)~temp[i];
+    memset(temp, 0, XCL_BMPMAP_LIMIT / 8);
+    }
+  }
+
+return TRUE;
+}
+
+
+/*************************************************
+*     Build a BMP map for a property class       *
+*************************************************/
+
+/* Matching a character against an extended class that contains Unicode
+properties costs a UCD lookup and a test of each property, followed by a search
+of the class's characters. This function works out the result of the whole
+class for every character less than 0x10000 and returns it as a two-level
+bitmap, so that the matchers can replace all of that with two table lookups.
+The map has a 256-byte index that gives a block number for each group of 256
+characters, followed by the distinct 32-byte blocks. Most properties are filled
+in from the code point range tables that GenerateUcd makes; others are
+evaluated once for each UCD record rather than for each character, using the
+stage tables. A few characters are tested individually by PRIV(xclass)() for
+some properties; those are evaluated one by one.
+
+Arguments:
+  props           property items in XCLASS format, preceded by a zero flags
+                    unit and followed by XCL_END
+  char_dependent  TRUE if a property tests individual characters
+  negated         TRUE if the class is negated
+  cranges         the ranges and character lists of the class
+  cb              compile data
+  sizeptr         where to return the size of the map
+
+Returns:        the map, or NULL if it would be too large or there is no memory
+*/
+
+static uint8_t *
+build_class_map(PCRE2_SPTR props, BOOL char_dependent, BOOL negated,
+  class_ranges *cranges, compile_block *cb, size_t *sizeptr)
+{
+uint8_t *work, *bits, *known, *value, *map;
+uint16_t *first;
+uint8_t index[256];
+uint8_t blocks[CLASS_MAP_MAX_BLOCKS];
+const uint32_t *single;
+uint32_t c, i, j, count, max_block;
+size_t work_size;
+
+/* UCD blocks that share a stage 2 block give the same results, so each stage
+2 block is evaluated once; first[] remembers where that was done. */
+
+max_block = 0;
+for (i = 0; i < XCL_BMPMAP_LIMIT / UCD_BLOCK_SIZE; i++)
+  if (PRIV(ucd_stage1)[i] > max_block) max_block = PRIV(ucd_stage1)[i];
+
+work_size = 3 * XCL_BMPMAP_LIMIT / 8 + (max_block + 1) * sizeof(uint16_t);
+work = cb->cx->memctl.malloc(work_size, cb->cx->memctl.memory_data);
+if (work == NULL) return NULL;
+memset(work, 0, work_size);
+bits = work;
+known = work + XCL_BMPMAP_LIMIT / 8;
+value = known + XCL_BMPMAP_LIMIT / 8;
+first = (uint16_t *)(value + XCL_BMPMAP_LIMIT / 8);
+
+/* The properties. UCD record numbers are less than 0x10000 because the stage
+2 table holds 16-bit values. */
+
+if (!class_map_from_ranges(props, bits, known))
+  {
+  for (i = 0; i < XCL_BMPMAP_LIMIT / UCD_BLOCK_SIZE; i++)
+    {
+    uint32_t block = PRIV(ucd_stage1)[i];
+    const uint16_t *records = PRIV(ucd_stage2) + block * UCD_BLOCK_SIZE;
+
+    if (first[block] != 0)
+      {
+      memcpy(bits + i * (UCD_BLOCK_SIZE / 8),
+        bits + (first[block] - 1) * (UCD_BLOCK_SIZE / 8), UCD_BLOCK_SIZE / 8);
+      continue;
+      }
+
+    first[block] = (uint16_t)(i + 1);
+    for (j = 0; j < UCD_BLOCK_SIZE; j++)
+      {
+      uint32_t record = records[j];
+
+      if ((known[record >> 3] & (1u << (record & 7))) == 0)
+        {
+        SETBIT(known, record);
+        if (PRIV(xclass)(i * UCD_BLOCK_SIZE + j, props, NULL, TRUE))
+          SETBIT(value, record);
+        }
+      if ((value[record >> 3] & (1u << (record & 7))) != 0)
+        SETBIT(bits, i * UCD_BLOCK_SIZE + j);
+      }
+    }
+  }
+
+/* Characters less than 256, and those that some properties test individually,
+are evaluated one by one. */
+
+for (c = 0, single = class_map_singles; c < XCL_BMPMAP_LIMIT; c++)
+  {
+  if (c >= 256)
+    {
+    if (!char_dependent) break;
+    while (c > single[1]) single += 2;
+    if (single[0] == NOTACHAR) break;
+    if (c < single[0]) c = single[0];
+    }
+
+  if (PRIV(xclass)(c, props, NULL, TRUE)) SETBIT(bits, c);
+  else bits[c >> 3] &= (uint8_t)~(1u << (c & 7));
+  }
+
+/* The characters and ranges, which in an XCLASS never include characters
+less than 256; these are in the 32-byte map if there is one. */
+
+for (i = 0; i < cranges->range_list_size; i += 2)
+  {
+  const uint32_t *range = (const uint32_t *)(cranges + 1) + i;
+  if (range[1] >= 256) class_map_add_range(bits, range[0], range[1]);
+  }
+
+if (cranges->char_lists_size > 0)
+  {
+  const uint16_t *item = (const uint16_t *)
+    ((const uint8_t *)(cranges + 1) + cranges->char_lists_start);
+  uint32_t type = cranges->char_lists_types;
+  uint32_t add = XCL_CHAR_LIST_LOW_16_ADD;
+  uint32_t list_start = XCL_CHAR_LIST_LOW_16_START;
+  uint32_t list_end = XCL_CHAR_LIST_LOW_16_END;
+
+  /* Only the two 16-bit lists cover characters less than 0x10000. */
+
+  for (i = 0; i < 2; i++)
+    {
+    uint32_t start = ((type & XCL_BEGIN_WITH_RANGE) != 0)? list_start : NOTACHAR;
+
+    count = type & XCL_ITEM_COUNT_MASK;
+    if (count == XCL_ITEM_COUNT_MASK) count = *item++;
+
+    for (; count > 0; count--)
+      {
+      uint32_t ch = add + (*item >> XCL_CHAR_SHIFT);
+      if ((*item++ & XCL_CHAR_END) == 0) start = ch; else
+        {
+        class_map_add_range(bits, (start == NOTACHAR)? ch : start, ch);
+        start = NOTACHAR;
+        }
+      }
+
+    if (start != NOTACHAR) class_map_add_range(bits, start, list_end);
+
+    type >>= XCL_TYPE_BIT_LEN;
+    add = XCL_CHAR_LIST_HIGH_16_ADD;
+    list_start = XCL_CHAR_LIST_HIGH_16_START;
+    list_end = XCL_CHAR_LIST_HIGH_16_END;
+    }
+  }
+
+/* Apply any negation, and share identical blocks. */
+
+count = 0;
+for (i = 0; i < 256; i++)
+  {
+  uint8_t *block = bits + 32 * i;
+
+  if (negated) for (j = 0; j < 32; j++) block[j] ^= 0xff;
+
+  for (j = 0; j < count; j++)
+    if (memcmp(block, bits + 32 * blocks[j], 32) == 0) break;
+
+  if (j == count)
+    {
+    if (count >= CLASS_MAP_MAX_BLOCKS)
+      {
+      cb->cx->memctl.free(work, cb->cx->memctl.memory_data);
+      return NULL;
+      }
+    blocks[count++] = (uint8_t)i;
+    }
+
+  index[i] = (uint8_t)j;
+  }
+
+*sizeptr = 256 + 32 * count;
+map = cb->cx->memctl.malloc(*sizeptr, cb->cx->memctl.memory_data);
+if (map != NULL)
+  {
+  memcpy(map, index, 256);
+  for (j = 0; j < count; j++)
+    memcpy(map + 256 + 32 * j, bits + 32 * blocks[j], 32);
+  }
+
+cb->cx->memctl.free(work, cb->cx->memctl.memory_data);
+return map;
+}
+
 #endif /* SUPPORT_UNICODE */
 
 
@@ -1082,6 +1519,17 @@ PCRE2_UCHAR *class_uchardata;
 class_ranges* cranges;
 #endif
 
+/* Helper variables for the BMP map of a class with properties. The property
+items are copied so that they can be evaluated before the class is complete. */
+
+#ifdef SUPPORT_UNICODE
+PCRE2_UCHAR map_props[2 + 3 * CLASS_MAP_MAX_PROPS];
+uint32_t map_prop_count = 0;
+BOOL map_char_dependent = FALSE;
+uint8_t *class_map = NULL;
+size_t class_map_size = 0;
+#endif
+
 /* If an XClass contains a negative special such as \S, we need to flip the
 negation flag at the end, so that support for characters > 255 works correctly
 (they are all included in the class). An XClass may need to insert specific
@@ -1125,6 +1573,10 @@ if (utf)
     cranges = cb->cranges;
     PCRE2_ASSERT(cranges != NULL);
     cb->cranges = cranges->next;
+#ifdef SUPPORT_UNICODE
+    class_map = cranges->class_map;
+    class_map_size = cranges->class_map_size;
+#endif
     }
 
   if (cranges->range_list_size > 0)
@@ -1214,6 +1666,8 @@ while (TRUE)
             *class_uchardata++ = 0;
             }
           xclass_props |= XCLASS_REQUIRED | XCLASS_HAS_PROPS;
+          add_map_prop(map_props, &map_prop_count, &map_char_dependent,
+            !local_negate, ptype, 0);
           }
         continue;
 
@@ -1427,6 +1881,8 @@ while (TRUE)
             *class_uchardata++ = pdata;
             }
           xclass_props |= XCLASS_REQUIRED | XCLASS_HAS_PROPS;
+          add_map_prop(map_props, &map_prop_count, &map_char_dependent,
+            escape == ESC_p, ptype, pdata);
           }
         }
       continue;
@@ -1793,6 +2249,43 @@ if ((xclass_props & XCLASS_REQUIRED) != 0)
       }
     }
 
+#ifdef SUPPORT_UNICODE
+  /* A class with properties that is not part of an extended class gets a BMP
+  map, unless the optimization is disabled. The map is built in the
+  pre-compile phase, where its size is needed, and kept with the character
+  ranges until the real compile copies it below the code, in the same way as
+  character lists. Its offset goes at the very end of the item. */
+
+  if (lengthptr != NULL)
+    {
+    if (cb->class_maps && has_bitmap == NULL && cranges != NULL &&
+        (xclass_props & XCLASS_HAS_PROPS) != 0 &&
+        map_prop_count <= CLASS_MAP_MAX_PROPS)
+      {
+      map_props[0] = 0;
+      map_props[1 + 3 * map_prop_count] = XCL_END;
+      cranges->class_map = build_class_map(map_props, map_char_dependent,
+        negate_class, cranges, cb, &cranges->class_map_size);
+
+      if (cranges->class_map != NULL)
+        {
+        *lengthptr += LINK_SIZE;
+        cb->class_maps_size += cranges->class_map_size;
+        }
+      }
+    }
+  else if (class_map != NULL)
+    {
+    previous[1 + LINK_SIZE] |= XCL_BMPMAP;
+    cb->char_lists_size += class_map_size;
+    memcpy((uint8_t *)cb->start_code - cb->char_lists_size, class_map,
+      class_map_size);
+    PUT(code, 0, (uint32_t)(cb->char_lists_size >> 1));
+    code += LINK_SIZE;
+    cb->cx->memctl.free(class_map, cb->cx->memctl.memory_data);
+    }
+#endif  /* SUPPORT_UNICODE */
+
   /* Now fill in the complete length of the item */
 
   PUT(previous, 1, (int)(code - previous));
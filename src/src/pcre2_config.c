@@ -88,6 +88,7 @@ if (where == NULL)  /* Requests a length */
     case PCRE2_CONFIG_COMPILED_WIDTHS:
     case PCRE2_CONFIG_DEPTHLIMIT:
     case PCRE2_CONFIG_HEAPLIMIT:
+    case PCRE2_CONFIG_INSTRUMENTATION:
     case PCRE2_CONFIG_JIT:
     case PCRE2_CONFIG_LINKSIZE:
     case PCRE2_CONFIG_MATCHLIMIT:
@@ -143,6 +144,14 @@ switch (what)
   *((uint32_t *)where) = HEAP_LIMIT;
   break;
 
+  case PCRE2_CONFIG_INSTRUMENTATION:
+#ifdef SUPPORT_INSTRUMENTATION
+  *((uint32_t *)where) = 1;
+#else
+  *((uint32_t *)where) = 0;
+#endif
+  break;
+
   case PCRE2_CONFIG_JIT:
 #ifdef SUPPORT_JIT
   *((uint32_t *)where) = 1;
@@ -176,10 +176,14 @@ pcre2_match_context PRIV(default_match_context) = {
   NULL,          /* Substitute callout data */
   NULL,          /* Substitute case callout function */
   NULL,          /* Substitute case callout data */
+  NULL,          /* Slow match callback */
+  NULL,          /* Slow match callback data */
   PCRE2_UNSET,   /* Offset limit */
   HEAP_LIMIT,
   MATCH_LIMIT,
-  MATCH_LIMIT_DEPTH };
+  MATCH_LIMIT_DEPTH,
+  0,             /* Slow match threshold */
+  0 };           /* Engine switch limit */
 
 /* The create function copies the default into the new memory, but must
 override the default memory handling functions if a gcontext was provided. */
@@ -429,7 +433,7 @@ switch (directive)
   break;
 
   default:
-  if (directive >= PCRE2_AUTO_POSSESS && directive <= PCRE2_START_OPTIMIZE_OFF)
+  if (directive >= PCRE2_AUTO_POSSESS && directive <= PCRE2_CLASS_MAPS_OFF)
     {
     /* Even directive numbers starting from 64 switch a bit on;
      * Odd directive numbers starting from 65 switch a bit off */
@@ -477,6 +481,29 @@ mcontext->substitute_case_callout_data = substitute_case_callout_data;
 return 0;
 }
 
+/* The slow match callback is called after any match that takes at least the
+threshold time (in microseconds). It is available only when PCRE2 is built with
+instrumentation. */
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_set_slow_match_callback(pcre2_match_context *mcontext,
+  void (*slow_match)(pcre2_slow_match_block *, void *), uint32_t threshold,
+  void *slow_match_data)
+{
+#ifdef SUPPORT_INSTRUMENTATION
+mcontext->slow_match = slow_match;
+mcontext->slow_match_data = slow_match_data;
+mcontext->slow_match_threshold = threshold;
+return 0;
+#else
+(void)mcontext;
+(void)slow_match;
+(void)threshold;
+(void)slow_match_data;
+return PCRE2_ERROR_BADOPTION;
+#endif
+}
+
 PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
 pcre2_set_heap_limit(pcre2_match_context *mcontext, uint32_t limit)
 {
@@ -505,6 +532,17 @@ mcontext->offset_limit = limit;
 return 0;
 }
 
+/* The engine switch limit is the match limit at which pcre2_engine_match()
+abandons a backtracking matcher and passes the match to the DFA matcher. Zero
+means one tenth of the match limit. */
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_set_engine_switch_limit(pcre2_match_context *mcontext, uint32_t limit)
+{
+mcontext->engine_switch_limit = limit;
+return 0;
+}
+
 /* These functions became obsolete at release 10.30. The first is kept as a
 synonym for backwards compatibility. The second now does nothing. Exclude both
 from coverage reports. */
@@ -447,6 +447,9 @@ else
     return PCRE2_ERROR_HEAPLIMIT;
   new = mb->memctl.malloc(newsize*sizeof(int), mb->memctl.memory_data);
   if (new == NULL) return PCRE2_ERROR_NOMEMORY;
+#ifdef SUPPORT_INSTRUMENTATION
+  mb->counters[PCRE2_INSTR_HEAP_GROWTHS]++;
+#endif
   mb->heap_used += newsizeK;
   new->next = NULL;
   new->size = newsize;
@@ -3335,10 +3338,18 @@ Returns:        > 0 => number of match offset pairs placed in offsets
                < -1 => some kind of unexpected problem
 */
 
+#ifdef SUPPORT_INSTRUMENTATION
+static int
+uninstrumented_dfa_match(const pcre2_code *code, PCRE2_SPTR subject,
+  PCRE2_SIZE length, PCRE2_SIZE start_offset, uint32_t options,
+  pcre2_match_data *match_data, pcre2_match_context *mcontext, int *workspace,
+  PCRE2_SIZE wscount)
+#else
 PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
 pcre2_dfa_match(const pcre2_code *code, PCRE2_SPTR subject, PCRE2_SIZE length,
   PCRE2_SIZE start_offset, uint32_t options, pcre2_match_data *match_data,
   pcre2_match_context *mcontext, int *workspace, PCRE2_SIZE wscount)
+#endif
 {
 int rc;
 int was_zero_terminated = 0;
@@ -3366,6 +3377,11 @@ PCRE2_UCHAR req_cu2 = 0;
 
 const uint8_t *start_bits = NULL;
 
+#ifdef SUPPORT_INSTRUMENTATION
+PCRE2_SPTR instr_start_match = NULL;  /* Start of this bumpalong iteration */
+BOOL instr_tried = TRUE;              /* Reached the matcher this iteration */
+#endif
+
 /* We need to have mb pointing to a match block, because the IS_NEWLINE macro
 is used below, and it expects NLBLOCK to be defined as a pointer. */
 
@@ -3529,6 +3545,9 @@ mb->moptions = options;
 mb->poptions = re->overall_options;
 mb->match_call_count = 0;
 mb->heap_used = 0;
+#ifdef SUPPORT_INSTRUMENTATION
+mb->counters = match_data->counters;
+#endif
 
 /* Process the \R and newline settings. */
 
@@ -3688,6 +3707,11 @@ a match. */
 
 for (;;)
   {
+#ifdef SUPPORT_INSTRUMENTATION
+  instr_start_match = start_match;
+  instr_tried = FALSE;
+#endif
+
   /* ----------------- Start of match optimizations ---------------- */
 
   /* There are some optimizations that avoid running the match if a known
@@ -4005,6 +4029,12 @@ for (;;)
 
   /* ------------ End of start of match optimizations ------------ */
 
+#ifdef SUPPORT_INSTRUMENTATION
+  match_data->counters[PCRE2_INSTR_START_SKIPS] +=
+    start_match - instr_start_match;
+  instr_tried = TRUE;
+#endif
+
   /* Give no match if we have passed the bumpalong limit. */
 
   if (start_match > bumpalong_limit) break;
@@ -4090,7 +4120,19 @@ for (;;)
 NOMATCH_EXIT:
 rc = PCRE2_ERROR_NOMATCH;
 
+/* If the start of match optimizations ended the search, the rest of the
+subject was skipped without being tried. */
+
+#ifdef SUPPORT_INSTRUMENTATION
+if (!instr_tried && mb->end_subject > instr_start_match)
+  match_data->counters[PCRE2_INSTR_START_SKIPS] +=
+    mb->end_subject - instr_start_match;
+#endif
+
 EXIT:
+#ifdef SUPPORT_INSTRUMENTATION
+match_data->counters[PCRE2_INSTR_FRAMES] = mb->match_call_count;
+#endif
 while (rws->next != NULL)
   {
   RWS_anchor *next = rws->next;
@@ -4101,6 +4143,37 @@ while (rws->next != NULL)
 return rc;
 }
 
+
+#ifdef SUPPORT_INSTRUMENTATION
+/*************************************************
+*    Perform a DFA match, instrumented           *
+*************************************************/
+
+/* When instrumentation is enabled, pcre2_dfa_match() is a wrapper that times
+the real matching function and records its counters. The arguments and return
+values are as for the function above. */
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_dfa_match(const pcre2_code *code, PCRE2_SPTR subject, PCRE2_SIZE length,
+  PCRE2_SIZE start_offset, uint32_t options, pcre2_match_data *match_data,
+  pcre2_match_context *mcontext, int *workspace, PCRE2_SIZE wscount)
+{
+uint64_t start_time;
+int rc;
+
+if (match_data == NULL)
+  return uninstrumented_dfa_match(code, subject, length, start_offset,
+    options, match_data, mcontext, workspace, wscount);
+
+start_time = PRIV(instr_start)(match_data);
+rc = uninstrumented_dfa_match(code, subject, length, start_offset, options,
+  match_data, mcontext, workspace, wscount);
+PRIV(instr_record)(PCRE2_INSTR_DFA, code, subject, length, start_offset,
+  match_data, mcontext, rc, start_time);
+return rc;
+}
+#endif  /* SUPPORT_INSTRUMENTATION */
+
 /* These #undefs are here to enable unity builds with CMake. */
 
 #undef NLBLOCK /* Block containing newline information */
@@ -0,0 +1,534 @@
+/*************************************************
+*      Perl-Compatible Regular Expressions       *
+*************************************************/
+
+/* PCRE is a library of functions to support regular expressions whose syntax
+and semantics are as close as possible to those of the Perl 5 language.
+
+                       Written by Philip Hazel
+     Original API code Copyright (c) 1997-2012 University of Cambridge
+          New API code Copyright (c) 2016-2024 University of Cambridge
+
+-----------------------------------------------------------------------------
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+    * Redistributions of source code must retain the above copyright notice,
+      this list of conditions and the following disclaimer.
+
+    * Redistributions in binary form must reproduce the above copyright
+      notice, this list of conditions and the following disclaimer in the
+      documentation and/or other materials provided with the distribution.
+
+    * Neither the name of the University of Cambridge nor the names of its
+      contributors may be used to endorse or promote products derived from
+      this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+-----------------------------------------------------------------------------
+*/
+
+
+/* This module contains pcre2_engine_select() and pcre2_engine_match(), which
+let an application use whichever of the interpreter, JIT, and the DFA matcher
+suits a pattern, without changing the code that calls the matcher. The choice
+is made once, when the pattern is prepared, and recorded in the pattern's
+flags. At match time a backtracking matcher may hand over to the DFA matcher
+when it comes close to the match limit. The number of matches handled by each
+matcher is counted; the totals are shared by all threads, so they are updated
+atomically where the compiler makes that possible. */
+
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "pcre2_internal.h"
+
+#if defined(__GNUC__) && defined(__GCC_HAVE_SYNC_COMPARE_AND_SWAP_8)
+#define ENGINE_ADD(p)      (void)__atomic_fetch_add((p), 1, __ATOMIC_RELAXED)
+#define ENGINE_LOAD(p)     __atomic_load_n((p), __ATOMIC_RELAXED)
+#define ENGINE_STORE(p, v) __atomic_store_n((p), (v), __ATOMIC_RELAXED)
+#elif defined(_MSC_VER)
+#include <windows.h>
+#define ENGINE_ADD(p)      \
+  (void)InterlockedIncrement64((volatile LONG64 *)(p))
+#define ENGINE_LOAD(p)     \
+  (uint64_t)InterlockedCompareExchange64((volatile LONG64 *)(p), 0, 0)
+#define ENGINE_STORE(p, v) \
+  (void)InterlockedExchange64((volatile LONG64 *)(p), (LONG64)(v))
+#else   /* No atomic operations; the totals may be approximate */
+#define ENGINE_ADD(p)      ((*(p))++)
+#define ENGINE_LOAD(p)     (*(p))
+#define ENGINE_STORE(p, v) (*(p) = (v))
+#endif
+
+/* One total for each engine, and one for switches from a backtracking
+matcher to the DFA matcher, indexed by the PCRE2_ENGINE_xxx values. */
+
+#define ENGINE_TOTALS (PCRE2_ENGINE_SWITCHES + 1)
+
+static uint64_t engine_totals[ENGINE_TOTALS];
+
+/* The DFA matcher is first given a workspace on the stack. If that is too
+small, a larger one is obtained from the heap, up to a maximum size. */
+
+#define DFA_WS_START   1000
+#define DFA_WS_MAX     (DFA_WS_START * 256)
+
+/* Limit on the nesting of groups that are tracked while a pattern is being
+scanned. Deeper nesting is treated as a sign of risk. */
+
+#define SCAN_DEPTH_MAX 64
+
+/* The result of scanning a compiled pattern. */
+
+typedef struct engine_scan {
+  BOOL dfa_ok;        /* The DFA matcher supports every item */
+  BOOL nested;        /* An unlimited repeat inside a repeated group */
+} engine_scan;
+
+
+
+/*************************************************
+*         Scan a pattern for the cost model      *
+*************************************************/
+
+/* The compiled code is scanned once, from start to end. Items that the DFA
+matcher does not support make it unusable. A stack of the groups that enclose
+the current item records which of them are repeated without limit in a way
+that allows backtracking into them; an unlimited repeat (of a single item or a
+group) inside such a group is the shape that can make backtracking take
+exponential time.
+
+Arguments:
+  re          the compiled pattern
+  scan        where to put the result
+
+Returns:      nothing
+*/
+
+static void
+scan_pattern(const pcre2_real_code *re, engine_scan *scan)
+{
+PCRE2_SPTR code = (PCRE2_SPTR)((const uint8_t *)re + re->code_start);
+PCRE2_SPTR kets[SCAN_DEPTH_MAX];
+BOOL repeated[SCAN_DEPTH_MAX];
+BOOL utf = (re->overall_options & PCRE2_UTF) != 0;
+int depth = 0;
+int nrepeated = 0;
+
+scan->dfa_ok = (re->flags & (PCRE2_HASBKC|PCRE2_HASACCEPT)) == 0 &&
+  (re->overall_options & PCRE2_MATCH_INVALID_UTF) == 0;
+scan->nested = FALSE;
+
+for (;;)
+  {
+  PCRE2_UCHAR c = *code;
+  BOOL unlimited = FALSE;
+
+  /* Leave any groups whose ket has been passed. */
+
+  while (depth > 0 && code > kets[depth-1])
+    {
+    depth--;
+    if (repeated[depth]) nrepeated--;
+    }
+
+  switch(c)
+    {
+    case OP_END:
+    return;
+
+    /* Items that the DFA matcher does not support. */
+
+    case OP_RREF:
+    if (GET2(code, 1) == RREF_ANY) break;
+    /* Fall through */
+
+    case OP_REF:
+    case OP_REFI:
+    case OP_DNREF:
+    case OP_DNREFI:
+    case OP_CREF:
+    case OP_DNCREF:
+    case OP_DNRREF:
+    case OP_SET_SOM:
+    case OP_MARK:
+    case OP_PRUNE:
+    case OP_PRUNE_ARG:
+    case OP_SKIP:
+    case OP_SKIP_ARG:
+    case OP_THEN:
+    case OP_THEN_ARG:
+    case OP_COMMIT:
+    case OP_COMMIT_ARG:
+    case OP_ACCEPT:
+    case OP_ASSERT_ACCEPT:
+    case OP_CLOSE:
+    case OP_ASSERT_NA:
+    case OP_ASSERTBACK_NA:
+    case OP_ASSERT_SCS:
+    case OP_SCRIPT_RUN:
+    scan->dfa_ok = FALSE;
+    break;
+
+    /* Unlimited repeats of single items that can be backtracked into. */
+
+    case OP_STAR: case OP_MINSTAR: case OP_PLUS: case OP_MINPLUS:
+    case OP_STARI: case OP_MINSTARI: case OP_PLUSI: case OP_MINPLUSI:
+    case OP_NOTSTAR: case OP_NOTMINSTAR: case OP_NOTPLUS: case OP_NOTMINPLUS:
+    case OP_NOTSTARI: case OP_NOTMINSTARI: case OP_NOTPLUSI: case OP_NOTMINPLUSI:
+    case OP_TYPESTAR: case OP_TYPEMINSTAR: case OP_TYPEPLUS: case OP_TYPEMINPLUS:
+    case OP_CRSTAR: case OP_CRMINSTAR: case OP_CRPLUS: case OP_CRMINPLUS:
+    unlimited = TRUE;
+    break;
+
+    case OP_CRRANGE:
+    case OP_CRMINRANGE:
+    unlimited = GET2(code, 1 + IMM2_SIZE) == 0;
+    break;
+
+    /* Groups. The ket is found by following the chain of alternatives. A
+    group that ends with KETRMAX or KETRMIN is repeated without limit; unless
+    it is atomic, backtracking can change the number of repeats. */
+
+    case OP_BRA: case OP_CBRA: case OP_SBRA: case OP_SCBRA:
+    case OP_BRAPOS: case OP_CBRAPOS: case OP_SBRAPOS: case OP_SCBRAPOS:
+    case OP_ONCE: case OP_COND: case OP_SCOND:
+    case OP_ASSERT: case OP_ASSERT_NOT: case OP_ASSERTBACK:
+    case OP_ASSERTBACK_NOT:
+      {
+      PCRE2_SPTR ket = code;
+      do ket += GET(ket, 1); while (*ket == OP_ALT);
+      if (depth >= SCAN_DEPTH_MAX)
+        {
+        scan->nested = TRUE;
+        break;
+        }
+      kets[depth] = ket;
+      repeated[depth] = c != OP_ONCE &&
+        (*ket == OP_KETRMAX || *ket == OP_KETRMIN);
+      if (repeated[depth])
+        {
+        if (nrepeated > 0) scan->nested = TRUE;
+        nrepeated++;
+        }
+      depth++;
+      }
+    break;
+
+    default:
+    break;
+    }
+
+  if (unlimited && nrepeated > 0) scan->nested = TRUE;
+
+  /* Move on to the next item. This follows PRIV(find_bracket)(). */
+
+  if (c == OP_XCLASS || c == OP_ECLASS) code += GET(code, 1);
+  else if (c == OP_CALLOUT_STR) code += GET(code, 1 + 2*LINK_SIZE);
+  else
+    {
+    switch(c)
+      {
+      case OP_TYPESTAR:
+      case OP_TYPEMINSTAR:
+      case OP_TYPEPLUS:
+      case OP_TYPEMINPLUS:
+      case OP_TYPEQUERY:
+      case OP_TYPEMINQUERY:
+      case OP_TYPEPOSSTAR:
+      case OP_TYPEPOSPLUS:
+      case OP_TYPEPOSQUERY:
+      if (code[1] == OP_PROP || code[1] == OP_NOTPROP) code += 2;
+      break;
+
+      case OP_TYPEUPTO:
+      case OP_TYPEMINUPTO:
+      case OP_TYPEEXACT:
+      case OP_TYPEPOSUPTO:
+      if (code[1 + IMM2_SIZE] == OP_PROP || code[1 + IMM2_SIZE] == OP_NOTPROP)
+        code += 2;
+      break;
+
+      case OP_MARK:
+      case OP_COMMIT_ARG:
+      case OP_PRUNE_ARG:
+      case OP_SKIP_ARG:
+      case OP_THEN_ARG:
+      code += code[1];
+      break;
+      }
+
+    code += PRIV(OP_lengths)[c];
+
+#ifdef MAYBE_UTF_MULTI
+    /* The opcodes from OP_CHAR to OP_NOTPOSUPTOI are followed by a
+    character, which may use more than one code unit. */
+
+    if (utf && c >= OP_CHAR && c <= OP_NOTPOSUPTOI && HAS_EXTRALEN(code[-1]))
+      code += GET_EXTRALEN(code[-1]);
+#else
+    (void)utf;
+#endif
+    }
+  }
+}
+
+
+
+/*************************************************
+*        Run the DFA matcher for an engine       *
+*************************************************/
+
+/* The DFA matcher needs a workspace. One on the stack is tried first; if it
+is too small, larger ones are obtained from the heap. The DFA matcher puts the
+longest match in the first pair of the ovector and shorter alternative matches
+in the following pairs, but these are not captured substrings, so to keep the
+contract of pcre2_match() they are unset and the result is 1.
+
+Arguments:   as for pcre2_engine_match()
+Returns:     1 for a match, otherwise as for pcre2_dfa_match()
+*/
+
+static int
+engine_dfa(const pcre2_code *code, PCRE2_SPTR subject, PCRE2_SIZE length,
+  PCRE2_SIZE start_offset, uint32_t options, pcre2_match_data *match_data,
+  pcre2_match_context *mcontext)
+{
+int stack_workspace[DFA_WS_START];
+int *workspace = stack_workspace;
+PCRE2_SIZE wscount = DFA_WS_START;
+pcre2_memctl *memctl = (mcontext != NULL)? &mcontext->memctl :
+  (pcre2_memctl *)&code->memctl;
+int rc;
+
+options &= ~(PCRE2_NO_JIT|PCRE2_DISABLE_RECURSELOOP_CHECK);
+
+for (;;)
+  {
+  rc = pcre2_dfa_match(code, subject, length, start_offset, options,
+    match_data, mcontext, workspace, wscount);
+  if (rc != PCRE2_ERROR_DFA_WSSIZE || wscount >= DFA_WS_MAX) break;
+
+  if (workspace != stack_workspace)
+    memctl->free(workspace, memctl->memory_data);
+  wscount *= 4;
+  workspace = memctl->malloc(wscount * sizeof(int), memctl->memory_data);
+  if (workspace == NULL)
+    {
+    rc = PCRE2_ERROR_NOMEMORY;
+    break;
+    }
+  }
+
+if (workspace != NULL && workspace != stack_workspace)
+  memctl->free(workspace, memctl->memory_data);
+ENGINE_ADD(engine_totals + PCRE2_ENGINE_DFA);
+
+if (rc >= 0)
+  {
+  uint32_t i;
+  for (i = 2; i < 2*match_data->oveccount; i++)
+    match_data->ovector[i] = PCRE2_UNSET;
+  match_data->rc = rc = 1;
+  }
+return rc;
+}
+
+
+
+/*************************************************
+*      Choose the matching engine for a pattern  *
+*************************************************/
+
+/* This function is called once, after pcre2_compile(), in the same way as
+pcre2_jit_compile(). The DFA matcher is a candidate only if the caller does not
+need captured substrings (PCRE2_SELECT_NOCAPTURE) and the pattern contains
+nothing that it does not support. Such a pattern is then matched by the DFA
+matcher from the start if it contains an unlimited repeat inside a repeated
+group, because backtracking may take exponential time; otherwise a
+backtracking matcher is used first and the DFA matcher is kept in reserve. With
+PCRE2_SELECT_JIT, the pattern is JIT-compiled for complete matching if a
+backtracking matcher is to be used first.
+
+Arguments:
+  code        the compiled pattern
+  options     option bits
+
+Returns:      PCRE2_ENGINE_INTERPRETER, PCRE2_ENGINE_JIT or PCRE2_ENGINE_DFA,
+                the engine that pcre2_engine_match() will try first
+              a negative error code on failure
+*/
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_engine_select(pcre2_code *code, uint32_t options)
+{
+engine_scan scan;
+
+if (code == NULL) return PCRE2_ERROR_NULL;
+if ((options & ~(PCRE2_SELECT_JIT|PCRE2_SELECT_NOCAPTURE)) != 0)
+  return PCRE2_ERROR_BADOPTION;
+if (code->magic_number != MAGIC_NUMBER) return PCRE2_ERROR_BADMAGIC;
+if ((code->flags & PCRE2_MODE_MASK) != PCRE2_CODE_UNIT_WIDTH/8)
+  return PCRE2_ERROR_BADMODE;
+
+code->flags &= ~(PCRE2_DFA_FALLBACK|PCRE2_DFA_FIRST);
+scan_pattern(code, &scan);
+
+if ((options & PCRE2_SELECT_NOCAPTURE) != 0 && scan.dfa_ok)
+  {
+  code->flags |= PCRE2_DFA_FALLBACK;
+  if (scan.nested)
+    {
+    code->flags |= PCRE2_DFA_FIRST;
+    return PCRE2_ENGINE_DFA;
+    }
+  }
+
+if ((options & PCRE2_SELECT_JIT) != 0 && (code->flags & PCRE2_NOJIT) == 0)
+  (void)pcre2_jit_compile(code, PCRE2_JIT_COMPLETE);
+
+return (code->executable_jit != NULL)?
+  PCRE2_ENGINE_JIT : PCRE2_ENGINE_INTERPRETER;
+}
+
+
+
+/*************************************************
+*     Match a pattern with the chosen engine     *
+*************************************************/
+
+/* This function has the same arguments as pcre2_match(), and can be used in
+its place. If pcre2_engine_select() has not been called for the pattern, or
+the DFA matcher is not a candidate, or partial matching is requested, it just
+calls pcre2_match(). Otherwise, if the DFA matcher was chosen to go first, it
+is called directly. If not, pcre2_match() is called with its match limit
+lowered to the engine switch limit; if it stops because of that or any other
+resource limit, the match is run again by the DFA matcher, this time with the
+caller's limits. When the DFA matcher is used, the match starts at the same
+place as with pcre2_match(), but it is the longest match from there rather than
+the leftmost-first match that a backtracking matcher finds (for example, /a|ab/
+matches "ab" rather than "a"), and there are no captured substrings.
+
+Arguments:   as for pcre2_match()
+Returns:     as for pcre2_match()
+*/
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_engine_match(const pcre2_code *code, PCRE2_SPTR subject,
+  PCRE2_SIZE length, PCRE2_SIZE start_offset, uint32_t options,
+  pcre2_match_data *match_data, pcre2_match_context *mcontext)
+{
+pcre2_match_context limited;
+uint32_t limit, switch_limit;
+int rc;
+
+if (code == NULL || match_data == NULL) return PCRE2_ERROR_NULL;
+
+if ((code->flags & PCRE2_DFA_FALLBACK) == 0 ||
+    (options & (PCRE2_PARTIAL_HARD|PCRE2_PARTIAL_SOFT)) != 0)
+  {
+  match_data->matchedby = PCRE2_MATCHEDBY_INTERPRETER;
+  rc = pcre2_match(code, subject, length, start_offset, options, match_data,
+    mcontext);
+  ENGINE_ADD(engine_totals + ((match_data->matchedby == PCRE2_MATCHEDBY_JIT)?
+    PCRE2_ENGINE_JIT : PCRE2_ENGINE_INTERPRETER));
+  return rc;
+  }
+
+if ((code->flags & PCRE2_DFA_FIRST) != 0)
+  return engine_dfa(code, subject, length, start_offset, options, match_data,
+    mcontext);
+
+/* Lower the match limit to the switch limit, which by default is a tenth of
+the limit that pcre2_match() would otherwise use. */
+
+limited = (mcontext != NULL)? *mcontext : PRIV(default_match_context);
+limit = limited.match_limit;
+if (code->limit_match < limit) limit = code->limit_match;
+switch_limit = limited.engine_switch_limit;
+if (switch_limit == 0) switch_limit = (limit < 10)? 1 : limit/10;
+if (switch_limit < limit) limited.match_limit = switch_limit;
+
+match_data->matchedby = PCRE2_MATCHEDBY_INTERPRETER;
+rc = pcre2_match(code, subject, length, start_offset, options, match_data,
+  &limited);
+
+switch(rc)
+  {
+  case PCRE2_ERROR_MATCHLIMIT:
+  case PCRE2_ERROR_DEPTHLIMIT:
+  case PCRE2_ERROR_HEAPLIMIT:
+  case PCRE2_ERROR_JIT_STACKLIMIT:
+  ENGINE_ADD(engine_totals + PCRE2_ENGINE_SWITCHES);
+  return engine_dfa(code, subject, length, start_offset, options, match_data,
+    mcontext);
+
+  default:
+  ENGINE_ADD(engine_totals + ((match_data->matchedby == PCRE2_MATCHEDBY_JIT)?
+    PCRE2_ENGINE_JIT : PCRE2_ENGINE_INTERPRETER));
+  return rc;
+  }
+}
+
+
+
+/*************************************************
+*      Return the totals for each engine         *
+*************************************************/
+
+/* The totals cover every call of pcre2_engine_match() since the library was
+loaded or the totals were last reset. A match that was passed to the DFA
+matcher is counted under PCRE2_ENGINE_SWITCHES as well as PCRE2_ENGINE_DFA.
+
+Arguments:
+  what        PCRE2_ENGINE_INTERPRETER, _JIT, _DFA or _SWITCHES
+  where       where to put the total, a uint64_t; or NULL
+
+Returns:      0 if data is returned
+              sizeof(uint64_t) if where is NULL
+              PCRE2_ERROR_BADOPTION if what is unknown
+*/
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_engine_info(uint32_t what, void *where)
+{
+if (what >= ENGINE_TOTALS) return PCRE2_ERROR_BADOPTION;
+if (where == NULL) return (int)sizeof(uint64_t);
+*((uint64_t *)where) = ENGINE_LOAD(&engine_totals[what]);
+return 0;
+}
+
+
+
+/*************************************************
+*         Reset the totals for each engine       *
+*************************************************/
+
+/* Each total is set to zero. Calls that are in progress when this happens may
+still be added to the new totals.
+
+Arguments:  none
+Returns:    nothing
+*/
+
+PCRE2_EXP_DEFN void PCRE2_CALL_CONVENTION
+pcre2_engine_reset(void)
+{
+int i;
+for (i = 0; i < ENGINE_TOTALS; i++) ENGINE_STORE(&engine_totals[i], 0);
+}
+
+/* End of pcre2_engine.c */
@@ -208,6 +208,7 @@ static const unsigned char compile_error_texts[] =
   /* 115 */
   "terminating ] with no following closing parenthesis in (?[...]\0"
   "unexpected character in (?[...]) extended character class\0"
+  "script runs require the Unicode script data, which was omitted from this build of PCRE2\0"
   ;
 
 /* Match-time and UTF error texts are in the same format. */
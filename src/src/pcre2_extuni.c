@@ -53,6 +53,19 @@ support, because some compilers do not like functionless source files. */
 #include "pcre2_internal.h"
 
 
+/* Check whether a code unit starts a character below UCD_GB_SIMPLE_LIMIT. In
+UTF-8 this is decided by the first byte, which is why the limit is a multiple of
+64; every non-UTF 8-bit character is below it. In UTF-16 a surrogate is above
+the limit, as is any character that it starts. */
+
+#if PCRE2_CODE_UNIT_WIDTH == 8
+#define GB_SIMPLE_UNIT(cu, utf) (!(utf) || \
+  (cu) < (0xc0u | (UCD_GB_SIMPLE_LIMIT >> 6)))
+#else
+#define GB_SIMPLE_UNIT(cu, utf) ((cu) < UCD_GB_SIMPLE_LIMIT)
+#endif
+
+
 /* Dummy function */
 
 #ifndef SUPPORT_UNICODE
@@ -78,7 +91,8 @@ return NULL;
 /* NOTE: The logic contained in this function is replicated in three special-
 purpose functions in the pcre2_jit_compile.c module. If the logic below is
 changed, they must be kept in step so that the interpreter and the JIT have the
-same behaviour.
+same behaviour. The shortcuts that avoid property lookups and scans for regional
+indicators do not change the result.
 
 Arguments:
   c              the first character
@@ -97,13 +111,33 @@ PRIV(extuni)(uint32_t c, PCRE2_SPTR eptr, PCRE2_SPTR start_subject,
   PCRE2_SPTR end_subject, BOOL utf, int *xcount)
 {
 BOOL was_ep_ZWJ = FALSE;
-int lgb = UCD_GRAPHBREAK(c);
+BOOL joined_ri = FALSE;
+PCRE2_SPTR first_next = eptr;
+int lgb;
+
+/* In most text, the first character and the one after it are both below
+UCD_GB_SIMPLE_LIMIT, and so are separate clusters unless they are CR and LF. */
+
+if (c < UCD_GB_SIMPLE_LIMIT && eptr < end_subject &&
+    GB_SIMPLE_UNIT(*eptr, utf) && (c != CHAR_CR || *eptr != CHAR_LF))
+  return eptr;
+
+lgb = UCD_GRAPHBREAK(c);
 
 while (eptr < end_subject)
   {
   int rgb;
   int len = 1;
   if (!utf) c = *eptr; else { GETCHARLEN(c, eptr, len); }
+
+  /* Only CR, Prepend, and ZWJ can be joined to a following character below
+  UCD_GB_SIMPLE_LIMIT, so there is no need to look up its property after any
+  other character. */
+
+  if (c < UCD_GB_SIMPLE_LIMIT && lgb != ucp_gbCR && lgb != ucp_gbPrepend &&
+      lgb != ucp_gbZWJ)
+    break;
+
   rgb = UCD_GRAPHBREAK(c);
   if ((PRIV(ucp_gbtable)[lgb] & (1u << rgb)) == 0) break;
 
@@ -122,22 +156,31 @@ while (eptr < end_subject)
     PCRE2_SPTR bptr = eptr - 1;
     if (utf) BACKCHAR(bptr);
 
-    /* bptr is pointing to the left-hand character */
+    /* bptr is pointing to the left-hand character. Once a pair of RIs has been
+    joined in this sequence, the count is odd. Otherwise, an RI that is not the
+    first character follows one of this sequence that is not an RI, so the
+    count is zero. Only a first character that is an RI needs a scan. */
+
+    if (joined_ri) break;  /* Grapheme break required */
 
-    while (bptr > start_subject)
+    if (eptr == first_next)
       {
-      bptr--;
-      if (utf)
+      while (bptr > start_subject)
         {
-        BACKCHAR(bptr);
-        GETCHAR(c, bptr);
+        bptr--;
+        if (utf)
+          {
+          BACKCHAR(bptr);
+          GETCHAR(c, bptr);
+          }
+        else
+        c = *bptr;
+        if (UCD_GRAPHBREAK(c) != ucp_gbRegional_Indicator) break;
+        ricount++;
         }
-      else
-      c = *bptr;
-      if (UCD_GRAPHBREAK(c) != ucp_gbRegional_Indicator) break;
-      ricount++;
+      if ((ricount & 1) != 0) break;  /* Grapheme break required */
       }
-    if ((ricount & 1) != 0) break;  /* Grapheme break required */
+    joined_ri = TRUE;
     }
 
   /* Set a flag when ZWJ follows Extended Pictographic (with optional Extend in
@@ -0,0 +1,284 @@
+/*************************************************
+*      Perl-Compatible Regular Expressions       *
+*************************************************/
+
+/* PCRE is a library of functions to support regular expressions whose syntax
+and semantics are as close as possible to those of the Perl 5 language.
+
+                       Written by Philip Hazel
+     Original API code Copyright (c) 1997-2012 University of Cambridge
+          New API code Copyright (c) 2016-2024 University of Cambridge
+
+-----------------------------------------------------------------------------
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+    * Redistributions of source code must retain the above copyright notice,
+      this list of conditions and the following disclaimer.
+
+    * Redistributions in binary form must reproduce the above copyright
+      notice, this list of conditions and the following disclaimer in the
+      documentation and/or other materials provided with the distribution.
+
+    * Neither the name of the University of Cambridge nor the names of its
+      contributors may be used to endorse or promote products derived from
+      this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+-----------------------------------------------------------------------------
+*/
+
+
+
+/* This module contains the support for match instrumentation. Most of it is
+compiled only when PCRE2 is built with instrumentation. Each matching function
+counts what it does in the match data block for the current call; when the
+call is over, the counts are added to totals that are kept separately for the
+interpreter, the DFA matcher, and JIT. The totals are shared by all threads, so
+they are updated atomically where the compiler makes that possible. */
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "pcre2_internal.h"
+
+#ifdef SUPPORT_INSTRUMENTATION
+
+#ifdef _WIN32
+#include <windows.h>
+#else
+#include <time.h>
+#endif
+
+#if defined(__GNUC__) && defined(__GCC_HAVE_SYNC_COMPARE_AND_SWAP_8)
+#define INSTR_ADD(p, v)   (void)__atomic_fetch_add((p), (v), __ATOMIC_RELAXED)
+#define INSTR_LOAD(p)     __atomic_load_n((p), __ATOMIC_RELAXED)
+#define INSTR_STORE(p, v) __atomic_store_n((p), (v), __ATOMIC_RELAXED)
+#elif defined(_MSC_VER)
+#define INSTR_ADD(p, v)   \
+  (void)InterlockedExchangeAdd64((volatile LONG64 *)(p), (LONG64)(v))
+#define INSTR_LOAD(p)     \
+  (uint64_t)InterlockedCompareExchange64((volatile LONG64 *)(p), 0, 0)
+#define INSTR_STORE(p, v) \
+  (void)InterlockedExchange64((volatile LONG64 *)(p), (LONG64)(v))
+#else   /* No atomic operations; the totals may be approximate */
+#define INSTR_ADD(p, v)   (*(p) += (v))
+#define INSTR_LOAD(p)     (*(p))
+#define INSTR_STORE(p, v) (*(p) = (v))
+#endif
+
+/* One set of totals for each matcher: interpreter, DFA, JIT. */
+
+static uint64_t instr_totals[3][PCRE2_INSTR_COUNTERS];
+
+
+
+/*************************************************
+*       Read a monotonic clock in nanoseconds    *
+*************************************************/
+
+static uint64_t
+instr_clock(void)
+{
+#ifdef _WIN32
+LARGE_INTEGER count, frequency;
+QueryPerformanceCounter(&count);
+QueryPerformanceFrequency(&frequency);
+return (uint64_t)(count.QuadPart / frequency.QuadPart) * 1000000000u +
+  (uint64_t)(count.QuadPart % frequency.QuadPart) * 1000000000u /
+  (uint64_t)frequency.QuadPart;
+#elif defined(CLOCK_MONOTONIC)
+struct timespec ts;
+(void)clock_gettime(CLOCK_MONOTONIC, &ts);
+return (uint64_t)ts.tv_sec * 1000000000u + (uint64_t)ts.tv_nsec;
+#else
+return (uint64_t)clock() * (1000000000u / CLOCKS_PER_SEC);
+#endif
+}
+
+
+
+/*************************************************
+*       Start instrumenting a matching call      *
+*************************************************/
+
+/* The counters for the previous call are cleared, and the current time is
+returned for passing to PRIV(instr_record)().
+
+Argument:   the match data block
+Returns:    the time in nanoseconds from an arbitrary starting point
+*/
+
+uint64_t
+PRIV(instr_start)(pcre2_match_data *match_data)
+{
+memset(match_data->counters, 0, sizeof(match_data->counters));
+return instr_clock();
+}
+
+
+
+/*************************************************
+*     Record the counts for a matching call      *
+*************************************************/
+
+/* This is called when a matching function returns. It adds the elapsed time
+and the outcome to the counters for the call, calls the slow match callback if
+the call took long enough, and adds the counters to the totals.
+
+Arguments:
+  matcher        PCRE2_INSTR_INTERPRETER, PCRE2_INSTR_DFA or PCRE2_INSTR_JIT
+  code           the compiled pattern
+  subject        the subject string
+  length         the subject length as passed to the matcher
+  start_offset   where matching started
+  match_data     the match data block, holding the counters
+  mcontext       the match context, or NULL
+  rc             the return code from the matcher
+  start_time     the value returned by PRIV(instr_start)()
+
+Returns:         nothing
+*/
+
+void
+PRIV(instr_record)(uint32_t matcher, const pcre2_code *code,
+  PCRE2_SPTR subject, PCRE2_SIZE length, PCRE2_SIZE start_offset,
+  pcre2_match_data *match_data, pcre2_match_context *mcontext, int rc,
+  uint64_t start_time)
+{
+uint64_t *counters = match_data->counters;
+uint64_t *totals = instr_totals[matcher >> 8];
+uint64_t elapsed = instr_clock() - start_time;
+int i;
+
+counters[PCRE2_INSTR_CALLS] = 1;
+counters[PCRE2_INSTR_TIME_NS] = elapsed;
+
+switch(rc)
+  {
+  case PCRE2_ERROR_MATCHLIMIT:
+  counters[PCRE2_INSTR_MATCHLIMIT_HITS] = 1;
+  break;
+
+  case PCRE2_ERROR_DEPTHLIMIT:
+  case PCRE2_ERROR_JIT_STACKLIMIT:
+  counters[PCRE2_INSTR_DEPTHLIMIT_HITS] = 1;
+  break;
+
+  case PCRE2_ERROR_HEAPLIMIT:
+  counters[PCRE2_INSTR_HEAPLIMIT_HITS] = 1;
+  break;
+
+  default:
+  break;
+  }
+
+if (mcontext != NULL && mcontext->slow_match != NULL &&
+    elapsed >= (uint64_t)mcontext->slow_match_threshold * 1000u)
+  {
+  pcre2_slow_match_block block;
+  counters[PCRE2_INSTR_SLOW_MATCHES] = 1;
+  block.version = 0;
+  block.matcher = matcher;
+  block.rc = rc;
+  block.code = code;
+  block.subject = subject;
+  block.subject_length = length;
+  block.start_offset = start_offset;
+  memcpy(block.counters, counters, sizeof(block.counters));
+  mcontext->slow_match(&block, mcontext->slow_match_data);
+  }
+
+for (i = 0; i < PCRE2_INSTR_COUNTERS; i++)
+  if (counters[i] != 0) INSTR_ADD(totals + i, counters[i]);
+}
+
+#endif  /* SUPPORT_INSTRUMENTATION */
+
+
+
+/*************************************************
+*     Return totals from the instrumentation     *
+*************************************************/
+
+/* The request is a counter number combined with a matcher selection. The
+totals cover every call since the library was loaded or the totals were last
+reset.
+
+Arguments:
+  what        which total is required
+  where       where to put the total, a uint64_t; or NULL
+
+Returns:      0 if data is returned
+              sizeof(uint64_t) if where is NULL
+              PCRE2_ERROR_BADOPTION if what is unknown or instrumentation
+                is not supported
+*/
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_instrumentation_info(uint32_t what, void *where)
+{
+#ifdef SUPPORT_INSTRUMENTATION
+uint32_t matcher = what & 0xff00u;
+uint32_t counter = what & 0xffu;
+uint64_t value = 0;
+
+if ((what & ~0xffffu) != 0 || matcher > PCRE2_INSTR_ALL ||
+    counter >= PCRE2_INSTR_COUNTERS)
+  return PCRE2_ERROR_BADOPTION;
+if (where == NULL) return (int)sizeof(uint64_t);
+
+if (matcher == PCRE2_INSTR_ALL)
+  {
+  int i;
+  for (i = 0; i < 3; i++) value += INSTR_LOAD(&instr_totals[i][counter]);
+  }
+else value = INSTR_LOAD(&instr_totals[matcher >> 8][counter]);
+
+*((uint64_t *)where) = value;
+return 0;
+
+#else  /* SUPPORT_INSTRUMENTATION */
+
+(void)what;
+(void)where;
+return PCRE2_ERROR_BADOPTION;
+#endif
+}
+
+
+
+/*************************************************
+*        Reset the instrumentation totals        *
+*************************************************/
+
+/* Each total is set to zero. Calls that are in progress when this happens may
+still be added to the new totals.
+
+Arguments:  none
+Returns:    nothing
+*/
+
+PCRE2_EXP_DEFN void PCRE2_CALL_CONVENTION
+pcre2_instrumentation_reset(void)
+{
+#ifdef SUPPORT_INSTRUMENTATION
+int i, j;
+for (i = 0; i < 3; i++)
+  for (j = 0; j < PCRE2_INSTR_COUNTERS; j++)
+    INSTR_STORE(&instr_totals[i][j], 0);
+#endif
+}
+
+/* End of pcre2_instrument.c */
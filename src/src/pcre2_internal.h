@@ -552,6 +552,8 @@ bytes in a code unit in that mode. */
 #define PCRE2_DUPCAPUSED    0x00200000u /* contains (?| */
 #define PCRE2_HASBKC        0x00400000u /* contains \C */
 #define PCRE2_HASACCEPT     0x00800000u /* contains (*ACCEPT) */
+#define PCRE2_DFA_FALLBACK  0x01000000u /* pcre2_engine_match() may use DFA */
+#define PCRE2_DFA_FIRST     0x02000000u /* pcre2_engine_match() starts with DFA */
 
 #define PCRE2_MODE_MASK     (PCRE2_MODE8 | PCRE2_MODE16 | PCRE2_MODE32)
 
@@ -630,8 +632,9 @@ total length of the tables. */
 #define PCRE2_OPTIM_AUTO_POSSESS    0x00000001u
 #define PCRE2_OPTIM_DOTSTAR_ANCHOR  0x00000002u
 #define PCRE2_OPTIM_START_OPTIMIZE  0x00000004u
+#define PCRE2_OPTIM_CLASS_MAPS      0x00000008u
 
-#define PCRE2_OPTIMIZATION_ALL      0x00000007u
+#define PCRE2_OPTIMIZATION_ALL      0x0000000fu
 
 /* -------------------- Character and string names ------------------------ */
 
@@ -985,6 +988,7 @@ a positive value. */
 #define STRING_UTF_RIGHTPAR               "UTF)"
 #define STRING_UCP_RIGHTPAR               "UCP)"
 #define STRING_NO_AUTO_POSSESS_RIGHTPAR   "NO_AUTO_POSSESS)"
+#define STRING_NO_CLASS_MAPS_RIGHTPAR     "NO_CLASS_MAPS)"
 #define STRING_NO_DOTSTAR_ANCHOR_RIGHTPAR "NO_DOTSTAR_ANCHOR)"
 #define STRING_NO_JIT_RIGHTPAR            "NO_JIT)"
 #define STRING_NO_START_OPT_RIGHTPAR      "NO_START_OPT)"
@@ -1290,6 +1294,7 @@ only. */
 #define STRING_UTF_RIGHTPAR               STR_U STR_T STR_F STR_RIGHT_PARENTHESIS
 #define STRING_UCP_RIGHTPAR               STR_U STR_C STR_P STR_RIGHT_PARENTHESIS
 #define STRING_NO_AUTO_POSSESS_RIGHTPAR   STR_N STR_O STR_UNDERSCORE STR_A STR_U STR_T STR_O STR_UNDERSCORE STR_P STR_O STR_S STR_S STR_E STR_S STR_S STR_RIGHT_PARENTHESIS
+#define STRING_NO_CLASS_MAPS_RIGHTPAR     STR_N STR_O STR_UNDERSCORE STR_C STR_L STR_A STR_S STR_S STR_UNDERSCORE STR_M STR_A STR_P STR_S STR_RIGHT_PARENTHESIS
 #define STRING_NO_DOTSTAR_ANCHOR_RIGHTPAR STR_N STR_O STR_UNDERSCORE STR_D STR_O STR_T STR_S STR_T STR_A STR_R STR_UNDERSCORE STR_A STR_N STR_C STR_H STR_O STR_R STR_RIGHT_PARENTHESIS
 #define STRING_NO_JIT_RIGHTPAR            STR_N STR_O STR_UNDERSCORE STR_J STR_I STR_T STR_RIGHT_PARENTHESIS
 #define STRING_NO_START_OPT_RIGHTPAR      STR_N STR_O STR_UNDERSCORE STR_S STR_T STR_A STR_R STR_T STR_UNDERSCORE STR_O STR_P STR_T STR_RIGHT_PARENTHESIS
@@ -1360,6 +1365,7 @@ contain characters with values greater than 255. */
 #define XCL_NOT      0x01  /* Flag: this is a negative class */
 #define XCL_MAP      0x02  /* Flag: a 32-byte map is present */
 #define XCL_HASPROP  0x04  /* Flag: property checks are present. */
+#define XCL_BMPMAP   0x08  /* Flag: a map for characters < 0x10000 exists */
 
 #define XCL_END      0     /* Marks end of individual items */
 #define XCL_SINGLE   1     /* Single item (one multibyte char) follows */
@@ -1438,6 +1444,20 @@ can be used to encode / decode the character value stored in an item. */
 #define XCL_CHAR_END 0x1
 #define XCL_CHAR_SHIFT 1
 
+/* When XCL_BMPMAP is set, the last LINK_SIZE code units of the OP_XCLASS item
+hold the offset of a two-level bitmap that gives the result of the whole class
+for every character less than 0x10000. The map is stored backwards from the
+byte code start, like the character lists, and the offset is halved in the
+same way. The first 256 bytes of the map hold a block number for each group of
+256 characters; they are followed by the 32-byte blocks themselves. Negation
+has already been applied. The argument of XCL_BMPMAP_OFFSET is a pointer to
+the flags of the class, which is the data pointer that is passed to
+PRIV(xclass)(). */
+
+#define XCL_BMPMAP_LIMIT 0x10000
+#define XCL_BMPMAP_OFFSET(data) \
+  (GET(((data) - 1 - LINK_SIZE + GET(((data) - LINK_SIZE), 0) - LINK_SIZE), 0) << 1)
+
 /* Flag bits for an extended class (OP_ECLASS), which is used for complex
 character matches such as [\p{Greek} && \p{Ll}]. */
 
@@ -1979,7 +1999,11 @@ typedef struct {
   uint16_t value;
 } ucp_type_table;
 
-/* Unicode character database (UCD) record format */
+/* Unicode character database (UCD) record format. The tables can be generated
+without some of the columns (see the --omit option of maint/GenerateUcd.py), in
+which case the library must be compiled with the matching PCRE2_UCD_OMIT_xxx
+macros, and patterns that use those properties are rejected. The script field
+costs no space, so it is kept, holding ucp_Unknown, when scripts are omitted. */
 
 typedef struct {
   uint8_t script;     /* ucp_Arabic, etc. */
@@ -1987,31 +2011,83 @@ typedef struct {
   uint8_t gbprop;     /* ucp_gbControl, etc. (grapheme break property) */
   uint8_t caseset;    /* offset to multichar other cases or zero */
   int32_t other_case; /* offset to other case, or zero if none */
+#if !defined PCRE2_UCD_OMIT_SCRIPTS || !defined PCRE2_UCD_OMIT_BIDI
   uint16_t scriptx_bidiclass; /* script extension (11 bit) and bidi class (5 bit) values */
+#endif
+#ifndef PCRE2_UCD_OMIT_BPROPS
   uint16_t bprops;    /* binary properties offset */
+#endif
 } ucd_record;
 
-/* UCD access macros */
+/* The JIT compiler needs the record size as a constant. */
+
+#if defined PCRE2_UCD_OMIT_SCRIPTS && defined PCRE2_UCD_OMIT_BIDI && \
+    defined PCRE2_UCD_OMIT_BPROPS
+#define UCD_RECORD_SIZE 8
+#else
+#define UCD_RECORD_SIZE 12
+#endif
+
+/* UCD access macros. The records for characters less than 256 are copied
+into a table of their own, so that the most common characters need only one
+lookup. The test is written as a shift because a comparison would provoke
+warnings when the character is an 8-bit code unit. */
 
 #define UCD_BLOCK_SIZE 128
 #define REAL_GET_UCD(ch) (PRIV(ucd_records) + \
         PRIV(ucd_stage2)[PRIV(ucd_stage1)[(int)(ch) / UCD_BLOCK_SIZE] * \
         UCD_BLOCK_SIZE + (int)(ch) % UCD_BLOCK_SIZE])
+#define LATIN1_GET_UCD(ch) (PRIV(ucd_latin1_records) + (int)(ch))
 
 #if PCRE2_CODE_UNIT_WIDTH == 32
-#define GET_UCD(ch) ((ch > MAX_UTF_CODE_POINT)? \
-  PRIV(dummy_ucd_record) : REAL_GET_UCD(ch))
+#define GET_UCD(ch) ((((uint32_t)(ch) >> 8) == 0)? LATIN1_GET_UCD(ch) : \
+  (ch > MAX_UTF_CODE_POINT)? PRIV(dummy_ucd_record) : REAL_GET_UCD(ch))
 #else
-#define GET_UCD(ch) REAL_GET_UCD(ch)
+#define GET_UCD(ch) ((((uint32_t)(ch) >> 8) == 0)? LATIN1_GET_UCD(ch) : \
+  REAL_GET_UCD(ch))
 #endif
 
 #define UCD_SCRIPTX_MASK 0x3ff
 #define UCD_BIDICLASS_SHIFT 11
 #define UCD_BPROPS_MASK 0xfff
 
+#ifdef PCRE2_UCD_OMIT_SCRIPTS
+#define UCD_SCRIPTX_PROP(prop) ((void)(prop), 0)
+#else
 #define UCD_SCRIPTX_PROP(prop) ((prop)->scriptx_bidiclass & UCD_SCRIPTX_MASK)
+#endif
+#ifdef PCRE2_UCD_OMIT_BIDI
+#define UCD_BIDICLASS_PROP(prop) ((void)(prop), ucp_bidiL)
+#else
 #define UCD_BIDICLASS_PROP(prop) ((prop)->scriptx_bidiclass >> UCD_BIDICLASS_SHIFT)
+#endif
+#ifdef PCRE2_UCD_OMIT_BPROPS
+#define UCD_BPROPS_PROP(prop) ((void)(prop), 0)
+#else
 #define UCD_BPROPS_PROP(prop) ((prop)->bprops & UCD_BPROPS_MASK)
+#endif
+
+/* This is TRUE for the property types whose columns were omitted from the UCD
+tables. The compiler does not recognize such properties. */
+
+#define UCD_PTYPE_OMITTED(t) (UCD_OMITTED_SCRIPTS(t) || \
+  UCD_OMITTED_BIDI(t) || UCD_OMITTED_BPROPS(t))
+
+#ifdef PCRE2_UCD_OMIT_SCRIPTS
+#define UCD_OMITTED_SCRIPTS(t) ((t) == PT_SC || (t) == PT_SCX)
+#else
+#define UCD_OMITTED_SCRIPTS(t) FALSE
+#endif
+#ifdef PCRE2_UCD_OMIT_BIDI
+#define UCD_OMITTED_BIDI(t) ((t) == PT_BIDICL)
+#else
+#define UCD_OMITTED_BIDI(t) FALSE
+#endif
+#ifdef PCRE2_UCD_OMIT_BPROPS
+#define UCD_OMITTED_BPROPS(t) ((t) == PT_BOOL)
+#else
+#define UCD_OMITTED_BPROPS(t) FALSE
+#endif
 
 #define UCD_CHARTYPE(ch)    GET_UCD(ch)->chartype
 #define UCD_SCRIPT(ch)      GET_UCD(ch)->script
@@ -2031,6 +2107,36 @@ typedef struct {
   ((uint32_t)(ch) == 0x0130u ?   0x69u : \
    (uint32_t)(ch) ==   0x49u ? 0x0131u : (uint32_t)(ch))
 
+/* The ucd_script_ranges, ucd_type_ranges, and ucd_boolprop_ranges tables hold
+sorted code point ranges, each packed into one 32-bit value as the first code
+point and the length less one. These macros extract the first and last code
+points of a range. */
+
+#define UCD_RANGE_LENGTH_BITS 11
+#define UCD_RANGE_LENGTH_MASK ((1u << UCD_RANGE_LENGTH_BITS) - 1)
+
+#define UCD_RANGE_START(r) ((r) >> UCD_RANGE_LENGTH_BITS)
+#define UCD_RANGE_END(r) (UCD_RANGE_START(r) + ((r) & UCD_RANGE_LENGTH_MASK))
+
+/* The case fold tables map a character to the smallest code point that it
+matches caselessly, ignoring the optional Turkish equivalences. Characters from
+UCD_FOLD_LIMIT onwards have no other case; pcre2_ucd.c checks these values. */
+
+#define UCD_FOLD_BLOCK_SIZE 32
+#define UCD_FOLD_LIMIT 0x1ea00u
+#define UCD_FOLD(ch) (((uint32_t)(ch) >= UCD_FOLD_LIMIT)? (uint32_t)(ch) : \
+  (uint32_t)((int)(ch) + PRIV(ucd_fold_stage2)[ \
+  PRIV(ucd_fold_stage1)[(int)(ch) / UCD_FOLD_BLOCK_SIZE] * \
+  UCD_FOLD_BLOCK_SIZE + (int)(ch) % UCD_FOLD_BLOCK_SIZE]))
+
+/* Every character below UCD_GB_SIMPLE_LIMIT has one of the grapheme break
+properties CR, LF, Control, Other, or Extended Pictographic; pcre2_ucd.c checks
+this value. Of these, only LF after CR fails to start a new extended grapheme
+cluster, so \X can often find the end of a cluster without looking up the
+property of the next character. */
+
+#define UCD_GB_SIMPLE_LIMIT 0x300u
+
 /* The "scriptx" and bprops fields contain offsets into vectors of 32-bit words
 that form a bitmap representing a list of scripts or boolean properties. These
 macros test or set a bit in the map by number. */
@@ -2094,13 +2200,23 @@ extern const uint8_t          PRIV(utf8_table4)[];
 #define _pcre2_hspace_list             PCRE2_SUFFIX(_pcre2_hspace_list_)
 #define _pcre2_vspace_list             PCRE2_SUFFIX(_pcre2_vspace_list_)
 #define _pcre2_ucd_boolprop_sets       PCRE2_SUFFIX(_pcre2_ucd_boolprop_sets_)
+#define _pcre2_ucd_boolprop_ranges     PCRE2_SUFFIX(_pcre2_ucd_boolprop_ranges_)
+#define _pcre2_ucd_boolprop_ranges_index  PCRE2_SUFFIX(_pcre2_ucd_boolprop_ranges_index_)
 #define _pcre2_ucd_caseless_sets       PCRE2_SUFFIX(_pcre2_ucd_caseless_sets_)
 #define _pcre2_ucd_turkish_dotted_i_caseset  PCRE2_SUFFIX(_pcre2_ucd_turkish_dotted_i_caseset_)
 #define _pcre2_ucd_nocase_ranges       PCRE2_SUFFIX(_pcre2_ucd_nocase_ranges_)
 #define _pcre2_ucd_nocase_ranges_size  PCRE2_SUFFIX(_pcre2_ucd_nocase_ranges_size_)
 #define _pcre2_ucd_digit_sets          PCRE2_SUFFIX(_pcre2_ucd_digit_sets_)
+#define _pcre2_ucd_digit_set_blocks    PCRE2_SUFFIX(_pcre2_ucd_digit_set_blocks_)
+#define _pcre2_ucd_fold_stage1         PCRE2_SUFFIX(_pcre2_ucd_fold_stage1_)
+#define _pcre2_ucd_fold_stage2         PCRE2_SUFFIX(_pcre2_ucd_fold_stage2_)
 #define _pcre2_ucd_script_sets         PCRE2_SUFFIX(_pcre2_ucd_script_sets_)
+#define _pcre2_ucd_script_ranges       PCRE2_SUFFIX(_pcre2_ucd_script_ranges_)
+#define _pcre2_ucd_script_ranges_index PCRE2_SUFFIX(_pcre2_ucd_script_ranges_index_)
+#define _pcre2_ucd_type_ranges         PCRE2_SUFFIX(_pcre2_ucd_type_ranges_)
+#define _pcre2_ucd_type_ranges_index   PCRE2_SUFFIX(_pcre2_ucd_type_ranges_index_)
 #define _pcre2_ucd_records             PCRE2_SUFFIX(_pcre2_ucd_records_)
+#define _pcre2_ucd_latin1_records      PCRE2_SUFFIX(_pcre2_ucd_latin1_records_)
 #define _pcre2_ucd_stage1              PCRE2_SUFFIX(_pcre2_ucd_stage1_)
 #define _pcre2_ucd_stage2              PCRE2_SUFFIX(_pcre2_ucd_stage2_)
 #define _pcre2_ucp_gbtable             PCRE2_SUFFIX(_pcre2_ucp_gbtable_)
@@ -2121,13 +2237,23 @@ extern const uint8_t                   PRIV(default_tables)[];
 extern const uint32_t                  PRIV(hspace_list)[];
 extern const uint32_t                  PRIV(vspace_list)[];
 extern const uint32_t                  PRIV(ucd_boolprop_sets)[];
+extern const uint32_t                  PRIV(ucd_boolprop_ranges)[];
+extern const uint16_t                  PRIV(ucd_boolprop_ranges_index)[];
 extern const uint32_t                  PRIV(ucd_caseless_sets)[];
 extern const uint32_t                  PRIV(ucd_turkish_dotted_i_caseset);
 extern const uint32_t                  PRIV(ucd_nocase_ranges)[];
 extern const uint32_t                  PRIV(ucd_nocase_ranges_size);
 extern const uint32_t                  PRIV(ucd_digit_sets)[];
+extern const uint8_t                   PRIV(ucd_digit_set_blocks)[];
+extern const uint8_t                   PRIV(ucd_fold_stage1)[];
+extern const int32_t                   PRIV(ucd_fold_stage2)[];
 extern const uint32_t                  PRIV(ucd_script_sets)[];
+extern const uint32_t                  PRIV(ucd_script_ranges)[];
+extern const uint16_t                  PRIV(ucd_script_ranges_index)[];
+extern const uint32_t                  PRIV(ucd_type_ranges)[];
+extern const uint16_t                  PRIV(ucd_type_ranges_index)[];
 extern const ucd_record                PRIV(ucd_records)[];
+extern const ucd_record                PRIV(ucd_latin1_records)[];
 #if PCRE2_CODE_UNIT_WIDTH == 32
 extern const ucd_record                PRIV(dummy_ucd_record)[];
 #endif
@@ -2138,7 +2264,7 @@ extern const uint32_t                  PRIV(ucp_gentype)[];
 #ifdef SUPPORT_JIT
 extern const int                       PRIV(ucp_typerange)[];
 #endif
-extern const char                     *PRIV(unicode_version);
+extern const char                      PRIV(unicode_version)[];
 extern const ucp_type_table            PRIV(utt)[];
 extern const char                      PRIV(utt_names)[];
 extern const size_t                    PRIV(utt_size);
@@ -2217,6 +2343,25 @@ extern BOOL         _pcre2_xclass(uint32_t, PCRE2_SPTR, const uint8_t *, BOOL);
 extern BOOL         _pcre2_eclass(uint32_t, PCRE2_SPTR, PCRE2_SPTR,
                       const uint8_t *, BOOL);
 
+/* These functions are needed only when match instrumentation is enabled. The
+uninstrumented JIT matcher is called directly by pcre2_match(), so that a match
+is not counted twice. */
+
+#ifdef SUPPORT_INSTRUMENTATION
+#define _pcre2_instr_record          PCRE2_SUFFIX(_pcre2_instr_record_)
+#define _pcre2_instr_start           PCRE2_SUFFIX(_pcre2_instr_start_)
+extern void         _pcre2_instr_record(uint32_t, const pcre2_code *,
+                      PCRE2_SPTR, PCRE2_SIZE, PCRE2_SIZE, pcre2_match_data *,
+                      pcre2_match_context *, int, uint64_t);
+extern uint64_t     _pcre2_instr_start(pcre2_match_data *);
+#ifdef SUPPORT_JIT
+#define _pcre2_jit_match             PCRE2_SUFFIX(_pcre2_jit_match_)
+extern int          _pcre2_jit_match(const pcre2_code *, PCRE2_SPTR,
+                      PCRE2_SIZE, PCRE2_SIZE, uint32_t, pcre2_match_data *,
+                      pcre2_match_context *);
+#endif
+#endif
+
 /* This function is needed only when memmove() is not available. */
 
 #if !defined(VPCOMPAT) && !defined(HAVE_MEMMOVE)
@@ -2224,6 +2369,15 @@ extern BOOL         _pcre2_eclass(uint32_t, PCRE2_SPTR, PCRE2_SPTR,
 extern void *       _pcre2_memmove(void *, const void *, size_t);
 #endif
 
+/* This function does not depend on the code unit width, so normally the
+libraries share its name, and a program that links more than one static library
+gets one copy. In a unity build (see PCRE2_UNITY_BUILD in CMakeLists.txt) each
+library is a single object, so the name must be different in each library. */
+
+#ifdef PCRE2_UNITY_BUILD
+#define _pcre2_ckd_smul              PCRE2_SUFFIX(_pcre2_ckd_smul_)
+#endif
+
 #endif  /* PCRE2_CODE_UNIT_WIDTH */
 
 extern BOOL         PRIV(ckd_smul)(PCRE2_SIZE *, int, int);
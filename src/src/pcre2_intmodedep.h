@@ -597,10 +597,14 @@ typedef struct pcre2_real_match_context {
   PCRE2_SIZE (*substitute_case_callout)(PCRE2_SPTR, PCRE2_SIZE, PCRE2_UCHAR *,
                                         PCRE2_SIZE, int, void *);
   void        *substitute_case_callout_data;
+  void       (*slow_match)(pcre2_slow_match_block *, void *);
+  void        *slow_match_data;
   PCRE2_SIZE offset_limit;
   uint32_t heap_limit;
   uint32_t match_limit;
   uint32_t depth_limit;
+  uint32_t slow_match_threshold;     /* In microseconds */
+  uint32_t engine_switch_limit;      /* For pcre2_engine_match() */
 } pcre2_real_match_context;
 
 /* The real convert context structure. */
@@ -679,9 +683,31 @@ typedef struct pcre2_real_match_data {
   uint8_t          flags;            /* Various flags */
   uint16_t         oveccount;        /* Number of pairs */
   int              rc;               /* The return code from the match */
+#ifdef SUPPORT_INSTRUMENTATION
+  uint64_t         counters[PCRE2_INSTR_COUNTERS];  /* For the last match */
+#endif
   PCRE2_SIZE       ovector[131072];  /* Must be last in the structure */
 } pcre2_real_match_data;
 
+/* The real stream structure. The buffer that holds the retained and new data
+follows the structure in the same block of memory; its size is fixed when the
+stream is created. */
+
+typedef struct pcre2_real_stream {
+  pcre2_memctl     memctl;           /* Memory control fields */
+  const pcre2_real_code *code;       /* The pattern being matched */
+  pcre2_match_data *match_data;      /* Used for every match */
+  int            (*callback)(pcre2_match_data *, PCRE2_SIZE, void *);
+  void            *callback_data;    /* Passed to the callback */
+  PCRE2_UCHAR     *buffer;           /* Points after this structure */
+  PCRE2_SIZE       size;             /* Buffer size in code units */
+  PCRE2_SIZE       used;             /* Code units in the buffer */
+  PCRE2_SIZE       offset;           /* Where the next search starts */
+  PCRE2_SIZE       base;             /* Stream offset of buffer[0] */
+  uint32_t         retain;           /* Characters kept before the offset */
+  uint32_t         flags;            /* Extra options for the next search */
+} pcre2_real_stream;
+
 
 /* ----------------------- PRIVATE STRUCTURES ----------------------------- */
 
@@ -736,6 +762,8 @@ typedef struct class_ranges {
   size_t char_lists_start;         /* Start offset of encoded char lists */
   uint16_t range_list_size;        /* Size of ranges array */
   uint16_t char_lists_types;       /* The XCL_LIST header of char lists */
+  uint8_t *class_map;              /* Map for characters < 0x10000, or NULL */
+  size_t class_map_size;           /* Size of the map */
   /* Followed by the list of ranges (start/end pairs) */
 } class_ranges;
 
@@ -793,6 +821,8 @@ typedef struct compile_block {
   class_ranges *cranges;           /* First class range. */
   class_ranges *next_cranges;      /* Next class range. */
   size_t char_lists_size;          /* Current size of character lists */
+  size_t class_maps_size;          /* Total size of class maps */
+  BOOL class_maps;                 /* Build maps for property classes */
 #endif
 } compile_block;
 
@@ -966,6 +996,9 @@ typedef struct dfa_match_block {
   void *callout_data;             /* To pass back to callouts */
   int (*callout)(pcre2_callout_block *,void *);  /* Callout function or NULL */
   dfa_recursion_info *recursive;  /* Linked list of pattern recursion data */
+#ifdef SUPPORT_INSTRUMENTATION
+  uint64_t *counters;             /* Instrumentation counters */
+#endif
 } dfa_match_block;
 
 #endif  /* PCRE2_PCRE2TEST */
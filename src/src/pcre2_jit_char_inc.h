@@ -300,6 +300,33 @@ add_jump(compiler, backtracks, JUMP(SLJIT_JUMP));
 JUMPHERE(jump);
 }
 
+#ifdef SUPPORT_UNICODE
+
+static void xclass_check_bmpmap(compiler_common *common, const sljit_u8 *bmpmap, jump_list **found, jump_list **backtracks)
+{
+DEFINE_COMPILER;
+struct sljit_jump *jump;
+
+/* The first 256 bytes select a 32-byte block for each 256 characters, so the
+bit number within the blocks is the block number followed by the low byte. */
+jump = CMP(SLJIT_GREATER_EQUAL, TMP1, 0, SLJIT_IMM, XCL_BMPMAP_LIMIT);
+OP2(SLJIT_LSHR, TMP2, 0, TMP1, 0, SLJIT_IMM, 8);
+OP1(SLJIT_MOV_U8, TMP2, 0, SLJIT_MEM1(TMP2), (sljit_sw)bmpmap);
+OP2(SLJIT_SHL, TMP2, 0, TMP2, 0, SLJIT_IMM, 8);
+OP2(SLJIT_AND, TMP1, 0, TMP1, 0, SLJIT_IMM, 0xff);
+OP2(SLJIT_OR, TMP1, 0, TMP1, 0, TMP2, 0);
+OP2(SLJIT_AND, TMP2, 0, TMP1, 0, SLJIT_IMM, 0x7);
+OP2(SLJIT_LSHR, TMP1, 0, TMP1, 0, SLJIT_IMM, 3);
+OP1(SLJIT_MOV_U8, TMP1, 0, SLJIT_MEM1(TMP1), (sljit_sw)(bmpmap + 256));
+OP2(SLJIT_SHL, TMP2, 0, SLJIT_IMM, 1, TMP2, 0);
+OP2U(SLJIT_AND | SLJIT_SET_Z, TMP1, 0, TMP2, 0);
+add_jump(compiler, found, JUMP(SLJIT_NOT_ZERO));
+add_jump(compiler, backtracks, JUMP(SLJIT_JUMP));
+JUMPHERE(jump);
+}
+
+#endif /* SUPPORT_UNICODE */
+
 #if defined SUPPORT_UNICODE && (PCRE2_CODE_UNIT_WIDTH == 8 || PCRE2_CODE_UNIT_WIDTH == 16)
 
 static void xclass_update_min_max(compiler_common *common, PCRE2_SPTR cc, sljit_u32 *min_ptr, sljit_u32 *max_ptr)
@@ -678,6 +705,17 @@ if ((flags & XCL_MAP) != 0)
   cc += 32 / sizeof(PCRE2_UCHAR);
   }
 
+#ifdef SUPPORT_UNICODE
+/* Characters below 0x10000 are looked up in the map of the class, when there
+is one. The map includes the negation. */
+if ((flags & XCL_BMPMAP) != 0)
+  {
+  SLJIT_ASSERT(!(status & XCLASS_IS_ECLASS));
+  xclass_check_bmpmap(common, (const sljit_u8 *)common->start -
+    XCL_BMPMAP_OFFSET(ccbegin - 1), &found, backtracks);
+  }
+#endif
+
 #ifdef SUPPORT_UNICODE
 if (status & XCLASS_NEEDS_UCD)
   {
@@ -700,12 +738,20 @@ if (status & XCLASS_NEEDS_UCD)
   OP2(SLJIT_ADD, TMP1, 0, TMP1, 0, TMP2, 0);
   OP1(SLJIT_MOV, TMP2, 0, SLJIT_IMM, (sljit_sw)PRIV(ucd_stage2));
   OP1(SLJIT_MOV_U16, TMP2, 0, SLJIT_MEM2(TMP2, TMP1), 1);
+#if UCD_RECORD_SIZE == 8
+  OP2(SLJIT_SHL, TMP2, 0, TMP2, 0, SLJIT_IMM, 3);
+#else
   OP2(SLJIT_SHL, TMP1, 0, TMP2, 0, SLJIT_IMM, 3);
   OP2(SLJIT_SHL, TMP2, 0, TMP2, 0, SLJIT_IMM, 2);
   OP2(SLJIT_ADD, TMP2, 0, TMP2, 0, TMP1, 0);
+#endif
 
   ccbegin = cc;
 
+  /* The compiler rejects properties whose UCD columns were omitted, so their
+  tests are left out too. */
+
+#ifndef PCRE2_UCD_OMIT_BIDI
   if (status & XCLASS_HAS_BIDICL)
     {
     OP1(SLJIT_MOV_U16, TMP1, 0, SLJIT_MEM1(TMP2), (sljit_sw)PRIV(ucd_records) + SLJIT_OFFSETOF(ucd_record, scriptx_bidiclass));
@@ -729,7 +775,9 @@ if (status & XCLASS_NEEDS_UCD)
 
     cc = ccbegin;
     }
+#endif
 
+#ifndef PCRE2_UCD_OMIT_BPROPS
   if (status & XCLASS_HAS_BOOL)
     {
     OP1(SLJIT_MOV_U16, TMP1, 0, SLJIT_MEM1(TMP2), (sljit_sw)PRIV(ucd_records) + SLJIT_OFFSETOF(ucd_record, bprops));
@@ -754,6 +802,7 @@ if (status & XCLASS_NEEDS_UCD)
 
     cc = ccbegin;
     }
+#endif
 
   if (status & XCLASS_HAS_SCRIPT)
     {
@@ -784,6 +833,7 @@ if (status & XCLASS_NEEDS_UCD)
     cc = ccbegin;
     }
 
+#ifndef PCRE2_UCD_OMIT_SCRIPTS
   if (status & XCLASS_HAS_SCRIPT_EXTENSION)
     {
     OP1(SLJIT_MOV_U16, TMP1, 0, SLJIT_MEM1(TMP2), (sljit_sw)PRIV(ucd_records) + SLJIT_OFFSETOF(ucd_record, scriptx_bidiclass));
@@ -844,6 +894,7 @@ if (status & XCLASS_NEEDS_UCD)
       OP1(SLJIT_MOV, TMP2, 0, RETURN_ADDR, 0);
     cc = ccbegin;
     }
+#endif
 
   if (status & XCLASS_SAVE_CHAR)
     OP1(SLJIT_MOV, TMP1, 0, (status & XCLASS_IS_ECLASS) ? ECLASS_CHAR_DATA : RETURN_ADDR, 0);
@@ -82,6 +82,10 @@ pcre2_memctl *allocator = ((pcre2_memctl*)allocator_data);
 allocator->free(ptr, allocator->memory_data);
 }
 
+#ifdef JIT_CHUNK_SIZE
+#define CHUNK_SIZE ((sljit_uw)JIT_CHUNK_SIZE)
+#endif
+
 #include "../deps/sljit/sljit_src/sljitLir.c"
 
 #if defined SLJIT_CONFIG_UNSUPPORTED && SLJIT_CONFIG_UNSUPPORTED
@@ -5416,7 +5420,7 @@ SLJIT_ASSERT(record->script == ucp_Unknown && record->chartype == ucp_Cn && reco
 SLJIT_ASSERT(record->caseset == 0 && record->other_case == 0);
 #endif
 
-SLJIT_ASSERT(UCD_BLOCK_SIZE == 128 && sizeof(ucd_record) == 12);
+SLJIT_ASSERT(UCD_BLOCK_SIZE == 128 && sizeof(ucd_record) == UCD_RECORD_SIZE);
 
 sljit_emit_op_dst(compiler, SLJIT_FAST_ENTER, RETURN_ADDR, 0);
 
@@ -5456,7 +5460,7 @@ SLJIT_ASSERT(record->script == ucp_Unknown && record->chartype == ucp_Cn && reco
 SLJIT_ASSERT(record->caseset == 0 && record->other_case == 0);
 #endif
 
-SLJIT_ASSERT(UCD_BLOCK_SIZE == 128 && sizeof(ucd_record) == 12);
+SLJIT_ASSERT(UCD_BLOCK_SIZE == 128 && sizeof(ucd_record) == UCD_RECORD_SIZE);
 
 sljit_emit_op_dst(compiler, SLJIT_FAST_ENTER, RETURN_ADDR, 0);
 
@@ -5478,11 +5482,15 @@ OP2(SLJIT_ADD, TMP1, 0, TMP1, 0, TMP2, 0);
 OP1(SLJIT_MOV, TMP2, 0, SLJIT_IMM, (sljit_sw)PRIV(ucd_stage2));
 OP1(SLJIT_MOV_U16, TMP2, 0, SLJIT_MEM2(TMP2, TMP1), 1);
 
-/* TMP2 is multiplied by 12. Same as (TMP2 << 2) + ((TMP2 << 2) << 1). */
 OP1(SLJIT_MOV, TMP1, 0, SLJIT_IMM, (sljit_sw)PRIV(ucd_records) + SLJIT_OFFSETOF(ucd_record, chartype));
+#if UCD_RECORD_SIZE == 8
+OP1(SLJIT_MOV_U8, TMP1, 0, SLJIT_MEM2(TMP1, TMP2), 3);
+#else
+/* TMP2 is multiplied by 12. Same as (TMP2 << 2) + ((TMP2 << 2) << 1). */
 OP2(SLJIT_SHL, TMP2, 0, TMP2, 0, SLJIT_IMM, 2);
 OP2(SLJIT_ADD, TMP1, 0, TMP1, 0, TMP2, 0);
 OP1(SLJIT_MOV_U8, TMP1, 0, SLJIT_MEM2(TMP1, TMP2), 1);
+#endif
 
 OP_SRC(SLJIT_FAST_RETURN, RETURN_ADDR, 0);
 }
@@ -8099,9 +8107,13 @@ if ((common->utf || common->ucp) && (*cc == OP_REFI || *cc == OP_DNREFI))
 
   add_jump(compiler, &common->getucd, JUMP(SLJIT_FAST_CALL));
 
+#if UCD_RECORD_SIZE == 8
+  OP2(SLJIT_SHL, TMP2, 0, TMP2, 0, SLJIT_IMM, 3);
+#else
   OP2(SLJIT_SHL, TMP1, 0, TMP2, 0, SLJIT_IMM, 2);
   OP2(SLJIT_SHL, TMP2, 0, TMP2, 0, SLJIT_IMM, 3);
   OP2(SLJIT_ADD, TMP2, 0, TMP2, 0, TMP1, 0);
+#endif
 
   OP2(SLJIT_ADD, TMP2, 0, TMP2, 0, SLJIT_IMM, (sljit_sw)PRIV(ucd_records));
 
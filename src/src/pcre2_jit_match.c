@@ -87,10 +87,17 @@ Returns:          > 0 => success; value is the number of ovector pairs filled
                  < -1 => some kind of unexpected problem
 */
 
+#if defined SUPPORT_INSTRUMENTATION && defined SUPPORT_JIT
+int
+PRIV(jit_match)(const pcre2_code *code, PCRE2_SPTR subject, PCRE2_SIZE length,
+  PCRE2_SIZE start_offset, uint32_t options, pcre2_match_data *match_data,
+  pcre2_match_context *mcontext)
+#else
 PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
 pcre2_jit_match(const pcre2_code *code, PCRE2_SPTR subject, PCRE2_SIZE length,
   PCRE2_SIZE start_offset, uint32_t options, pcre2_match_data *match_data,
   pcre2_match_context *mcontext)
+#endif
 {
 #ifndef SUPPORT_JIT
 
@@ -197,4 +204,29 @@ return match_data->rc;
 #endif  /* SUPPORT_JIT */
 }
 
+
+#if defined SUPPORT_INSTRUMENTATION && defined SUPPORT_JIT
+/*************************************************
+*   Do a JIT pattern match, instrumented         *
+*************************************************/
+
+/* When instrumentation is enabled, pcre2_jit_match() is a wrapper that times
+the function above and records the call. JIT code does not count backtracks or
+frames, so only the call, its time, and any limit that was hit are recorded;
+running out of JIT stack counts as hitting the depth limit. */
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_jit_match(const pcre2_code *code, PCRE2_SPTR subject, PCRE2_SIZE length,
+  PCRE2_SIZE start_offset, uint32_t options, pcre2_match_data *match_data,
+  pcre2_match_context *mcontext)
+{
+uint64_t start_time = PRIV(instr_start)(match_data);
+int rc = PRIV(jit_match)(code, subject, length, start_offset, options,
+  match_data, mcontext);
+PRIV(instr_record)(PCRE2_INSTR_JIT, code, subject, length, start_offset,
+  match_data, mcontext, rc, start_time);
+return rc;
+}
+#endif  /* SUPPORT_INSTRUMENTATION && SUPPORT_JIT */
+
 /* End of pcre2_jit_match.c */
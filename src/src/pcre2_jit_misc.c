@@ -199,6 +199,273 @@ if (jit_stack != NULL)
 }
 
 
+/*************************************************
+*          Create a pool of JIT stacks           *
+*************************************************/
+
+/* A pool hands out JIT stacks to threads and takes them back, so that a
+program whose threads come and go does not have to create and free a stack for
+each of them. Stacks are created on demand; up to "keep" idle stacks are
+retained for reuse. The pool is protected by a lock, but its stacks, once handed
+out, belong to a single thread until they are returned.
+
+Arguments:
+  startsize    starting size of each stack
+  maxsize      maximum size of each stack
+  keep         the maximum number of idle stacks to keep
+  gcontext     a general context, or NULL
+
+Returns:       pointer to the pool, or NULL on failure
+*/
+
+#ifdef SUPPORT_JIT
+#ifdef _WIN32
+#define POOL_LOCK_TYPE           CRITICAL_SECTION
+#define POOL_LOCK_INIT(l)        (InitializeCriticalSection(l), 0)
+#define POOL_LOCK_DESTROY(l)     DeleteCriticalSection(l)
+#define POOL_LOCK(l)             EnterCriticalSection(l)
+#define POOL_UNLOCK(l)           LeaveCriticalSection(l)
+#else
+#include <pthread.h>
+#define POOL_LOCK_TYPE           pthread_mutex_t
+#define POOL_LOCK_INIT(l)        pthread_mutex_init(l, NULL)
+#define POOL_LOCK_DESTROY(l)     pthread_mutex_destroy(l)
+#define POOL_LOCK(l)             pthread_mutex_lock(l)
+#define POOL_UNLOCK(l)           pthread_mutex_unlock(l)
+#endif
+
+struct pcre2_real_jit_stack_pool {
+  pcre2_memctl memctl;
+  size_t startsize;               /* Parameters for new stacks */
+  size_t maxsize;
+  uint32_t keep;                  /* Size of the stacks vector */
+  uint32_t count;                 /* Number of idle stacks */
+  POOL_LOCK_TYPE lock;
+  pcre2_jit_stack *stacks[1];     /* Idle stacks (really keep of them) */
+};
+#endif  /* SUPPORT_JIT */
+
+PCRE2_EXP_DEFN pcre2_jit_stack_pool * PCRE2_CALL_CONVENTION
+pcre2_jit_stack_pool_create(size_t startsize, size_t maxsize, uint32_t keep,
+  pcre2_general_context *gcontext)
+{
+#ifndef SUPPORT_JIT
+
+(void)startsize;
+(void)maxsize;
+(void)keep;
+(void)gcontext;
+return NULL;
+
+#else  /* SUPPORT_JIT */
+
+pcre2_jit_stack_pool *pool;
+size_t size = offsetof(pcre2_jit_stack_pool, stacks) +
+  ((keep == 0)? 1 : keep) * sizeof(pcre2_jit_stack *);
+
+if (startsize == 0 || maxsize == 0 || maxsize > SIZE_MAX - STACK_GROWTH_RATE)
+  return NULL;
+if (startsize > maxsize)
+  startsize = maxsize;
+
+pool = PRIV(memctl_malloc)(size, (pcre2_memctl *)gcontext);
+if (pool == NULL) return NULL;
+
+if (POOL_LOCK_INIT(&pool->lock) != 0)
+  {
+  pool->memctl.free(pool, pool->memctl.memory_data);
+  return NULL;
+  }
+
+pool->startsize = startsize;
+pool->maxsize = maxsize;
+pool->keep = keep;
+pool->count = 0;
+return pool;
+
+#endif  /* SUPPORT_JIT */
+}
+
+
+/*************************************************
+*         Take a JIT stack from a pool           *
+*************************************************/
+
+/* An idle stack is returned if there is one; otherwise a new stack is
+created, using the pool's memory management functions.
+
+Argument:   the pool
+Returns:    a JIT stack, or NULL on failure
+*/
+
+PCRE2_EXP_DEFN pcre2_jit_stack * PCRE2_CALL_CONVENTION
+pcre2_jit_stack_pool_get(pcre2_jit_stack_pool *pool)
+{
+#ifndef SUPPORT_JIT
+
+(void)pool;
+return NULL;
+
+#else  /* SUPPORT_JIT */
+
+pcre2_jit_stack *jit_stack = NULL;
+
+if (pool == NULL) return NULL;
+
+POOL_LOCK(&pool->lock);
+if (pool->count > 0) jit_stack = pool->stacks[--pool->count];
+POOL_UNLOCK(&pool->lock);
+
+if (jit_stack == NULL)
+  jit_stack = pcre2_jit_stack_create(pool->startsize, pool->maxsize,
+    (pcre2_general_context *)pool);
+return jit_stack;
+
+#endif  /* SUPPORT_JIT */
+}
+
+
+/*************************************************
+*         Return a JIT stack to a pool           *
+*************************************************/
+
+/* The stack is kept for reuse if the pool has room for it; otherwise it is
+freed. A stack must not be in use by any match when it is returned.
+
+Arguments:
+  pool         the pool
+  jit_stack    a stack obtained from pcre2_jit_stack_pool_get()
+
+Returns:       nothing
+*/
+
+PCRE2_EXP_DEFN void PCRE2_CALL_CONVENTION
+pcre2_jit_stack_pool_put(pcre2_jit_stack_pool *pool,
+  pcre2_jit_stack *jit_stack)
+{
+#ifndef SUPPORT_JIT
+(void)pool;
+(void)jit_stack;
+#else  /* SUPPORT_JIT */
+
+if (jit_stack == NULL) return;
+if (pool != NULL)
+  {
+  POOL_LOCK(&pool->lock);
+  if (pool->count < pool->keep)
+    {
+    pool->stacks[pool->count++] = jit_stack;
+    jit_stack = NULL;
+    }
+  POOL_UNLOCK(&pool->lock);
+  }
+pcre2_jit_stack_free(jit_stack);
+
+#endif  /* SUPPORT_JIT */
+}
+
+
+/*************************************************
+*           Free a pool of JIT stacks            *
+*************************************************/
+
+/* The idle stacks are freed with the pool. Stacks that are still handed out
+must be freed separately, with pcre2_jit_stack_free().
+
+Argument:   the pool
+Returns:    nothing
+*/
+
+PCRE2_EXP_DEFN void PCRE2_CALL_CONVENTION
+pcre2_jit_stack_pool_free(pcre2_jit_stack_pool *pool)
+{
+#ifndef SUPPORT_JIT
+(void)pool;
+#else  /* SUPPORT_JIT */
+
+if (pool == NULL) return;
+while (pool->count > 0) pcre2_jit_stack_free(pool->stacks[--pool->count]);
+POOL_LOCK_DESTROY(&pool->lock);
+pool->memctl.free(pool, pool->memctl.memory_data);
+
+#endif  /* SUPPORT_JIT */
+}
+
+
+/*************************************************
+*     Get information about JIT code memory      *
+*************************************************/
+
+/* Each library (8-bit, 16-bit, 32-bit) has its own executable memory
+allocator, shared by all the patterns it compiles. The allocator obtains memory
+from the system in chunks, and carves these into blocks for individual
+patterns. The numbers it keeps show how much memory has been mapped, how much
+is in use, and how fragmented the free space is.
+
+Arguments:
+  what        what information is required
+  where       where to put the information, a PCRE2_SIZE
+
+Returns:      0 when data returned
+              PCRE2_ERROR_NULL if where is NULL
+              PCRE2_ERROR_BADOPTION if what is unknown
+              PCRE2_ERROR_JIT_BADOPTION if JIT is not supported or the
+                allocator does not keep these numbers
+*/
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_jit_memory_info(uint32_t what, void *where)
+{
+#if !defined SUPPORT_JIT || \
+  !(defined SLJIT_EXECUTABLE_ALLOCATOR && SLJIT_EXECUTABLE_ALLOCATOR) || \
+  (defined SLJIT_WX_EXECUTABLE_ALLOCATOR && SLJIT_WX_EXECUTABLE_ALLOCATOR)
+
+(void)what;
+(void)where;
+return PCRE2_ERROR_JIT_BADOPTION;
+
+#else
+
+struct sljit_exec_allocator_stats stats;
+PCRE2_SIZE value;
+
+if (where == NULL) return PCRE2_ERROR_NULL;
+
+sljit_get_exec_allocator_stats(&stats);
+
+switch(what)
+  {
+  case PCRE2_JIT_MEMINFO_CHUNKS:
+  value = stats.chunk_count;
+  break;
+
+  case PCRE2_JIT_MEMINFO_TOTALSIZE:
+  value = stats.total_size;
+  break;
+
+  case PCRE2_JIT_MEMINFO_USEDSIZE:
+  value = stats.allocated_size;
+  break;
+
+  case PCRE2_JIT_MEMINFO_FREEBLOCKS:
+  value = stats.free_block_count;
+  break;
+
+  case PCRE2_JIT_MEMINFO_LARGESTFREE:
+  value = stats.largest_free_block;
+  break;
+
+  default:
+  return PCRE2_ERROR_BADOPTION;
+  }
+
+*((PCRE2_SIZE *)where) = value;
+return 0;
+
+#endif
+}
+
+
 /*************************************************
 *               Get target CPU type              *
 *************************************************/
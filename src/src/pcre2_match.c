@@ -429,13 +429,22 @@ if (caseless)
         d = UCD_FOLD_I_TURKISH(d);
         if (c != d) return -1;  /* No match */
         }
+
+      /* Without PCRE2_EXTRA_CASELESS_RESTRICT, two characters match if their
+      case folds are the same, which covers caseless sets as well as pairs. */
+
+      else if (!caseless_restrict)
+        {
+        if (c != d && UCD_FOLD(c) != UCD_FOLD(d)) return -1;  /* No match */
+        }
+
       else if (c != d && c != (uint32_t)((int)d + (ur = GET_UCD(d))->other_case))
         {
         const uint32_t *pp = PRIV(ucd_caseless_sets) + ur->caseset;
 
         /* When PCRE2_EXTRA_CASELESS_RESTRICT is set, ignore any caseless sets
         that start with an ASCII character. */
-        if (caseless_restrict && *pp < 128) return -1;  /* No match */
+        if (*pp < 128) return -1;  /* No match */
 
         for (;;)
           {
@@ -722,6 +731,9 @@ if ((heapframe *)((char *)N + frame_size) >= frames_top)
   new = match_data->memctl.malloc(newsize, match_data->memctl.memory_data);
   if (new == NULL) return PCRE2_ERROR_NOMEMORY;
   memcpy(new, match_data->heapframes, usedsize);
+#ifdef SUPPORT_INSTRUMENTATION
+  match_data->counters[PCRE2_INSTR_HEAP_GROWTHS]++;
+#endif
 
   N = (heapframe *)((char *)new + usedsize);
   F = (heapframe *)((char *)N - frame_size);
@@ -6772,6 +6784,9 @@ in rrc. */
 RETURN_SWITCH:
 if (Feptr > mb->last_used_ptr) mb->last_used_ptr = Feptr;
 if (Frdepth == 0) return rrc;                     /* Exit from the top level */
+#ifdef SUPPORT_INSTRUMENTATION
+match_data->counters[PCRE2_INSTR_BACKTRACKS]++;
+#endif
 F = (heapframe *)((char *)F - Fback_frame);       /* Backtrack */
 mb->cb->callout_flags |= PCRE2_CALLOUT_BACKTRACK; /* Note for callouts */
 
@@ -6830,10 +6845,17 @@ Returns:          > 0 => success; value is the number of ovector pairs filled
                   < -2 => some kind of unexpected problem
 */
 
+#ifdef SUPPORT_INSTRUMENTATION
+static int
+uninstrumented_match(const pcre2_code *code, PCRE2_SPTR subject,
+  PCRE2_SIZE length, PCRE2_SIZE start_offset, uint32_t options,
+  pcre2_match_data *match_data, pcre2_match_context *mcontext)
+#else
 PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
 pcre2_match(const pcre2_code *code, PCRE2_SPTR subject, PCRE2_SIZE length,
   PCRE2_SIZE start_offset, uint32_t options, pcre2_match_data *match_data,
   pcre2_match_context *mcontext)
+#endif
 {
 int rc;
 int was_zero_terminated = 0;
@@ -6864,6 +6886,11 @@ PCRE2_SPTR req_cu_ptr;
 PCRE2_SPTR start_partial;
 PCRE2_SPTR match_partial;
 
+#ifdef SUPPORT_INSTRUMENTATION
+PCRE2_SPTR instr_start_match = NULL;  /* Start of this bumpalong iteration */
+BOOL instr_tried = TRUE;              /* Reached the matcher this iteration */
+#endif
+
 #ifdef SUPPORT_JIT
 BOOL use_jit;
 #endif
@@ -7067,8 +7094,13 @@ if (use_jit)
   /* If JIT returns BADOPTION, which means that the selected complete or
   partial matching mode was not compiled, fall through to the interpreter. */
 
+#ifdef SUPPORT_INSTRUMENTATION
+  rc = PRIV(jit_match)(code, subject, length, start_offset, options,
+    match_data, mcontext);
+#else
   rc = pcre2_jit_match(code, subject, length, start_offset, options,
     match_data, mcontext);
+#endif
   if (rc != PCRE2_ERROR_JIT_BADOPTION)
     {
     match_data->subject_length = length;
@@ -7377,6 +7409,9 @@ if (match_data->heapframes_size < heapframes_size)
     return PCRE2_ERROR_NOMEMORY;
     }
   match_data->heapframes_size = heapframes_size;
+#ifdef SUPPORT_INSTRUMENTATION
+  match_data->counters[PCRE2_INSTR_HEAP_GROWTHS]++;
+#endif
   }
 
 /* Write to the ovector within the first frame to mark every capture unset and
@@ -7455,6 +7490,11 @@ for(;;)
   {
   PCRE2_SPTR new_start_match;
 
+#ifdef SUPPORT_INSTRUMENTATION
+  instr_start_match = start_match;
+  instr_tried = FALSE;
+#endif
+
   /* ----------------- Start of match optimizations ---------------- */
 
   /* There are some optimizations that avoid running the match if a known
@@ -7785,6 +7825,12 @@ for(;;)
 
   /* ------------ End of start of match optimizations ------------ */
 
+#ifdef SUPPORT_INSTRUMENTATION
+  match_data->counters[PCRE2_INSTR_START_SKIPS] +=
+    start_match - instr_start_match;
+  instr_tried = TRUE;
+#endif
+
   /* Give no match if we have passed the bumpalong limit. */
 
   if (start_match > bumpalong_limit)
@@ -7817,6 +7863,10 @@ for(;;)
   rc = match(start_match, mb->start_code, re->top_bracket, frame_size,
     match_data, mb);
 
+#ifdef SUPPORT_INSTRUMENTATION
+  match_data->counters[PCRE2_INSTR_FRAMES] += mb->match_call_count;
+#endif
+
 #ifdef DEBUG_SHOW_OPS
   fprintf(stderr, "++ match() returned %d\n\n", rc);
 #endif
@@ -7939,6 +7989,15 @@ for(;;)
 
 ENDLOOP:
 
+/* If the start of match optimizations ended the search, the rest of the
+subject was skipped without being tried. */
+
+#ifdef SUPPORT_INSTRUMENTATION
+if (!instr_tried && mb->end_subject > instr_start_match)
+  match_data->counters[PCRE2_INSTR_START_SKIPS] +=
+    mb->end_subject - instr_start_match;
+#endif
+
 /* If end_subject != true_end_subject, it means we are handling invalid UTF,
 and have just processed a non-terminal fragment. If this resulted in no match
 or a partial match we must carry on to the next fragment (a partial match is
@@ -8071,6 +8130,40 @@ else match_data->rc = PCRE2_ERROR_NOMATCH;
 return match_data->rc;
 }
 
+
+#ifdef SUPPORT_INSTRUMENTATION
+/*************************************************
+*     Match a Regular Expression, instrumented   *
+*************************************************/
+
+/* When instrumentation is enabled, pcre2_match() is a wrapper that times the
+real matching function and records its counters. The arguments and return
+values are as for the function above. A match that is handed over to JIT is
+recorded as a JIT match. */
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_match(const pcre2_code *code, PCRE2_SPTR subject, PCRE2_SIZE length,
+  PCRE2_SIZE start_offset, uint32_t options, pcre2_match_data *match_data,
+  pcre2_match_context *mcontext)
+{
+uint64_t start_time;
+int rc;
+
+if (match_data == NULL)
+  return uninstrumented_match(code, subject, length, start_offset, options,
+    match_data, mcontext);
+
+start_time = PRIV(instr_start)(match_data);
+match_data->matchedby = PCRE2_MATCHEDBY_INTERPRETER;
+rc = uninstrumented_match(code, subject, length, start_offset, options,
+  match_data, mcontext);
+PRIV(instr_record)((match_data->matchedby == PCRE2_MATCHEDBY_JIT)?
+  PCRE2_INSTR_JIT : PCRE2_INSTR_INTERPRETER, code, subject, length,
+  start_offset, match_data, mcontext, rc, start_time);
+return rc;
+}
+#endif  /* SUPPORT_INSTRUMENTATION */
+
 /* These #undefs are here to enable unity builds with CMake. */
 
 #undef NLBLOCK /* Block containing newline information */
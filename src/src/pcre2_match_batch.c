@@ -0,0 +1,126 @@
+/*************************************************
+*      Perl-Compatible Regular Expressions       *
+*************************************************/
+
+/* PCRE is a library of functions to support regular expressions whose syntax
+and semantics are as close as possible to those of the Perl 5 language.
+
+                       Written by Philip Hazel
+     Original API code Copyright (c) 1997-2012 University of Cambridge
+          New API code Copyright (c) 2016-2024 University of Cambridge
+
+-----------------------------------------------------------------------------
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+    * Redistributions of source code must retain the above copyright notice,
+      this list of conditions and the following disclaimer.
+
+    * Redistributions in binary form must reproduce the above copyright
+      notice, this list of conditions and the following disclaimer in the
+      documentation and/or other materials provided with the distribution.
+
+    * Neither the name of the University of Cambridge nor the names of its
+      contributors may be used to endorse or promote products derived from
+      this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+-----------------------------------------------------------------------------
+*/
+
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "pcre2_internal.h"
+
+
+
+/*************************************************
+*     Match a pattern against many subjects      *
+*************************************************/
+
+/* This function runs pcre2_match() once for each subject in an array, using
+the same match data block (and therefore the same heap frame vector) for every
+call. When a match context is supplied, any JIT stack that has been assigned to
+it is likewise shared. This avoids creating and freeing a match data block for
+each subject, which dominates the cost when many short strings are matched.
+
+The function does no locking and holds no state between calls, so disjoint
+slices of the arrays may be handed to different threads, provided that each
+thread uses its own match data block and match context.
+
+Arguments:
+  code            points to the compiled expression
+  subjects        vector of subject pointers
+  lengths         vector of subject lengths, or NULL if all are zero-terminated
+  count           number of subjects
+  options         option bits passed to each pcre2_match() call
+  match_data      points to a match_data block, or NULL
+  mcontext        points to a match context, or NULL
+  results         vector of count ints for the pcre2_match() return codes
+  offsets         NULL, or vector of 2*count PCRE2_SIZE values, set to the
+                    start and end of each overall match, or PCRE2_UNSET
+
+Returns:          >= 0 the number of subjects that matched
+                  < 0 an error code that applies to the whole batch
+*/
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_match_batch(const pcre2_code *code, const PCRE2_SPTR *subjects,
+  const PCRE2_SIZE *lengths, uint32_t count, uint32_t options,
+  pcre2_match_data *match_data, pcre2_match_context *mcontext, int *results,
+  PCRE2_SIZE *offsets)
+{
+int matched = 0;
+uint32_t i;
+pcre2_match_data *md = match_data;
+
+if (code == NULL || results == NULL || (subjects == NULL && count > 0))
+  return PCRE2_ERROR_NULL;
+if (count > INT_MAX) return PCRE2_ERROR_BADDATA;
+
+/* Use a private match data block if none was supplied. One ovector pair is
+enough, because only the overall match is reported back. */
+
+if (md == NULL)
+  {
+  md = pcre2_match_data_create(1, (pcre2_general_context *)code);
+  if (md == NULL) return PCRE2_ERROR_NOMEMORY;
+  }
+
+for (i = 0; i < count; i++)
+  {
+  PCRE2_SIZE length = (lengths == NULL)? PCRE2_ZERO_TERMINATED : lengths[i];
+  int rc = pcre2_match(code, subjects[i], length, 0, options, md, mcontext);
+
+  results[i] = rc;
+  if (rc >= 0) matched++;
+
+  if (offsets != NULL)
+    {
+    if (rc >= 0)
+      {
+      offsets[2*i] = md->ovector[0];
+      offsets[2*i+1] = md->ovector[1];
+      }
+    else offsets[2*i] = offsets[2*i+1] = PCRE2_UNSET;
+    }
+  }
+
+if (match_data == NULL) pcre2_match_data_free(md);
+return matched;
+}
+
+/* End of pcre2_match_batch.c */
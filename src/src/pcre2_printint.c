@@ -519,7 +519,7 @@ static void
 print_class(FILE *f, int type, PCRE2_SPTR code, const uint8_t *char_lists_end,
   BOOL utf, const char *before, const char *after)
 {
-BOOL printmap, negated;
+BOOL printmap, negated, bmpmap = FALSE;
 PCRE2_SPTR ccode;
 
 /* Negative XCLASS and NCLASS both have a bitmap indicating which characters
@@ -529,6 +529,7 @@ if (type == OP_XCLASS)
   ccode = code + LINK_SIZE;
   printmap = (*ccode & XCL_MAP) != 0;
   negated = (*ccode & XCL_NOT) != 0;
+  bmpmap = (*ccode & XCL_BMPMAP) != 0;
   ccode++;
   }
 else  /* CLASS or NCLASS */
@@ -606,6 +607,8 @@ if (type == OP_XCLASS)
       }
     }
 
+  /* The map itself is not shown; skip its offset. */
+  if (bmpmap) ccode += LINK_SIZE;
   PCRE2_ASSERT(ccode == code + (GET(code, 0) - 1));
   }
 
@@ -87,7 +87,6 @@ PRIV(script_run)(PCRE2_SPTR ptr, PCRE2_SPTR endptr, BOOL utf)
 #ifdef SUPPORT_UNICODE
 uint32_t require_state = SCRIPT_UNSET;
 uint32_t require_map[FULL_MAPSIZE];
-uint32_t map[FULL_MAPSIZE];
 uint32_t require_digitset = 0;
 uint32_t c;
 
@@ -140,15 +139,17 @@ for (;;)
     {
     BOOL OK;
 
-    /* Set up a full-sized map for this character that can include bits for all
-    scripts. Copy the scriptx map for this character (which covers those
-    scripts that appear in script extension lists), set the remaining values to
-    zero, and then, except for Common or Inherited, add this script's bit to
-    the map. */
+    /* The scripts allowed with this character are those in its scriptx map,
+    which covers the scripts that appear in script extension lists, plus its
+    own script unless that is Common or Inherited. The map for a character
+    without extensions is all zeros. Rather than building a full-sized map,
+    the tests below use the scriptx map's words directly, and check the
+    character's own script separately. */
 
-    memcpy(map, PRIV(ucd_script_sets) + UCD_SCRIPTX_PROP(ucd), UCD_MAPSIZE * sizeof(uint32_t));
-    memset(map + UCD_MAPSIZE, 0, (FULL_MAPSIZE - UCD_MAPSIZE) * sizeof(uint32_t));
-    if (script != ucp_Common && script != ucp_Inherited) MAPSET(map, script);
+    const uint32_t *xmap = PRIV(ucd_script_sets) + UCD_SCRIPTX_PROP(ucd);
+    BOOL own = script != ucp_Common && script != ucp_Inherited;
+
+#define HAS_SCRIPT(s) ((own && script == (s)) || MAPBIT(xmap, (s)) != 0)
 
     /* Handle the different checking states */
 
@@ -178,7 +179,8 @@ for (;;)
         break;
 
         default:
-        memcpy(require_map, map, FULL_MAPSIZE * sizeof(uint32_t));
+        memcpy(require_map, xmap, UCD_MAPSIZE * sizeof(uint32_t));
+        if (own) MAPSET(require_map, script);
         require_state = SCRIPT_MAP;
         break;
         }
@@ -206,10 +208,10 @@ for (;;)
         {
         uint32_t chspecial = 0;
 
-        if (MAPBIT(map, ucp_Bopomofo) != 0) chspecial |= FOUND_BOPOMOFO;
-        if (MAPBIT(map, ucp_Hiragana) != 0) chspecial |= FOUND_HIRAGANA;
-        if (MAPBIT(map, ucp_Katakana) != 0) chspecial |= FOUND_KATAKANA;
-        if (MAPBIT(map, ucp_Hangul) != 0)   chspecial |= FOUND_HANGUL;
+        if (HAS_SCRIPT(ucp_Bopomofo)) chspecial |= FOUND_BOPOMOFO;
+        if (HAS_SCRIPT(ucp_Hiragana)) chspecial |= FOUND_HIRAGANA;
+        if (HAS_SCRIPT(ucp_Katakana)) chspecial |= FOUND_KATAKANA;
+        if (HAS_SCRIPT(ucp_Hangul))   chspecial |= FOUND_HANGUL;
 
         if (chspecial == 0) return FALSE;   /* Not allowed with Han */
 
@@ -227,30 +229,34 @@ for (;;)
       this character is appropriate. */
 
       case SCRIPT_HANHIRAKATA:
-      if (MAPBIT(map, ucp_Han) + MAPBIT(map, ucp_Hiragana) +
-          MAPBIT(map, ucp_Katakana) == 0) return FALSE;
+      if (!HAS_SCRIPT(ucp_Han) && !HAS_SCRIPT(ucp_Hiragana) &&
+          !HAS_SCRIPT(ucp_Katakana)) return FALSE;
       break;
 
       case SCRIPT_HANBOPOMOFO:
-      if (MAPBIT(map, ucp_Han) + MAPBIT(map, ucp_Bopomofo) == 0) return FALSE;
+      if (!HAS_SCRIPT(ucp_Han) && !HAS_SCRIPT(ucp_Bopomofo)) return FALSE;
       break;
 
       case SCRIPT_HANHANGUL:
-      if (MAPBIT(map, ucp_Han) + MAPBIT(map, ucp_Hangul) == 0) return FALSE;
+      if (!HAS_SCRIPT(ucp_Han) && !HAS_SCRIPT(ucp_Hangul)) return FALSE;
       break;
 
       /* Previously encountered one or more characters that are allowed with a
-      list of scripts. */
+      list of scripts. The character's own script can be tested directly; the
+      extension words are ANDed in parallel, and only if it has extensions. */
 
       case SCRIPT_MAP:
-      OK = FALSE;
+      OK = own && MAPBIT(require_map, script) != 0;
 
-      for (int i = 0; i < FULL_MAPSIZE; i++)
+      if (!OK && UCD_SCRIPTX_PROP(ucd) != 0)
         {
-        if ((require_map[i] & map[i]) != 0)
+        for (int i = 0; i < UCD_MAPSIZE; i++)
           {
-          OK = TRUE;
-          break;
+          if ((require_map[i] & xmap[i]) != 0)
+            {
+            OK = TRUE;
+            break;
+            }
           }
         }
 
@@ -279,15 +285,23 @@ for (;;)
         break;
 
         /* Compute the intersection of the required list of scripts and the
-        allowed scripts for this character. */
+        allowed scripts for this character. Only the scriptx words can have
+        bits other than the character's own script. */
 
         default:
-        for (int i = 0; i < FULL_MAPSIZE; i++) require_map[i] &= map[i];
+          {
+          BOOL keep = own && MAPBIT(require_map, script) != 0;
+          for (int i = 0; i < UCD_MAPSIZE; i++) require_map[i] &= xmap[i];
+          for (int i = UCD_MAPSIZE; i < FULL_MAPSIZE; i++) require_map[i] = 0;
+          if (keep) MAPSET(require_map, script);
+          }
         break;
         }
 
       break;
       }
+
+#undef HAS_SCRIPT
     }   /* End checking character's script and extensions. */
 
   /* The character is in an acceptable script. We must now ensure that all
@@ -298,7 +312,9 @@ for (;;)
   following elements, and then, in ascending order, the code points of the
   '9' characters in every set of 10 digits. Each set is identified by the
   offset in the vector of its '9' character. An initial check of the first
-  value picks up ASCII digits quickly. Otherwise, a binary chop is used. */
+  value picks up ASCII digits quickly. Otherwise, PRIV(ucd_digit_set_blocks)[]
+  gives the first set that ends in or after the digit's block of 256
+  characters, and a short scan finds the digit's own set. */
 
   if (ucd->chartype == ucp_Nd)
     {
@@ -306,19 +322,8 @@ for (;;)
 
     if (c <= PRIV(ucd_digit_sets)[1]) digitset = 1; else
       {
-      int mid;
-      int bot = 1;
-      int top = PRIV(ucd_digit_sets)[0];
-      for (;;)
-        {
-        if (top <= bot + 1)    /* <= rather than == is paranoia */
-          {
-          digitset = top;
-          break;
-          }
-        mid = (top + bot) / 2;
-        if (c <= PRIV(ucd_digit_sets)[mid]) top = mid; else bot = mid;
-        }
+      digitset = PRIV(ucd_digit_set_blocks)[c >> 8];
+      while (c > PRIV(ucd_digit_sets)[digitset]) digitset++;
       }
 
     /* A required value of 0 means "unset". */
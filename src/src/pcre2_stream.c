@@ -0,0 +1,371 @@
+/*************************************************
+*      Perl-Compatible Regular Expressions       *
+*************************************************/
+
+/* PCRE is a library of functions to support regular expressions whose syntax
+and semantics are as close as possible to those of the Perl 5 language.
+
+                       Written by Philip Hazel
+     Original API code Copyright (c) 1997-2012 University of Cambridge
+          New API code Copyright (c) 2016-2024 University of Cambridge
+
+-----------------------------------------------------------------------------
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+    * Redistributions of source code must retain the above copyright notice,
+      this list of conditions and the following disclaimer.
+
+    * Redistributions in binary form must reproduce the above copyright
+      notice, this list of conditions and the following disclaimer in the
+      documentation and/or other materials provided with the distribution.
+
+    * Neither the name of the University of Cambridge nor the names of its
+      contributors may be used to endorse or promote products derived from
+      this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+-----------------------------------------------------------------------------
+*/
+
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include "pcre2_internal.h"
+
+
+
+/*************************************************
+*          Create a stream matching block        *
+*************************************************/
+
+/* The buffer that holds the retained tail of the stream and the newly added
+data follows the stream structure in the same block of memory, so the memory
+that a stream uses is fixed when it is created. Before the start of each new
+search, enough characters are kept for the pattern's longest lookbehind, or at
+least one character, so that assertions such as \b and ^ (in multiline mode) at
+the start of the new data see the character that precedes it. The match data
+block is created from the pattern, so that captured substrings are available to
+the callback.
+
+Arguments:
+  code            points to the compiled expression
+  bufsize         size of the buffer, in code units
+  callback        function called for each match, or NULL
+  callback_data   user data that is passed to the callback
+  gcontext        points to a general context, or NULL
+
+Returns:          pointer to the new stream, or NULL on failure
+*/
+
+PCRE2_EXP_DEFN pcre2_stream * PCRE2_CALL_CONVENTION
+pcre2_stream_create(const pcre2_code *code, PCRE2_SIZE bufsize,
+  int (*callback)(pcre2_match_data *, PCRE2_SIZE, void *),
+  void *callback_data, pcre2_general_context *gcontext)
+{
+pcre2_stream *stream;
+const pcre2_real_code *re = (const pcre2_real_code *)code;
+uint32_t retain;
+
+if (re == NULL || re->magic_number != MAGIC_NUMBER ||
+    (re->flags & PCRE2_MODE_MASK) != PCRE2_CODE_UNIT_WIDTH/8)
+  return NULL;
+
+/* The buffer must be able to hold the retained characters, allowing for up to
+four code units per character in UTF-8, and some new data. */
+
+retain = (re->max_lookbehind > 0)? re->max_lookbehind : 1;
+if (bufsize <= (PCRE2_SIZE)retain * 4 ||
+    bufsize > (PCRE2_SIZE)(~(size_t)0 - sizeof(pcre2_real_stream)) /
+      CU2BYTES(1))
+  return NULL;
+
+if (gcontext == NULL) gcontext = (pcre2_general_context *)code;
+stream = PRIV(memctl_malloc)(sizeof(pcre2_real_stream) + CU2BYTES(bufsize),
+  (pcre2_memctl *)gcontext);
+if (stream == NULL) return NULL;
+
+stream->match_data = pcre2_match_data_create_from_pattern(code, gcontext);
+if (stream->match_data == NULL)
+  {
+  stream->memctl.free(stream, stream->memctl.memory_data);
+  return NULL;
+  }
+
+stream->code = re;
+stream->callback = callback;
+stream->callback_data = callback_data;
+stream->buffer = (PCRE2_UCHAR *)((uint8_t *)stream + sizeof(pcre2_real_stream));
+stream->size = bufsize;
+stream->used = 0;
+stream->offset = 0;
+stream->base = 0;
+stream->retain = retain;
+stream->flags = 0;
+return stream;
+}
+
+
+
+/*************************************************
+*          Free a stream matching block          *
+*************************************************/
+
+PCRE2_EXP_DEFN void PCRE2_CALL_CONVENTION
+pcre2_stream_free(pcre2_stream *stream)
+{
+if (stream != NULL)
+  {
+  pcre2_match_data_free(stream->match_data);
+  stream->memctl.free(stream, stream->memctl.memory_data);
+  }
+}
+
+
+
+/*************************************************
+*     Find the end of the last whole character   *
+*************************************************/
+
+/* The last character in the buffer may be incomplete if a chunk ended in the
+middle of a UTF-8 or UTF-16 character. The pcre2_match() function does not
+accept a truncated character, even when partial matching, so such code units
+are kept in the buffer but excluded from the search until the rest of the
+character arrives. Invalid UTF is left for pcre2_match() to diagnose.
+
+Argument:   the stream block
+Returns:    the length of the buffer without any incomplete last character
+*/
+
+static PCRE2_SIZE
+whole_length(pcre2_stream *stream)
+{
+#if defined SUPPORT_UNICODE && PCRE2_CODE_UNIT_WIDTH != 32
+PCRE2_SIZE end = stream->used;
+PCRE2_SPTR buffer = stream->buffer;
+
+if ((stream->code->overall_options & PCRE2_UTF) == 0 || end == 0)
+  return end;
+
+#if PCRE2_CODE_UNIT_WIDTH == 8
+  {
+  PCRE2_SIZE start = end - 1;
+  uint32_t c;
+
+  while (start > 0 && end - start < 6 && NOT_FIRSTCU(buffer[start])) start--;
+  c = buffer[start];
+  if (c >= 0xc0 && end - start <= PRIV(utf8_table4)[c & 0x3f])
+    return start;
+  }
+#else  /* 16-bit */
+if ((buffer[end - 1] & 0xfc00u) == 0xd800u) return end - 1;
+#endif
+
+return end;
+
+#else  /* No truncation possible */
+return stream->used;
+#endif
+}
+
+
+
+/*************************************************
+*       Search the data held in the buffer       *
+*************************************************/
+
+/* Matches are sought from the current offset until there are no more complete
+matches in the buffer. Each one is passed to the callback, together with the
+stream offset of the start of the buffer. After a partial match (which can only
+happen when PCRE2_PARTIAL_HARD is set) everything from the start of the partial
+match must be kept; after no match, only the new data. The retained characters
+are then moved to the start of the buffer, together with any incomplete final
+character.
+
+Arguments:
+  stream          the stream block
+  options         options for pcre2_match()
+  mcontext        a match context, or NULL
+
+Returns:          >= 0 the number of matches found
+                  < 0 an error code
+*/
+
+static int
+stream_search(pcre2_stream *stream, uint32_t options,
+  pcre2_match_context *mcontext)
+{
+int yield = 0;
+PCRE2_SIZE keep;
+PCRE2_SIZE length = ((options & PCRE2_PARTIAL_HARD) != 0)?
+  whole_length(stream) : stream->used;
+PCRE2_SIZE *ovector = stream->match_data->ovector;
+uint32_t i;
+#ifdef SUPPORT_UNICODE
+BOOL utf = (stream->code->overall_options & PCRE2_UTF) != 0;
+#endif
+
+for (;;)
+  {
+  int rc = pcre2_match((const pcre2_code *)stream->code, stream->buffer,
+    length, stream->offset, options | stream->flags, stream->match_data,
+    mcontext);
+
+  if (rc == PCRE2_ERROR_NOMATCH)
+    {
+    keep = length;
+    break;
+    }
+
+  if (rc == PCRE2_ERROR_PARTIAL)
+    {
+    keep = ovector[0];
+    break;
+    }
+
+  if (rc < 0) return rc;
+
+  /* An empty match must not be found again at the same place. */
+
+  stream->offset = ovector[1];
+  stream->flags = (ovector[0] == ovector[1])? PCRE2_NOTEMPTY_ATSTART : 0;
+  if (yield < INT_MAX) yield++;
+
+  if (stream->callback != NULL)
+    {
+    rc = stream->callback(stream->match_data, stream->base,
+      stream->callback_data);
+    if (rc < 0) return rc;
+    }
+  }
+
+/* Move back over the characters that must be retained for lookbehinds. */
+
+if (keep != stream->offset) stream->flags = 0;
+stream->offset = keep;
+
+for (i = 0; i < stream->retain && keep > 0; i++)
+  {
+  keep--;
+#ifdef SUPPORT_UNICODE
+  if (utf) while (keep > 0 && NOT_FIRSTCU(stream->buffer[keep])) keep--;
+#endif
+  }
+
+if (keep > 0)
+  {
+  stream->used -= keep;
+  stream->offset -= keep;
+  stream->base += keep;
+  memmove(stream->buffer, stream->buffer + keep, CU2BYTES(stream->used));
+  }
+
+return yield;
+}
+
+
+
+/*************************************************
+*          Add a chunk of data to a stream       *
+*************************************************/
+
+/* The chunk is copied into the buffer, in pieces if it does not all fit, and
+each piece is searched with PCRE2_PARTIAL_HARD, so that a match that might
+continue into data that has not yet arrived is held back. If the buffer fills
+up with a partial match, the stream cannot proceed; pcre2_stream_finish() can
+still be called to search what has been retained.
+
+Arguments:
+  stream          the stream block
+  chunk           the new data
+  length          length of the data, or PCRE2_ZERO_TERMINATED
+  options         option bits for pcre2_match()
+  mcontext        a match context, or NULL
+
+Returns:          >= 0 the number of matches found
+                  < 0 an error code
+*/
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_stream_feed(pcre2_stream *stream, PCRE2_SPTR chunk, PCRE2_SIZE length,
+  uint32_t options, pcre2_match_context *mcontext)
+{
+int yield = 0;
+
+if (chunk == NULL && length == 0) return 0;
+if (stream == NULL || chunk == NULL) return PCRE2_ERROR_NULL;
+if ((options & (PCRE2_PARTIAL_HARD|PCRE2_PARTIAL_SOFT)) != 0)
+  return PCRE2_ERROR_BADOPTION;
+if (length == PCRE2_ZERO_TERMINATED) length = PRIV(strlen)(chunk);
+
+while (length > 0)
+  {
+  int rc;
+  PCRE2_SIZE n = stream->size - stream->used;
+
+  if (n == 0) return PCRE2_ERROR_NOMEMORY;
+  if (n > length) n = length;
+  memcpy(stream->buffer + stream->used, chunk, CU2BYTES(n));
+  stream->used += n;
+  chunk += n;
+  length -= n;
+
+  rc = stream_search(stream, options | PCRE2_PARTIAL_HARD, mcontext);
+  if (rc < 0) return rc;
+  yield = (rc > INT_MAX - yield)? INT_MAX : yield + rc;
+  }
+
+return yield;
+}
+
+
+
+/*************************************************
+*           Signal the end of a stream           *
+*************************************************/
+
+/* The retained data is searched without partial matching, because the end of
+the buffer is now the true end of the subject. The stream is then reset so that
+it can be used again.
+
+Arguments:
+  stream          the stream block
+  options         option bits for pcre2_match()
+  mcontext        a match context, or NULL
+
+Returns:          >= 0 the number of matches found
+                  < 0 an error code
+*/
+
+PCRE2_EXP_DEFN int PCRE2_CALL_CONVENTION
+pcre2_stream_finish(pcre2_stream *stream, uint32_t options,
+  pcre2_match_context *mcontext)
+{
+int rc;
+
+if (stream == NULL) return PCRE2_ERROR_NULL;
+if ((options & (PCRE2_PARTIAL_HARD|PCRE2_PARTIAL_SOFT)) != 0)
+  return PCRE2_ERROR_BADOPTION;
+
+rc = stream_search(stream, options, mcontext);
+
+stream->used = 0;
+stream->offset = 0;
+stream->base = 0;
+stream->flags = 0;
+return rc;
+}
+
+/* End of pcre2_stream.c */
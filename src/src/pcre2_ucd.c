@@ -69,6 +69,7 @@ compilers barf at that. Instead, just supply some small dummy tables. */
 
 #ifndef SUPPORT_UNICODE
 const ucd_record PRIV(ucd_records)[] = {{0,0,0,0,0,0,0}};
+const ucd_record PRIV(ucd_latin1_records)[] = {{0,0,0,0,0,0,0}};
 const uint16_t PRIV(ucd_stage1)[] = {0};
 const uint16_t PRIV(ucd_stage2)[] = {0};
 const uint32_t PRIV(ucd_caseless_sets)[] = {0};
@@ -78,7 +79,7 @@ const uint32_t PRIV(ucd_nocase_ranges_size) = 0;
 
 /* Total size: 116564 bytes, block size: 128. */
 
-const char *PRIV(unicode_version) = "16.0.0";
+const char PRIV(unicode_version)[] = "16.0.0";
 
 /* When recompiling tables with a new Unicode version, please check the types
 in this structure definition with those in pcre2_internal.h (the actual field
@@ -95,21 +96,6 @@ uint16_t property_6;
 } ucd_record;
 */
 
-/* If the 32-bit library is run in non-32-bit mode, character values greater
-than 0x10ffff may be encountered. For these we set up a special record. */
-
-#if PCRE2_CODE_UNIT_WIDTH == 32
-const ucd_record PRIV(dummy_ucd_record)[] = {{
-  ucp_Unknown,    /* script */
-  ucp_Cn,         /* type unassigned */
-  ucp_gbOther,    /* grapheme break property */
-  0,              /* case set */
-  0,              /* other case */
-  0 | (ucp_bidiL << UCD_BIDICLASS_SHIFT), /* script extension and bidi class */
-  0,              /* bool properties offset */
-  }};
-#endif
-
 /* This table contains lists of characters that are caseless sets of
 more than one character. Each list is terminated by NOTACHAR. */
 
@@ -157,6 +143,34 @@ the large main UCD tables. */
 
 #ifndef PCRE2_PCRE2TEST
 
+/* The library must be compiled with a PCRE2_UCD_OMIT_xxx macro for each
+column that maint/GenerateUcd.py was told to omit, and no others. */
+
+#if defined PCRE2_UCD_OMIT_SCRIPTS || \
+    defined PCRE2_UCD_OMIT_BIDI || \
+    defined PCRE2_UCD_OMIT_BPROPS
+#error The PCRE2_UCD_OMIT_xxx macros do not match the tables in pcre2_ucd.c
+#endif
+
+#if UCD_RECORD_SIZE != 12
+#error Please correct UCD_RECORD_SIZE in pcre2_internal.h
+#endif
+
+/* If the 32-bit library is run in non-32-bit mode, character values greater
+than 0x10ffff may be encountered. For these we set up a special record. */
+
+#if PCRE2_CODE_UNIT_WIDTH == 32
+const ucd_record PRIV(dummy_ucd_record)[] = {{
+  ucp_Unknown,    /* script */
+  ucp_Cn,         /* type unassigned */
+  ucp_gbOther,    /* grapheme break property */
+  0,              /* case set */
+  0,              /* other case */
+  0 | (ucp_bidiL << UCD_BIDICLASS_SHIFT), /* script extension and bidi class */
+  0,              /* bool properties offset */
+  }};
+#endif
+
 /* This table contains character ranges, where the characters in the range have
 no other case. Both start and end values are excluded from the range. */
 
@@ -204,7 +218,7 @@ const uint32_t PRIV(ucd_nocase_ranges)[] = {
   0xffffffff, 0xffffffff /* terminator */
 };
 
-/* Total: 1110933 characters. */
+/* Total: 1110933 characters in 40 ranges of at least 8, 328 bytes. */
 const uint32_t PRIV(ucd_nocase_ranges_size) = 80;
 
 /* This table lists the code points for the '9' characters in each set of
@@ -225,6 +239,45 @@ const uint32_t PRIV(ucd_digit_sets)[] = {
   0x1e4f9, 0x1e5fa, 0x1e959, 0x1fbf9,
 };
 
+/* This table is indexed by a digit's code point shifted right by 8 bits. It
+holds the offset in ucd_digit_sets of the first set of digits that ends in or
+after that block of 256 characters. */
+
+const uint8_t PRIV(ucd_digit_set_blocks)[] = { /* 512 bytes */
+  1,  2,  2,  2,  2,  2,  2,  4,  5,  5,  7,  9, 11, 13, 15, 17, /* U+0000 */
+ 18, 20, 20, 20, 20, 20, 20, 20, 21, 22, 24, 26, 28, 30, 30, 30, /* U+1000 */
+ 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, /* U+2000 */
+ 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, /* U+3000 */
+ 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, /* U+4000 */
+ 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, /* U+5000 */
+ 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, /* U+6000 */
+ 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, /* U+7000 */
+ 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, /* U+8000 */
+ 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, 30, /* U+9000 */
+ 30, 30, 30, 30, 30, 30, 30, 31, 31, 32, 35, 36, 37, 37, 37, 37, /* U+A000 */
+ 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, /* U+B000 */
+ 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, /* U+C000 */
+ 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, /* U+D000 */
+ 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, /* U+E000 */
+ 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, 37, /* U+F000 */
+ 38, 38, 38, 38, 38, 39, 39, 39, 39, 39, 39, 39, 39, 39, 41, 41, /* U+10000 */
+ 41, 43, 45, 46, 46, 48, 48, 52, 53, 54, 55, 55, 56, 57, 59, 59, /* U+11000 */
+ 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, /* U+12000 */
+ 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, /* U+13000 */
+ 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, /* U+14000 */
+ 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, 60, /* U+15000 */
+ 60, 60, 61, 61, 61, 61, 61, 61, 61, 61, 61, 63, 64, 64, 65, 65, /* U+16000 */
+ 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, /* U+17000 */
+ 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, /* U+18000 */
+ 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, /* U+19000 */
+ 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, /* U+1A000 */
+ 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, /* U+1B000 */
+ 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 65, 66, 66, 66, /* U+1C000 */
+ 66, 66, 66, 66, 66, 66, 66, 66, 71, 71, 71, 71, 71, 71, 71, 71, /* U+1D000 */
+ 71, 71, 72, 73, 73, 74, 75, 75, 75, 75, 76, 76, 76, 76, 76, 76, /* U+1E000 */
+ 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, 76, /* U+1F000 */
+};
+
 /* This vector is a list of script bitsets for the Script Extension property.
 The number of 32-bit words in each bitset is #defined in pcre2_ucp.h as
 ucd_script_sets_item_size. */
@@ -542,6 +595,3557 @@ const uint32_t PRIV(ucd_boolprop_sets)[] = {
  0x01022020u, 0x00000008u,
 };
 
+/* These tables list the code points that have each script, general category
+(character type), and Boolean property, as sorted ranges. Each entry holds the
+first code point of a range in its top 21 bits and the length of the range less
+one in its bottom 11 bits; see UCD_RANGE_START() and UCD_RANGE_END() in
+pcre2_internal.h. The ranges for value n of a property are those from index[n]
+up to index[n+1], using the table's index table. */
+
+const uint32_t PRIV(ucd_script_ranges)[] = {
+  /* Latin */
+  0x00020819, 0x00030819, 0x00055000, 0x0005d000, 0x00060016, 0x0006c01e,
+  0x0007c1c0, 0x00170004, 0x00e80025, 0x00e96030, 0x00eb1003, 0x00eb580c,
+  0x00ebc845, 0x00f000ff, 0x01038800, 0x0103f800, 0x0104800c, 0x01095001,
+  0x01099000, 0x010a7000, 0x010b0028, 0x0163001f, 0x05391065, 0x053c5842,
+  0x053e8001, 0x053e9800, 0x053ea807, 0x053f900d, 0x0559802a, 0x055ae008,
+  0x055b3003, 0x07d80006, 0x07f90819, 0x07fa0819, 0x083c0005, 0x083c3829,
+  0x083d9008, 0x0ef8001e, 0x0ef92805,
+  /* Greek */
+  0x001b8003, 0x001ba802, 0x001bd003, 0x001bf800, 0x001c2000, 0x001c3000,
+  0x001c4002, 0x001c6000, 0x001c7013, 0x001d183e, 0x001f800f, 0x00e93004,
+  0x00eae804, 0x00eb3004, 0x00edf800, 0x00f80015, 0x00f8c005, 0x00f90025,
+  0x00fa4005, 0x00fa8007, 0x00fac800, 0x00fad800, 0x00fae800, 0x00faf81e,
+  0x00fc0034, 0x00fdb00e, 0x00fe300d, 0x00feb005, 0x00fee812, 0x00ff9002,
+  0x00ffb008, 0x01093000, 0x055b2800, 0x080a004e, 0x080d0000, 0x0e900045,
+  /* Cyrillic */
+  0x00200084, 0x002438a8, 0x00e4000a, 0x00e95800, 0x00ebc000, 0x016f001f,
+  0x0532005f, 0x07f17001, 0x0f01803d, 0x0f047800,
+  /* Armenian */
+  0x00298825, 0x002ac831, 0x002c6802, 0x07d89804,
+  /* Hebrew */
+  0x002c8836, 0x002e801a, 0x002f7805, 0x07d8e819, 0x07d9c004, 0x07d9f000,
+  0x07da0001, 0x07da1801, 0x07da3009,
+  /* Arabic */
+  0x00300004, 0x00303005, 0x0030680d, 0x0030e002, 0x0031001f, 0x00320809,
+  0x0032b019, 0x0033886b, 0x0036f021, 0x003a802f, 0x0043801e, 0x00448001,
+  0x0044b84a, 0x0047181c, 0x07da8072, 0x07de996a, 0x07ea004f, 0x07ec9035,
+  0x07ee7800, 0x07ef800f, 0x07f38004, 0x07f3b086, 0x0873001e, 0x08761002,
+  0x0877e003, 0x0f700003, 0x0f70281a, 0x0f710801, 0x0f712000, 0x0f713800,
+  0x0f714809, 0x0f71a003, 0x0f71c800, 0x0f71d800, 0x0f721000, 0x0f723800,
+  0x0f724800, 0x0f725800, 0x0f726802, 0x0f728801, 0x0f72a000, 0x0f72b800,
+  0x0f72c800, 0x0f72d800, 0x0f72e800, 0x0f72f800, 0x0f730801, 0x0f732000,
+  0x0f733803, 0x0f736006, 0x0f73a003, 0x0f73c803, 0x0f73f000, 0x0f740009,
+  0x0f745810, 0x0f750802, 0x0f752804, 0x0f755810, 0x0f778001,
+  /* Syriac */
+  0x0038000d, 0x0038783b, 0x003a6802, 0x0043000a,
+  /* Thaana */
+  0x003c0031,
+  /* Devanagari */
+  0x00480050, 0x004aa80e, 0x004b3019, 0x0547001f, 0x08d80009,
+  /* Bengali */
+  0x004c0003, 0x004c2807, 0x004c7801, 0x004c9815, 0x004d5006, 0x004d9000,
+  0x004db003, 0x004de008, 0x004e3801, 0x004e5803, 0x004eb800, 0x004ee001,
+  0x004ef804, 0x004f3018,
+  /* Gurmukhi */
+  0x00500802, 0x00502805, 0x00507801, 0x00509815, 0x00515006, 0x00519001,
+  0x0051a801, 0x0051c001, 0x0051e000, 0x0051f004, 0x00523801, 0x00525802,
+  0x00528800, 0x0052c803, 0x0052f000, 0x00533010,
+  /* Gujarati */
+  0x00540802, 0x00542808, 0x00547802, 0x00549815, 0x00555006, 0x00559001,
+  0x0055a804, 0x0055e009, 0x00563802, 0x00565802, 0x00568000, 0x00570003,
+  0x0057300b, 0x0057c806,
+  /* Oriya */
+  0x00580802, 0x00582807, 0x00587801, 0x00589815, 0x00595006, 0x00599001,
+  0x0059a804, 0x0059e008, 0x005a3801, 0x005a5802, 0x005aa802, 0x005ae001,
+  0x005af804, 0x005b3011,
+  /* Tamil */
+  0x005c1001, 0x005c2805, 0x005c7002, 0x005c9003, 0x005cc801, 0x005ce000,
+  0x005cf001, 0x005d1801, 0x005d4002, 0x005d700b, 0x005df004, 0x005e3002,
+  0x005e5003, 0x005e8000, 0x005eb800, 0x005f3014, 0x08fe0031, 0x08fff800,
+  /* Telugu */
+  0x0060000c, 0x00607002, 0x00609016, 0x0061500f, 0x0061e008, 0x00623002,
+  0x00625003, 0x0062a801, 0x0062c002, 0x0062e800, 0x00630003, 0x00633009,
+  0x0063b808,
+  /* Kannada */
+  0x0064000c, 0x00647002, 0x00649016, 0x00655009, 0x0065a804, 0x0065e008,
+  0x00663002, 0x00665003, 0x0066a801, 0x0066e801, 0x00670003, 0x00673009,
+  0x00678802,
+  /* Malayalam */
+  0x0068000c, 0x00687002, 0x00689032, 0x006a3002, 0x006a5005, 0x006aa00f,
+  0x006b3019,
+  /* Sinhala */
+  0x006c0802, 0x006c2811, 0x006cd017, 0x006d9808, 0x006de800, 0x006e0006,
+  0x006e5000, 0x006e7805, 0x006eb000, 0x006ec007, 0x006f3009, 0x006f9002,
+  0x088f0813,
+  /* Thai */
+  0x00700839, 0x0072001b,
+  /* Tibetan */
+  0x00780047, 0x007a4823, 0x007b8826, 0x007cc823, 0x007df00e, 0x007e7006,
+  0x007ec801,
+  /* Myanmar */
+  0x0080009f, 0x054f001e, 0x0553001f, 0x08b68013,
+  /* Georgian */
+  0x00850025, 0x00863800, 0x00866800, 0x0086802a, 0x0087e003, 0x00e4802a,
+  0x00e5e802, 0x01680025, 0x01693800, 0x01696800,
+  /* Hangul */
+  0x008800ff, 0x01817001, 0x0189885d, 0x0190001e, 0x0193001e, 0x054b001c,
+  0x056007ff, 0x05a007ff, 0x05e007ff, 0x062007ff, 0x066007ff, 0x06a003a3,
+  0x06bd8016, 0x06be5830, 0x07fd001e, 0x07fe1005, 0x07fe5005, 0x07fe9005,
+  0x07fed002,
+  /* Ethiopic */
+  0x00900048, 0x00925003, 0x00928006, 0x0092c000, 0x0092d003, 0x00930028,
+  0x00945003, 0x00948020, 0x00959003, 0x0095c006, 0x00960000, 0x00961003,
+  0x0096400e, 0x0096c038, 0x00989003, 0x0098c042, 0x009ae81f, 0x009c0019,
+  0x016c0016, 0x016d0006, 0x016d4006, 0x016d8006, 0x016dc006, 0x016e0006,
+  0x016e4006, 0x016e8006, 0x016ec006, 0x05580805, 0x05584805, 0x05588805,
+  0x05590006, 0x05594006, 0x0f3f0006, 0x0f3f4003, 0x0f3f6801, 0x0f3f800e,
+  /* Cherokee */
+  0x009d0055, 0x009fc005, 0x055b804f,
+  /* Runic */
+  0x00b5004a, 0x00b7700a,
+  /* Mongolian */
+  0x00c00001, 0x00c02000, 0x00c03013, 0x00c10058, 0x00c4002a, 0x08b3000c,
+  /* Hiragana */
+  0x01820855, 0x0184e802, 0x0d80091e, 0x0d899000, 0x0d8a8002, 0x0f900000,
+  /* Katakana */
+  0x01850859, 0x0187e802, 0x018f800f, 0x0196802e, 0x01980057, 0x07fb3009,
+  0x07fb882c, 0x0d7f8003, 0x0d7fa806, 0x0d7fe801, 0x0d800000, 0x0d890002,
+  0x0d8aa800, 0x0d8b2003,
+  /* Bopomofo */
+  0x00175001, 0x0188282a, 0x018d001f,
+  /* Han */
+  0x01740019, 0x0174d858, 0x017800d5, 0x01802800, 0x01803800, 0x01810808,
+  0x0181c003, 0x01a007ff, 0x01e007ff, 0x022007ff, 0x026001bf, 0x027007ff,
+  0x02b007ff, 0x02f007ff, 0x033007ff, 0x037007ff, 0x03b007ff, 0x03f007ff,
+  0x043007ff, 0x047007ff, 0x04b007ff, 0x04f001ff, 0x07c8016d, 0x07d38069,
+  0x0b7f1001, 0x0b7f8001, 0x100007ff, 0x104007ff, 0x108007ff, 0x10c007ff,
+  0x110007ff, 0x114007ff, 0x118007ff, 0x11c007ff, 0x120007ff, 0x124007ff,
+  0x128007ff, 0x12c007ff, 0x130007ff, 0x134007ff, 0x138007ff, 0x13c007ff,
+  0x140007ff, 0x144007ff, 0x148007ff, 0x14c007ff, 0x150006df, 0x153807ff,
+  0x157807ff, 0x15b80039, 0x15ba00dd, 0x15c107ff, 0x160107ff, 0x16410681,
+  0x167587ff, 0x16b587ff, 0x16f587ff, 0x17358530, 0x175f826d, 0x17c0021d,
+  0x180007ff, 0x184007ff, 0x1880034a, 0x189a87ff, 0x18da87ff, 0x191a805f,
+  /* Yi */
+  0x0500048c, 0x05248036,
+  /* Gothic */
+  0x0819801a,
+  /* Tagalog */
+  0x00b80015, 0x00b8f800,
+  /* Hanunoo */
+  0x00b90014,
+  /* Buhid */
+  0x00ba0013,
+  /* Tagbanwa */
+  0x00bb000c, 0x00bb7002, 0x00bb9001,
+  /* Limbu */
+  0x00c8001e, 0x00c9000b, 0x00c9800b, 0x00ca0000, 0x00ca200b,
+  /* Tai_Le */
+  0x00ca801d, 0x00cb8004,
+  /* Linear_B */
+  0x0800000b, 0x08006819, 0x08014012, 0x0801e001, 0x0801f80e, 0x0802800d,
+  0x0804007a,
+  /* Shavian */
+  0x0822802f,
+  /* Cypriot */
+  0x08400005, 0x08404000, 0x0840502b, 0x0841b801, 0x0841e000, 0x0841f800,
+  /* Buginese */
+  0x00d0001b, 0x00d0f001,
+  /* Coptic */
+  0x001f100d, 0x01640073, 0x0167c806,
+  /* Glagolitic */
+  0x0160005f, 0x0f000006, 0x0f004010, 0x0f00d806, 0x0f011801, 0x0f013004,
+  /* Tifinagh */
+  0x01698037, 0x016b7801, 0x016bf800,
+  /* Syloti_Nagri */
+  0x0540002c,
+  /* Phags_Pa */
+  0x05420037,
+  /* Nko */
+  0x003e003a, 0x003fe802,
+  /* Kayah_Li */
+  0x0548002d, 0x05497800,
+  /* Lycian */
+  0x0814001c,
+  /* Carian */
+  0x08150030,
+  /* Lydian */
+  0x08490019, 0x0849f800,
+  /* Avestan */
+  0x08580035, 0x0859c806,
+  /* Samaritan */
+  0x0040002d, 0x0041800e,
+  /* Lisu */
+  0x0526802f, 0x08fd8000,
+  /* Javanese */
+  0x054c004d, 0x054e8009, 0x054ef001,
+  /* Old_Turkic */
+  0x08600048,
+  /* Kaithi */
+  0x08840042, 0x08866800,
+  /* Mandaic */
+  0x0042001b, 0x0042f000,
+  /* Chakma */
+  0x08880034, 0x0889b011,
+  /* Meroitic_Hieroglyphs */
+  0x084c001f,
+  /* Sharada */
+  0x088c005f,
+  /* Takri */
+  0x08b40039, 0x08b60009,
+  /* Caucasian_Albanian */
+  0x08298033, 0x082b7800,
+  /* Duployan */
+  0x0de0006a, 0x0de3800c, 0x0de40008, 0x0de48009, 0x0de4e003,
+  /* Elbasan */
+  0x08280027,
+  /* Grantha */
+  0x08980003, 0x08982807, 0x08987801, 0x08989815, 0x08995006, 0x08999001,
+  0x0899a804, 0x0899e008, 0x089a3801, 0x089a5802, 0x089a8000, 0x089ab800,
+  0x089ae806, 0x089b3006, 0x089b8004,
+  /* Khojki */
+  0x08900011, 0x0890982e,
+  /* Linear_A */
+  0x08300136, 0x083a0015, 0x083b0007,
+  /* Mahajani */
+  0x088a8026,
+  /* Manichaean */
+  0x08560026, 0x0857580b,
+  /* Modi */
+  0x08b00044, 0x08b28009,
+  /* Old_Permic */
+  0x081a802a,
+  /* Psalter_Pahlavi */
+  0x085c0011, 0x085cc803, 0x085d4806,
+  /* Khudawadi */
+  0x0895803a, 0x08978009,
+  /* Tirhuta */
+  0x08a40047, 0x08a68009,
+  /* Multani */
+  0x08940006, 0x08944000, 0x08945003, 0x0894780e, 0x0894f80a,
+  /* Old_Hungarian */
+  0x08640032, 0x08660032, 0x0867d005,
+  /* Adlam */
+  0x0f48004b, 0x0f4a8009, 0x0f4af001,
+  /* Osage */
+  0x08258023, 0x0826c023,
+  /* Tangut */
+  0x0b7f0000, 0x0b8007ff, 0x0bc007ff, 0x0c0007f7, 0x0c4002ff, 0x0c680008,
+  /* Masaram_Gondi */
+  0x08e80006, 0x08e84001, 0x08e8582b, 0x08e9d000, 0x08e9e001, 0x08e9f808,
+  0x08ea8009,
+  /* Dogra */
+  0x08c0003b,
+  /* Gunjala_Gondi */
+  0x08eb0005, 0x08eb3801, 0x08eb5024, 0x08ec8001, 0x08ec9805, 0x08ed0009,
+  /* Hanifi_Rohingya */
+  0x08680027, 0x08698009,
+  /* Sogdian */
+  0x08798029,
+  /* Nandinagari */
+  0x08cd0007, 0x08cd502d, 0x08ced00a,
+  /* Yezidi */
+  0x08740029, 0x08755802, 0x08758001,
+  /* Cypro_Minoan */
+  0x097c8062,
+  /* Old_Uyghur */
+  0x087b8019,
+  /* Toto */
+  0x0f14801e,
+  /* Garay */
+  0x086a0025, 0x086b481c, 0x086c7001,
+  /* Gurung_Khema */
+  0x0b080039,
+  /* Ol_Onal */
+  0x0f2e802a, 0x0f2ff800,
+  /* Sunuwar */
+  0x08de0021, 0x08df8009,
+  /* Todhri */
+  0x082e0033,
+  /* Tulu_Tigalari */
+  0x089c0009, 0x089c5800, 0x089c7000, 0x089c8025, 0x089db809, 0x089e1000,
+  0x089e2800, 0x089e3803, 0x089e6009, 0x089eb801, 0x089f0801,
+  /* Unknown */
+  0x001bc001, 0x001c0003, 0x001c5800, 0x001c6800, 0x001d1000, 0x00298000,
+  0x002ab801, 0x002c5801, 0x002c8000, 0x002e4007, 0x002f5803, 0x002fa80a,
+  0x00387000, 0x003a5801, 0x003d900d, 0x003fd801, 0x00417001, 0x0041f800,
+  0x0042e001, 0x0042f800, 0x00435804, 0x00447800, 0x00449004, 0x004c2000,
+  0x004c6801, 0x004c8801, 0x004d4800, 0x004d8800, 0x004d9802, 0x004dd001,
+  0x004e2801, 0x004e4801, 0x004e7807, 0x004ec003, 0x004ef000, 0x004f2001,
+  0x004ff801, 0x00502000, 0x00505803, 0x00508801, 0x00514800, 0x00518800,
+  0x0051a000, 0x0051b800, 0x0051d001, 0x0051e800, 0x00521803, 0x00524801,
+  0x00527002, 0x00529006, 0x0052e800, 0x0052f806, 0x0053b809, 0x00542000,
+  0x00547000, 0x00549000, 0x00554800, 0x00558800, 0x0055a000, 0x0055d001,
+  0x00563000, 0x00565000, 0x00567001, 0x0056880e, 0x00572001, 0x00579006,
+  0x00580000, 0x00582000, 0x00586801, 0x00588801, 0x00594800, 0x00598800,
+  0x0059a000, 0x0059d001, 0x005a2801, 0x005a4801, 0x005a7006, 0x005ac003,
+  0x005af000, 0x005b2001, 0x005bc009, 0x005c2000, 0x005c5802, 0x005c8800,
+  0x005cb002, 0x005cd800, 0x005ce800, 0x005d0002, 0x005d2802, 0x005d5802,
+  0x005dd003, 0x005e1802, 0x005e4800, 0x005e7001, 0x005e8805, 0x005ec00d,
+  0x005fd804, 0x00606800, 0x00608800, 0x00614800, 0x0061d001, 0x00622800,
+  0x00624800, 0x00627006, 0x0062b800, 0x0062d801, 0x0062f001, 0x00632001,
+  0x00638006, 0x00646800, 0x00648800, 0x00654800, 0x0065a000, 0x0065d001,
+  0x00662800, 0x00664800, 0x00667006, 0x0066b805, 0x0066f800, 0x00672001,
+  0x00678000, 0x0067a00b, 0x00686800, 0x00688800, 0x006a2800, 0x006a4800,
+  0x006a8003, 0x006b2001, 0x006c0000, 0x006c2000, 0x006cb802, 0x006d9000,
+  0x006de000, 0x006df001, 0x006e3802, 0x006e5803, 0x006ea800, 0x006eb800,
+  0x006f0005, 0x006f8001, 0x006fa80b, 0x0071d803, 0x0072e024, 0x00741800,
+  0x00742800, 0x00745800, 0x00752000, 0x00753000, 0x0075f001, 0x00762800,
+  0x00763800, 0x00767800, 0x0076d001, 0x0077001f, 0x007a4000, 0x007b6803,
+  0x007cc000, 0x007de800, 0x007e6800, 0x007ed824, 0x00863000, 0x00864004,
+  0x00867001, 0x00924800, 0x00927001, 0x0092b800, 0x0092c800, 0x0092f001,
+  0x00944800, 0x00947001, 0x00958800, 0x0095b001, 0x0095f800, 0x00960800,
+  0x00963001, 0x0096b800, 0x00988800, 0x0098b001, 0x009ad801, 0x009be802,
+  0x009cd005, 0x009fb001, 0x009ff001, 0x00b4e802, 0x00b7c806, 0x00b8b008,
+  0x00b9b808, 0x00baa00b, 0x00bb6800, 0x00bb8800, 0x00bba00b, 0x00bef001,
+  0x00bf5005, 0x00bfd005, 0x00c0d005, 0x00c3c806, 0x00c55804, 0x00c7b009,
+  0x00c8f800, 0x00c96003, 0x00c9e003, 0x00ca0802, 0x00cb7001, 0x00cba80a,
+  0x00cd6003, 0x00ce5005, 0x00ced802, 0x00d0e001, 0x00d2f800, 0x00d3e801,
+  0x00d45005, 0x00d4d005, 0x00d57001, 0x00d67830, 0x00da6800, 0x00dfa007,
+  0x00e1c002, 0x00e25002, 0x00e45804, 0x00e5d801, 0x00e64007, 0x00e7d804,
+  0x00f8b001, 0x00f8f001, 0x00fa3001, 0x00fa7001, 0x00fac000, 0x00fad000,
+  0x00fae000, 0x00faf000, 0x00fbf001, 0x00fda800, 0x00fe2800, 0x00fea001,
+  0x00fee000, 0x00ff8001, 0x00ffa800, 0x00fff800, 0x01032800, 0x01039001,
+  0x01047800, 0x0104e802, 0x0106080e, 0x0107880e, 0x010c6003, 0x01215015,
+  0x01225814, 0x015ba001, 0x015cb000, 0x0167a004, 0x01693000, 0x01694004,
+  0x01697001, 0x016b4006, 0x016b880d, 0x016cb808, 0x016d3800, 0x016d7800,
+  0x016db800, 0x016df800, 0x016e3800, 0x016e7800, 0x016eb800, 0x016ef800,
+  0x0172f021, 0x0174d000, 0x0177a00b, 0x017eb019, 0x01820000, 0x0184b801,
+  0x01880004, 0x01898000, 0x018c7800, 0x018f3008, 0x0190f800, 0x05246802,
+  0x05263808, 0x05316013, 0x0537c007, 0x053e7001, 0x053e9000, 0x053ea000,
+  0x053ee814, 0x05416802, 0x0541d005, 0x0543c007, 0x05463007, 0x0546d005,
+  0x054aa00a, 0x054be802, 0x054e7000, 0x054ed003, 0x054ff800, 0x0551b808,
+  0x05527001, 0x0552d001, 0x05561817, 0x0557b809, 0x05583801, 0x05587801,
+  0x0558b808, 0x05593800, 0x05597800, 0x055b6003, 0x055f7001, 0x055fd005,
+  0x06bd200b, 0x06be3803, 0x06bfe7ff, 0x06ffe7ff, 0x073fe7ff, 0x077fe7ff,
+  0x07bfe103, 0x07d37001, 0x07d6d025, 0x07d8380b, 0x07d8c004, 0x07d9b800,
+  0x07d9e800, 0x07d9f800, 0x07da1000, 0x07da2800, 0x07de180f, 0x07ec8001,
+  0x07ee4006, 0x07ee801f, 0x07f0d005, 0x07f29800, 0x07f33800, 0x07f36003,
+  0x07f3a800, 0x07f7e801, 0x07f80000, 0x07fdf802, 0x07fe4001, 0x07fe8001,
+  0x07fec001, 0x07fee802, 0x07ff3800, 0x07ff7809, 0x07fff001, 0x08006000,
+  0x08013800, 0x0801d800, 0x0801f000, 0x08027001, 0x0802f021, 0x0807d804,
+  0x08081803, 0x0809a002, 0x080c7800, 0x080ce802, 0x080d082e, 0x080ff081,
+  0x0814e802, 0x0816880e, 0x0817e003, 0x08192008, 0x081a5804, 0x081bd804,
+  0x081cf000, 0x081e2003, 0x081eb029, 0x0824f001, 0x08255005, 0x0826a003,
+  0x0827e003, 0x08294007, 0x082b200a, 0x082bd800, 0x082c5800, 0x082c9800,
+  0x082cb000, 0x082d1000, 0x082d9000, 0x082dd000, 0x082de802, 0x082fa00b,
+  0x0839b808, 0x083ab009, 0x083b4017, 0x083c3000, 0x083d8800, 0x083dd844,
+  0x08403001, 0x08404800, 0x0841b000, 0x0841c802, 0x0841e801, 0x0842b000,
+  0x0844f807, 0x0845802f, 0x08479800, 0x0847b004, 0x0848e002, 0x0849d004,
+  0x084a003f, 0x084dc003, 0x084e8001, 0x08502000, 0x08503804, 0x0850a000,
+  0x0850c000, 0x0851b001, 0x0851d803, 0x08524806, 0x0852c806, 0x0855001f,
+  0x08573803, 0x0857b808, 0x0859b002, 0x085ab001, 0x085b9804, 0x085c9006,
+  0x085ce80b, 0x085d804f, 0x08624836, 0x0865980c, 0x08679806, 0x08694007,
+  0x0869d005, 0x086b3002, 0x086c3007, 0x086c80cf, 0x0873f800, 0x08755000,
+  0x08757001, 0x0875900f, 0x08762836, 0x08794007, 0x087ad015, 0x087c5025,
+  0x087e6013, 0x087fb808, 0x08827003, 0x0883b008, 0x08861809, 0x08867001,
+  0x08874806, 0x0887d005, 0x0889a800, 0x088a4007, 0x088bb808, 0x088f0000,
+  0x088fa80a, 0x08909000, 0x0892103d, 0x08943800, 0x08944800, 0x08947000,
+  0x0894f000, 0x08955005, 0x08975804, 0x0897d005, 0x08982000, 0x08986801,
+  0x08988801, 0x08994800, 0x08998800, 0x0899a000, 0x0899d000, 0x089a2801,
+  0x089a4801, 0x089a7001, 0x089a8805, 0x089ac004, 0x089b2001, 0x089b6802,
+  0x089ba80a, 0x089c5000, 0x089c6001, 0x089c7800, 0x089db000, 0x089e0800,
+  0x089e1801, 0x089e3000, 0x089e5800, 0x089eb000, 0x089ec807, 0x089f181c,
+  0x08a2e000, 0x08a3101d, 0x08a64007, 0x08a6d0a5, 0x08adb001, 0x08aef021,
+  0x08b2280a, 0x08b2d005, 0x08b36812, 0x08b5d005, 0x08b65005, 0x08b7201b,
+  0x08b8d801, 0x08b96003, 0x08ba38b8, 0x08c1e063, 0x08c7980b, 0x08c83801,
+  0x08c85001, 0x08c8a000, 0x08c8b800, 0x08c9b000, 0x08c9c801, 0x08ca3808,
+  0x08cad045, 0x08cd4001, 0x08cec001, 0x08cf281a, 0x08d24007, 0x08d5180c,
+  0x08d7c806, 0x08d850b5, 0x08df100d, 0x08dfd005, 0x08e04800, 0x08e1b800,
+  0x08e23009, 0x08e36802, 0x08e48001, 0x08e54000, 0x08e5b848, 0x08e83800,
+  0x08e85000, 0x08e9b802, 0x08e9d800, 0x08e9f000, 0x08ea4007, 0x08ead005,
+  0x08eb3000, 0x08eb4800, 0x08ec7800, 0x08ec9000, 0x08ecc806, 0x08ed5135,
+  0x08f7c806, 0x08f88800, 0x08f9d802, 0x08fad854, 0x08fd880e, 0x08ff900c,
+  0x091cd065, 0x09237800, 0x0923a80a, 0x092a27ff, 0x096a224b, 0x097f980c,
+  0x09a2b009, 0x0a1fd804, 0x0a323fff, 0x0a723fff, 0x0ab23fff, 0x0af23ab8,
+  0x0b09d6c5, 0x0b51c806, 0x0b52f800, 0x0b535003, 0x0b55f800, 0x0b565005,
+  0x0b577001, 0x0b57b009, 0x0b5a3009, 0x0b5ad000, 0x0b5b1000, 0x0b5bc004,
+  0x0b5c81af, 0x0b6bd0c5, 0x0b74d864, 0x0b7a5803, 0x0b7c4006, 0x0b7d003f,
+  0x0b7f280a, 0x0b7f900d, 0x0c3fc007, 0x0c66b028, 0x0c684fff, 0x0ca84fff,
+  0x0ce84fff, 0x0d284fff, 0x0d684ae6, 0x0d7fa000, 0x0d7fe000, 0x0d7ff800,
+  0x0d89180e, 0x0d89981c, 0x0d8a9801, 0x0d8ab00d, 0x0d8b4007, 0x0d97e7ff,
+  0x0dd7e103, 0x0de35804, 0x0de3e802, 0x0de44806, 0x0de4d001, 0x0de527ff,
+  0x0e25275b, 0x0e67d005, 0x0e75a04b, 0x0e797001, 0x0e7a3808, 0x0e7e203b,
+  0x0e87b009, 0x0e893801, 0x0e8f5814, 0x0e923079, 0x0e96a00b, 0x0e97a00b,
+  0x0e9ab808, 0x0e9bc886, 0x0ea2a800, 0x0ea4e800, 0x0ea50001, 0x0ea51801,
+  0x0ea53801, 0x0ea56800, 0x0ea5d000, 0x0ea5e000, 0x0ea62000, 0x0ea83000,
+  0x0ea85801, 0x0ea8a800, 0x0ea8e800, 0x0ea9d000, 0x0ea9f800, 0x0eaa2800,
+  0x0eaa3802, 0x0eaa8800, 0x0eb53001, 0x0ebe6001, 0x0ed4600e, 0x0ed50000,
+  0x0ed5844f, 0x0ef8f805, 0x0ef958d4, 0x0f003800, 0x0f00c801, 0x0f011000,
+  0x0f012800, 0x0f015804, 0x0f037020, 0x0f04806f, 0x0f096802, 0x0f09f001,
+  0x0f0a5003, 0x0f0a813f, 0x0f157810, 0x0f17d004, 0x0f1801cf, 0x0f27d0d5,
+  0x0f2fd803, 0x0f3001df, 0x0f3f3800, 0x0f3f6000, 0x0f3f7800, 0x0f3ff800,
+  0x0f462801, 0x0f46b828, 0x0f4a6003, 0x0f4ad003, 0x0f4b0310, 0x0f65a84b,
+  0x0f69f0c1, 0x0f702000, 0x0f710000, 0x0f711800, 0x0f712801, 0x0f714000,
+  0x0f719800, 0x0f71c000, 0x0f71d000, 0x0f71e005, 0x0f721803, 0x0f724000,
+  0x0f725000, 0x0f726000, 0x0f728000, 0x0f729800, 0x0f72a801, 0x0f72c000,
+  0x0f72d000, 0x0f72e000, 0x0f72f000, 0x0f730000, 0x0f731800, 0x0f732801,
+  0x0f735800, 0x0f739800, 0x0f73c000, 0x0f73e800, 0x0f73f800, 0x0f745000,
+  0x0f74e004, 0x0f752000, 0x0f755000, 0x0f75e033, 0x0f77910d, 0x0f816003,
+  0x0f84a00b, 0x0f857801, 0x0f860000, 0x0f868000, 0x0f87b009, 0x0f8d7037,
+  0x0f90180c, 0x0f91e003, 0x0f924806, 0x0f92900d, 0x0f933099, 0x0fb6c003,
+  0x0fb76802, 0x0fb7e802, 0x0fbbb803, 0x0fbed005, 0x0fbf6003, 0x0fbf880e,
+  0x0fc06003, 0x0fc24007, 0x0fc2d005, 0x0fc44007, 0x0fc57001, 0x0fc5e003,
+  0x0fc6103d, 0x0fd2a00b, 0x0fd37001, 0x0fd3e802, 0x0fd45004, 0x0fd63806,
+  0x0fd6e801, 0x0fd75005, 0x0fd7c806, 0x0fdc9800, 0x0fdfd405, 0x1537001f,
+  0x15b9d005, 0x15c0f001, 0x1675100d, 0x175f080e, 0x1772f7ff, 0x17b2f1a1,
+  0x17d0f5e1, 0x189a5804, 0x191d87ff, 0x195d87ff, 0x199d87ff, 0x19dd87ff,
+  0x1a1d87ff, 0x1a5d87ff, 0x1a9d87ff, 0x1add87ff, 0x1b1d87ff, 0x1b5d87ff,
+  0x1b9d87ff, 0x1bdd87ff, 0x1c1d87ff, 0x1c5d87ff, 0x1c9d87ff, 0x1cdd87ff,
+  0x1d1d87ff, 0x1d5d87ff, 0x1d9d87ff, 0x1ddd87ff, 0x1e1d87ff, 0x1e5d87ff,
+  0x1e9d87ff, 0x1edd87ff, 0x1f1d87ff, 0x1f5d87ff, 0x1f9d87ff, 0x1fdd87ff,
+  0x201d87ff, 0x205d87ff, 0x209d87ff, 0x20dd87ff, 0x211d87ff, 0x215d87ff,
+  0x219d87ff, 0x21dd87ff, 0x221d87ff, 0x225d87ff, 0x229d87ff, 0x22dd87ff,
+  0x231d87ff, 0x235d87ff, 0x239d87ff, 0x23dd87ff, 0x241d87ff, 0x245d87ff,
+  0x249d87ff, 0x24dd87ff, 0x251d87ff, 0x255d87ff, 0x259d87ff, 0x25dd87ff,
+  0x261d87ff, 0x265d87ff, 0x269d87ff, 0x26dd87ff, 0x271d87ff, 0x275d87ff,
+  0x279d87ff, 0x27dd87ff, 0x281d87ff, 0x285d87ff, 0x289d87ff, 0x28dd87ff,
+  0x291d87ff, 0x295d87ff, 0x299d87ff, 0x29dd87ff, 0x2a1d87ff, 0x2a5d87ff,
+  0x2a9d87ff, 0x2add87ff, 0x2b1d87ff, 0x2b5d87ff, 0x2b9d87ff, 0x2bdd87ff,
+  0x2c1d87ff, 0x2c5d87ff, 0x2c9d87ff, 0x2cdd87ff, 0x2d1d87ff, 0x2d5d87ff,
+  0x2d9d87ff, 0x2ddd87ff, 0x2e1d87ff, 0x2e5d87ff, 0x2e9d87ff, 0x2edd87ff,
+  0x2f1d87ff, 0x2f5d87ff, 0x2f9d87ff, 0x2fdd87ff, 0x301d87ff, 0x305d87ff,
+  0x309d87ff, 0x30dd87ff, 0x311d87ff, 0x315d87ff, 0x319d87ff, 0x31dd87ff,
+  0x321d87ff, 0x325d87ff, 0x329d87ff, 0x32dd87ff, 0x331d87ff, 0x335d87ff,
+  0x339d87ff, 0x33dd87ff, 0x341d87ff, 0x345d87ff, 0x349d87ff, 0x34dd87ff,
+  0x351d87ff, 0x355d87ff, 0x359d87ff, 0x35dd87ff, 0x361d87ff, 0x365d87ff,
+  0x369d87ff, 0x36dd87ff, 0x371d87ff, 0x375d87ff, 0x379d87ff, 0x37dd87ff,
+  0x381d87ff, 0x385d87ff, 0x389d87ff, 0x38dd87ff, 0x391d87ff, 0x395d87ff,
+  0x399d87ff, 0x39dd87ff, 0x3a1d87ff, 0x3a5d87ff, 0x3a9d87ff, 0x3add87ff,
+  0x3b1d87ff, 0x3b5d87ff, 0x3b9d87ff, 0x3bdd87ff, 0x3c1d87ff, 0x3c5d87ff,
+  0x3c9d87ff, 0x3cdd87ff, 0x3d1d87ff, 0x3d5d87ff, 0x3d9d87ff, 0x3ddd87ff,
+  0x3e1d87ff, 0x3e5d87ff, 0x3e9d87ff, 0x3edd87ff, 0x3f1d87ff, 0x3f5d87ff,
+  0x3f9d87ff, 0x3fdd87ff, 0x401d87ff, 0x405d87ff, 0x409d87ff, 0x40dd87ff,
+  0x411d87ff, 0x415d87ff, 0x419d87ff, 0x41dd87ff, 0x421d87ff, 0x425d87ff,
+  0x429d87ff, 0x42dd87ff, 0x431d87ff, 0x435d87ff, 0x439d87ff, 0x43dd87ff,
+  0x441d87ff, 0x445d87ff, 0x449d87ff, 0x44dd87ff, 0x451d87ff, 0x455d87ff,
+  0x459d87ff, 0x45dd87ff, 0x461d87ff, 0x465d87ff, 0x469d87ff, 0x46dd87ff,
+  0x471d87ff, 0x475d87ff, 0x479d87ff, 0x47dd87ff, 0x481d87ff, 0x485d87ff,
+  0x489d87ff, 0x48dd87ff, 0x491d87ff, 0x495d87ff, 0x499d87ff, 0x49dd87ff,
+  0x4a1d87ff, 0x4a5d87ff, 0x4a9d87ff, 0x4add87ff, 0x4b1d87ff, 0x4b5d87ff,
+  0x4b9d87ff, 0x4bdd87ff, 0x4c1d87ff, 0x4c5d87ff, 0x4c9d87ff, 0x4cdd87ff,
+  0x4d1d87ff, 0x4d5d87ff, 0x4d9d87ff, 0x4ddd87ff, 0x4e1d87ff, 0x4e5d87ff,
+  0x4e9d87ff, 0x4edd87ff, 0x4f1d87ff, 0x4f5d87ff, 0x4f9d87ff, 0x4fdd87ff,
+  0x501d87ff, 0x505d87ff, 0x509d87ff, 0x50dd87ff, 0x511d87ff, 0x515d87ff,
+  0x519d87ff, 0x51dd87ff, 0x521d87ff, 0x525d87ff, 0x529d87ff, 0x52dd87ff,
+  0x531d87ff, 0x535d87ff, 0x539d87ff, 0x53dd87ff, 0x541d87ff, 0x545d87ff,
+  0x549d87ff, 0x54dd87ff, 0x551d87ff, 0x555d87ff, 0x559d87ff, 0x55dd87ff,
+  0x561d87ff, 0x565d87ff, 0x569d87ff, 0x56dd87ff, 0x571d87ff, 0x575d87ff,
+  0x579d87ff, 0x57dd87ff, 0x581d87ff, 0x585d87ff, 0x589d87ff, 0x58dd87ff,
+  0x591d87ff, 0x595d87ff, 0x599d87ff, 0x59dd87ff, 0x5a1d87ff, 0x5a5d87ff,
+  0x5a9d87ff, 0x5add87ff, 0x5b1d87ff, 0x5b5d87ff, 0x5b9d87ff, 0x5bdd87ff,
+  0x5c1d87ff, 0x5c5d87ff, 0x5c9d87ff, 0x5cdd87ff, 0x5d1d87ff, 0x5d5d87ff,
+  0x5d9d87ff, 0x5ddd87ff, 0x5e1d87ff, 0x5e5d87ff, 0x5e9d87ff, 0x5edd87ff,
+  0x5f1d87ff, 0x5f5d87ff, 0x5f9d87ff, 0x5fdd87ff, 0x601d87ff, 0x605d87ff,
+  0x609d87ff, 0x60dd87ff, 0x611d87ff, 0x615d87ff, 0x619d87ff, 0x61dd87ff,
+  0x621d87ff, 0x625d87ff, 0x629d87ff, 0x62dd87ff, 0x631d87ff, 0x635d87ff,
+  0x639d87ff, 0x63dd87ff, 0x641d87ff, 0x645d87ff, 0x649d87ff, 0x64dd87ff,
+  0x651d87ff, 0x655d87ff, 0x659d87ff, 0x65dd87ff, 0x661d87ff, 0x665d87ff,
+  0x669d87ff, 0x66dd87ff, 0x671d87ff, 0x675d87ff, 0x679d87ff, 0x67dd87ff,
+  0x681d87ff, 0x685d87ff, 0x689d87ff, 0x68dd87ff, 0x691d87ff, 0x695d87ff,
+  0x699d87ff, 0x69dd87ff, 0x6a1d87ff, 0x6a5d87ff, 0x6a9d87ff, 0x6add87ff,
+  0x6b1d87ff, 0x6b5d87ff, 0x6b9d87ff, 0x6bdd87ff, 0x6c1d87ff, 0x6c5d87ff,
+  0x6c9d87ff, 0x6cdd87ff, 0x6d1d87ff, 0x6d5d87ff, 0x6d9d87ff, 0x6ddd87ff,
+  0x6e1d87ff, 0x6e5d87ff, 0x6e9d87ff, 0x6edd87ff, 0x6f1d87ff, 0x6f5d87ff,
+  0x6f9d87ff, 0x6fdd8450, 0x7000101d, 0x7004007f, 0x700f87ff, 0x704f87ff,
+  0x708f87ff, 0x70cf87ff, 0x710f87ff, 0x714f87ff, 0x718f87ff, 0x71cf87ff,
+  0x720f87ff, 0x724f87ff, 0x728f87ff, 0x72cf87ff, 0x730f87ff, 0x734f87ff,
+  0x738f87ff, 0x73cf87ff, 0x740f87ff, 0x744f87ff, 0x748f87ff, 0x74cf87ff,
+  0x750f87ff, 0x754f87ff, 0x758f87ff, 0x75cf87ff, 0x760f87ff, 0x764f87ff,
+  0x768f87ff, 0x76cf87ff, 0x770f87ff, 0x774f87ff, 0x778f87ff, 0x77cf87ff,
+  0x780f87ff, 0x784f87ff, 0x788f87ff, 0x78cf87ff, 0x790f87ff, 0x794f87ff,
+  0x798f87ff, 0x79cf87ff, 0x7a0f87ff, 0x7a4f87ff, 0x7a8f87ff, 0x7acf87ff,
+  0x7b0f87ff, 0x7b4f87ff, 0x7b8f87ff, 0x7bcf87ff, 0x7c0f87ff, 0x7c4f87ff,
+  0x7c8f87ff, 0x7ccf87ff, 0x7d0f87ff, 0x7d4f87ff, 0x7d8f87ff, 0x7dcf87ff,
+  0x7e0f87ff, 0x7e4f87ff, 0x7e8f87ff, 0x7ecf87ff, 0x7f0f87ff, 0x7f4f87ff,
+  0x7f8f87ff, 0x7fcf87ff, 0x800f87ff, 0x804f87ff, 0x808f87ff, 0x80cf87ff,
+  0x810f87ff, 0x814f87ff, 0x818f87ff, 0x81cf87ff, 0x820f87ff, 0x824f87ff,
+  0x828f87ff, 0x82cf87ff, 0x830f87ff, 0x834f87ff, 0x838f87ff, 0x83cf87ff,
+  0x840f87ff, 0x844f87ff, 0x848f87ff, 0x84cf87ff, 0x850f87ff, 0x854f87ff,
+  0x858f87ff, 0x85cf87ff, 0x860f87ff, 0x864f87ff, 0x868f87ff, 0x86cf87ff,
+  0x870f87ff, 0x874f87ff, 0x878f87ff, 0x87cf860f,
+  /* Common */
+  0x00000040, 0x0002d805, 0x0003d82e, 0x0005580e, 0x0005d804, 0x0006b800,
+  0x0007b800, 0x0015c826, 0x00172804, 0x00176013, 0x001ba000, 0x001bf000,
+  0x001c2800, 0x001c3800, 0x00302800, 0x00306000, 0x0030d800, 0x0030f800,
+  0x00320000, 0x0036e800, 0x00471000, 0x004b2001, 0x0071f800, 0x007ea803,
+  0x0087d800, 0x00b75802, 0x00b9a801, 0x00c01001, 0x00c02800, 0x00e69800,
+  0x00e70800, 0x00e74803, 0x00e77005, 0x00e7a802, 0x00e7d000, 0x0100000b,
+  0x01007056, 0x0103300a, 0x0103a00a, 0x0104000e, 0x01050020, 0x01080025,
+  0x01093802, 0x01096005, 0x0109981a, 0x010a7810, 0x010c4802, 0x010c8299,
+  0x0122000a, 0x0123039f, 0x01480273, 0x015bb01f, 0x015cb868, 0x0170005d,
+  0x017f8014, 0x01803000, 0x01804018, 0x01818007, 0x0181e003, 0x0184d801,
+  0x01850000, 0x0187d801, 0x018c800f, 0x018e0025, 0x018f7800, 0x0191003f,
+  0x0193f850, 0x0197f800, 0x019ac0a7, 0x026e003f, 0x05380021, 0x053c4002,
+  0x05418009, 0x05497000, 0x054e7800, 0x055ad800, 0x055b5001, 0x07e9f001,
+  0x07f08009, 0x07f18022, 0x07f2a012, 0x07f34003, 0x07f7f800, 0x07f8081f,
+  0x07f9d805, 0x07fad80a, 0x07fb8000, 0x07fcf001, 0x07ff0006, 0x07ff4006,
+  0x07ffc804, 0x08080002, 0x0808382c, 0x0809b808, 0x080c800c, 0x080e802c,
+  0x0817081a, 0x0de50003, 0x0e6000f9, 0x0e6801b3, 0x0e7a8073, 0x0e8000f5,
+  0x0e880026, 0x0e89483d, 0x0e8b5010, 0x0e8c1801, 0x0e8c601d, 0x0e8d703c,
+  0x0e960013, 0x0e970013, 0x0e980056, 0x0e9b0018, 0x0ea00054, 0x0ea2b046,
+  0x0ea4f001, 0x0ea51000, 0x0ea52801, 0x0ea54803, 0x0ea5700b, 0x0ea5d800,
+  0x0ea5e806, 0x0ea62840, 0x0ea83803, 0x0ea86807, 0x0ea8b006, 0x0ea8f01b,
+  0x0ea9d803, 0x0eaa0004, 0x0eaa3000, 0x0eaa5006, 0x0eaa9153, 0x0eb54123,
+  0x0ebe7031, 0x0f638843, 0x0f68083c, 0x0f80002b, 0x0f818063, 0x0f85000e,
+  0x0f85880e, 0x0f86080e, 0x0f868824, 0x0f8800ad, 0x0f8f3019, 0x0f900801,
+  0x0f90802b, 0x0f920008, 0x0f928001, 0x0f930005, 0x0f9803d7, 0x0fb6e010,
+  0x0fb7800c, 0x0fb80076, 0x0fbbd85e, 0x0fbf000b, 0x0fbf8000, 0x0fc0000b,
+  0x0fc08037, 0x0fc28009, 0x0fc30027, 0x0fc4801d, 0x0fc5800b, 0x0fc60001,
+  0x0fc80153, 0x0fd3000d, 0x0fd3800c, 0x0fd40009, 0x0fd47837, 0x0fd6700e,
+  0x0fd6f80a, 0x0fd78008, 0x0fd80092, 0x0fdca065, 0x70000800, 0x7001005f,
+  /* Lao */
+  0x00740801, 0x00742000, 0x00743004, 0x00746017, 0x00752800, 0x00753816,
+  0x00760004, 0x00763000, 0x00764006, 0x00768009, 0x0076e003,
+  /* Canadian_Aboriginal */
+  0x00a0027f, 0x00c58045, 0x08d5800f,
+  /* Ogham */
+  0x00b4001c,
+  /* Khmer */
+  0x00bc005d, 0x00bf0009, 0x00bf8009, 0x00cf001f,
+  /* Old_Italic */
+  0x08180023, 0x08196802,
+  /* Deseret */
+  0x0820004f,
+  /* Inherited */
+  0x0018006f, 0x00242801, 0x0032580a, 0x00338000, 0x004a8803, 0x00d5801e,
+  0x00e68002, 0x00e6a00c, 0x00e71006, 0x00e76800, 0x00e7a000, 0x00e7c001,
+  0x00ee003f, 0x01006001, 0x01068020, 0x01815003, 0x0184c801, 0x07f0000f,
+  0x07f1000d, 0x080fe800, 0x08170000, 0x0899d800, 0x0e78002d, 0x0e798016,
+  0x0e8b3802, 0x0e8bd807, 0x0e8c2806, 0x0e8d5003, 0x700800ef,
+  /* Ugaritic */
+  0x081c001d, 0x081cf800,
+  /* Osmanya */
+  0x0824001d, 0x08250009,
+  /* Braille */
+  0x014000ff,
+  /* New_Tai_Lue */
+  0x00cc002b, 0x00cd8019, 0x00ce800a, 0x00cef001,
+  /* Old_Persian */
+  0x081d0023, 0x081e400d,
+  /* Kharoshthi */
+  0x08500003, 0x08502801, 0x08506007, 0x0850a802, 0x0850c81c, 0x0851c002,
+  0x0851f809, 0x08528008,
+  /* Balinese */
+  0x00d8004c, 0x00da7031,
+  /* Cuneiform */
+  0x09000399, 0x0920006e, 0x09238004, 0x092400c3,
+  /* Phoenician */
+  0x0848001b, 0x0848f800,
+  /* Sundanese */
+  0x00dc003f, 0x00e60007,
+  /* Lepcha */
+  0x00e00037, 0x00e1d80e, 0x00e26802,
+  /* Ol_Chiki */
+  0x00e2802f,
+  /* Vai */
+  0x0528012b,
+  /* Saurashtra */
+  0x05440045, 0x0546700b,
+  /* Rejang */
+  0x05498023, 0x054af800,
+  /* Cham */
+  0x05500036, 0x0552000d, 0x05528009, 0x0552e003,
+  /* Tai_Tham */
+  0x00d1003e, 0x00d3001c, 0x00d3f80a, 0x00d48009, 0x00d5000d,
+  /* Tai_Viet */
+  0x05540042, 0x0556d804,
+  /* Egyptian_Hieroglyphs */
+  0x09800455, 0x09a307ff, 0x09e3079a,
+  /* Bamum */
+  0x05350057, 0x0b400238,
+  /* Meetei_Mayek */
+  0x05570016, 0x055e002d, 0x055f8009,
+  /* Imperial_Aramaic */
+  0x08420015, 0x0842b808,
+  /* Old_South_Arabian */
+  0x0853001f,
+  /* Inscriptional_Parthian */
+  0x085a0015, 0x085ac007,
+  /* Inscriptional_Pahlavi */
+  0x085b0012, 0x085bc007,
+  /* Batak */
+  0x00de0033, 0x00dfe003,
+  /* Brahmi */
+  0x0880004d, 0x08829023, 0x0883f800,
+  /* Meroitic_Cursive */
+  0x084d0017, 0x084de013, 0x084e902d,
+  /* Miao */
+  0x0b78004a, 0x0b7a7838, 0x0b7c7810,
+  /* Sora_Sompeng */
+  0x08868018, 0x08878009,
+  /* Bassa_Vah */
+  0x0b56801d, 0x0b578005,
+  /* Pahawh_Hmong */
+  0x0b580045, 0x0b5a8009, 0x0b5ad806, 0x0b5b1814, 0x0b5be812,
+  /* Mende_Kikakui */
+  0x0f4000c4, 0x0f46380f,
+  /* Mro */
+  0x0b52001e, 0x0b530009, 0x0b537001,
+  /* Old_North_Arabian */
+  0x0854001f,
+  /* Nabataean */
+  0x0844001e, 0x08453808,
+  /* Palmyrene */
+  0x0843001f,
+  /* Pau_Cin_Hau */
+  0x08d60038,
+  /* Siddham */
+  0x08ac0035, 0x08adc025,
+  /* Warang_Citi */
+  0x08c50052, 0x08c7f800,
+  /* Ahom */
+  0x08b8001a, 0x08b8e80e, 0x08b98016,
+  /* Anatolian_Hieroglyphs */
+  0x0a200246,
+  /* Hatran */
+  0x08470012, 0x0847a001, 0x0847d804,
+  /* SignWriting */
+  0x0ec0028b, 0x0ed4d804, 0x0ed5080e,
+  /* Bhaiksuki */
+  0x08e00008, 0x08e0502c, 0x08e1c00d, 0x08e2801c,
+  /* Marchen */
+  0x08e3801f, 0x08e49015, 0x08e5480d,
+  /* Newa */
+  0x08a0005b, 0x08a2e804,
+  /* Nushu */
+  0x0b7f0800, 0x0d8b818b,
+  /* Soyombo */
+  0x08d28052,
+  /* Zanabazar_Square */
+  0x08d00047,
+  /* Makasar */
+  0x08f70018,
+  /* Medefaidrin */
+  0x0b72005a,
+  /* Old_Sogdian */
+  0x08780027,
+  /* Elymaic */
+  0x087f0016,
+  /* Nyiakeng_Puachue_Hmong */
+  0x0f08002c, 0x0f09800d, 0x0f0a0009, 0x0f0a7001,
+  /* Wancho */
+  0x0f160039, 0x0f17f800,
+  /* Chorasmian */
+  0x087d801b,
+  /* Dives_Akuru */
+  0x08c80006, 0x08c84800, 0x08c86007, 0x08c8a801, 0x08c8c01d, 0x08c9b801,
+  0x08c9d80b, 0x08ca8009,
+  /* Khitan_Small_Script */
+  0x0b7f2000, 0x0c5801d5, 0x0c67f800,
+  /* Tangsa */
+  0x0b53804e, 0x0b560009,
+  /* Vithkuqi */
+  0x082b800a, 0x082be00e, 0x082c6006, 0x082ca001, 0x082cb80a, 0x082d180e,
+  0x082d9806, 0x082dd801,
+  /* Kawi */
+  0x08f80010, 0x08f89028, 0x08f9f01c,
+  /* Nag_Mundari */
+  0x0f268029,
+  /* Kirat_Rai */
+  0x0b6a0039,
+};
+
+const uint16_t PRIV(ucd_script_ranges_index)[] = {
+      0,    39,    75,    85,    89,    98,   157,   161,
+    162,   167,   181,   197,   211,   225,   243,   256,
+    269,   276,   289,   291,   298,   302,   312,   331,
+    367,   370,   372,   378,   384,   398,   401,   467,
+    469,   470,   472,   473,   474,   477,   482,   484,
+    491,   492,   498,   500,   503,   509,   512,   513,
+    514,   516,   518,   519,   520,   522,   524,   526,
+    528,   531,   532,   534,   536,   538,   539,   540,
+    542,   544,   549,   550,   565,   567,   570,   571,
+    573,   575,   576,   579,   581,   583,   588,   591,
+    594,   596,   602,   609,   610,   616,   618,   619,
+    622,   625,   626,   627,   628,   631,   632,   634,
+    636,   637,   648,  1834,  2008,  2019,  2022,  2023,
+   2027,  2029,  2030,  2059,  2061,  2063,  2064,  2068,
+   2070,  2078,  2080,  2084,  2086,  2088,  2091,  2092,
+   2093,  2095,  2097,  2101,  2106,  2108,  2111,  2113,
+   2116,  2118,  2119,  2121,  2123,  2125,  2128,  2131,
+   2134,  2136,  2138,  2143,  2145,  2148,  2149,  2151,
+   2152,  2153,  2155,  2157,  2160,  2161,  2164,  2167,
+   2171,  2174,  2176,  2178,  2179,  2180,  2181,  2182,
+   2183,  2184,  2188,  2190,  2191,  2199,  2202,  2204,
+   2212,  2215,  2216,  2217,
+};
+
+const uint32_t PRIV(ucd_type_ranges)[] = {
+  /* Cc */
+  0x0000001f, 0x0003f820,
+  /* Cf */
+  0x00056800, 0x00300005, 0x0030e000, 0x0036e800, 0x00387800, 0x00448001,
+  0x00471000, 0x00c07000, 0x01005804, 0x01015004, 0x01030004, 0x01033009,
+  0x07f7f800, 0x07ffc802, 0x0885e800, 0x08866800, 0x09a1800f, 0x0de50003,
+  0x0e8b9807, 0x70000800, 0x7001005f,
+  /* Cn */
+  0x001bc001, 0x001c0003, 0x001c5800, 0x001c6800, 0x001d1000, 0x00298000,
+  0x002ab801, 0x002c5801, 0x002c8000, 0x002e4007, 0x002f5803, 0x002fa80a,
+  0x00387000, 0x003a5801, 0x003d900d, 0x003fd801, 0x00417001, 0x0041f800,
+  0x0042e001, 0x0042f800, 0x00435804, 0x00447800, 0x00449004, 0x004c2000,
+  0x004c6801, 0x004c8801, 0x004d4800, 0x004d8800, 0x004d9802, 0x004dd001,
+  0x004e2801, 0x004e4801, 0x004e7807, 0x004ec003, 0x004ef000, 0x004f2001,
+  0x004ff801, 0x00502000, 0x00505803, 0x00508801, 0x00514800, 0x00518800,
+  0x0051a000, 0x0051b800, 0x0051d001, 0x0051e800, 0x00521803, 0x00524801,
+  0x00527002, 0x00529006, 0x0052e800, 0x0052f806, 0x0053b809, 0x00542000,
+  0x00547000, 0x00549000, 0x00554800, 0x00558800, 0x0055a000, 0x0055d001,
+  0x00563000, 0x00565000, 0x00567001, 0x0056880e, 0x00572001, 0x00579006,
+  0x00580000, 0x00582000, 0x00586801, 0x00588801, 0x00594800, 0x00598800,
+  0x0059a000, 0x0059d001, 0x005a2801, 0x005a4801, 0x005a7006, 0x005ac003,
+  0x005af000, 0x005b2001, 0x005bc009, 0x005c2000, 0x005c5802, 0x005c8800,
+  0x005cb002, 0x005cd800, 0x005ce800, 0x005d0002, 0x005d2802, 0x005d5802,
+  0x005dd003, 0x005e1802, 0x005e4800, 0x005e7001, 0x005e8805, 0x005ec00d,
+  0x005fd804, 0x00606800, 0x00608800, 0x00614800, 0x0061d001, 0x00622800,
+  0x00624800, 0x00627006, 0x0062b800, 0x0062d801, 0x0062f001, 0x00632001,
+  0x00638006, 0x00646800, 0x00648800, 0x00654800, 0x0065a000, 0x0065d001,
+  0x00662800, 0x00664800, 0x00667006, 0x0066b805, 0x0066f800, 0x00672001,
+  0x00678000, 0x0067a00b, 0x00686800, 0x00688800, 0x006a2800, 0x006a4800,
+  0x006a8003, 0x006b2001, 0x006c0000, 0x006c2000, 0x006cb802, 0x006d9000,
+  0x006de000, 0x006df001, 0x006e3802, 0x006e5803, 0x006ea800, 0x006eb800,
+  0x006f0005, 0x006f8001, 0x006fa80b, 0x0071d803, 0x0072e024, 0x00741800,
+  0x00742800, 0x00745800, 0x00752000, 0x00753000, 0x0075f001, 0x00762800,
+  0x00763800, 0x00767800, 0x0076d001, 0x0077001f, 0x007a4000, 0x007b6803,
+  0x007cc000, 0x007de800, 0x007e6800, 0x007ed824, 0x00863000, 0x00864004,
+  0x00867001, 0x00924800, 0x00927001, 0x0092b800, 0x0092c800, 0x0092f001,
+  0x00944800, 0x00947001, 0x00958800, 0x0095b001, 0x0095f800, 0x00960800,
+  0x00963001, 0x0096b800, 0x00988800, 0x0098b001, 0x009ad801, 0x009be802,
+  0x009cd005, 0x009fb001, 0x009ff001, 0x00b4e802, 0x00b7c806, 0x00b8b008,
+  0x00b9b808, 0x00baa00b, 0x00bb6800, 0x00bb8800, 0x00bba00b, 0x00bef001,
+  0x00bf5005, 0x00bfd005, 0x00c0d005, 0x00c3c806, 0x00c55804, 0x00c7b009,
+  0x00c8f800, 0x00c96003, 0x00c9e003, 0x00ca0802, 0x00cb7001, 0x00cba80a,
+  0x00cd6003, 0x00ce5005, 0x00ced802, 0x00d0e001, 0x00d2f800, 0x00d3e801,
+  0x00d45005, 0x00d4d005, 0x00d57001, 0x00d67830, 0x00da6800, 0x00dfa007,
+  0x00e1c002, 0x00e25002, 0x00e45804, 0x00e5d801, 0x00e64007, 0x00e7d804,
+  0x00f8b001, 0x00f8f001, 0x00fa3001, 0x00fa7001, 0x00fac000, 0x00fad000,
+  0x00fae000, 0x00faf000, 0x00fbf001, 0x00fda800, 0x00fe2800, 0x00fea001,
+  0x00fee000, 0x00ff8001, 0x00ffa800, 0x00fff800, 0x01032800, 0x01039001,
+  0x01047800, 0x0104e802, 0x0106080e, 0x0107880e, 0x010c6003, 0x01215015,
+  0x01225814, 0x015ba001, 0x015cb000, 0x0167a004, 0x01693000, 0x01694004,
+  0x01697001, 0x016b4006, 0x016b880d, 0x016cb808, 0x016d3800, 0x016d7800,
+  0x016db800, 0x016df800, 0x016e3800, 0x016e7800, 0x016eb800, 0x016ef800,
+  0x0172f021, 0x0174d000, 0x0177a00b, 0x017eb019, 0x01820000, 0x0184b801,
+  0x01880004, 0x01898000, 0x018c7800, 0x018f3008, 0x0190f800, 0x05246802,
+  0x05263808, 0x05316013, 0x0537c007, 0x053e7001, 0x053e9000, 0x053ea000,
+  0x053ee814, 0x05416802, 0x0541d005, 0x0543c007, 0x05463007, 0x0546d005,
+  0x054aa00a, 0x054be802, 0x054e7000, 0x054ed003, 0x054ff800, 0x0551b808,
+  0x05527001, 0x0552d001, 0x05561817, 0x0557b809, 0x05583801, 0x05587801,
+  0x0558b808, 0x05593800, 0x05597800, 0x055b6003, 0x055f7001, 0x055fd005,
+  0x06bd200b, 0x06be3803, 0x06bfe003, 0x07d37001, 0x07d6d025, 0x07d8380b,
+  0x07d8c004, 0x07d9b800, 0x07d9e800, 0x07d9f800, 0x07da1000, 0x07da2800,
+  0x07de180f, 0x07ec8001, 0x07ee4006, 0x07ee801f, 0x07f0d005, 0x07f29800,
+  0x07f33800, 0x07f36003, 0x07f3a800, 0x07f7e801, 0x07f80000, 0x07fdf802,
+  0x07fe4001, 0x07fe8001, 0x07fec001, 0x07fee802, 0x07ff3800, 0x07ff7809,
+  0x07fff001, 0x08006000, 0x08013800, 0x0801d800, 0x0801f000, 0x08027001,
+  0x0802f021, 0x0807d804, 0x08081803, 0x0809a002, 0x080c7800, 0x080ce802,
+  0x080d082e, 0x080ff081, 0x0814e802, 0x0816880e, 0x0817e003, 0x08192008,
+  0x081a5804, 0x081bd804, 0x081cf000, 0x081e2003, 0x081eb029, 0x0824f001,
+  0x08255005, 0x0826a003, 0x0827e003, 0x08294007, 0x082b200a, 0x082bd800,
+  0x082c5800, 0x082c9800, 0x082cb000, 0x082d1000, 0x082d9000, 0x082dd000,
+  0x082de802, 0x082fa00b, 0x0839b808, 0x083ab009, 0x083b4017, 0x083c3000,
+  0x083d8800, 0x083dd844, 0x08403001, 0x08404800, 0x0841b000, 0x0841c802,
+  0x0841e801, 0x0842b000, 0x0844f807, 0x0845802f, 0x08479800, 0x0847b004,
+  0x0848e002, 0x0849d004, 0x084a003f, 0x084dc003, 0x084e8001, 0x08502000,
+  0x08503804, 0x0850a000, 0x0850c000, 0x0851b001, 0x0851d803, 0x08524806,
+  0x0852c806, 0x0855001f, 0x08573803, 0x0857b808, 0x0859b002, 0x085ab001,
+  0x085b9804, 0x085c9006, 0x085ce80b, 0x085d804f, 0x08624836, 0x0865980c,
+  0x08679806, 0x08694007, 0x0869d005, 0x086b3002, 0x086c3007, 0x086c80cf,
+  0x0873f800, 0x08755000, 0x08757001, 0x0875900f, 0x08762836, 0x08794007,
+  0x087ad015, 0x087c5025, 0x087e6013, 0x087fb808, 0x08827003, 0x0883b008,
+  0x08861809, 0x08867001, 0x08874806, 0x0887d005, 0x0889a800, 0x088a4007,
+  0x088bb808, 0x088f0000, 0x088fa80a, 0x08909000, 0x0892103d, 0x08943800,
+  0x08944800, 0x08947000, 0x0894f000, 0x08955005, 0x08975804, 0x0897d005,
+  0x08982000, 0x08986801, 0x08988801, 0x08994800, 0x08998800, 0x0899a000,
+  0x0899d000, 0x089a2801, 0x089a4801, 0x089a7001, 0x089a8805, 0x089ac004,
+  0x089b2001, 0x089b6802, 0x089ba80a, 0x089c5000, 0x089c6001, 0x089c7800,
+  0x089db000, 0x089e0800, 0x089e1801, 0x089e3000, 0x089e5800, 0x089eb000,
+  0x089ec807, 0x089f181c, 0x08a2e000, 0x08a3101d, 0x08a64007, 0x08a6d0a5,
+  0x08adb001, 0x08aef021, 0x08b2280a, 0x08b2d005, 0x08b36812, 0x08b5d005,
+  0x08b65005, 0x08b7201b, 0x08b8d801, 0x08b96003, 0x08ba38b8, 0x08c1e063,
+  0x08c7980b, 0x08c83801, 0x08c85001, 0x08c8a000, 0x08c8b800, 0x08c9b000,
+  0x08c9c801, 0x08ca3808, 0x08cad045, 0x08cd4001, 0x08cec001, 0x08cf281a,
+  0x08d24007, 0x08d5180c, 0x08d7c806, 0x08d850b5, 0x08df100d, 0x08dfd005,
+  0x08e04800, 0x08e1b800, 0x08e23009, 0x08e36802, 0x08e48001, 0x08e54000,
+  0x08e5b848, 0x08e83800, 0x08e85000, 0x08e9b802, 0x08e9d800, 0x08e9f000,
+  0x08ea4007, 0x08ead005, 0x08eb3000, 0x08eb4800, 0x08ec7800, 0x08ec9000,
+  0x08ecc806, 0x08ed5135, 0x08f7c806, 0x08f88800, 0x08f9d802, 0x08fad854,
+  0x08fd880e, 0x08ff900c, 0x091cd065, 0x09237800, 0x0923a80a, 0x092a27ff,
+  0x096a224b, 0x097f980c, 0x09a2b009, 0x0a1fd804, 0x0a323fff, 0x0a723fff,
+  0x0ab23fff, 0x0af23ab8, 0x0b09d6c5, 0x0b51c806, 0x0b52f800, 0x0b535003,
+  0x0b55f800, 0x0b565005, 0x0b577001, 0x0b57b009, 0x0b5a3009, 0x0b5ad000,
+  0x0b5b1000, 0x0b5bc004, 0x0b5c81af, 0x0b6bd0c5, 0x0b74d864, 0x0b7a5803,
+  0x0b7c4006, 0x0b7d003f, 0x0b7f280a, 0x0b7f900d, 0x0c3fc007, 0x0c66b028,
+  0x0c684fff, 0x0ca84fff, 0x0ce84fff, 0x0d284fff, 0x0d684ae6, 0x0d7fa000,
+  0x0d7fe000, 0x0d7ff800, 0x0d89180e, 0x0d89981c, 0x0d8a9801, 0x0d8ab00d,
+  0x0d8b4007, 0x0d97e7ff, 0x0dd7e103, 0x0de35804, 0x0de3e802, 0x0de44806,
+  0x0de4d001, 0x0de527ff, 0x0e25275b, 0x0e67d005, 0x0e75a04b, 0x0e797001,
+  0x0e7a3808, 0x0e7e203b, 0x0e87b009, 0x0e893801, 0x0e8f5814, 0x0e923079,
+  0x0e96a00b, 0x0e97a00b, 0x0e9ab808, 0x0e9bc886, 0x0ea2a800, 0x0ea4e800,
+  0x0ea50001, 0x0ea51801, 0x0ea53801, 0x0ea56800, 0x0ea5d000, 0x0ea5e000,
+  0x0ea62000, 0x0ea83000, 0x0ea85801, 0x0ea8a800, 0x0ea8e800, 0x0ea9d000,
+  0x0ea9f800, 0x0eaa2800, 0x0eaa3802, 0x0eaa8800, 0x0eb53001, 0x0ebe6001,
+  0x0ed4600e, 0x0ed50000, 0x0ed5844f, 0x0ef8f805, 0x0ef958d4, 0x0f003800,
+  0x0f00c801, 0x0f011000, 0x0f012800, 0x0f015804, 0x0f037020, 0x0f04806f,
+  0x0f096802, 0x0f09f001, 0x0f0a5003, 0x0f0a813f, 0x0f157810, 0x0f17d004,
+  0x0f1801cf, 0x0f27d0d5, 0x0f2fd803, 0x0f3001df, 0x0f3f3800, 0x0f3f6000,
+  0x0f3f7800, 0x0f3ff800, 0x0f462801, 0x0f46b828, 0x0f4a6003, 0x0f4ad003,
+  0x0f4b0310, 0x0f65a84b, 0x0f69f0c1, 0x0f702000, 0x0f710000, 0x0f711800,
+  0x0f712801, 0x0f714000, 0x0f719800, 0x0f71c000, 0x0f71d000, 0x0f71e005,
+  0x0f721803, 0x0f724000, 0x0f725000, 0x0f726000, 0x0f728000, 0x0f729800,
+  0x0f72a801, 0x0f72c000, 0x0f72d000, 0x0f72e000, 0x0f72f000, 0x0f730000,
+  0x0f731800, 0x0f732801, 0x0f735800, 0x0f739800, 0x0f73c000, 0x0f73e800,
+  0x0f73f800, 0x0f745000, 0x0f74e004, 0x0f752000, 0x0f755000, 0x0f75e033,
+  0x0f77910d, 0x0f816003, 0x0f84a00b, 0x0f857801, 0x0f860000, 0x0f868000,
+  0x0f87b009, 0x0f8d7037, 0x0f90180c, 0x0f91e003, 0x0f924806, 0x0f92900d,
+  0x0f933099, 0x0fb6c003, 0x0fb76802, 0x0fb7e802, 0x0fbbb803, 0x0fbed005,
+  0x0fbf6003, 0x0fbf880e, 0x0fc06003, 0x0fc24007, 0x0fc2d005, 0x0fc44007,
+  0x0fc57001, 0x0fc5e003, 0x0fc6103d, 0x0fd2a00b, 0x0fd37001, 0x0fd3e802,
+  0x0fd45004, 0x0fd63806, 0x0fd6e801, 0x0fd75005, 0x0fd7c806, 0x0fdc9800,
+  0x0fdfd405, 0x1537001f, 0x15b9d005, 0x15c0f001, 0x1675100d, 0x175f080e,
+  0x1772f7ff, 0x17b2f1a1, 0x17d0f5e1, 0x189a5804, 0x191d87ff, 0x195d87ff,
+  0x199d87ff, 0x19dd87ff, 0x1a1d87ff, 0x1a5d87ff, 0x1a9d87ff, 0x1add87ff,
+  0x1b1d87ff, 0x1b5d87ff, 0x1b9d87ff, 0x1bdd87ff, 0x1c1d87ff, 0x1c5d87ff,
+  0x1c9d87ff, 0x1cdd87ff, 0x1d1d87ff, 0x1d5d87ff, 0x1d9d87ff, 0x1ddd87ff,
+  0x1e1d87ff, 0x1e5d87ff, 0x1e9d87ff, 0x1edd87ff, 0x1f1d87ff, 0x1f5d87ff,
+  0x1f9d87ff, 0x1fdd87ff, 0x201d87ff, 0x205d87ff, 0x209d87ff, 0x20dd87ff,
+  0x211d87ff, 0x215d87ff, 0x219d87ff, 0x21dd87ff, 0x221d87ff, 0x225d87ff,
+  0x229d87ff, 0x22dd87ff, 0x231d87ff, 0x235d87ff, 0x239d87ff, 0x23dd87ff,
+  0x241d87ff, 0x245d87ff, 0x249d87ff, 0x24dd87ff, 0x251d87ff, 0x255d87ff,
+  0x259d87ff, 0x25dd87ff, 0x261d87ff, 0x265d87ff, 0x269d87ff, 0x26dd87ff,
+  0x271d87ff, 0x275d87ff, 0x279d87ff, 0x27dd87ff, 0x281d87ff, 0x285d87ff,
+  0x289d87ff, 0x28dd87ff, 0x291d87ff, 0x295d87ff, 0x299d87ff, 0x29dd87ff,
+  0x2a1d87ff, 0x2a5d87ff, 0x2a9d87ff, 0x2add87ff, 0x2b1d87ff, 0x2b5d87ff,
+  0x2b9d87ff, 0x2bdd87ff, 0x2c1d87ff, 0x2c5d87ff, 0x2c9d87ff, 0x2cdd87ff,
+  0x2d1d87ff, 0x2d5d87ff, 0x2d9d87ff, 0x2ddd87ff, 0x2e1d87ff, 0x2e5d87ff,
+  0x2e9d87ff, 0x2edd87ff, 0x2f1d87ff, 0x2f5d87ff, 0x2f9d87ff, 0x2fdd87ff,
+  0x301d87ff, 0x305d87ff, 0x309d87ff, 0x30dd87ff, 0x311d87ff, 0x315d87ff,
+  0x319d87ff, 0x31dd87ff, 0x321d87ff, 0x325d87ff, 0x329d87ff, 0x32dd87ff,
+  0x331d87ff, 0x335d87ff, 0x339d87ff, 0x33dd87ff, 0x341d87ff, 0x345d87ff,
+  0x349d87ff, 0x34dd87ff, 0x351d87ff, 0x355d87ff, 0x359d87ff, 0x35dd87ff,
+  0x361d87ff, 0x365d87ff, 0x369d87ff, 0x36dd87ff, 0x371d87ff, 0x375d87ff,
+  0x379d87ff, 0x37dd87ff, 0x381d87ff, 0x385d87ff, 0x389d87ff, 0x38dd87ff,
+  0x391d87ff, 0x395d87ff, 0x399d87ff, 0x39dd87ff, 0x3a1d87ff, 0x3a5d87ff,
+  0x3a9d87ff, 0x3add87ff, 0x3b1d87ff, 0x3b5d87ff, 0x3b9d87ff, 0x3bdd87ff,
+  0x3c1d87ff, 0x3c5d87ff, 0x3c9d87ff, 0x3cdd87ff, 0x3d1d87ff, 0x3d5d87ff,
+  0x3d9d87ff, 0x3ddd87ff, 0x3e1d87ff, 0x3e5d87ff, 0x3e9d87ff, 0x3edd87ff,
+  0x3f1d87ff, 0x3f5d87ff, 0x3f9d87ff, 0x3fdd87ff, 0x401d87ff, 0x405d87ff,
+  0x409d87ff, 0x40dd87ff, 0x411d87ff, 0x415d87ff, 0x419d87ff, 0x41dd87ff,
+  0x421d87ff, 0x425d87ff, 0x429d87ff, 0x42dd87ff, 0x431d87ff, 0x435d87ff,
+  0x439d87ff, 0x43dd87ff, 0x441d87ff, 0x445d87ff, 0x449d87ff, 0x44dd87ff,
+  0x451d87ff, 0x455d87ff, 0x459d87ff, 0x45dd87ff, 0x461d87ff, 0x465d87ff,
+  0x469d87ff, 0x46dd87ff, 0x471d87ff, 0x475d87ff, 0x479d87ff, 0x47dd87ff,
+  0x481d87ff, 0x485d87ff, 0x489d87ff, 0x48dd87ff, 0x491d87ff, 0x495d87ff,
+  0x499d87ff, 0x49dd87ff, 0x4a1d87ff, 0x4a5d87ff, 0x4a9d87ff, 0x4add87ff,
+  0x4b1d87ff, 0x4b5d87ff, 0x4b9d87ff, 0x4bdd87ff, 0x4c1d87ff, 0x4c5d87ff,
+  0x4c9d87ff, 0x4cdd87ff, 0x4d1d87ff, 0x4d5d87ff, 0x4d9d87ff, 0x4ddd87ff,
+  0x4e1d87ff, 0x4e5d87ff, 0x4e9d87ff, 0x4edd87ff, 0x4f1d87ff, 0x4f5d87ff,
+  0x4f9d87ff, 0x4fdd87ff, 0x501d87ff, 0x505d87ff, 0x509d87ff, 0x50dd87ff,
+  0x511d87ff, 0x515d87ff, 0x519d87ff, 0x51dd87ff, 0x521d87ff, 0x525d87ff,
+  0x529d87ff, 0x52dd87ff, 0x531d87ff, 0x535d87ff, 0x539d87ff, 0x53dd87ff,
+  0x541d87ff, 0x545d87ff, 0x549d87ff, 0x54dd87ff, 0x551d87ff, 0x555d87ff,
+  0x559d87ff, 0x55dd87ff, 0x561d87ff, 0x565d87ff, 0x569d87ff, 0x56dd87ff,
+  0x571d87ff, 0x575d87ff, 0x579d87ff, 0x57dd87ff, 0x581d87ff, 0x585d87ff,
+  0x589d87ff, 0x58dd87ff, 0x591d87ff, 0x595d87ff, 0x599d87ff, 0x59dd87ff,
+  0x5a1d87ff, 0x5a5d87ff, 0x5a9d87ff, 0x5add87ff, 0x5b1d87ff, 0x5b5d87ff,
+  0x5b9d87ff, 0x5bdd87ff, 0x5c1d87ff, 0x5c5d87ff, 0x5c9d87ff, 0x5cdd87ff,
+  0x5d1d87ff, 0x5d5d87ff, 0x5d9d87ff, 0x5ddd87ff, 0x5e1d87ff, 0x5e5d87ff,
+  0x5e9d87ff, 0x5edd87ff, 0x5f1d87ff, 0x5f5d87ff, 0x5f9d87ff, 0x5fdd87ff,
+  0x601d87ff, 0x605d87ff, 0x609d87ff, 0x60dd87ff, 0x611d87ff, 0x615d87ff,
+  0x619d87ff, 0x61dd87ff, 0x621d87ff, 0x625d87ff, 0x629d87ff, 0x62dd87ff,
+  0x631d87ff, 0x635d87ff, 0x639d87ff, 0x63dd87ff, 0x641d87ff, 0x645d87ff,
+  0x649d87ff, 0x64dd87ff, 0x651d87ff, 0x655d87ff, 0x659d87ff, 0x65dd87ff,
+  0x661d87ff, 0x665d87ff, 0x669d87ff, 0x66dd87ff, 0x671d87ff, 0x675d87ff,
+  0x679d87ff, 0x67dd87ff, 0x681d87ff, 0x685d87ff, 0x689d87ff, 0x68dd87ff,
+  0x691d87ff, 0x695d87ff, 0x699d87ff, 0x69dd87ff, 0x6a1d87ff, 0x6a5d87ff,
+  0x6a9d87ff, 0x6add87ff, 0x6b1d87ff, 0x6b5d87ff, 0x6b9d87ff, 0x6bdd87ff,
+  0x6c1d87ff, 0x6c5d87ff, 0x6c9d87ff, 0x6cdd87ff, 0x6d1d87ff, 0x6d5d87ff,
+  0x6d9d87ff, 0x6ddd87ff, 0x6e1d87ff, 0x6e5d87ff, 0x6e9d87ff, 0x6edd87ff,
+  0x6f1d87ff, 0x6f5d87ff, 0x6f9d87ff, 0x6fdd8450, 0x7000101d, 0x7004007f,
+  0x700f87ff, 0x704f87ff, 0x708f87ff, 0x70cf87ff, 0x710f87ff, 0x714f87ff,
+  0x718f87ff, 0x71cf87ff, 0x720f87ff, 0x724f87ff, 0x728f87ff, 0x72cf87ff,
+  0x730f87ff, 0x734f87ff, 0x738f87ff, 0x73cf87ff, 0x740f87ff, 0x744f87ff,
+  0x748f87ff, 0x74cf87ff, 0x750f87ff, 0x754f87ff, 0x758f87ff, 0x75cf87ff,
+  0x760f87ff, 0x764f87ff, 0x768f87ff, 0x76cf87ff, 0x770f87ff, 0x774f87ff,
+  0x778f87ff, 0x77cf860f, 0x7ffff001, 0x87fff001,
+  /* Co */
+  0x070007ff, 0x074007ff, 0x078007ff, 0x07c000ff, 0x780007ff, 0x784007ff,
+  0x788007ff, 0x78c007ff, 0x790007ff, 0x794007ff, 0x798007ff, 0x79c007ff,
+  0x7a0007ff, 0x7a4007ff, 0x7a8007ff, 0x7ac007ff, 0x7b0007ff, 0x7b4007ff,
+  0x7b8007ff, 0x7bc007ff, 0x7c0007ff, 0x7c4007ff, 0x7c8007ff, 0x7cc007ff,
+  0x7d0007ff, 0x7d4007ff, 0x7d8007ff, 0x7dc007ff, 0x7e0007ff, 0x7e4007ff,
+  0x7e8007ff, 0x7ec007ff, 0x7f0007ff, 0x7f4007ff, 0x7f8007ff, 0x7fc007fd,
+  0x800007ff, 0x804007ff, 0x808007ff, 0x80c007ff, 0x810007ff, 0x814007ff,
+  0x818007ff, 0x81c007ff, 0x820007ff, 0x824007ff, 0x828007ff, 0x82c007ff,
+  0x830007ff, 0x834007ff, 0x838007ff, 0x83c007ff, 0x840007ff, 0x844007ff,
+  0x848007ff, 0x84c007ff, 0x850007ff, 0x854007ff, 0x858007ff, 0x85c007ff,
+  0x860007ff, 0x864007ff, 0x868007ff, 0x86c007ff, 0x870007ff, 0x874007ff,
+  0x878007ff, 0x87c007fd,
+  /* Cs */
+  0x06c007ff,
+  /* Ll */
+  0x00030819, 0x0005a800, 0x0006f817, 0x0007c007, 0x00080800, 0x00081800,
+  0x00082800, 0x00083800, 0x00084800, 0x00085800, 0x00086800, 0x00087800,
+  0x00088800, 0x00089800, 0x0008a800, 0x0008b800, 0x0008c800, 0x0008d800,
+  0x0008e800, 0x0008f800, 0x00090800, 0x00091800, 0x00092800, 0x00093800,
+  0x00094800, 0x00095800, 0x00096800, 0x00097800, 0x00098800, 0x00099800,
+  0x0009a800, 0x0009b801, 0x0009d000, 0x0009e000, 0x0009f000, 0x000a0000,
+  0x000a1000, 0x000a2000, 0x000a3000, 0x000a4001, 0x000a5800, 0x000a6800,
+  0x000a7800, 0x000a8800, 0x000a9800, 0x000aa800, 0x000ab800, 0x000ac800,
+  0x000ad800, 0x000ae800, 0x000af800, 0x000b0800, 0x000b1800, 0x000b2800,
+  0x000b3800, 0x000b4800, 0x000b5800, 0x000b6800, 0x000b7800, 0x000b8800,
+  0x000b9800, 0x000ba800, 0x000bb800, 0x000bd000, 0x000be000, 0x000bf002,
+  0x000c1800, 0x000c2800, 0x000c4000, 0x000c6001, 0x000c9000, 0x000ca800,
+  0x000cc802, 0x000cf000, 0x000d0800, 0x000d1800, 0x000d2800, 0x000d4000,
+  0x000d5001, 0x000d6800, 0x000d8000, 0x000da000, 0x000db000, 0x000dc801,
+  0x000de802, 0x000e3000, 0x000e4800, 0x000e6000, 0x000e7000, 0x000e8000,
+  0x000e9000, 0x000ea000, 0x000eb000, 0x000ec000, 0x000ed000, 0x000ee001,
+  0x000ef800, 0x000f0800, 0x000f1800, 0x000f2800, 0x000f3800, 0x000f4800,
+  0x000f5800, 0x000f6800, 0x000f7801, 0x000f9800, 0x000fa800, 0x000fc800,
+  0x000fd800, 0x000fe800, 0x000ff800, 0x00100800, 0x00101800, 0x00102800,
+  0x00103800, 0x00104800, 0x00105800, 0x00106800, 0x00107800, 0x00108800,
+  0x00109800, 0x0010a800, 0x0010b800, 0x0010c800, 0x0010d800, 0x0010e800,
+  0x0010f800, 0x00110800, 0x00111800, 0x00112800, 0x00113800, 0x00114800,
+  0x00115800, 0x00116800, 0x00117800, 0x00118800, 0x00119806, 0x0011e000,
+  0x0011f801, 0x00121000, 0x00123800, 0x00124800, 0x00125800, 0x00126800,
+  0x00127844, 0x0014a81a, 0x001b8800, 0x001b9800, 0x001bb800, 0x001bd802,
+  0x001c8000, 0x001d6022, 0x001e8001, 0x001ea802, 0x001ec800, 0x001ed800,
+  0x001ee800, 0x001ef800, 0x001f0800, 0x001f1800, 0x001f2800, 0x001f3800,
+  0x001f4800, 0x001f5800, 0x001f6800, 0x001f7804, 0x001fa800, 0x001fc000,
+  0x001fd801, 0x0021802f, 0x00230800, 0x00231800, 0x00232800, 0x00233800,
+  0x00234800, 0x00235800, 0x00236800, 0x00237800, 0x00238800, 0x00239800,
+  0x0023a800, 0x0023b800, 0x0023c800, 0x0023d800, 0x0023e800, 0x0023f800,
+  0x00240800, 0x00245800, 0x00246800, 0x00247800, 0x00248800, 0x00249800,
+  0x0024a800, 0x0024b800, 0x0024c800, 0x0024d800, 0x0024e800, 0x0024f800,
+  0x00250800, 0x00251800, 0x00252800, 0x00253800, 0x00254800, 0x00255800,
+  0x00256800, 0x00257800, 0x00258800, 0x00259800, 0x0025a800, 0x0025b800,
+  0x0025c800, 0x0025d800, 0x0025e800, 0x0025f800, 0x00261000, 0x00262000,
+  0x00263000, 0x00264000, 0x00265000, 0x00266000, 0x00267001, 0x00268800,
+  0x00269800, 0x0026a800, 0x0026b800, 0x0026c800, 0x0026d800, 0x0026e800,
+  0x0026f800, 0x00270800, 0x00271800, 0x00272800, 0x00273800, 0x00274800,
+  0x00275800, 0x00276800, 0x00277800, 0x00278800, 0x00279800, 0x0027a800,
+  0x0027b800, 0x0027c800, 0x0027d800, 0x0027e800, 0x0027f800, 0x00280800,
+  0x00281800, 0x00282800, 0x00283800, 0x00284800, 0x00285800, 0x00286800,
+  0x00287800, 0x00288800, 0x00289800, 0x0028a800, 0x0028b800, 0x0028c800,
+  0x0028d800, 0x0028e800, 0x0028f800, 0x00290800, 0x00291800, 0x00292800,
+  0x00293800, 0x00294800, 0x00295800, 0x00296800, 0x00297800, 0x002b0028,
+  0x0086802a, 0x0087e802, 0x009fc005, 0x00e40008, 0x00e45000, 0x00e8002b,
+  0x00eb580c, 0x00ebc821, 0x00f00800, 0x00f01800, 0x00f02800, 0x00f03800,
+  0x00f04800, 0x00f05800, 0x00f06800, 0x00f07800, 0x00f08800, 0x00f09800,
+  0x00f0a800, 0x00f0b800, 0x00f0c800, 0x00f0d800, 0x00f0e800, 0x00f0f800,
+  0x00f10800, 0x00f11800, 0x00f12800, 0x00f13800, 0x00f14800, 0x00f15800,
+  0x00f16800, 0x00f17800, 0x00f18800, 0x00f19800, 0x00f1a800, 0x00f1b800,
+  0x00f1c800, 0x00f1d800, 0x00f1e800, 0x00f1f800, 0x00f20800, 0x00f21800,
+  0x00f22800, 0x00f23800, 0x00f24800, 0x00f25800, 0x00f26800, 0x00f27800,
+  0x00f28800, 0x00f29800, 0x00f2a800, 0x00f2b800, 0x00f2c800, 0x00f2d800,
+  0x00f2e800, 0x00f2f800, 0x00f30800, 0x00f31800, 0x00f32800, 0x00f33800,
+  0x00f34800, 0x00f35800, 0x00f36800, 0x00f37800, 0x00f38800, 0x00f39800,
+  0x00f3a800, 0x00f3b800, 0x00f3c800, 0x00f3d800, 0x00f3e800, 0x00f3f800,
+  0x00f40800, 0x00f41800, 0x00f42800, 0x00f43800, 0x00f44800, 0x00f45800,
+  0x00f46800, 0x00f47800, 0x00f48800, 0x00f49800, 0x00f4a808, 0x00f4f800,
+  0x00f50800, 0x00f51800, 0x00f52800, 0x00f53800, 0x00f54800, 0x00f55800,
+  0x00f56800, 0x00f57800, 0x00f58800, 0x00f59800, 0x00f5a800, 0x00f5b800,
+  0x00f5c800, 0x00f5d800, 0x00f5e800, 0x00f5f800, 0x00f60800, 0x00f61800,
+  0x00f62800, 0x00f63800, 0x00f64800, 0x00f65800, 0x00f66800, 0x00f67800,
+  0x00f68800, 0x00f69800, 0x00f6a800, 0x00f6b800, 0x00f6c800, 0x00f6d800,
+  0x00f6e800, 0x00f6f800, 0x00f70800, 0x00f71800, 0x00f72800, 0x00f73800,
+  0x00f74800, 0x00f75800, 0x00f76800, 0x00f77800, 0x00f78800, 0x00f79800,
+  0x00f7a800, 0x00f7b800, 0x00f7c800, 0x00f7d800, 0x00f7e800, 0x00f7f808,
+  0x00f88005, 0x00f90007, 0x00f98007, 0x00fa0005, 0x00fa8007, 0x00fb0007,
+  0x00fb800d, 0x00fc0007, 0x00fc8007, 0x00fd0007, 0x00fd8004, 0x00fdb001,
+  0x00fdf000, 0x00fe1002, 0x00fe3001, 0x00fe8003, 0x00feb001, 0x00ff0007,
+  0x00ff9002, 0x00ffb001, 0x01085000, 0x01087001, 0x01089800, 0x01097800,
+  0x0109a000, 0x0109c800, 0x0109e001, 0x010a3003, 0x010a7000, 0x010c2000,
+  0x0161802f, 0x01630800, 0x01632801, 0x01634000, 0x01635000, 0x01636000,
+  0x01638800, 0x01639801, 0x0163b005, 0x01640800, 0x01641800, 0x01642800,
+  0x01643800, 0x01644800, 0x01645800, 0x01646800, 0x01647800, 0x01648800,
+  0x01649800, 0x0164a800, 0x0164b800, 0x0164c800, 0x0164d800, 0x0164e800,
+  0x0164f800, 0x01650800, 0x01651800, 0x01652800, 0x01653800, 0x01654800,
+  0x01655800, 0x01656800, 0x01657800, 0x01658800, 0x01659800, 0x0165a800,
+  0x0165b800, 0x0165c800, 0x0165d800, 0x0165e800, 0x0165f800, 0x01660800,
+  0x01661800, 0x01662800, 0x01663800, 0x01664800, 0x01665800, 0x01666800,
+  0x01667800, 0x01668800, 0x01669800, 0x0166a800, 0x0166b800, 0x0166c800,
+  0x0166d800, 0x0166e800, 0x0166f800, 0x01670800, 0x01671801, 0x01676000,
+  0x01677000, 0x01679800, 0x01680025, 0x01693800, 0x01696800, 0x05320800,
+  0x05321800, 0x05322800, 0x05323800, 0x05324800, 0x05325800, 0x05326800,
+  0x05327800, 0x05328800, 0x05329800, 0x0532a800, 0x0532b800, 0x0532c800,
+  0x0532d800, 0x0532e800, 0x0532f800, 0x05330800, 0x05331800, 0x05332800,
+  0x05333800, 0x05334800, 0x05335800, 0x05336800, 0x05340800, 0x05341800,
+  0x05342800, 0x05343800, 0x05344800, 0x05345800, 0x05346800, 0x05347800,
+  0x05348800, 0x05349800, 0x0534a800, 0x0534b800, 0x0534c800, 0x0534d800,
+  0x05391800, 0x05392800, 0x05393800, 0x05394800, 0x05395800, 0x05396800,
+  0x05397802, 0x05399800, 0x0539a800, 0x0539b800, 0x0539c800, 0x0539d800,
+  0x0539e800, 0x0539f800, 0x053a0800, 0x053a1800, 0x053a2800, 0x053a3800,
+  0x053a4800, 0x053a5800, 0x053a6800, 0x053a7800, 0x053a8800, 0x053a9800,
+  0x053aa800, 0x053ab800, 0x053ac800, 0x053ad800, 0x053ae800, 0x053af800,
+  0x053b0800, 0x053b1800, 0x053b2800, 0x053b3800, 0x053b4800, 0x053b5800,
+  0x053b6800, 0x053b7800, 0x053b8807, 0x053bd000, 0x053be000, 0x053bf800,
+  0x053c0800, 0x053c1800, 0x053c2800, 0x053c3800, 0x053c6000, 0x053c7000,
+  0x053c8800, 0x053c9802, 0x053cb800, 0x053cc800, 0x053cd800, 0x053ce800,
+  0x053cf800, 0x053d0800, 0x053d1800, 0x053d2800, 0x053d3800, 0x053d4800,
+  0x053d7800, 0x053da800, 0x053db800, 0x053dc800, 0x053dd800, 0x053de800,
+  0x053df800, 0x053e0800, 0x053e1800, 0x053e4000, 0x053e5000, 0x053e6800,
+  0x053e8800, 0x053e9800, 0x053ea800, 0x053eb800, 0x053ec800, 0x053ed800,
+  0x053fb000, 0x053fd000, 0x0559802a, 0x055b0008, 0x055b804f, 0x07d80006,
+  0x07d89804, 0x07fa0819, 0x08214027, 0x0826c023, 0x082cb80a, 0x082d180e,
+  0x082d9806, 0x082dd801, 0x08660032, 0x086b8015, 0x08c6001f, 0x0b73001f,
+  0x0ea0d019, 0x0ea27006, 0x0ea2b011, 0x0ea41019, 0x0ea5b003, 0x0ea5d800,
+  0x0ea5e806, 0x0ea6280a, 0x0ea75019, 0x0ea8f019, 0x0eaa9019, 0x0eac3019,
+  0x0eadd019, 0x0eaf7019, 0x0eb11019, 0x0eb2b019, 0x0eb4501b, 0x0eb61018,
+  0x0eb6e005, 0x0eb7e018, 0x0eb8b005, 0x0eb9b018, 0x0eba8005, 0x0ebb8018,
+  0x0ebc5005, 0x0ebd5018, 0x0ebe2005, 0x0ebe5800, 0x0ef80009, 0x0ef85813,
+  0x0ef92805, 0x0f491021,
+  /* Lm */
+  0x00158011, 0x0016300b, 0x00170004, 0x00176000, 0x00177000, 0x001ba000,
+  0x001bd000, 0x002ac800, 0x00320000, 0x00372801, 0x003fa001, 0x003fd000,
+  0x0040d000, 0x00412000, 0x00414000, 0x00464800, 0x004b8800, 0x00723000,
+  0x00763000, 0x0087e000, 0x00beb800, 0x00c21800, 0x00d53800, 0x00e3c005,
+  0x00e9603e, 0x00ebc000, 0x00ecd824, 0x01038800, 0x0103f800, 0x0104800c,
+  0x0163e001, 0x016b7800, 0x01717800, 0x01802800, 0x01818804, 0x0181d800,
+  0x0184e801, 0x0187e002, 0x0500a800, 0x0527c005, 0x05306000, 0x0533f800,
+  0x0534e001, 0x0538b808, 0x053b8000, 0x053c4000, 0x053f9002, 0x053fc001,
+  0x054e7800, 0x054f3000, 0x05538000, 0x0556e800, 0x05579801, 0x055ae003,
+  0x055b4800, 0x07fb8000, 0x07fcf001, 0x083c0005, 0x083c3829, 0x083d9008,
+  0x086a7000, 0x086b7800, 0x0b5a0003, 0x0b6a0002, 0x0b6b5801, 0x0b7c980c,
+  0x0b7f0001, 0x0b7f1800, 0x0d7f8003, 0x0d7fa806, 0x0d7fe801, 0x0f01803d,
+  0x0f09b806, 0x0f275800, 0x0f4a5800,
+  /* Lo */
+  0x00055000, 0x0005d000, 0x000dd800, 0x000e0003, 0x0014a000, 0x002e801a,
+  0x002f7803, 0x0031001f, 0x00320809, 0x00337001, 0x00338862, 0x0036a800,
+  0x00377001, 0x0037d002, 0x0037f800, 0x00388000, 0x0038901d, 0x003a6858,
+  0x003d8800, 0x003e5020, 0x00400015, 0x00420018, 0x0043000a, 0x00438017,
+  0x00444805, 0x00450028, 0x00482035, 0x0049e800, 0x004a8000, 0x004ac009,
+  0x004b900e, 0x004c2807, 0x004c7801, 0x004c9815, 0x004d5006, 0x004d9000,
+  0x004db003, 0x004de800, 0x004e7000, 0x004ee001, 0x004ef802, 0x004f8001,
+  0x004fe000, 0x00502805, 0x00507801, 0x00509815, 0x00515006, 0x00519001,
+  0x0051a801, 0x0051c001, 0x0052c803, 0x0052f000, 0x00539002, 0x00542808,
+  0x00547802, 0x00549815, 0x00555006, 0x00559001, 0x0055a804, 0x0055e800,
+  0x00568000, 0x00570001, 0x0057c800, 0x00582807, 0x00587801, 0x00589815,
+  0x00595006, 0x00599001, 0x0059a804, 0x0059e800, 0x005ae001, 0x005af802,
+  0x005b8800, 0x005c1800, 0x005c2805, 0x005c7002, 0x005c9003, 0x005cc801,
+  0x005ce000, 0x005cf001, 0x005d1801, 0x005d4002, 0x005d700b, 0x005e8000,
+  0x00602807, 0x00607002, 0x00609016, 0x0061500f, 0x0061e800, 0x0062c002,
+  0x0062e800, 0x00630001, 0x00640000, 0x00642807, 0x00647002, 0x00649016,
+  0x00655009, 0x0065a804, 0x0065e800, 0x0066e801, 0x00670001, 0x00678801,
+  0x00682008, 0x00687002, 0x00689028, 0x0069e800, 0x006a7000, 0x006aa002,
+  0x006af802, 0x006bd005, 0x006c2811, 0x006cd017, 0x006d9808, 0x006de800,
+  0x006e0006, 0x0070082f, 0x00719001, 0x00720005, 0x00740801, 0x00742000,
+  0x00743004, 0x00746017, 0x00752800, 0x00753809, 0x00759001, 0x0075e800,
+  0x00760004, 0x0076e003, 0x00780000, 0x007a0007, 0x007a4823, 0x007c4004,
+  0x0080002a, 0x0081f800, 0x00828005, 0x0082d003, 0x00830800, 0x00832801,
+  0x00837002, 0x0083a80c, 0x00847000, 0x00880148, 0x00925003, 0x00928006,
+  0x0092c000, 0x0092d003, 0x00930028, 0x00945003, 0x00948020, 0x00959003,
+  0x0095c006, 0x00960000, 0x00961003, 0x0096400e, 0x0096c038, 0x00989003,
+  0x0098c042, 0x009c000f, 0x00a00a6b, 0x00b37810, 0x00b40819, 0x00b5004a,
+  0x00b78807, 0x00b80011, 0x00b8f812, 0x00ba0011, 0x00bb000c, 0x00bb7002,
+  0x00bc0033, 0x00bee000, 0x00c10022, 0x00c22034, 0x00c40004, 0x00c43821,
+  0x00c55000, 0x00c58045, 0x00c8001e, 0x00ca801d, 0x00cb8004, 0x00cc002b,
+  0x00cd8019, 0x00d00016, 0x00d10034, 0x00d8282e, 0x00da2807, 0x00dc181d,
+  0x00dd7001, 0x00ddd02b, 0x00e00023, 0x00e26802, 0x00e2d01d, 0x00e74803,
+  0x00e77005, 0x00e7a801, 0x00e7d000, 0x0109a803, 0x01698037, 0x016c0016,
+  0x016d0006, 0x016d4006, 0x016d8006, 0x016dc006, 0x016e0006, 0x016e4006,
+  0x016e8006, 0x016ec006, 0x01803000, 0x0181e000, 0x01820855, 0x0184f800,
+  0x01850859, 0x0187f800, 0x0188282a, 0x0189885d, 0x018d001f, 0x018f800f,
+  0x01a007ff, 0x01e007ff, 0x022007ff, 0x026001bf, 0x027007ff, 0x02b007ff,
+  0x02f007ff, 0x033007ff, 0x037007ff, 0x03b007ff, 0x03f007ff, 0x043007ff,
+  0x047007ff, 0x04b007ff, 0x04f00214, 0x0500b476, 0x05268027, 0x0528010b,
+  0x0530800f, 0x05315001, 0x05337000, 0x05350045, 0x053c7800, 0x053fb800,
+  0x053fd806, 0x05401802, 0x05403803, 0x05406016, 0x05420033, 0x05441031,
+  0x05479005, 0x0547d800, 0x0547e801, 0x0548501b, 0x05498016, 0x054b001c,
+  0x054c202e, 0x054f0004, 0x054f3808, 0x054fd004, 0x05500028, 0x05520002,
+  0x05522007, 0x0553000f, 0x05538805, 0x0553d000, 0x0553f031, 0x05558800,
+  0x0555a801, 0x0555c804, 0x05560000, 0x05561000, 0x0556d801, 0x0557000a,
+  0x05579000, 0x05580805, 0x05584805, 0x05588805, 0x05590006, 0x05594006,
+  0x055e0022, 0x056007ff, 0x05a007ff, 0x05e007ff, 0x062007ff, 0x066007ff,
+  0x06a003a3, 0x06bd8016, 0x06be5830, 0x07c8016d, 0x07d38069, 0x07d8e800,
+  0x07d8f809, 0x07d9500c, 0x07d9c004, 0x07d9f000, 0x07da0001, 0x07da1801,
+  0x07da306b, 0x07de996a, 0x07ea803f, 0x07ec9035, 0x07ef800b, 0x07f38004,
+  0x07f3b086, 0x07fb3009, 0x07fb882c, 0x07fd001e, 0x07fe1005, 0x07fe5005,
+  0x07fe9005, 0x07fed002, 0x0800000b, 0x08006819, 0x08014012, 0x0801e001,
+  0x0801f80e, 0x0802800d, 0x0804007a, 0x0814001c, 0x08150030, 0x0818001f,
+  0x08196813, 0x081a1007, 0x081a8025, 0x081c001d, 0x081d0023, 0x081e4007,
+  0x0822804d, 0x08280027, 0x08298033, 0x082e0033, 0x08300136, 0x083a0015,
+  0x083b0007, 0x08400005, 0x08404000, 0x0840502b, 0x0841b801, 0x0841e000,
+  0x0841f816, 0x08430016, 0x0844001e, 0x08470012, 0x0847a001, 0x08480015,
+  0x08490019, 0x084c0037, 0x084df001, 0x08500000, 0x08508003, 0x0850a802,
+  0x0850c81c, 0x0853001c, 0x0854001c, 0x08560007, 0x0856481b, 0x08580035,
+  0x085a0015, 0x085b0012, 0x085c0011, 0x08600048, 0x08680023, 0x086a5003,
+  0x086a7800, 0x08740029, 0x08758001, 0x08761002, 0x0878001c, 0x08793800,
+  0x08798015, 0x087b8011, 0x087d8014, 0x087f0016, 0x08801834, 0x08838801,
+  0x0883a800, 0x0884182c, 0x08868018, 0x08881823, 0x088a2000, 0x088a3800,
+  0x088a8022, 0x088bb000, 0x088c182f, 0x088e0803, 0x088ed000, 0x088ee000,
+  0x08900011, 0x08909818, 0x0891f801, 0x08940006, 0x08944000, 0x08945003,
+  0x0894780e, 0x0894f809, 0x0895802e, 0x08982807, 0x08987801, 0x08989815,
+  0x08995006, 0x08999001, 0x0899a804, 0x0899e800, 0x089a8000, 0x089ae804,
+  0x089c0009, 0x089c5800, 0x089c7000, 0x089c8025, 0x089db800, 0x089e8800,
+  0x089e9800, 0x08a00034, 0x08a23803, 0x08a2f802, 0x08a4002f, 0x08a62001,
+  0x08a63800, 0x08ac002e, 0x08aec003, 0x08b0002f, 0x08b22000, 0x08b4002a,
+  0x08b5c000, 0x08b8001a, 0x08ba0006, 0x08c0002b, 0x08c7f807, 0x08c84800,
+  0x08c86007, 0x08c8a801, 0x08c8c017, 0x08c9f800, 0x08ca0800, 0x08cd0007,
+  0x08cd5026, 0x08cf0800, 0x08cf1800, 0x08d00000, 0x08d05827, 0x08d1d000,
+  0x08d28000, 0x08d2e02d, 0x08d4e800, 0x08d58048, 0x08de0020, 0x08e00008,
+  0x08e05024, 0x08e20000, 0x08e3901d, 0x08e80006, 0x08e84001, 0x08e85825,
+  0x08ea3000, 0x08eb0005, 0x08eb3801, 0x08eb501f, 0x08ecc000, 0x08f70012,
+  0x08f81000, 0x08f8200c, 0x08f89021, 0x08fd8000, 0x09000399, 0x092400c3,
+  0x097c8060, 0x0980042f, 0x09a20805, 0x09a307ff, 0x09e3079a, 0x0a200246,
+  0x0b08001d, 0x0b400238, 0x0b52001e, 0x0b53804e, 0x0b56801d, 0x0b58002f,
+  0x0b5b1814, 0x0b5be812, 0x0b6a1827, 0x0b78004a, 0x0b7a8000, 0x0b8007ff,
+  0x0bc007ff, 0x0c0007f7, 0x0c4004d5, 0x0c67f809, 0x0d800122, 0x0d899000,
+  0x0d8a8002, 0x0d8aa800, 0x0d8b2003, 0x0d8b818b, 0x0de0006a, 0x0de3800c,
+  0x0de40008, 0x0de48009, 0x0ef85000, 0x0f08002c, 0x0f0a7000, 0x0f14801d,
+  0x0f16002b, 0x0f26801a, 0x0f2e801d, 0x0f2f8000, 0x0f3f0006, 0x0f3f4003,
+  0x0f3f6801, 0x0f3f800e, 0x0f4000c4, 0x0f700003, 0x0f70281a, 0x0f710801,
+  0x0f712000, 0x0f713800, 0x0f714809, 0x0f71a003, 0x0f71c800, 0x0f71d800,
+  0x0f721000, 0x0f723800, 0x0f724800, 0x0f725800, 0x0f726802, 0x0f728801,
+  0x0f72a000, 0x0f72b800, 0x0f72c800, 0x0f72d800, 0x0f72e800, 0x0f72f800,
+  0x0f730801, 0x0f732000, 0x0f733803, 0x0f736006, 0x0f73a003, 0x0f73c803,
+  0x0f73f000, 0x0f740009, 0x0f745810, 0x0f750802, 0x0f752804, 0x0f755810,
+  0x100007ff, 0x104007ff, 0x108007ff, 0x10c007ff, 0x110007ff, 0x114007ff,
+  0x118007ff, 0x11c007ff, 0x120007ff, 0x124007ff, 0x128007ff, 0x12c007ff,
+  0x130007ff, 0x134007ff, 0x138007ff, 0x13c007ff, 0x140007ff, 0x144007ff,
+  0x148007ff, 0x14c007ff, 0x150006df, 0x153807ff, 0x157807ff, 0x15b80039,
+  0x15ba00dd, 0x15c107ff, 0x160107ff, 0x16410681, 0x167587ff, 0x16b587ff,
+  0x16f587ff, 0x17358530, 0x175f826d, 0x17c0021d, 0x180007ff, 0x184007ff,
+  0x1880034a, 0x189a87ff, 0x18da87ff, 0x191a805f,
+  /* Lt */
+  0x000e2800, 0x000e4000, 0x000e5800, 0x000f9000, 0x00fc4007, 0x00fcc007,
+  0x00fd4007, 0x00fde000, 0x00fe6000, 0x00ffe000,
+  /* Lu */
+  0x00020819, 0x00060016, 0x0006c006, 0x00080000, 0x00081000, 0x00082000,
+  0x00083000, 0x00084000, 0x00085000, 0x00086000, 0x00087000, 0x00088000,
+  0x00089000, 0x0008a000, 0x0008b000, 0x0008c000, 0x0008d000, 0x0008e000,
+  0x0008f000, 0x00090000, 0x00091000, 0x00092000, 0x00093000, 0x00094000,
+  0x00095000, 0x00096000, 0x00097000, 0x00098000, 0x00099000, 0x0009a000,
+  0x0009b000, 0x0009c800, 0x0009d800, 0x0009e800, 0x0009f800, 0x000a0800,
+  0x000a1800, 0x000a2800, 0x000a3800, 0x000a5000, 0x000a6000, 0x000a7000,
+  0x000a8000, 0x000a9000, 0x000aa000, 0x000ab000, 0x000ac000, 0x000ad000,
+  0x000ae000, 0x000af000, 0x000b0000, 0x000b1000, 0x000b2000, 0x000b3000,
+  0x000b4000, 0x000b5000, 0x000b6000, 0x000b7000, 0x000b8000, 0x000b9000,
+  0x000ba000, 0x000bb000, 0x000bc001, 0x000bd800, 0x000be800, 0x000c0801,
+  0x000c2000, 0x000c3001, 0x000c4802, 0x000c7003, 0x000c9801, 0x000cb002,
+  0x000ce001, 0x000cf801, 0x000d1000, 0x000d2000, 0x000d3001, 0x000d4800,
+  0x000d6000, 0x000d7001, 0x000d8802, 0x000da800, 0x000db801, 0x000de000,
+  0x000e2000, 0x000e3800, 0x000e5000, 0x000e6800, 0x000e7800, 0x000e8800,
+  0x000e9800, 0x000ea800, 0x000eb800, 0x000ec800, 0x000ed800, 0x000ef000,
+  0x000f0000, 0x000f1000, 0x000f2000, 0x000f3000, 0x000f4000, 0x000f5000,
+  0x000f6000, 0x000f7000, 0x000f8800, 0x000fa000, 0x000fb002, 0x000fd000,
+  0x000fe000, 0x000ff000, 0x00100000, 0x00101000, 0x00102000, 0x00103000,
+  0x00104000, 0x00105000, 0x00106000, 0x00107000, 0x00108000, 0x00109000,
+  0x0010a000, 0x0010b000, 0x0010c000, 0x0010d000, 0x0010e000, 0x0010f000,
+  0x00110000, 0x00111000, 0x00112000, 0x00113000, 0x00114000, 0x00115000,
+  0x00116000, 0x00117000, 0x00118000, 0x00119000, 0x0011d001, 0x0011e801,
+  0x00120800, 0x00121803, 0x00124000, 0x00125000, 0x00126000, 0x00127000,
+  0x001b8000, 0x001b9000, 0x001bb000, 0x001bf800, 0x001c3000, 0x001c4002,
+  0x001c6000, 0x001c7001, 0x001c8810, 0x001d1808, 0x001e7800, 0x001e9002,
+  0x001ec000, 0x001ed000, 0x001ee000, 0x001ef000, 0x001f0000, 0x001f1000,
+  0x001f2000, 0x001f3000, 0x001f4000, 0x001f5000, 0x001f6000, 0x001f7000,
+  0x001fa000, 0x001fb800, 0x001fc801, 0x001fe832, 0x00230000, 0x00231000,
+  0x00232000, 0x00233000, 0x00234000, 0x00235000, 0x00236000, 0x00237000,
+  0x00238000, 0x00239000, 0x0023a000, 0x0023b000, 0x0023c000, 0x0023d000,
+  0x0023e000, 0x0023f000, 0x00240000, 0x00245000, 0x00246000, 0x00247000,
+  0x00248000, 0x00249000, 0x0024a000, 0x0024b000, 0x0024c000, 0x0024d000,
+  0x0024e000, 0x0024f000, 0x00250000, 0x00251000, 0x00252000, 0x00253000,
+  0x00254000, 0x00255000, 0x00256000, 0x00257000, 0x00258000, 0x00259000,
+  0x0025a000, 0x0025b000, 0x0025c000, 0x0025d000, 0x0025e000, 0x0025f000,
+  0x00260001, 0x00261800, 0x00262800, 0x00263800, 0x00264800, 0x00265800,
+  0x00266800, 0x00268000, 0x00269000, 0x0026a000, 0x0026b000, 0x0026c000,
+  0x0026d000, 0x0026e000, 0x0026f000, 0x00270000, 0x00271000, 0x00272000,
+  0x00273000, 0x00274000, 0x00275000, 0x00276000, 0x00277000, 0x00278000,
+  0x00279000, 0x0027a000, 0x0027b000, 0x0027c000, 0x0027d000, 0x0027e000,
+  0x0027f000, 0x00280000, 0x00281000, 0x00282000, 0x00283000, 0x00284000,
+  0x00285000, 0x00286000, 0x00287000, 0x00288000, 0x00289000, 0x0028a000,
+  0x0028b000, 0x0028c000, 0x0028d000, 0x0028e000, 0x0028f000, 0x00290000,
+  0x00291000, 0x00292000, 0x00293000, 0x00294000, 0x00295000, 0x00296000,
+  0x00297000, 0x00298825, 0x00850025, 0x00863800, 0x00866800, 0x009d0055,
+  0x00e44800, 0x00e4802a, 0x00e5e802, 0x00f00000, 0x00f01000, 0x00f02000,
+  0x00f03000, 0x00f04000, 0x00f05000, 0x00f06000, 0x00f07000, 0x00f08000,
+  0x00f09000, 0x00f0a000, 0x00f0b000, 0x00f0c000, 0x00f0d000, 0x00f0e000,
+  0x00f0f000, 0x00f10000, 0x00f11000, 0x00f12000, 0x00f13000, 0x00f14000,
+  0x00f15000, 0x00f16000, 0x00f17000, 0x00f18000, 0x00f19000, 0x00f1a000,
+  0x00f1b000, 0x00f1c000, 0x00f1d000, 0x00f1e000, 0x00f1f000, 0x00f20000,
+  0x00f21000, 0x00f22000, 0x00f23000, 0x00f24000, 0x00f25000, 0x00f26000,
+  0x00f27000, 0x00f28000, 0x00f29000, 0x00f2a000, 0x00f2b000, 0x00f2c000,
+  0x00f2d000, 0x00f2e000, 0x00f2f000, 0x00f30000, 0x00f31000, 0x00f32000,
+  0x00f33000, 0x00f34000, 0x00f35000, 0x00f36000, 0x00f37000, 0x00f38000,
+  0x00f39000, 0x00f3a000, 0x00f3b000, 0x00f3c000, 0x00f3d000, 0x00f3e000,
+  0x00f3f000, 0x00f40000, 0x00f41000, 0x00f42000, 0x00f43000, 0x00f44000,
+  0x00f45000, 0x00f46000, 0x00f47000, 0x00f48000, 0x00f49000, 0x00f4a000,
+  0x00f4f000, 0x00f50000, 0x00f51000, 0x00f52000, 0x00f53000, 0x00f54000,
+  0x00f55000, 0x00f56000, 0x00f57000, 0x00f58000, 0x00f59000, 0x00f5a000,
+  0x00f5b000, 0x00f5c000, 0x00f5d000, 0x00f5e000, 0x00f5f000, 0x00f60000,
+  0x00f61000, 0x00f62000, 0x00f63000, 0x00f64000, 0x00f65000, 0x00f66000,
+  0x00f67000, 0x00f68000, 0x00f69000, 0x00f6a000, 0x00f6b000, 0x00f6c000,
+  0x00f6d000, 0x00f6e000, 0x00f6f000, 0x00f70000, 0x00f71000, 0x00f72000,
+  0x00f73000, 0x00f74000, 0x00f75000, 0x00f76000, 0x00f77000, 0x00f78000,
+  0x00f79000, 0x00f7a000, 0x00f7b000, 0x00f7c000, 0x00f7d000, 0x00f7e000,
+  0x00f7f000, 0x00f84007, 0x00f8c005, 0x00f94007, 0x00f9c007, 0x00fa4005,
+  0x00fac800, 0x00fad800, 0x00fae800, 0x00faf800, 0x00fb4007, 0x00fdc003,
+  0x00fe4003, 0x00fec003, 0x00ff4004, 0x00ffc003, 0x01081000, 0x01083800,
+  0x01085802, 0x01088002, 0x0108a800, 0x0108c804, 0x01092000, 0x01093000,
+  0x01094000, 0x01095003, 0x01098003, 0x0109f001, 0x010a2800, 0x010c1800,
+  0x0160002f, 0x01630000, 0x01631002, 0x01633800, 0x01634800, 0x01635800,
+  0x01636803, 0x01639000, 0x0163a800, 0x0163f002, 0x01641000, 0x01642000,
+  0x01643000, 0x01644000, 0x01645000, 0x01646000, 0x01647000, 0x01648000,
+  0x01649000, 0x0164a000, 0x0164b000, 0x0164c000, 0x0164d000, 0x0164e000,
+  0x0164f000, 0x01650000, 0x01651000, 0x01652000, 0x01653000, 0x01654000,
+  0x01655000, 0x01656000, 0x01657000, 0x01658000, 0x01659000, 0x0165a000,
+  0x0165b000, 0x0165c000, 0x0165d000, 0x0165e000, 0x0165f000, 0x01660000,
+  0x01661000, 0x01662000, 0x01663000, 0x01664000, 0x01665000, 0x01666000,
+  0x01667000, 0x01668000, 0x01669000, 0x0166a000, 0x0166b000, 0x0166c000,
+  0x0166d000, 0x0166e000, 0x0166f000, 0x01670000, 0x01671000, 0x01675800,
+  0x01676800, 0x01679000, 0x05320000, 0x05321000, 0x05322000, 0x05323000,
+  0x05324000, 0x05325000, 0x05326000, 0x05327000, 0x05328000, 0x05329000,
+  0x0532a000, 0x0532b000, 0x0532c000, 0x0532d000, 0x0532e000, 0x0532f000,
+  0x05330000, 0x05331000, 0x05332000, 0x05333000, 0x05334000, 0x05335000,
+  0x05336000, 0x05340000, 0x05341000, 0x05342000, 0x05343000, 0x05344000,
+  0x05345000, 0x05346000, 0x05347000, 0x05348000, 0x05349000, 0x0534a000,
+  0x0534b000, 0x0534c000, 0x0534d000, 0x05391000, 0x05392000, 0x05393000,
+  0x05394000, 0x05395000, 0x05396000, 0x05397000, 0x05399000, 0x0539a000,
+  0x0539b000, 0x0539c000, 0x0539d000, 0x0539e000, 0x0539f000, 0x053a0000,
+  0x053a1000, 0x053a2000, 0x053a3000, 0x053a4000, 0x053a5000, 0x053a6000,
+  0x053a7000, 0x053a8000, 0x053a9000, 0x053aa000, 0x053ab000, 0x053ac000,
+  0x053ad000, 0x053ae000, 0x053af000, 0x053b0000, 0x053b1000, 0x053b2000,
+  0x053b3000, 0x053b4000, 0x053b5000, 0x053b6000, 0x053b7000, 0x053bc800,
+  0x053bd800, 0x053be801, 0x053c0000, 0x053c1000, 0x053c2000, 0x053c3000,
+  0x053c5800, 0x053c6800, 0x053c8000, 0x053c9000, 0x053cb000, 0x053cc000,
+  0x053cd000, 0x053ce000, 0x053cf000, 0x053d0000, 0x053d1000, 0x053d2000,
+  0x053d3000, 0x053d4000, 0x053d5004, 0x053d8004, 0x053db000, 0x053dc000,
+  0x053dd000, 0x053de000, 0x053df000, 0x053e0000, 0x053e1000, 0x053e2003,
+  0x053e4800, 0x053e5801, 0x053e8000, 0x053eb000, 0x053ec000, 0x053ed000,
+  0x053ee000, 0x053fa800, 0x07f90819, 0x08200027, 0x08258023, 0x082b800a,
+  0x082be00e, 0x082c6006, 0x082ca001, 0x08640032, 0x086a8015, 0x08c5001f,
+  0x0b72001f, 0x0ea00019, 0x0ea1a019, 0x0ea34019, 0x0ea4e000, 0x0ea4f001,
+  0x0ea51000, 0x0ea52801, 0x0ea54803, 0x0ea57007, 0x0ea68019, 0x0ea82001,
+  0x0ea83803, 0x0ea86807, 0x0ea8b006, 0x0ea9c001, 0x0ea9d803, 0x0eaa0004,
+  0x0eaa3000, 0x0eaa5006, 0x0eab6019, 0x0ead0019, 0x0eaea019, 0x0eb04019,
+  0x0eb1e019, 0x0eb38019, 0x0eb54018, 0x0eb71018, 0x0eb8e018, 0x0ebab018,
+  0x0ebc8018, 0x0ebe5000, 0x0f480021,
+  /* Mc */
+  0x00481800, 0x0049d800, 0x0049f002, 0x004a4803, 0x004a7001, 0x004c1001,
+  0x004df002, 0x004e3801, 0x004e5801, 0x004eb800, 0x00501800, 0x0051f002,
+  0x00541800, 0x0055f002, 0x00564800, 0x00565801, 0x00581001, 0x0059f000,
+  0x005a0000, 0x005a3801, 0x005a5801, 0x005ab800, 0x005df001, 0x005e0801,
+  0x005e3002, 0x005e5002, 0x005eb800, 0x00600802, 0x00620803, 0x00641001,
+  0x0065f000, 0x00660004, 0x00663801, 0x00665001, 0x0066a801, 0x00679800,
+  0x00681001, 0x0069f002, 0x006a3002, 0x006a5002, 0x006ab800, 0x006c1001,
+  0x006e7802, 0x006ec007, 0x006f9001, 0x0079f001, 0x007bf800, 0x00815801,
+  0x00818800, 0x0081c000, 0x0081d801, 0x0082b001, 0x00831002, 0x00833806,
+  0x00841801, 0x00843805, 0x00847800, 0x0084d002, 0x00b8a800, 0x00b9a000,
+  0x00bdb000, 0x00bdf007, 0x00be3801, 0x00c91803, 0x00c94802, 0x00c98001,
+  0x00c99805, 0x00d0c801, 0x00d2a800, 0x00d2b800, 0x00d30800, 0x00d31801,
+  0x00d36805, 0x00d82000, 0x00d9a800, 0x00d9d800, 0x00d9e804, 0x00da1801,
+  0x00dc1000, 0x00dd0800, 0x00dd3001, 0x00dd5000, 0x00df3800, 0x00df5002,
+  0x00df7000, 0x00df9001, 0x00e12007, 0x00e1a001, 0x00e70800, 0x00e7b800,
+  0x01817001, 0x05411801, 0x05413800, 0x05440001, 0x0545a00f, 0x054a9001,
+  0x054c1800, 0x054da001, 0x054dd001, 0x054df002, 0x05517801, 0x05519801,
+  0x05526800, 0x0553d800, 0x0553e800, 0x05575800, 0x05577001, 0x0557a800,
+  0x055f1801, 0x055f3001, 0x055f4801, 0x055f6000, 0x08800000, 0x08801000,
+  0x08841000, 0x08858002, 0x0885b801, 0x08896000, 0x088a2801, 0x088c1000,
+  0x088d9802, 0x088df801, 0x088e7000, 0x08916002, 0x08919001, 0x0891a800,
+  0x08970002, 0x08981001, 0x0899f001, 0x089a0803, 0x089a3801, 0x089a5802,
+  0x089ab800, 0x089b1001, 0x089dc002, 0x089e1000, 0x089e2800, 0x089e3803,
+  0x089e6001, 0x089e7800, 0x08a1a802, 0x08a20001, 0x08a22800, 0x08a58002,
+  0x08a5c800, 0x08a5d803, 0x08a60800, 0x08ad7802, 0x08adc003, 0x08adf000,
+  0x08b18002, 0x08b1d801, 0x08b1f000, 0x08b56000, 0x08b57001, 0x08b5b000,
+  0x08b8f000, 0x08b90001, 0x08b93000, 0x08c16002, 0x08c1c000, 0x08c98005,
+  0x08c9b801, 0x08c9e800, 0x08ca0000, 0x08ca1000, 0x08ce8802, 0x08cee003,
+  0x08cf2000, 0x08d1c800, 0x08d2b801, 0x08d4b800, 0x08e17800, 0x08e1f000,
+  0x08e54800, 0x08e58800, 0x08e5a000, 0x08ec5004, 0x08ec9801, 0x08ecb000,
+  0x08f7a801, 0x08f81800, 0x08f9a001, 0x08f9f001, 0x08fa0800, 0x0b095002,
+  0x0b7a8836, 0x0b7f8001, 0x0e8b2801, 0x0e8b6805,
+  /* Me */
+  0x00244001, 0x00d5f000, 0x0106e803, 0x01071002, 0x05338002,
+  /* Mn */
+  0x0018006f, 0x00241804, 0x002c882c, 0x002df800, 0x002e0801, 0x002e2001,
+  0x002e3800, 0x0030800a, 0x00325814, 0x00338000, 0x0036b006, 0x0036f805,
+  0x00373801, 0x00375003, 0x00388800, 0x0039801a, 0x003d300a, 0x003f5808,
+  0x003fe800, 0x0040b003, 0x0040d808, 0x00412802, 0x00414804, 0x0042c802,
+  0x0044b808, 0x00465017, 0x0047181f, 0x0049d000, 0x0049e000, 0x004a0807,
+  0x004a6800, 0x004a8806, 0x004b1001, 0x004c0800, 0x004de000, 0x004e0803,
+  0x004e6800, 0x004f1001, 0x004ff000, 0x00500801, 0x0051e000, 0x00520801,
+  0x00523801, 0x00525802, 0x00528800, 0x00538001, 0x0053a800, 0x00540801,
+  0x0055e000, 0x00560804, 0x00563801, 0x00566800, 0x00571001, 0x0057d005,
+  0x00580800, 0x0059e000, 0x0059f800, 0x005a0803, 0x005a6800, 0x005aa801,
+  0x005b1001, 0x005c1000, 0x005e0000, 0x005e6800, 0x00600000, 0x00602000,
+  0x0061e000, 0x0061f002, 0x00623002, 0x00625003, 0x0062a801, 0x00631001,
+  0x00640800, 0x0065e000, 0x0065f800, 0x00663000, 0x00666001, 0x00671001,
+  0x00680001, 0x0069d801, 0x006a0803, 0x006a6800, 0x006b1001, 0x006c0800,
+  0x006e5000, 0x006e9002, 0x006eb000, 0x00718800, 0x0071a006, 0x00723807,
+  0x00758800, 0x0075a008, 0x00764006, 0x0078c001, 0x0079a800, 0x0079b800,
+  0x0079c800, 0x007b880d, 0x007c0004, 0x007c3001, 0x007c680a, 0x007cc823,
+  0x007e3000, 0x00816803, 0x00819005, 0x0081c801, 0x0081e801, 0x0082c001,
+  0x0082f002, 0x00838803, 0x00841000, 0x00842801, 0x00846800, 0x0084e800,
+  0x009ae802, 0x00b89002, 0x00b99001, 0x00ba9001, 0x00bb9001, 0x00bda001,
+  0x00bdb806, 0x00be3000, 0x00be480a, 0x00bee800, 0x00c05802, 0x00c07800,
+  0x00c42801, 0x00c54800, 0x00c90002, 0x00c93801, 0x00c99000, 0x00c9c802,
+  0x00d0b801, 0x00d0d800, 0x00d2b000, 0x00d2c006, 0x00d30000, 0x00d31000,
+  0x00d32807, 0x00d39809, 0x00d3f800, 0x00d5800d, 0x00d5f80f, 0x00d80003,
+  0x00d9a000, 0x00d9b004, 0x00d9e000, 0x00da1000, 0x00db5808, 0x00dc0001,
+  0x00dd1003, 0x00dd4001, 0x00dd5802, 0x00df3000, 0x00df4001, 0x00df6800,
+  0x00df7802, 0x00e16007, 0x00e1b001, 0x00e68002, 0x00e6a00c, 0x00e71006,
+  0x00e76800, 0x00e7a000, 0x00e7c001, 0x00ee003f, 0x0106800c, 0x01070800,
+  0x0107280b, 0x01677802, 0x016bf800, 0x016f001f, 0x01815003, 0x0184c801,
+  0x05337800, 0x0533a009, 0x0534f001, 0x05378001, 0x05401000, 0x05403000,
+  0x05405800, 0x05412801, 0x05416000, 0x05462001, 0x05470011, 0x0547f800,
+  0x05493007, 0x054a380a, 0x054c0002, 0x054d9800, 0x054db003, 0x054de001,
+  0x054f2800, 0x05514805, 0x05518801, 0x0551a801, 0x05521800, 0x05526000,
+  0x0553e000, 0x05558000, 0x05559002, 0x0555b801, 0x0555f001, 0x05560800,
+  0x05576001, 0x0557b000, 0x055f2800, 0x055f4000, 0x055f6800, 0x07d8f000,
+  0x07f0000f, 0x07f1000f, 0x080fe800, 0x08170000, 0x081bb004, 0x08500802,
+  0x08502801, 0x08506003, 0x0851c002, 0x0851f800, 0x08572801, 0x08692003,
+  0x086b4804, 0x08755801, 0x0877e003, 0x087a300a, 0x087c1003, 0x08800800,
+  0x0881c00e, 0x08838000, 0x08839801, 0x0883f802, 0x08859803, 0x0885c801,
+  0x08861000, 0x08880002, 0x08893804, 0x08896807, 0x088b9800, 0x088c0001,
+  0x088db008, 0x088e4803, 0x088e7800, 0x08917802, 0x0891a000, 0x0891b001,
+  0x0891f000, 0x08920800, 0x0896f800, 0x08971807, 0x08980001, 0x0899d801,
+  0x089a0000, 0x089b3006, 0x089b8004, 0x089dd805, 0x089e7000, 0x089e8000,
+  0x089e9000, 0x089f0801, 0x08a1c007, 0x08a21002, 0x08a23000, 0x08a2f000,
+  0x08a59805, 0x08a5d000, 0x08a5f801, 0x08a61001, 0x08ad9003, 0x08ade001,
+  0x08adf801, 0x08aee001, 0x08b19807, 0x08b1e800, 0x08b1f801, 0x08b55800,
+  0x08b56800, 0x08b58005, 0x08b5b800, 0x08b8e800, 0x08b8f800, 0x08b91003,
+  0x08b93804, 0x08c17808, 0x08c1c801, 0x08c9d801, 0x08c9f000, 0x08ca1800,
+  0x08cea003, 0x08ced001, 0x08cf0000, 0x08d00809, 0x08d19805, 0x08d1d803,
+  0x08d23800, 0x08d28805, 0x08d2c802, 0x08d4500c, 0x08d4c001, 0x08e18006,
+  0x08e1c005, 0x08e1f800, 0x08e49015, 0x08e55006, 0x08e59001, 0x08e5a801,
+  0x08e98805, 0x08e9d000, 0x08e9e001, 0x08e9f806, 0x08ea3800, 0x08ec8001,
+  0x08eca800, 0x08ecb800, 0x08f79801, 0x08f80001, 0x08f9b004, 0x08fa0000,
+  0x08fa1000, 0x08fad000, 0x09a20000, 0x09a2380e, 0x0b08f00b, 0x0b096802,
+  0x0b578004, 0x0b598006, 0x0b7a7800, 0x0b7c7803, 0x0b7f2000, 0x0de4e801,
+  0x0e78002d, 0x0e798016, 0x0e8b3802, 0x0e8bd807, 0x0e8c2806, 0x0e8d5003,
+  0x0e921002, 0x0ed00036, 0x0ed1d831, 0x0ed3a800, 0x0ed42000, 0x0ed4d804,
+  0x0ed5080e, 0x0f000006, 0x0f004010, 0x0f00d806, 0x0f011801, 0x0f013004,
+  0x0f047800, 0x0f098006, 0x0f157000, 0x0f176003, 0x0f276003, 0x0f2f7001,
+  0x0f468006, 0x0f4a2006, 0x700800ef,
+  /* Nd */
+  0x00018009, 0x00330009, 0x00378009, 0x003e0009, 0x004b3009, 0x004f3009,
+  0x00533009, 0x00573009, 0x005b3009, 0x005f3009, 0x00633009, 0x00673009,
+  0x006b3009, 0x006f3009, 0x00728009, 0x00768009, 0x00790009, 0x00820009,
+  0x00848009, 0x00bf0009, 0x00c08009, 0x00ca3009, 0x00ce8009, 0x00d40009,
+  0x00d48009, 0x00da8009, 0x00dd8009, 0x00e20009, 0x00e28009, 0x05310009,
+  0x05468009, 0x05480009, 0x054e8009, 0x054f8009, 0x05528009, 0x055f8009,
+  0x07f88009, 0x08250009, 0x08698009, 0x086a0009, 0x08833009, 0x08878009,
+  0x0889b009, 0x088e8009, 0x08978009, 0x08a28009, 0x08a68009, 0x08b28009,
+  0x08b60009, 0x08b68013, 0x08b98009, 0x08c70009, 0x08ca8009, 0x08df8009,
+  0x08e28009, 0x08ea8009, 0x08ed0009, 0x08fa8009, 0x0b098009, 0x0b530009,
+  0x0b560009, 0x0b5a8009, 0x0b6b8009, 0x0e678009, 0x0ebe7031, 0x0f0a0009,
+  0x0f178009, 0x0f278009, 0x0f2f8809, 0x0f4a8009, 0x0fdf8009,
+  /* Nl */
+  0x00b77002, 0x010b0022, 0x010c2803, 0x01803800, 0x01810808, 0x0181c002,
+  0x05373009, 0x080a0034, 0x081a0800, 0x081a5000, 0x081e8804, 0x0920006e,
+  /* No */
+  0x00059001, 0x0005c800, 0x0005e002, 0x004fa005, 0x005b9005, 0x005f8002,
+  0x0063c006, 0x006ac006, 0x006b8008, 0x00795009, 0x009b4813, 0x00bf8009,
+  0x00ced000, 0x01038000, 0x0103a005, 0x01040009, 0x010a800f, 0x010c4800,
+  0x0123003b, 0x01275015, 0x013bb01d, 0x0167e800, 0x018c9003, 0x01910009,
+  0x01924007, 0x0192880e, 0x01940009, 0x0195880e, 0x05418005, 0x0808382c,
+  0x080ba803, 0x080c5001, 0x0817081a, 0x08190003, 0x0842c007, 0x0843c806,
+  0x08453808, 0x0847d804, 0x0848b005, 0x084de001, 0x084e000f, 0x084e902d,
+  0x08520008, 0x0853e801, 0x0854e802, 0x08575804, 0x085ac007, 0x085bc007,
+  0x085d4806, 0x0867d005, 0x0873001e, 0x0878e809, 0x087a8803, 0x087e2806,
+  0x08829013, 0x088f0813, 0x08b9d001, 0x08c75008, 0x08e2d012, 0x08fe0014,
+  0x0b5ad806, 0x0b740016, 0x0e960013, 0x0e970013, 0x0e9b0018, 0x0f463808,
+  0x0f63883a, 0x0f656802, 0x0f658803, 0x0f68082c, 0x0f69780e, 0x0f88000c,
+  /* Pc */
+  0x0002f800, 0x0101f801, 0x0102a000, 0x07f19801, 0x07f26802, 0x07f9f800,
+  /* Pd */
+  0x00016800, 0x002c5000, 0x002df000, 0x00a00000, 0x00c03000, 0x01008005,
+  0x0170b800, 0x0170d000, 0x0171d001, 0x01720000, 0x0172e800, 0x0180e000,
+  0x01818000, 0x01850000, 0x07f18801, 0x07f2c000, 0x07f31800, 0x07f86800,
+  0x086b7000, 0x08756800,
+  /* Pe */
+  0x00014800, 0x0002e800, 0x0003e800, 0x0079d800, 0x0079e800, 0x00b4e000,
+  0x01023000, 0x0103f000, 0x01047000, 0x01184800, 0x01185800, 0x01195000,
+  0x013b4800, 0x013b5800, 0x013b6800, 0x013b7800, 0x013b8800, 0x013b9800,
+  0x013ba800, 0x013e3000, 0x013f3800, 0x013f4800, 0x013f5800, 0x013f6800,
+  0x013f7800, 0x014c2000, 0x014c3000, 0x014c4000, 0x014c5000, 0x014c6000,
+  0x014c7000, 0x014c8000, 0x014c9000, 0x014ca000, 0x014cb000, 0x014cc000,
+  0x014ec800, 0x014ed800, 0x014fe800, 0x01711800, 0x01712800, 0x01713800,
+  0x01714800, 0x0172b000, 0x0172c000, 0x0172d000, 0x0172e000, 0x01804800,
+  0x01805800, 0x01806800, 0x01807800, 0x01808800, 0x0180a800, 0x0180b800,
+  0x0180c800, 0x0180d800, 0x0180f001, 0x07e9f000, 0x07f0c000, 0x07f1b000,
+  0x07f1c000, 0x07f1d000, 0x07f1e000, 0x07f1f000, 0x07f20000, 0x07f21000,
+  0x07f22000, 0x07f24000, 0x07f2d000, 0x07f2e000, 0x07f2f000, 0x07f84800,
+  0x07f9e800, 0x07fae800, 0x07fb0000, 0x07fb1800,
+  /* Pf */
+  0x0005d800, 0x0100c800, 0x0100e800, 0x0101d000, 0x01701800, 0x01702800,
+  0x01705000, 0x01706800, 0x0170e800, 0x01710800,
+  /* Pi */
+  0x00055800, 0x0100c000, 0x0100d801, 0x0100f800, 0x0101c800, 0x01701000,
+  0x01702000, 0x01704800, 0x01706000, 0x0170e000, 0x01710000,
+  /* Po */
+  0x00010802, 0x00012802, 0x00015000, 0x00016000, 0x00017001, 0x0001d001,
+  0x0001f801, 0x0002e000, 0x00050800, 0x00053800, 0x0005b001, 0x0005f800,
+  0x001bf000, 0x001c3800, 0x002ad005, 0x002c4800, 0x002e0000, 0x002e1800,
+  0x002e3000, 0x002f9801, 0x00304801, 0x00306001, 0x0030d800, 0x0030e802,
+  0x00335003, 0x0036a000, 0x0038000d, 0x003fb802, 0x0041800e, 0x0042f000,
+  0x004b2001, 0x004b8000, 0x004fe800, 0x0053b000, 0x00578000, 0x0063b800,
+  0x00642000, 0x006fa000, 0x00727800, 0x0072d001, 0x0078200e, 0x0078a000,
+  0x007c2800, 0x007e8004, 0x007ec801, 0x00825005, 0x0087d800, 0x009b0008,
+  0x00b37000, 0x00b75802, 0x00b9a801, 0x00bea002, 0x00bec002, 0x00c00005,
+  0x00c03803, 0x00ca2001, 0x00d0f001, 0x00d50006, 0x00d54005, 0x00da7001,
+  0x00dad006, 0x00dbe802, 0x00dfe003, 0x00e1d804, 0x00e3f001, 0x00e60007,
+  0x00e69800, 0x0100b001, 0x01010007, 0x01018008, 0x0101d803, 0x01020802,
+  0x0102380a, 0x01029800, 0x0102a809, 0x0167c803, 0x0167f001, 0x016b8000,
+  0x01700001, 0x01703002, 0x01705800, 0x01707008, 0x0170c001, 0x0170d800,
+  0x0170f001, 0x01715004, 0x01718009, 0x0171e003, 0x01720800, 0x0172180c,
+  0x01729002, 0x01800802, 0x0181e800, 0x0187d800, 0x0527f001, 0x05306802,
+  0x05339800, 0x0533f000, 0x05379005, 0x0543a003, 0x05467001, 0x0547c002,
+  0x0547e000, 0x05497001, 0x054af800, 0x054e080c, 0x054ef001, 0x0552e003,
+  0x0556f001, 0x05578001, 0x055f5800, 0x07f08006, 0x07f0c800, 0x07f18000,
+  0x07f22801, 0x07f24803, 0x07f28002, 0x07f2a003, 0x07f2f802, 0x07f34000,
+  0x07f35001, 0x07f80802, 0x07f82802, 0x07f85000, 0x07f86000, 0x07f87001,
+  0x07f8d001, 0x07f8f801, 0x07f9e000, 0x07fb0800, 0x07fb2001, 0x08080002,
+  0x081cf800, 0x081e8000, 0x082b7800, 0x0842b800, 0x0848f800, 0x0849f800,
+  0x08528008, 0x0853f800, 0x08578006, 0x0859c806, 0x085cc803, 0x087aa804,
+  0x087c3003, 0x08823806, 0x0885d801, 0x0885f003, 0x088a0003, 0x088ba001,
+  0x088e2803, 0x088e6800, 0x088ed800, 0x088ee802, 0x0891c005, 0x08954800,
+  0x089ea001, 0x089eb801, 0x08a25804, 0x08a2d001, 0x08a2e800, 0x08a63000,
+  0x08ae0816, 0x08b20802, 0x08b3000c, 0x08b5c800, 0x08b9e002, 0x08c1d800,
+  0x08ca2002, 0x08cf1000, 0x08d1f807, 0x08d4d002, 0x08d4f004, 0x08d80009,
+  0x08df0800, 0x08e20804, 0x08e38001, 0x08f7b801, 0x08fa180c, 0x08fff800,
+  0x09238004, 0x097f8801, 0x0b537001, 0x0b57a800, 0x0b59b804, 0x0b5a2000,
+  0x0b6b6802, 0x0b74b803, 0x0b7f1000, 0x0de4f800, 0x0ed43804, 0x0f2ff800,
+  0x0f4af001,
+  /* Ps */
+  0x00014000, 0x0002d800, 0x0003d800, 0x0079d000, 0x0079e000, 0x00b4d800,
+  0x0100d000, 0x0100f000, 0x01022800, 0x0103e800, 0x01046800, 0x01184000,
+  0x01185000, 0x01194800, 0x013b4000, 0x013b5000, 0x013b6000, 0x013b7000,
+  0x013b8000, 0x013b9000, 0x013ba000, 0x013e2800, 0x013f3000, 0x013f4000,
+  0x013f5000, 0x013f6000, 0x013f7000, 0x014c1800, 0x014c2800, 0x014c3800,
+  0x014c4800, 0x014c5800, 0x014c6800, 0x014c7800, 0x014c8800, 0x014c9800,
+  0x014ca800, 0x014cb800, 0x014ec000, 0x014ed000, 0x014fe000, 0x01711000,
+  0x01712000, 0x01713000, 0x01714000, 0x01721000, 0x0172a800, 0x0172b800,
+  0x0172c800, 0x0172d800, 0x01804000, 0x01805000, 0x01806000, 0x01807000,
+  0x01808000, 0x0180a000, 0x0180b000, 0x0180c000, 0x0180d000, 0x0180e800,
+  0x07e9f800, 0x07f0b800, 0x07f1a800, 0x07f1b800, 0x07f1c800, 0x07f1d800,
+  0x07f1e800, 0x07f1f800, 0x07f20800, 0x07f21800, 0x07f23800, 0x07f2c800,
+  0x07f2d800, 0x07f2e800, 0x07f84000, 0x07f9d800, 0x07fad800, 0x07faf800,
+  0x07fb1000,
+  /* Sc */
+  0x00012000, 0x00051003, 0x002c7800, 0x00305800, 0x003ff001, 0x004f9001,
+  0x004fd800, 0x00578800, 0x005fc800, 0x0071f800, 0x00bed800, 0x01050020,
+  0x0541c000, 0x07efe000, 0x07f34800, 0x07f82000, 0x07ff0001, 0x07ff2801,
+  0x08fee803, 0x0f17f800, 0x0f658000,
+  /* Sk */
+  0x0002f000, 0x00030000, 0x00054000, 0x00057800, 0x0005a000, 0x0005c000,
+  0x00161003, 0x0016900d, 0x00172806, 0x00176800, 0x00177810, 0x001ba800,
+  0x001c2001, 0x00444000, 0x00fde800, 0x00fdf802, 0x00fe6802, 0x00fee802,
+  0x00ff6802, 0x00ffe801, 0x0184d801, 0x05380016, 0x05390001, 0x053c4801,
+  0x055ad800, 0x055b5001, 0x07dd9010, 0x07f9f000, 0x07fa0000, 0x07ff1800,
+  0x0f9fd804,
+  /* Sm */
+  0x00015800, 0x0001e002, 0x0003e000, 0x0003f000, 0x00056000, 0x00058800,
+  0x0006b800, 0x0007b800, 0x001fb000, 0x00303002, 0x01022000, 0x01029000,
+  0x0103d002, 0x01045002, 0x0108c000, 0x010a0004, 0x010a5800, 0x010c8004,
+  0x010cd001, 0x010d0000, 0x010d1800, 0x010d3000, 0x010d7000, 0x010e7001,
+  0x010e9000, 0x010ea000, 0x010fa10b, 0x01190001, 0x011be000, 0x011cd818,
+  0x011ee005, 0x012db800, 0x012e0800, 0x012fc007, 0x01337800, 0x013e0004,
+  0x013e381e, 0x013f800f, 0x01480082, 0x014cc83e, 0x014ee01f, 0x014ff101,
+  0x01598014, 0x015a3805, 0x07d94800, 0x07f31000, 0x07f32002, 0x07f85800,
+  0x07f8e002, 0x07fae000, 0x07faf000, 0x07ff1000, 0x07ff4803, 0x086c7001,
+  0x0eb60800, 0x0eb6d800, 0x0eb7d800, 0x0eb8a800, 0x0eb9a800, 0x0eba7800,
+  0x0ebb7800, 0x0ebc4800, 0x0ebd4800, 0x0ebe1800, 0x0f778001,
+  /* So */
+  0x00053000, 0x00054800, 0x00057000, 0x00058000, 0x00241000, 0x002c6801,
+  0x00307001, 0x0036f000, 0x00374800, 0x0037e801, 0x003fb000, 0x004fd000,
+  0x005b8000, 0x005f9805, 0x005fd000, 0x0063f800, 0x006a7800, 0x006bc800,
+  0x00780802, 0x00789800, 0x0078a802, 0x0078d005, 0x0079a000, 0x0079b000,
+  0x0079c000, 0x007df007, 0x007e3805, 0x007e7001, 0x007ea803, 0x0084f001,
+  0x009c8009, 0x00b36800, 0x00ca0000, 0x00cef021, 0x00db0809, 0x00dba008,
+  0x01080001, 0x01081803, 0x01084001, 0x0108a000, 0x0108b001, 0x0108f005,
+  0x01092800, 0x01093800, 0x01094800, 0x01097000, 0x0109d001, 0x010a5000,
+  0x010a6001, 0x010a7800, 0x010c5001, 0x010ca804, 0x010ce003, 0x010d0801,
+  0x010d2001, 0x010d3806, 0x010d781e, 0x010e8001, 0x010e9800, 0x010ea81e,
+  0x01180007, 0x01186013, 0x01191006, 0x01195850, 0x011be81d, 0x011da027,
+  0x011f1047, 0x0122000a, 0x0124e04d, 0x012800b6, 0x012dc008, 0x012e1035,
+  0x0130006e, 0x013380f7, 0x013ca02b, 0x014000ff, 0x0158002f, 0x015a2801,
+  0x015a6826, 0x015bb01f, 0x015cb868, 0x01672805, 0x01728001, 0x01740019,
+  0x0174d858, 0x017800d5, 0x017f800f, 0x01802000, 0x01809001, 0x01810000,
+  0x0181b001, 0x0181f001, 0x018c8001, 0x018cb009, 0x018e0025, 0x018f7800,
+  0x0190001e, 0x0191501d, 0x01928000, 0x0193001f, 0x01945026, 0x0196013f,
+  0x026e003f, 0x05248036, 0x05414003, 0x0541b001, 0x0541c800, 0x0553b802,
+  0x07ea000f, 0x07ee7800, 0x07efe802, 0x07ff2000, 0x07ff4000, 0x07ff6801,
+  0x07ffe001, 0x0809b808, 0x080bc810, 0x080c6002, 0x080c800c, 0x080d0000,
+  0x080e802c, 0x0843b801, 0x08564000, 0x08b9f800, 0x08fea807, 0x08ff0810,
+  0x0b59e003, 0x0b5a2800, 0x0de4e000, 0x0e6000ef, 0x0e6801b3, 0x0e7a8073,
+  0x0e8000f5, 0x0e880026, 0x0e89483b, 0x0e8b5002, 0x0e8c1801, 0x0e8c601d,
+  0x0e8d703c, 0x0e900041, 0x0e922800, 0x0e980056, 0x0ec001ff, 0x0ed1b803,
+  0x0ed36807, 0x0ed3b00d, 0x0ed42801, 0x0f0a7800, 0x0f656000, 0x0f697000,
+  0x0f80002b, 0x0f818063, 0x0f85000e, 0x0f85880e, 0x0f86080e, 0x0f868824,
+  0x0f8868a0, 0x0f8f301c, 0x0f90802b, 0x0f920008, 0x0f928001, 0x0f930005,
+  0x0f9800fa, 0x0fa002d7, 0x0fb6e010, 0x0fb7800c, 0x0fb80076, 0x0fbbd85e,
+  0x0fbf000b, 0x0fbf8000, 0x0fc0000b, 0x0fc08037, 0x0fc28009, 0x0fc30027,
+  0x0fc4801d, 0x0fc5800b, 0x0fc60001, 0x0fc80153, 0x0fd3000d, 0x0fd3800c,
+  0x0fd40009, 0x0fd47837, 0x0fd6700e, 0x0fd6f80a, 0x0fd78008, 0x0fd80092,
+  0x0fdca05b,
+  /* Zl */
+  0x01014000,
+  /* Zp */
+  0x01014800,
+  /* Zs */
+  0x00010000, 0x00050000, 0x00b40000, 0x0100000a, 0x01017800, 0x0102f800,
+  0x01800000,
+};
+
+const uint16_t PRIV(ucd_type_ranges_index)[] = {
+      0,     2,    23,  1143,  1211,  1212,  1874,  1949,
+   2529,  2539,  3190,  3380,  3385,  3742,  3813,  3825,
+   3897,  3903,  3923,  3999,  4009,  4020,  4213,  4292,
+   4313,  4344,  4409,  4596,  4597,  4598,  4605,
+};
+
+const uint32_t PRIV(ucd_boolprop_ranges)[] = {
+  /* ASCII */
+  0x0000007f,
+  /* ASCII_Hex_Digit */
+  0x00018009, 0x00020805, 0x00030805,
+  /* Alphabetic */
+  0x00020819, 0x00030819, 0x00055000, 0x0005a800, 0x0005d000, 0x00060016,
+  0x0006c01e, 0x0007c1c9, 0x0016300b, 0x00170004, 0x00176000, 0x00177000,
+  0x001a2800, 0x001b1811, 0x001bb001, 0x001bd003, 0x001bf800, 0x001c3000,
+  0x001c4002, 0x001c6000, 0x001c7013, 0x001d1852, 0x001fb88a, 0x002450a5,
+  0x00298825, 0x002ac800, 0x002b0028, 0x002d800d, 0x002df800, 0x002e0801,
+  0x002e2001, 0x002e3800, 0x002e801a, 0x002f7803, 0x0030800a, 0x00310037,
+  0x0032c806, 0x00337065, 0x0036a807, 0x00370807, 0x00376802, 0x0037d002,
+  0x0037f800, 0x0038802f, 0x003a6864, 0x003e5020, 0x003fa001, 0x003fd000,
+  0x00400017, 0x0040d012, 0x00420018, 0x0043000a, 0x00438017, 0x00444805,
+  0x0044b800, 0x00450029, 0x0046a00b, 0x00471806, 0x0047804b, 0x0049e80f,
+  0x004a7002, 0x004aa80e, 0x004b8812, 0x004c2807, 0x004c7801, 0x004c9815,
+  0x004d5006, 0x004d9000, 0x004db003, 0x004de807, 0x004e3801, 0x004e5801,
+  0x004e7000, 0x004eb800, 0x004ee001, 0x004ef804, 0x004f8001, 0x004fe000,
+  0x00500802, 0x00502805, 0x00507801, 0x00509815, 0x00515006, 0x00519001,
+  0x0051a801, 0x0051c001, 0x0051f004, 0x00523801, 0x00525801, 0x00528800,
+  0x0052c803, 0x0052f000, 0x00538005, 0x00540802, 0x00542808, 0x00547802,
+  0x00549815, 0x00555006, 0x00559001, 0x0055a804, 0x0055e808, 0x00563802,
+  0x00565801, 0x00568000, 0x00570003, 0x0057c803, 0x00580802, 0x00582807,
+  0x00587801, 0x00589815, 0x00595006, 0x00599001, 0x0059a804, 0x0059e807,
+  0x005a3801, 0x005a5801, 0x005ab001, 0x005ae001, 0x005af804, 0x005b8800,
+  0x005c1001, 0x005c2805, 0x005c7002, 0x005c9003, 0x005cc801, 0x005ce000,
+  0x005cf001, 0x005d1801, 0x005d4002, 0x005d700b, 0x005df004, 0x005e3002,
+  0x005e5002, 0x005e8000, 0x005eb800, 0x0060000c, 0x00607002, 0x00609016,
+  0x0061500f, 0x0061e807, 0x00623002, 0x00625002, 0x0062a801, 0x0062c002,
+  0x0062e800, 0x00630003, 0x00640003, 0x00642807, 0x00647002, 0x00649016,
+  0x00655009, 0x0065a804, 0x0065e807, 0x00663002, 0x00665002, 0x0066a801,
+  0x0066e801, 0x00670003, 0x00678802, 0x0068000c, 0x00687002, 0x00689028,
+  0x0069e807, 0x006a3002, 0x006a5002, 0x006a7000, 0x006aa003, 0x006af804,
+  0x006bd005, 0x006c0802, 0x006c2811, 0x006cd017, 0x006d9808, 0x006de800,
+  0x006e0006, 0x006e7805, 0x006eb000, 0x006ec007, 0x006f9001, 0x00700839,
+  0x00720006, 0x00726800, 0x00740801, 0x00742000, 0x00743004, 0x00746017,
+  0x00752800, 0x00753812, 0x0075d802, 0x00760004, 0x00763000, 0x00766800,
+  0x0076e003, 0x00780000, 0x007a0007, 0x007a4823, 0x007b8812, 0x007c400f,
+  0x007cc823, 0x00800036, 0x0081c000, 0x0081d804, 0x0082803f, 0x0084d003,
+  0x00850025, 0x00863800, 0x00866800, 0x0086802a, 0x0087e14c, 0x00925003,
+  0x00928006, 0x0092c000, 0x0092d003, 0x00930028, 0x00945003, 0x00948020,
+  0x00959003, 0x0095c006, 0x00960000, 0x00961003, 0x0096400e, 0x0096c038,
+  0x00989003, 0x0098c042, 0x009c000f, 0x009d0055, 0x009fc005, 0x00a00a6b,
+  0x00b37810, 0x00b40819, 0x00b5004a, 0x00b7700a, 0x00b80013, 0x00b8f814,
+  0x00ba0013, 0x00bb000c, 0x00bb7002, 0x00bb9001, 0x00bc0033, 0x00bdb012,
+  0x00beb800, 0x00bee000, 0x00c10058, 0x00c4002a, 0x00c58045, 0x00c8001e,
+  0x00c9000b, 0x00c98008, 0x00ca801d, 0x00cb8004, 0x00cc002b, 0x00cd8019,
+  0x00d0001b, 0x00d1003e, 0x00d30813, 0x00d53800, 0x00d5f801, 0x00d66002,
+  0x00d80033, 0x00d9a80e, 0x00da2807, 0x00dc0029, 0x00dd6003, 0x00ddd02b,
+  0x00df380a, 0x00e00036, 0x00e26802, 0x00e2d023, 0x00e4000a, 0x00e4802a,
+  0x00e5e802, 0x00e74803, 0x00e77005, 0x00e7a801, 0x00e7d000, 0x00e800bf,
+  0x00ee9821, 0x00f00115, 0x00f8c005, 0x00f90025, 0x00fa4005, 0x00fa8007,
+  0x00fac800, 0x00fad800, 0x00fae800, 0x00faf81e, 0x00fc0034, 0x00fdb006,
+  0x00fdf000, 0x00fe1002, 0x00fe3006, 0x00fe8003, 0x00feb005, 0x00ff000c,
+  0x00ff9002, 0x00ffb006, 0x01038800, 0x0103f800, 0x0104800c, 0x01081000,
+  0x01083800, 0x01085009, 0x0108a800, 0x0108c804, 0x01092000, 0x01093000,
+  0x01094000, 0x01095003, 0x0109780a, 0x0109e003, 0x010a2804, 0x010a7000,
+  0x010b0028, 0x0125b033, 0x016000e4, 0x01675803, 0x01679001, 0x01680025,
+  0x01693800, 0x01696800, 0x01698037, 0x016b7800, 0x016c0016, 0x016d0006,
+  0x016d4006, 0x016d8006, 0x016dc006, 0x016e0006, 0x016e4006, 0x016e8006,
+  0x016ec006, 0x016f001f, 0x01717800, 0x01802802, 0x01810808, 0x01818804,
+  0x0181c004, 0x01820855, 0x0184e802, 0x01850859, 0x0187e003, 0x0188282a,
+  0x0189885d, 0x018d001f, 0x018f800f, 0x01a007ff, 0x01e007ff, 0x022007ff,
+  0x026001bf, 0x027007ff, 0x02b007ff, 0x02f007ff, 0x033007ff, 0x037007ff,
+  0x03b007ff, 0x03f007ff, 0x043007ff, 0x047007ff, 0x04b007ff, 0x04f0068c,
+  0x0526802d, 0x0528010c, 0x0530800f, 0x05315001, 0x0532002e, 0x0533a007,
+  0x0533f870, 0x0538b808, 0x05391066, 0x053c5842, 0x053e8001, 0x053e9800,
+  0x053ea807, 0x053f9013, 0x05403820, 0x05420033, 0x05440043, 0x05462800,
+  0x05479005, 0x0547d800, 0x0547e802, 0x05485020, 0x05498022, 0x054b001c,
+  0x054c0032, 0x054da00b, 0x054e7800, 0x054f000f, 0x054fd004, 0x05500036,
+  0x0552000d, 0x05530016, 0x0553d044, 0x05560000, 0x05561000, 0x0556d802,
+  0x0557000f, 0x05579003, 0x05580805, 0x05584805, 0x05588805, 0x05590006,
+  0x05594006, 0x0559802a, 0x055ae00d, 0x055b807a, 0x056007ff, 0x05a007ff,
+  0x05e007ff, 0x062007ff, 0x066007ff, 0x06a003a3, 0x06bd8016, 0x06be5830,
+  0x07c8016d, 0x07d38069, 0x07d80006, 0x07d89804, 0x07d8e80b, 0x07d9500c,
+  0x07d9c004, 0x07d9f000, 0x07da0001, 0x07da1801, 0x07da306b, 0x07de996a,
+  0x07ea803f, 0x07ec9035, 0x07ef800b, 0x07f38004, 0x07f3b086, 0x07f90819,
+  0x07fa0819, 0x07fb3058, 0x07fe1005, 0x07fe5005, 0x07fe9005, 0x07fed002,
+  0x0800000b, 0x08006819, 0x08014012, 0x0801e001, 0x0801f80e, 0x0802800d,
+  0x0804007a, 0x080a0034, 0x0814001c, 0x08150030, 0x0818001f, 0x0819681d,
+  0x081a802a, 0x081c001d, 0x081d0023, 0x081e4007, 0x081e8804, 0x0820009d,
+  0x08258023, 0x0826c023, 0x08280027, 0x08298033, 0x082b800a, 0x082be00e,
+  0x082c6006, 0x082ca001, 0x082cb80a, 0x082d180e, 0x082d9806, 0x082dd801,
+  0x082e0033, 0x08300136, 0x083a0015, 0x083b0007, 0x083c0005, 0x083c3829,
+  0x083d9008, 0x08400005, 0x08404000, 0x0840502b, 0x0841b801, 0x0841e000,
+  0x0841f816, 0x08430016, 0x0844001e, 0x08470012, 0x0847a001, 0x08480015,
+  0x08490019, 0x084c0037, 0x084df001, 0x08500003, 0x08502801, 0x08506007,
+  0x0850a802, 0x0850c81c, 0x0853001c, 0x0854001c, 0x08560007, 0x0856481b,
+  0x08580035, 0x085a0015, 0x085b0012, 0x085c0011, 0x08600048, 0x08640032,
+  0x08660032, 0x08680027, 0x086a501b, 0x086b4800, 0x086b7816, 0x08740029,
+  0x08755801, 0x08758001, 0x08761002, 0x0877e000, 0x0878001c, 0x08793800,
+  0x08798015, 0x087b8011, 0x087d8014, 0x087f0016, 0x08800045, 0x08838804,
+  0x08840038, 0x08861000, 0x08868018, 0x08880032, 0x088a2003, 0x088a8022,
+  0x088bb000, 0x088c003f, 0x088e0803, 0x088e7001, 0x088ed000, 0x088ee000,
+  0x08900011, 0x08909821, 0x0891b800, 0x0891f003, 0x08940006, 0x08944000,
+  0x08945003, 0x0894780e, 0x0894f809, 0x08958038, 0x08980003, 0x08982807,
+  0x08987801, 0x08989815, 0x08995006, 0x08999001, 0x0899a804, 0x0899e807,
+  0x089a3801, 0x089a5801, 0x089a8000, 0x089ab800, 0x089ae806, 0x089c0009,
+  0x089c5800, 0x089c7000, 0x089c8025, 0x089db809, 0x089e1000, 0x089e2800,
+  0x089e3803, 0x089e6001, 0x089e8800, 0x089e9800, 0x08a00041, 0x08a21802,
+  0x08a23803, 0x08a2f802, 0x08a40041, 0x08a62001, 0x08a63800, 0x08ac0035,
+  0x08adc006, 0x08aec005, 0x08b0003e, 0x08b20000, 0x08b22000, 0x08b40035,
+  0x08b5c000, 0x08b8001a, 0x08b8e80d, 0x08ba0006, 0x08c00038, 0x08c5003f,
+  0x08c7f807, 0x08c84800, 0x08c86007, 0x08c8a801, 0x08c8c01d, 0x08c9b801,
+  0x08c9d801, 0x08c9f803, 0x08cd0007, 0x08cd502d, 0x08ced005, 0x08cf0800,
+  0x08cf1801, 0x08d00032, 0x08d1a809, 0x08d28047, 0x08d4e800, 0x08d58048,
+  0x08de0020, 0x08e00008, 0x08e0502c, 0x08e1c006, 0x08e20000, 0x08e3901d,
+  0x08e49015, 0x08e5480d, 0x08e80006, 0x08e84001, 0x08e8582b, 0x08e9d000,
+  0x08e9e001, 0x08e9f802, 0x08ea1800, 0x08ea3001, 0x08eb0005, 0x08eb3801,
+  0x08eb5024, 0x08ec8001, 0x08ec9803, 0x08ecc000, 0x08f70016, 0x08f80010,
+  0x08f89028, 0x08f9f002, 0x08fd8000, 0x09000399, 0x0920006e, 0x092400c3,
+  0x097c8060, 0x0980042f, 0x09a20805, 0x09a307ff, 0x09e3079a, 0x0a200246,
+  0x0b08002e, 0x0b400238, 0x0b52001e, 0x0b53804e, 0x0b56801d, 0x0b58002f,
+  0x0b5a0003, 0x0b5b1814, 0x0b5be812, 0x0b6a002c, 0x0b72003f, 0x0b78004a,
+  0x0b7a7838, 0x0b7c7810, 0x0b7f0001, 0x0b7f1800, 0x0b7f8001, 0x0b8007ff,
+  0x0bc007ff, 0x0c0007f7, 0x0c4004d5, 0x0c67f809, 0x0d7f8003, 0x0d7fa806,
+  0x0d7fe801, 0x0d800122, 0x0d899000, 0x0d8a8002, 0x0d8aa800, 0x0d8b2003,
+  0x0d8b818b, 0x0de0006a, 0x0de3800c, 0x0de40008, 0x0de48009, 0x0de4f000,
+  0x0ea00054, 0x0ea2b046, 0x0ea4f001, 0x0ea51000, 0x0ea52801, 0x0ea54803,
+  0x0ea5700b, 0x0ea5d800, 0x0ea5e806, 0x0ea62840, 0x0ea83803, 0x0ea86807,
+  0x0ea8b006, 0x0ea8f01b, 0x0ea9d803, 0x0eaa0004, 0x0eaa3000, 0x0eaa5006,
+  0x0eaa9153, 0x0eb54018, 0x0eb61018, 0x0eb6e01e, 0x0eb7e018, 0x0eb8b01e,
+  0x0eb9b018, 0x0eba801e, 0x0ebb8018, 0x0ebc501e, 0x0ebd5018, 0x0ebe2007,
+  0x0ef8001e, 0x0ef92805, 0x0f000006, 0x0f004010, 0x0f00d806, 0x0f011801,
+  0x0f013004, 0x0f01803d, 0x0f047800, 0x0f08002c, 0x0f09b806, 0x0f0a7000,
+  0x0f14801d, 0x0f16002b, 0x0f26801b, 0x0f2e801d, 0x0f2f8000, 0x0f3f0006,
+  0x0f3f4003, 0x0f3f6801, 0x0f3f800e, 0x0f4000c4, 0x0f480043, 0x0f4a3800,
+  0x0f4a5800, 0x0f700003, 0x0f70281a, 0x0f710801, 0x0f712000, 0x0f713800,
+  0x0f714809, 0x0f71a003, 0x0f71c800, 0x0f71d800, 0x0f721000, 0x0f723800,
+  0x0f724800, 0x0f725800, 0x0f726802, 0x0f728801, 0x0f72a000, 0x0f72b800,
+  0x0f72c800, 0x0f72d800, 0x0f72e800, 0x0f72f800, 0x0f730801, 0x0f732000,
+  0x0f733803, 0x0f736006, 0x0f73a003, 0x0f73c803, 0x0f73f000, 0x0f740009,
+  0x0f745810, 0x0f750802, 0x0f752804, 0x0f755810, 0x0f898019, 0x0f8a8019,
+  0x0f8b8019, 0x100007ff, 0x104007ff, 0x108007ff, 0x10c007ff, 0x110007ff,
+  0x114007ff, 0x118007ff, 0x11c007ff, 0x120007ff, 0x124007ff, 0x128007ff,
+  0x12c007ff, 0x130007ff, 0x134007ff, 0x138007ff, 0x13c007ff, 0x140007ff,
+  0x144007ff, 0x148007ff, 0x14c007ff, 0x150006df, 0x153807ff, 0x157807ff,
+  0x15b80039, 0x15ba00dd, 0x15c107ff, 0x160107ff, 0x16410681, 0x167587ff,
+  0x16b587ff, 0x16f587ff, 0x17358530, 0x175f826d, 0x17c0021d, 0x180007ff,
+  0x184007ff, 0x1880034a, 0x189a87ff, 0x18da87ff, 0x191a805f,
+  /* Bidi_Control */
+  0x0030e000, 0x01007001, 0x01015004, 0x01033003,
+  /* Bidi_Mirrored */
+  0x00014001, 0x0001e000, 0x0001f000, 0x0002d800, 0x0002e800, 0x0003d800,
+  0x0003e800, 0x00055800, 0x0005d800, 0x0079d003, 0x00b4d801, 0x0101c801,
+  0x01022801, 0x0103e801, 0x01046801, 0x01104005, 0x0110a800, 0x0110f803,
+  0x01112000, 0x0111e001, 0x01121800, 0x01122800, 0x01126000, 0x01129003,
+  0x01132007, 0x0113701d, 0x01147803, 0x0114c000, 0x01151001, 0x01153000,
+  0x01154001, 0x01155800, 0x01158008, 0x01164804, 0x01168001, 0x0116b017,
+  0x01178004, 0x0117b001, 0x0117d004, 0x01184003, 0x01194801, 0x013b400d,
+  0x013e1803, 0x013e4001, 0x013e5800, 0x013e6800, 0x013ea801, 0x013ee002,
+  0x013f100d, 0x014c1815, 0x014cd800, 0x014d0000, 0x014d1802, 0x014d4007,
+  0x014dc000, 0x014e0001, 0x014e2001, 0x014e7803, 0x014ea001, 0x014ec003,
+  0x014f4001, 0x014fa800, 0x014fc001, 0x014fe001, 0x01515803, 0x0151a001,
+  0x0151e001, 0x01532001, 0x0153c829, 0x01553007, 0x01557827, 0x0156f000,
+  0x01571802, 0x01576002, 0x0157b803, 0x015ff000, 0x01701003, 0x01704801,
+  0x01706001, 0x0170e001, 0x01710009, 0x0172a807, 0x01804009, 0x0180a007,
+  0x07f2c805, 0x07f32001, 0x07f84001, 0x07f8e000, 0x07f8f000, 0x07f9d800,
+  0x07f9e800, 0x07fad800, 0x07fae800, 0x07faf801, 0x07fb1001,
+  /* Case_Ignorable */
+  0x00013800, 0x00017000, 0x0001d000, 0x0002f000, 0x00030000, 0x00054000,
+  0x00056800, 0x00057800, 0x0005a000, 0x0005b801, 0x001580bf, 0x001ba001,
+  0x001bd000, 0x001c2001, 0x001c3800, 0x00241806, 0x002ac800, 0x002af800,
+  0x002c882c, 0x002df800, 0x002e0801, 0x002e2001, 0x002e3800, 0x002fa000,
+  0x00300005, 0x0030800a, 0x0030e000, 0x00320000, 0x00325814, 0x00338000,
+  0x0036b007, 0x0036f809, 0x00375003, 0x00387800, 0x00388800, 0x0039801a,
+  0x003d300a, 0x003f580a, 0x003fd000, 0x003fe800, 0x0040b017, 0x0042c802,
+  0x00444000, 0x00448001, 0x0044b808, 0x00464839, 0x0049d000, 0x0049e000,
+  0x004a0807, 0x004a6800, 0x004a8806, 0x004b1001, 0x004b8800, 0x004c0800,
+  0x004de000, 0x004e0803, 0x004e6800, 0x004f1001, 0x004ff000, 0x00500801,
+  0x0051e000, 0x00520801, 0x00523801, 0x00525802, 0x00528800, 0x00538001,
+  0x0053a800, 0x00540801, 0x0055e000, 0x00560804, 0x00563801, 0x00566800,
+  0x00571001, 0x0057d005, 0x00580800, 0x0059e000, 0x0059f800, 0x005a0803,
+  0x005a6800, 0x005aa801, 0x005b1001, 0x005c1000, 0x005e0000, 0x005e6800,
+  0x00600000, 0x00602000, 0x0061e000, 0x0061f002, 0x00623002, 0x00625003,
+  0x0062a801, 0x00631001, 0x00640800, 0x0065e000, 0x0065f800, 0x00663000,
+  0x00666001, 0x00671001, 0x00680001, 0x0069d801, 0x006a0803, 0x006a6800,
+  0x006b1001, 0x006c0800, 0x006e5000, 0x006e9002, 0x006eb000, 0x00718800,
+  0x0071a006, 0x00723008, 0x00758800, 0x0075a008, 0x00763000, 0x00764006,
+  0x0078c001, 0x0079a800, 0x0079b800, 0x0079c800, 0x007b880d, 0x007c0004,
+  0x007c3001, 0x007c680a, 0x007cc823, 0x007e3000, 0x00816803, 0x00819005,
+  0x0081c801, 0x0081e801, 0x0082c001, 0x0082f002, 0x00838803, 0x00841000,
+  0x00842801, 0x00846800, 0x0084e800, 0x0087e000, 0x009ae802, 0x00b89002,
+  0x00b99001, 0x00ba9001, 0x00bb9001, 0x00bda001, 0x00bdb806, 0x00be3000,
+  0x00be480a, 0x00beb800, 0x00bee800, 0x00c05804, 0x00c21800, 0x00c42801,
+  0x00c54800, 0x00c90002, 0x00c93801, 0x00c99000, 0x00c9c802, 0x00d0b801,
+  0x00d0d800, 0x00d2b000, 0x00d2c006, 0x00d30000, 0x00d31000, 0x00d32807,
+  0x00d39809, 0x00d3f800, 0x00d53800, 0x00d5801e, 0x00d80003, 0x00d9a000,
+  0x00d9b004, 0x00d9e000, 0x00da1000, 0x00db5808, 0x00dc0001, 0x00dd1003,
+  0x00dd4001, 0x00dd5802, 0x00df3000, 0x00df4001, 0x00df6800, 0x00df7802,
+  0x00e16007, 0x00e1b001, 0x00e3c005, 0x00e68002, 0x00e6a00c, 0x00e71006,
+  0x00e76800, 0x00e7a000, 0x00e7c001, 0x00e9603e, 0x00ebc000, 0x00ecd864,
+  0x00fde800, 0x00fdf802, 0x00fe6802, 0x00fee802, 0x00ff6802, 0x00ffe801,
+  0x01005804, 0x0100c001, 0x01012000, 0x01013800, 0x01015004, 0x01030004,
+  0x01033009, 0x01038800, 0x0103f800, 0x0104800c, 0x01068020, 0x0163e001,
+  0x01677802, 0x016b7800, 0x016bf800, 0x016f001f, 0x01717800, 0x01802800,
+  0x01815003, 0x01818804, 0x0181d800, 0x0184c805, 0x0187e002, 0x0500a800,
+  0x0527c005, 0x05306000, 0x05337803, 0x0533a009, 0x0533f800, 0x0534e003,
+  0x05378001, 0x05380021, 0x053b8000, 0x053c4002, 0x053f9002, 0x053fc001,
+  0x05401000, 0x05403000, 0x05405800, 0x05412801, 0x05416000, 0x05462001,
+  0x05470011, 0x0547f800, 0x05493007, 0x054a380a, 0x054c0002, 0x054d9800,
+  0x054db003, 0x054de001, 0x054e7800, 0x054f2801, 0x05514805, 0x05518801,
+  0x0551a801, 0x05521800, 0x05526000, 0x05538000, 0x0553e000, 0x05558000,
+  0x05559002, 0x0555b801, 0x0555f001, 0x05560800, 0x0556e800, 0x05576001,
+  0x05579801, 0x0557b000, 0x055ad804, 0x055b4802, 0x055f2800, 0x055f4000,
+  0x055f6800, 0x07d8f000, 0x07dd9010, 0x07f0000f, 0x07f09800, 0x07f1000f,
+  0x07f29000, 0x07f2a800, 0x07f7f800, 0x07f83800, 0x07f87000, 0x07f8d000,
+  0x07f9f000, 0x07fa0000, 0x07fb8000, 0x07fcf001, 0x07ff1800, 0x07ffc802,
+  0x080fe800, 0x08170000, 0x081bb004, 0x083c0005, 0x083c3829, 0x083d9008,
+  0x08500802, 0x08502801, 0x08506003, 0x0851c002, 0x0851f800, 0x08572801,
+  0x08692003, 0x086a7000, 0x086b4804, 0x086b7800, 0x08755801, 0x0877e003,
+  0x087a300a, 0x087c1003, 0x08800800, 0x0881c00e, 0x08838000, 0x08839801,
+  0x0883f802, 0x08859803, 0x0885c801, 0x0885e800, 0x08861000, 0x08866800,
+  0x08880002, 0x08893804, 0x08896807, 0x088b9800, 0x088c0001, 0x088db008,
+  0x088e4803, 0x088e7800, 0x08917802, 0x0891a000, 0x0891b001, 0x0891f000,
+  0x08920800, 0x0896f800, 0x08971807, 0x08980001, 0x0899d801, 0x089a0000,
+  0x089b3006, 0x089b8004, 0x089dd805, 0x089e7000, 0x089e8000, 0x089e9000,
+  0x089f0801, 0x08a1c007, 0x08a21002, 0x08a23000, 0x08a2f000, 0x08a59805,
+  0x08a5d000, 0x08a5f801, 0x08a61001, 0x08ad9003, 0x08ade001, 0x08adf801,
+  0x08aee001, 0x08b19807, 0x08b1e800, 0x08b1f801, 0x08b55800, 0x08b56800,
+  0x08b58005, 0x08b5b800, 0x08b8e800, 0x08b8f800, 0x08b91003, 0x08b93804,
+  0x08c17808, 0x08c1c801, 0x08c9d801, 0x08c9f000, 0x08ca1800, 0x08cea003,
+  0x08ced001, 0x08cf0000, 0x08d00809, 0x08d19805, 0x08d1d803, 0x08d23800,
+  0x08d28805, 0x08d2c802, 0x08d4500c, 0x08d4c001, 0x08e18006, 0x08e1c005,
+  0x08e1f800, 0x08e49015, 0x08e55006, 0x08e59001, 0x08e5a801, 0x08e98805,
+  0x08e9d000, 0x08e9e001, 0x08e9f806, 0x08ea3800, 0x08ec8001, 0x08eca800,
+  0x08ecb800, 0x08f79801, 0x08f80001, 0x08f9b004, 0x08fa0000, 0x08fa1000,
+  0x08fad000, 0x09a18010, 0x09a2380e, 0x0b08f00b, 0x0b096802, 0x0b578004,
+  0x0b598006, 0x0b5a0003, 0x0b6a0002, 0x0b6b5801, 0x0b7a7800, 0x0b7c7810,
+  0x0b7f0001, 0x0b7f1801, 0x0d7f8003, 0x0d7fa806, 0x0d7fe801, 0x0de4e801,
+  0x0de50003, 0x0e78002d, 0x0e798016, 0x0e8b3802, 0x0e8b980f, 0x0e8c2806,
+  0x0e8d5003, 0x0e921002, 0x0ed00036, 0x0ed1d831, 0x0ed3a800, 0x0ed42000,
+  0x0ed4d804, 0x0ed5080e, 0x0f000006, 0x0f004010, 0x0f00d806, 0x0f011801,
+  0x0f013004, 0x0f01803d, 0x0f047800, 0x0f09800d, 0x0f157000, 0x0f176003,
+  0x0f275804, 0x0f2f7001, 0x0f468006, 0x0f4a2007, 0x0f9fd804, 0x70000800,
+  0x7001005f, 0x700800ef,
+  /* Cased */
+  0x00020819, 0x00030819, 0x00055000, 0x0005a800, 0x0005d000, 0x00060016,
+  0x0006c01e, 0x0007c0c2, 0x000de003, 0x000e20cf, 0x0014a823, 0x00160001,
+  0x00170004, 0x001a2800, 0x001b8003, 0x001bb001, 0x001bd003, 0x001bf800,
+  0x001c3000, 0x001c4002, 0x001c6000, 0x001c7013, 0x001d1852, 0x001fb88a,
+  0x002450a5, 0x00298825, 0x002b0028, 0x00850025, 0x00863800, 0x00866800,
+  0x0086802a, 0x0087e003, 0x009d0055, 0x009fc005, 0x00e4000a, 0x00e4802a,
+  0x00e5e802, 0x00e800bf, 0x00f00115, 0x00f8c005, 0x00f90025, 0x00fa4005,
+  0x00fa8007, 0x00fac800, 0x00fad800, 0x00fae800, 0x00faf81e, 0x00fc0034,
+  0x00fdb006, 0x00fdf000, 0x00fe1002, 0x00fe3006, 0x00fe8003, 0x00feb005,
+  0x00ff000c, 0x00ff9002, 0x00ffb006, 0x01038800, 0x0103f800, 0x0104800c,
+  0x01081000, 0x01083800, 0x01085009, 0x0108a800, 0x0108c804, 0x01092000,
+  0x01093000, 0x01094000, 0x01095003, 0x01097805, 0x0109c800, 0x0109e003,
+  0x010a2804, 0x010a7000, 0x010b001f, 0x010c1801, 0x0125b033, 0x016000e4,
+  0x01675803, 0x01679001, 0x01680025, 0x01693800, 0x01696800, 0x0532002d,
+  0x0534001d, 0x05391065, 0x053c5803, 0x053c803d, 0x053e8001, 0x053e9800,
+  0x053ea807, 0x053f9004, 0x053fc002, 0x0559802a, 0x055ae00d, 0x055b804f,
+  0x07d80006, 0x07d89804, 0x07f90819, 0x07fa0819, 0x0820004f, 0x08258023,
+  0x0826c023, 0x082b800a, 0x082be00e, 0x082c6006, 0x082ca001, 0x082cb80a,
+  0x082d180e, 0x082d9806, 0x082dd801, 0x083c0000, 0x083c1802, 0x083c3829,
+  0x083d9008, 0x08640032, 0x08660032, 0x086a8015, 0x086b8015, 0x08c5003f,
+  0x0b72003f, 0x0ea00054, 0x0ea2b046, 0x0ea4f001, 0x0ea51000, 0x0ea52801,
+  0x0ea54803, 0x0ea5700b, 0x0ea5d800, 0x0ea5e806, 0x0ea62840, 0x0ea83803,
+  0x0ea86807, 0x0ea8b006, 0x0ea8f01b, 0x0ea9d803, 0x0eaa0004, 0x0eaa3000,
+  0x0eaa5006, 0x0eaa9153, 0x0eb54018, 0x0eb61018, 0x0eb6e01e, 0x0eb7e018,
+  0x0eb8b01e, 0x0eb9b018, 0x0eba801e, 0x0ebb8018, 0x0ebc501e, 0x0ebd5018,
+  0x0ebe2007, 0x0ef80009, 0x0ef85813, 0x0ef92805, 0x0f01803d, 0x0f480043,
+  0x0f898019, 0x0f8a8019, 0x0f8b8019,
+  /* Changes_When_Casefolded */
+  0x00020819, 0x0005a800, 0x00060016, 0x0006c007, 0x00080000, 0x00081000,
+  0x00082000, 0x00083000, 0x00084000, 0x00085000, 0x00086000, 0x00087000,
+  0x00088000, 0x00089000, 0x0008a000, 0x0008b000, 0x0008c000, 0x0008d000,
+  0x0008e000, 0x0008f000, 0x00090000, 0x00091000, 0x00092000, 0x00093000,
+  0x00094000, 0x00095000, 0x00096000, 0x00097000, 0x00098000, 0x00099000,
+  0x0009a000, 0x0009b000, 0x0009c800, 0x0009d800, 0x0009e800, 0x0009f800,
+  0x000a0800, 0x000a1800, 0x000a2800, 0x000a3800, 0x000a4801, 0x000a6000,
+  0x000a7000, 0x000a8000, 0x000a9000, 0x000aa000, 0x000ab000, 0x000ac000,
+  0x000ad000, 0x000ae000, 0x000af000, 0x000b0000, 0x000b1000, 0x000b2000,
+  0x000b3000, 0x000b4000, 0x000b5000, 0x000b6000, 0x000b7000, 0x000b8000,
+  0x000b9000, 0x000ba000, 0x000bb000, 0x000bc001, 0x000bd800, 0x000be800,
+  0x000bf800, 0x000c0801, 0x000c2000, 0x000c3001, 0x000c4802, 0x000c7003,
+  0x000c9801, 0x000cb002, 0x000ce001, 0x000cf801, 0x000d1000, 0x000d2000,
+  0x000d3001, 0x000d4800, 0x000d6000, 0x000d7001, 0x000d8802, 0x000da800,
+  0x000db801, 0x000de000, 0x000e2001, 0x000e3801, 0x000e5001, 0x000e6800,
+  0x000e7800, 0x000e8800, 0x000e9800, 0x000ea800, 0x000eb800, 0x000ec800,
+  0x000ed800, 0x000ef000, 0x000f0000, 0x000f1000, 0x000f2000, 0x000f3000,
+  0x000f4000, 0x000f5000, 0x000f6000, 0x000f7000, 0x000f8801, 0x000fa000,
+  0x000fb002, 0x000fd000, 0x000fe000, 0x000ff000, 0x00100000, 0x00101000,
+  0x00102000, 0x00103000, 0x00104000, 0x00105000, 0x00106000, 0x00107000,
+  0x00108000, 0x00109000, 0x0010a000, 0x0010b000, 0x0010c000, 0x0010d000,
+  0x0010e000, 0x0010f000, 0x00110000, 0x00111000, 0x00112000, 0x00113000,
+  0x00114000, 0x00115000, 0x00116000, 0x00117000, 0x00118000, 0x00119000,
+  0x0011d001, 0x0011e801, 0x00120800, 0x00121803, 0x00124000, 0x00125000,
+  0x00126000, 0x00127000, 0x001a2800, 0x001b8000, 0x001b9000, 0x001bb000,
+  0x001bf800, 0x001c3000, 0x001c4002, 0x001c6000, 0x001c7001, 0x001c8810,
+  0x001d1808, 0x001e1000, 0x001e7802, 0x001ea801, 0x001ec000, 0x001ed000,
+  0x001ee000, 0x001ef000, 0x001f0000, 0x001f1000, 0x001f2000, 0x001f3000,
+  0x001f4000, 0x001f5000, 0x001f6000, 0x001f7000, 0x001f8001, 0x001fa001,
+  0x001fb800, 0x001fc801, 0x001fe832, 0x00230000, 0x00231000, 0x00232000,
+  0x00233000, 0x00234000, 0x00235000, 0x00236000, 0x00237000, 0x00238000,
+  0x00239000, 0x0023a000, 0x0023b000, 0x0023c000, 0x0023d000, 0x0023e000,
+  0x0023f000, 0x00240000, 0x00245000, 0x00246000, 0x00247000, 0x00248000,
+  0x00249000, 0x0024a000, 0x0024b000, 0x0024c000, 0x0024d000, 0x0024e000,
+  0x0024f000, 0x00250000, 0x00251000, 0x00252000, 0x00253000, 0x00254000,
+  0x00255000, 0x00256000, 0x00257000, 0x00258000, 0x00259000, 0x0025a000,
+  0x0025b000, 0x0025c000, 0x0025d000, 0x0025e000, 0x0025f000, 0x00260001,
+  0x00261800, 0x00262800, 0x00263800, 0x00264800, 0x00265800, 0x00266800,
+  0x00268000, 0x00269000, 0x0026a000, 0x0026b000, 0x0026c000, 0x0026d000,
+  0x0026e000, 0x0026f000, 0x00270000, 0x00271000, 0x00272000, 0x00273000,
+  0x00274000, 0x00275000, 0x00276000, 0x00277000, 0x00278000, 0x00279000,
+  0x0027a000, 0x0027b000, 0x0027c000, 0x0027d000, 0x0027e000, 0x0027f000,
+  0x00280000, 0x00281000, 0x00282000, 0x00283000, 0x00284000, 0x00285000,
+  0x00286000, 0x00287000, 0x00288000, 0x00289000, 0x0028a000, 0x0028b000,
+  0x0028c000, 0x0028d000, 0x0028e000, 0x0028f000, 0x00290000, 0x00291000,
+  0x00292000, 0x00293000, 0x00294000, 0x00295000, 0x00296000, 0x00297000,
+  0x00298825, 0x002c3800, 0x00850025, 0x00863800, 0x00866800, 0x009fc005,
+  0x00e40009, 0x00e4802a, 0x00e5e802, 0x00f00000, 0x00f01000, 0x00f02000,
+  0x00f03000, 0x00f04000, 0x00f05000, 0x00f06000, 0x00f07000, 0x00f08000,
+  0x00f09000, 0x00f0a000, 0x00f0b000, 0x00f0c000, 0x00f0d000, 0x00f0e000,
+  0x00f0f000, 0x00f10000, 0x00f11000, 0x00f12000, 0x00f13000, 0x00f14000,
+  0x00f15000, 0x00f16000, 0x00f17000, 0x00f18000, 0x00f19000, 0x00f1a000,
+  0x00f1b000, 0x00f1c000, 0x00f1d000, 0x00f1e000, 0x00f1f000, 0x00f20000,
+  0x00f21000, 0x00f22000, 0x00f23000, 0x00f24000, 0x00f25000, 0x00f26000,
+  0x00f27000, 0x00f28000, 0x00f29000, 0x00f2a000, 0x00f2b000, 0x00f2c000,
+  0x00f2d000, 0x00f2e000, 0x00f2f000, 0x00f30000, 0x00f31000, 0x00f32000,
+  0x00f33000, 0x00f34000, 0x00f35000, 0x00f36000, 0x00f37000, 0x00f38000,
+  0x00f39000, 0x00f3a000, 0x00f3b000, 0x00f3c000, 0x00f3d000, 0x00f3e000,
+  0x00f3f000, 0x00f40000, 0x00f41000, 0x00f42000, 0x00f43000, 0x00f44000,
+  0x00f45000, 0x00f46000, 0x00f47000, 0x00f48000, 0x00f49000, 0x00f4a000,
+  0x00f4d001, 0x00f4f000, 0x00f50000, 0x00f51000, 0x00f52000, 0x00f53000,
+  0x00f54000, 0x00f55000, 0x00f56000, 0x00f57000, 0x00f58000, 0x00f59000,
+  0x00f5a000, 0x00f5b000, 0x00f5c000, 0x00f5d000, 0x00f5e000, 0x00f5f000,
+  0x00f60000, 0x00f61000, 0x00f62000, 0x00f63000, 0x00f64000, 0x00f65000,
+  0x00f66000, 0x00f67000, 0x00f68000, 0x00f69000, 0x00f6a000, 0x00f6b000,
+  0x00f6c000, 0x00f6d000, 0x00f6e000, 0x00f6f000, 0x00f70000, 0x00f71000,
+  0x00f72000, 0x00f73000, 0x00f74000, 0x00f75000, 0x00f76000, 0x00f77000,
+  0x00f78000, 0x00f79000, 0x00f7a000, 0x00f7b000, 0x00f7c000, 0x00f7d000,
+  0x00f7e000, 0x00f7f000, 0x00f84007, 0x00f8c005, 0x00f94007, 0x00f9c007,
+  0x00fa4005, 0x00fac800, 0x00fad800, 0x00fae800, 0x00faf800, 0x00fb4007,
+  0x00fc002f, 0x00fd9002, 0x00fdb805, 0x00fe1002, 0x00fe3805, 0x00fec003,
+  0x00ff4004, 0x00ff9002, 0x00ffb805, 0x01093000, 0x01095001, 0x01099000,
+  0x010b000f, 0x010c1800, 0x0125b019, 0x0160002f, 0x01630000, 0x01631002,
+  0x01633800, 0x01634800, 0x01635800, 0x01636803, 0x01639000, 0x0163a800,
+  0x0163f002, 0x01641000, 0x01642000, 0x01643000, 0x01644000, 0x01645000,
+  0x01646000, 0x01647000, 0x01648000, 0x01649000, 0x0164a000, 0x0164b000,
+  0x0164c000, 0x0164d000, 0x0164e000, 0x0164f000, 0x01650000, 0x01651000,
+  0x01652000, 0x01653000, 0x01654000, 0x01655000, 0x01656000, 0x01657000,
+  0x01658000, 0x01659000, 0x0165a000, 0x0165b000, 0x0165c000, 0x0165d000,
+  0x0165e000, 0x0165f000, 0x01660000, 0x01661000, 0x01662000, 0x01663000,
+  0x01664000, 0x01665000, 0x01666000, 0x01667000, 0x01668000, 0x01669000,
+  0x0166a000, 0x0166b000, 0x0166c000, 0x0166d000, 0x0166e000, 0x0166f000,
+  0x01670000, 0x01671000, 0x01675800, 0x01676800, 0x01679000, 0x05320000,
+  0x05321000, 0x05322000, 0x05323000, 0x05324000, 0x05325000, 0x05326000,
+  0x05327000, 0x05328000, 0x05329000, 0x0532a000, 0x0532b000, 0x0532c000,
+  0x0532d000, 0x0532e000, 0x0532f000, 0x05330000, 0x05331000, 0x05332000,
+  0x05333000, 0x05334000, 0x05335000, 0x05336000, 0x05340000, 0x05341000,
+  0x05342000, 0x05343000, 0x05344000, 0x05345000, 0x05346000, 0x05347000,
+  0x05348000, 0x05349000, 0x0534a000, 0x0534b000, 0x0534c000, 0x0534d000,
+  0x05391000, 0x05392000, 0x05393000, 0x05394000, 0x05395000, 0x05396000,
+  0x05397000, 0x05399000, 0x0539a000, 0x0539b000, 0x0539c000, 0x0539d000,
+  0x0539e000, 0x0539f000, 0x053a0000, 0x053a1000, 0x053a2000, 0x053a3000,
+  0x053a4000, 0x053a5000, 0x053a6000, 0x053a7000, 0x053a8000, 0x053a9000,
+  0x053aa000, 0x053ab000, 0x053ac000, 0x053ad000, 0x053ae000, 0x053af000,
+  0x053b0000, 0x053b1000, 0x053b2000, 0x053b3000, 0x053b4000, 0x053b5000,
+  0x053b6000, 0x053b7000, 0x053bc800, 0x053bd800, 0x053be801, 0x053c0000,
+  0x053c1000, 0x053c2000, 0x053c3000, 0x053c5800, 0x053c6800, 0x053c8000,
+  0x053c9000, 0x053cb000, 0x053cc000, 0x053cd000, 0x053ce000, 0x053cf000,
+  0x053d0000, 0x053d1000, 0x053d2000, 0x053d3000, 0x053d4000, 0x053d5004,
+  0x053d8004, 0x053db000, 0x053dc000, 0x053dd000, 0x053de000, 0x053df000,
+  0x053e0000, 0x053e1000, 0x053e2003, 0x053e4800, 0x053e5801, 0x053e8000,
+  0x053eb000, 0x053ec000, 0x053ed000, 0x053ee000, 0x053fa800, 0x055b804f,
+  0x07d80006, 0x07d89804, 0x07f90819, 0x08200027, 0x08258023, 0x082b800a,
+  0x082be00e, 0x082c6006, 0x082ca001, 0x08640032, 0x086a8015, 0x08c5001f,
+  0x0b72001f, 0x0f480021,
+  /* Changes_When_Casemapped */
+  0x00020819, 0x00030819, 0x0005a800, 0x00060016, 0x0006c01e, 0x0007c03f,
+  0x0009c853, 0x000c701b, 0x000d600d, 0x000de001, 0x000df800, 0x000e205c,
+  0x00111011, 0x0011d01a, 0x0012b001, 0x0012c800, 0x0012d801, 0x00130001,
+  0x00131803, 0x00134004, 0x00137800, 0x00138801, 0x0013a800, 0x0013e800,
+  0x00140000, 0x00141001, 0x00143805, 0x00149000, 0x0014e801, 0x001a2800,
+  0x001b8003, 0x001bb001, 0x001bd802, 0x001bf800, 0x001c3000, 0x001c4002,
+  0x001c6000, 0x001c7013, 0x001d182e, 0x001ea820, 0x001fb804, 0x001fe884,
+  0x002450a5, 0x00298825, 0x002b0826, 0x00850025, 0x00863800, 0x00866800,
+  0x0086802a, 0x0087e802, 0x009d0055, 0x009fc005, 0x00e4000a, 0x00e4802a,
+  0x00e5e802, 0x00ebc800, 0x00ebe800, 0x00ec7000, 0x00f0009b, 0x00f4f000,
+  0x00f50075, 0x00f8c005, 0x00f90025, 0x00fa4005, 0x00fa8007, 0x00fac800,
+  0x00fad800, 0x00fae800, 0x00faf81e, 0x00fc0034, 0x00fdb006, 0x00fdf000,
+  0x00fe1002, 0x00fe3006, 0x00fe8003, 0x00feb005, 0x00ff000c, 0x00ff9002,
+  0x00ffb006, 0x01093000, 0x01095001, 0x01099000, 0x010a7000, 0x010b001f,
+  0x010c1801, 0x0125b033, 0x01600070, 0x01639001, 0x0163a801, 0x0163f065,
+  0x01675803, 0x01679001, 0x01680025, 0x01693800, 0x01696800, 0x0532002d,
+  0x0534001b, 0x0539100d, 0x0539903d, 0x053bc80e, 0x053c5802, 0x053c8004,
+  0x053cb018, 0x053d801d, 0x053e8001, 0x053eb006, 0x053fa801, 0x055a9800,
+  0x055b804f, 0x07d80006, 0x07d89804, 0x07f90819, 0x07fa0819, 0x0820004f,
+  0x08258023, 0x0826c023, 0x082b800a, 0x082be00e, 0x082c6006, 0x082ca001,
+  0x082cb80a, 0x082d180e, 0x082d9806, 0x082dd801, 0x08640032, 0x08660032,
+  0x086a8015, 0x086b8015, 0x08c5003f, 0x0b72003f, 0x0f480043,
+  /* Changes_When_Lowercased */
+  0x00020819, 0x00060016, 0x0006c006, 0x00080000, 0x00081000, 0x00082000,
+  0x00083000, 0x00084000, 0x00085000, 0x00086000, 0x00087000, 0x00088000,
+  0x00089000, 0x0008a000, 0x0008b000, 0x0008c000, 0x0008d000, 0x0008e000,
+  0x0008f000, 0x00090000, 0x00091000, 0x00092000, 0x00093000, 0x00094000,
+  0x00095000, 0x00096000, 0x00097000, 0x00098000, 0x00099000, 0x0009a000,
+  0x0009b000, 0x0009c800, 0x0009d800, 0x0009e800, 0x0009f800, 0x000a0800,
+  0x000a1800, 0x000a2800, 0x000a3800, 0x000a5000, 0x000a6000, 0x000a7000,
+  0x000a8000, 0x000a9000, 0x000aa000, 0x000ab000, 0x000ac000, 0x000ad000,
+  0x000ae000, 0x000af000, 0x000b0000, 0x000b1000, 0x000b2000, 0x000b3000,
+  0x000b4000, 0x000b5000, 0x000b6000, 0x000b7000, 0x000b8000, 0x000b9000,
+  0x000ba000, 0x000bb000, 0x000bc001, 0x000bd800, 0x000be800, 0x000c0801,
+  0x000c2000, 0x000c3001, 0x000c4802, 0x000c7003, 0x000c9801, 0x000cb002,
+  0x000ce001, 0x000cf801, 0x000d1000, 0x000d2000, 0x000d3001, 0x000d4800,
+  0x000d6000, 0x000d7001, 0x000d8802, 0x000da800, 0x000db801, 0x000de000,
+  0x000e2001, 0x000e3801, 0x000e5001, 0x000e6800, 0x000e7800, 0x000e8800,
+  0x000e9800, 0x000ea800, 0x000eb800, 0x000ec800, 0x000ed800, 0x000ef000,
+  0x000f0000, 0x000f1000, 0x000f2000, 0x000f3000, 0x000f4000, 0x000f5000,
+  0x000f6000, 0x000f7000, 0x000f8801, 0x000fa000, 0x000fb002, 0x000fd000,
+  0x000fe000, 0x000ff000, 0x00100000, 0x00101000, 0x00102000, 0x00103000,
+  0x00104000, 0x00105000, 0x00106000, 0x00107000, 0x00108000, 0x00109000,
+  0x0010a000, 0x0010b000, 0x0010c000, 0x0010d000, 0x0010e000, 0x0010f000,
+  0x00110000, 0x00111000, 0x00112000, 0x00113000, 0x00114000, 0x00115000,
+  0x00116000, 0x00117000, 0x00118000, 0x00119000, 0x0011d001, 0x0011e801,
+  0x00120800, 0x00121803, 0x00124000, 0x00125000, 0x00126000, 0x00127000,
+  0x001b8000, 0x001b9000, 0x001bb000, 0x001bf800, 0x001c3000, 0x001c4002,
+  0x001c6000, 0x001c7001, 0x001c8810, 0x001d1808, 0x001e7800, 0x001ec000,
+  0x001ed000, 0x001ee000, 0x001ef000, 0x001f0000, 0x001f1000, 0x001f2000,
+  0x001f3000, 0x001f4000, 0x001f5000, 0x001f6000, 0x001f7000, 0x001fa000,
+  0x001fb800, 0x001fc801, 0x001fe832, 0x00230000, 0x00231000, 0x00232000,
+  0x00233000, 0x00234000, 0x00235000, 0x00236000, 0x00237000, 0x00238000,
+  0x00239000, 0x0023a000, 0x0023b000, 0x0023c000, 0x0023d000, 0x0023e000,
+  0x0023f000, 0x00240000, 0x00245000, 0x00246000, 0x00247000, 0x00248000,
+  0x00249000, 0x0024a000, 0x0024b000, 0x0024c000, 0x0024d000, 0x0024e000,
+  0x0024f000, 0x00250000, 0x00251000, 0x00252000, 0x00253000, 0x00254000,
+  0x00255000, 0x00256000, 0x00257000, 0x00258000, 0x00259000, 0x0025a000,
+  0x0025b000, 0x0025c000, 0x0025d000, 0x0025e000, 0x0025f000, 0x00260001,
+  0x00261800, 0x00262800, 0x00263800, 0x00264800, 0x00265800, 0x00266800,
+  0x00268000, 0x00269000, 0x0026a000, 0x0026b000, 0x0026c000, 0x0026d000,
+  0x0026e000, 0x0026f000, 0x00270000, 0x00271000, 0x00272000, 0x00273000,
+  0x00274000, 0x00275000, 0x00276000, 0x00277000, 0x00278000, 0x00279000,
+  0x0027a000, 0x0027b000, 0x0027c000, 0x0027d000, 0x0027e000, 0x0027f000,
+  0x00280000, 0x00281000, 0x00282000, 0x00283000, 0x00284000, 0x00285000,
+  0x00286000, 0x00287000, 0x00288000, 0x00289000, 0x0028a000, 0x0028b000,
+  0x0028c000, 0x0028d000, 0x0028e000, 0x0028f000, 0x00290000, 0x00291000,
+  0x00292000, 0x00293000, 0x00294000, 0x00295000, 0x00296000, 0x00297000,
+  0x00298825, 0x00850025, 0x00863800, 0x00866800, 0x009d0055, 0x00e44800,
+  0x00e4802a, 0x00e5e802, 0x00f00000, 0x00f01000, 0x00f02000, 0x00f03000,
+  0x00f04000, 0x00f05000, 0x00f06000, 0x00f07000, 0x00f08000, 0x00f09000,
+  0x00f0a000, 0x00f0b000, 0x00f0c000, 0x00f0d000, 0x00f0e000, 0x00f0f000,
+  0x00f10000, 0x00f11000, 0x00f12000, 0x00f13000, 0x00f14000, 0x00f15000,
+  0x00f16000, 0x00f17000, 0x00f18000, 0x00f19000, 0x00f1a000, 0x00f1b000,
+  0x00f1c000, 0x00f1d000, 0x00f1e000, 0x00f1f000, 0x00f20000, 0x00f21000,
+  0x00f22000, 0x00f23000, 0x00f24000, 0x00f25000, 0x00f26000, 0x00f27000,
+  0x00f28000, 0x00f29000, 0x00f2a000, 0x00f2b000, 0x00f2c000, 0x00f2d000,
+  0x00f2e000, 0x00f2f000, 0x00f30000, 0x00f31000, 0x00f32000, 0x00f33000,
+  0x00f34000, 0x00f35000, 0x00f36000, 0x00f37000, 0x00f38000, 0x00f39000,
+  0x00f3a000, 0x00f3b000, 0x00f3c000, 0x00f3d000, 0x00f3e000, 0x00f3f000,
+  0x00f40000, 0x00f41000, 0x00f42000, 0x00f43000, 0x00f44000, 0x00f45000,
+  0x00f46000, 0x00f47000, 0x00f48000, 0x00f49000, 0x00f4a000, 0x00f4f000,
+  0x00f50000, 0x00f51000, 0x00f52000, 0x00f53000, 0x00f54000, 0x00f55000,
+  0x00f56000, 0x00f57000, 0x00f58000, 0x00f59000, 0x00f5a000, 0x00f5b000,
+  0x00f5c000, 0x00f5d000, 0x00f5e000, 0x00f5f000, 0x00f60000, 0x00f61000,
+  0x00f62000, 0x00f63000, 0x00f64000, 0x00f65000, 0x00f66000, 0x00f67000,
+  0x00f68000, 0x00f69000, 0x00f6a000, 0x00f6b000, 0x00f6c000, 0x00f6d000,
+  0x00f6e000, 0x00f6f000, 0x00f70000, 0x00f71000, 0x00f72000, 0x00f73000,
+  0x00f74000, 0x00f75000, 0x00f76000, 0x00f77000, 0x00f78000, 0x00f79000,
+  0x00f7a000, 0x00f7b000, 0x00f7c000, 0x00f7d000, 0x00f7e000, 0x00f7f000,
+  0x00f84007, 0x00f8c005, 0x00f94007, 0x00f9c007, 0x00fa4005, 0x00fac800,
+  0x00fad800, 0x00fae800, 0x00faf800, 0x00fb4007, 0x00fc4007, 0x00fcc007,
+  0x00fd4007, 0x00fdc004, 0x00fe4004, 0x00fec003, 0x00ff4004, 0x00ffc004,
+  0x01093000, 0x01095001, 0x01099000, 0x010b000f, 0x010c1800, 0x0125b019,
+  0x0160002f, 0x01630000, 0x01631002, 0x01633800, 0x01634800, 0x01635800,
+  0x01636803, 0x01639000, 0x0163a800, 0x0163f002, 0x01641000, 0x01642000,
+  0x01643000, 0x01644000, 0x01645000, 0x01646000, 0x01647000, 0x01648000,
+  0x01649000, 0x0164a000, 0x0164b000, 0x0164c000, 0x0164d000, 0x0164e000,
+  0x0164f000, 0x01650000, 0x01651000, 0x01652000, 0x01653000, 0x01654000,
+  0x01655000, 0x01656000, 0x01657000, 0x01658000, 0x01659000, 0x0165a000,
+  0x0165b000, 0x0165c000, 0x0165d000, 0x0165e000, 0x0165f000, 0x01660000,
+  0x01661000, 0x01662000, 0x01663000, 0x01664000, 0x01665000, 0x01666000,
+  0x01667000, 0x01668000, 0x01669000, 0x0166a000, 0x0166b000, 0x0166c000,
+  0x0166d000, 0x0166e000, 0x0166f000, 0x01670000, 0x01671000, 0x01675800,
+  0x01676800, 0x01679000, 0x05320000, 0x05321000, 0x05322000, 0x05323000,
+  0x05324000, 0x05325000, 0x05326000, 0x05327000, 0x05328000, 0x05329000,
+  0x0532a000, 0x0532b000, 0x0532c000, 0x0532d000, 0x0532e000, 0x0532f000,
+  0x05330000, 0x05331000, 0x05332000, 0x05333000, 0x05334000, 0x05335000,
+  0x05336000, 0x05340000, 0x05341000, 0x05342000, 0x05343000, 0x05344000,
+  0x05345000, 0x05346000, 0x05347000, 0x05348000, 0x05349000, 0x0534a000,
+  0x0534b000, 0x0534c000, 0x0534d000, 0x05391000, 0x05392000, 0x05393000,
+  0x05394000, 0x05395000, 0x05396000, 0x05397000, 0x05399000, 0x0539a000,
+  0x0539b000, 0x0539c000, 0x0539d000, 0x0539e000, 0x0539f000, 0x053a0000,
+  0x053a1000, 0x053a2000, 0x053a3000, 0x053a4000, 0x053a5000, 0x053a6000,
+  0x053a7000, 0x053a8000, 0x053a9000, 0x053aa000, 0x053ab000, 0x053ac000,
+  0x053ad000, 0x053ae000, 0x053af000, 0x053b0000, 0x053b1000, 0x053b2000,
+  0x053b3000, 0x053b4000, 0x053b5000, 0x053b6000, 0x053b7000, 0x053bc800,
+  0x053bd800, 0x053be801, 0x053c0000, 0x053c1000, 0x053c2000, 0x053c3000,
+  0x053c5800, 0x053c6800, 0x053c8000, 0x053c9000, 0x053cb000, 0x053cc000,
+  0x053cd000, 0x053ce000, 0x053cf000, 0x053d0000, 0x053d1000, 0x053d2000,
+  0x053d3000, 0x053d4000, 0x053d5004, 0x053d8004, 0x053db000, 0x053dc000,
+  0x053dd000, 0x053de000, 0x053df000, 0x053e0000, 0x053e1000, 0x053e2003,
+  0x053e4800, 0x053e5801, 0x053e8000, 0x053eb000, 0x053ec000, 0x053ed000,
+  0x053ee000, 0x053fa800, 0x07f90819, 0x08200027, 0x08258023, 0x082b800a,
+  0x082be00e, 0x082c6006, 0x082ca001, 0x08640032, 0x086a8015, 0x08c5001f,
+  0x0b72001f, 0x0f480021,
+  /* Changes_When_Titlecased */
+  0x00030819, 0x0005a800, 0x0006f817, 0x0007c007, 0x00080800, 0x00081800,
+  0x00082800, 0x00083800, 0x00084800, 0x00085800, 0x00086800, 0x00087800,
+  0x00088800, 0x00089800, 0x0008a800, 0x0008b800, 0x0008c800, 0x0008d800,
+  0x0008e800, 0x0008f800, 0x00090800, 0x00091800, 0x00092800, 0x00093800,
+  0x00094800, 0x00095800, 0x00096800, 0x00097800, 0x00098800, 0x00099800,
+  0x0009a800, 0x0009b800, 0x0009d000, 0x0009e000, 0x0009f000, 0x000a0000,
+  0x000a1000, 0x000a2000, 0x000a3000, 0x000a4001, 0x000a5800, 0x000a6800,
+  0x000a7800, 0x000a8800, 0x000a9800, 0x000aa800, 0x000ab800, 0x000ac800,
+  0x000ad800, 0x000ae800, 0x000af800, 0x000b0800, 0x000b1800, 0x000b2800,
+  0x000b3800, 0x000b4800, 0x000b5800, 0x000b6800, 0x000b7800, 0x000b8800,
+  0x000b9800, 0x000ba800, 0x000bb800, 0x000bd000, 0x000be000, 0x000bf002,
+  0x000c1800, 0x000c2800, 0x000c4000, 0x000c6000, 0x000c9000, 0x000ca800,
+  0x000cc802, 0x000cf000, 0x000d0800, 0x000d1800, 0x000d2800, 0x000d4000,
+  0x000d6800, 0x000d8000, 0x000da000, 0x000db000, 0x000dc800, 0x000de800,
+  0x000df800, 0x000e2000, 0x000e3001, 0x000e4801, 0x000e6000, 0x000e7000,
+  0x000e8000, 0x000e9000, 0x000ea000, 0x000eb000, 0x000ec000, 0x000ed000,
+  0x000ee001, 0x000ef800, 0x000f0800, 0x000f1800, 0x000f2800, 0x000f3800,
+  0x000f4800, 0x000f5800, 0x000f6800, 0x000f7802, 0x000f9800, 0x000fa800,
+  0x000fc800, 0x000fd800, 0x000fe800, 0x000ff800, 0x00100800, 0x00101800,
+  0x00102800, 0x00103800, 0x00104800, 0x00105800, 0x00106800, 0x00107800,
+  0x00108800, 0x00109800, 0x0010a800, 0x0010b800, 0x0010c800, 0x0010d800,
+  0x0010e800, 0x0010f800, 0x00111800, 0x00112800, 0x00113800, 0x00114800,
+  0x00115800, 0x00116800, 0x00117800, 0x00118800, 0x00119800, 0x0011e000,
+  0x0011f801, 0x00121000, 0x00123800, 0x00124800, 0x00125800, 0x00126800,
+  0x00127805, 0x0012b001, 0x0012c800, 0x0012d801, 0x00130001, 0x00131803,
+  0x00134004, 0x00137800, 0x00138801, 0x0013a800, 0x0013e800, 0x00140000,
+  0x00141001, 0x00143805, 0x00149000, 0x0014e801, 0x001a2800, 0x001b8800,
+  0x001b9800, 0x001bb800, 0x001bd802, 0x001c8000, 0x001d6022, 0x001e8001,
+  0x001ea802, 0x001ec800, 0x001ed800, 0x001ee800, 0x001ef800, 0x001f0800,
+  0x001f1800, 0x001f2800, 0x001f3800, 0x001f4800, 0x001f5800, 0x001f6800,
+  0x001f7804, 0x001fa800, 0x001fc000, 0x001fd800, 0x0021802f, 0x00230800,
+  0x00231800, 0x00232800, 0x00233800, 0x00234800, 0x00235800, 0x00236800,
+  0x00237800, 0x00238800, 0x00239800, 0x0023a800, 0x0023b800, 0x0023c800,
+  0x0023d800, 0x0023e800, 0x0023f800, 0x00240800, 0x00245800, 0x00246800,
+  0x00247800, 0x00248800, 0x00249800, 0x0024a800, 0x0024b800, 0x0024c800,
+  0x0024d800, 0x0024e800, 0x0024f800, 0x00250800, 0x00251800, 0x00252800,
+  0x00253800, 0x00254800, 0x00255800, 0x00256800, 0x00257800, 0x00258800,
+  0x00259800, 0x0025a800, 0x0025b800, 0x0025c800, 0x0025d800, 0x0025e800,
+  0x0025f800, 0x00261000, 0x00262000, 0x00263000, 0x00264000, 0x00265000,
+  0x00266000, 0x00267001, 0x00268800, 0x00269800, 0x0026a800, 0x0026b800,
+  0x0026c800, 0x0026d800, 0x0026e800, 0x0026f800, 0x00270800, 0x00271800,
+  0x00272800, 0x00273800, 0x00274800, 0x00275800, 0x00276800, 0x00277800,
+  0x00278800, 0x00279800, 0x0027a800, 0x0027b800, 0x0027c800, 0x0027d800,
+  0x0027e800, 0x0027f800, 0x00280800, 0x00281800, 0x00282800, 0x00283800,
+  0x00284800, 0x00285800, 0x00286800, 0x00287800, 0x00288800, 0x00289800,
+  0x0028a800, 0x0028b800, 0x0028c800, 0x0028d800, 0x0028e800, 0x0028f800,
+  0x00290800, 0x00291800, 0x00292800, 0x00293800, 0x00294800, 0x00295800,
+  0x00296800, 0x00297800, 0x002b0826, 0x009fc005, 0x00e40008, 0x00e45000,
+  0x00ebc800, 0x00ebe800, 0x00ec7000, 0x00f00800, 0x00f01800, 0x00f02800,
+  0x00f03800, 0x00f04800, 0x00f05800, 0x00f06800, 0x00f07800, 0x00f08800,
+  0x00f09800, 0x00f0a800, 0x00f0b800, 0x00f0c800, 0x00f0d800, 0x00f0e800,
+  0x00f0f800, 0x00f10800, 0x00f11800, 0x00f12800, 0x00f13800, 0x00f14800,
+  0x00f15800, 0x00f16800, 0x00f17800, 0x00f18800, 0x00f19800, 0x00f1a800,
+  0x00f1b800, 0x00f1c800, 0x00f1d800, 0x00f1e800, 0x00f1f800, 0x00f20800,
+  0x00f21800, 0x00f22800, 0x00f23800, 0x00f24800, 0x00f25800, 0x00f26800,
+  0x00f27800, 0x00f28800, 0x00f29800, 0x00f2a800, 0x00f2b800, 0x00f2c800,
+  0x00f2d800, 0x00f2e800, 0x00f2f800, 0x00f30800, 0x00f31800, 0x00f32800,
+  0x00f33800, 0x00f34800, 0x00f35800, 0x00f36800, 0x00f37800, 0x00f38800,
+  0x00f39800, 0x00f3a800, 0x00f3b800, 0x00f3c800, 0x00f3d800, 0x00f3e800,
+  0x00f3f800, 0x00f40800, 0x00f41800, 0x00f42800, 0x00f43800, 0x00f44800,
+  0x00f45800, 0x00f46800, 0x00f47800, 0x00f48800, 0x00f49800, 0x00f4a806,
+  0x00f50800, 0x00f51800, 0x00f52800, 0x00f53800, 0x00f54800, 0x00f55800,
+  0x00f56800, 0x00f57800, 0x00f58800, 0x00f59800, 0x00f5a800, 0x00f5b800,
+  0x00f5c800, 0x00f5d800, 0x00f5e800, 0x00f5f800, 0x00f60800, 0x00f61800,
+  0x00f62800, 0x00f63800, 0x00f64800, 0x00f65800, 0x00f66800, 0x00f67800,
+  0x00f68800, 0x00f69800, 0x00f6a800, 0x00f6b800, 0x00f6c800, 0x00f6d800,
+  0x00f6e800, 0x00f6f800, 0x00f70800, 0x00f71800, 0x00f72800, 0x00f73800,
+  0x00f74800, 0x00f75800, 0x00f76800, 0x00f77800, 0x00f78800, 0x00f79800,
+  0x00f7a800, 0x00f7b800, 0x00f7c800, 0x00f7d800, 0x00f7e800, 0x00f7f808,
+  0x00f88005, 0x00f90007, 0x00f98007, 0x00fa0005, 0x00fa8007, 0x00fb0007,
+  0x00fb800d, 0x00fc0007, 0x00fc8007, 0x00fd0007, 0x00fd8004, 0x00fdb001,
+  0x00fdf000, 0x00fe1002, 0x00fe3001, 0x00fe8003, 0x00feb001, 0x00ff0007,
+  0x00ff9002, 0x00ffb001, 0x010a7000, 0x010b800f, 0x010c2000, 0x01268019,
+  0x0161802f, 0x01630800, 0x01632801, 0x01634000, 0x01635000, 0x01636000,
+  0x01639800, 0x0163b000, 0x01640800, 0x01641800, 0x01642800, 0x01643800,
+  0x01644800, 0x01645800, 0x01646800, 0x01647800, 0x01648800, 0x01649800,
+  0x0164a800, 0x0164b800, 0x0164c800, 0x0164d800, 0x0164e800, 0x0164f800,
+  0x01650800, 0x01651800, 0x01652800, 0x01653800, 0x01654800, 0x01655800,
+  0x01656800, 0x01657800, 0x01658800, 0x01659800, 0x0165a800, 0x0165b800,
+  0x0165c800, 0x0165d800, 0x0165e800, 0x0165f800, 0x01660800, 0x01661800,
+  0x01662800, 0x01663800, 0x01664800, 0x01665800, 0x01666800, 0x01667800,
+  0x01668800, 0x01669800, 0x0166a800, 0x0166b800, 0x0166c800, 0x0166d800,
+  0x0166e800, 0x0166f800, 0x01670800, 0x01671800, 0x01676000, 0x01677000,
+  0x01679800, 0x01680025, 0x01693800, 0x01696800, 0x05320800, 0x05321800,
+  0x05322800, 0x05323800, 0x05324800, 0x05325800, 0x05326800, 0x05327800,
+  0x05328800, 0x05329800, 0x0532a800, 0x0532b800, 0x0532c800, 0x0532d800,
+  0x0532e800, 0x0532f800, 0x05330800, 0x05331800, 0x05332800, 0x05333800,
+  0x05334800, 0x05335800, 0x05336800, 0x05340800, 0x05341800, 0x05342800,
+  0x05343800, 0x05344800, 0x05345800, 0x05346800, 0x05347800, 0x05348800,
+  0x05349800, 0x0534a800, 0x0534b800, 0x0534c800, 0x0534d800, 0x05391800,
+  0x05392800, 0x05393800, 0x05394800, 0x05395800, 0x05396800, 0x05397800,
+  0x05399800, 0x0539a800, 0x0539b800, 0x0539c800, 0x0539d800, 0x0539e800,
+  0x0539f800, 0x053a0800, 0x053a1800, 0x053a2800, 0x053a3800, 0x053a4800,
+  0x053a5800, 0x053a6800, 0x053a7800, 0x053a8800, 0x053a9800, 0x053aa800,
+  0x053ab800, 0x053ac800, 0x053ad800, 0x053ae800, 0x053af800, 0x053b0800,
+  0x053b1800, 0x053b2800, 0x053b3800, 0x053b4800, 0x053b5800, 0x053b6800,
+  0x053b7800, 0x053bd000, 0x053be000, 0x053bf800, 0x053c0800, 0x053c1800,
+  0x053c2800, 0x053c3800, 0x053c6000, 0x053c8800, 0x053c9801, 0x053cb800,
+  0x053cc800, 0x053cd800, 0x053ce800, 0x053cf800, 0x053d0800, 0x053d1800,
+  0x053d2800, 0x053d3800, 0x053d4800, 0x053da800, 0x053db800, 0x053dc800,
+  0x053dd800, 0x053de800, 0x053df800, 0x053e0800, 0x053e1800, 0x053e4000,
+  0x053e5000, 0x053e6800, 0x053e8800, 0x053eb800, 0x053ec800, 0x053ed800,
+  0x053fb000, 0x055a9800, 0x055b804f, 0x07d80006, 0x07d89804, 0x07fa0819,
+  0x08214027, 0x0826c023, 0x082cb80a, 0x082d180e, 0x082d9806, 0x082dd801,
+  0x08660032, 0x086b8015, 0x08c6001f, 0x0b73001f, 0x0f491021,
+  /* Changes_When_Uppercased */
+  0x00030819, 0x0005a800, 0x0006f817, 0x0007c007, 0x00080800, 0x00081800,
+  0x00082800, 0x00083800, 0x00084800, 0x00085800, 0x00086800, 0x00087800,
+  0x00088800, 0x00089800, 0x0008a800, 0x0008b800, 0x0008c800, 0x0008d800,
+  0x0008e800, 0x0008f800, 0x00090800, 0x00091800, 0x00092800, 0x00093800,
+  0x00094800, 0x00095800, 0x00096800, 0x00097800, 0x00098800, 0x00099800,
+  0x0009a800, 0x0009b800, 0x0009d000, 0x0009e000, 0x0009f000, 0x000a0000,
+  0x000a1000, 0x000a2000, 0x000a3000, 0x000a4001, 0x000a5800, 0x000a6800,
+  0x000a7800, 0x000a8800, 0x000a9800, 0x000aa800, 0x000ab800, 0x000ac800,
+  0x000ad800, 0x000ae800, 0x000af800, 0x000b0800, 0x000b1800, 0x000b2800,
+  0x000b3800, 0x000b4800, 0x000b5800, 0x000b6800, 0x000b7800, 0x000b8800,
+  0x000b9800, 0x000ba800, 0x000bb800, 0x000bd000, 0x000be000, 0x000bf002,
+  0x000c1800, 0x000c2800, 0x000c4000, 0x000c6000, 0x000c9000, 0x000ca800,
+  0x000cc802, 0x000cf000, 0x000d0800, 0x000d1800, 0x000d2800, 0x000d4000,
+  0x000d6800, 0x000d8000, 0x000da000, 0x000db000, 0x000dc800, 0x000de800,
+  0x000df800, 0x000e2801, 0x000e4001, 0x000e5801, 0x000e7000, 0x000e8000,
+  0x000e9000, 0x000ea000, 0x000eb000, 0x000ec000, 0x000ed000, 0x000ee001,
+  0x000ef800, 0x000f0800, 0x000f1800, 0x000f2800, 0x000f3800, 0x000f4800,
+  0x000f5800, 0x000f6800, 0x000f7801, 0x000f9001, 0x000fa800, 0x000fc800,
+  0x000fd800, 0x000fe800, 0x000ff800, 0x00100800, 0x00101800, 0x00102800,
+  0x00103800, 0x00104800, 0x00105800, 0x00106800, 0x00107800, 0x00108800,
+  0x00109800, 0x0010a800, 0x0010b800, 0x0010c800, 0x0010d800, 0x0010e800,
+  0x0010f800, 0x00111800, 0x00112800, 0x00113800, 0x00114800, 0x00115800,
+  0x00116800, 0x00117800, 0x00118800, 0x00119800, 0x0011e000, 0x0011f801,
+  0x00121000, 0x00123800, 0x00124800, 0x00125800, 0x00126800, 0x00127805,
+  0x0012b001, 0x0012c800, 0x0012d801, 0x00130001, 0x00131803, 0x00134004,
+  0x00137800, 0x00138801, 0x0013a800, 0x0013e800, 0x00140000, 0x00141001,
+  0x00143805, 0x00149000, 0x0014e801, 0x001a2800, 0x001b8800, 0x001b9800,
+  0x001bb800, 0x001bd802, 0x001c8000, 0x001d6022, 0x001e8001, 0x001ea802,
+  0x001ec800, 0x001ed800, 0x001ee800, 0x001ef800, 0x001f0800, 0x001f1800,
+  0x001f2800, 0x001f3800, 0x001f4800, 0x001f5800, 0x001f6800, 0x001f7804,
+  0x001fa800, 0x001fc000, 0x001fd800, 0x0021802f, 0x00230800, 0x00231800,
+  0x00232800, 0x00233800, 0x00234800, 0x00235800, 0x00236800, 0x00237800,
+  0x00238800, 0x00239800, 0x0023a800, 0x0023b800, 0x0023c800, 0x0023d800,
+  0x0023e800, 0x0023f800, 0x00240800, 0x00245800, 0x00246800, 0x00247800,
+  0x00248800, 0x00249800, 0x0024a800, 0x0024b800, 0x0024c800, 0x0024d800,
+  0x0024e800, 0x0024f800, 0x00250800, 0x00251800, 0x00252800, 0x00253800,
+  0x00254800, 0x00255800, 0x00256800, 0x00257800, 0x00258800, 0x00259800,
+  0x0025a800, 0x0025b800, 0x0025c800, 0x0025d800, 0x0025e800, 0x0025f800,
+  0x00261000, 0x00262000, 0x00263000, 0x00264000, 0x00265000, 0x00266000,
+  0x00267001, 0x00268800, 0x00269800, 0x0026a800, 0x0026b800, 0x0026c800,
+  0x0026d800, 0x0026e800, 0x0026f800, 0x00270800, 0x00271800, 0x00272800,
+  0x00273800, 0x00274800, 0x00275800, 0x00276800, 0x00277800, 0x00278800,
+  0x00279800, 0x0027a800, 0x0027b800, 0x0027c800, 0x0027d800, 0x0027e800,
+  0x0027f800, 0x00280800, 0x00281800, 0x00282800, 0x00283800, 0x00284800,
+  0x00285800, 0x00286800, 0x00287800, 0x00288800, 0x00289800, 0x0028a800,
+  0x0028b800, 0x0028c800, 0x0028d800, 0x0028e800, 0x0028f800, 0x00290800,
+  0x00291800, 0x00292800, 0x00293800, 0x00294800, 0x00295800, 0x00296800,
+  0x00297800, 0x002b0826, 0x0086802a, 0x0087e802, 0x009fc005, 0x00e40008,
+  0x00e45000, 0x00ebc800, 0x00ebe800, 0x00ec7000, 0x00f00800, 0x00f01800,
+  0x00f02800, 0x00f03800, 0x00f04800, 0x00f05800, 0x00f06800, 0x00f07800,
+  0x00f08800, 0x00f09800, 0x00f0a800, 0x00f0b800, 0x00f0c800, 0x00f0d800,
+  0x00f0e800, 0x00f0f800, 0x00f10800, 0x00f11800, 0x00f12800, 0x00f13800,
+  0x00f14800, 0x00f15800, 0x00f16800, 0x00f17800, 0x00f18800, 0x00f19800,
+  0x00f1a800, 0x00f1b800, 0x00f1c800, 0x00f1d800, 0x00f1e800, 0x00f1f800,
+  0x00f20800, 0x00f21800, 0x00f22800, 0x00f23800, 0x00f24800, 0x00f25800,
+  0x00f26800, 0x00f27800, 0x00f28800, 0x00f29800, 0x00f2a800, 0x00f2b800,
+  0x00f2c800, 0x00f2d800, 0x00f2e800, 0x00f2f800, 0x00f30800, 0x00f31800,
+  0x00f32800, 0x00f33800, 0x00f34800, 0x00f35800, 0x00f36800, 0x00f37800,
+  0x00f38800, 0x00f39800, 0x00f3a800, 0x00f3b800, 0x00f3c800, 0x00f3d800,
+  0x00f3e800, 0x00f3f800, 0x00f40800, 0x00f41800, 0x00f42800, 0x00f43800,
+  0x00f44800, 0x00f45800, 0x00f46800, 0x00f47800, 0x00f48800, 0x00f49800,
+  0x00f4a806, 0x00f50800, 0x00f51800, 0x00f52800, 0x00f53800, 0x00f54800,
+  0x00f55800, 0x00f56800, 0x00f57800, 0x00f58800, 0x00f59800, 0x00f5a800,
+  0x00f5b800, 0x00f5c800, 0x00f5d800, 0x00f5e800, 0x00f5f800, 0x00f60800,
+  0x00f61800, 0x00f62800, 0x00f63800, 0x00f64800, 0x00f65800, 0x00f66800,
+  0x00f67800, 0x00f68800, 0x00f69800, 0x00f6a800, 0x00f6b800, 0x00f6c800,
+  0x00f6d800, 0x00f6e800, 0x00f6f800, 0x00f70800, 0x00f71800, 0x00f72800,
+  0x00f73800, 0x00f74800, 0x00f75800, 0x00f76800, 0x00f77800, 0x00f78800,
+  0x00f79800, 0x00f7a800, 0x00f7b800, 0x00f7c800, 0x00f7d800, 0x00f7e800,
+  0x00f7f808, 0x00f88005, 0x00f90007, 0x00f98007, 0x00fa0005, 0x00fa8007,
+  0x00fb0007, 0x00fb800d, 0x00fc0034, 0x00fdb001, 0x00fde000, 0x00fdf000,
+  0x00fe1002, 0x00fe3001, 0x00fe6000, 0x00fe8003, 0x00feb001, 0x00ff0007,
+  0x00ff9002, 0x00ffb001, 0x00ffe000, 0x010a7000, 0x010b800f, 0x010c2000,
+  0x01268019, 0x0161802f, 0x01630800, 0x01632801, 0x01634000, 0x01635000,
+  0x01636000, 0x01639800, 0x0163b000, 0x01640800, 0x01641800, 0x01642800,
+  0x01643800, 0x01644800, 0x01645800, 0x01646800, 0x01647800, 0x01648800,
+  0x01649800, 0x0164a800, 0x0164b800, 0x0164c800, 0x0164d800, 0x0164e800,
+  0x0164f800, 0x01650800, 0x01651800, 0x01652800, 0x01653800, 0x01654800,
+  0x01655800, 0x01656800, 0x01657800, 0x01658800, 0x01659800, 0x0165a800,
+  0x0165b800, 0x0165c800, 0x0165d800, 0x0165e800, 0x0165f800, 0x01660800,
+  0x01661800, 0x01662800, 0x01663800, 0x01664800, 0x01665800, 0x01666800,
+  0x01667800, 0x01668800, 0x01669800, 0x0166a800, 0x0166b800, 0x0166c800,
+  0x0166d800, 0x0166e800, 0x0166f800, 0x01670800, 0x01671800, 0x01676000,
+  0x01677000, 0x01679800, 0x01680025, 0x01693800, 0x01696800, 0x05320800,
+  0x05321800, 0x05322800, 0x05323800, 0x05324800, 0x05325800, 0x05326800,
+  0x05327800, 0x05328800, 0x05329800, 0x0532a800, 0x0532b800, 0x0532c800,
+  0x0532d800, 0x0532e800, 0x0532f800, 0x05330800, 0x05331800, 0x05332800,
+  0x05333800, 0x05334800, 0x05335800, 0x05336800, 0x05340800, 0x05341800,
+  0x05342800, 0x05343800, 0x05344800, 0x05345800, 0x05346800, 0x05347800,
+  0x05348800, 0x05349800, 0x0534a800, 0x0534b800, 0x0534c800, 0x0534d800,
+  0x05391800, 0x05392800, 0x05393800, 0x05394800, 0x05395800, 0x05396800,
+  0x05397800, 0x05399800, 0x0539a800, 0x0539b800, 0x0539c800, 0x0539d800,
+  0x0539e800, 0x0539f800, 0x053a0800, 0x053a1800, 0x053a2800, 0x053a3800,
+  0x053a4800, 0x053a5800, 0x053a6800, 0x053a7800, 0x053a8800, 0x053a9800,
+  0x053aa800, 0x053ab800, 0x053ac800, 0x053ad800, 0x053ae800, 0x053af800,
+  0x053b0800, 0x053b1800, 0x053b2800, 0x053b3800, 0x053b4800, 0x053b5800,
+  0x053b6800, 0x053b7800, 0x053bd000, 0x053be000, 0x053bf800, 0x053c0800,
+  0x053c1800, 0x053c2800, 0x053c3800, 0x053c6000, 0x053c8800, 0x053c9801,
+  0x053cb800, 0x053cc800, 0x053cd800, 0x053ce800, 0x053cf800, 0x053d0800,
+  0x053d1800, 0x053d2800, 0x053d3800, 0x053d4800, 0x053da800, 0x053db800,
+  0x053dc800, 0x053dd800, 0x053de800, 0x053df800, 0x053e0800, 0x053e1800,
+  0x053e4000, 0x053e5000, 0x053e6800, 0x053e8800, 0x053eb800, 0x053ec800,
+  0x053ed800, 0x053fb000, 0x055a9800, 0x055b804f, 0x07d80006, 0x07d89804,
+  0x07fa0819, 0x08214027, 0x0826c023, 0x082cb80a, 0x082d180e, 0x082d9806,
+  0x082dd801, 0x08660032, 0x086b8015, 0x08c6001f, 0x0b73001f, 0x0f491021,
+  /* Dash */
+  0x00016800, 0x002c5000, 0x002df000, 0x00a00000, 0x00c03000, 0x01008005,
+  0x01029800, 0x0103d800, 0x01045800, 0x01109000, 0x0170b800, 0x0170d000,
+  0x0171d001, 0x01720000, 0x0172e800, 0x0180e000, 0x01818000, 0x01850000,
+  0x07f18801, 0x07f2c000, 0x07f31800, 0x07f86800, 0x086b7000, 0x08756800,
+  /* Default_Ignorable_Code_Point */
+  0x00056800, 0x001a7800, 0x0030e000, 0x008af801, 0x00bda001, 0x00c05804,
+  0x01005804, 0x01015004, 0x0103000f, 0x018b2000, 0x07f0000f, 0x07f7f800,
+  0x07fd0000, 0x07ff8008, 0x0de50003, 0x0e8b9807, 0x700007ff, 0x704007ff,
+  /* Deprecated */
+  0x000a4800, 0x00339800, 0x007bb800, 0x007bc800, 0x00bd1801, 0x01035005,
+  0x01194801, 0x70000800,
+  /* Diacritic */
+  0x0002f000, 0x00030000, 0x00054000, 0x00057800, 0x0005a000, 0x0005b801,
+  0x0015809e, 0x001a8007, 0x001ae805, 0x001ba001, 0x001bd000, 0x001c2001,
+  0x00241804, 0x002ac800, 0x002c8810, 0x002d181a, 0x002df800, 0x002e0801,
+  0x002e2000, 0x00325807, 0x0032b801, 0x0036f801, 0x00372801, 0x00375002,
+  0x0039801a, 0x003d300a, 0x003f580a, 0x0040c001, 0x0044c007, 0x00464809,
+  0x0047181b, 0x0049e000, 0x004a6800, 0x004a8803, 0x004b8800, 0x004de000,
+  0x004e6800, 0x0051e000, 0x00526800, 0x0055e000, 0x00566800, 0x0057e802,
+  0x0059e000, 0x005a6800, 0x005aa800, 0x005e6800, 0x0061e000, 0x00626800,
+  0x0065e000, 0x00666800, 0x0069d801, 0x006a6800, 0x006e5000, 0x0071d000,
+  0x00723805, 0x00727000, 0x0075d000, 0x00764004, 0x0078c001, 0x0079a800,
+  0x0079b800, 0x0079c800, 0x0079f001, 0x007c1002, 0x007c3001, 0x007e3000,
+  0x0081b800, 0x0081c801, 0x00831801, 0x00834804, 0x00843806, 0x00847800,
+  0x0084d001, 0x009ae802, 0x00b8a001, 0x00b9a000, 0x00be480a, 0x00bee800,
+  0x00c9c802, 0x00d30000, 0x00d3a807, 0x00d3f800, 0x00d5800e, 0x00d6080a,
+  0x00d9a000, 0x00da2000, 0x00db5808, 0x00dd5001, 0x00df3000, 0x00df9001,
+  0x00e1b001, 0x00e3c005, 0x00e68018, 0x00e76800, 0x00e7a000, 0x00e7b802,
+  0x00e9603e, 0x00ee200b, 0x00efa80a, 0x00fde800, 0x00fdf802, 0x00fe6802,
+  0x00fee802, 0x00ff6802, 0x00ffe801, 0x01677802, 0x01717800, 0x01815005,
+  0x0184c803, 0x0187e000, 0x05337800, 0x0533e001, 0x0533f800, 0x0534e001,
+  0x05378001, 0x05380021, 0x053c4002, 0x053fc001, 0x05403000, 0x05416000,
+  0x05462000, 0x05470011, 0x05495803, 0x054a9800, 0x054d9800, 0x054e0000,
+  0x054f2800, 0x0553d802, 0x0555f803, 0x0557b000, 0x055ad804, 0x055b4802,
+  0x055f6001, 0x07d8f000, 0x07f1000f, 0x07f9f000, 0x07fa0000, 0x07fb8000,
+  0x07fcf001, 0x07ff1800, 0x08170000, 0x083c0005, 0x083c3829, 0x083d9008,
+  0x0851c002, 0x0851f800, 0x08572801, 0x08691005, 0x086a7000, 0x086b4804,
+  0x0877e802, 0x087a300a, 0x087c1003, 0x08823000, 0x08838000, 0x0885c801,
+  0x08899801, 0x088b9800, 0x088e0000, 0x088e5002, 0x0891a801, 0x08974801,
+  0x0899d801, 0x089a6800, 0x089b3006, 0x089b8004, 0x089e7002, 0x089e9001,
+  0x089f0801, 0x08a21000, 0x08a23000, 0x08a61001, 0x08adf801, 0x08b1f800,
+  0x08b5b001, 0x08b95800, 0x08c1c801, 0x08c9e801, 0x08ca1800, 0x08cf0000,
+  0x08d1a000, 0x08d23800, 0x08d4c800, 0x08e1f800, 0x08ea1000, 0x08ea2001,
+  0x08ecb800, 0x08fa0801, 0x08fad000, 0x09a2380e, 0x0b097800, 0x0b578004,
+  0x0b598006, 0x0b6b5801, 0x0b7c7810, 0x0b7f8001, 0x0d7f8003, 0x0d7fa806,
+  0x0d7fe801, 0x0e78002d, 0x0e798016, 0x0e8b3802, 0x0e8b6805, 0x0e8bd807,
+  0x0e8c2806, 0x0e8d5003, 0x0f01803d, 0x0f098006, 0x0f157000, 0x0f176003,
+  0x0f2f7001, 0x0f468006, 0x0f4a2002, 0x0f4a4002,
+  /* Emoji */
+  0x00011800, 0x00015000, 0x00018009, 0x00054800, 0x00057000, 0x0101e000,
+  0x01024800, 0x01091000, 0x0109c800, 0x010ca005, 0x010d4801, 0x0118d001,
+  0x01194000, 0x011e7800, 0x011f480a, 0x011fc002, 0x01261000, 0x012d5001,
+  0x012db000, 0x012e0000, 0x012fd803, 0x01300004, 0x01307000, 0x01308800,
+  0x0130a001, 0x0130c000, 0x0130e800, 0x01310000, 0x01311001, 0x01313000,
+  0x01315000, 0x01317001, 0x0131c002, 0x01320000, 0x01321000, 0x0132400b,
+  0x0132f801, 0x01331800, 0x01332801, 0x01334000, 0x0133d800, 0x0133f001,
+  0x01349005, 0x0134c800, 0x0134d801, 0x01350001, 0x01353800, 0x01355001,
+  0x01358001, 0x0135e801, 0x01362001, 0x01364000, 0x01367001, 0x01368800,
+  0x01369801, 0x01374801, 0x01378005, 0x0137b803, 0x0137e800, 0x01381000,
+  0x01382800, 0x01384005, 0x01387800, 0x01389000, 0x0138a000, 0x0138b000,
+  0x0138e800, 0x01390800, 0x01394000, 0x01399801, 0x013a2000, 0x013a3800,
+  0x013a6000, 0x013a7000, 0x013a9802, 0x013ab800, 0x013b1801, 0x013ca802,
+  0x013d0800, 0x013d8000, 0x013df800, 0x0149a001, 0x01582802, 0x0158d801,
+  0x015a8000, 0x015aa800, 0x01818000, 0x0181e800, 0x0194b800, 0x0194c800,
+  0x0f802000, 0x0f867800, 0x0f8b8001, 0x0f8bf001, 0x0f8c7000, 0x0f8c8809,
+  0x0f8f3019, 0x0f900801, 0x0f90d000, 0x0f917800, 0x0f919008, 0x0f928001,
+  0x0f980021, 0x0f99206f, 0x0f9cb001, 0x0f9cc802, 0x0f9cf052, 0x0f9f9802,
+  0x0f9fb906, 0x0fa7f83e, 0x0faa4805, 0x0faa8017, 0x0fab7801, 0x0fab9807,
+  0x0fac3800, 0x0fac5003, 0x0fac8000, 0x0faca801, 0x0fad2001, 0x0fad4000,
+  0x0fad8801, 0x0fade000, 0x0fae1002, 0x0fae8802, 0x0faee002, 0x0faf0800,
+  0x0faf1800, 0x0faf4000, 0x0faf7800, 0x0faf9800, 0x0fafd055, 0x0fb40045,
+  0x0fb65807, 0x0fb6a802, 0x0fb6e009, 0x0fb74800, 0x0fb75801, 0x0fb78000,
+  0x0fb79809, 0x0fbf000b, 0x0fbf8000, 0x0fc8602e, 0x0fc9e009, 0x0fca38b8,
+  0x0fd3800c, 0x0fd40009, 0x0fd47837, 0x0fd6700e, 0x0fd6f80a, 0x0fd78008,
+  /* Emoji_Component */
+  0x00011800, 0x00015000, 0x00018009, 0x01006800, 0x01071800, 0x07f07800,
+  0x0f8f3019, 0x0f9fd804, 0x0fcd8003, 0x7001005f,
+  /* Emoji_Modifier */
+  0x0f9fd804,
+  /* Emoji_Modifier_Base */
+  0x0130e800, 0x0137c800, 0x01385003, 0x0f9c2800, 0x0f9e1002, 0x0f9e3800,
+  0x0f9e5002, 0x0fa21001, 0x0fa2300a, 0x0fa33012, 0x0fa3e000, 0x0fa40802,
+  0x0fa42802, 0x0fa47800, 0x0fa48800, 0x0fa55000, 0x0faba001, 0x0fabd000,
+  0x0fac8000, 0x0faca801, 0x0fb22802, 0x0fb25804, 0x0fb51800, 0x0fb5a002,
+  0x0fb60000, 0x0fb66000, 0x0fc86000, 0x0fc87800, 0x0fc8c007, 0x0fc93000,
+  0x0fc98009, 0x0fc9e002, 0x0fcbb800, 0x0fcda801, 0x0fcdc001, 0x0fcdd800,
+  0x0fce6802, 0x0fce880c, 0x0fd61802, 0x0fd78008,
+  /* Emoji_Presentation */
+  0x0118d001, 0x011f4803, 0x011f8000, 0x011f9800, 0x012fe801, 0x0130a001,
+  0x0132400b, 0x0133f800, 0x01349800, 0x01350800, 0x01355001, 0x0135e801,
+  0x01362001, 0x01367000, 0x0136a000, 0x01375000, 0x01379001, 0x0137a800,
+  0x0137d000, 0x0137e800, 0x01382800, 0x01385001, 0x01394000, 0x013a6000,
+  0x013a7000, 0x013a9802, 0x013ab800, 0x013ca802, 0x013d8000, 0x013df800,
+  0x0158d801, 0x015a8000, 0x015aa800, 0x0f802000, 0x0f867800, 0x0f8c7000,
+  0x0f8c8809, 0x0f8f3019, 0x0f900800, 0x0f90d000, 0x0f917800, 0x0f919004,
+  0x0f91c002, 0x0f928001, 0x0f980020, 0x0f996808, 0x0f99b845, 0x0f9bf015,
+  0x0f9d002a, 0x0f9e7804, 0x0f9f0010, 0x0f9fa000, 0x0f9fc046, 0x0fa20000,
+  0x0fa210ba, 0x0fa7f83e, 0x0faa5803, 0x0faa8017, 0x0fabd000, 0x0faca801,
+  0x0fad2000, 0x0fafd854, 0x0fb40045, 0x0fb66000, 0x0fb68002, 0x0fb6a802,
+  0x0fb6e003, 0x0fb75801, 0x0fb7a008, 0x0fbf000b, 0x0fbf8000, 0x0fc8602e,
+  0x0fc9e009, 0x0fca38b8, 0x0fd3800c, 0x0fd40009, 0x0fd47837, 0x0fd6700e,
+  0x0fd6f80a, 0x0fd78008,
+  /* Extended_Pictographic */
+  0x00054800, 0x00057000, 0x0101e000, 0x01024800, 0x01091000, 0x0109c800,
+  0x010ca005, 0x010d4801, 0x0118d001, 0x01194000, 0x011c4000, 0x011e7800,
+  0x011f480a, 0x011fc002, 0x01261000, 0x012d5001, 0x012db000, 0x012e0000,
+  0x012fd803, 0x01300005, 0x0130380b, 0x0130a071, 0x01348075, 0x0138400a,
+  0x0138a000, 0x0138b000, 0x0138e800, 0x01390800, 0x01394000, 0x01399801,
+  0x013a2000, 0x013a3800, 0x013a6000, 0x013a7000, 0x013a9802, 0x013ab800,
+  0x013b1804, 0x013ca802, 0x013d0800, 0x013d8000, 0x013df800, 0x0149a001,
+  0x01582802, 0x0158d801, 0x015a8000, 0x015aa800, 0x01818000, 0x0181e800,
+  0x0194b800, 0x0194c800, 0x0f8000ff, 0x0f886802, 0x0f897800, 0x0f8b6005,
+  0x0f8bf001, 0x0f8c7000, 0x0f8c8809, 0x0f8d6838, 0x0f90080e, 0x0f90d000,
+  0x0f917800, 0x0f919008, 0x0f91e003, 0x0f9249b1, 0x0fa0013d, 0x0faa3109,
+  0x0fb4007f, 0x0fbba00b, 0x0fbea82a, 0x0fc06003, 0x0fc24007, 0x0fc2d005,
+  0x0fc44007, 0x0fc57051, 0x0fc8602e, 0x0fc9e009, 0x0fca39b8, 0x0fe003fd,
+  /* Extender */
+  0x0005b800, 0x00168001, 0x00320000, 0x003fd000, 0x00538800, 0x0057d800,
+  0x005aa800, 0x00723000, 0x00763000, 0x00c05000, 0x00c21800, 0x00d53800,
+  0x00e1b000, 0x00e3d800, 0x01802800, 0x01818804, 0x0184e801, 0x0187e002,
+  0x0500a800, 0x05306000, 0x054e7800, 0x054f3000, 0x05538000, 0x0556e800,
+  0x05579801, 0x07fb8000, 0x083c0801, 0x086a7000, 0x086b5000, 0x086b7800,
+  0x0891b800, 0x089ae800, 0x089e9001, 0x08ae3002, 0x08d4c000, 0x0b5a1001,
+  0x0b7f0001, 0x0b7f1800, 0x0f09e001, 0x0f2f7800, 0x0f4a2002,
+  /* Grapheme_Base */
+  0x0001005e, 0x0005000c, 0x00057251, 0x001b8007, 0x001bd005, 0x001c2006,
+  0x001c6000, 0x001c7013, 0x001d18df, 0x002450a5, 0x00298825, 0x002ac831,
+  0x002c6802, 0x002df000, 0x002e0000, 0x002e1800, 0x002e3000, 0x002e801a,
+  0x002f7805, 0x00303009, 0x0030d800, 0x0030e82d, 0x0033000f, 0x00338864,
+  0x0036f000, 0x00372801, 0x00374800, 0x0037701f, 0x00388000, 0x0038901d,
+  0x003a6858, 0x003d8800, 0x003e002a, 0x003fa006, 0x003ff017, 0x0040d000,
+  0x00412000, 0x00414000, 0x0041800e, 0x00420018, 0x0042f000, 0x0043000a,
+  0x0043801e, 0x00450029, 0x00481836, 0x0049d800, 0x0049e803, 0x004a4803,
+  0x004a7002, 0x004ac009, 0x004b201c, 0x004c1001, 0x004c2807, 0x004c7801,
+  0x004c9815, 0x004d5006, 0x004d9000, 0x004db003, 0x004de800, 0x004df801,
+  0x004e3801, 0x004e5801, 0x004e7000, 0x004ee001, 0x004ef802, 0x004f3017,
+  0x00501800, 0x00502805, 0x00507801, 0x00509815, 0x00515006, 0x00519001,
+  0x0051a801, 0x0051c001, 0x0051f002, 0x0052c803, 0x0052f000, 0x00533009,
+  0x00539002, 0x0053b000, 0x00541800, 0x00542808, 0x00547802, 0x00549815,
+  0x00555006, 0x00559001, 0x0055a804, 0x0055e803, 0x00564800, 0x00565801,
+  0x00568000, 0x00570001, 0x0057300b, 0x0057c800, 0x00581001, 0x00582807,
+  0x00587801, 0x00589815, 0x00595006, 0x00599001, 0x0059a804, 0x0059e800,
+  0x005a0000, 0x005a3801, 0x005a5801, 0x005ae001, 0x005af802, 0x005b3011,
+  0x005c1800, 0x005c2805, 0x005c7002, 0x005c9003, 0x005cc801, 0x005ce000,
+  0x005cf001, 0x005d1801, 0x005d4002, 0x005d700b, 0x005df800, 0x005e0801,
+  0x005e3002, 0x005e5002, 0x005e8000, 0x005f3014, 0x00600802, 0x00602807,
+  0x00607002, 0x00609016, 0x0061500f, 0x0061e800, 0x00620803, 0x0062c002,
+  0x0062e800, 0x00630001, 0x00633009, 0x0063b809, 0x0064100a, 0x00647002,
+  0x00649016, 0x00655009, 0x0065a804, 0x0065e801, 0x00660800, 0x00661801,
+  0x0066e801, 0x00670001, 0x00673009, 0x00678802, 0x0068100a, 0x00687002,
+  0x00689028, 0x0069e800, 0x0069f801, 0x006a3002, 0x006a5002, 0x006a7001,
+  0x006aa002, 0x006ac009, 0x006b3019, 0x006c1001, 0x006c2811, 0x006cd017,
+  0x006d9808, 0x006de800, 0x006e0006, 0x006e8001, 0x006ec006, 0x006f3009,
+  0x006f9002, 0x0070082f, 0x00719001, 0x0071f807, 0x0072780c, 0x00740801,
+  0x00742000, 0x00743004, 0x00746017, 0x00752800, 0x00753809, 0x00759001,
+  0x0075e800, 0x00760004, 0x00763000, 0x00768009, 0x0076e003, 0x00780017,
+  0x0078d01a, 0x0079b000, 0x0079c000, 0x0079d00d, 0x007a4823, 0x007bf800,
+  0x007c2800, 0x007c4004, 0x007df007, 0x007e3805, 0x007e700c, 0x0080002c,
+  0x00818800, 0x0081c000, 0x0081d801, 0x0081f818, 0x0082d003, 0x0083080f,
+  0x0083a80c, 0x00841801, 0x00843805, 0x0084700e, 0x0084f027, 0x00863800,
+  0x00866800, 0x00868178, 0x00925003, 0x00928006, 0x0092c000, 0x0092d003,
+  0x00930028, 0x00945003, 0x00948020, 0x00959003, 0x0095c006, 0x00960000,
+  0x00961003, 0x0096400e, 0x0096c038, 0x00989003, 0x0098c042, 0x009b001c,
+  0x009c0019, 0x009d0055, 0x009fc005, 0x00a0029c, 0x00b50058, 0x00b80011,
+  0x00b8f812, 0x00b9a801, 0x00ba0011, 0x00bb000c, 0x00bb7002, 0x00bc0033,
+  0x00bdb000, 0x00bdf007, 0x00be3801, 0x00bea008, 0x00bf0009, 0x00bf8009,
+  0x00c0000a, 0x00c08009, 0x00c10058, 0x00c40004, 0x00c43821, 0x00c55000,
+  0x00c58045, 0x00c8001e, 0x00c91803, 0x00c94802, 0x00c98001, 0x00c99805,
+  0x00ca0000, 0x00ca2029, 0x00cb8004, 0x00cc002b, 0x00cd8019, 0x00ce800a,
+  0x00cef038, 0x00d0c801, 0x00d0f037, 0x00d2b800, 0x00d30800, 0x00d31801,
+  0x00d36805, 0x00d40009, 0x00d48009, 0x00d5000d, 0x00d8202f, 0x00d9f003,
+  0x00da2807, 0x00da701c, 0x00dba00b, 0x00dc101f, 0x00dd3001, 0x00dd7037,
+  0x00df3800, 0x00df5002, 0x00df7000, 0x00dfe02f, 0x00e1a001, 0x00e1d80e,
+  0x00e2683d, 0x00e4802a, 0x00e5e80a, 0x00e69800, 0x00e70800, 0x00e74803,
+  0x00e77005, 0x00e7a802, 0x00e7d000, 0x00e800bf, 0x00f00115, 0x00f8c005,
+  0x00f90025, 0x00fa4005, 0x00fa8007, 0x00fac800, 0x00fad800, 0x00fae800,
+  0x00faf81e, 0x00fc0034, 0x00fdb00e, 0x00fe300d, 0x00feb005, 0x00fee812,
+  0x00ff9002, 0x00ffb008, 0x0100000a, 0x01008017, 0x01017830, 0x01038001,
+  0x0103a01a, 0x0104800c, 0x01050020, 0x0108008b, 0x010c8299, 0x0122000a,
+  0x01230713, 0x015bb01f, 0x015cb957, 0x01679001, 0x0167c82c, 0x01693800,
+  0x01696800, 0x01698037, 0x016b7801, 0x016c0016, 0x016d0006, 0x016d4006,
+  0x016d8006, 0x016dc006, 0x016e0006, 0x016e4006, 0x016e8006, 0x016ec006,
+  0x0170005d, 0x01740019, 0x0174d858, 0x017800d5, 0x017f8039, 0x0181800f,
+  0x01820855, 0x0184d864, 0x0188282a, 0x0189885d, 0x018c8055, 0x018f782f,
+  0x019107ff, 0x01d107ff, 0x021107ff, 0x025107ff, 0x029107ff, 0x02d107ff,
+  0x031107ff, 0x035107ff, 0x039107ff, 0x03d107ff, 0x041107ff, 0x045107ff,
+  0x049107ff, 0x04d107ff, 0x0511026c, 0x05248036, 0x0526815b, 0x0532002e,
+  0x05339800, 0x0533f01f, 0x0535004f, 0x05379005, 0x053800cd, 0x053e8001,
+  0x053e9800, 0x053ea807, 0x053f900f, 0x05401802, 0x05403803, 0x05406018,
+  0x05413804, 0x05418009, 0x05420037, 0x05440043, 0x0546700b, 0x0547900c,
+  0x05480025, 0x05497018, 0x054a9000, 0x054af81d, 0x054c182f, 0x054da001,
+  0x054dd001, 0x054df001, 0x054e080c, 0x054e780a, 0x054ef006, 0x054f3018,
+  0x05500028, 0x05517801, 0x05519801, 0x05520002, 0x05522007, 0x05526800,
+  0x05528009, 0x0552e01f, 0x0553e832, 0x05558800, 0x0555a801, 0x0555c804,
+  0x05560000, 0x05561000, 0x0556d810, 0x05577007, 0x05580805, 0x05584805,
+  0x05588805, 0x05590006, 0x05594006, 0x0559803b, 0x055b8074, 0x055f3001,
+  0x055f4803, 0x055f8009, 0x056007ff, 0x05a007ff, 0x05e007ff, 0x062007ff,
+  0x066007ff, 0x06a003a3, 0x06bd8016, 0x06be5830, 0x07c8016d, 0x07d38069,
+  0x07d80006, 0x07d89804, 0x07d8e800, 0x07d8f817, 0x07d9c004, 0x07d9f000,
+  0x07da0001, 0x07da1801, 0x07da307c, 0x07de99bc, 0x07ec9035, 0x07ee7800,
+  0x07ef800f, 0x07f08009, 0x07f18022, 0x07f2a012, 0x07f34003, 0x07f38004,
+  0x07f3b086, 0x07f8089c, 0x07fd001e, 0x07fe1005, 0x07fe5005, 0x07fe9005,
+  0x07fed002, 0x07ff0006, 0x07ff4006, 0x07ffe001, 0x0800000b, 0x08006819,
+  0x08014012, 0x0801e001, 0x0801f80e, 0x0802800d, 0x0804007a, 0x08080002,
+  0x0808382c, 0x0809b857, 0x080c800c, 0x080d0000, 0x080e802c, 0x0814001c,
+  0x08150030, 0x0817081a, 0x08180023, 0x0819681d, 0x081a8025, 0x081c001d,
+  0x081cf824, 0x081e400d, 0x0820009d, 0x08250009, 0x08258023, 0x0826c023,
+  0x08280027, 0x08298033, 0x082b780b, 0x082be00e, 0x082c6006, 0x082ca001,
+  0x082cb80a, 0x082d180e, 0x082d9806, 0x082dd801, 0x082e0033, 0x08300136,
+  0x083a0015, 0x083b0007, 0x083c0005, 0x083c3829, 0x083d9008, 0x08400005,
+  0x08404000, 0x0840502b, 0x0841b801, 0x0841e000, 0x0841f816, 0x0842b847,
+  0x08453808, 0x08470012, 0x0847a001, 0x0847d820, 0x0848f81a, 0x0849f800,
+  0x084c0037, 0x084de013, 0x084e902e, 0x08508003, 0x0850a802, 0x0850c81c,
+  0x08520008, 0x08528008, 0x0853003f, 0x08560024, 0x0857580b, 0x08580035,
+  0x0859c81c, 0x085ac01a, 0x085bc019, 0x085cc803, 0x085d4806, 0x08600048,
+  0x08640032, 0x08660032, 0x0867d029, 0x08698009, 0x086a0025, 0x086b7017,
+  0x086c7001, 0x0873001e, 0x08740029, 0x08756800, 0x08758001, 0x08761002,
+  0x08780027, 0x08798015, 0x087a8808, 0x087b8011, 0x087c3003, 0x087d801b,
+  0x087f0016, 0x08800000, 0x08801035, 0x08823806, 0x0882901d, 0x08838801,
+  0x0883a800, 0x08841030, 0x0885b801, 0x0885d801, 0x0885f003, 0x08868018,
+  0x08878009, 0x08881823, 0x08896000, 0x0889b011, 0x088a8022, 0x088ba002,
+  0x088c1033, 0x088df800, 0x088e0807, 0x088e6801, 0x088e800f, 0x088f0813,
+  0x08900011, 0x0890981b, 0x08919001, 0x0891c005, 0x0891f801, 0x08940006,
+  0x08944000, 0x08945003, 0x0894780e, 0x0894f80a, 0x0895802e, 0x08970002,
+  0x08978009, 0x08981001, 0x08982807, 0x08987801, 0x08989815, 0x08995006,
+  0x08999001, 0x0899a804, 0x0899e800, 0x0899f800, 0x089a0803, 0x089a3801,
+  0x089a5801, 0x089a8000, 0x089ae806, 0x089c0009, 0x089c5800, 0x089c7000,
+  0x089c8025, 0x089db800, 0x089dc801, 0x089e5000, 0x089e6001, 0x089e8800,
+  0x089e9802, 0x089eb801, 0x08a00037, 0x08a20001, 0x08a22800, 0x08a23814,
+  0x08a2e800, 0x08a2f802, 0x08a4002f, 0x08a58801, 0x08a5c800, 0x08a5d801,
+  0x08a5f000, 0x08a60800, 0x08a62003, 0x08a68009, 0x08ac002e, 0x08ad8001,
+  0x08adc003, 0x08adf000, 0x08ae081a, 0x08b00032, 0x08b1d801, 0x08b1f000,
+  0x08b20803, 0x08b28009, 0x08b3000c, 0x08b4002a, 0x08b56000, 0x08b57001,
+  0x08b5c001, 0x08b60009, 0x08b68013, 0x08b8001a, 0x08b8f000, 0x08b90001,
+  0x08b93000, 0x08b98016, 0x08c0002e, 0x08c1c000, 0x08c1d800, 0x08c50052,
+  0x08c7f807, 0x08c84800, 0x08c86007, 0x08c8a801, 0x08c8c017, 0x08c98804,
+  0x08c9b801, 0x08c9f803, 0x08ca2002, 0x08ca8009, 0x08cd0007, 0x08cd5029,
+  0x08cee003, 0x08cf0803, 0x08d00000, 0x08d05827, 0x08d1c801, 0x08d1f807,
+  0x08d28000, 0x08d2b801, 0x08d2e02d, 0x08d4b800, 0x08d4d008, 0x08d58048,
+  0x08d80009, 0x08de0021, 0x08df8009, 0x08e00008, 0x08e05025, 0x08e1f000,
+  0x08e20005, 0x08e2801c, 0x08e3801f, 0x08e54800, 0x08e58800, 0x08e5a000,
+  0x08e80006, 0x08e84001, 0x08e85825, 0x08ea3000, 0x08ea8009, 0x08eb0005,
+  0x08eb3801, 0x08eb5024, 0x08ec9801, 0x08ecb000, 0x08ecc000, 0x08ed0009,
+  0x08f70012, 0x08f7a803, 0x08f8100e, 0x08f89023, 0x08f9f001, 0x08fa1816,
+  0x08fd8000, 0x08fe0031, 0x08fffb9a, 0x0920006e, 0x09238004, 0x092400c3,
+  0x097c8062, 0x0980042f, 0x09a20805, 0x09a307ff, 0x09e3079a, 0x0a200246,
+  0x0b08001d, 0x0b095002, 0x0b098009, 0x0b400238, 0x0b52001e, 0x0b530009,
+  0x0b537050, 0x0b560009, 0x0b56801d, 0x0b57a800, 0x0b58002f, 0x0b59b80e,
+  0x0b5a8009, 0x0b5ad806, 0x0b5b1814, 0x0b5be812, 0x0b6a0039, 0x0b72005a,
+  0x0b78004a, 0x0b7a8037, 0x0b7c980c, 0x0b7f0003, 0x0b8007ff, 0x0bc007ff,
+  0x0c0007f7, 0x0c4004d5, 0x0c67f809, 0x0d7f8003, 0x0d7fa806, 0x0d7fe801,
+  0x0d800122, 0x0d899000, 0x0d8a8002, 0x0d8aa800, 0x0d8b2003, 0x0d8b818b,
+  0x0de0006a, 0x0de3800c, 0x0de40008, 0x0de48009, 0x0de4e000, 0x0de4f800,
+  0x0e6000f9, 0x0e6801b3, 0x0e7a8073, 0x0e8000f5, 0x0e880026, 0x0e89483b,
+  0x0e8b5002, 0x0e8c1801, 0x0e8c601d, 0x0e8d703c, 0x0e900041, 0x0e922800,
+  0x0e960013, 0x0e970013, 0x0e980056, 0x0e9b0018, 0x0ea00054, 0x0ea2b046,
+  0x0ea4f001, 0x0ea51000, 0x0ea52801, 0x0ea54803, 0x0ea5700b, 0x0ea5d800,
+  0x0ea5e806, 0x0ea62840, 0x0ea83803, 0x0ea86807, 0x0ea8b006, 0x0ea8f01b,
+  0x0ea9d803, 0x0eaa0004, 0x0eaa3000, 0x0eaa5006, 0x0eaa9153, 0x0eb54123,
+  0x0ebe7231, 0x0ed1b803, 0x0ed36807, 0x0ed3b00d, 0x0ed42806, 0x0ef8001e,
+  0x0ef92805, 0x0f01803d, 0x0f08002c, 0x0f09b806, 0x0f0a0009, 0x0f0a7001,
+  0x0f14801d, 0x0f16002b, 0x0f178009, 0x0f17f800, 0x0f26801b, 0x0f278009,
+  0x0f2e801d, 0x0f2f800a, 0x0f2ff800, 0x0f3f0006, 0x0f3f4003, 0x0f3f6801,
+  0x0f3f800e, 0x0f4000c4, 0x0f463808, 0x0f480043, 0x0f4a5800, 0x0f4a8009,
+  0x0f4af001, 0x0f638843, 0x0f68083c, 0x0f700003, 0x0f70281a, 0x0f710801,
+  0x0f712000, 0x0f713800, 0x0f714809, 0x0f71a003, 0x0f71c800, 0x0f71d800,
+  0x0f721000, 0x0f723800, 0x0f724800, 0x0f725800, 0x0f726802, 0x0f728801,
+  0x0f72a000, 0x0f72b800, 0x0f72c800, 0x0f72d800, 0x0f72e800, 0x0f72f800,
+  0x0f730801, 0x0f732000, 0x0f733803, 0x0f736006, 0x0f73a003, 0x0f73c803,
+  0x0f73f000, 0x0f740009, 0x0f745810, 0x0f750802, 0x0f752804, 0x0f755810,
+  0x0f778001, 0x0f80002b, 0x0f818063, 0x0f85000e, 0x0f85880e, 0x0f86080e,
+  0x0f868824, 0x0f8800ad, 0x0f8f301c, 0x0f90802b, 0x0f920008, 0x0f928001,
+  0x0f930005, 0x0f9803d7, 0x0fb6e010, 0x0fb7800c, 0x0fb80076, 0x0fbbd85e,
+  0x0fbf000b, 0x0fbf8000, 0x0fc0000b, 0x0fc08037, 0x0fc28009, 0x0fc30027,
+  0x0fc4801d, 0x0fc5800b, 0x0fc60001, 0x0fc80153, 0x0fd3000d, 0x0fd3800c,
+  0x0fd40009, 0x0fd47837, 0x0fd6700e, 0x0fd6f80a, 0x0fd78008, 0x0fd80092,
+  0x0fdca065, 0x100007ff, 0x104007ff, 0x108007ff, 0x10c007ff, 0x110007ff,
+  0x114007ff, 0x118007ff, 0x11c007ff, 0x120007ff, 0x124007ff, 0x128007ff,
+  0x12c007ff, 0x130007ff, 0x134007ff, 0x138007ff, 0x13c007ff, 0x140007ff,
+  0x144007ff, 0x148007ff, 0x14c007ff, 0x150006df, 0x153807ff, 0x157807ff,
+  0x15b80039, 0x15ba00dd, 0x15c107ff, 0x160107ff, 0x16410681, 0x167587ff,
+  0x16b587ff, 0x16f587ff, 0x17358530, 0x175f826d, 0x17c0021d, 0x180007ff,
+  0x184007ff, 0x1880034a, 0x189a87ff, 0x18da87ff, 0x191a805f,
+  /* Grapheme_Extend */
+  0x0018006f, 0x00241806, 0x002c882c, 0x002df800, 0x002e0801, 0x002e2001,
+  0x002e3800, 0x0030800a, 0x00325814, 0x00338000, 0x0036b006, 0x0036f805,
+  0x00373801, 0x00375003, 0x00388800, 0x0039801a, 0x003d300a, 0x003f5808,
+  0x003fe800, 0x0040b003, 0x0040d808, 0x00412802, 0x00414804, 0x0042c802,
+  0x0044b808, 0x00465017, 0x0047181f, 0x0049d000, 0x0049e000, 0x004a0807,
+  0x004a6800, 0x004a8806, 0x004b1001, 0x004c0800, 0x004de000, 0x004df000,
+  0x004e0803, 0x004e6800, 0x004eb800, 0x004f1001, 0x004ff000, 0x00500801,
+  0x0051e000, 0x00520801, 0x00523801, 0x00525802, 0x00528800, 0x00538001,
+  0x0053a800, 0x00540801, 0x0055e000, 0x00560804, 0x00563801, 0x00566800,
+  0x00571001, 0x0057d005, 0x00580800, 0x0059e000, 0x0059f001, 0x005a0803,
+  0x005a6800, 0x005aa802, 0x005b1001, 0x005c1000, 0x005df000, 0x005e0000,
+  0x005e6800, 0x005eb800, 0x00600000, 0x00602000, 0x0061e000, 0x0061f002,
+  0x00623002, 0x00625003, 0x0062a801, 0x00631001, 0x00640800, 0x0065e000,
+  0x0065f801, 0x00661000, 0x00663002, 0x00665003, 0x0066a801, 0x00671001,
+  0x00680001, 0x0069d801, 0x0069f000, 0x006a0803, 0x006a6800, 0x006ab800,
+  0x006b1001, 0x006c0800, 0x006e5000, 0x006e7800, 0x006e9002, 0x006eb000,
+  0x006ef800, 0x00718800, 0x0071a006, 0x00723807, 0x00758800, 0x0075a008,
+  0x00764006, 0x0078c001, 0x0079a800, 0x0079b800, 0x0079c800, 0x007b880d,
+  0x007c0004, 0x007c3001, 0x007c680a, 0x007cc823, 0x007e3000, 0x00816803,
+  0x00819005, 0x0081c801, 0x0081e801, 0x0082c001, 0x0082f002, 0x00838803,
+  0x00841000, 0x00842801, 0x00846800, 0x0084e800, 0x009ae802, 0x00b89003,
+  0x00b99002, 0x00ba9001, 0x00bb9001, 0x00bda001, 0x00bdb806, 0x00be3000,
+  0x00be480a, 0x00bee800, 0x00c05802, 0x00c07800, 0x00c42801, 0x00c54800,
+  0x00c90002, 0x00c93801, 0x00c99000, 0x00c9c802, 0x00d0b801, 0x00d0d800,
+  0x00d2b000, 0x00d2c006, 0x00d30000, 0x00d31000, 0x00d32807, 0x00d39809,
+  0x00d3f800, 0x00d5801e, 0x00d80003, 0x00d9a009, 0x00da1002, 0x00db5808,
+  0x00dc0001, 0x00dd1003, 0x00dd4005, 0x00df3000, 0x00df4001, 0x00df6800,
+  0x00df7804, 0x00e16007, 0x00e1b001, 0x00e68002, 0x00e6a00c, 0x00e71006,
+  0x00e76800, 0x00e7a000, 0x00e7c001, 0x00ee003f, 0x01006000, 0x01068020,
+  0x01677802, 0x016bf800, 0x016f001f, 0x01815005, 0x0184c801, 0x05337803,
+  0x0533a009, 0x0534f001, 0x05378001, 0x05401000, 0x05403000, 0x05405800,
+  0x05412801, 0x05416000, 0x05462001, 0x05470011, 0x0547f800, 0x05493007,
+  0x054a380a, 0x054a9800, 0x054c0002, 0x054d9800, 0x054db003, 0x054de001,
+  0x054e0000, 0x054f2800, 0x05514805, 0x05518801, 0x0551a801, 0x05521800,
+  0x05526000, 0x0553e000, 0x05558000, 0x05559002, 0x0555b801, 0x0555f001,
+  0x05560800, 0x05576001, 0x0557b000, 0x055f2800, 0x055f4000, 0x055f6800,
+  0x07d8f000, 0x07f0000f, 0x07f1000f, 0x07fcf001, 0x080fe800, 0x08170000,
+  0x081bb004, 0x08500802, 0x08502801, 0x08506003, 0x0851c002, 0x0851f800,
+  0x08572801, 0x08692003, 0x086b4804, 0x08755801, 0x0877e003, 0x087a300a,
+  0x087c1003, 0x08800800, 0x0881c00e, 0x08838000, 0x08839801, 0x0883f802,
+  0x08859803, 0x0885c801, 0x08861000, 0x08880002, 0x08893804, 0x08896807,
+  0x088b9800, 0x088c0001, 0x088db008, 0x088e0000, 0x088e4803, 0x088e7800,
+  0x08917802, 0x0891a003, 0x0891f000, 0x08920800, 0x0896f800, 0x08971807,
+  0x08980001, 0x0899d801, 0x0899f000, 0x089a0000, 0x089a6800, 0x089ab800,
+  0x089b3006, 0x089b8004, 0x089dc000, 0x089dd805, 0x089e1000, 0x089e2800,
+  0x089e3802, 0x089e7002, 0x089e9000, 0x089f0801, 0x08a1c007, 0x08a21002,
+  0x08a23000, 0x08a2f000, 0x08a58000, 0x08a59805, 0x08a5d000, 0x08a5e800,
+  0x08a5f801, 0x08a61001, 0x08ad7800, 0x08ad9003, 0x08ade001, 0x08adf801,
+  0x08aee001, 0x08b19807, 0x08b1e800, 0x08b1f801, 0x08b55800, 0x08b56800,
+  0x08b58007, 0x08b8e800, 0x08b8f800, 0x08b91003, 0x08b93804, 0x08c17808,
+  0x08c1c801, 0x08c98000, 0x08c9d803, 0x08ca1800, 0x08cea003, 0x08ced001,
+  0x08cf0000, 0x08d00809, 0x08d19805, 0x08d1d803, 0x08d23800, 0x08d28805,
+  0x08d2c802, 0x08d4500c, 0x08d4c001, 0x08e18006, 0x08e1c005, 0x08e1f800,
+  0x08e49015, 0x08e55006, 0x08e59001, 0x08e5a801, 0x08e98805, 0x08e9d000,
+  0x08e9e001, 0x08e9f806, 0x08ea3800, 0x08ec8001, 0x08eca800, 0x08ecb800,
+  0x08f79801, 0x08f80001, 0x08f9b004, 0x08fa0002, 0x08fad000, 0x09a20000,
+  0x09a2380e, 0x0b08f00b, 0x0b096802, 0x0b578004, 0x0b598006, 0x0b7a7800,
+  0x0b7c7803, 0x0b7f2000, 0x0b7f8001, 0x0de4e801, 0x0e78002d, 0x0e798016,
+  0x0e8b2804, 0x0e8b6805, 0x0e8bd807, 0x0e8c2806, 0x0e8d5003, 0x0e921002,
+  0x0ed00036, 0x0ed1d831, 0x0ed3a800, 0x0ed42000, 0x0ed4d804, 0x0ed5080e,
+  0x0f000006, 0x0f004010, 0x0f00d806, 0x0f011801, 0x0f013004, 0x0f047800,
+  0x0f098006, 0x0f157000, 0x0f176003, 0x0f276003, 0x0f2f7001, 0x0f468006,
+  0x0f4a2006, 0x7001005f, 0x700800ef,
+  /* Grapheme_Link */
+  0x004a6800, 0x004e6800, 0x00526800, 0x00566800, 0x005a6800, 0x005e6800,
+  0x00626800, 0x00666800, 0x0069d801, 0x006a6800, 0x006e5000, 0x0071d000,
+  0x0075d000, 0x007c2000, 0x0081c801, 0x00b8a001, 0x00b9a000, 0x00be9000,
+  0x00d30000, 0x00da2000, 0x00dd5001, 0x00df9001, 0x016bf800, 0x05403000,
+  0x05416000, 0x05462000, 0x054a9800, 0x054e0000, 0x0557b000, 0x055f6800,
+  0x0851f800, 0x08823000, 0x08838000, 0x0883f800, 0x0885c800, 0x08899801,
+  0x088e0000, 0x0891a800, 0x08975000, 0x089a6800, 0x089e7002, 0x08a21000,
+  0x08a61000, 0x08adf800, 0x08b1f800, 0x08b5b000, 0x08b95800, 0x08c1c800,
+  0x08c9e801, 0x08cf0000, 0x08d1a000, 0x08d23800, 0x08d4c800, 0x08e1f800,
+  0x08ea2001, 0x08ecb800, 0x08fa0801, 0x0b097800,
+  /* Hex_Digit */
+  0x00018009, 0x00020805, 0x00030805, 0x07f88009, 0x07f90805, 0x07fa0805,
+  /* IDS_Binary_Operator */
+  0x017f8001, 0x017fa009, 0x018f7800,
+  /* IDS_Trinary_Operator */
+  0x017f9001,
+  /* IDS_Unary_Operator */
+  0x017ff001,
+  /* ID_Compat_Math_Continue */
+  0x00059001, 0x0005c800, 0x01038000, 0x0103a00a, 0x0104000e, 0x01101000,
+  0x01103800, 0x0110f000, 0x0eb60800, 0x0eb6d800, 0x0eb7d800, 0x0eb8a800,
+  0x0eb9a800, 0x0eba7800, 0x0ebb7800, 0x0ebc4800, 0x0ebd4800, 0x0ebe1800,
+  /* ID_Compat_Math_Start */
+  0x01101000, 0x01103800, 0x0110f000, 0x0eb60800, 0x0eb6d800, 0x0eb7d800,
+  0x0eb8a800, 0x0eb9a800, 0x0eba7800, 0x0ebb7800, 0x0ebc4800, 0x0ebd4800,
+  0x0ebe1800,
+  /* ID_Continue */
+  0x00018009, 0x00020819, 0x0002f800, 0x00030819, 0x00055000, 0x0005a800,
+  0x0005b800, 0x0005d000, 0x00060016, 0x0006c01e, 0x0007c1c9, 0x0016300b,
+  0x00170004, 0x00176000, 0x00177000, 0x00180074, 0x001bb001, 0x001bd003,
+  0x001bf800, 0x001c3004, 0x001c6000, 0x001c7013, 0x001d1852, 0x001fb88a,
+  0x00241804, 0x002450a5, 0x00298825, 0x002ac800, 0x002b0028, 0x002c882c,
+  0x002df800, 0x002e0801, 0x002e2001, 0x002e3800, 0x002e801a, 0x002f7803,
+  0x0030800a, 0x00310049, 0x00337065, 0x0036a807, 0x0036f809, 0x00375012,
+  0x0037f800, 0x0038803a, 0x003a6864, 0x003e0035, 0x003fd000, 0x003fe800,
+  0x0040002d, 0x0042001b, 0x0043000a, 0x00438017, 0x00444805, 0x0044b84a,
+  0x00471880, 0x004b3009, 0x004b8812, 0x004c2807, 0x004c7801, 0x004c9815,
+  0x004d5006, 0x004d9000, 0x004db003, 0x004de008, 0x004e3801, 0x004e5803,
+  0x004eb800, 0x004ee001, 0x004ef804, 0x004f300b, 0x004fe000, 0x004ff000,
+  0x00500802, 0x00502805, 0x00507801, 0x00509815, 0x00515006, 0x00519001,
+  0x0051a801, 0x0051c001, 0x0051e000, 0x0051f004, 0x00523801, 0x00525802,
+  0x00528800, 0x0052c803, 0x0052f000, 0x0053300f, 0x00540802, 0x00542808,
+  0x00547802, 0x00549815, 0x00555006, 0x00559001, 0x0055a804, 0x0055e009,
+  0x00563802, 0x00565802, 0x00568000, 0x00570003, 0x00573009, 0x0057c806,
+  0x00580802, 0x00582807, 0x00587801, 0x00589815, 0x00595006, 0x00599001,
+  0x0059a804, 0x0059e008, 0x005a3801, 0x005a5802, 0x005aa802, 0x005ae001,
+  0x005af804, 0x005b3009, 0x005b8800, 0x005c1001, 0x005c2805, 0x005c7002,
+  0x005c9003, 0x005cc801, 0x005ce000, 0x005cf001, 0x005d1801, 0x005d4002,
+  0x005d700b, 0x005df004, 0x005e3002, 0x005e5003, 0x005e8000, 0x005eb800,
+  0x005f3009, 0x0060000c, 0x00607002, 0x00609016, 0x0061500f, 0x0061e008,
+  0x00623002, 0x00625003, 0x0062a801, 0x0062c002, 0x0062e800, 0x00630003,
+  0x00633009, 0x00640003, 0x00642807, 0x00647002, 0x00649016, 0x00655009,
+  0x0065a804, 0x0065e008, 0x00663002, 0x00665003, 0x0066a801, 0x0066e801,
+  0x00670003, 0x00673009, 0x00678802, 0x0068000c, 0x00687002, 0x00689032,
+  0x006a3002, 0x006a5004, 0x006aa003, 0x006af804, 0x006b3009, 0x006bd005,
+  0x006c0802, 0x006c2811, 0x006cd017, 0x006d9808, 0x006de800, 0x006e0006,
+  0x006e5000, 0x006e7805, 0x006eb000, 0x006ec007, 0x006f3009, 0x006f9001,
+  0x00700839, 0x0072000e, 0x00728009, 0x00740801, 0x00742000, 0x00743004,
+  0x00746017, 0x00752800, 0x00753816, 0x00760004, 0x00763000, 0x00764006,
+  0x00768009, 0x0076e003, 0x00780000, 0x0078c001, 0x00790009, 0x0079a800,
+  0x0079b800, 0x0079c800, 0x0079f009, 0x007a4823, 0x007b8813, 0x007c3011,
+  0x007cc823, 0x007e3000, 0x00800049, 0x0082804d, 0x00850025, 0x00863800,
+  0x00866800, 0x0086802a, 0x0087e14c, 0x00925003, 0x00928006, 0x0092c000,
+  0x0092d003, 0x00930028, 0x00945003, 0x00948020, 0x00959003, 0x0095c006,
+  0x00960000, 0x00961003, 0x0096400e, 0x0096c038, 0x00989003, 0x0098c042,
+  0x009ae802, 0x009b4808, 0x009c000f, 0x009d0055, 0x009fc005, 0x00a00a6b,
+  0x00b37810, 0x00b40819, 0x00b5004a, 0x00b7700a, 0x00b80015, 0x00b8f815,
+  0x00ba0013, 0x00bb000c, 0x00bb7002, 0x00bb9001, 0x00bc0053, 0x00beb800,
+  0x00bee001, 0x00bf0009, 0x00c05802, 0x00c0780a, 0x00c10058, 0x00c4002a,
+  0x00c58045, 0x00c8001e, 0x00c9000b, 0x00c9800b, 0x00ca3027, 0x00cb8004,
+  0x00cc002b, 0x00cd8019, 0x00ce800a, 0x00d0001b, 0x00d1003e, 0x00d3001c,
+  0x00d3f80a, 0x00d48009, 0x00d53800, 0x00d5800d, 0x00d5f80f, 0x00d8004c,
+  0x00da8009, 0x00db5808, 0x00dc0073, 0x00e00037, 0x00e20009, 0x00e26830,
+  0x00e4000a, 0x00e4802a, 0x00e5e802, 0x00e68002, 0x00e6a026, 0x00e80215,
+  0x00f8c005, 0x00f90025, 0x00fa4005, 0x00fa8007, 0x00fac800, 0x00fad800,
+  0x00fae800, 0x00faf81e, 0x00fc0034, 0x00fdb006, 0x00fdf000, 0x00fe1002,
+  0x00fe3006, 0x00fe8003, 0x00feb005, 0x00ff000c, 0x00ff9002, 0x00ffb006,
+  0x01006001, 0x0101f801, 0x0102a000, 0x01038800, 0x0103f800, 0x0104800c,
+  0x0106800c, 0x01070800, 0x0107280b, 0x01081000, 0x01083800, 0x01085009,
+  0x0108a800, 0x0108c005, 0x01092000, 0x01093000, 0x01094000, 0x0109500f,
+  0x0109e003, 0x010a2804, 0x010a7000, 0x010b0028, 0x016000e4, 0x01675808,
+  0x01680025, 0x01693800, 0x01696800, 0x01698037, 0x016b7800, 0x016bf817,
+  0x016d0006, 0x016d4006, 0x016d8006, 0x016dc006, 0x016e0006, 0x016e4006,
+  0x016e8006, 0x016ec006, 0x016f001f, 0x01802802, 0x0181080e, 0x01818804,
+  0x0181c004, 0x01820855, 0x0184c806, 0x0185085e, 0x0188282a, 0x0189885d,
+  0x018d001f, 0x018f800f, 0x01a007ff, 0x01e007ff, 0x022007ff, 0x026001bf,
+  0x027007ff, 0x02b007ff, 0x02f007ff, 0x033007ff, 0x037007ff, 0x03b007ff,
+  0x03f007ff, 0x043007ff, 0x047007ff, 0x04b007ff, 0x04f0068c, 0x0526802d,
+  0x0528010c, 0x0530801b, 0x0532002f, 0x0533a009, 0x0533f872, 0x0538b808,
+  0x05391066, 0x053c5842, 0x053e8001, 0x053e9800, 0x053ea807, 0x053f9035,
+  0x05416000, 0x05420033, 0x05440045, 0x05468009, 0x05470017, 0x0547d800,
+  0x0547e830, 0x05498023, 0x054b001c, 0x054c0040, 0x054e780a, 0x054f001e,
+  0x05500036, 0x0552000d, 0x05528009, 0x05530016, 0x0553d048, 0x0556d802,
+  0x0557000f, 0x05579004, 0x05580805, 0x05584805, 0x05588805, 0x05590006,
+  0x05594006, 0x0559802a, 0x055ae00d, 0x055b807a, 0x055f6001, 0x055f8009,
+  0x056007ff, 0x05a007ff, 0x05e007ff, 0x062007ff, 0x066007ff, 0x06a003a3,
+  0x06bd8016, 0x06be5830, 0x07c8016d, 0x07d38069, 0x07d80006, 0x07d89804,
+  0x07d8e80b, 0x07d9500c, 0x07d9c004, 0x07d9f000, 0x07da0001, 0x07da1801,
+  0x07da306b, 0x07de996a, 0x07ea803f, 0x07ec9035, 0x07ef800b, 0x07f0000f,
+  0x07f1000f, 0x07f19801, 0x07f26802, 0x07f38004, 0x07f3b086, 0x07f88009,
+  0x07f90819, 0x07f9f800, 0x07fa0819, 0x07fb2859, 0x07fe1005, 0x07fe5005,
+  0x07fe9005, 0x07fed002, 0x0800000b, 0x08006819, 0x08014012, 0x0801e001,
+  0x0801f80e, 0x0802800d, 0x0804007a, 0x080a0034, 0x080fe800, 0x0814001c,
+  0x08150030, 0x08170000, 0x0818001f, 0x0819681d, 0x081a802a, 0x081c001d,
+  0x081d0023, 0x081e4007, 0x081e8804, 0x0820009d, 0x08250009, 0x08258023,
+  0x0826c023, 0x08280027, 0x08298033, 0x082b800a, 0x082be00e, 0x082c6006,
+  0x082ca001, 0x082cb80a, 0x082d180e, 0x082d9806, 0x082dd801, 0x082e0033,
+  0x08300136, 0x083a0015, 0x083b0007, 0x083c0005, 0x083c3829, 0x083d9008,
+  0x08400005, 0x08404000, 0x0840502b, 0x0841b801, 0x0841e000, 0x0841f816,
+  0x08430016, 0x0844001e, 0x08470012, 0x0847a001, 0x08480015, 0x08490019,
+  0x084c0037, 0x084df001, 0x08500003, 0x08502801, 0x08506007, 0x0850a802,
+  0x0850c81c, 0x0851c002, 0x0851f800, 0x0853001c, 0x0854001c, 0x08560007,
+  0x0856481d, 0x08580035, 0x085a0015, 0x085b0012, 0x085c0011, 0x08600048,
+  0x08640032, 0x08660032, 0x08680027, 0x08698009, 0x086a0025, 0x086b4804,
+  0x086b7816, 0x08740029, 0x08755801, 0x08758001, 0x08761002, 0x0877e020,
+  0x08793800, 0x08798020, 0x087b8015, 0x087d8014, 0x087f0016, 0x08800046,
+  0x0883300f, 0x0883f83b, 0x08861000, 0x08868018, 0x08878009, 0x08880034,
+  0x0889b009, 0x088a2003, 0x088a8023, 0x088bb000, 0x088c0044, 0x088e4803,
+  0x088e700c, 0x088ee000, 0x08900011, 0x08909824, 0x0891f003, 0x08940006,
+  0x08944000, 0x08945003, 0x0894780e, 0x0894f809, 0x0895803a, 0x08978009,
+  0x08980003, 0x08982807, 0x08987801, 0x08989815, 0x08995006, 0x08999001,
+  0x0899a804, 0x0899d809, 0x089a3801, 0x089a5802, 0x089a8000, 0x089ab800,
+  0x089ae806, 0x089b3006, 0x089b8004, 0x089c0009, 0x089c5800, 0x089c7000,
+  0x089c8025, 0x089db809, 0x089e1000, 0x089e2800, 0x089e3803, 0x089e6007,
+  0x089f0801, 0x08a0004a, 0x08a28009, 0x08a2f003, 0x08a40045, 0x08a63800,
+  0x08a68009, 0x08ac0035, 0x08adc008, 0x08aec005, 0x08b00040, 0x08b22000,
+  0x08b28009, 0x08b40038, 0x08b60009, 0x08b68013, 0x08b8001a, 0x08b8e80e,
+  0x08b98009, 0x08ba0006, 0x08c0003a, 0x08c50049, 0x08c7f807, 0x08c84800,
+  0x08c86007, 0x08c8a801, 0x08c8c01d, 0x08c9b801, 0x08c9d808, 0x08ca8009,
+  0x08cd0007, 0x08cd502d, 0x08ced007, 0x08cf1801, 0x08d0003e, 0x08d23800,
+  0x08d28049, 0x08d4e800, 0x08d58048, 0x08de0020, 0x08df8009, 0x08e00008,
+  0x08e0502c, 0x08e1c008, 0x08e28009, 0x08e3901d, 0x08e49015, 0x08e5480d,
+  0x08e80006, 0x08e84001, 0x08e8582b, 0x08e9d000, 0x08e9e001, 0x08e9f808,
+  0x08ea8009, 0x08eb0005, 0x08eb3801, 0x08eb5024, 0x08ec8001, 0x08ec9805,
+  0x08ed0009, 0x08f70016, 0x08f80010, 0x08f89028, 0x08f9f004, 0x08fa800a,
+  0x08fd8000, 0x09000399, 0x0920006e, 0x092400c3, 0x097c8060, 0x0980042f,
+  0x09a20015, 0x09a307ff, 0x09e3079a, 0x0a200246, 0x0b080039, 0x0b400238,
+  0x0b52001e, 0x0b530009, 0x0b53804e, 0x0b560009, 0x0b56801d, 0x0b578004,
+  0x0b580036, 0x0b5a0003, 0x0b5a8009, 0x0b5b1814, 0x0b5be812, 0x0b6a002c,
+  0x0b6b8009, 0x0b72003f, 0x0b78004a, 0x0b7a7838, 0x0b7c7810, 0x0b7f0001,
+  0x0b7f1801, 0x0b7f8001, 0x0b8007ff, 0x0bc007ff, 0x0c0007f7, 0x0c4004d5,
+  0x0c67f809, 0x0d7f8003, 0x0d7fa806, 0x0d7fe801, 0x0d800122, 0x0d899000,
+  0x0d8a8002, 0x0d8aa800, 0x0d8b2003, 0x0d8b818b, 0x0de0006a, 0x0de3800c,
+  0x0de40008, 0x0de48009, 0x0de4e801, 0x0e678009, 0x0e78002d, 0x0e798016,
+  0x0e8b2804, 0x0e8b6805, 0x0e8bd807, 0x0e8c2806, 0x0e8d5003, 0x0e921002,
+  0x0ea00054, 0x0ea2b046, 0x0ea4f001, 0x0ea51000, 0x0ea52801, 0x0ea54803,
+  0x0ea5700b, 0x0ea5d800, 0x0ea5e806, 0x0ea62840, 0x0ea83803, 0x0ea86807,
+  0x0ea8b006, 0x0ea8f01b, 0x0ea9d803, 0x0eaa0004, 0x0eaa3000, 0x0eaa5006,
+  0x0eaa9153, 0x0eb54018, 0x0eb61018, 0x0eb6e01e, 0x0eb7e018, 0x0eb8b01e,
+  0x0eb9b018, 0x0eba801e, 0x0ebb8018, 0x0ebc501e, 0x0ebd5018, 0x0ebe2007,
+  0x0ebe7031, 0x0ed00036, 0x0ed1d831, 0x0ed3a800, 0x0ed42000, 0x0ed4d804,
+  0x0ed5080e, 0x0ef8001e, 0x0ef92805, 0x0f000006, 0x0f004010, 0x0f00d806,
+  0x0f011801, 0x0f013004, 0x0f01803d, 0x0f047800, 0x0f08002c, 0x0f09800d,
+  0x0f0a0009, 0x0f0a7000, 0x0f14801e, 0x0f160039, 0x0f268029, 0x0f2e802a,
+  0x0f3f0006, 0x0f3f4003, 0x0f3f6801, 0x0f3f800e, 0x0f4000c4, 0x0f468006,
+  0x0f48004b, 0x0f4a8009, 0x0f700003, 0x0f70281a, 0x0f710801, 0x0f712000,
+  0x0f713800, 0x0f714809, 0x0f71a003, 0x0f71c800, 0x0f71d800, 0x0f721000,
+  0x0f723800, 0x0f724800, 0x0f725800, 0x0f726802, 0x0f728801, 0x0f72a000,
+  0x0f72b800, 0x0f72c800, 0x0f72d800, 0x0f72e800, 0x0f72f800, 0x0f730801,
+  0x0f732000, 0x0f733803, 0x0f736006, 0x0f73a003, 0x0f73c803, 0x0f73f000,
+  0x0f740009, 0x0f745810, 0x0f750802, 0x0f752804, 0x0f755810, 0x0fdf8009,
+  0x100007ff, 0x104007ff, 0x108007ff, 0x10c007ff, 0x110007ff, 0x114007ff,
+  0x118007ff, 0x11c007ff, 0x120007ff, 0x124007ff, 0x128007ff, 0x12c007ff,
+  0x130007ff, 0x134007ff, 0x138007ff, 0x13c007ff, 0x140007ff, 0x144007ff,
+  0x148007ff, 0x14c007ff, 0x150006df, 0x153807ff, 0x157807ff, 0x15b80039,
+  0x15ba00dd, 0x15c107ff, 0x160107ff, 0x16410681, 0x167587ff, 0x16b587ff,
+  0x16f587ff, 0x17358530, 0x175f826d, 0x17c0021d, 0x180007ff, 0x184007ff,
+  0x1880034a, 0x189a87ff, 0x18da87ff, 0x191a805f, 0x700800ef,
+  /* ID_Start */
+  0x00020819, 0x00030819, 0x00055000, 0x0005a800, 0x0005d000, 0x00060016,
+  0x0006c01e, 0x0007c1c9, 0x0016300b, 0x00170004, 0x00176000, 0x00177000,
+  0x001b8004, 0x001bb001, 0x001bd003, 0x001bf800, 0x001c3000, 0x001c4002,
+  0x001c6000, 0x001c7013, 0x001d1852, 0x001fb88a, 0x002450a5, 0x00298825,
+  0x002ac800, 0x002b0028, 0x002e801a, 0x002f7803, 0x0031002a, 0x00337001,
+  0x00338862, 0x0036a800, 0x00372801, 0x00377001, 0x0037d002, 0x0037f800,
+  0x00388000, 0x0038901d, 0x003a6858, 0x003d8800, 0x003e5020, 0x003fa001,
+  0x003fd000, 0x00400015, 0x0040d000, 0x00412000, 0x00414000, 0x00420018,
+  0x0043000a, 0x00438017, 0x00444805, 0x00450029, 0x00482035, 0x0049e800,
+  0x004a8000, 0x004ac009, 0x004b880f, 0x004c2807, 0x004c7801, 0x004c9815,
+  0x004d5006, 0x004d9000, 0x004db003, 0x004de800, 0x004e7000, 0x004ee001,
+  0x004ef802, 0x004f8001, 0x004fe000, 0x00502805, 0x00507801, 0x00509815,
+  0x00515006, 0x00519001, 0x0051a801, 0x0051c001, 0x0052c803, 0x0052f000,
+  0x00539002, 0x00542808, 0x00547802, 0x00549815, 0x00555006, 0x00559001,
+  0x0055a804, 0x0055e800, 0x00568000, 0x00570001, 0x0057c800, 0x00582807,
+  0x00587801, 0x00589815, 0x00595006, 0x00599001, 0x0059a804, 0x0059e800,
+  0x005ae001, 0x005af802, 0x005b8800, 0x005c1800, 0x005c2805, 0x005c7002,
+  0x005c9003, 0x005cc801, 0x005ce000, 0x005cf001, 0x005d1801, 0x005d4002,
+  0x005d700b, 0x005e8000, 0x00602807, 0x00607002, 0x00609016, 0x0061500f,
+  0x0061e800, 0x0062c002, 0x0062e800, 0x00630001, 0x00640000, 0x00642807,
+  0x00647002, 0x00649016, 0x00655009, 0x0065a804, 0x0065e800, 0x0066e801,
+  0x00670001, 0x00678801, 0x00682008, 0x00687002, 0x00689028, 0x0069e800,
+  0x006a7000, 0x006aa002, 0x006af802, 0x006bd005, 0x006c2811, 0x006cd017,
+  0x006d9808, 0x006de800, 0x006e0006, 0x0070082f, 0x00719001, 0x00720006,
+  0x00740801, 0x00742000, 0x00743004, 0x00746017, 0x00752800, 0x00753809,
+  0x00759001, 0x0075e800, 0x00760004, 0x00763000, 0x0076e003, 0x00780000,
+  0x007a0007, 0x007a4823, 0x007c4004, 0x0080002a, 0x0081f800, 0x00828005,
+  0x0082d003, 0x00830800, 0x00832801, 0x00837002, 0x0083a80c, 0x00847000,
+  0x00850025, 0x00863800, 0x00866800, 0x0086802a, 0x0087e14c, 0x00925003,
+  0x00928006, 0x0092c000, 0x0092d003, 0x00930028, 0x00945003, 0x00948020,
+  0x00959003, 0x0095c006, 0x00960000, 0x00961003, 0x0096400e, 0x0096c038,
+  0x00989003, 0x0098c042, 0x009c000f, 0x009d0055, 0x009fc005, 0x00a00a6b,
+  0x00b37810, 0x00b40819, 0x00b5004a, 0x00b7700a, 0x00b80011, 0x00b8f812,
+  0x00ba0011, 0x00bb000c, 0x00bb7002, 0x00bc0033, 0x00beb800, 0x00bee000,
+  0x00c10058, 0x00c40028, 0x00c55000, 0x00c58045, 0x00c8001e, 0x00ca801d,
+  0x00cb8004, 0x00cc002b, 0x00cd8019, 0x00d00016, 0x00d10034, 0x00d53800,
+  0x00d8282e, 0x00da2807, 0x00dc181d, 0x00dd7001, 0x00ddd02b, 0x00e00023,
+  0x00e26802, 0x00e2d023, 0x00e4000a, 0x00e4802a, 0x00e5e802, 0x00e74803,
+  0x00e77005, 0x00e7a801, 0x00e7d000, 0x00e800bf, 0x00f00115, 0x00f8c005,
+  0x00f90025, 0x00fa4005, 0x00fa8007, 0x00fac800, 0x00fad800, 0x00fae800,
+  0x00faf81e, 0x00fc0034, 0x00fdb006, 0x00fdf000, 0x00fe1002, 0x00fe3006,
+  0x00fe8003, 0x00feb005, 0x00ff000c, 0x00ff9002, 0x00ffb006, 0x01038800,
+  0x0103f800, 0x0104800c, 0x01081000, 0x01083800, 0x01085009, 0x0108a800,
+  0x0108c005, 0x01092000, 0x01093000, 0x01094000, 0x0109500f, 0x0109e003,
+  0x010a2804, 0x010a7000, 0x010b0028, 0x016000e4, 0x01675803, 0x01679001,
+  0x01680025, 0x01693800, 0x01696800, 0x01698037, 0x016b7800, 0x016c0016,
+  0x016d0006, 0x016d4006, 0x016d8006, 0x016dc006, 0x016e0006, 0x016e4006,
+  0x016e8006, 0x016ec006, 0x01802802, 0x01810808, 0x01818804, 0x0181c004,
+  0x01820855, 0x0184d804, 0x01850859, 0x0187e003, 0x0188282a, 0x0189885d,
+  0x018d001f, 0x018f800f, 0x01a007ff, 0x01e007ff, 0x022007ff, 0x026001bf,
+  0x027007ff, 0x02b007ff, 0x02f007ff, 0x033007ff, 0x037007ff, 0x03b007ff,
+  0x03f007ff, 0x043007ff, 0x047007ff, 0x04b007ff, 0x04f0068c, 0x0526802d,
+  0x0528010c, 0x0530800f, 0x05315001, 0x0532002e, 0x0533f81e, 0x0535004f,
+  0x0538b808, 0x05391066, 0x053c5842, 0x053e8001, 0x053e9800, 0x053ea807,
+  0x053f900f, 0x05401802, 0x05403803, 0x05406016, 0x05420033, 0x05441031,
+  0x05479005, 0x0547d800, 0x0547e801, 0x0548501b, 0x05498016, 0x054b001c,
+  0x054c202e, 0x054e7800, 0x054f0004, 0x054f3009, 0x054fd004, 0x05500028,
+  0x05520002, 0x05522007, 0x05530016, 0x0553d000, 0x0553f031, 0x05558800,
+  0x0555a801, 0x0555c804, 0x05560000, 0x05561000, 0x0556d802, 0x0557000a,
+  0x05579002, 0x05580805, 0x05584805, 0x05588805, 0x05590006, 0x05594006,
+  0x0559802a, 0x055ae00d, 0x055b8072, 0x056007ff, 0x05a007ff, 0x05e007ff,
+  0x062007ff, 0x066007ff, 0x06a003a3, 0x06bd8016, 0x06be5830, 0x07c8016d,
+  0x07d38069, 0x07d80006, 0x07d89804, 0x07d8e800, 0x07d8f809, 0x07d9500c,
+  0x07d9c004, 0x07d9f000, 0x07da0001, 0x07da1801, 0x07da306b, 0x07de996a,
+  0x07ea803f, 0x07ec9035, 0x07ef800b, 0x07f38004, 0x07f3b086, 0x07f90819,
+  0x07fa0819, 0x07fb3058, 0x07fe1005, 0x07fe5005, 0x07fe9005, 0x07fed002,
+  0x0800000b, 0x08006819, 0x08014012, 0x0801e001, 0x0801f80e, 0x0802800d,
+  0x0804007a, 0x080a0034, 0x0814001c, 0x08150030, 0x0818001f, 0x0819681d,
+  0x081a8025, 0x081c001d, 0x081d0023, 0x081e4007, 0x081e8804, 0x0820009d,
+  0x08258023, 0x0826c023, 0x08280027, 0x08298033, 0x082b800a, 0x082be00e,
+  0x082c6006, 0x082ca001, 0x082cb80a, 0x082d180e, 0x082d9806, 0x082dd801,
+  0x082e0033, 0x08300136, 0x083a0015, 0x083b0007, 0x083c0005, 0x083c3829,
+  0x083d9008, 0x08400005, 0x08404000, 0x0840502b, 0x0841b801, 0x0841e000,
+  0x0841f816, 0x08430016, 0x0844001e, 0x08470012, 0x0847a001, 0x08480015,
+  0x08490019, 0x084c0037, 0x084df001, 0x08500000, 0x08508003, 0x0850a802,
+  0x0850c81c, 0x0853001c, 0x0854001c, 0x08560007, 0x0856481b, 0x08580035,
+  0x085a0015, 0x085b0012, 0x085c0011, 0x08600048, 0x08640032, 0x08660032,
+  0x08680023, 0x086a501b, 0x086b7816, 0x08740029, 0x08758001, 0x08761002,
+  0x0878001c, 0x08793800, 0x08798015, 0x087b8011, 0x087d8014, 0x087f0016,
+  0x08801834, 0x08838801, 0x0883a800, 0x0884182c, 0x08868018, 0x08881823,
+  0x088a2000, 0x088a3800, 0x088a8022, 0x088bb000, 0x088c182f, 0x088e0803,
+  0x088ed000, 0x088ee000, 0x08900011, 0x08909818, 0x0891f801, 0x08940006,
+  0x08944000, 0x08945003, 0x0894780e, 0x0894f809, 0x0895802e, 0x08982807,
+  0x08987801, 0x08989815, 0x08995006, 0x08999001, 0x0899a804, 0x0899e800,
+  0x089a8000, 0x089ae804, 0x089c0009, 0x089c5800, 0x089c7000, 0x089c8025,
+  0x089db800, 0x089e8800, 0x089e9800, 0x08a00034, 0x08a23803, 0x08a2f802,
+  0x08a4002f, 0x08a62001, 0x08a63800, 0x08ac002e, 0x08aec003, 0x08b0002f,
+  0x08b22000, 0x08b4002a, 0x08b5c000, 0x08b8001a, 0x08ba0006, 0x08c0002b,
+  0x08c5003f, 0x08c7f807, 0x08c84800, 0x08c86007, 0x08c8a801, 0x08c8c017,
+  0x08c9f800, 0x08ca0800, 0x08cd0007, 0x08cd5026, 0x08cf0800, 0x08cf1800,
+  0x08d00000, 0x08d05827, 0x08d1d000, 0x08d28000, 0x08d2e02d, 0x08d4e800,
+  0x08d58048, 0x08de0020, 0x08e00008, 0x08e05024, 0x08e20000, 0x08e3901d,
+  0x08e80006, 0x08e84001, 0x08e85825, 0x08ea3000, 0x08eb0005, 0x08eb3801,
+  0x08eb501f, 0x08ecc000, 0x08f70012, 0x08f81000, 0x08f8200c, 0x08f89021,
+  0x08fd8000, 0x09000399, 0x0920006e, 0x092400c3, 0x097c8060, 0x0980042f,
+  0x09a20805, 0x09a307ff, 0x09e3079a, 0x0a200246, 0x0b08001d, 0x0b400238,
+  0x0b52001e, 0x0b53804e, 0x0b56801d, 0x0b58002f, 0x0b5a0003, 0x0b5b1814,
+  0x0b5be812, 0x0b6a002c, 0x0b72003f, 0x0b78004a, 0x0b7a8000, 0x0b7c980c,
+  0x0b7f0001, 0x0b7f1800, 0x0b8007ff, 0x0bc007ff, 0x0c0007f7, 0x0c4004d5,
+  0x0c67f809, 0x0d7f8003, 0x0d7fa806, 0x0d7fe801, 0x0d800122, 0x0d899000,
+  0x0d8a8002, 0x0d8aa800, 0x0d8b2003, 0x0d8b818b, 0x0de0006a, 0x0de3800c,
+  0x0de40008, 0x0de48009, 0x0ea00054, 0x0ea2b046, 0x0ea4f001, 0x0ea51000,
+  0x0ea52801, 0x0ea54803, 0x0ea5700b, 0x0ea5d800, 0x0ea5e806, 0x0ea62840,
+  0x0ea83803, 0x0ea86807, 0x0ea8b006, 0x0ea8f01b, 0x0ea9d803, 0x0eaa0004,
+  0x0eaa3000, 0x0eaa5006, 0x0eaa9153, 0x0eb54018, 0x0eb61018, 0x0eb6e01e,
+  0x0eb7e018, 0x0eb8b01e, 0x0eb9b018, 0x0eba801e, 0x0ebb8018, 0x0ebc501e,
+  0x0ebd5018, 0x0ebe2007, 0x0ef8001e, 0x0ef92805, 0x0f01803d, 0x0f08002c,
+  0x0f09b806, 0x0f0a7000, 0x0f14801d, 0x0f16002b, 0x0f26801b, 0x0f2e801d,
+  0x0f2f8000, 0x0f3f0006, 0x0f3f4003, 0x0f3f6801, 0x0f3f800e, 0x0f4000c4,
+  0x0f480043, 0x0f4a5800, 0x0f700003, 0x0f70281a, 0x0f710801, 0x0f712000,
+  0x0f713800, 0x0f714809, 0x0f71a003, 0x0f71c800, 0x0f71d800, 0x0f721000,
+  0x0f723800, 0x0f724800, 0x0f725800, 0x0f726802, 0x0f728801, 0x0f72a000,
+  0x0f72b800, 0x0f72c800, 0x0f72d800, 0x0f72e800, 0x0f72f800, 0x0f730801,
+  0x0f732000, 0x0f733803, 0x0f736006, 0x0f73a003, 0x0f73c803, 0x0f73f000,
+  0x0f740009, 0x0f745810, 0x0f750802, 0x0f752804, 0x0f755810, 0x100007ff,
+  0x104007ff, 0x108007ff, 0x10c007ff, 0x110007ff, 0x114007ff, 0x118007ff,
+  0x11c007ff, 0x120007ff, 0x124007ff, 0x128007ff, 0x12c007ff, 0x130007ff,
+  0x134007ff, 0x138007ff, 0x13c007ff, 0x140007ff, 0x144007ff, 0x148007ff,
+  0x14c007ff, 0x150006df, 0x153807ff, 0x157807ff, 0x15b80039, 0x15ba00dd,
+  0x15c107ff, 0x160107ff, 0x16410681, 0x167587ff, 0x16b587ff, 0x16f587ff,
+  0x17358530, 0x175f826d, 0x17c0021d, 0x180007ff, 0x184007ff, 0x1880034a,
+  0x189a87ff, 0x18da87ff, 0x191a805f,
+  /* Ideographic */
+  0x01803001, 0x01810808, 0x0181c002, 0x01a007ff, 0x01e007ff, 0x022007ff,
+  0x026001bf, 0x027007ff, 0x02b007ff, 0x02f007ff, 0x033007ff, 0x037007ff,
+  0x03b007ff, 0x03f007ff, 0x043007ff, 0x047007ff, 0x04b007ff, 0x04f001ff,
+  0x07c8016d, 0x07d38069, 0x0b7f2000, 0x0b8007ff, 0x0bc007ff, 0x0c0007f7,
+  0x0c4004d5, 0x0c67f809, 0x0d8b818b, 0x100007ff, 0x104007ff, 0x108007ff,
+  0x10c007ff, 0x110007ff, 0x114007ff, 0x118007ff, 0x11c007ff, 0x120007ff,
+  0x124007ff, 0x128007ff, 0x12c007ff, 0x130007ff, 0x134007ff, 0x138007ff,
+  0x13c007ff, 0x140007ff, 0x144007ff, 0x148007ff, 0x14c007ff, 0x150006df,
+  0x153807ff, 0x157807ff, 0x15b80039, 0x15ba00dd, 0x15c107ff, 0x160107ff,
+  0x16410681, 0x167587ff, 0x16b587ff, 0x16f587ff, 0x17358530, 0x175f826d,
+  0x17c0021d, 0x180007ff, 0x184007ff, 0x1880034a, 0x189a87ff, 0x18da87ff,
+  0x191a805f,
+  /* InCB */
+  0x0018006f, 0x00241806, 0x002c882c, 0x002df800, 0x002e0801, 0x002e2001,
+  0x002e3800, 0x0030800a, 0x00325814, 0x00338000, 0x0036b006, 0x0036f805,
+  0x00373801, 0x00375003, 0x00388800, 0x0039801a, 0x003d300a, 0x003f5808,
+  0x003fe800, 0x0040b003, 0x0040d808, 0x00412802, 0x00414804, 0x0042c802,
+  0x0044b808, 0x00465017, 0x0047181f, 0x0048a825, 0x0049e000, 0x004a0807,
+  0x004a6800, 0x004a880e, 0x004b1001, 0x004bc007, 0x004c0800, 0x004ca813,
+  0x004d5006, 0x004d9000, 0x004db003, 0x004de000, 0x004df000, 0x004e0803,
+  0x004e6800, 0x004eb800, 0x004ee001, 0x004ef800, 0x004f1001, 0x004f8001,
+  0x004ff000, 0x00500801, 0x0051e000, 0x00520801, 0x00523801, 0x00525802,
+  0x00528800, 0x00538001, 0x0053a800, 0x00540801, 0x0054a813, 0x00555006,
+  0x00559001, 0x0055a804, 0x0055e000, 0x00560804, 0x00563801, 0x00566800,
+  0x00571001, 0x0057c806, 0x00580800, 0x0058a813, 0x00595006, 0x00599001,
+  0x0059a804, 0x0059e000, 0x0059f001, 0x005a0803, 0x005a6800, 0x005aa802,
+  0x005ae001, 0x005af800, 0x005b1001, 0x005b8800, 0x005c1000, 0x005df000,
+  0x005e0000, 0x005e6800, 0x005eb800, 0x00600000, 0x00602000, 0x0060a813,
+  0x0061500f, 0x0061e000, 0x0061f002, 0x00623002, 0x00625003, 0x0062a801,
+  0x0062c002, 0x00631001, 0x00640800, 0x0065e000, 0x0065f801, 0x00661000,
+  0x00663002, 0x00665003, 0x0066a801, 0x00671001, 0x00680001, 0x0068a827,
+  0x0069f000, 0x006a0803, 0x006a6800, 0x006ab800, 0x006b1001, 0x006c0800,
+  0x006e5000, 0x006e7800, 0x006e9002, 0x006eb000, 0x006ef800, 0x00718800,
+  0x0071a006, 0x00723807, 0x00758800, 0x0075a008, 0x00764006, 0x0078c001,
+  0x0079a800, 0x0079b800, 0x0079c800, 0x007b880d, 0x007c0004, 0x007c3001,
+  0x007c680a, 0x007cc823, 0x007e3000, 0x00816803, 0x00819005, 0x0081c801,
+  0x0081e801, 0x0082c001, 0x0082f002, 0x00838803, 0x00841000, 0x00842801,
+  0x00846800, 0x0084e800, 0x009ae802, 0x00b89003, 0x00b99002, 0x00ba9001,
+  0x00bb9001, 0x00bda001, 0x00bdb806, 0x00be3000, 0x00be480a, 0x00bee800,
+  0x00c05802, 0x00c07800, 0x00c42801, 0x00c54800, 0x00c90002, 0x00c93801,
+  0x00c99000, 0x00c9c802, 0x00d0b801, 0x00d0d800, 0x00d2b000, 0x00d2c006,
+  0x00d30000, 0x00d31000, 0x00d32807, 0x00d39809, 0x00d3f800, 0x00d5801e,
+  0x00d80003, 0x00d9a009, 0x00da1002, 0x00db5808, 0x00dc0001, 0x00dd1003,
+  0x00dd4005, 0x00df3000, 0x00df4001, 0x00df6800, 0x00df7804, 0x00e16007,
+  0x00e1b001, 0x00e68002, 0x00e6a00c, 0x00e71006, 0x00e76800, 0x00e7a000,
+  0x00e7c001, 0x00ee003f, 0x01006800, 0x01068020, 0x01677802, 0x016bf800,
+  0x016f001f, 0x01815005, 0x0184c801, 0x05337803, 0x0533a009, 0x0534f001,
+  0x05378001, 0x05401000, 0x05403000, 0x05405800, 0x05412801, 0x05416000,
+  0x05462001, 0x05470011, 0x0547f800, 0x05493007, 0x054a380a, 0x054a9800,
+  0x054c0002, 0x054d9800, 0x054db003, 0x054de001, 0x054e0000, 0x054f2800,
+  0x05514805, 0x05518801, 0x0551a801, 0x05521800, 0x05526000, 0x0553e000,
+  0x05558000, 0x05559002, 0x0555b801, 0x0555f001, 0x05560800, 0x05576001,
+  0x0557b000, 0x055f2800, 0x055f4000, 0x055f6800, 0x07d8f000, 0x07f0000f,
+  0x07f1000f, 0x07fcf001, 0x080fe800, 0x08170000, 0x081bb004, 0x08500802,
+  0x08502801, 0x08506003, 0x0851c002, 0x0851f800, 0x08572801, 0x08692003,
+  0x086b4804, 0x08755801, 0x0877e003, 0x087a300a, 0x087c1003, 0x08800800,
+  0x0881c00e, 0x08838000, 0x08839801, 0x0883f802, 0x08859803, 0x0885c801,
+  0x08861000, 0x08880002, 0x08893804, 0x08896807, 0x088b9800, 0x088c0001,
+  0x088db008, 0x088e0000, 0x088e4803, 0x088e7800, 0x08917802, 0x0891a003,
+  0x0891f000, 0x08920800, 0x0896f800, 0x08971807, 0x08980001, 0x0899d801,
+  0x0899f000, 0x089a0000, 0x089a6800, 0x089ab800, 0x089b3006, 0x089b8004,
+  0x089dc000, 0x089dd805, 0x089e1000, 0x089e2800, 0x089e3802, 0x089e7002,
+  0x089e9000, 0x089f0801, 0x08a1c007, 0x08a21002, 0x08a23000, 0x08a2f000,
+  0x08a58000, 0x08a59805, 0x08a5d000, 0x08a5e800, 0x08a5f801, 0x08a61001,
+  0x08ad7800, 0x08ad9003, 0x08ade001, 0x08adf801, 0x08aee001, 0x08b19807,
+  0x08b1e800, 0x08b1f801, 0x08b55800, 0x08b56800, 0x08b58007, 0x08b8e800,
+  0x08b8f800, 0x08b91003, 0x08b93804, 0x08c17808, 0x08c1c801, 0x08c98000,
+  0x08c9d803, 0x08ca1800, 0x08cea003, 0x08ced001, 0x08cf0000, 0x08d00809,
+  0x08d19805, 0x08d1d803, 0x08d23800, 0x08d28805, 0x08d2c802, 0x08d4500c,
+  0x08d4c001, 0x08e18006, 0x08e1c005, 0x08e1f800, 0x08e49015, 0x08e55006,
+  0x08e59001, 0x08e5a801, 0x08e98805, 0x08e9d000, 0x08e9e001, 0x08e9f806,
+  0x08ea3800, 0x08ec8001, 0x08eca800, 0x08ecb800, 0x08f79801, 0x08f80001,
+  0x08f9b004, 0x08fa0002, 0x08fad000, 0x09a20000, 0x09a2380e, 0x0b08f00b,
+  0x0b096802, 0x0b578004, 0x0b598006, 0x0b7a7800, 0x0b7c7803, 0x0b7f2000,
+  0x0b7f8001, 0x0de4e801, 0x0e78002d, 0x0e798016, 0x0e8b2804, 0x0e8b6805,
+  0x0e8bd807, 0x0e8c2806, 0x0e8d5003, 0x0e921002, 0x0ed00036, 0x0ed1d831,
+  0x0ed3a800, 0x0ed42000, 0x0ed4d804, 0x0ed5080e, 0x0f000006, 0x0f004010,
+  0x0f00d806, 0x0f011801, 0x0f013004, 0x0f047800, 0x0f098006, 0x0f157000,
+  0x0f176003, 0x0f276003, 0x0f2f7001, 0x0f468006, 0x0f4a2006, 0x0f9fd804,
+  0x7001005f, 0x700800ef,
+  /* Join_Control */
+  0x01006001,
+  /* Logical_Order_Exception */
+  0x00720004, 0x00760004, 0x00cda802, 0x00cdd000, 0x0555a801, 0x0555c800,
+  0x0555d801,
+  /* Lowercase */
+  0x00030819, 0x00055000, 0x0005a800, 0x0005d000, 0x0006f817, 0x0007c007,
+  0x00080800, 0x00081800, 0x00082800, 0x00083800, 0x00084800, 0x00085800,
+  0x00086800, 0x00087800, 0x00088800, 0x00089800, 0x0008a800, 0x0008b800,
+  0x0008c800, 0x0008d800, 0x0008e800, 0x0008f800, 0x00090800, 0x00091800,
+  0x00092800, 0x00093800, 0x00094800, 0x00095800, 0x00096800, 0x00097800,
+  0x00098800, 0x00099800, 0x0009a800, 0x0009b801, 0x0009d000, 0x0009e000,
+  0x0009f000, 0x000a0000, 0x000a1000, 0x000a2000, 0x000a3000, 0x000a4001,
+  0x000a5800, 0x000a6800, 0x000a7800, 0x000a8800, 0x000a9800, 0x000aa800,
+  0x000ab800, 0x000ac800, 0x000ad800, 0x000ae800, 0x000af800, 0x000b0800,
+  0x000b1800, 0x000b2800, 0x000b3800, 0x000b4800, 0x000b5800, 0x000b6800,
+  0x000b7800, 0x000b8800, 0x000b9800, 0x000ba800, 0x000bb800, 0x000bd000,
+  0x000be000, 0x000bf002, 0x000c1800, 0x000c2800, 0x000c4000, 0x000c6001,
+  0x000c9000, 0x000ca800, 0x000cc802, 0x000cf000, 0x000d0800, 0x000d1800,
+  0x000d2800, 0x000d4000, 0x000d5001, 0x000d6800, 0x000d8000, 0x000da000,
+  0x000db000, 0x000dc801, 0x000de802, 0x000e3000, 0x000e4800, 0x000e6000,
+  0x000e7000, 0x000e8000, 0x000e9000, 0x000ea000, 0x000eb000, 0x000ec000,
+  0x000ed000, 0x000ee001, 0x000ef800, 0x000f0800, 0x000f1800, 0x000f2800,
+  0x000f3800, 0x000f4800, 0x000f5800, 0x000f6800, 0x000f7801, 0x000f9800,
+  0x000fa800, 0x000fc800, 0x000fd800, 0x000fe800, 0x000ff800, 0x00100800,
+  0x00101800, 0x00102800, 0x00103800, 0x00104800, 0x00105800, 0x00106800,
+  0x00107800, 0x00108800, 0x00109800, 0x0010a800, 0x0010b800, 0x0010c800,
+  0x0010d800, 0x0010e800, 0x0010f800, 0x00110800, 0x00111800, 0x00112800,
+  0x00113800, 0x00114800, 0x00115800, 0x00116800, 0x00117800, 0x00118800,
+  0x00119806, 0x0011e000, 0x0011f801, 0x00121000, 0x00123800, 0x00124800,
+  0x00125800, 0x00126800, 0x00127844, 0x0014a823, 0x00160001, 0x00170004,
+  0x001a2800, 0x001b8800, 0x001b9800, 0x001bb800, 0x001bd003, 0x001c8000,
+  0x001d6022, 0x001e8001, 0x001ea802, 0x001ec800, 0x001ed800, 0x001ee800,
+  0x001ef800, 0x001f0800, 0x001f1800, 0x001f2800, 0x001f3800, 0x001f4800,
+  0x001f5800, 0x001f6800, 0x001f7804, 0x001fa800, 0x001fc000, 0x001fd801,
+  0x0021802f, 0x00230800, 0x00231800, 0x00232800, 0x00233800, 0x00234800,
+  0x00235800, 0x00236800, 0x00237800, 0x00238800, 0x00239800, 0x0023a800,
+  0x0023b800, 0x0023c800, 0x0023d800, 0x0023e800, 0x0023f800, 0x00240800,
+  0x00245800, 0x00246800, 0x00247800, 0x00248800, 0x00249800, 0x0024a800,
+  0x0024b800, 0x0024c800, 0x0024d800, 0x0024e800, 0x0024f800, 0x00250800,
+  0x00251800, 0x00252800, 0x00253800, 0x00254800, 0x00255800, 0x00256800,
+  0x00257800, 0x00258800, 0x00259800, 0x0025a800, 0x0025b800, 0x0025c800,
+  0x0025d800, 0x0025e800, 0x0025f800, 0x00261000, 0x00262000, 0x00263000,
+  0x00264000, 0x00265000, 0x00266000, 0x00267001, 0x00268800, 0x00269800,
+  0x0026a800, 0x0026b800, 0x0026c800, 0x0026d800, 0x0026e800, 0x0026f800,
+  0x00270800, 0x00271800, 0x00272800, 0x00273800, 0x00274800, 0x00275800,
+  0x00276800, 0x00277800, 0x00278800, 0x00279800, 0x0027a800, 0x0027b800,
+  0x0027c800, 0x0027d800, 0x0027e800, 0x0027f800, 0x00280800, 0x00281800,
+  0x00282800, 0x00283800, 0x00284800, 0x00285800, 0x00286800, 0x00287800,
+  0x00288800, 0x00289800, 0x0028a800, 0x0028b800, 0x0028c800, 0x0028d800,
+  0x0028e800, 0x0028f800, 0x00290800, 0x00291800, 0x00292800, 0x00293800,
+  0x00294800, 0x00295800, 0x00296800, 0x00297800, 0x002b0028, 0x0086802a,
+  0x0087e003, 0x009fc005, 0x00e40008, 0x00e45000, 0x00e800bf, 0x00f00800,
+  0x00f01800, 0x00f02800, 0x00f03800, 0x00f04800, 0x00f05800, 0x00f06800,
+  0x00f07800, 0x00f08800, 0x00f09800, 0x00f0a800, 0x00f0b800, 0x00f0c800,
+  0x00f0d800, 0x00f0e800, 0x00f0f800, 0x00f10800, 0x00f11800, 0x00f12800,
+  0x00f13800, 0x00f14800, 0x00f15800, 0x00f16800, 0x00f17800, 0x00f18800,
+  0x00f19800, 0x00f1a800, 0x00f1b800, 0x00f1c800, 0x00f1d800, 0x00f1e800,
+  0x00f1f800, 0x00f20800, 0x00f21800, 0x00f22800, 0x00f23800, 0x00f24800,
+  0x00f25800, 0x00f26800, 0x00f27800, 0x00f28800, 0x00f29800, 0x00f2a800,
+  0x00f2b800, 0x00f2c800, 0x00f2d800, 0x00f2e800, 0x00f2f800, 0x00f30800,
+  0x00f31800, 0x00f32800, 0x00f33800, 0x00f34800, 0x00f35800, 0x00f36800,
+  0x00f37800, 0x00f38800, 0x00f39800, 0x00f3a800, 0x00f3b800, 0x00f3c800,
+  0x00f3d800, 0x00f3e800, 0x00f3f800, 0x00f40800, 0x00f41800, 0x00f42800,
+  0x00f43800, 0x00f44800, 0x00f45800, 0x00f46800, 0x00f47800, 0x00f48800,
+  0x00f49800, 0x00f4a808, 0x00f4f800, 0x00f50800, 0x00f51800, 0x00f52800,
+  0x00f53800, 0x00f54800, 0x00f55800, 0x00f56800, 0x00f57800, 0x00f58800,
+  0x00f59800, 0x00f5a800, 0x00f5b800, 0x00f5c800, 0x00f5d800, 0x00f5e800,
+  0x00f5f800, 0x00f60800, 0x00f61800, 0x00f62800, 0x00f63800, 0x00f64800,
+  0x00f65800, 0x00f66800, 0x00f67800, 0x00f68800, 0x00f69800, 0x00f6a800,
+  0x00f6b800, 0x00f6c800, 0x00f6d800, 0x00f6e800, 0x00f6f800, 0x00f70800,
+  0x00f71800, 0x00f72800, 0x00f73800, 0x00f74800, 0x00f75800, 0x00f76800,
+  0x00f77800, 0x00f78800, 0x00f79800, 0x00f7a800, 0x00f7b800, 0x00f7c800,
+  0x00f7d800, 0x00f7e800, 0x00f7f808, 0x00f88005, 0x00f90007, 0x00f98007,
+  0x00fa0005, 0x00fa8007, 0x00fb0007, 0x00fb800d, 0x00fc0007, 0x00fc8007,
+  0x00fd0007, 0x00fd8004, 0x00fdb001, 0x00fdf000, 0x00fe1002, 0x00fe3001,
+  0x00fe8003, 0x00feb001, 0x00ff0007, 0x00ff9002, 0x00ffb001, 0x01038800,
+  0x0103f800, 0x0104800c, 0x01085000, 0x01087001, 0x01089800, 0x01097800,
+  0x0109a000, 0x0109c800, 0x0109e001, 0x010a3003, 0x010a7000, 0x010b800f,
+  0x010c2000, 0x01268019, 0x0161802f, 0x01630800, 0x01632801, 0x01634000,
+  0x01635000, 0x01636000, 0x01638800, 0x01639801, 0x0163b007, 0x01640800,
+  0x01641800, 0x01642800, 0x01643800, 0x01644800, 0x01645800, 0x01646800,
+  0x01647800, 0x01648800, 0x01649800, 0x0164a800, 0x0164b800, 0x0164c800,
+  0x0164d800, 0x0164e800, 0x0164f800, 0x01650800, 0x01651800, 0x01652800,
+  0x01653800, 0x01654800, 0x01655800, 0x01656800, 0x01657800, 0x01658800,
+  0x01659800, 0x0165a800, 0x0165b800, 0x0165c800, 0x0165d800, 0x0165e800,
+  0x0165f800, 0x01660800, 0x01661800, 0x01662800, 0x01663800, 0x01664800,
+  0x01665800, 0x01666800, 0x01667800, 0x01668800, 0x01669800, 0x0166a800,
+  0x0166b800, 0x0166c800, 0x0166d800, 0x0166e800, 0x0166f800, 0x01670800,
+  0x01671801, 0x01676000, 0x01677000, 0x01679800, 0x01680025, 0x01693800,
+  0x01696800, 0x05320800, 0x05321800, 0x05322800, 0x05323800, 0x05324800,
+  0x05325800, 0x05326800, 0x05327800, 0x05328800, 0x05329800, 0x0532a800,
+  0x0532b800, 0x0532c800, 0x0532d800, 0x0532e800, 0x0532f800, 0x05330800,
+  0x05331800, 0x05332800, 0x05333800, 0x05334800, 0x05335800, 0x05336800,
+  0x05340800, 0x05341800, 0x05342800, 0x05343800, 0x05344800, 0x05345800,
+  0x05346800, 0x05347800, 0x05348800, 0x05349800, 0x0534a800, 0x0534b800,
+  0x0534c800, 0x0534d802, 0x05391800, 0x05392800, 0x05393800, 0x05394800,
+  0x05395800, 0x05396800, 0x05397802, 0x05399800, 0x0539a800, 0x0539b800,
+  0x0539c800, 0x0539d800, 0x0539e800, 0x0539f800, 0x053a0800, 0x053a1800,
+  0x053a2800, 0x053a3800, 0x053a4800, 0x053a5800, 0x053a6800, 0x053a7800,
+  0x053a8800, 0x053a9800, 0x053aa800, 0x053ab800, 0x053ac800, 0x053ad800,
+  0x053ae800, 0x053af800, 0x053b0800, 0x053b1800, 0x053b2800, 0x053b3800,
+  0x053b4800, 0x053b5800, 0x053b6800, 0x053b7809, 0x053bd000, 0x053be000,
+  0x053bf800, 0x053c0800, 0x053c1800, 0x053c2800, 0x053c3800, 0x053c6000,
+  0x053c7000, 0x053c8800, 0x053c9802, 0x053cb800, 0x053cc800, 0x053cd800,
+  0x053ce800, 0x053cf800, 0x053d0800, 0x053d1800, 0x053d2800, 0x053d3800,
+  0x053d4800, 0x053d7800, 0x053da800, 0x053db800, 0x053dc800, 0x053dd800,
+  0x053de800, 0x053df800, 0x053e0800, 0x053e1800, 0x053e4000, 0x053e5000,
+  0x053e6800, 0x053e8800, 0x053e9800, 0x053ea800, 0x053eb800, 0x053ec800,
+  0x053ed800, 0x053f9002, 0x053fb000, 0x053fc002, 0x0559802a, 0x055ae00d,
+  0x055b804f, 0x07d80006, 0x07d89804, 0x07fa0819, 0x08214027, 0x0826c023,
+  0x082cb80a, 0x082d180e, 0x082d9806, 0x082dd801, 0x083c0000, 0x083c1802,
+  0x083c3829, 0x083d9008, 0x08660032, 0x086b8015, 0x08c6001f, 0x0b73001f,
+  0x0ea0d019, 0x0ea27006, 0x0ea2b011, 0x0ea41019, 0x0ea5b003, 0x0ea5d800,
+  0x0ea5e806, 0x0ea6280a, 0x0ea75019, 0x0ea8f019, 0x0eaa9019, 0x0eac3019,
+  0x0eadd019, 0x0eaf7019, 0x0eb11019, 0x0eb2b019, 0x0eb4501b, 0x0eb61018,
+  0x0eb6e005, 0x0eb7e018, 0x0eb8b005, 0x0eb9b018, 0x0eba8005, 0x0ebb8018,
+  0x0ebc5005, 0x0ebd5018, 0x0ebe2005, 0x0ebe5800, 0x0ef80009, 0x0ef85813,
+  0x0ef92805, 0x0f01803d, 0x0f491021,
+  /* Math */
+  0x00015800, 0x0001e002, 0x0002f000, 0x0003e000, 0x0003f000, 0x00056000,
+  0x00058800, 0x0006b800, 0x0007b800, 0x001e8002, 0x001ea800, 0x001f8001,
+  0x001fa002, 0x00303002, 0x0100b000, 0x01019002, 0x01020000, 0x01022000,
+  0x01029000, 0x01030803, 0x0103d004, 0x01045004, 0x0106800c, 0x01070800,
+  0x01072801, 0x01075804, 0x01081000, 0x01083800, 0x01085009, 0x0108a800,
+  0x0108c005, 0x01092000, 0x01094001, 0x01096001, 0x01097802, 0x01099805,
+  0x0109e00d, 0x010a5800, 0x010c8017, 0x010d4805, 0x010d8001, 0x010db001,
+  0x010de01f, 0x010ee800, 0x010f2001, 0x010fa10b, 0x01184003, 0x01190001,
+  0x011be000, 0x011cd81a, 0x011db800, 0x011e8000, 0x011ee006, 0x012d0001,
+  0x012d7009, 0x012de005, 0x012e3001, 0x012e5001, 0x012e7804, 0x012f1000,
+  0x012f2000, 0x012f3805, 0x012fc007, 0x01302801, 0x01320000, 0x01321000,
+  0x01330003, 0x01336802, 0x013e003f, 0x014801ff, 0x01598014, 0x015a3805,
+  0x07d94800, 0x07f30805, 0x07f34000, 0x07f85800, 0x07f8e002, 0x07f9e000,
+  0x07f9f000, 0x07fae000, 0x07faf000, 0x07ff1000, 0x07ff4803, 0x086c7001,
+  0x0ea00054, 0x0ea2b046, 0x0ea4f001, 0x0ea51000, 0x0ea52801, 0x0ea54803,
+  0x0ea5700b, 0x0ea5d800, 0x0ea5e806, 0x0ea62840, 0x0ea83803, 0x0ea86807,
+  0x0ea8b006, 0x0ea8f01b, 0x0ea9d803, 0x0eaa0004, 0x0eaa3000, 0x0eaa5006,
+  0x0eaa9153, 0x0eb54123, 0x0ebe7031, 0x0f700003, 0x0f70281a, 0x0f710801,
+  0x0f712000, 0x0f713800, 0x0f714809, 0x0f71a003, 0x0f71c800, 0x0f71d800,
+  0x0f721000, 0x0f723800, 0x0f724800, 0x0f725800, 0x0f726802, 0x0f728801,
+  0x0f72a000, 0x0f72b800, 0x0f72c800, 0x0f72d800, 0x0f72e800, 0x0f72f800,
+  0x0f730801, 0x0f732000, 0x0f733803, 0x0f736006, 0x0f73a003, 0x0f73c803,
+  0x0f73f000, 0x0f740009, 0x0f745810, 0x0f750802, 0x0f752804, 0x0f755810,
+  0x0f778001,
+  /* Modifier_Combining_Mark */
+  0x0032a001, 0x0032c000, 0x0036e000, 0x00371800, 0x00373801, 0x00465001,
+  0x00466802, 0x00469800, 0x00479800,
+  /* Noncharacter_Code_Point */
+  0x07ee801f, 0x07fff001, 0x0ffff001, 0x17fff001, 0x1ffff001, 0x27fff001,
+  0x2ffff001, 0x37fff001, 0x3ffff001, 0x47fff001, 0x4ffff001, 0x57fff001,
+  0x5ffff001, 0x67fff001, 0x6ffff001, 0x77fff001, 0x7ffff001, 0x87fff001,
+  /* Pattern_Syntax */
+  0x0001080e, 0x0001d006, 0x0002d803, 0x00030000, 0x0003d803, 0x00050806,
+  0x00054800, 0x00055801, 0x00057000, 0x00058001, 0x0005b000, 0x0005d800,
+  0x0005f800, 0x0006b800, 0x0007b800, 0x01008017, 0x0101800e, 0x01020812,
+  0x0102a809, 0x010c82cf, 0x01280275, 0x013ca46b, 0x0170007f, 0x01800802,
+  0x01804018, 0x01818000, 0x07e9f001, 0x07f22801,
+  /* Pattern_White_Space */
+  0x00004804, 0x00010000, 0x00042800, 0x01007001, 0x01014001,
+  /* Prepended_Concatenation_Mark */
+  0x00300005, 0x0036e800, 0x00387800, 0x00448001, 0x00471000, 0x0885e800,
+  0x08866800,
+  /* Quotation_Mark */
+  0x00011000, 0x00013800, 0x00055800, 0x0005d800, 0x0100c007, 0x0101c801,
+  0x01721000, 0x01806003, 0x0180e802, 0x07f20803, 0x07f81000, 0x07f83800,
+  0x07fb1001,
+  /* Radical */
+  0x01740019, 0x0174d858, 0x017800d5,
+  /* Regional_Indicator */
+  0x0f8f3019,
+  /* Sentence_Terminal */
+  0x00010800, 0x00017000, 0x0001f800, 0x002c4800, 0x0030e802, 0x0036a000,
+  0x00380002, 0x003fc800, 0x0041b800, 0x0041c800, 0x0041e801, 0x004b2001,
+  0x00825001, 0x009b1000, 0x009b3801, 0x00b37000, 0x00b9a801, 0x00bea001,
+  0x00c01800, 0x00c04800, 0x00ca2001, 0x00d54003, 0x00da7001, 0x00dad001,
+  0x00daf001, 0x00dbe802, 0x00e1d801, 0x00e3f001, 0x01012000, 0x0101e001,
+  0x01023802, 0x0167c802, 0x01717000, 0x0171e000, 0x01729801, 0x01801000,
+  0x0527f800, 0x05307001, 0x05379800, 0x0537b800, 0x0543b001, 0x05467001,
+  0x05497800, 0x054e4001, 0x0552e802, 0x05578001, 0x055f5800, 0x07f09000,
+  0x07f0a801, 0x07f29000, 0x07f2b001, 0x07f80800, 0x07f87000, 0x07f8f800,
+  0x07fb0800, 0x0852b001, 0x087aa804, 0x087c3003, 0x08823801, 0x0885f003,
+  0x088a0802, 0x088e2801, 0x088e6800, 0x088ef001, 0x0891c001, 0x0891d801,
+  0x08954800, 0x089ea001, 0x08a25801, 0x08ae1001, 0x08ae480e, 0x08b20801,
+  0x08b9e002, 0x08ca2000, 0x08ca3000, 0x08d21001, 0x08d4d801, 0x08e20801,
+  0x08f7b801, 0x08fa1801, 0x0b537001, 0x0b57a800, 0x0b59b801, 0x0b5a2000,
+  0x0b6b7001, 0x0b74c000, 0x0de4f800, 0x0ed44000,
+  /* Soft_Dotted */
+  0x00034801, 0x00097800, 0x00124800, 0x00134000, 0x0014e800, 0x00159000,
+  0x001f9800, 0x0022b000, 0x0022c000, 0x00eb1000, 0x00ecb000, 0x00ed2000,
+  0x00ed4000, 0x00f16800, 0x00f65800, 0x01038800, 0x010a4001, 0x0163e000,
+  0x0ea11001, 0x0ea2b001, 0x0ea45001, 0x0ea5f001, 0x0ea79001, 0x0ea93001,
+  0x0eaad001, 0x0eac7001, 0x0eae1001, 0x0eafb001, 0x0eb15001, 0x0eb2f001,
+  0x0eb49001, 0x0ef8d000, 0x0f026001, 0x0f034000,
+  /* Terminal_Punctuation */
+  0x00010800, 0x00016000, 0x00017000, 0x0001d001, 0x0001f800, 0x001bf000,
+  0x001c3800, 0x002c4800, 0x002e1800, 0x00306000, 0x0030d800, 0x0030e802,
+  0x0036a000, 0x0038000a, 0x00386000, 0x003fc001, 0x00418005, 0x0041b807,
+  0x0042f000, 0x004b2001, 0x0072d001, 0x00784000, 0x00786805, 0x00825001,
+  0x009b0807, 0x00b37000, 0x00b75802, 0x00b9a801, 0x00bea002, 0x00bed000,
+  0x00c01003, 0x00c04001, 0x00ca2001, 0x00d54003, 0x00da7001, 0x00dad001,
+  0x00dae802, 0x00dbe802, 0x00e1d804, 0x00e3f001, 0x01012000, 0x0101e001,
+  0x01023802, 0x0167c802, 0x01717000, 0x0171e000, 0x01720800, 0x01726000,
+  0x01727001, 0x01729801, 0x01800801, 0x0527f001, 0x05306802, 0x05379804,
+  0x0543b001, 0x05467001, 0x05497800, 0x054e3802, 0x0552e802, 0x0556f800,
+  0x05578001, 0x055f5800, 0x07f09000, 0x07f0a801, 0x07f28002, 0x07f2a003,
+  0x07f80800, 0x07f86000, 0x07f87000, 0x07f8d001, 0x07f8f800, 0x07fb0800,
+  0x07fb2000, 0x081cf800, 0x081e8000, 0x0842b800, 0x0848f800, 0x0852b001,
+  0x08578005, 0x0859d005, 0x085cc803, 0x087aa804, 0x087c3003, 0x08823806,
+  0x0885f003, 0x088a0802, 0x088e2801, 0x088e6800, 0x088ef001, 0x0891c004,
+  0x08954800, 0x089ea001, 0x08a25802, 0x08a2d001, 0x08ae1003, 0x08ae480e,
+  0x08b20801, 0x08b9e002, 0x08ca2000, 0x08ca3000, 0x08d21001, 0x08d4d801,
+  0x08d50801, 0x08e20802, 0x08e38800, 0x08f7b801, 0x08fa1801, 0x09238004,
+  0x0b537001, 0x0b57a800, 0x0b59b802, 0x0b5a2000, 0x0b6b7001, 0x0b74b801,
+  0x0de4f800, 0x0ed43803,
+  /* Unified_Ideograph */
+  0x01a007ff, 0x01e007ff, 0x022007ff, 0x026001bf, 0x027007ff, 0x02b007ff,
+  0x02f007ff, 0x033007ff, 0x037007ff, 0x03b007ff, 0x03f007ff, 0x043007ff,
+  0x047007ff, 0x04b007ff, 0x04f001ff, 0x07d07001, 0x07d08800, 0x07d09801,
+  0x07d0f800, 0x07d10800, 0x07d11801, 0x07d13802, 0x100007ff, 0x104007ff,
+  0x108007ff, 0x10c007ff, 0x110007ff, 0x114007ff, 0x118007ff, 0x11c007ff,
+  0x120007ff, 0x124007ff, 0x128007ff, 0x12c007ff, 0x130007ff, 0x134007ff,
+  0x138007ff, 0x13c007ff, 0x140007ff, 0x144007ff, 0x148007ff, 0x14c007ff,
+  0x150006df, 0x153807ff, 0x157807ff, 0x15b80039, 0x15ba00dd, 0x15c107ff,
+  0x160107ff, 0x16410681, 0x167587ff, 0x16b587ff, 0x16f587ff, 0x17358530,
+  0x175f826d, 0x180007ff, 0x184007ff, 0x1880034a, 0x189a87ff, 0x18da87ff,
+  0x191a805f,
+  /* Uppercase */
+  0x00020819, 0x00060016, 0x0006c006, 0x00080000, 0x00081000, 0x00082000,
+  0x00083000, 0x00084000, 0x00085000, 0x00086000, 0x00087000, 0x00088000,
+  0x00089000, 0x0008a000, 0x0008b000, 0x0008c000, 0x0008d000, 0x0008e000,
+  0x0008f000, 0x00090000, 0x00091000, 0x00092000, 0x00093000, 0x00094000,
+  0x00095000, 0x00096000, 0x00097000, 0x00098000, 0x00099000, 0x0009a000,
+  0x0009b000, 0x0009c800, 0x0009d800, 0x0009e800, 0x0009f800, 0x000a0800,
+  0x000a1800, 0x000a2800, 0x000a3800, 0x000a5000, 0x000a6000, 0x000a7000,
+  0x000a8000, 0x000a9000, 0x000aa000, 0x000ab000, 0x000ac000, 0x000ad000,
+  0x000ae000, 0x000af000, 0x000b0000, 0x000b1000, 0x000b2000, 0x000b3000,
+  0x000b4000, 0x000b5000, 0x000b6000, 0x000b7000, 0x000b8000, 0x000b9000,
+  0x000ba000, 0x000bb000, 0x000bc001, 0x000bd800, 0x000be800, 0x000c0801,
+  0x000c2000, 0x000c3001, 0x000c4802, 0x000c7003, 0x000c9801, 0x000cb002,
+  0x000ce001, 0x000cf801, 0x000d1000, 0x000d2000, 0x000d3001, 0x000d4800,
+  0x000d6000, 0x000d7001, 0x000d8802, 0x000da800, 0x000db801, 0x000de000,
+  0x000e2000, 0x000e3800, 0x000e5000, 0x000e6800, 0x000e7800, 0x000e8800,
+  0x000e9800, 0x000ea800, 0x000eb800, 0x000ec800, 0x000ed800, 0x000ef000,
+  0x000f0000, 0x000f1000, 0x000f2000, 0x000f3000, 0x000f4000, 0x000f5000,
+  0x000f6000, 0x000f7000, 0x000f8800, 0x000fa000, 0x000fb002, 0x000fd000,
+  0x000fe000, 0x000ff000, 0x00100000, 0x00101000, 0x00102000, 0x00103000,
+  0x00104000, 0x00105000, 0x00106000, 0x00107000, 0x00108000, 0x00109000,
+  0x0010a000, 0x0010b000, 0x0010c000, 0x0010d000, 0x0010e000, 0x0010f000,
+  0x00110000, 0x00111000, 0x00112000, 0x00113000, 0x00114000, 0x00115000,
+  0x00116000, 0x00117000, 0x00118000, 0x00119000, 0x0011d001, 0x0011e801,
+  0x00120800, 0x00121803, 0x00124000, 0x00125000, 0x00126000, 0x00127000,
+  0x001b8000, 0x001b9000, 0x001bb000, 0x001bf800, 0x001c3000, 0x001c4002,
+  0x001c6000, 0x001c7001, 0x001c8810, 0x001d1808, 0x001e7800, 0x001e9002,
+  0x001ec000, 0x001ed000, 0x001ee000, 0x001ef000, 0x001f0000, 0x001f1000,
+  0x001f2000, 0x001f3000, 0x001f4000, 0x001f5000, 0x001f6000, 0x001f7000,
+  0x001fa000, 0x001fb800, 0x001fc801, 0x001fe832, 0x00230000, 0x00231000,
+  0x00232000, 0x00233000, 0x00234000, 0x00235000, 0x00236000, 0x00237000,
+  0x00238000, 0x00239000, 0x0023a000, 0x0023b000, 0x0023c000, 0x0023d000,
+  0x0023e000, 0x0023f000, 0x00240000, 0x00245000, 0x00246000, 0x00247000,
+  0x00248000, 0x00249000, 0x0024a000, 0x0024b000, 0x0024c000, 0x0024d000,
+  0x0024e000, 0x0024f000, 0x00250000, 0x00251000, 0x00252000, 0x00253000,
+  0x00254000, 0x00255000, 0x00256000, 0x00257000, 0x00258000, 0x00259000,
+  0x0025a000, 0x0025b000, 0x0025c000, 0x0025d000, 0x0025e000, 0x0025f000,
+  0x00260001, 0x00261800, 0x00262800, 0x00263800, 0x00264800, 0x00265800,
+  0x00266800, 0x00268000, 0x00269000, 0x0026a000, 0x0026b000, 0x0026c000,
+  0x0026d000, 0x0026e000, 0x0026f000, 0x00270000, 0x00271000, 0x00272000,
+  0x00273000, 0x00274000, 0x00275000, 0x00276000, 0x00277000, 0x00278000,
+  0x00279000, 0x0027a000, 0x0027b000, 0x0027c000, 0x0027d000, 0x0027e000,
+  0x0027f000, 0x00280000, 0x00281000, 0x00282000, 0x00283000, 0x00284000,
+  0x00285000, 0x00286000, 0x00287000, 0x00288000, 0x00289000, 0x0028a000,
+  0x0028b000, 0x0028c000, 0x0028d000, 0x0028e000, 0x0028f000, 0x00290000,
+  0x00291000, 0x00292000, 0x00293000, 0x00294000, 0x00295000, 0x00296000,
+  0x00297000, 0x00298825, 0x00850025, 0x00863800, 0x00866800, 0x009d0055,
+  0x00e44800, 0x00e4802a, 0x00e5e802, 0x00f00000, 0x00f01000, 0x00f02000,
+  0x00f03000, 0x00f04000, 0x00f05000, 0x00f06000, 0x00f07000, 0x00f08000,
+  0x00f09000, 0x00f0a000, 0x00f0b000, 0x00f0c000, 0x00f0d000, 0x00f0e000,
+  0x00f0f000, 0x00f10000, 0x00f11000, 0x00f12000, 0x00f13000, 0x00f14000,
+  0x00f15000, 0x00f16000, 0x00f17000, 0x00f18000, 0x00f19000, 0x00f1a000,
+  0x00f1b000, 0x00f1c000, 0x00f1d000, 0x00f1e000, 0x00f1f000, 0x00f20000,
+  0x00f21000, 0x00f22000, 0x00f23000, 0x00f24000, 0x00f25000, 0x00f26000,
+  0x00f27000, 0x00f28000, 0x00f29000, 0x00f2a000, 0x00f2b000, 0x00f2c000,
+  0x00f2d000, 0x00f2e000, 0x00f2f000, 0x00f30000, 0x00f31000, 0x00f32000,
+  0x00f33000, 0x00f34000, 0x00f35000, 0x00f36000, 0x00f37000, 0x00f38000,
+  0x00f39000, 0x00f3a000, 0x00f3b000, 0x00f3c000, 0x00f3d000, 0x00f3e000,
+  0x00f3f000, 0x00f40000, 0x00f41000, 0x00f42000, 0x00f43000, 0x00f44000,
+  0x00f45000, 0x00f46000, 0x00f47000, 0x00f48000, 0x00f49000, 0x00f4a000,
+  0x00f4f000, 0x00f50000, 0x00f51000, 0x00f52000, 0x00f53000, 0x00f54000,
+  0x00f55000, 0x00f56000, 0x00f57000, 0x00f58000, 0x00f59000, 0x00f5a000,
+  0x00f5b000, 0x00f5c000, 0x00f5d000, 0x00f5e000, 0x00f5f000, 0x00f60000,
+  0x00f61000, 0x00f62000, 0x00f63000, 0x00f64000, 0x00f65000, 0x00f66000,
+  0x00f67000, 0x00f68000, 0x00f69000, 0x00f6a000, 0x00f6b000, 0x00f6c000,
+  0x00f6d000, 0x00f6e000, 0x00f6f000, 0x00f70000, 0x00f71000, 0x00f72000,
+  0x00f73000, 0x00f74000, 0x00f75000, 0x00f76000, 0x00f77000, 0x00f78000,
+  0x00f79000, 0x00f7a000, 0x00f7b000, 0x00f7c000, 0x00f7d000, 0x00f7e000,
+  0x00f7f000, 0x00f84007, 0x00f8c005, 0x00f94007, 0x00f9c007, 0x00fa4005,
+  0x00fac800, 0x00fad800, 0x00fae800, 0x00faf800, 0x00fb4007, 0x00fdc003,
+  0x00fe4003, 0x00fec003, 0x00ff4004, 0x00ffc003, 0x01081000, 0x01083800,
+  0x01085802, 0x01088002, 0x0108a800, 0x0108c804, 0x01092000, 0x01093000,
+  0x01094000, 0x01095003, 0x01098003, 0x0109f001, 0x010a2800, 0x010b000f,
+  0x010c1800, 0x0125b019, 0x0160002f, 0x01630000, 0x01631002, 0x01633800,
+  0x01634800, 0x01635800, 0x01636803, 0x01639000, 0x0163a800, 0x0163f002,
+  0x01641000, 0x01642000, 0x01643000, 0x01644000, 0x01645000, 0x01646000,
+  0x01647000, 0x01648000, 0x01649000, 0x0164a000, 0x0164b000, 0x0164c000,
+  0x0164d000, 0x0164e000, 0x0164f000, 0x01650000, 0x01651000, 0x01652000,
+  0x01653000, 0x01654000, 0x01655000, 0x01656000, 0x01657000, 0x01658000,
+  0x01659000, 0x0165a000, 0x0165b000, 0x0165c000, 0x0165d000, 0x0165e000,
+  0x0165f000, 0x01660000, 0x01661000, 0x01662000, 0x01663000, 0x01664000,
+  0x01665000, 0x01666000, 0x01667000, 0x01668000, 0x01669000, 0x0166a000,
+  0x0166b000, 0x0166c000, 0x0166d000, 0x0166e000, 0x0166f000, 0x01670000,
+  0x01671000, 0x01675800, 0x01676800, 0x01679000, 0x05320000, 0x05321000,
+  0x05322000, 0x05323000, 0x05324000, 0x05325000, 0x05326000, 0x05327000,
+  0x05328000, 0x05329000, 0x0532a000, 0x0532b000, 0x0532c000, 0x0532d000,
+  0x0532e000, 0x0532f000, 0x05330000, 0x05331000, 0x05332000, 0x05333000,
+  0x05334000, 0x05335000, 0x05336000, 0x05340000, 0x05341000, 0x05342000,
+  0x05343000, 0x05344000, 0x05345000, 0x05346000, 0x05347000, 0x05348000,
+  0x05349000, 0x0534a000, 0x0534b000, 0x0534c000, 0x0534d000, 0x05391000,
+  0x05392000, 0x05393000, 0x05394000, 0x05395000, 0x05396000, 0x05397000,
+  0x05399000, 0x0539a000, 0x0539b000, 0x0539c000, 0x0539d000, 0x0539e000,
+  0x0539f000, 0x053a0000, 0x053a1000, 0x053a2000, 0x053a3000, 0x053a4000,
+  0x053a5000, 0x053a6000, 0x053a7000, 0x053a8000, 0x053a9000, 0x053aa000,
+  0x053ab000, 0x053ac000, 0x053ad000, 0x053ae000, 0x053af000, 0x053b0000,
+  0x053b1000, 0x053b2000, 0x053b3000, 0x053b4000, 0x053b5000, 0x053b6000,
+  0x053b7000, 0x053bc800, 0x053bd800, 0x053be801, 0x053c0000, 0x053c1000,
+  0x053c2000, 0x053c3000, 0x053c5800, 0x053c6800, 0x053c8000, 0x053c9000,
+  0x053cb000, 0x053cc000, 0x053cd000, 0x053ce000, 0x053cf000, 0x053d0000,
+  0x053d1000, 0x053d2000, 0x053d3000, 0x053d4000, 0x053d5004, 0x053d8004,
+  0x053db000, 0x053dc000, 0x053dd000, 0x053de000, 0x053df000, 0x053e0000,
+  0x053e1000, 0x053e2003, 0x053e4800, 0x053e5801, 0x053e8000, 0x053eb000,
+  0x053ec000, 0x053ed000, 0x053ee000, 0x053fa800, 0x07f90819, 0x08200027,
+  0x08258023, 0x082b800a, 0x082be00e, 0x082c6006, 0x082ca001, 0x08640032,
+  0x086a8015, 0x08c5001f, 0x0b72001f, 0x0ea00019, 0x0ea1a019, 0x0ea34019,
+  0x0ea4e000, 0x0ea4f001, 0x0ea51000, 0x0ea52801, 0x0ea54803, 0x0ea57007,
+  0x0ea68019, 0x0ea82001, 0x0ea83803, 0x0ea86807, 0x0ea8b006, 0x0ea9c001,
+  0x0ea9d803, 0x0eaa0004, 0x0eaa3000, 0x0eaa5006, 0x0eab6019, 0x0ead0019,
+  0x0eaea019, 0x0eb04019, 0x0eb1e019, 0x0eb38019, 0x0eb54018, 0x0eb71018,
+  0x0eb8e018, 0x0ebab018, 0x0ebc8018, 0x0ebe5000, 0x0f480021, 0x0f898019,
+  0x0f8a8019, 0x0f8b8019,
+  /* Variation_Selector */
+  0x00c05802, 0x00c07800, 0x07f0000f, 0x700800ef,
+  /* White_Space */
+  0x00004804, 0x00010000, 0x00042800, 0x00050000, 0x00b40000, 0x0100000a,
+  0x01014001, 0x01017800, 0x0102f800, 0x01800000,
+  /* XID_Continue */
+  0x00018009, 0x00020819, 0x0002f800, 0x00030819, 0x00055000, 0x0005a800,
+  0x0005b800, 0x0005d000, 0x00060016, 0x0006c01e, 0x0007c1c9, 0x0016300b,
+  0x00170004, 0x00176000, 0x00177000, 0x00180074, 0x001bb001, 0x001bd802,
+  0x001bf800, 0x001c3004, 0x001c6000, 0x001c7013, 0x001d1852, 0x001fb88a,
+  0x00241804, 0x002450a5, 0x00298825, 0x002ac800, 0x002b0028, 0x002c882c,
+  0x002df800, 0x002e0801, 0x002e2001, 0x002e3800, 0x002e801a, 0x002f7803,
+  0x0030800a, 0x00310049, 0x00337065, 0x0036a807, 0x0036f809, 0x00375012,
+  0x0037f800, 0x0038803a, 0x003a6864, 0x003e0035, 0x003fd000, 0x003fe800,
+  0x0040002d, 0x0042001b, 0x0043000a, 0x00438017, 0x00444805, 0x0044b84a,
+  0x00471880, 0x004b3009, 0x004b8812, 0x004c2807, 0x004c7801, 0x004c9815,
+  0x004d5006, 0x004d9000, 0x004db003, 0x004de008, 0x004e3801, 0x004e5803,
+  0x004eb800, 0x004ee001, 0x004ef804, 0x004f300b, 0x004fe000, 0x004ff000,
+  0x00500802, 0x00502805, 0x00507801, 0x00509815, 0x00515006, 0x00519001,
+  0x0051a801, 0x0051c001, 0x0051e000, 0x0051f004, 0x00523801, 0x00525802,
+  0x00528800, 0x0052c803, 0x0052f000, 0x0053300f, 0x00540802, 0x00542808,
+  0x00547802, 0x00549815, 0x00555006, 0x00559001, 0x0055a804, 0x0055e009,
+  0x00563802, 0x00565802, 0x00568000, 0x00570003, 0x00573009, 0x0057c806,
+  0x00580802, 0x00582807, 0x00587801, 0x00589815, 0x00595006, 0x00599001,
+  0x0059a804, 0x0059e008, 0x005a3801, 0x005a5802, 0x005aa802, 0x005ae001,
+  0x005af804, 0x005b3009, 0x005b8800, 0x005c1001, 0x005c2805, 0x005c7002,
+  0x005c9003, 0x005cc801, 0x005ce000, 0x005cf001, 0x005d1801, 0x005d4002,
+  0x005d700b, 0x005df004, 0x005e3002, 0x005e5003, 0x005e8000, 0x005eb800,
+  0x005f3009, 0x0060000c, 0x00607002, 0x00609016, 0x0061500f, 0x0061e008,
+  0x00623002, 0x00625003, 0x0062a801, 0x0062c002, 0x0062e800, 0x00630003,
+  0x00633009, 0x00640003, 0x00642807, 0x00647002, 0x00649016, 0x00655009,
+  0x0065a804, 0x0065e008, 0x00663002, 0x00665003, 0x0066a801, 0x0066e801,
+  0x00670003, 0x00673009, 0x00678802, 0x0068000c, 0x00687002, 0x00689032,
+  0x006a3002, 0x006a5004, 0x006aa003, 0x006af804, 0x006b3009, 0x006bd005,
+  0x006c0802, 0x006c2811, 0x006cd017, 0x006d9808, 0x006de800, 0x006e0006,
+  0x006e5000, 0x006e7805, 0x006eb000, 0x006ec007, 0x006f3009, 0x006f9001,
+  0x00700839, 0x0072000e, 0x00728009, 0x00740801, 0x00742000, 0x00743004,
+  0x00746017, 0x00752800, 0x00753816, 0x00760004, 0x00763000, 0x00764006,
+  0x00768009, 0x0076e003, 0x00780000, 0x0078c001, 0x00790009, 0x0079a800,
+  0x0079b800, 0x0079c800, 0x0079f009, 0x007a4823, 0x007b8813, 0x007c3011,
+  0x007cc823, 0x007e3000, 0x00800049, 0x0082804d, 0x00850025, 0x00863800,
+  0x00866800, 0x0086802a, 0x0087e14c, 0x00925003, 0x00928006, 0x0092c000,
+  0x0092d003, 0x00930028, 0x00945003, 0x00948020, 0x00959003, 0x0095c006,
+  0x00960000, 0x00961003, 0x0096400e, 0x0096c038, 0x00989003, 0x0098c042,
+  0x009ae802, 0x009b4808, 0x009c000f, 0x009d0055, 0x009fc005, 0x00a00a6b,
+  0x00b37810, 0x00b40819, 0x00b5004a, 0x00b7700a, 0x00b80015, 0x00b8f815,
+  0x00ba0013, 0x00bb000c, 0x00bb7002, 0x00bb9001, 0x00bc0053, 0x00beb800,
+  0x00bee001, 0x00bf0009, 0x00c05802, 0x00c0780a, 0x00c10058, 0x00c4002a,
+  0x00c58045, 0x00c8001e, 0x00c9000b, 0x00c9800b, 0x00ca3027, 0x00cb8004,
+  0x00cc002b, 0x00cd8019, 0x00ce800a, 0x00d0001b, 0x00d1003e, 0x00d3001c,
+  0x00d3f80a, 0x00d48009, 0x00d53800, 0x00d5800d, 0x00d5f80f, 0x00d8004c,
+  0x00da8009, 0x00db5808, 0x00dc0073, 0x00e00037, 0x00e20009, 0x00e26830,
+  0x00e4000a, 0x00e4802a, 0x00e5e802, 0x00e68002, 0x00e6a026, 0x00e80215,
+  0x00f8c005, 0x00f90025, 0x00fa4005, 0x00fa8007, 0x00fac800, 0x00fad800,
+  0x00fae800, 0x00faf81e, 0x00fc0034, 0x00fdb006, 0x00fdf000, 0x00fe1002,
+  0x00fe3006, 0x00fe8003, 0x00feb005, 0x00ff000c, 0x00ff9002, 0x00ffb006,
+  0x01006001, 0x0101f801, 0x0102a000, 0x01038800, 0x0103f800, 0x0104800c,
+  0x0106800c, 0x01070800, 0x0107280b, 0x01081000, 0x01083800, 0x01085009,
+  0x0108a800, 0x0108c005, 0x01092000, 0x01093000, 0x01094000, 0x0109500f,
+  0x0109e003, 0x010a2804, 0x010a7000, 0x010b0028, 0x016000e4, 0x01675808,
+  0x01680025, 0x01693800, 0x01696800, 0x01698037, 0x016b7800, 0x016bf817,
+  0x016d0006, 0x016d4006, 0x016d8006, 0x016dc006, 0x016e0006, 0x016e4006,
+  0x016e8006, 0x016ec006, 0x016f001f, 0x01802802, 0x0181080e, 0x01818804,
+  0x0181c004, 0x01820855, 0x0184c801, 0x0184e802, 0x0185085e, 0x0188282a,
+  0x0189885d, 0x018d001f, 0x018f800f, 0x01a007ff, 0x01e007ff, 0x022007ff,
+  0x026001bf, 0x027007ff, 0x02b007ff, 0x02f007ff, 0x033007ff, 0x037007ff,
+  0x03b007ff, 0x03f007ff, 0x043007ff, 0x047007ff, 0x04b007ff, 0x04f0068c,
+  0x0526802d, 0x0528010c, 0x0530801b, 0x0532002f, 0x0533a009, 0x0533f872,
+  0x0538b808, 0x05391066, 0x053c5842, 0x053e8001, 0x053e9800, 0x053ea807,
+  0x053f9035, 0x05416000, 0x05420033, 0x05440045, 0x05468009, 0x05470017,
+  0x0547d800, 0x0547e830, 0x05498023, 0x054b001c, 0x054c0040, 0x054e780a,
+  0x054f001e, 0x05500036, 0x0552000d, 0x05528009, 0x05530016, 0x0553d048,
+  0x0556d802, 0x0557000f, 0x05579004, 0x05580805, 0x05584805, 0x05588805,
+  0x05590006, 0x05594006, 0x0559802a, 0x055ae00d, 0x055b807a, 0x055f6001,
+  0x055f8009, 0x056007ff, 0x05a007ff, 0x05e007ff, 0x062007ff, 0x066007ff,
+  0x06a003a3, 0x06bd8016, 0x06be5830, 0x07c8016d, 0x07d38069, 0x07d80006,
+  0x07d89804, 0x07d8e80b, 0x07d9500c, 0x07d9c004, 0x07d9f000, 0x07da0001,
+  0x07da1801, 0x07da306b, 0x07de988a, 0x07e320d9, 0x07ea803f, 0x07ec9035,
+  0x07ef8009, 0x07f0000f, 0x07f1000f, 0x07f19801, 0x07f26802, 0x07f38800,
+  0x07f39800, 0x07f3b800, 0x07f3c800, 0x07f3d800, 0x07f3e800, 0x07f3f87d,
+  0x07f88009, 0x07f90819, 0x07f9f800, 0x07fa0819, 0x07fb2859, 0x07fe1005,
+  0x07fe5005, 0x07fe9005, 0x07fed002, 0x0800000b, 0x08006819, 0x08014012,
+  0x0801e001, 0x0801f80e, 0x0802800d, 0x0804007a, 0x080a0034, 0x080fe800,
+  0x0814001c, 0x08150030, 0x08170000, 0x0818001f, 0x0819681d, 0x081a802a,
+  0x081c001d, 0x081d0023, 0x081e4007, 0x081e8804, 0x0820009d, 0x08250009,
+  0x08258023, 0x0826c023, 0x08280027, 0x08298033, 0x082b800a, 0x082be00e,
+  0x082c6006, 0x082ca001, 0x082cb80a, 0x082d180e, 0x082d9806, 0x082dd801,
+  0x082e0033, 0x08300136, 0x083a0015, 0x083b0007, 0x083c0005, 0x083c3829,
+  0x083d9008, 0x08400005, 0x08404000, 0x0840502b, 0x0841b801, 0x0841e000,
+  0x0841f816, 0x08430016, 0x0844001e, 0x08470012, 0x0847a001, 0x08480015,
+  0x08490019, 0x084c0037, 0x084df001, 0x08500003, 0x08502801, 0x08506007,
+  0x0850a802, 0x0850c81c, 0x0851c002, 0x0851f800, 0x0853001c, 0x0854001c,
+  0x08560007, 0x0856481d, 0x08580035, 0x085a0015, 0x085b0012, 0x085c0011,
+  0x08600048, 0x08640032, 0x08660032, 0x08680027, 0x08698009, 0x086a0025,
+  0x086b4804, 0x086b7816, 0x08740029, 0x08755801, 0x08758001, 0x08761002,
+  0x0877e020, 0x08793800, 0x08798020, 0x087b8015, 0x087d8014, 0x087f0016,
+  0x08800046, 0x0883300f, 0x0883f83b, 0x08861000, 0x08868018, 0x08878009,
+  0x08880034, 0x0889b009, 0x088a2003, 0x088a8023, 0x088bb000, 0x088c0044,
+  0x088e4803, 0x088e700c, 0x088ee000, 0x08900011, 0x08909824, 0x0891f003,
+  0x08940006, 0x08944000, 0x08945003, 0x0894780e, 0x0894f809, 0x0895803a,
+  0x08978009, 0x08980003, 0x08982807, 0x08987801, 0x08989815, 0x08995006,
+  0x08999001, 0x0899a804, 0x0899d809, 0x089a3801, 0x089a5802, 0x089a8000,
+  0x089ab800, 0x089ae806, 0x089b3006, 0x089b8004, 0x089c0009, 0x089c5800,
+  0x089c7000, 0x089c8025, 0x089db809, 0x089e1000, 0x089e2800, 0x089e3803,
+  0x089e6007, 0x089f0801, 0x08a0004a, 0x08a28009, 0x08a2f003, 0x08a40045,
+  0x08a63800, 0x08a68009, 0x08ac0035, 0x08adc008, 0x08aec005, 0x08b00040,
+  0x08b22000, 0x08b28009, 0x08b40038, 0x08b60009, 0x08b68013, 0x08b8001a,
+  0x08b8e80e, 0x08b98009, 0x08ba0006, 0x08c0003a, 0x08c50049, 0x08c7f807,
+  0x08c84800, 0x08c86007, 0x08c8a801, 0x08c8c01d, 0x08c9b801, 0x08c9d808,
+  0x08ca8009, 0x08cd0007, 0x08cd502d, 0x08ced007, 0x08cf1801, 0x08d0003e,
+  0x08d23800, 0x08d28049, 0x08d4e800, 0x08d58048, 0x08de0020, 0x08df8009,
+  0x08e00008, 0x08e0502c, 0x08e1c008, 0x08e28009, 0x08e3901d, 0x08e49015,
+  0x08e5480d, 0x08e80006, 0x08e84001, 0x08e8582b, 0x08e9d000, 0x08e9e001,
+  0x08e9f808, 0x08ea8009, 0x08eb0005, 0x08eb3801, 0x08eb5024, 0x08ec8001,
+  0x08ec9805, 0x08ed0009, 0x08f70016, 0x08f80010, 0x08f89028, 0x08f9f004,
+  0x08fa800a, 0x08fd8000, 0x09000399, 0x0920006e, 0x092400c3, 0x097c8060,
+  0x0980042f, 0x09a20015, 0x09a307ff, 0x09e3079a, 0x0a200246, 0x0b080039,
+  0x0b400238, 0x0b52001e, 0x0b530009, 0x0b53804e, 0x0b560009, 0x0b56801d,
+  0x0b578004, 0x0b580036, 0x0b5a0003, 0x0b5a8009, 0x0b5b1814, 0x0b5be812,
+  0x0b6a002c, 0x0b6b8009, 0x0b72003f, 0x0b78004a, 0x0b7a7838, 0x0b7c7810,
+  0x0b7f0001, 0x0b7f1801, 0x0b7f8001, 0x0b8007ff, 0x0bc007ff, 0x0c0007f7,
+  0x0c4004d5, 0x0c67f809, 0x0d7f8003, 0x0d7fa806, 0x0d7fe801, 0x0d800122,
+  0x0d899000, 0x0d8a8002, 0x0d8aa800, 0x0d8b2003, 0x0d8b818b, 0x0de0006a,
+  0x0de3800c, 0x0de40008, 0x0de48009, 0x0de4e801, 0x0e678009, 0x0e78002d,
+  0x0e798016, 0x0e8b2804, 0x0e8b6805, 0x0e8bd807, 0x0e8c2806, 0x0e8d5003,
+  0x0e921002, 0x0ea00054, 0x0ea2b046, 0x0ea4f001, 0x0ea51000, 0x0ea52801,
+  0x0ea54803, 0x0ea5700b, 0x0ea5d800, 0x0ea5e806, 0x0ea62840, 0x0ea83803,
+  0x0ea86807, 0x0ea8b006, 0x0ea8f01b, 0x0ea9d803, 0x0eaa0004, 0x0eaa3000,
+  0x0eaa5006, 0x0eaa9153, 0x0eb54018, 0x0eb61018, 0x0eb6e01e, 0x0eb7e018,
+  0x0eb8b01e, 0x0eb9b018, 0x0eba801e, 0x0ebb8018, 0x0ebc501e, 0x0ebd5018,
+  0x0ebe2007, 0x0ebe7031, 0x0ed00036, 0x0ed1d831, 0x0ed3a800, 0x0ed42000,
+  0x0ed4d804, 0x0ed5080e, 0x0ef8001e, 0x0ef92805, 0x0f000006, 0x0f004010,
+  0x0f00d806, 0x0f011801, 0x0f013004, 0x0f01803d, 0x0f047800, 0x0f08002c,
+  0x0f09800d, 0x0f0a0009, 0x0f0a7000, 0x0f14801e, 0x0f160039, 0x0f268029,
+  0x0f2e802a, 0x0f3f0006, 0x0f3f4003, 0x0f3f6801, 0x0f3f800e, 0x0f4000c4,
+  0x0f468006, 0x0f48004b, 0x0f4a8009, 0x0f700003, 0x0f70281a, 0x0f710801,
+  0x0f712000, 0x0f713800, 0x0f714809, 0x0f71a003, 0x0f71c800, 0x0f71d800,
+  0x0f721000, 0x0f723800, 0x0f724800, 0x0f725800, 0x0f726802, 0x0f728801,
+  0x0f72a000, 0x0f72b800, 0x0f72c800, 0x0f72d800, 0x0f72e800, 0x0f72f800,
+  0x0f730801, 0x0f732000, 0x0f733803, 0x0f736006, 0x0f73a003, 0x0f73c803,
+  0x0f73f000, 0x0f740009, 0x0f745810, 0x0f750802, 0x0f752804, 0x0f755810,
+  0x0fdf8009, 0x100007ff, 0x104007ff, 0x108007ff, 0x10c007ff, 0x110007ff,
+  0x114007ff, 0x118007ff, 0x11c007ff, 0x120007ff, 0x124007ff, 0x128007ff,
+  0x12c007ff, 0x130007ff, 0x134007ff, 0x138007ff, 0x13c007ff, 0x140007ff,
+  0x144007ff, 0x148007ff, 0x14c007ff, 0x150006df, 0x153807ff, 0x157807ff,
+  0x15b80039, 0x15ba00dd, 0x15c107ff, 0x160107ff, 0x16410681, 0x167587ff,
+  0x16b587ff, 0x16f587ff, 0x17358530, 0x175f826d, 0x17c0021d, 0x180007ff,
+  0x184007ff, 0x1880034a, 0x189a87ff, 0x18da87ff, 0x191a805f, 0x700800ef,
+  /* XID_Start */
+  0x00020819, 0x00030819, 0x00055000, 0x0005a800, 0x0005d000, 0x00060016,
+  0x0006c01e, 0x0007c1c9, 0x0016300b, 0x00170004, 0x00176000, 0x00177000,
+  0x001b8004, 0x001bb001, 0x001bd802, 0x001bf800, 0x001c3000, 0x001c4002,
+  0x001c6000, 0x001c7013, 0x001d1852, 0x001fb88a, 0x002450a5, 0x00298825,
+  0x002ac800, 0x002b0028, 0x002e801a, 0x002f7803, 0x0031002a, 0x00337001,
+  0x00338862, 0x0036a800, 0x00372801, 0x00377001, 0x0037d002, 0x0037f800,
+  0x00388000, 0x0038901d, 0x003a6858, 0x003d8800, 0x003e5020, 0x003fa001,
+  0x003fd000, 0x00400015, 0x0040d000, 0x00412000, 0x00414000, 0x00420018,
+  0x0043000a, 0x00438017, 0x00444805, 0x00450029, 0x00482035, 0x0049e800,
+  0x004a8000, 0x004ac009, 0x004b880f, 0x004c2807, 0x004c7801, 0x004c9815,
+  0x004d5006, 0x004d9000, 0x004db003, 0x004de800, 0x004e7000, 0x004ee001,
+  0x004ef802, 0x004f8001, 0x004fe000, 0x00502805, 0x00507801, 0x00509815,
+  0x00515006, 0x00519001, 0x0051a801, 0x0051c001, 0x0052c803, 0x0052f000,
+  0x00539002, 0x00542808, 0x00547802, 0x00549815, 0x00555006, 0x00559001,
+  0x0055a804, 0x0055e800, 0x00568000, 0x00570001, 0x0057c800, 0x00582807,
+  0x00587801, 0x00589815, 0x00595006, 0x00599001, 0x0059a804, 0x0059e800,
+  0x005ae001, 0x005af802, 0x005b8800, 0x005c1800, 0x005c2805, 0x005c7002,
+  0x005c9003, 0x005cc801, 0x005ce000, 0x005cf001, 0x005d1801, 0x005d4002,
+  0x005d700b, 0x005e8000, 0x00602807, 0x00607002, 0x00609016, 0x0061500f,
+  0x0061e800, 0x0062c002, 0x0062e800, 0x00630001, 0x00640000, 0x00642807,
+  0x00647002, 0x00649016, 0x00655009, 0x0065a804, 0x0065e800, 0x0066e801,
+  0x00670001, 0x00678801, 0x00682008, 0x00687002, 0x00689028, 0x0069e800,
+  0x006a7000, 0x006aa002, 0x006af802, 0x006bd005, 0x006c2811, 0x006cd017,
+  0x006d9808, 0x006de800, 0x006e0006, 0x0070082f, 0x00719000, 0x00720006,
+  0x00740801, 0x00742000, 0x00743004, 0x00746017, 0x00752800, 0x00753809,
+  0x00759000, 0x0075e800, 0x00760004, 0x00763000, 0x0076e003, 0x00780000,
+  0x007a0007, 0x007a4823, 0x007c4004, 0x0080002a, 0x0081f800, 0x00828005,
+  0x0082d003, 0x00830800, 0x00832801, 0x00837002, 0x0083a80c, 0x00847000,
+  0x00850025, 0x00863800, 0x00866800, 0x0086802a, 0x0087e14c, 0x00925003,
+  0x00928006, 0x0092c000, 0x0092d003, 0x00930028, 0x00945003, 0x00948020,
+  0x00959003, 0x0095c006, 0x00960000, 0x00961003, 0x0096400e, 0x0096c038,
+  0x00989003, 0x0098c042, 0x009c000f, 0x009d0055, 0x009fc005, 0x00a00a6b,
+  0x00b37810, 0x00b40819, 0x00b5004a, 0x00b7700a, 0x00b80011, 0x00b8f812,
+  0x00ba0011, 0x00bb000c, 0x00bb7002, 0x00bc0033, 0x00beb800, 0x00bee000,
+  0x00c10058, 0x00c40028, 0x00c55000, 0x00c58045, 0x00c8001e, 0x00ca801d,
+  0x00cb8004, 0x00cc002b, 0x00cd8019, 0x00d00016, 0x00d10034, 0x00d53800,
+  0x00d8282e, 0x00da2807, 0x00dc181d, 0x00dd7001, 0x00ddd02b, 0x00e00023,
+  0x00e26802, 0x00e2d023, 0x00e4000a, 0x00e4802a, 0x00e5e802, 0x00e74803,
+  0x00e77005, 0x00e7a801, 0x00e7d000, 0x00e800bf, 0x00f00115, 0x00f8c005,
+  0x00f90025, 0x00fa4005, 0x00fa8007, 0x00fac800, 0x00fad800, 0x00fae800,
+  0x00faf81e, 0x00fc0034, 0x00fdb006, 0x00fdf000, 0x00fe1002, 0x00fe3006,
+  0x00fe8003, 0x00feb005, 0x00ff000c, 0x00ff9002, 0x00ffb006, 0x01038800,
+  0x0103f800, 0x0104800c, 0x01081000, 0x01083800, 0x01085009, 0x0108a800,
+  0x0108c005, 0x01092000, 0x01093000, 0x01094000, 0x0109500f, 0x0109e003,
+  0x010a2804, 0x010a7000, 0x010b0028, 0x016000e4, 0x01675803, 0x01679001,
+  0x01680025, 0x01693800, 0x01696800, 0x01698037, 0x016b7800, 0x016c0016,
+  0x016d0006, 0x016d4006, 0x016d8006, 0x016dc006, 0x016e0006, 0x016e4006,
+  0x016e8006, 0x016ec006, 0x01802802, 0x01810808, 0x01818804, 0x0181c004,
+  0x01820855, 0x0184e802, 0x01850859, 0x0187e003, 0x0188282a, 0x0189885d,
+  0x018d001f, 0x018f800f, 0x01a007ff, 0x01e007ff, 0x022007ff, 0x026001bf,
+  0x027007ff, 0x02b007ff, 0x02f007ff, 0x033007ff, 0x037007ff, 0x03b007ff,
+  0x03f007ff, 0x043007ff, 0x047007ff, 0x04b007ff, 0x04f0068c, 0x0526802d,
+  0x0528010c, 0x0530800f, 0x05315001, 0x0532002e, 0x0533f81e, 0x0535004f,
+  0x0538b808, 0x05391066, 0x053c5842, 0x053e8001, 0x053e9800, 0x053ea807,
+  0x053f900f, 0x05401802, 0x05403803, 0x05406016, 0x05420033, 0x05441031,
+  0x05479005, 0x0547d800, 0x0547e801, 0x0548501b, 0x05498016, 0x054b001c,
+  0x054c202e, 0x054e7800, 0x054f0004, 0x054f3009, 0x054fd004, 0x05500028,
+  0x05520002, 0x05522007, 0x05530016, 0x0553d000, 0x0553f031, 0x05558800,
+  0x0555a801, 0x0555c804, 0x05560000, 0x05561000, 0x0556d802, 0x0557000a,
+  0x05579002, 0x05580805, 0x05584805, 0x05588805, 0x05590006, 0x05594006,
+  0x0559802a, 0x055ae00d, 0x055b8072, 0x056007ff, 0x05a007ff, 0x05e007ff,
+  0x062007ff, 0x066007ff, 0x06a003a3, 0x06bd8016, 0x06be5830, 0x07c8016d,
+  0x07d38069, 0x07d80006, 0x07d89804, 0x07d8e800, 0x07d8f809, 0x07d9500c,
+  0x07d9c004, 0x07d9f000, 0x07da0001, 0x07da1801, 0x07da306b, 0x07de988a,
+  0x07e320d9, 0x07ea803f, 0x07ec9035, 0x07ef8009, 0x07f38800, 0x07f39800,
+  0x07f3b800, 0x07f3c800, 0x07f3d800, 0x07f3e800, 0x07f3f87d, 0x07f90819,
+  0x07fa0819, 0x07fb3037, 0x07fd001e, 0x07fe1005, 0x07fe5005, 0x07fe9005,
+  0x07fed002, 0x0800000b, 0x08006819, 0x08014012, 0x0801e001, 0x0801f80e,
+  0x0802800d, 0x0804007a, 0x080a0034, 0x0814001c, 0x08150030, 0x0818001f,
+  0x0819681d, 0x081a8025, 0x081c001d, 0x081d0023, 0x081e4007, 0x081e8804,
+  0x0820009d, 0x08258023, 0x0826c023, 0x08280027, 0x08298033, 0x082b800a,
+  0x082be00e, 0x082c6006, 0x082ca001, 0x082cb80a, 0x082d180e, 0x082d9806,
+  0x082dd801, 0x082e0033, 0x08300136, 0x083a0015, 0x083b0007, 0x083c0005,
+  0x083c3829, 0x083d9008, 0x08400005, 0x08404000, 0x0840502b, 0x0841b801,
+  0x0841e000, 0x0841f816, 0x08430016, 0x0844001e, 0x08470012, 0x0847a001,
+  0x08480015, 0x08490019, 0x084c0037, 0x084df001, 0x08500000, 0x08508003,
+  0x0850a802, 0x0850c81c, 0x0853001c, 0x0854001c, 0x08560007, 0x0856481b,
+  0x08580035, 0x085a0015, 0x085b0012, 0x085c0011, 0x08600048, 0x08640032,
+  0x08660032, 0x08680023, 0x086a501b, 0x086b7816, 0x08740029, 0x08758001,
+  0x08761002, 0x0878001c, 0x08793800, 0x08798015, 0x087b8011, 0x087d8014,
+  0x087f0016, 0x08801834, 0x08838801, 0x0883a800, 0x0884182c, 0x08868018,
+  0x08881823, 0x088a2000, 0x088a3800, 0x088a8022, 0x088bb000, 0x088c182f,
+  0x088e0803, 0x088ed000, 0x088ee000, 0x08900011, 0x08909818, 0x0891f801,
+  0x08940006, 0x08944000, 0x08945003, 0x0894780e, 0x0894f809, 0x0895802e,
+  0x08982807, 0x08987801, 0x08989815, 0x08995006, 0x08999001, 0x0899a804,
+  0x0899e800, 0x089a8000, 0x089ae804, 0x089c0009, 0x089c5800, 0x089c7000,
+  0x089c8025, 0x089db800, 0x089e8800, 0x089e9800, 0x08a00034, 0x08a23803,
+  0x08a2f802, 0x08a4002f, 0x08a62001, 0x08a63800, 0x08ac002e, 0x08aec003,
+  0x08b0002f, 0x08b22000, 0x08b4002a, 0x08b5c000, 0x08b8001a, 0x08ba0006,
+  0x08c0002b, 0x08c5003f, 0x08c7f807, 0x08c84800, 0x08c86007, 0x08c8a801,
+  0x08c8c017, 0x08c9f800, 0x08ca0800, 0x08cd0007, 0x08cd5026, 0x08cf0800,
+  0x08cf1800, 0x08d00000, 0x08d05827, 0x08d1d000, 0x08d28000, 0x08d2e02d,
+  0x08d4e800, 0x08d58048, 0x08de0020, 0x08e00008, 0x08e05024, 0x08e20000,
+  0x08e3901d, 0x08e80006, 0x08e84001, 0x08e85825, 0x08ea3000, 0x08eb0005,
+  0x08eb3801, 0x08eb501f, 0x08ecc000, 0x08f70012, 0x08f81000, 0x08f8200c,
+  0x08f89021, 0x08fd8000, 0x09000399, 0x0920006e, 0x092400c3, 0x097c8060,
+  0x0980042f, 0x09a20805, 0x09a307ff, 0x09e3079a, 0x0a200246, 0x0b08001d,
+  0x0b400238, 0x0b52001e, 0x0b53804e, 0x0b56801d, 0x0b58002f, 0x0b5a0003,
+  0x0b5b1814, 0x0b5be812, 0x0b6a002c, 0x0b72003f, 0x0b78004a, 0x0b7a8000,
+  0x0b7c980c, 0x0b7f0001, 0x0b7f1800, 0x0b8007ff, 0x0bc007ff, 0x0c0007f7,
+  0x0c4004d5, 0x0c67f809, 0x0d7f8003, 0x0d7fa806, 0x0d7fe801, 0x0d800122,
+  0x0d899000, 0x0d8a8002, 0x0d8aa800, 0x0d8b2003, 0x0d8b818b, 0x0de0006a,
+  0x0de3800c, 0x0de40008, 0x0de48009, 0x0ea00054, 0x0ea2b046, 0x0ea4f001,
+  0x0ea51000, 0x0ea52801, 0x0ea54803, 0x0ea5700b, 0x0ea5d800, 0x0ea5e806,
+  0x0ea62840, 0x0ea83803, 0x0ea86807, 0x0ea8b006, 0x0ea8f01b, 0x0ea9d803,
+  0x0eaa0004, 0x0eaa3000, 0x0eaa5006, 0x0eaa9153, 0x0eb54018, 0x0eb61018,
+  0x0eb6e01e, 0x0eb7e018, 0x0eb8b01e, 0x0eb9b018, 0x0eba801e, 0x0ebb8018,
+  0x0ebc501e, 0x0ebd5018, 0x0ebe2007, 0x0ef8001e, 0x0ef92805, 0x0f01803d,
+  0x0f08002c, 0x0f09b806, 0x0f0a7000, 0x0f14801d, 0x0f16002b, 0x0f26801b,
+  0x0f2e801d, 0x0f2f8000, 0x0f3f0006, 0x0f3f4003, 0x0f3f6801, 0x0f3f800e,
+  0x0f4000c4, 0x0f480043, 0x0f4a5800, 0x0f700003, 0x0f70281a, 0x0f710801,
+  0x0f712000, 0x0f713800, 0x0f714809, 0x0f71a003, 0x0f71c800, 0x0f71d800,
+  0x0f721000, 0x0f723800, 0x0f724800, 0x0f725800, 0x0f726802, 0x0f728801,
+  0x0f72a000, 0x0f72b800, 0x0f72c800, 0x0f72d800, 0x0f72e800, 0x0f72f800,
+  0x0f730801, 0x0f732000, 0x0f733803, 0x0f736006, 0x0f73a003, 0x0f73c803,
+  0x0f73f000, 0x0f740009, 0x0f745810, 0x0f750802, 0x0f752804, 0x0f755810,
+  0x100007ff, 0x104007ff, 0x108007ff, 0x10c007ff, 0x110007ff, 0x114007ff,
+  0x118007ff, 0x11c007ff, 0x120007ff, 0x124007ff, 0x128007ff, 0x12c007ff,
+  0x130007ff, 0x134007ff, 0x138007ff, 0x13c007ff, 0x140007ff, 0x144007ff,
+  0x148007ff, 0x14c007ff, 0x150006df, 0x153807ff, 0x157807ff, 0x15b80039,
+  0x15ba00dd, 0x15c107ff, 0x160107ff, 0x16410681, 0x167587ff, 0x16b587ff,
+  0x16f587ff, 0x17358530, 0x175f826d, 0x17c0021d, 0x180007ff, 0x184007ff,
+  0x1880034a, 0x189a87ff, 0x18da87ff, 0x191a805f,
+};
+
+const uint16_t PRIV(ucd_boolprop_ranges_index)[] = {
+      0,     1,     4,   813,   817,   912,  1364,  1523,
+   2149,  2280,  2894,  3523,  4153,  4177,  4195,  4203,
+   4417,  4567,  4577,  4578,  4618,  4698,  4776,  4817,
+   5764,  6139,  6197,  6203,  6206,  6207,  6208,  6226,
+   6239,  7084,  7813,  7880,  8278,  8279,  8286,  8961,
+   9100,  9109,  9127,  9155,  9160,  9167,  9180,  9183,
+   9184,  9272,  9306,  9422,  9483, 10139, 10143, 10153,
+  11005, 11741,
+};
+
 /* These are the main two-stage UCD tables. The fields in each record are:
 script (8 bits), character type (8 bits), grapheme break property (8 bits),
 offset to multichar other cases or zero (8 bits), offset to other case or zero
@@ -5794,6 +9398,834 @@ const uint16_t PRIV(ucd_stage2)[] = { /* 80640 bytes, block = 128 */
 1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1024,1032,1032,
 };
 
+/* These tables map each character to the smallest code point that it matches
+caselessly, leaving aside the optional Turkish equivalences, so that comparing
+two characters' folds tests whether they match caselessly. The stage 2 table
+holds the offset from a character to its fold. Characters from UCD_FOLD_LIMIT
+onwards have no other case and are not in the tables. */
+
+const uint8_t PRIV(ucd_fold_stage1)[] = { /* 3920 bytes */
+  0,  0,  0,  1,  0,  0,  0,  2,  3,  4,  5,  6,  7,  8,  9, 10, /* U+0000 */
+  3, 11, 12, 13, 14,  0,  0,  0,  0,  0,  0, 15, 16, 17, 18, 19, /* U+0200 */
+  0, 20, 21,  3, 22,  3, 23,  3,  3, 24,  0, 25, 26,  0,  0,  0, /* U+0400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+0600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+0800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+0A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+0C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+0E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 27, /* U+1200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1A00 */
+  0,  0,  0,  0, 28, 29,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1C00 */
+  3,  3,  3,  3, 30,  3,  3,  3, 31, 32, 33, 34, 32, 35, 36, 37, /* U+1E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0, 38, 39, 40, 41,  0,  0,  0, /* U+2000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+2200 */
+  0,  0,  0,  0,  0,  0, 42, 43,  0,  0,  0,  0,  0,  0,  0,  0, /* U+2400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+2600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+2800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+2A00 */
+  0, 44, 45, 46,  3,  3,  3, 47, 48, 49,  0,  0,  0,  0,  0,  0, /* U+2C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+2E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+3000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+3200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+3400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+3600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+3800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+3A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+3C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+3E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+4000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+4200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+4400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+4600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+4800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+4A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+4C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+4E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+5000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+5200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+5400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+5600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+5800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+5A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+5C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+5E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+6000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+6200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+6400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+6600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+6800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+6A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+6C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+6E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+7000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+7200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+7400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+7600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+7800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+7A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+7C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+7E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+8000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+8200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+8400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+8600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+8800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+8A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+8C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+8E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+9000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+9200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+9400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+9600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+9800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+9A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+9C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+9E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+A000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+A200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+A400 */
+  0,  0, 50, 51, 52,  0,  0,  0,  0, 53,  3, 54, 55, 56, 57, 58, /* U+A600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+A800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, 59, 60, 61, 61,  0,  0, /* U+AA00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+AC00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+AE00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+B000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+B200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+B400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+B600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+B800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+BA00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+BC00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+BE00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+C000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+C200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+C400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+C600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+C800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+CA00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+CC00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+CE00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+D000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+D200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+D400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+D600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+D800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+DA00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+DC00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+DE00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+E000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+E200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+E400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+E600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+E800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+EA00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+EC00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+EE00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+F000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+F200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+F400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+F600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+F800 */
+  0,  0,  0,  0,  0,  0,  0,  0, 62,  0,  0,  0,  0,  0,  0,  0, /* U+FA00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+FC00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  1,  0,  0,  0,  0,  0, /* U+FE00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+10000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+10200 */
+  0, 63, 64,  0,  0,  0, 65, 66,  0,  0,  0,  0, 67, 68,  0,  0, /* U+10400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+10600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+10800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+10A00 */
+  0,  0,  0,  0,  0,  0, 69, 70,  0,  0,  0, 20, 71,  0,  0,  0, /* U+10C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+10E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+11000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+11200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+11400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+11600 */
+  0,  0,  0,  0,  0,  0, 72,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+11800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+11A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+11C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+11E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+12000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+12200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+12400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+12600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+12800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+12A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+12C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+12E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+13000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+13200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+13400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+13600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+13800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+13A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+13C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+13E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+14000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+14200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+14400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+14600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+14800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+14A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+14C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+14E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+15000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+15200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+15400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+15600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+15800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+15A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+15C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+15E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+16000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+16200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+16400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+16600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+16800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+16A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+16C00 */
+  0,  0,  0, 72,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+16E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+17000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+17200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+17400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+17600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+17800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+17A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+17C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+17E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+18000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+18200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+18400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+18600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+18800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+18A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+18C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+18E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+19000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+19200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+19400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+19600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+19800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+19A00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+19C00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+19E00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1A000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1A200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1A400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1A600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1A800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1AA00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1AC00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1AE00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1B000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1B200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1B400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1B600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1B800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1BA00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1BC00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1BE00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1C000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1C200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1C400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1C600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1C800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1CA00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1CC00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1CE00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1D000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1D200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1D400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1D600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1D800 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1DA00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1DC00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1DE00 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1E000 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1E200 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1E400 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, /* U+1E600 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0, 73, 74,  0,  0,  0,  0,  0, /* U+1E800 */
+};
+
+const int32_t PRIV(ucd_fold_stage2)[] = { /* 9600 bytes, block = 32 */
+
+/* block 0 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 1 */
+  0,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,  0,  0,  0,  0,  0,
+
+/* block 2 */
+-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+-32,-32,-32,-32,-32,-32,-32,  0,-32,-32,-32,-32,-32,-32,-32,  0,
+
+/* block 3 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+
+/* block 4 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+  0,  0,  0, -1,  0, -1,  0, -1,  0,  0, -1,  0, -1,  0, -1,  0,
+
+/* block 5 */
+ -1,  0, -1,  0, -1,  0, -1,  0, -1,  0,  0, -1,  0, -1,  0, -1,
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+
+/* block 6 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+  0, -1,  0, -1,  0, -1,  0, -1,-121,  0, -1,  0, -1,  0, -1,-300,
+
+/* block 7 */
+  0,  0,  0, -1,  0, -1,  0,  0, -1,  0,  0,  0, -1,  0,  0,  0,
+  0,  0, -1,  0,  0,  0,  0,  0,  0, -1,  0,  0,  0,  0,  0,  0,
+
+/* block 8 */
+  0, -1,  0, -1,  0, -1,  0,  0, -1,  0,  0,  0,  0, -1,  0,  0,
+ -1,  0,  0,  0, -1,  0, -1,  0,  0, -1,  0,  0,  0, -1,  0,  0,
+
+/* block 9 */
+  0,  0,  0,  0,  0, -1, -2,  0, -1, -2,  0, -1, -2,  0, -1,  0,
+ -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,-79,  0, -1,
+
+/* block 10 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+  0,  0, -1, -2,  0, -1,-97,-56,  0, -1,  0, -1,  0, -1,  0, -1,
+
+/* block 11 */
+-130,  0,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+  0, -1,  0, -1,  0,  0,  0,  0,  0,  0,  0,  0, -1,-163,  0,  0,
+
+/* block 12 */
+  0,  0, -1,-195,  0,  0,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+  0,  0,  0,-210,-206,  0,-205,-205,  0,-202,  0,-203,  0,  0,  0,  0,
+
+/* block 13 */
+-205,  0,  0,-207,  0,  0,  0,  0,-209,-211,  0,  0,  0,  0,  0,-211,
+  0,  0,-213,  0,  0,-214,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 14 */
+-218,  0,  0,-218,  0,  0,  0,  0,-218,-69,-217,-217,-71,  0,  0,  0,
+  0,  0,-219,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 15 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0, -1,  0, -1,  0,  0,  0, -1,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 16 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,-84,  0,  0,-743,  0,  0,  0,
+
+/* block 17 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,-38,-37,-37,-37,
+  0,-32,-32,-32,-32,-32,-32,-32,-32,-116,-32,-32,-775,-32,-32,-32,
+
+/* block 18 */
+-32,-32,-31,-32,-32,-32,-32,-32,-32,-32,-32,-32,-64,-63,-63,  0,
+-62,-57,  0,  0,  0,-47,-54, -8,  0, -1,  0, -1,  0, -1,  0, -1,
+
+/* block 19 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+-86,-80,  0,-116,-92,-96,  0,  0, -1, -7,  0, -1,  0,-130,-130,-130,
+
+/* block 20 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+
+/* block 21 */
+-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,-80,
+
+/* block 22 */
+  0, -1,  0,  0,  0,  0,  0,  0,  0,  0,  0, -1,  0, -1,  0, -1,
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+
+/* block 23 */
+  0,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,-15,
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+
+/* block 24 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 25 */
+  0,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,
+-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,
+
+/* block 26 */
+-48,-48,-48,-48,-48,-48,-48,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 27 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0, -8, -8, -8, -8, -8, -8,  0,  0,
+
+/* block 28 */
+-6254,-6253,-6244,-6242,-6242,-6243,-6236,-6181,  0,  0, -1,  0,  0,  0,  0,  0,
+-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,
+
+/* block 29 */
+-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,
+-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,-3008,  0,  0,-3008,-3008,-3008,
+
+/* block 30 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+  0, -1,  0, -1,  0, -1,  0,  0,  0,  0,  0,-59,  0,  0,-7615,  0,
+
+/* block 31 */
+  0,  0,  0,  0,  0,  0,  0,  0, -8, -8, -8, -8, -8, -8, -8, -8,
+  0,  0,  0,  0,  0,  0,  0,  0, -8, -8, -8, -8, -8, -8,  0,  0,
+
+/* block 32 */
+  0,  0,  0,  0,  0,  0,  0,  0, -8, -8, -8, -8, -8, -8, -8, -8,
+  0,  0,  0,  0,  0,  0,  0,  0, -8, -8, -8, -8, -8, -8, -8, -8,
+
+/* block 33 */
+  0,  0,  0,  0,  0,  0,  0,  0, -8, -8, -8, -8, -8, -8,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0, -8,  0, -8,  0, -8,  0, -8,
+
+/* block 34 */
+  0,  0,  0,  0,  0,  0,  0,  0, -8, -8, -8, -8, -8, -8, -8, -8,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 35 */
+  0,  0,  0,  0,  0,  0,  0,  0, -8, -8, -8, -8, -8, -8, -8, -8,
+  0,  0,  0,  0,  0,  0,  0,  0, -8, -8,-74,-74, -9,  0,-7289,  0,
+
+/* block 36 */
+  0,  0,  0,  0,  0,  0,  0,  0,-86,-86,-86,-86, -9,  0,  0,  0,
+  0,  0,  0,-7235,  0,  0,  0,  0, -8, -8,-100,-100,  0,  0,  0,  0,
+
+/* block 37 */
+  0,  0,  0,-7219,  0,  0,  0,  0, -8, -8,-112,-112, -7,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,-128,-128,-126,-126, -9,  0,  0,  0,
+
+/* block 38 */
+  0,  0,  0,  0,  0,  0,-7549,  0,  0,  0,-8415,-8294,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 39 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,-28,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 40 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,-16,
+
+/* block 41 */
+  0,  0,  0,  0, -1,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 42 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,
+
+/* block 43 */
+-26,-26,-26,-26,-26,-26,-26,-26,-26,-26,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 44 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,
+
+/* block 45 */
+-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,
+-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,-48,
+
+/* block 46 */
+  0, -1,-10743,-3814,-10727,-10795,-10792,  0, -1,  0, -1,  0, -1,-10780,-10749,-10783,
+-10782,  0,  0, -1,  0,  0, -1,  0,  0,  0,  0,  0,  0,  0,-10815,-10815,
+
+/* block 47 */
+  0, -1,  0, -1,  0,  0,  0,  0,  0,  0,  0,  0, -1,  0, -1,  0,
+  0,  0,  0, -1,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 48 */
+-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,
+-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,-7264,
+
+/* block 49 */
+-7264,-7264,-7264,-7264,-7264,-7264,  0,-7264,  0,  0,  0,  0,  0,-7264,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 50 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,-35266,-35267,  0, -1,  0, -1,
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+
+/* block 51 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 52 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0,  0,  0,  0,
+
+/* block 53 */
+  0,  0,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+  0,  0,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+
+/* block 54 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0, -1,  0, -1,-35332,  0, -1,
+
+/* block 55 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0,  0,  0,  0, -1,-42280,  0,  0,
+  0, -1,  0, -1,  0,  0,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+
+/* block 56 */
+  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,-42308,-42319,-42315,-42305,-42308,  0,
+-42258,-42282,-42261,  0,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,  0, -1,
+
+/* block 57 */
+  0, -1,  0, -1,-48,-42307,-35384,  0, -1,  0, -1,-42343,  0, -1,  0,  0,
+  0, -1,  0,  0,  0,  0,  0, -1,  0, -1,  0, -1,-42561,  0,  0,  0,
+
+/* block 58 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0, -1,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 59 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,-928,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 60 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,
+
+/* block 61 */
+-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,
+-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,-38864,
+
+/* block 62 */
+  0,  0,  0,  0,  0,  0, -1,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 63 */
+  0,  0,  0,  0,  0,  0,  0,  0,-40,-40,-40,-40,-40,-40,-40,-40,
+-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,
+
+/* block 64 */
+-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 65 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,-40,-40,-40,-40,-40,-40,-40,-40,
+
+/* block 66 */
+-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,
+-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,-40,  0,  0,  0,  0,
+
+/* block 67 */
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,-39,-39,-39,-39,-39,-39,-39,-39,-39,
+
+/* block 68 */
+-39,-39,  0,-39,-39,-39,-39,-39,-39,-39,-39,-39,-39,-39,-39,-39,
+-39,-39,  0,-39,-39,-39,-39,-39,-39,-39,  0,-39,-39,  0,  0,  0,
+
+/* block 69 */
+-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,
+-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,
+
+/* block 70 */
+-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,-64,
+-64,-64,-64,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 71 */
+-32,-32,-32,-32,-32,-32,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+
+/* block 72 */
+-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,-32,
+
+/* block 73 */
+  0,  0,-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,
+-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,-34,
+
+/* block 74 */
+-34,-34,-34,-34,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,  0,
+};
+
+#if UCD_FOLD_BLOCK_SIZE != 32 || UCD_FOLD_LIMIT != 0x1ea00
+#error Please correct UCD_FOLD_BLOCK_SIZE or UCD_FOLD_LIMIT in pcre2_internal.h
+#endif
+
+#if UCD_GB_SIMPLE_LIMIT != 0x300
+#error Please correct UCD_GB_SIMPLE_LIMIT in pcre2_internal.h
+#endif
+
+/* This table holds copies of the records for the first 256 characters, so
+that GET_UCD() can find them with one lookup instead of three. These characters
+are by far the most common in most subjects. */
+
+const ucd_record PRIV(ucd_latin1_records)[] = { /* 3072 bytes, record size 12 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0000 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0001 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0002 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0003 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0004 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0005 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0006 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0007 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0008 */
+  {    99,      0,      2,      0,      0,  43008,      4, }, /* U+0009 */
+  {    99,      0,      1,      0,      0,   4096,      4, }, /* U+000A */
+  {    99,      0,      2,      0,      0,  43008,      4, }, /* U+000B */
+  {    99,      0,      2,      0,      0,  45056,      4, }, /* U+000C */
+  {    99,      0,      0,      0,      0,   4096,      4, }, /* U+000D */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+000E */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+000F */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0010 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0011 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0012 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0013 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0014 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0015 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0016 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0017 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0018 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+0019 */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+001A */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+001B */
+  {    99,      0,      2,      0,      0,   4096,      2, }, /* U+001C */
+  {    99,      0,      2,      0,      0,   4096,      2, }, /* U+001D */
+  {    99,      0,      2,      0,      0,   4096,      2, }, /* U+001E */
+  {    99,      0,      2,      0,      0,  43008,      2, }, /* U+001F */
+  {    99,     29,     12,      0,      0,  45056,      6, }, /* U+0020 */
+  {    99,     21,     12,      0,      0,  28672,      8, }, /* U+0021 */
+  {    99,     21,     12,      0,      0,  28672,     10, }, /* U+0022 */
+  {    99,     21,     12,      0,      0,  14336,     12, }, /* U+0023 */
+  {    99,     23,     12,      0,      0,  14336,     14, }, /* U+0024 */
+  {    99,     21,     12,      0,      0,  14336,     14, }, /* U+0025 */
+  {    99,     21,     12,      0,      0,  28672,     14, }, /* U+0026 */
+  {    99,     21,     12,      0,      0,  28672,     16, }, /* U+0027 */
+  {    99,     22,     12,      0,      0,  28672,     18, }, /* U+0028 */
+  {    99,     18,     12,      0,      0,  28672,     18, }, /* U+0029 */
+  {    99,     21,     12,      0,      0,  28672,     12, }, /* U+002A */
+  {    99,     25,     12,      0,      0,  12288,     20, }, /* U+002B */
+  {    99,     21,     12,      0,      0,   8192,     22, }, /* U+002C */
+  {    99,     17,     12,      0,      0,  12288,     24, }, /* U+002D */
+  {    99,     21,     12,      0,      0,   8192,     26, }, /* U+002E */
+  {    99,     21,     12,      0,      0,   8192,     14, }, /* U+002F */
+  {    99,     13,     12,      0,      0,  10240,     28, }, /* U+0030 */
+  {    99,     13,     12,      0,      0,  10240,     28, }, /* U+0031 */
+  {    99,     13,     12,      0,      0,  10240,     28, }, /* U+0032 */
+  {    99,     13,     12,      0,      0,  10240,     28, }, /* U+0033 */
+  {    99,     13,     12,      0,      0,  10240,     28, }, /* U+0034 */
+  {    99,     13,     12,      0,      0,  10240,     28, }, /* U+0035 */
+  {    99,     13,     12,      0,      0,  10240,     28, }, /* U+0036 */
+  {    99,     13,     12,      0,      0,  10240,     28, }, /* U+0037 */
+  {    99,     13,     12,      0,      0,  10240,     28, }, /* U+0038 */
+  {    99,     13,     12,      0,      0,  10240,     28, }, /* U+0039 */
+  {    99,     21,     12,      0,      0,   8192,     30, }, /* U+003A */
+  {    99,     21,     12,      0,      0,  28672,     22, }, /* U+003B */
+  {    99,     25,     12,      0,      0,  28672,     32, }, /* U+003C */
+  {    99,     25,     12,      0,      0,  28672,     20, }, /* U+003D */
+  {    99,     25,     12,      0,      0,  28672,     32, }, /* U+003E */
+  {    99,     21,     12,      0,      0,  28672,      8, }, /* U+003F */
+  {    99,     21,     12,      0,      0,  28672,     14, }, /* U+0040 */
+  {     0,      9,     12,      0,     32,  18432,     34, }, /* U+0041 */
+  {     0,      9,     12,      0,     32,  18432,     34, }, /* U+0042 */
+  {     0,      9,     12,      0,     32,  18432,     34, }, /* U+0043 */
+  {     0,      9,     12,      0,     32,  18432,     34, }, /* U+0044 */
+  {     0,      9,     12,      0,     32,  18432,     34, }, /* U+0045 */
+  {     0,      9,     12,      0,     32,  18432,     34, }, /* U+0046 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0047 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0048 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0049 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+004A */
+  {     0,      9,     12,    100,     32,  18432,     36, }, /* U+004B */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+004C */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+004D */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+004E */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+004F */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0050 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0051 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0052 */
+  {     0,      9,     12,      1,     32,  18432,     36, }, /* U+0053 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0054 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0055 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0056 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0057 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0058 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+0059 */
+  {     0,      9,     12,      0,     32,  18432,     36, }, /* U+005A */
+  {    99,     22,     12,      0,      0,  28672,     18, }, /* U+005B */
+  {    99,     21,     12,      0,      0,  28672,     14, }, /* U+005C */
+  {    99,     18,     12,      0,      0,  28672,     18, }, /* U+005D */
+  {    99,     24,     12,      0,      0,  28672,     38, }, /* U+005E */
+  {    99,     16,     12,      0,      0,  28672,     40, }, /* U+005F */
+  {    99,     24,     12,      0,      0,  28672,     42, }, /* U+0060 */
+  {     0,      5,     12,      0,    -32,  18432,     44, }, /* U+0061 */
+  {     0,      5,     12,      0,    -32,  18432,     44, }, /* U+0062 */
+  {     0,      5,     12,      0,    -32,  18432,     44, }, /* U+0063 */
+  {     0,      5,     12,      0,    -32,  18432,     44, }, /* U+0064 */
+  {     0,      5,     12,      0,    -32,  18432,     44, }, /* U+0065 */
+  {     0,      5,     12,      0,    -32,  18432,     44, }, /* U+0066 */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+0067 */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+0068 */
+  {     0,      5,     12,      0,    -32,  18432,     48, }, /* U+0069 */
+  {     0,      5,     12,      0,    -32,  18432,     48, }, /* U+006A */
+  {     0,      5,     12,    100,    -32,  18432,     46, }, /* U+006B */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+006C */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+006D */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+006E */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+006F */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+0070 */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+0071 */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+0072 */
+  {     0,      5,     12,      1,    -32,  18432,     46, }, /* U+0073 */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+0074 */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+0075 */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+0076 */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+0077 */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+0078 */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+0079 */
+  {     0,      5,     12,      0,    -32,  18432,     46, }, /* U+007A */
+  {    99,     22,     12,      0,      0,  28672,     18, }, /* U+007B */
+  {    99,     25,     12,      0,      0,  28672,     20, }, /* U+007C */
+  {    99,     18,     12,      0,      0,  28672,     18, }, /* U+007D */
+  {    99,     25,     12,      0,      0,  28672,     20, }, /* U+007E */
+  {    99,      0,      2,      0,      0,   6144,      2, }, /* U+007F */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0080 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0081 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0082 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0083 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0084 */
+  {    99,      0,      2,      0,      0,   4096,     50, }, /* U+0085 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0086 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0087 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0088 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0089 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+008A */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+008B */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+008C */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+008D */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+008E */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+008F */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0090 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0091 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0092 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0093 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0094 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0095 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0096 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0097 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0098 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+0099 */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+009A */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+009B */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+009C */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+009D */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+009E */
+  {    99,      0,      2,      0,      0,   6144,      0, }, /* U+009F */
+  {    99,     29,     12,      0,      0,   8192,     52, }, /* U+00A0 */
+  {    99,     21,     12,      0,      0,  28672,     54, }, /* U+00A1 */
+  {    99,     23,     12,      0,      0,  14336,     54, }, /* U+00A2 */
+  {    99,     23,     12,      0,      0,  14336,     54, }, /* U+00A3 */
+  {    99,     23,     12,      0,      0,  14336,     54, }, /* U+00A4 */
+  {    99,     23,     12,      0,      0,  14336,     54, }, /* U+00A5 */
+  {    99,     26,     12,      0,      0,  28672,     54, }, /* U+00A6 */
+  {    99,     21,     12,      0,      0,  28672,     54, }, /* U+00A7 */
+  {    99,     24,     12,      0,      0,  28672,     56, }, /* U+00A8 */
+  {    99,     26,     14,      0,      0,  28672,     58, }, /* U+00A9 */
+  {     0,      7,     12,      0,      0,  18432,     60, }, /* U+00AA */
+  {    99,     20,     12,      0,      0,  28672,     62, }, /* U+00AB */
+  {    99,     25,     12,      0,      0,  28672,     64, }, /* U+00AC */
+  {    99,      1,      2,      0,      0,   6144,     66, }, /* U+00AD */
+  {    99,     26,     14,      0,      0,  28672,     58, }, /* U+00AE */
+  {    99,     24,     12,      0,      0,  28672,     56, }, /* U+00AF */
+  {    99,     26,     12,      0,      0,  14336,     54, }, /* U+00B0 */
+  {    99,     25,     12,      0,      0,  14336,     64, }, /* U+00B1 */
+  {    99,     15,     12,      0,      0,  10240,     68, }, /* U+00B2 */
+  {    99,     15,     12,      0,      0,  10240,     68, }, /* U+00B3 */
+  {    99,     24,     12,      0,      0,  28672,     56, }, /* U+00B4 */
+  {    99,      5,     12,     26,    775,  18432,     70, }, /* U+00B5 */
+  {    99,     21,     12,      0,      0,  28672,     54, }, /* U+00B6 */
+  {    99,     21,     12,      0,      0,  28676,     72, }, /* U+00B7 */
+  {    99,     24,     12,      0,      0,  28672,     56, }, /* U+00B8 */
+  {    99,     15,     12,      0,      0,  10240,     68, }, /* U+00B9 */
+  {     0,      7,     12,      0,      0,  18432,     60, }, /* U+00BA */
+  {    99,     19,     12,      0,      0,  28672,     62, }, /* U+00BB */
+  {    99,     15,     12,      0,      0,  28672,     74, }, /* U+00BC */
+  {    99,     15,     12,      0,      0,  28672,     74, }, /* U+00BD */
+  {    99,     15,     12,      0,      0,  28672,     74, }, /* U+00BE */
+  {    99,     21,     12,      0,      0,  28672,     54, }, /* U+00BF */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00C0 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00C1 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00C2 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00C3 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00C4 */
+  {     0,      9,     12,    104,     32,  18432,     76, }, /* U+00C5 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00C6 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00C7 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00C8 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00C9 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00CA */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00CB */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00CC */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00CD */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00CE */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00CF */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00D0 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00D1 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00D2 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00D3 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00D4 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00D5 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00D6 */
+  {    99,     25,     12,      0,      0,  28672,     64, }, /* U+00D7 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00D8 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00D9 */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00DA */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00DB */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00DC */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00DD */
+  {     0,      9,     12,      0,     32,  18432,     76, }, /* U+00DE */
+  {     0,      5,     12,      0,   7615,  18432,     70, }, /* U+00DF */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00E0 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00E1 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00E2 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00E3 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00E4 */
+  {     0,      5,     12,    104,    -32,  18432,     78, }, /* U+00E5 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00E6 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00E7 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00E8 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00E9 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00EA */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00EB */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00EC */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00ED */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00EE */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00EF */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00F0 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00F1 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00F2 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00F3 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00F4 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00F5 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00F6 */
+  {    99,     25,     12,      0,      0,  28672,     64, }, /* U+00F7 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00F8 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00F9 */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00FA */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00FB */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00FC */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00FD */
+  {     0,      5,     12,      0,    -32,  18432,     78, }, /* U+00FE */
+  {     0,      5,     12,      0,    121,  18432,     78, }, /* U+00FF */
+};
+
 #if UCD_BLOCK_SIZE != 128
 #error Please correct UCD_BLOCK_SIZE in pcre2_internal.h
 #endif
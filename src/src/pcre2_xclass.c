@@ -57,10 +57,15 @@ pcre2_match() and pcre2_dfa_match(). */
 /* This function is called to match a character against an extended class that
 might contain codepoints above 255 and/or Unicode properties.
 
+When the class has a map for characters below 0x10000 (see XCL_BMPMAP in
+pcre2_internal.h), such characters are looked up in the map, which holds the
+complete result for them, including any negation.
+
 Arguments:
-  c           the character
-  data        points to the flag code unit of the XCLASS data
-  utf         TRUE if in UTF mode
+  c              the character
+  data           points to the flag code unit of the XCLASS data
+  char_lists_end points after the character lists and maps
+  utf            TRUE if in UTF mode
 
 Returns:      TRUE if character matches, else FALSE
 */
@@ -73,12 +78,16 @@ PCRE2_UCHAR t;
 BOOL not_negated = (*data & XCL_NOT) == 0;
 uint32_t type, max_index, min_index, value;
 const uint8_t *next_char;
+const uint8_t *bmpmap = NULL;
 
 #if PCRE2_CODE_UNIT_WIDTH == 8
 /* In 8 bit mode, this must always be TRUE. Help the compiler to know that. */
 utf = TRUE;
 #endif
 
+if ((*data & XCL_BMPMAP) != 0)
+  bmpmap = char_lists_end - XCL_BMPMAP_OFFSET(data);
+
 /* Code points < 256 are matched against a bitmap, if one is present. */
 
 if ((*data++ & XCL_MAP) != 0)
@@ -89,6 +98,16 @@ if ((*data++ & XCL_MAP) != 0)
   data += 32 / sizeof(PCRE2_UCHAR);
   }
 
+/* Other code points < 0x10000 are matched against the map, if there is one.
+Its first 256 bytes select a block of 256 bits for each group of 256 code
+points. */
+
+if (bmpmap != NULL && c < XCL_BMPMAP_LIMIT)
+  {
+  bmpmap += 256 + 32 * bmpmap[c >> 8];
+  return (bmpmap[(c & 0xff) >> 3] & (1u << (c & 7))) != 0;
+  }
+
 /* Match against the list of Unicode properties. We won't ever
 encounter XCL_PROP or XCL_NOTPROP when UTF support is not compiled. */
 #ifdef SUPPORT_UNICODE
@@ -307,6 +326,11 @@ if (*data < XCL_LIST)
   return !not_negated;   /* char did not match */
   }
 
+/* The character lists start at XCL_CHAR_LIST_LOW_16_START, and a list that
+begins with a range begins there, so smaller characters are never in them. */
+
+if (c < XCL_CHAR_LIST_LOW_16_START) return !not_negated;
+
 #if PCRE2_CODE_UNIT_WIDTH == 8
 type = (uint32_t)(data[0] << 8) | data[1];
 data += 2;
@@ -0,0 +1,1773 @@
+/*************************************************
+*             pcre2analyze program               *
+*************************************************/
+
+/* This program looks for patterns that can backtrack catastrophically. Each
+pattern is compiled by the 8-bit library with automatic callouts, and the
+compiled code is scanned for nested quantifiers, repeated alternatives that can
+match the same text, and adjacent quantifiers that compete for the same
+characters. Because the scan is done after auto-possessification, quantifiers
+that the library has already made possessive are not reported. The automatic
+callouts record where each item is in the pattern, so that findings can be
+shown as pattern text and rewrites suggested. The program also has a fuzz mode
+that searches for subjects that make a pattern slow, counting the callouts
+during matching as a measure of the work done.
+
+Like pcre2test, this program uses "inside information" about the compiled code,
+so it must be built from the same sources as the library it is linked with.
+
+           Copyright (c) 2024 University of Cambridge
+
+-----------------------------------------------------------------------------
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+    * Redistributions of source code must retain the above copyright notice,
+      this list of conditions and the following disclaimer.
+
+    * Redistributions in binary form must reproduce the above copyright
+      notice, this list of conditions and the following disclaimer in the
+      documentation and/or other materials provided with the distribution.
+
+    * Neither the name of the University of Cambridge nor the names of its
+      contributors may be used to endorse or promote products derived from
+      this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+-----------------------------------------------------------------------------
+*/
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <errno.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+/* The internal headers and tables are included in the same way as in
+pcre2test, which has a full explanation. Only the 8-bit library is used. */
+
+#define PRIV(name) name
+#define PCRE2_CODE_UNIT_WIDTH 0
+#define PCRE2_BUILDING_PCRE2TEST
+#include "pcre2.h"
+#include "pcre2_internal.h"
+
+#define PCRE2_PCRE2TEST
+#include "pcre2_tables.c"
+#include "pcre2_ucd.c"
+
+#define glue(a,b) a##b
+#define G(a,b) glue(a,b)
+
+/* The compiled code printer needs to know which characters are printable. */
+
+#ifdef EBCDIC
+#define PRINTABLE(c) ((c) >= 64 && (c) < 255)
+#else
+#define PRINTABLE(c) ((c) >= 32 && (c) < 127)
+#endif
+
+#undef PCRE2_SUFFIX
+#undef PCRE2_CODE_UNIT_WIDTH
+
+#define  PCRE2_CODE_UNIT_WIDTH 8
+#define  PCRE2_SUFFIX(a) G(a,8)
+#include "pcre2_intmodedep.h"
+#include "pcre2_printint.c"
+#undef   PCRE2_CODE_UNIT_WIDTH
+#undef   PCRE2_SUFFIX
+
+#define PCRE2_SUFFIX(a) a
+
+#define MAX_PATTERN_LINE 65536
+#define MAX_SEQUENCE     16         /* Longest alternative compared */
+#define MAX_ALTERNATIVES 256        /* Alternatives compared in one group */
+#define MAX_ALPHABET     32         /* Characters used for fuzzing */
+#define MAX_VARIABLE     8          /* Backtracking points kept per group */
+#define MAX_FOLLOW_ITEMS 1000       /* Items scanned to find what follows */
+#define UNLIMITED        UINT32_MAX
+
+#define DEFAULT_FUZZ_ITERATIONS 2000
+#define DEFAULT_FUZZ_LENGTH     24
+#define DEFAULT_FUZZ_STEPS      1000000
+
+/* A set of characters less than 256. If the set could not be worked out (for
+example, for a Unicode property) known is FALSE, and the set is never taken to
+overlap another. */
+
+typedef struct charset {
+  uint8_t bits[32];
+  BOOL known;
+} charset;
+
+/* A quantifier, as found in the compiled code */
+
+typedef struct repeat {
+  uint32_t min;
+  uint32_t max;               /* UNLIMITED if there is no maximum */
+  BOOL possessive;
+} repeat;
+
+/* What is known about one alternative of a group. A short alternative that
+consists only of single characters is kept as a sequence of sets so that it
+can be compared with the other alternatives. */
+
+typedef struct branch_info {
+  charset first;              /* Characters that can start the alternative */
+  BOOL can_be_empty;
+  BOOL fixed;                 /* Only single characters, in seq */
+  int seqlen;
+  uint8_t seq[MAX_SEQUENCE][32];
+} branch_info;
+
+/* A point where backtracking can happen: a quantifier that is not
+possessive, or a group that repeats or has ambiguous alternatives. */
+
+typedef struct var_item {
+  size_t start;               /* Its text in the pattern */
+  size_t length;
+  charset set;                /* The characters it can match */
+  const uint8_t *next;        /* The compiled code that follows it */
+  BOOL single;                /* TRUE for a repeated single item, not a group */
+} var_item;
+
+/* What is known about a group, or the whole pattern. The backtracking points
+inside it are listed, apart from those inside atomic groups and assertions. */
+
+typedef struct group_info {
+  charset first;
+  BOOL can_be_empty;
+  int nvar;
+  var_item var[MAX_VARIABLE];
+} group_info;
+
+/* The state of the scan of one compiled pattern */
+
+typedef struct scan_state {
+  const uint8_t *pattern;     /* The pattern text */
+  size_t patlen;
+  BOOL utf;
+  BOOL report;                /* FALSE when only counting quantifiers */
+  const uint8_t *cbits;       /* Class bitmaps from the character tables */
+  const uint8_t *fcc;         /* Case flipping table */
+  size_t cpos;                /* Position and length of the pattern item */
+  size_t clen;                /*   from the latest automatic callout */
+  unsigned int variable;      /* Quantifiers with a variable repeat count */
+  unsigned int possessive;    /* The number of those that are possessive */
+  unsigned int warnings;
+  BOOL exponential;
+  int chain;                  /* Longest chain of competing quantifiers */
+  charset alphabet;           /* Characters for the fuzz mode */
+  charset everything;         /* All the characters the pattern uses */
+} scan_state;
+
+/* Options */
+
+static const char *pattern_file;
+static BOOL show_code = FALSE;
+static BOOL quiet = FALSE;
+static BOOL fuzz = FALSE;
+static unsigned long fuzz_iterations = DEFAULT_FUZZ_ITERATIONS;
+static unsigned long fuzz_length = DEFAULT_FUZZ_LENGTH;
+static unsigned long fuzz_steps = DEFAULT_FUZZ_STEPS;
+static uint32_t fuzz_seed = 1;
+
+/* Callout counting for the fuzz mode */
+
+static unsigned long callout_count;
+
+static const uint8_t *scan_group(const uint8_t *, scan_state *, group_info *,
+  size_t);
+static BOOL follow_set(const uint8_t *, const uint8_t *, scan_state *,
+  charset *, int *);
+
+
+
+/*************************************************
+*                Usage message                   *
+*************************************************/
+
+static void
+usage(void)
+{
+fprintf(stderr,
+  "Usage: pcre2analyze [options] <pattern file>\n"
+  "       pcre2analyze [options] -e <pattern>\n"
+  "Each line of the pattern file, other than empty lines and lines that\n"
+  "start with #, is a pattern. Write \\# for a pattern that starts with #.\n"
+  "Options:\n"
+  "  -b        show the compiled code of each pattern\n"
+  "  -e <pat>  analyze one pattern given on the command line\n"
+  "  -f        fuzz mode: search for subjects that take a long time\n"
+  "  -i        compile caseless (PCRE2_CASELESS)\n"
+  "  -l <n>    longest subject in fuzz mode (default %d)\n"
+  "  -m        compile multiline (PCRE2_MULTILINE)\n"
+  "  -n <n>    number of subjects tried in fuzz mode (default %d)\n"
+  "  -q        show only patterns with findings\n"
+  "  -r <n>    random seed for fuzz mode (default 1)\n"
+  "  -s        dot matches newline (PCRE2_DOTALL)\n"
+  "  -S <n>    matching steps at which fuzz mode stops (default %d)\n"
+  "  -u        compile in UTF mode (PCRE2_UTF)\n"
+  "  -U        compile in UTF and UCP mode (PCRE2_UTF|PCRE2_UCP)\n"
+  "  -x        extended syntax (PCRE2_EXTENDED)\n"
+  "The exit status is 0 if nothing was found, 1 if any pattern may backtrack\n"
+  "badly, and 2 for errors.\n",
+  DEFAULT_FUZZ_LENGTH, DEFAULT_FUZZ_ITERATIONS, DEFAULT_FUZZ_STEPS);
+}
+
+
+
+/*************************************************
+*            Character set functions             *
+*************************************************/
+
+static void
+set_clear(charset *cs)
+{
+memset(cs->bits, 0, sizeof(cs->bits));
+cs->known = TRUE;
+}
+
+static void
+set_add(charset *cs, uint32_t c)
+{
+if (c < 256) cs->bits[c/8] |= (uint8_t)(1u << (c%8));
+}
+
+static BOOL
+set_has(const charset *cs, uint32_t c)
+{
+return c < 256 && (cs->bits[c/8] & (1u << (c%8))) != 0;
+}
+
+static void
+set_invert(charset *cs)
+{
+int i;
+for (i = 0; i < 32; i++) cs->bits[i] ^= 0xff;
+}
+
+static void
+set_union(charset *a, const charset *b)
+{
+int i;
+if (!b->known) a->known = FALSE;
+for (i = 0; i < 32; i++) a->bits[i] |= b->bits[i];
+}
+
+static BOOL
+bits_overlap(const uint8_t *a, const uint8_t *b)
+{
+int i;
+for (i = 0; i < 32; i++) if ((a[i] & b[i]) != 0) return TRUE;
+return FALSE;
+}
+
+static BOOL
+set_overlap(const charset *a, const charset *b)
+{
+return a->known && b->known && bits_overlap(a->bits, b->bits);
+}
+
+
+
+/*************************************************
+*       Work out the set for a matching item     *
+*************************************************/
+
+/* This handles a single character, possibly caseless or negated. Characters
+above 255 are not tracked.
+
+Arguments:
+  st          the scan state
+  c           the character
+  caseless    TRUE for a caseless match
+  negated     TRUE for a negated character
+  cs          where to put the set
+
+Returns:      nothing
+*/
+
+static void
+char_set(scan_state *st, uint32_t c, BOOL caseless, BOOL negated, charset *cs)
+{
+set_clear(cs);
+if (c > 255)
+  {
+  if (negated) set_invert(cs); else cs->known = FALSE;
+  return;
+  }
+set_add(cs, c);
+if (caseless) set_add(cs, st->fcc[c]);
+if (negated) set_invert(cs);
+}
+
+
+/* This handles the character types such as \d and dot.
+
+Arguments:
+  st          the scan state
+  type        the opcode for the type
+  cs          where to put the set
+
+Returns:      nothing
+*/
+
+static void
+type_set(scan_state *st, uint32_t type, charset *cs)
+{
+int i;
+const uint8_t *map = NULL;
+BOOL negated = FALSE;
+
+set_clear(cs);
+switch(type)
+  {
+  case OP_NOT_DIGIT: negated = TRUE; /* Fall through */
+  case OP_DIGIT: map = st->cbits + cbit_digit; break;
+
+  case OP_NOT_WHITESPACE: negated = TRUE; /* Fall through */
+  case OP_WHITESPACE: map = st->cbits + cbit_space; break;
+
+  case OP_NOT_WORDCHAR: negated = TRUE; /* Fall through */
+  case OP_WORDCHAR: map = st->cbits + cbit_word; break;
+
+  case OP_ANY:
+  set_invert(cs);
+  cs->bits['\n'/8] &= (uint8_t)~(1u << ('\n'%8));
+  return;
+
+  case OP_ALLANY:
+  case OP_ANYBYTE:
+  set_invert(cs);
+  return;
+
+  case OP_NOT_HSPACE: negated = TRUE; /* Fall through */
+  case OP_HSPACE:
+  set_add(cs, '\t');
+  set_add(cs, ' ');
+  set_add(cs, 0xa0);
+  break;
+
+  case OP_NOT_VSPACE: negated = TRUE; /* Fall through */
+  case OP_VSPACE:
+  case OP_ANYNL:
+  for (i = '\n'; i <= '\r'; i++) set_add(cs, i);
+  set_add(cs, 0x85);
+  break;
+
+  default:                /* Properties and \X */
+  cs->known = FALSE;
+  return;
+  }
+
+if (map != NULL) memcpy(cs->bits, map, 32);
+if (negated) set_invert(cs);
+}
+
+
+
+/*************************************************
+*       Get a character from compiled code       *
+*************************************************/
+
+static uint32_t
+get_char(scan_state *st, const uint8_t *p)
+{
+uint32_t c = *p;
+#ifdef SUPPORT_UNICODE
+if (st->utf) { GETCHAR(c, p); }
+#else
+(void)st;
+#endif
+return c;
+}
+
+
+
+/*************************************************
+*         Skip an item in compiled code          *
+*************************************************/
+
+/* This is the same as the scan in pcre2_find_bracket.c, for one item that is
+not a bracket.
+
+Arguments:
+  code        points to the item
+  utf         TRUE in UTF mode
+
+Returns:      pointer to the next item
+*/
+
+static const uint8_t *
+skip_item(const uint8_t *code, BOOL utf)
+{
+uint8_t c = *code;
+
+if (c == OP_XCLASS || c == OP_ECLASS) return code + GET(code, 1);
+if (c == OP_CALLOUT_STR) return code + GET(code, 1 + 2*LINK_SIZE);
+
+switch(c)
+  {
+  case OP_TYPESTAR:
+  case OP_TYPEMINSTAR:
+  case OP_TYPEPLUS:
+  case OP_TYPEMINPLUS:
+  case OP_TYPEQUERY:
+  case OP_TYPEMINQUERY:
+  case OP_TYPEPOSSTAR:
+  case OP_TYPEPOSPLUS:
+  case OP_TYPEPOSQUERY:
+  if (code[1] == OP_PROP || code[1] == OP_NOTPROP) code += 2;
+  break;
+
+  case OP_TYPEUPTO:
+  case OP_TYPEMINUPTO:
+  case OP_TYPEEXACT:
+  case OP_TYPEPOSUPTO:
+  if (code[1 + IMM2_SIZE] == OP_PROP || code[1 + IMM2_SIZE] == OP_NOTPROP)
+    code += 2;
+  break;
+
+  case OP_MARK:
+  case OP_COMMIT_ARG:
+  case OP_PRUNE_ARG:
+  case OP_SKIP_ARG:
+  case OP_THEN_ARG:
+  code += code[1];
+  break;
+  }
+
+code += OP_lengths_8[c];
+
+/* Opcodes that are followed by a character may be followed by a multi-byte
+character in UTF mode. These are all the single character and character repeat
+opcodes. */
+
+#ifdef SUPPORT_UNICODE
+if (utf && c >= OP_CHAR && c <= OP_NOTPOSUPTOI && HAS_EXTRALEN(code[-1]))
+  code += GET_EXTRALEN(code[-1]);
+#else
+(void)utf;
+#endif
+
+return code;
+}
+
+
+
+/*************************************************
+*           Skip a bracketed group               *
+*************************************************/
+
+static const uint8_t *
+skip_group(const uint8_t *code)
+{
+do code += GET(code, 1); while (*code == OP_ALT);
+return code + OP_lengths_8[*code];
+}
+
+
+
+/*************************************************
+*            Decode a repeat opcode              *
+*************************************************/
+
+/* The single character and character type repeats come in groups of 13 with
+the same layout: STAR, MINSTAR, PLUS, MINPLUS, QUERY, MINQUERY, UPTO, MINUPTO,
+EXACT, POSSTAR, POSPLUS, POSQUERY, POSUPTO.
+
+Arguments:
+  kind        the position of the opcode in its group
+  code        the opcode, which is followed by a count for UPTO and EXACT
+  rep         where to put the repeat
+
+Returns:      the number of code units used by the count
+*/
+
+static int
+decode_repeat(int kind, const uint8_t *code, repeat *rep)
+{
+static const uint8_t min[] = { 0, 0, 1, 1, 0, 0, 0, 0, 0, 0, 1, 0, 0 };
+static const uint8_t max[] = { 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 1, 0 };
+
+rep->min = min[kind];
+rep->max = (max[kind] == 0)? UNLIMITED : max[kind];
+rep->possessive = kind >= 9;
+
+switch(kind)
+  {
+  case 6: case 7: case 12:
+  rep->max = GET2(code, 1);
+  return IMM2_SIZE;
+
+  case 8:
+  rep->min = rep->max = GET2(code, 1);
+  return IMM2_SIZE;
+  }
+return 0;
+}
+
+
+/* The repeats that follow classes and back references are different. There
+may be no repeat at all.
+
+Arguments:
+  code        the code after the class or back reference
+  rep         where to put the repeat
+
+Returns:      the code after the repeat
+*/
+
+static const uint8_t *
+decode_class_repeat(const uint8_t *code, repeat *rep)
+{
+uint8_t op = *code;
+
+rep->min = rep->max = 1;
+rep->possessive = FALSE;
+if (op < OP_CRSTAR || op > OP_CRPOSRANGE) return code;
+
+switch(op)
+  {
+  case OP_CRSTAR: case OP_CRMINSTAR: case OP_CRPOSSTAR:
+  rep->min = 0;
+  rep->max = UNLIMITED;
+  break;
+
+  case OP_CRPLUS: case OP_CRMINPLUS: case OP_CRPOSPLUS:
+  rep->max = UNLIMITED;
+  break;
+
+  case OP_CRQUERY: case OP_CRMINQUERY: case OP_CRPOSQUERY:
+  rep->min = 0;
+  break;
+
+  default:                /* The RANGE opcodes */
+  rep->min = GET2(code, 1);
+  rep->max = GET2(code, 1 + IMM2_SIZE);
+  if (rep->max == 0) rep->max = UNLIMITED;
+  break;
+  }
+
+rep->possessive = op >= OP_CRPOSSTAR;
+return code + OP_lengths_8[op];
+}
+
+
+
+/*************************************************
+*      Print part of the pattern, quoted         *
+*************************************************/
+
+static void
+print_text(const uint8_t *s, size_t length)
+{
+size_t i;
+putchar('"');
+for (i = 0; i < length; i++)
+  {
+  if (s[i] == '"' || s[i] == '\\' || s[i] < 0x20 || s[i] == 0x7f)
+    {
+    if (s[i] == '"' || s[i] == '\\') printf("\\%c", s[i]);
+      else printf("\\x%02x", s[i]);
+    }
+  else putchar(s[i]);
+  }
+putchar('"');
+}
+
+
+/* Print the pattern with some text inserted at two positions. This is how
+rewrites are suggested.
+
+Arguments:
+  st          the scan state
+  at1         where to insert text1
+  text1       the first insertion, or NULL
+  at2         where to insert text2 (not before at1)
+  text2       the second insertion
+
+Returns:      nothing
+*/
+
+static void
+print_rewrite(scan_state *st, size_t at1, const char *text1, size_t at2,
+  const char *text2)
+{
+size_t i;
+printf("    try: ");
+for (i = 0; i <= st->patlen; i++)
+  {
+  if (i == at1 && text1 != NULL) printf("%s", text1);
+  if (i == at2) printf("%s", text2);
+  if (i < st->patlen) putchar(st->pattern[i]);
+  }
+printf("\n");
+}
+
+
+/* Check whether the text of a pattern item ends with a greedy quantifier, to
+which a + can be added to make it possessive. */
+
+static BOOL
+greedy_text(scan_state *st, size_t start, size_t length)
+{
+const uint8_t *s = st->pattern + start;
+uint8_t last, prev;
+
+if (length < 2 || start + length > st->patlen) return FALSE;
+last = s[length-1];
+prev = s[length-2];
+if (last != '*' && last != '+' && last != '?' && last != '}') return FALSE;
+if ((last == '?' || last == '+') &&
+    (prev == '*' || prev == '+' || prev == '?' || prev == '}'))
+  return FALSE;        /* Lazy or already possessive */
+return TRUE;
+}
+
+
+
+/*************************************************
+*        Add a backtracking point to a group     *
+*************************************************/
+
+static void
+add_variable(group_info *gi, size_t start, size_t length, const charset *set,
+  const uint8_t *next, BOOL single)
+{
+if (gi->nvar >= MAX_VARIABLE) return;
+gi->var[gi->nvar].start = start;
+gi->var[gi->nvar].length = length;
+gi->var[gi->nvar].set = *set;
+gi->var[gi->nvar].next = next;
+gi->var[gi->nvar].single = single;
+gi->nvar++;
+}
+
+
+
+/*************************************************
+*    Check two alternatives for ambiguity        *
+*************************************************/
+
+/* Two alternatives of a repeated group make it ambiguous if they can match
+the same text, or if the shorter can match the start of the longer and the
+rest of the longer can be matched by another repeat of the group.
+
+Arguments:
+  a, b        the alternatives
+  first       what the group can start with
+
+Returns:      TRUE if ambiguous
+*/
+
+static BOOL
+ambiguous_pair(const branch_info *a, const branch_info *b,
+  const charset *first)
+{
+const branch_info *longer = (a->seqlen >= b->seqlen)? a : b;
+int m = (a->seqlen < b->seqlen)? a->seqlen : b->seqlen;
+int i;
+
+for (i = 0; i < m; i++)
+  if (!bits_overlap(a->seq[i], b->seq[i])) return FALSE;
+if (a->seqlen == b->seqlen) return TRUE;
+return first->known && bits_overlap(longer->seq[m], first->bits);
+}
+
+
+
+/*************************************************
+*        Note a character set for fuzzing        *
+*************************************************/
+
+/* Small sets are added to the fuzzing alphabet in full. For larger ones, a
+typical member is chosen. */
+
+static void
+note_set(scan_state *st, const charset *cs)
+{
+static const char *preferred = "a0 _A.-/:@";
+const char *p;
+int i, n = 0;
+
+if (!cs->known) return;
+set_union(&st->everything, cs);
+for (i = 0; i < 256; i++) if (set_has(cs, i)) n++;
+if (n == 0) return;
+if (n <= 4)
+  {
+  set_union(&st->alphabet, cs);
+  return;
+  }
+for (p = preferred; *p != 0; p++)
+  if (set_has(cs, (uint8_t)*p)) { set_add(&st->alphabet, (uint8_t)*p); return; }
+for (i = 0x20; i < 256; i++)
+  if (set_has(cs, i)) { set_add(&st->alphabet, i); return; }
+}
+
+
+
+/*************************************************
+*      Find the characters an item matches       *
+*************************************************/
+
+/* This handles the items that match characters: single characters, character
+types, classes, back references, and recursions, with their quantifiers.
+
+Arguments:
+  code        points to the item
+  st          the scan state
+  cs          where to put the set of characters
+  rep         where to put the quantifier
+
+Returns:      pointer to the next item, or NULL if the item is not one of
+                those
+*/
+
+static const uint8_t *
+item_set(const uint8_t *code, scan_state *st, charset *cs, repeat *rep)
+{
+uint8_t op = *code;
+
+rep->min = rep->max = 1;
+rep->possessive = FALSE;
+
+/* Single characters */
+
+if (op >= OP_CHAR && op <= OP_NOTI)
+  {
+  char_set(st, get_char(st, code + 1), op == OP_CHARI || op == OP_NOTI,
+    op >= OP_NOT, cs);
+  return skip_item(code, st->utf);
+  }
+
+/* Repeated characters */
+
+if (op >= OP_STAR && op <= OP_NOTPOSUPTOI)
+  {
+  int kind = (op - OP_STAR) % 13;
+  int type = (op - OP_STAR) / 13;   /* CHAR, CHARI, NOT, NOTI */
+  int extra = decode_repeat(kind, code, rep);
+  char_set(st, get_char(st, code + 1 + extra), (type & 1) != 0, type >= 2,
+    cs);
+  return skip_item(code, st->utf);
+  }
+
+/* Repeated character types */
+
+if (op >= OP_TYPESTAR && op <= OP_TYPEPOSUPTO)
+  {
+  int extra = decode_repeat(op - OP_TYPESTAR, code, rep);
+  type_set(st, code[1 + extra], cs);
+  return skip_item(code, st->utf);
+  }
+
+/* Single character types */
+
+if (op >= OP_NOT_DIGIT && op <= OP_EXTUNI)
+  {
+  type_set(st, op, cs);
+  return skip_item(code, st->utf);
+  }
+
+/* Classes and back references, which may be followed by a repeat */
+
+if (op == OP_CLASS || op == OP_NCLASS || op == OP_XCLASS ||
+    op == OP_ECLASS || (op >= OP_REF && op <= OP_DNREFI))
+  {
+  set_clear(cs);
+  if (op == OP_CLASS || op == OP_NCLASS) memcpy(cs->bits, code + 1, 32);
+#ifdef SUPPORT_WIDE_CHARS
+  else if (op == OP_XCLASS && (code[1 + LINK_SIZE] & XCL_MAP) != 0)
+    {
+    memcpy(cs->bits, code + 2 + LINK_SIZE, 32);
+    if ((code[1 + LINK_SIZE] & XCL_NOT) != 0) set_invert(cs);
+    }
+#endif
+  else cs->known = FALSE;
+  return decode_class_repeat(skip_item(code, st->utf), rep);
+  }
+
+/* Recursions match unknown text. */
+
+if (op == OP_RECURSE)
+  {
+  set_clear(cs);
+  cs->known = FALSE;
+  return skip_item(code, st->utf);
+  }
+
+return NULL;
+}
+
+
+
+/*************************************************
+*          Find what can follow an item          *
+*************************************************/
+
+/* The compiled code is followed from some point, collecting the characters
+with which the rest of the match can start. Each alternative of a group is
+followed into what comes after the group, and at the end of a repeated group
+the group may start again. The scan along one path stops at an item that must
+match at least one character, or at the end of the pattern.
+
+Arguments:
+  code        where to start
+  stop        a closing bracket at which to stop, or NULL
+  st          the scan state
+  cs          the set to which the characters are added
+  budget      counts down the items that may still be scanned
+
+Returns:      FALSE if the set could not be worked out
+*/
+
+static BOOL
+follow_alternatives(const uint8_t *code, const uint8_t *stop, scan_state *st,
+  charset *cs, int *budget)
+{
+do
+  {
+  if (!follow_set(code + OP_lengths_8[*code], stop, st, cs, budget))
+    return FALSE;
+  code += GET(code, 1);
+  }
+while (*code == OP_ALT);
+return TRUE;
+}
+
+static BOOL
+follow_set(const uint8_t *code, const uint8_t *stop, scan_state *st,
+  charset *cs, int *budget)
+{
+for (;;)
+  {
+  uint8_t op = *code;
+  const uint8_t *next;
+  charset item;
+  repeat rep;
+
+  if (code == stop || op == OP_END) return TRUE;
+  if (--*budget < 0) return FALSE;
+
+  next = item_set(code, st, &item, &rep);
+  if (next != NULL)
+    {
+    if (!item.known) return FALSE;
+    set_union(cs, &item);
+    if (rep.min > 0) return TRUE;
+    code = next;
+    }
+
+  /* The end of an alternative skips the rest of the group. At the end of a
+  repeated group, the group may start again. */
+
+  else if (op == OP_ALT)
+    {
+    do code += GET(code, 1); while (*code == OP_ALT);
+    }
+
+  else if (op >= OP_KET && op <= OP_KETRPOS)
+    {
+    if (op != OP_KET &&
+        !follow_alternatives(code - GET(code, 1), code, st, cs, budget))
+      return FALSE;
+    code += OP_lengths_8[op];
+    }
+
+  /* Assertions match no characters, and a conditional group is not worth
+  working out. */
+
+  else if (op >= OP_ASSERT && op < OP_ONCE) code = skip_group(code);
+  else if (op == OP_COND || op == OP_SCOND) return FALSE;
+
+  /* Other groups, which may be optional */
+
+  else if (op >= OP_ONCE && op <= OP_SCBRAPOS)
+    return follow_alternatives(code, stop, st, cs, budget);
+
+  else if (op >= OP_BRAZERO && op <= OP_BRAPOSZERO)
+    {
+    if (!follow_alternatives(code + 1, stop, st, cs, budget)) return FALSE;
+    code = skip_group(code + 1);
+    }
+
+  else if (op == OP_SKIPZERO) code = skip_group(code + 1);
+
+  /* Anything else matches no characters. */
+
+  else code = skip_item(code, st->utf);
+  }
+}
+
+
+/* A quantifier can be made possessive without changing what the pattern
+matches only if nothing that can follow it starts with a character that it can
+match. Otherwise it might take characters that the rest of the match needs.
+Characters above 255 are not tracked, so this is not tried in UTF mode. */
+
+static BOOL
+can_be_possessive(scan_state *st, const var_item *item)
+{
+charset follow;
+int budget = MAX_FOLLOW_ITEMS;
+
+if (st->utf || !item->single || !item->set.known) return FALSE;
+set_clear(&follow);
+return follow_set(item->next, NULL, st, &follow, &budget) &&
+  !bits_overlap(item->set.bits, follow.bits);
+}
+
+
+
+/*************************************************
+*            Scan one alternative                *
+*************************************************/
+
+/* The items from code up to end are scanned. Characters and quantifiers are
+handled here; groups are handled by scan_group().
+
+Arguments:
+  code        the start of the alternative
+  end         the ALT or KET that ends it
+  st          the scan state
+  bi          where to return information about the alternative
+  gi          information about the enclosing group, updated
+
+Returns:      nothing
+*/
+
+static void
+scan_branch(const uint8_t *code, const uint8_t *end, scan_state *st,
+  branch_info *bi, group_info *gi)
+{
+charset prev;                 /* Set of the quantifier that started a chain */
+size_t prev_pos = 0, prev_len = 0;
+int chain = 0;
+BOOL open = FALSE;
+
+set_clear(&bi->first);
+set_clear(&prev);
+bi->can_be_empty = TRUE;
+bi->fixed = TRUE;
+bi->seqlen = 0;
+
+while (code < end)
+  {
+  uint8_t op = *code;
+  size_t ipos = st->cpos;
+  size_t ilen = st->clen;
+  const uint8_t *next;
+  charset cs;
+  repeat rep;
+  BOOL variable;
+
+  /* Automatic callouts tell us where the next item is in the pattern. */
+
+  if (op == OP_CALLOUT)
+    {
+    if (code[1 + 2*LINK_SIZE] == 255)
+      {
+      st->cpos = GET(code, 1);
+      st->clen = GET(code, 1 + LINK_SIZE);
+      }
+    code += OP_lengths_8[op];
+    continue;
+    }
+
+  /* Items that match characters */
+
+  next = item_set(code, st, &cs, &rep);
+  if (next != NULL) code = next;
+
+  /* A group that is skipped by {0} */
+
+  else if (op == OP_SKIPZERO)
+    {
+    code = skip_group(code + 1);
+    continue;
+    }
+
+  /* Groups, which may be optional */
+
+  else if ((op >= OP_ASSERT && op <= OP_SCOND) ||
+           (op >= OP_BRAZERO && op <= OP_BRAPOSZERO))
+    {
+    group_info sub;
+    BOOL zero = op >= OP_BRAZERO;
+    int i;
+
+    if (zero) code++;
+    code = scan_group(code, st, &sub, ipos);
+    if (zero) sub.can_be_empty = TRUE;
+
+    for (i = 0; i < sub.nvar; i++)
+      add_variable(gi, sub.var[i].start, sub.var[i].length, &sub.var[i].set,
+        sub.var[i].next, sub.var[i].single);
+    if (bi->can_be_empty)
+      {
+      set_union(&bi->first, &sub.first);
+      if (!sub.can_be_empty) bi->can_be_empty = FALSE;
+      }
+    bi->fixed = FALSE;
+    chain = 0;
+    open = FALSE;
+    continue;
+    }
+
+  /* Anything else matches no characters. */
+
+  else
+    {
+    code = skip_item(code, st->utf);
+    continue;
+    }
+
+  /* We have an item that matches characters, described by cs and rep. */
+
+  note_set(st, &cs);
+  variable = rep.min != rep.max && !rep.possessive;
+  if (rep.min != rep.max)
+    {
+    st->variable++;
+    if (rep.possessive) st->possessive++;
+    }
+
+  if (bi->can_be_empty)
+    {
+    set_union(&bi->first, &cs);
+    if (rep.min > 0) bi->can_be_empty = FALSE;
+    }
+
+  if (bi->fixed && cs.known && rep.min == rep.max &&
+      rep.min <= (uint32_t)(MAX_SEQUENCE - bi->seqlen))
+    {
+    uint32_t i;
+    for (i = 0; i < rep.min; i++) memcpy(bi->seq[bi->seqlen++], cs.bits, 32);
+    }
+  else bi->fixed = FALSE;
+
+  if (variable) add_variable(gi, ipos, ilen, &cs, code, TRUE);
+
+  /* Look for quantifiers that compete for the same characters. A chain starts
+  at an unlimited quantifier that is not possessive. It continues through
+  items that can match the same characters, and grows at each further
+  unlimited quantifier that can. Anything else ends it. */
+
+  if (rep.max == UNLIMITED)
+    {
+    if (open && set_overlap(&prev, &cs))
+      {
+      chain++;
+      st->warnings++;
+      if (st->report)
+        {
+        printf("  competing quantifiers: ");
+        print_text(st->pattern + prev_pos, prev_len);
+        printf(" and ");
+        print_text(st->pattern + ipos, ilen);
+        printf(" can match the same characters\n");
+        printf("    make their character sets exclusive, or anchor the "
+          "text between them\n");
+        }
+      if (rep.possessive) open = FALSE;
+      }
+    else if (variable)
+      {
+      chain = 1;
+      open = TRUE;
+      prev = cs;
+      prev_pos = ipos;
+      prev_len = ilen;
+      }
+    else open = FALSE;
+    }
+  else if (open && !set_overlap(&prev, &cs))
+    {
+    open = FALSE;
+    chain = 0;
+    }
+
+  if (chain > st->chain) st->chain = chain;
+  }
+}
+
+
+
+/*************************************************
+*              Scan a group                      *
+*************************************************/
+
+/* The code points to the opening bracket of any kind of group, including
+assertions and conditionals.
+
+Arguments:
+  code        the opening bracket
+  st          the scan state
+  gi          where to return information about the group
+  start       the position of the group in the pattern
+
+Returns:      the code after the closing bracket
+*/
+
+static const uint8_t *
+scan_group(const uint8_t *code, scan_state *st, group_info *gi, size_t start)
+{
+uint8_t op = *code;
+BOOL assertion = op < OP_ONCE;
+BOOL atomic = op == OP_ONCE ||
+  (assertion && op != OP_ASSERT_NA && op != OP_ASSERTBACK_NA);
+BOOL repeated, ambiguous = FALSE;
+branch_info *fixed = NULL;
+int nfixed = 0;
+const uint8_t *branch = code + OP_lengths_8[op];
+size_t end;
+uint8_t ket;
+
+memset(gi, 0, sizeof(group_info));
+set_clear(&gi->first);
+
+for (;;)
+  {
+  const uint8_t *next = code + GET(code, 1);
+  branch_info bi;
+
+  scan_branch(branch, next, st, &bi, gi);
+  set_union(&gi->first, &bi.first);
+  if (bi.can_be_empty) gi->can_be_empty = TRUE;
+
+  if (bi.fixed && bi.seqlen > 0 && nfixed < MAX_ALTERNATIVES)
+    {
+    if (fixed == NULL) fixed = malloc(MAX_ALTERNATIVES * sizeof(branch_info));
+    if (fixed != NULL) fixed[nfixed++] = bi;
+    }
+
+  code = next;
+  if (*code != OP_ALT) break;
+  branch = code + OP_lengths_8[OP_ALT];
+  }
+
+/* The last automatic callout in the group was for the closing parenthesis
+and its quantifier. */
+
+ket = *code;
+end = st->cpos + st->clen;
+code += OP_lengths_8[ket];
+repeated = ket == OP_KETRMAX || ket == OP_KETRMIN || ket == OP_KETRPOS;
+
+if (nfixed > 1)
+  {
+  int i, j;
+  for (i = 1; i < nfixed && !ambiguous; i++)
+    for (j = 0; j < i && !ambiguous; j++)
+      {
+      if (repeated) ambiguous = ambiguous_pair(fixed + i, fixed + j, &gi->first);
+      else ambiguous = fixed[i].seqlen == fixed[j].seqlen &&
+        ambiguous_pair(fixed + i, fixed + j, &gi->first);
+      }
+  }
+free(fixed);
+
+if (repeated)
+  {
+  st->variable++;
+  if (ket == OP_KETRPOS) st->possessive++;
+  }
+
+/* A group that repeats without limit, and is neither atomic nor possessive,
+is where catastrophic backtracking happens, if there is more than one way of
+matching its content. That is so if it has ambiguous alternatives, or if
+something inside can backtrack over characters with which the next repeat of
+the group can start. */
+
+if ((ket == OP_KETRMAX || ket == OP_KETRMIN) && !atomic)
+  {
+  var_item *culprit = NULL;
+  int i;
+
+  for (i = 0; i < gi->nvar && culprit == NULL; i++)
+    if (!gi->var[i].set.known || !gi->first.known ||
+        set_overlap(&gi->var[i].set, &gi->first))
+      culprit = gi->var + i;
+
+  if (culprit != NULL || ambiguous)
+    {
+    st->warnings++;
+    st->exponential = TRUE;
+    }
+
+  /* A possessive quantifier is suggested only where it cannot take characters
+  that the rest of the match needs. Otherwise only the atomic group is
+  suggested. */
+
+  if (st->report && (culprit != NULL || ambiguous))
+    {
+    BOOL possessive = TRUE;
+
+    if (culprit != NULL)
+      {
+      printf("  nested quantifier: ");
+      print_text(st->pattern + culprit->start, culprit->length);
+      printf(" inside ");
+      print_text(st->pattern + start, end - start);
+      printf(" can match the same text in many ways\n");
+      possessive = can_be_possessive(st, culprit);
+      if (possessive && greedy_text(st, culprit->start, culprit->length))
+        print_rewrite(st, 0, NULL, culprit->start + culprit->length, "+");
+      }
+    else
+      {
+      printf("  ambiguous repeat: ");
+      print_text(st->pattern + start, end - start);
+      printf(" has alternatives that can match the same text\n");
+      }
+    if (possessive && greedy_text(st, start, end - start))
+      print_rewrite(st, 0, NULL, end, "+");
+    print_rewrite(st, start, "(?>", end, ")");
+    }
+  }
+
+/* Nothing inside an atomic group or an assertion can be backtracked into from
+outside. Otherwise a repeating or ambiguous group is itself a backtracking
+point for any enclosing group. */
+
+if (atomic || assertion) gi->nvar = 0;
+  else if (ket == OP_KETRMAX || ket == OP_KETRMIN || ambiguous)
+    add_variable(gi, start, end - start, &gi->first, code, FALSE);
+
+/* Assertions do not match characters; a conditional group may match none. */
+
+if (assertion)
+  {
+  set_clear(&gi->first);
+  gi->can_be_empty = TRUE;
+  }
+else if (op == OP_COND || op == OP_SCOND) gi->can_be_empty = TRUE;
+
+return code;
+}
+
+
+
+/*************************************************
+*        Scan a compiled pattern                 *
+*************************************************/
+
+static void
+scan_pattern(const pcre2_code_8 *code, scan_state *st)
+{
+const pcre2_real_code_8 *re = (const pcre2_real_code_8 *)code;
+group_info gi;
+
+st->utf = (re->overall_options & PCRE2_UTF) != 0;
+st->fcc = re->tables + fcc_offset;
+st->cbits = re->tables + cbits_offset;
+st->cpos = st->clen = 0;
+st->variable = st->possessive = st->warnings = 0;
+st->exponential = FALSE;
+st->chain = 0;
+set_clear(&st->alphabet);
+set_clear(&st->everything);
+
+(void)scan_group((const uint8_t *)re + re->code_start, st, &gi, 0);
+}
+
+
+
+/*************************************************
+*         Print pattern information              *
+*************************************************/
+
+static void
+print_code_unit(uint32_t c)
+{
+if (c >= 0x20 && c < 0x7f && c != '\'') printf("'%c'", (int)c);
+  else printf("\\x{%x}", c);
+}
+
+static void
+print_info(pcre2_code_8 *re)
+{
+uint32_t captures, backrefs, minlength, firsttype, lasttype, unit;
+
+(void)pcre2_pattern_info_8(re, PCRE2_INFO_CAPTURECOUNT, &captures);
+(void)pcre2_pattern_info_8(re, PCRE2_INFO_BACKREFMAX, &backrefs);
+(void)pcre2_pattern_info_8(re, PCRE2_INFO_MINLENGTH, &minlength);
+(void)pcre2_pattern_info_8(re, PCRE2_INFO_FIRSTCODETYPE, &firsttype);
+(void)pcre2_pattern_info_8(re, PCRE2_INFO_LASTCODETYPE, &lasttype);
+
+printf("  info: %u capture%s, minimum length %u", captures,
+  (captures == 1)? "" : "s", minlength);
+if (backrefs > 0) printf(", back references");
+
+if (firsttype == 1)
+  {
+  (void)pcre2_pattern_info_8(re, PCRE2_INFO_FIRSTCODEUNIT, &unit);
+  printf(", first code unit ");
+  print_code_unit(unit);
+  }
+else if (firsttype == 2) printf(", starts at line starts");
+else
+  {
+  const uint8_t *bitmap;
+  (void)pcre2_pattern_info_8(re, PCRE2_INFO_FIRSTBITMAP, &bitmap);
+  printf(bitmap != NULL? ", start bitmap" : ", tried at every position");
+  }
+
+if (lasttype == 1)
+  {
+  (void)pcre2_pattern_info_8(re, PCRE2_INFO_LASTCODEUNIT, &unit);
+  printf(", last code unit ");
+  print_code_unit(unit);
+  }
+printf("\n");
+}
+
+
+
+/*************************************************
+*                 Fuzz mode                      *
+*************************************************/
+
+static uint32_t
+next_random(void)
+{
+fuzz_seed ^= fuzz_seed << 13;
+fuzz_seed ^= fuzz_seed >> 17;
+fuzz_seed ^= fuzz_seed << 5;
+return fuzz_seed;
+}
+
+static int
+count_callout(pcre2_callout_block_8 *cb, void *data)
+{
+(void)cb;
+(void)data;
+return (++callout_count >= fuzz_steps)? PCRE2_ERROR_CALLOUT : 0;
+}
+
+
+/* Convert a subject to code units, in UTF-8 if necessary, and match it with
+the callout-compiled pattern.
+
+Returns:      the number of callouts, which measures the work done
+*/
+
+static unsigned long
+fuzz_cost(pcre2_code_8 *re, pcre2_match_data_8 *md, pcre2_match_context_8 *mc,
+  const uint8_t *subject, size_t length, BOOL utf, uint8_t *buffer,
+  size_t *units)
+{
+size_t i, n = 0;
+
+for (i = 0; i < length; i++)
+  {
+  uint8_t c = subject[i];
+  if (utf && c >= 0x80)
+    {
+    buffer[n++] = (uint8_t)(0xc0 | (c >> 6));
+    buffer[n++] = (uint8_t)(0x80 | (c & 0x3f));
+    }
+  else buffer[n++] = c;
+  }
+*units = n;
+
+callout_count = 0;
+(void)pcre2_match_8(re, buffer, n, 0, 0, md, mc);
+return callout_count;
+}
+
+
+/* The search starts with subjects that repeat one character of the alphabet
+followed by a character that the pattern does not use, which is the classic
+shape of a catastrophic subject. It then mutates the best subject found so far
+at random, keeping changes that do not reduce the work.
+
+Arguments:
+  re_callout  the pattern compiled with automatic callouts
+  re          the pattern compiled normally
+  st          the scan state, which supplies the alphabet
+
+Returns:      TRUE if the step limit was reached
+*/
+
+static BOOL
+fuzz_pattern(pcre2_code_8 *re_callout, pcre2_code_8 *re, scan_state *st)
+{
+pcre2_match_data_8 *md = pcre2_match_data_create_8(1, NULL);
+pcre2_match_context_8 *mc = pcre2_match_context_create_8(NULL);
+uint8_t alphabet[MAX_ALPHABET];
+uint8_t *best = malloc(fuzz_length);
+uint8_t *current = malloc(fuzz_length);
+uint8_t *trial = malloc(fuzz_length);
+uint8_t *buffer = malloc(fuzz_length * 2);
+size_t best_len = 0, current_len, trial_len, units;
+unsigned long best_cost = 0, current_cost, cost;
+unsigned long i;
+int n = 0, a;
+uint32_t c;
+clock_t start;
+double seconds;
+int rc;
+
+if (md == NULL || mc == NULL || best == NULL || current == NULL ||
+    trial == NULL || buffer == NULL)
+  {
+  fprintf(stderr, "pcre2analyze: malloc failed\n");
+  goto EXIT;
+  }
+(void)pcre2_set_callout_8(mc, count_callout, NULL);
+
+for (c = 0; c < 256 && n < MAX_ALPHABET - 1; c++)
+  if (set_has(&st->alphabet, c)) alphabet[n++] = (uint8_t)c;
+for (c = '!'; c < 256; c++)
+  if (!set_has(&st->everything, c)) break;
+if (c < 256) alphabet[n++] = (uint8_t)c;
+if (n == 0) alphabet[n++] = 'a';
+
+/* Seed the search */
+
+for (a = 0; a < n; a++)
+  {
+  size_t k;
+  for (k = 0; k < fuzz_length - 1; k++) trial[k] = alphabet[a];
+  trial[fuzz_length - 1] = alphabet[n - 1];
+  cost = fuzz_cost(re_callout, md, mc, trial, fuzz_length, st->utf, buffer,
+    &units);
+  if (cost > best_cost || best_len == 0)
+    {
+    best_cost = cost;
+    best_len = fuzz_length;
+    memcpy(best, trial, fuzz_length);
+    }
+  }
+
+memcpy(current, best, best_len);
+current_len = best_len;
+current_cost = best_cost;
+
+/* Mutate */
+
+for (i = 0; i < fuzz_iterations && best_cost < fuzz_steps; i++)
+  {
+  int m, mutations = 1 + next_random() % 3;
+
+  memcpy(trial, current, current_len);
+  trial_len = current_len;
+
+  for (m = 0; m < mutations; m++)
+    {
+    size_t pos = next_random() % trial_len;
+    uint8_t ch = alphabet[next_random() % n];
+    size_t k, span;
+
+    switch(next_random() % 4)
+      {
+      case 0:                   /* Change one character */
+      trial[pos] = ch;
+      break;
+
+      case 1:                   /* Change a run of characters */
+      span = 1 + next_random() % (trial_len - pos);
+      for (k = 0; k < span; k++) trial[pos + k] = ch;
+      break;
+
+      case 2:                   /* Insert a character */
+      if (trial_len >= fuzz_length) break;
+      memmove(trial + pos + 1, trial + pos, trial_len - pos);
+      trial[pos] = ch;
+      trial_len++;
+      break;
+
+      default:                  /* Delete a character */
+      if (trial_len <= 1) break;
+      memmove(trial + pos, trial + pos + 1, trial_len - pos - 1);
+      trial_len--;
+      break;
+      }
+    }
+
+  cost = fuzz_cost(re_callout, md, mc, trial, trial_len, st->utf, buffer,
+    &units);
+  if (cost >= current_cost)
+    {
+    memcpy(current, trial, trial_len);
+    current_len = trial_len;
+    current_cost = cost;
+    if (cost > best_cost)
+      {
+      memcpy(best, trial, trial_len);
+      best_len = trial_len;
+      best_cost = cost;
+      }
+    }
+  }
+
+/* Report the worst subject, and how long the real pattern takes with it. */
+
+(void)fuzz_cost(re_callout, md, mc, best, best_len, st->utf, buffer, &units);
+printf("  fuzz: worst subject ");
+print_text(buffer, units);
+printf(" takes %s%lu steps\n", (best_cost >= fuzz_steps)? "at least " : "",
+  best_cost);
+
+start = clock();
+rc = pcre2_match_8(re, buffer, units, 0, PCRE2_NO_JIT, md, NULL);
+seconds = (double)(clock() - start) / CLOCKS_PER_SEC;
+printf("  fuzz: interpreter %.3f s%s\n", seconds,
+  (rc == PCRE2_ERROR_MATCHLIMIT)? " (match limit reached)" : "");
+
+#ifdef SUPPORT_JIT
+if (pcre2_jit_compile_8(re, PCRE2_JIT_COMPLETE) == 0)
+  {
+  start = clock();
+  rc = pcre2_match_8(re, buffer, units, 0, 0, md, NULL);
+  seconds = (double)(clock() - start) / CLOCKS_PER_SEC;
+  printf("  fuzz: JIT %.3f s%s\n", seconds,
+    (rc == PCRE2_ERROR_MATCHLIMIT)? " (match limit reached)" : "");
+  }
+#endif
+
+EXIT:
+free(best);
+free(current);
+free(trial);
+free(buffer);
+pcre2_match_context_free_8(mc);
+pcre2_match_data_free_8(md);
+return best_cost >= fuzz_steps;
+}
+
+
+
+/*************************************************
+*            Analyze one pattern                 *
+*************************************************/
+
+/*
+Arguments:
+  pattern     the pattern
+  length      its length
+  options     compile options
+  where       description of where it came from, for errors
+
+Returns:      0 if nothing was found, 1 for findings, 2 for a compile error
+*/
+
+static int
+analyze(const uint8_t *pattern, size_t length, uint32_t options,
+  const char *where)
+{
+pcre2_code_8 *re, *re_callout, *re_noauto;
+scan_state st, counts;
+uint32_t all_options;
+int errorcode, degree;
+PCRE2_SIZE erroroffset;
+
+re = pcre2_compile_8(pattern, length, options, &errorcode, &erroroffset,
+  NULL);
+if (re == NULL)
+  {
+  uint8_t message[256];
+  (void)pcre2_get_error_message_8(errorcode, message, sizeof(message));
+  fprintf(stderr, "pcre2analyze: %s: error at offset %lu: %s\n", where,
+    (unsigned long)erroroffset, message);
+  return 2;
+  }
+
+re_callout = pcre2_compile_8(pattern, length, options|PCRE2_AUTO_CALLOUT,
+  &errorcode, &erroroffset, NULL);
+re_noauto = pcre2_compile_8(pattern, length,
+  options|PCRE2_AUTO_CALLOUT|PCRE2_NO_AUTO_POSSESS, &errorcode, &erroroffset,
+  NULL);
+if (re_callout == NULL || re_noauto == NULL)
+  {
+  fprintf(stderr, "pcre2analyze: %s: failed to compile with callouts\n",
+    where);
+  pcre2_code_free_8(re);
+  pcre2_code_free_8(re_callout);
+  pcre2_code_free_8(re_noauto);
+  return 2;
+  }
+
+/* Findings are printed as they are found, so the scan is done twice when
+only patterns with findings are to be shown. */
+
+memset(&st, 0, sizeof(st));
+st.pattern = pattern;
+st.patlen = length;
+counts = st;
+
+(void)pcre2_pattern_info_8(re, PCRE2_INFO_ALLOPTIONS, &all_options);
+if (quiet)
+  {
+  scan_pattern(re_callout, &st);
+  if (st.warnings == 0 && !fuzz &&
+      (all_options & PCRE2_NO_AUTO_POSSESS) == 0)
+    goto EXIT;
+  }
+
+printf("%s: ", where);
+print_text(pattern, length);
+printf("\n");
+if (show_code) pcre2_printint_8(re, stdout, FALSE);
+print_info(re);
+
+st.report = TRUE;
+scan_pattern(re_callout, &st);
+scan_pattern(re_noauto, &counts);
+
+printf("  quantifiers: %u variable, %u possessive (%u made possessive "
+  "automatically)\n", st.variable, st.possessive,
+  st.possessive - counts.possessive);
+
+if ((all_options & PCRE2_NO_AUTO_POSSESS) != 0)
+  {
+  printf("  auto-possessification is disabled; remove (*NO_AUTO_POSSESS) or "
+    "PCRE2_NO_AUTO_POSSESS\n");
+  st.warnings++;
+  }
+
+degree = st.chain + (((all_options & PCRE2_ANCHORED) == 0)? 1 : 0);
+if (st.exponential) printf("  cost: exponential\n");
+  else if (st.chain > 0 && degree > 1)
+    printf("  cost: polynomial, about O(n^%d)\n", degree);
+  else printf("  cost: linear\n");
+
+if (fuzz && fuzz_pattern(re_callout, re, &st) && st.warnings == 0)
+  st.warnings++;
+
+EXIT:
+pcre2_code_free_8(re);
+pcre2_code_free_8(re_callout);
+pcre2_code_free_8(re_noauto);
+return (st.warnings > 0)? 1 : 0;
+}
+
+
+
+/*************************************************
+*                Main program                    *
+*************************************************/
+
+int
+main(int argc, char **argv)
+{
+uint32_t options = 0;
+const char *single = NULL;
+char *buffer;
+unsigned long line = 0;
+char where[64];
+int i, rc = 0;
+FILE *f;
+
+for (i = 1; i < argc && argv[i][0] == '-' && argv[i][1] != 0; i++)
+  {
+  const char *arg = argv[i];
+  if (strcmp(arg, "-b") == 0) show_code = TRUE;
+  else if (strcmp(arg, "-f") == 0) fuzz = TRUE;
+  else if (strcmp(arg, "-i") == 0) options |= PCRE2_CASELESS;
+  else if (strcmp(arg, "-m") == 0) options |= PCRE2_MULTILINE;
+  else if (strcmp(arg, "-q") == 0) quiet = TRUE;
+  else if (strcmp(arg, "-s") == 0) options |= PCRE2_DOTALL;
+  else if (strcmp(arg, "-u") == 0) options |= PCRE2_UTF;
+  else if (strcmp(arg, "-U") == 0) options |= PCRE2_UTF|PCRE2_UCP;
+  else if (strcmp(arg, "-x") == 0) options |= PCRE2_EXTENDED;
+  else if (strcmp(arg, "-e") == 0 && i + 1 < argc) single = argv[++i];
+  else if (strcmp(arg, "-l") == 0 && i + 1 < argc)
+    fuzz_length = strtoul(argv[++i], NULL, 10);
+  else if (strcmp(arg, "-n") == 0 && i + 1 < argc)
+    fuzz_iterations = strtoul(argv[++i], NULL, 10);
+  else if (strcmp(arg, "-r") == 0 && i + 1 < argc)
+    fuzz_seed = (uint32_t)strtoul(argv[++i], NULL, 10);
+  else if (strcmp(arg, "-S") == 0 && i + 1 < argc)
+    fuzz_steps = strtoul(argv[++i], NULL, 10);
+  else
+    {
+    usage();
+    return 2;
+    }
+  }
+
+if ((single == NULL)? (argc - i != 1) : (argc - i != 0))
+  {
+  usage();
+  return 2;
+  }
+if (fuzz_length < 2) fuzz_length = 2;
+if (fuzz_seed == 0) fuzz_seed = 1;
+
+if (single != NULL)
+  return analyze((const uint8_t *)single, strlen(single), options, "pattern");
+
+pattern_file = argv[i];
+f = fopen(pattern_file, "rb");
+if (f == NULL)
+  {
+  fprintf(stderr, "pcre2analyze: failed to open %s: %s\n", pattern_file,
+    strerror(errno));
+  return 2;
+  }
+
+buffer = malloc(MAX_PATTERN_LINE + 2);
+if (buffer == NULL)
+  {
+  fprintf(stderr, "pcre2analyze: malloc failed\n");
+  fclose(f);
+  return 2;
+  }
+
+while (fgets(buffer, MAX_PATTERN_LINE + 2, f) != NULL)
+  {
+  size_t length = strlen(buffer);
+  char *p = buffer;
+  int prc;
+
+  line++;
+  if (length > MAX_PATTERN_LINE)
+    {
+    fprintf(stderr, "pcre2analyze: %s:%lu: line is too long\n", pattern_file,
+      line);
+    rc = 2;
+    break;
+    }
+
+  while (length > 0 &&
+    (buffer[length-1] == '\n' || buffer[length-1] == '\r'))
+    length--;
+  buffer[length] = 0;
+  if (length == 0 || buffer[0] == '#') continue;
+  if (buffer[0] == '\\' && buffer[1] == '#')
+    {
+    p++;
+    length--;
+    }
+
+  sprintf(where, "%lu", line);
+  prc = analyze((const uint8_t *)p, length, options, where);
+  if (prc > rc) rc = prc;
+  if (!quiet || prc != 0) fflush(stdout);
+  }
+
+free(buffer);
+fclose(f);
+return rc;
+}
+
+/* End of pcre2analyze.c */
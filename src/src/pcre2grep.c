@@ -87,6 +87,13 @@ POSSIBILITY OF SUCH DAMAGE.
 #endif
 #endif
 
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+#include <limits.h>
+#include <signal.h>
+#include <sys/mman.h>
+#include <sys/wait.h>
+#endif
+
 #ifdef SUPPORT_VALGRIND
 #include <valgrind/memcheck.h>
 #endif
@@ -134,6 +141,7 @@ be C99 don't support it (hence DISABLE_PERCENT_ZT). */
 typedef int BOOL;
 
 #define DEFAULT_CAPTURE_MAX 50
+#define DEFAULT_SPLIT_SIZE (4*1024*1024)
 
 #if BUFSIZ > 8192
 #define MAXPATLEN BUFSIZ
@@ -150,9 +158,10 @@ all values greater than FN_DEFAULT. */
 
 enum { FN_NONE, FN_DEFAULT, FN_MATCH_ONLY, FN_NOMATCH_ONLY, FN_FORCE };
 
-/* File reading styles */
+/* File reading styles. FR_MMAP means that the whole of the data is already in
+memory, having been mapped from a regular file. */
 
-enum { FR_PLAIN, FR_LIBZ, FR_LIBBZ2 };
+enum { FR_PLAIN, FR_LIBZ, FR_LIBBZ2, FR_MMAP };
 
 /* Actions for the -d and -D options */
 
@@ -169,6 +178,10 @@ enum { DEE_READ, DEE_SKIP };
 
 enum { BIN_BINARY, BIN_NOMATCH, BIN_TEXT };
 
+/* Literal prefilter types */
+
+enum { PF_NONE, PF_UNIT, PF_LITERAL };
+
 /* Return values from decode_dollar_escape() */
 
 enum { DDE_ERROR, DDE_CAPTURE, DDE_CHAR };
@@ -235,6 +248,8 @@ static int endlinetype;
 static int count_limit = -1;  /* Not long, so that it works with OP_NUMBER */
 static unsigned long int counts_printed = 0;
 static unsigned long int total_count = 0;
+static unsigned long int lines_searched = 0;
+static unsigned long int lines_prefiltered = 0;
 
 static PCRE2_SIZE bufthird = PCRE2GREP_BUFSIZE;
 static PCRE2_SIZE max_bufthird = PCRE2GREP_MAX_BUFSIZE;
@@ -249,6 +264,9 @@ static int dee_action = dee_READ;
 static int DEE_action = DEE_READ;
 static int error_count = 0;
 static int filenames = FN_DEFAULT;
+static int jobs = 1;
+
+static PCRE2_SIZE split_size = DEFAULT_SPLIT_SIZE;
 
 #ifdef SUPPORT_PCRE2GREP_JIT
 static BOOL use_jit = TRUE;
@@ -290,12 +308,49 @@ static BOOL number = FALSE;
 static BOOL omit_zero_count = FALSE;
 static BOOL resource_error = FALSE;
 static BOOL quiet = FALSE;
+static BOOL show_stats = FALSE;
 static BOOL show_total_count = FALSE;
 static BOOL silent = FALSE;
 static BOOL utf = FALSE;
+static BOOL use_mmap = FALSE;
+static BOOL use_prefilter = TRUE;
 static BOOL posix_digit = FALSE;
 static BOOL posix_pattern_file = FALSE;
 
+/* When --jobs is greater than one, files (and, with --mmap, pieces of large
+files) are searched in forked worker processes. Each worker writes its output
+to an anonymous temporary file, followed by a trailer that passes back the
+values that are accumulated over all the files. The parent keeps a circular
+queue of running jobs, which it collects in the order they were started, so
+that the output is the same as for a serial search. */
+
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+#define JOB_TRAILER_MAGIC 0x50324a42u
+
+typedef struct job_trailer {
+  uint32_t magic;
+  int rc;
+  int error_count;
+  BOOL resource_error;
+  unsigned long int counts_printed;
+  unsigned long int total_count;
+  unsigned long int lines_searched;
+  unsigned long int lines_prefiltered;
+} job_trailer;
+
+typedef struct job_item {
+  pid_t pid;
+  FILE *out;
+} job_item;
+
+static job_item *job_queue = NULL;
+static int job_head = 0;
+static int job_active = 0;
+static int job_rc = 1;
+static BOOL job_child = FALSE;
+static BOOL split_ok = FALSE;
+#endif
+
 static uint8_t utf8_buffer[8];
 
 
@@ -356,6 +411,11 @@ typedef struct patstr {
   char *string;
   PCRE2_SIZE length;
   pcre2_code *compiled;
+  int pf_type;              /* Prefilter type */
+  uint8_t pf_units[2];      /* Code unit(s) for PF_UNIT */
+  char *pf_string;          /* Copied string for PF_LITERAL */
+  PCRE2_SIZE pf_length;     /* Its length */
+  char *pf_next[2];         /* Next candidates in the buffer, NULL if unknown */
 } patstr;
 
 static patstr *patterns = NULL;
@@ -434,6 +494,11 @@ used to identify them. */
 #define N_GROUP_SEPARATOR (-27)
 #define N_NO_GROUP_SEPARATOR (-28)
 #define N_POSIX_PATFILE (-29)
+#define N_JOBS         (-30)
+#define N_MMAP         (-31)
+#define N_SPLIT_SIZE   (-32)
+#define N_NO_PREFILTER (-33)
+#define N_STATS        (-34)
 
 static option_item optionlist[] = {
   { OP_NODATA,     N_NULL,   NULL,              "",              "terminate options" },
@@ -463,6 +528,11 @@ static option_item optionlist[] = {
   { OP_NODATA,     'h',      NULL,              "no-filename",   "suppress the prefixing filename on output" },
   { OP_NODATA,     'I',      NULL,              "",              "treat binary files as not matching (ignore)" },
   { OP_NODATA,     'i',      NULL,              "ignore-case",   "ignore case distinctions" },
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+  { OP_NUMBER,     N_JOBS,   &jobs,             "jobs=number",   "search up to <number> files or pieces in parallel" },
+#else
+  { OP_NUMBER,     N_JOBS,   &jobs,             "jobs=number",   "ignored: this pcre2grep does not support parallel search" },
+#endif
   { OP_NODATA,     'l',      NULL,              "files-with-matches", "print only FILE names containing matches" },
   { OP_NODATA,     'L',      NULL,              "files-without-match","print only FILE names not containing matches" },
   { OP_STRING,     N_LABEL,  &stdin_name,       "label=name",    "set name for standard input" },
@@ -475,6 +545,11 @@ static option_item optionlist[] = {
   { OP_U32NUMBER,  N_M_LIMIT_DEP, &depth_limit, "recursion-limit=number", "obsolete synonym for depth-limit" },
   { OP_NODATA,     'M',      NULL,              "multiline",     "run in multiline mode" },
   { OP_NUMBER,     'm',      &count_limit,      "max-count=number", "stop after <number> matched lines" },
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+  { OP_NODATA,     N_MMAP,   NULL,              "mmap",          "search regular files via memory mapping" },
+#else
+  { OP_NODATA,     N_MMAP,   NULL,              "mmap",          "ignored: this pcre2grep does not support memory mapping" },
+#endif
   { OP_STRING,     'N',      &newline_arg,      "newline=type",  "set newline type (CR, LF, CRLF, ANYCRLF, ANY, or NUL)" },
   { OP_NODATA,     'n',      NULL,              "line-number",   "print line number with output lines" },
 #ifdef SUPPORT_PCRE2GREP_JIT
@@ -483,6 +558,7 @@ static option_item optionlist[] = {
   { OP_NODATA,     N_NOJIT,  NULL,              "no-jit",        "ignored: this pcre2grep does not support JIT" },
 #endif
   { OP_NODATA,     N_NO_GROUP_SEPARATOR, NULL,   "no-group-separator", "suppress separators between groups of lines" },
+  { OP_NODATA,     N_NO_PREFILTER, NULL,         "no-prefilter",  "do not skip lines that lack a required literal" },
   { OP_STRING,     'O',      &output_text,       "output=text",   "show only this text (possibly expanded)" },
   { OP_OP_NUMBERS, 'o',      &only_matching_data, "only-matching=n", "show only the part of the line that matched" },
   { OP_STRING,     N_OM_SEPARATOR, &om_separator, "om-separator=text", "set separator for multiple -o output" },
@@ -497,6 +573,8 @@ static option_item optionlist[] = {
   { OP_FILELIST,   N_EXCLUDE_FROM,&exclude_from_data, "exclude-from=path", "read exclude list from file" },
   { OP_FILELIST,   N_INCLUDE_FROM,&include_from_data, "include-from=path", "read include list from file" },
   { OP_NODATA,    's',      NULL,              "no-messages",   "suppress error messages" },
+  { OP_SIZE,      N_SPLIT_SIZE, &split_size,     "split-size=number", "minimum piece size for --jobs with --mmap" },
+  { OP_NODATA,    N_STATS,  NULL,              "stats",         "print search statistics on stderr" },
   { OP_NODATA,    't',      NULL,              "total-count",   "print total count of matching lines" },
   { OP_NODATA,    'u',      NULL,              "utf",           "use UTF/Unicode" },
   { OP_NODATA,    'U',      NULL,              "utf-allow-invalid", "use UTF/Unicode, allow for invalid code units" },
@@ -676,6 +754,18 @@ if (resource_error)
     PCRE2_ERROR_DEPTHLIMIT, PCRE2_ERROR_HEAPLIMIT);
   fprintf(stderr, "pcre2grep: Check your regex for nested unlimited loops.\n");
   }
+
+/* A worker process must not run the exit handlers, because they might reset
+the file position of an input stream that it shares with its parent. */
+
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+if (job_child)
+  {
+  (void)fflush(stdout);
+  _exit(rc);
+  }
+#endif
+
 exit(rc);
 }
 
@@ -721,6 +811,9 @@ p->next = NULL;
 p->string = s;
 p->length = patlen;
 p->compiled = NULL;
+p->pf_type = PF_NONE;
+p->pf_string = NULL;
+p->pf_next[0] = p->pf_next[1] = NULL;
 
 if (after != NULL)
   {
@@ -749,6 +842,7 @@ while (pc != NULL)
   patstr *p = pc;
   pc = p->next;
   if (p->compiled != NULL) pcre2_code_free(p->compiled);
+  free(p->pf_string);
   free(p);
   }
 }
@@ -1245,6 +1339,10 @@ printf("Files whose names end in .gz are read using zlib." STDOUT_NL);
 printf("Files whose names end in .bz2 are read using bzlib2." STDOUT_NL);
 #endif
 
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+printf("Memory-mapped and parallel searching (--mmap, --jobs) are supported." STDOUT_NL);
+#endif
+
 #if defined SUPPORT_LIBZ || defined SUPPORT_LIBBZ2
 printf("Other files and the standard input are read as plain files." STDOUT_NL STDOUT_NL);
 #else
@@ -1275,6 +1373,7 @@ for (op = optionlist; op->one_char != 0; op++)
 printf(STDOUT_NL "Numbers may be followed by K or M, e.g. --max-buffer-size=100K." STDOUT_NL);
 printf("The default value for --buffer-size is %d." STDOUT_NL, PCRE2GREP_BUFSIZE);
 printf("The default value for --max-buffer-size is %d." STDOUT_NL, PCRE2GREP_MAX_BUFSIZE);
+printf("The default value for --split-size is %d." STDOUT_NL, DEFAULT_SPLIT_SIZE);
 printf("When reading patterns or file names from a file, trailing white" STDOUT_NL);
 printf("space is removed and blank lines are ignored." STDOUT_NL);
 printf("The maximum size of any pattern is %d bytes." STDOUT_NL, MAXPATLEN);
@@ -1965,6 +2064,110 @@ return TRUE;
 
 
 
+/*************************************************
+*          Reset the literal prefilters          *
+*************************************************/
+
+/* This is called whenever the data in the buffer is moved or replaced, so
+that the remembered candidate positions are no longer valid.
+
+Arguments:  none
+Returns:    nothing
+*/
+
+static void
+prefilter_reset(void)
+{
+patstr *p;
+for (p = patterns; p != NULL; p = p->next)
+  p->pf_next[0] = p->pf_next[1] = NULL;
+}
+
+
+
+/*************************************************
+*     Find the next prefilter candidate          *
+*************************************************/
+
+/* Search forward for the next occurrence of a pattern's code unit or literal
+string.
+
+Arguments:
+  p            the pattern block
+  n            which of the two code units to look for (PF_UNIT)
+  start        where to start searching
+  endptr       end of the data in the buffer
+
+Returns:       pointer to the occurrence, or endptr if there is none
+*/
+
+static char *
+prefilter_scan(patstr *p, int n, char *start, char *endptr)
+{
+char *s;
+
+if (p->pf_type == PF_UNIT)
+  {
+  s = memchr(start, p->pf_units[n], endptr - start);
+  return (s == NULL)? endptr : s;
+  }
+
+while ((PCRE2_SIZE)(endptr - start) >= p->pf_length)
+  {
+  s = memchr(start, p->pf_string[0], endptr - start - p->pf_length + 1);
+  if (s == NULL) break;
+  if (memcmp(s, p->pf_string, p->pf_length) == 0) return s;
+  start = s + 1;
+  }
+
+return endptr;
+}
+
+
+
+/*************************************************
+*      Check a line against the prefilters       *
+*************************************************/
+
+/* A line can match only if at least one pattern's literal starts within it.
+For each pattern the position of the next occurrence is remembered, so that
+each part of the buffer is scanned only once, however many lines it holds.
+Finding "no occurrence" is remembered as endptr; if more data is later added
+to the buffer, that just makes the following lines candidates until the
+pointer passes the old end, when the search is repeated.
+
+Arguments:
+  start        start of the line
+  end          end of the line, excluding the terminator
+  endptr       end of the data in the buffer
+
+Returns:       TRUE if the line must be passed to pcre2_match()
+*/
+
+static BOOL
+prefilter_candidate(char *start, char *end, char *endptr)
+{
+patstr *p;
+
+for (p = patterns; p != NULL; p = p->next)
+  {
+  int n;
+  int count = (p->pf_type == PF_UNIT && p->pf_units[1] != p->pf_units[0])?
+    2 : 1;
+
+  for (n = 0; n < count; n++)
+    {
+    if (p->pf_next[n] == NULL || p->pf_next[n] < start)
+      p->pf_next[n] = prefilter_scan(p, n, start, endptr);
+    if (p->pf_next[n] < end) return TRUE;
+    }
+  }
+
+return FALSE;
+}
+
+
+
 /*************************************************
 *          Decode dollar escape sequence         *
 *************************************************/
@@ -2580,6 +2783,112 @@ return result != 0;
 
 
 
+#ifdef SUPPORT_LIBBZ2
+/*************************************************
+*    Read a .bz2 file that may have many streams *
+*************************************************/
+
+/* BZ2_bzread() stops at the end of the first bzip2 stream, but a .bz2 file
+may consist of several streams (as written by parallel bzip2 compressors, or by
+concatenating files), and bzip2 itself decompresses them all. So does the
+decompression pipeline that is used when searching in parallel, and the serial
+search must see the same data. These functions therefore use the low-level
+reading interface, which reports the end of each stream and any data that it
+has read beyond it, so that the next stream can be started. As in bzip2,
+anything after the last stream that does not look like the start of another one
+is ignored; an error at the start of the first stream, however, is reported to
+the caller, which then reads the file as plain text. */
+
+typedef struct bz2_reader {
+  FILE *file;
+  BZFILE *bz;
+  int error;            /* The last bzlib error code */
+  int streams;          /* Number of streams that have been finished */
+} bz2_reader;
+
+static bz2_reader *
+bz2_open(const char *pathname)
+{
+bz2_reader *r = (bz2_reader *)malloc(sizeof(bz2_reader));
+if (r == NULL) return NULL;
+r->file = fopen(pathname, "rb");
+r->streams = 0;
+r->bz = (r->file == NULL)? NULL :
+  BZ2_bzReadOpen(&r->error, r->file, 0, 0, NULL, 0);
+if (r->bz == NULL)
+  {
+  int save_errno = errno;
+  if (r->file != NULL) fclose(r->file);
+  free(r);
+  errno = save_errno;
+  return NULL;
+  }
+return r;
+}
+
+static void
+bz2_close(bz2_reader *r)
+{
+int error;
+if (r->bz != NULL) BZ2_bzReadClose(&error, r->bz);
+fclose(r->file);
+free(r);
+}
+
+/* Returns the number of bytes read, which is zero at the end of the file, or
+-1 after an error, whose code is left in r->error. */
+
+static int
+bz2_read(bz2_reader *r, char *buffer, int length)
+{
+int total = 0;
+
+while (total < length && r->bz != NULL)
+  {
+  int n = BZ2_bzRead(&r->error, r->bz, buffer + total, length - total);
+
+  if (r->error != BZ_OK && r->error != BZ_STREAM_END)
+    {
+    if (r->error != BZ_DATA_ERROR_MAGIC || r->streams == 0) return -1;
+    BZ2_bzReadClose(&r->error, r->bz);  /* Trailing data is ignored */
+    r->bz = NULL;
+    break;
+    }
+
+  total += n;
+
+  /* At the end of a stream, start another with the data that has already been
+  read beyond it, unless there is no more data. */
+
+  if (r->error == BZ_STREAM_END)
+    {
+    void *unused;
+    int c, nunused;
+    char saved[BZ_MAX_UNUSED];
+
+    BZ2_bzReadGetUnused(&r->error, r->bz, &unused, &nunused);
+    if (r->error != BZ_OK) return -1;
+    memcpy(saved, unused, nunused);
+    BZ2_bzReadClose(&r->error, r->bz);
+    r->bz = NULL;
+    r->streams++;
+
+    if (nunused == 0)
+      {
+      if ((c = getc(r->file)) == EOF) break;
+      ungetc(c, r->file);
+      }
+    r->bz = BZ2_bzReadOpen(&r->error, r->file, 0, 0, saved, nunused);
+    if (r->bz == NULL) return -1;
+    }
+  }
+
+return total;
+}
+#endif  /* SUPPORT_LIBBZ2 */
+
+
+
 /*************************************************
 *     Read a portion of the file into buffer     *
 *************************************************/
@@ -2599,10 +2908,14 @@ else
 
 #ifdef SUPPORT_LIBBZ2
 if (frtype == FR_LIBBZ2)
-  return (PCRE2_SIZE)BZ2_bzread((BZFILE *)handle, buffer, length);
+  return (PCRE2_SIZE)bz2_read((bz2_reader *)handle, buffer, (int)length);
 else
 #endif
 
+/* A mapped file is already in the buffer. */
+
+if (frtype == FR_MMAP) return length;
+
 nread = (input_line_buffered ?
   read_one_line(buffer, length, (FILE *)handle) :
   fread(buffer, 1, length, (FILE *)handle));
@@ -2631,8 +2944,9 @@ be in the middle third most of the time, so the bottom third is available for
 Arguments:
   handle       the fopened FILE stream for a normal file
                the gzFile pointer when reading is via libz
-               the BZFILE pointer when reading is via libbz2
-  frtype       FR_PLAIN, FR_LIBZ, or FR_LIBBZ2
+               the bz2_reader pointer when reading is via libbz2
+               NULL for a mapped file, which is already in main_buffer
+  frtype       FR_PLAIN, FR_LIBZ, FR_LIBBZ2, or FR_MMAP
   filename     the file name or NULL (for errors)
   printname    the file name if it is to be printed for each match
                or NULL if the file name is not to be printed
@@ -2669,7 +2983,7 @@ of what we have. In the case of libz, a non-zipped .gz file will be read as a
 plain file. However, if a .bz2 file isn't actually bzipped, the first read will
 fail. */
 
-if (frtype != FR_LIBZ && frtype != FR_LIBBZ2)
+if (frtype == FR_PLAIN)
   {
   in = (FILE *)handle;
   if (feof(in)) return 1;
@@ -2690,6 +3004,7 @@ if (frtype == FR_LIBBZ2 && (int)bufflength < 0) return 3;   /* Gotcha: bufflengt
 #endif
 
 endptr = main_buffer + bufflength;
+if (use_prefilter) prefilter_reset();
 
 /* Unless binary-files=text, see if we have a binary file. This uses the same
 rule as GNU grep, namely, a search for a binary zero byte near the start of the
@@ -2714,6 +3029,7 @@ while (ptr < endptr)
   int mrc = 0;
   unsigned int options = 0;
   BOOL match;
+  BOOL candidate = TRUE;
   BOOL line_matched = FALSE;
   char *t = ptr;
   PCRE2_SIZE length, linelength;
@@ -2746,9 +3062,10 @@ while (ptr < endptr)
   /* Check to see if the line we are looking at extends right to the very end
   of the buffer without a line terminator. This means the line is too long to
   handle at the current buffer size. Until the buffer reaches its maximum size,
-  try doubling it and reading more data. */
+  try doubling it and reading more data. A mapped file is entirely in memory,
+  so this can only be its final line. */
 
-  if (endlinelength == 0 && t == main_buffer + bufsize)
+  if (endlinelength == 0 && t == main_buffer + bufsize && frtype != FR_MMAP)
     {
     if (bufthird < max_bufthird)
       {
@@ -2782,6 +3099,7 @@ while (ptr < endptr)
       lastmatchrestart = new_buffer + (lastmatchrestart - main_buffer);
       free(main_buffer);
       main_buffer = new_buffer;
+      if (use_prefilter) prefilter_reset();
 
       /* Read more data into the buffer and then try to find the line ending
       again. */
@@ -2805,6 +3123,16 @@ while (ptr < endptr)
       }
     }
 
+  /* If none of the patterns' required literals starts in this line, it cannot
+  match, and there is no need to call pcre2_match(). */
+
+  lines_searched++;
+  if (use_prefilter && !prefilter_candidate(ptr, ptr + linelength, endptr))
+    {
+    candidate = FALSE;
+    lines_prefiltered++;
+    }
+
   /* We come back here after a match when only_matching_count is non-zero, in
   order to find any further matches in the same line. This applies to
   --only-matching, --file-offsets, and --line-offsets. */
@@ -2817,7 +3145,7 @@ while (ptr < endptr)
   match, set PCRE2_NOTEMPTY to disable any further matches of null strings in
   this line. */
 
-  match = match_patterns(ptr, length, options, startoffset, &mrc);
+  match = candidate && match_patterns(ptr, length, options, startoffset, &mrc);
   options = PCRE2_NOTEMPTY;
 
   /* If it's a match or a not-match (as required), do what's wanted. NOTE: Use
@@ -3262,9 +3590,10 @@ while (ptr < endptr)
       main_buffer + 2*bufthird, bufthird, input_line_buffered);
     endptr = main_buffer + bufflength;
 
-    /* Adjust any last match point */
+    /* Adjust any last match point, and forget prefilter candidates. */
 
     if (lastmatchnumber > 0) lastmatchrestart -= bufthird;
+    if (use_prefilter) prefilter_reset();
     }
   }     /* Loop through the whole file */
 
@@ -3307,137 +3636,812 @@ return rc;
 
 
 
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
 /*************************************************
-*     Grep a file or recurse into a directory    *
+*         Grep a region of mapped memory         *
 *************************************************/
 
-/* Given a path name, if it's a directory, scan all the files if we are
-recursing; if it's a file, grep it.
+/* The region is temporarily made into the main buffer, with the size of a
+buffer third set so that the buffer is never shifted or refilled.
 
 Arguments:
-  pathname          the path to investigate
-  dir_recurse       TRUE if recursing is wanted (-r or -drecurse)
-  only_one_at_top   TRUE if the path is the only one at toplevel
+  start        start of the region, which must be at the start of a line
+  length       length of the region
+  filename     the file name (for errors)
+  printname    the file name if it is to be printed for each match, or NULL
 
-Returns:  -1 the file/directory was skipped
-           0 if there was at least one match
-           1 if there were no matches
-           2 there was some kind of error
+Returns:       the yield from pcre2grep()
+*/
 
-However, file opening failures are suppressed if "silent" is set.
+static int
+grep_region(char *start, PCRE2_SIZE length, const char *filename,
+  const char *printname)
+{
+int rc;
+char *save_buffer = main_buffer;
+PCRE2_SIZE save_bufthird = bufthird;
+
+main_buffer = start;
+bufthird = bufsize = length;
+rc = pcre2grep(NULL, FR_MMAP, filename, printname);
+main_buffer = save_buffer;
+bufthird = save_bufthird;
+bufsize = 3*bufthird;
+return rc;
+}
+
+
+
+/*************************************************
+*       Map a regular file and grep it           *
+*************************************************/
+
+/* This is called for --mmap. Only non-empty regular files are mapped; for
+anything else, or if mapping fails, the caller reads the file normally.
+
+Arguments:
+  in           the fopened FILE stream
+  filename     the file name (for errors)
+  printname    the file name if it is to be printed for each match, or NULL
+
+Returns:       -1 if the file was not mapped
+               otherwise the yield from pcre2grep()
 */
 
 static int
-grep_or_recurse(char *pathname, BOOL dir_recurse, BOOL only_one_at_top)
+grep_mapped(FILE *in, const char *filename, const char *printname)
 {
-int rc = 1;
-int frtype;
-void *handle;
-char *lastcomp;
-FILE *in = NULL;           /* Ensure initialized */
+int rc;
+char *map;
+PCRE2_SIZE length;
+struct stat statbuf;
 
-#ifdef SUPPORT_LIBZ
-gzFile ingz = NULL;
-#endif
+if (fstat(fileno(in), &statbuf) != 0 || !S_ISREG(statbuf.st_mode) ||
+    statbuf.st_size <= 0 || (off_t)(size_t)statbuf.st_size != statbuf.st_size)
+  return -1;
 
-#ifdef SUPPORT_LIBBZ2
-BZFILE *inbz2 = NULL;
-#endif
+length = (PCRE2_SIZE)statbuf.st_size;
+map = mmap(NULL, length, PROT_READ|PROT_WRITE, MAP_PRIVATE, fileno(in), 0);
+if (map == MAP_FAILED) return -1;
 
-#if defined SUPPORT_LIBZ || defined SUPPORT_LIBBZ2
-int pathlen;
+#ifdef MADV_SEQUENTIAL
+(void)madvise(map, length, MADV_SEQUENTIAL);
 #endif
 
-#if defined NATIVE_ZOS
-int zos_type;
-FILE *zos_test_file;
-#endif
+rc = grep_region(map, length, filename, printname);
+(void)munmap(map, length);
+return rc;
+}
 
-/* If the file name is "-" we scan stdin */
 
-if (strcmp(pathname, "-") == 0)
+
+/*************************************************
+*       Collect the oldest running job           *
+*************************************************/
+
+/* Wait for the job at the head of the queue to finish, copy its output to
+stdout, and add its counts and return code into the global values. If there is
+no trailer, the worker did not finish normally, and anything it wrote is copied
+without further ado.
+
+Arguments:  none
+Returns:    nothing
+*/
+
+static void
+job_collect(void)
+{
+int rc, status;
+long int size;
+job_item *job = job_queue + job_head;
+job_trailer trailer;
+char buffer[8192];
+
+while (waitpid(job->pid, &status, 0) < 0)
   {
-  if (count_limit >= 0) setbuf(stdin, NULL);
-  return pcre2grep(stdin, FR_PLAIN, stdin_name,
-    (filenames > FN_DEFAULT || (filenames == FN_DEFAULT && !only_one_at_top))?
-      stdin_name : NULL);
+  if (errno != EINTR) { status = 2 << 8; break; }
   }
+rc = (WIFEXITED(status))? WEXITSTATUS(status) : 2;
 
-/* Inclusion and exclusion: --include-dir and --exclude-dir apply only to
-directories, whereas --include and --exclude apply to everything else. The test
-is against the final component of the path. */
-
-lastcomp = strrchr(pathname, FILESEP);
-lastcomp = (lastcomp == NULL)? pathname : lastcomp + 1;
+size = (fseek(job->out, 0, SEEK_END) == 0)? ftell(job->out) : 0;
+if (size >= (long int)sizeof(trailer) &&
+    fseek(job->out, size - (long int)sizeof(trailer), SEEK_SET) == 0 &&
+    fread(&trailer, sizeof(trailer), 1, job->out) == 1 &&
+    trailer.magic == JOB_TRAILER_MAGIC)
+  {
+  size -= sizeof(trailer);
+  rc = trailer.rc;
+  error_count += trailer.error_count;
+  resource_error |= trailer.resource_error;
+  counts_printed += trailer.counts_printed;
+  total_count += trailer.total_count;
+  lines_searched += trailer.lines_searched;
+  lines_prefiltered += trailer.lines_prefiltered;
+  }
+else if (rc < 2) rc = 2;
 
-/* If the file is a directory, skip if not recursing or if explicitly excluded.
-Otherwise, scan the directory and recurse for each path within it. The scanning
-code is localized so it can be made system-specific. */
+rewind(job->out);
+while (size > 0)
+  {
+  size_t n = fread(buffer, 1, (size > (long int)sizeof(buffer))?
+    sizeof(buffer) : (size_t)size, job->out);
+  if (n == 0) break;
+  FWRITE_IGNORE(buffer, 1, n, stdout);
+  size -= n;
+  }
+fclose(job->out);
 
+if (rc > 1) job_rc = rc;
+  else if (rc == 0 && job_rc == 1) job_rc = 0;
 
-/* For z/OS, determine the file type. */
+job_head = (job_head + 1) % jobs;
+job_active--;
+}
 
-#if defined NATIVE_ZOS
-zos_test_file =  fopen(pathname,"rb");
 
-if (zos_test_file == NULL)
-   {
-   if (!silent) fprintf(stderr, "pcre2grep: failed to test next file %s\n",
-     pathname, strerror(errno));
-   return -1;
-   }
-zos_type = identifyzosfiletype (zos_test_file);
-fclose (zos_test_file);
 
-/* Handle a PDS in separate code */
+/*************************************************
+*          Collect all running jobs              *
+*************************************************/
 
-if (zos_type == __ZOS_PDS || zos_type == __ZOS_PDSE)
-   {
-   return travelonpdsdir (pathname, only_one_at_top);
-   }
+/* This is called before the parent writes anything to stdout itself, and at
+the end of the run.
 
-/* Deal with regular files in the normal way below. These types are:
-   zos_type == __ZOS_PDS_MEMBER
-   zos_type == __ZOS_PS
-   zos_type == __ZOS_VSAM_KSDS
-   zos_type == __ZOS_VSAM_ESDS
-   zos_type == __ZOS_VSAM_RRDS
+Arguments:  none
+Returns:    nothing
 */
 
-/* Handle a z/OS directory using common code. */
+static void
+job_collect_all(void)
+{
+while (job_active > 0) job_collect();
+}
 
-else if (zos_type == __ZOS_HFS)
- {
-#endif  /* NATIVE_ZOS */
 
 
-/* Handle directories: common code for all OS */
+/*************************************************
+*           Start a worker process               *
+*************************************************/
 
-if (isdirectory(pathname))
-  {
-  if (dee_action == dee_SKIP ||
-      !test_incexc(lastcomp, include_dir_patterns, exclude_dir_patterns))
-    return -1;
+/* If the queue is full, the oldest job is collected first. In the child, the
+standard output is redirected to the job's temporary file and the accumulated
+values are zeroed, so that the trailer contains only the child's contribution.
 
-  if (dee_action == dee_RECURSE)
-    {
-    char childpath[FNBUFSIZ];
-    char *nextfile;
-    directory_type *dir = opendirectory(pathname);
+Arguments:  none
 
-    if (dir == NULL)
-      {
-      /* LCOV_EXCL_START - this is a "never" event */
-      if (!silent)
-        fprintf(stderr, "pcre2grep: Failed to open directory %s: %s\n", pathname,
-          strerror(errno));
-      return 2;
-      /* LCOV_EXCL_STOP */
-      }
+Returns:    1 in the parent, when a job has been started
+            0 in the child
+           -1 if no job could be started; the caller must search serially
+*/
 
-    while ((nextfile = readdirectory(dir)) != NULL)
-      {
-      int frc;
+static int
+job_start(void)
+{
+FILE *out;
+pid_t pid;
+
+if (job_active >= jobs) job_collect();
+
+out = tmpfile();
+if (out == NULL) return -1;
+
+(void)fflush(stdout);
+pid = fork();
+
+if (pid < 0)
+  {
+  fclose(out);
+  return -1;
+  }
+
+if (pid == 0)
+  {
+  if (dup2(fileno(out), STDOUT_FILENO) < 0) _exit(2);
+  fclose(out);
+  job_child = TRUE;
+  job_active = 0;
+  error_count = 0;
+  resource_error = FALSE;
+  counts_printed = total_count = 0;
+  lines_searched = lines_prefiltered = 0;
+  return 0;
+  }
+
+job_queue[(job_head + job_active) % jobs].pid = pid;
+job_queue[(job_head + job_active) % jobs].out = out;
+job_active++;
+return 1;
+}
+
+
+
+/*************************************************
+*           Finish a worker process              *
+*************************************************/
+
+/* Write the trailer after the child's output and exit without running any
+exit handlers.
+
+Argument:  the return code from the search
+Returns:   does not return
+*/
+
+static void
+job_end(int rc)
+{
+job_trailer trailer;
+
+trailer.magic = JOB_TRAILER_MAGIC;
+trailer.rc = rc;
+trailer.error_count = error_count;
+trailer.resource_error = resource_error;
+trailer.counts_printed = counts_printed;
+trailer.total_count = total_count;
+trailer.lines_searched = lines_searched;
+trailer.lines_prefiltered = lines_prefiltered;
+
+FWRITE_IGNORE(&trailer, sizeof(trailer), 1, stdout);
+(void)fflush(stdout);
+_exit((rc > 1)? 2 : rc);
+}
+
+
+
+/*************************************************
+*     Split a large file between worker jobs     *
+*************************************************/
+
+/* This is called for a plain file when --jobs and --mmap are both set and the
+other options allow it (no context, line numbers, offsets, counts, or other
+state that carries from one line to the next). The file is mapped and cut at
+line boundaries into pieces of at least split_size bytes, each of which is
+searched by its own job. The binary file test is done here on the start of the
+file, and is not repeated for each piece.
+
+Arguments:
+  pathname     the file name
+  printname    the file name if it is to be printed for each match, or NULL
+
+Returns:       TRUE if the file has been handed to jobs
+               FALSE if it is to be searched in the normal way
+*/
+
+static BOOL
+grep_split(const char *pathname, const char *printname)
+{
+BOOL yield = FALSE;
+char *map, *endmap, *start;
+PCRE2_SIZE length, piece;
+struct stat statbuf;
+FILE *in = fopen(pathname, "rb");
+
+if (in == NULL) return FALSE;
+
+if (fstat(fileno(in), &statbuf) != 0 || !S_ISREG(statbuf.st_mode) ||
+    (off_t)(size_t)statbuf.st_size != statbuf.st_size ||
+    (PCRE2_SIZE)statbuf.st_size < 2*split_size)
+  goto END;
+
+length = (PCRE2_SIZE)statbuf.st_size;
+map = mmap(NULL, length, PROT_READ|PROT_WRITE, MAP_PRIVATE, fileno(in), 0);
+if (map == MAP_FAILED) goto END;
+
+if (binary_files != BIN_TEXT && endlinetype != PCRE2_NEWLINE_NUL &&
+    memchr(map, 0, (length > 1024)? 1024 : length) != NULL)
+  {
+  (void)munmap(map, length);
+  goto END;
+  }
+
+piece = length/jobs;
+if (piece < split_size) piece = split_size;
+if (piece == 0) piece = 1;
+endmap = map + length;
+
+/* Start the search for a line ending one character early, so that a CRLF
+pair that straddles the nominal cut is kept together. */
+
+for (start = map; start < endmap;)
+  {
+  int ellength, rc;
+  char *end = ((PCRE2_SIZE)(endmap - start) <= piece)? endmap :
+    end_of_line(start + piece - 1, endmap, &ellength);
+
+  switch (job_start())
+    {
+    case 0:
+    binary_files = BIN_TEXT;
+    job_end(grep_region(start, end - start, pathname, printname));
+    break;   /* Not reached */
+
+    case 1:
+    break;
+
+    default:  /* No job; search this piece here, after all preceding output */
+    job_collect_all();
+    rc = grep_region(start, end - start, pathname, printname);
+    if (rc > 1) job_rc = rc;
+      else if (rc == 0 && job_rc == 1) job_rc = 0;
+    break;
+    }
+
+  start = end;
+  }
+
+(void)munmap(map, length);
+yield = TRUE;
+
+END:
+fclose(in);
+return yield;
+}
+#endif  /* SUPPORT_PCRE2GREP_PARALLEL */
+
+
+
+#if defined SUPPORT_PCRE2GREP_PARALLEL && \
+  (defined SUPPORT_LIBZ || defined SUPPORT_LIBBZ2)
+#ifdef SUPPORT_LIBBZ2
+/*************************************************
+*      Decompress concatenated bzip2 streams     *
+*************************************************/
+
+/* Decompress one or more complete bzip2 streams from memory to stdout. As in
+bzip2 itself, anything after the last stream that does not look like the start
+of another one is ignored.
+
+Arguments:
+  start        start of the compressed data
+  length       its length
+  pathname     the file name (for errors)
+
+Returns:       0 on success, 2 on error
+*/
+
+static int
+bz2_decompress_region(char *start, PCRE2_SIZE length, const char *pathname)
+{
+char *end = start + length;
+char buffer[32*1024];
+
+while (end - start >= 4 && memcmp(start, "BZh", 3) == 0)
+  {
+  int ret;
+  bz_stream strm;
+
+  memset(&strm, 0, sizeof(strm));
+  if (BZ2_bzDecompressInit(&strm, 0, 0) != BZ_OK) return 2;
+  strm.next_in = start;
+  strm.avail_in = 0;
+
+  for (;;)
+    {
+    if (strm.avail_in == 0)
+      {
+      PCRE2_SIZE left = end - strm.next_in;
+      if (left == 0)
+        {
+        ret = BZ_UNEXPECTED_EOF;
+        break;
+        }
+      strm.avail_in = (left > UINT_MAX)? UINT_MAX : (unsigned int)left;
+      }
+    strm.next_out = buffer;
+    strm.avail_out = sizeof(buffer);
+    ret = BZ2_bzDecompress(&strm);
+    if (ret != BZ_OK && ret != BZ_STREAM_END) break;
+    FWRITE_IGNORE(buffer, 1, sizeof(buffer) - strm.avail_out, stdout);
+    if (ret == BZ_STREAM_END) break;
+    }
+
+  start = strm.next_in;
+  (void)BZ2_bzDecompressEnd(&strm);
+
+  if (ret != BZ_STREAM_END)
+    {
+    if (!silent)
+      fprintf(stderr, "pcre2grep: Failed to decompress %s using bzlib: "
+        "error %d\n", pathname, ret);
+    return 2;
+    }
+  }
+
+return 0;
+}
+
+
+
+/*************************************************
+*       Find the start of a bzip2 stream         *
+*************************************************/
+
+/* A stream starts with "BZh", a digit for the block size, and the 48-bit
+magic number that starts the first block. At the start of a stream these are
+byte-aligned, so the search is simple. A false match within compressed data is
+possible in principle, but 80 particular bits are most unlikely to occur.
+
+Arguments:
+  p            where to start looking
+  end          end of the data
+
+Returns:       pointer to the start of a stream, or end if none is found
+*/
+
+static char *
+bz2_find_stream(char *p, char *end)
+{
+while (end - p >= 10)
+  {
+  p = memchr(p, 'B', end - p - 9);
+  if (p == NULL) break;
+  if (p[1] == 'Z' && p[2] == 'h' && p[3] >= '1' && p[3] <= '9' &&
+      memcmp(p + 4, "\x31\x41\x59\x26\x53\x59", 6) == 0)
+    return p;
+  p++;
+  }
+return end;
+}
+#endif  /* SUPPORT_LIBBZ2 */
+
+
+
+/*************************************************
+*    Decompress a file to stdout (child side)    *
+*************************************************/
+
+/* This runs in the decompressing process of a pipeline, whose stdout is the
+pipe. A .gz file is simply read through zlib. A .bz2 file that consists of
+several independent streams (as written by parallel bzip2 compressors, or by
+concatenating files) is cut at stream boundaries into pieces of at least
+split_size bytes, which are decompressed by worker jobs whose output is passed
+on in order. Otherwise the file is decompressed here.
+
+Arguments:
+  pathname     the file name
+  frtype       FR_LIBZ or FR_LIBBZ2
+
+Returns:       0 on success, 2 on error
+*/
+
+static int
+decompress_file(const char *pathname, int frtype)
+{
+int rc = 0;
+
+#ifdef SUPPORT_LIBZ
+if (frtype == FR_LIBZ)
+  {
+  int n;
+  char buffer[32*1024];
+  gzFile ingz = gzopen(pathname, "rb");
+
+  if (ingz == NULL)
+    {
+    if (!silent)
+      fprintf(stderr, "pcre2grep: Failed to open %s: %s\n", pathname,
+        strerror(errno));
+    return 2;
+    }
+
+  while ((n = gzread(ingz, buffer, sizeof(buffer))) > 0)
+    FWRITE_IGNORE(buffer, 1, n, stdout);
+
+  if (n < 0)
+    {
+    int errnum;
+    const char *err = gzerror(ingz, &errnum);
+    if (!silent)
+      fprintf(stderr, "pcre2grep: Failed to read %s using zlib: %s\n",
+        pathname, err);
+    rc = 2;
+    }
+
+  gzclose(ingz);
+  }
+#endif
+
+#ifdef SUPPORT_LIBBZ2
+if (frtype == FR_LIBBZ2)
+  {
+  char *map, *end, *start;
+  PCRE2_SIZE length;
+  struct stat statbuf;
+  FILE *in = fopen(pathname, "rb");
+
+  if (in == NULL ||
+      fstat(fileno(in), &statbuf) != 0 ||
+      (off_t)(size_t)statbuf.st_size != statbuf.st_size ||
+      (map = mmap(NULL, (size_t)statbuf.st_size, PROT_READ, MAP_PRIVATE,
+        fileno(in), 0)) == MAP_FAILED)
+    {
+    if (!silent)
+      fprintf(stderr, "pcre2grep: Failed to open %s: %s\n", pathname,
+        strerror(errno));
+    if (in != NULL) fclose(in);
+    return 2;
+    }
+
+  length = (PCRE2_SIZE)statbuf.st_size;
+  end = map + length;
+
+  for (start = map; start < end;)
+    {
+    char *next = ((PCRE2_SIZE)(end - start) <= split_size)? end :
+      bz2_find_stream(start + split_size, end);
+
+    /* If the whole file is one piece, or the first piece could not be given
+    to a job, decompress it here. */
+
+    if (next == end && start == map)
+      {
+      rc = bz2_decompress_region(start, next - start, pathname);
+      break;
+      }
+
+    switch (job_start())
+      {
+      case 0:
+      job_end(bz2_decompress_region(start, next - start, pathname));
+      break;   /* Not reached */
+
+      case 1:
+      break;
+
+      default:
+      job_collect_all();
+      if (bz2_decompress_region(start, next - start, pathname) != 0)
+        job_rc = 2;
+      break;
+      }
+
+    start = next;
+    }
+
+  job_collect_all();
+  if (job_rc > 1) rc = 2;
+  (void)munmap(map, length);
+  fclose(in);
+  }
+#endif
+
+return rc;
+}
+
+
+
+/*************************************************
+*    Grep a compressed file through a pipeline   *
+*************************************************/
+
+/* When --jobs is greater than one, a compressed file is decompressed in a
+child process that writes into a pipe, while this process searches what comes
+out of the other end. The pipe is the bounded buffer between the two stages.
+If the search stops early (for example, for -l or -q), the decompressor is
+killed by SIGPIPE, which is not an error. A .bz2 file that does not start with
+the bzip2 magic is left to the serial code, which treats it as plain text.
+
+Arguments:
+  pathname     the file name
+  frtype       FR_LIBZ or FR_LIBBZ2
+  printname    the file name if it is to be printed for each match, or NULL
+
+Returns:       -1 if the pipeline could not be set up
+               otherwise the yield from pcre2grep(), or 2 if decompression
+                 failed
+*/
+
+static int
+grep_piped(const char *pathname, int frtype, const char *printname)
+{
+int rc, status;
+int fds[2];
+pid_t pid;
+FILE *in;
+
+#ifdef SUPPORT_LIBBZ2
+if (frtype == FR_LIBBZ2)
+  {
+  char magic[3];
+  BOOL isbz2;
+  FILE *f = fopen(pathname, "rb");
+  if (f == NULL) return -1;
+  isbz2 = fread(magic, 1, 3, f) == 3 && memcmp(magic, "BZh", 3) == 0;
+  fclose(f);
+  if (!isbz2) return -1;
+  }
+#endif
+
+if (pipe(fds) != 0) return -1;
+(void)fflush(stdout);
+pid = fork();
+
+if (pid < 0)
+  {
+  close(fds[0]);
+  close(fds[1]);
+  return -1;
+  }
+
+if (pid == 0)
+  {
+  close(fds[0]);
+  if (dup2(fds[1], STDOUT_FILENO) < 0) _exit(2);
+  close(fds[1]);
+  (void)signal(SIGPIPE, SIG_DFL);
+  job_child = TRUE;
+  job_active = 0;
+  job_rc = 1;
+  rc = decompress_file(pathname, frtype);
+  (void)fflush(stdout);
+  _exit(rc);
+  }
+
+close(fds[1]);
+in = fdopen(fds[0], "rb");
+if (in == NULL)
+  {
+  close(fds[0]);
+  (void)waitpid(pid, &status, 0);
+  return 2;
+  }
+
+rc = pcre2grep(in, FR_PLAIN, pathname, printname);
+fclose(in);
+
+while (waitpid(pid, &status, 0) < 0)
+  {
+  if (errno != EINTR) return rc;
+  }
+if (WIFEXITED(status)? WEXITSTATUS(status) != 0 :
+    !WIFSIGNALED(status) || WTERMSIG(status) != SIGPIPE)
+  rc = 2;
+
+return rc;
+}
+#endif  /* SUPPORT_PCRE2GREP_PARALLEL && (SUPPORT_LIBZ || SUPPORT_LIBBZ2) */
+
+
+
+/*************************************************
+*     Grep a file or recurse into a directory    *
+*************************************************/
+
+/* Given a path name, if it's a directory, scan all the files if we are
+recursing; if it's a file, grep it.
+
+Arguments:
+  pathname          the path to investigate
+  dir_recurse       TRUE if recursing is wanted (-r or -drecurse)
+  only_one_at_top   TRUE if the path is the only one at toplevel
+
+Returns:  -1 the file/directory was skipped, or was handed to a worker job
+           0 if there was at least one match
+           1 if there were no matches
+           2 there was some kind of error
+
+However, file opening failures are suppressed if "silent" is set.
+*/
+
+static int
+grep_or_recurse(char *pathname, BOOL dir_recurse, BOOL only_one_at_top)
+{
+int rc = 1;
+int frtype;
+void *handle;
+char *lastcomp;
+const char *printname;
+FILE *in = NULL;           /* Ensure initialized */
+
+#ifdef SUPPORT_LIBZ
+gzFile ingz = NULL;
+#endif
+
+#ifdef SUPPORT_LIBBZ2
+bz2_reader *inbz2 = NULL;
+#endif
+
+#if defined SUPPORT_LIBZ || defined SUPPORT_LIBBZ2
+int pathlen;
+#endif
+
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+int ztype = FR_PLAIN;
+#endif
+
+#if defined NATIVE_ZOS
+int zos_type;
+FILE *zos_test_file;
+#endif
+
+/* If the file name is "-" we scan stdin, after the output of any running jobs
+has been written. */
+
+if (strcmp(pathname, "-") == 0)
+  {
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+  job_collect_all();
+#endif
+  if (count_limit >= 0) setbuf(stdin, NULL);
+  return pcre2grep(stdin, FR_PLAIN, stdin_name,
+    (filenames > FN_DEFAULT || (filenames == FN_DEFAULT && !only_one_at_top))?
+      stdin_name : NULL);
+  }
+
+/* Inclusion and exclusion: --include-dir and --exclude-dir apply only to
+directories, whereas --include and --exclude apply to everything else. The test
+is against the final component of the path. */
+
+lastcomp = strrchr(pathname, FILESEP);
+lastcomp = (lastcomp == NULL)? pathname : lastcomp + 1;
+
+/* If the file is a directory, skip if not recursing or if explicitly excluded.
+Otherwise, scan the directory and recurse for each path within it. The scanning
+code is localized so it can be made system-specific. */
+
+
+/* For z/OS, determine the file type. */
+
+#if defined NATIVE_ZOS
+zos_test_file =  fopen(pathname,"rb");
+
+if (zos_test_file == NULL)
+   {
+   if (!silent) fprintf(stderr, "pcre2grep: failed to test next file %s\n",
+     pathname, strerror(errno));
+   return -1;
+   }
+zos_type = identifyzosfiletype (zos_test_file);
+fclose (zos_test_file);
+
+/* Handle a PDS in separate code */
+
+if (zos_type == __ZOS_PDS || zos_type == __ZOS_PDSE)
+   {
+   return travelonpdsdir (pathname, only_one_at_top);
+   }
+
+/* Deal with regular files in the normal way below. These types are:
+   zos_type == __ZOS_PDS_MEMBER
+   zos_type == __ZOS_PS
+   zos_type == __ZOS_VSAM_KSDS
+   zos_type == __ZOS_VSAM_ESDS
+   zos_type == __ZOS_VSAM_RRDS
+*/
+
+/* Handle a z/OS directory using common code. */
+
+else if (zos_type == __ZOS_HFS)
+ {
+#endif  /* NATIVE_ZOS */
+
+
+/* Handle directories: common code for all OS */
+
+if (isdirectory(pathname))
+  {
+  if (dee_action == dee_SKIP ||
+      !test_incexc(lastcomp, include_dir_patterns, exclude_dir_patterns))
+    return -1;
+
+  if (dee_action == dee_RECURSE)
+    {
+    char childpath[FNBUFSIZ];
+    char *nextfile;
+    directory_type *dir = opendirectory(pathname);
+
+    if (dir == NULL)
+      {
+      /* LCOV_EXCL_START - this is a "never" event */
+      if (!silent)
+        fprintf(stderr, "pcre2grep: Failed to open directory %s: %s\n", pathname,
+          strerror(errno));
+      return 2;
+      /* LCOV_EXCL_STOP */
+      }
+
+    while ((nextfile = readdirectory(dir)) != NULL)
+      {
+      int frc;
       int fnlength = strlen(pathname) + strlen(nextfile) + 2;
       if (fnlength > FNBUFSIZ)
         {
@@ -3545,6 +4549,56 @@ the file name, or the filename was forced (-H). */
 pathlen = (int)(strlen(pathname));
 #endif
 
+printname = (filenames > FN_DEFAULT ||
+  (filenames == FN_DEFAULT && !only_one_at_top))? pathname : NULL;
+
+/* When searching in parallel, hand the file to a worker job, which comes back
+here with job_child set in order to search it in the normal way. A large plain
+file may instead be split into pieces, each with its own job. */
+
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+#ifdef SUPPORT_LIBZ
+if (pathlen > 3 && strcmp(pathname + pathlen - 3, ".gz") == 0)
+  ztype = FR_LIBZ;
+#endif
+
+#ifdef SUPPORT_LIBBZ2
+if (pathlen > 4 && strcmp(pathname + pathlen - 4, ".bz2") == 0)
+  ztype = FR_LIBBZ2;
+#endif
+
+if (jobs > 1 && !job_child)
+  {
+  if (split_ok && ztype == FR_PLAIN && grep_split(pathname, printname))
+    return -1;
+
+  switch (job_start())
+    {
+    case 0:
+    job_end(grep_or_recurse(pathname, dir_recurse, only_one_at_top));
+    break;   /* Not reached */
+
+    case 1:
+    return -1;
+
+    default:  /* No job; search the file here, after all preceding output */
+    job_collect_all();
+    break;
+    }
+  }
+
+/* A compressed file is decompressed by a separate process when searching in
+parallel. */
+
+#if defined SUPPORT_LIBZ || defined SUPPORT_LIBBZ2
+if (jobs > 1 && ztype != FR_PLAIN)
+  {
+  rc = grep_piped(pathname, ztype, printname);
+  if (rc >= 0) return rc;
+  }
+#endif
+#endif  /* SUPPORT_PCRE2GREP_PARALLEL */
+
 /* Open using zlib if it is supported and the file name ends with .gz. */
 
 #ifdef SUPPORT_LIBZ
@@ -3571,7 +4625,7 @@ else
 #ifdef SUPPORT_LIBBZ2
 if (pathlen > 4 && strcmp(pathname + pathlen - 4, ".bz2") == 0)
   {
-  inbz2 = BZ2_bzopen(pathname, "rb");
+  inbz2 = bz2_open(pathname);
   handle = (void *)inbz2;
   frtype = FR_LIBBZ2;
   }
@@ -3600,10 +4654,14 @@ if (handle == NULL)
   return 2;
   }
 
-/* Now grep the file */
+/* Now grep the file, via a memory mapping if requested and possible. */
 
-rc = pcre2grep(handle, frtype, pathname, (filenames > FN_DEFAULT ||
-  (filenames == FN_DEFAULT && !only_one_at_top))? pathname : NULL);
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+rc = (use_mmap && frtype == FR_PLAIN)?
+  grep_mapped(in, pathname, printname) : -1;
+if (rc < 0)
+#endif
+rc = pcre2grep(handle, frtype, pathname, printname);
 
 /* Close in an appropriate manner. */
 
@@ -3622,21 +4680,19 @@ if (frtype == FR_LIBBZ2)
   {
   if (rc == 3)
     {
-    int errnum;
-    const char *err = BZ2_bzerror(inbz2, &errnum);
-    if (errnum == BZ_DATA_ERROR_MAGIC)
+    if (inbz2->error == BZ_DATA_ERROR_MAGIC)
       {
-      BZ2_bzclose(inbz2);
+      bz2_close(inbz2);
       goto PLAIN_FILE;
       }
     /* LCOV_EXCL_START */
     else if (!silent)
-      fprintf(stderr, "pcre2grep: Failed to read %s using bzlib: %s\n",
-        pathname, err);
+      fprintf(stderr, "pcre2grep: Failed to read %s using bzlib: error %d\n",
+        pathname, inbz2->error);
     rc = 2;    /* The normal "something went wrong" code */
     /* LCOV_EXCL_STOP */
     }
-  BZ2_bzclose(inbz2);
+  bz2_close(inbz2);
   }
 else
 #endif
@@ -3667,7 +4723,10 @@ switch(letter)
   case N_HELP: help(); pcre2grep_exit(0); break; /* Stops compiler warning */
   case N_LBUFFER: line_buffered = TRUE; break;
   case N_LOFFSETS: line_offsets = number = TRUE; break;
+  case N_MMAP: use_mmap = TRUE; break;
   case N_NOJIT: use_jit = FALSE; break;
+  case N_NO_PREFILTER: use_prefilter = FALSE; break;
+  case N_STATS: show_stats = TRUE; break;
   case N_ALLABSK: extra_options |= PCRE2_EXTRA_ALLOW_LOOKAROUND_BSK; break;
   case N_NO_GROUP_SEPARATOR: group_separator = NULL; break;
   case N_POSIX_PATFILE: posix_pattern_file = TRUE; break;
@@ -3752,6 +4811,87 @@ return buffer;
 
 
 
+/*************************************************
+*         Set up a literal prefilter             *
+*************************************************/
+
+/* If every match of a pattern must contain a certain code unit or literal
+string, lines that do not contain it can be skipped without calling
+pcre2_match(). For a literal (-F) pattern without -i, the whole string is used.
+Otherwise the first code unit, or failing that the required (last) code unit,
+that pcre2_pattern_info() reports is used. This is the same test that
+pcre2_match() makes before it starts matching, so no match can be lost.
+However, pcre2_pattern_info() does not say whether the code unit is caseless,
+so both cases are looked for if caseless matching is possible at all. If the
+other case of a non-ASCII code unit might be needed, no prefilter is set.
+
+Arguments:
+  p            the pattern block, which has been compiled
+  ps           the pattern string
+  patlen       its length
+
+Returns:       nothing
+*/
+
+static void
+set_prefilter(patstr *p, char *ps, PCRE2_SIZE patlen)
+{
+uint32_t argoptions, alloptions, unit, type;
+BOOL caseless;
+
+(void)pcre2_pattern_info(p->compiled, PCRE2_INFO_ARGOPTIONS, &argoptions);
+(void)pcre2_pattern_info(p->compiled, PCRE2_INFO_ALLOPTIONS, &alloptions);
+/* Invalid UTF is diagnosed by pcre2_match() even in a line that could not
+match, unless it is allowed. */
+
+if ((alloptions & PCRE2_NO_START_OPTIMIZE) != 0 ||
+    (alloptions & (PCRE2_UTF|PCRE2_MATCH_INVALID_UTF)) == PCRE2_UTF)
+  return;
+
+if ((argoptions & (PCRE2_LITERAL|PCRE2_CASELESS)) == PCRE2_LITERAL)
+  {
+  if (patlen == 0) return;
+  p->pf_string = (char *)malloc(patlen);
+  if (p->pf_string == NULL) return;
+  memcpy(p->pf_string, ps, patlen);
+  p->pf_length = patlen;
+  p->pf_type = PF_LITERAL;
+  return;
+  }
+
+/* Caseless matching can be turned on within a pattern only by an option
+setting, all of which start with "(?". */
+
+caseless = (argoptions & PCRE2_CASELESS) != 0;
+if (!caseless && (argoptions & PCRE2_LITERAL) == 0)
+  {
+  PCRE2_SIZE i;
+  for (i = 1; i < patlen && !caseless; i++)
+    caseless = ps[i-1] == '(' && ps[i] == '?';
+  }
+
+(void)pcre2_pattern_info(p->compiled, PCRE2_INFO_FIRSTCODETYPE, &type);
+if (type == 1)
+  (void)pcre2_pattern_info(p->compiled, PCRE2_INFO_FIRSTCODEUNIT, &unit);
+else
+  {
+  (void)pcre2_pattern_info(p->compiled, PCRE2_INFO_LASTCODETYPE, &type);
+  if (type != 1) return;
+  (void)pcre2_pattern_info(p->compiled, PCRE2_INFO_LASTCODEUNIT, &unit);
+  }
+
+p->pf_units[0] = p->pf_units[1] = (uint8_t)unit;
+if (caseless)
+  {
+  if (unit < 128)
+    p->pf_units[1] = (uint8_t)(islower(unit)? toupper(unit) : tolower(unit));
+  else if ((alloptions & PCRE2_UTF) == 0) return;
+  }
+p->pf_type = PF_UNIT;
+}
+
+
+
 /*************************************************
 *          Compile a single pattern              *
 *************************************************/
@@ -3814,6 +4954,7 @@ if (p->compiled != NULL)
 #ifdef SUPPORT_PCRE2GREP_JIT
   if (use_jit) (void)pcre2_jit_compile(p->compiled, PCRE2_JIT_COMPLETE);
 #endif
+  if (use_prefilter) set_prefilter(p, ps, patlen);
   return TRUE;
   }
 
@@ -4274,6 +5415,27 @@ if (both_context > 0)
   if (before_context == 0) before_context = both_context;
   }
 
+/* Searching in parallel is not possible when output for one file may depend
+on what was output for the previous one (the separators between context
+groups), nor when output is line-buffered. Splitting a single file into pieces
+is further restricted to options that do not need any state to be carried from
+one piece to the next. */
+
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+if (jobs > 1 && (before_context > 0 || after_context > 0 || line_buffered))
+  jobs = 1;
+
+if (jobs > 1)
+  {
+  job_queue = (job_item *)malloc(jobs * sizeof(job_item));
+  if (job_queue == NULL) jobs = 1;
+  }
+
+split_ok = jobs > 1 && use_mmap && !multiline && !number && !file_offsets &&
+  !line_offsets && !count_only && count_limit < 0 &&
+  filenames != FN_MATCH_ONLY && filenames != FN_NOMATCH_ONLY;
+#endif
+
 /* Only one of --only-matching, --output, --file-offsets, or --line-offsets is
 permitted. They display, each in their own way, only the data that has matched.
 */
@@ -4532,6 +5694,14 @@ for (fn = pattern_files; fn != NULL; fn = fn->next)
   if (!read_pattern_file(fn->name, &patterns, &patterns_last)) goto EXIT2;
   }
 
+/* The literal prefilter can be used only if every pattern has one. It is not
+used in multiline mode, where a match can extend beyond the line in which it
+starts. */
+
+if (multiline) use_prefilter = FALSE;
+for (cp = patterns; cp != NULL && use_prefilter; cp = cp->next)
+  if (cp->pf_type == PF_NONE) use_prefilter = FALSE;
+
 /* Unless JIT has been explicitly disabled, arrange a stack for it to use. */
 
 #ifdef SUPPORT_PCRE2GREP_JIT
@@ -4639,6 +5809,14 @@ for (; i < argc; i++)
     else if (frc == 0 && rc == 1) rc = 0;
   }
 
+/* Collect any outstanding jobs and merge their return code. */
+
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+job_collect_all();
+if (job_rc > 1) rc = job_rc;
+  else if (job_rc == 0 && rc == 1) rc = 0;
+#endif
+
 /* Show the total number of matches if requested, but not if only one file's
 count was printed. */
 
@@ -4650,12 +5828,32 @@ if (show_total_count && counts_printed != 1 && filenames != FN_NOMATCH_ONLY)
   }
 
 EXIT:
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+job_collect_all();     /* In case of an error exit */
+#endif
+
+/* Output from the searches must all be out before the statistics, which are
+written to stderr, in case both go to the same place. */
+
+if (show_stats)
+  {
+  fflush(stdout);
+  fprintf(stderr, "pcre2grep: literal prefilter: %s\n",
+    use_prefilter? "on" : "off");
+  fprintf(stderr, "pcre2grep: lines searched: %lu\n", lines_searched);
+  fprintf(stderr, "pcre2grep: lines skipped by prefilter: %lu\n",
+    lines_prefiltered);
+  }
+
 #ifdef SUPPORT_PCRE2GREP_JIT
 pcre2_jit_free_unused_memory(NULL);
 if (jit_stack != NULL) pcre2_jit_stack_free(jit_stack);
 #endif
 
 free(main_buffer);
+#ifdef SUPPORT_PCRE2GREP_PARALLEL
+free(job_queue);
+#endif
 if (character_tables != NULL) pcre2_maketables_free(NULL, character_tables);
 
 pcre2_compile_context_free(compile_context);
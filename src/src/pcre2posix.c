@@ -144,28 +144,29 @@ static const int eint2[] = {
  102, REG_EESCAPE  /* \ddd octal > \377 in PYTHON_OCTAL mode */
 };
 
-/* Table of texts corresponding to POSIX error codes */
-
-static const char *const pstring[] = {
-  "",                                /* Dummy for value 0 */
-  "internal error",                  /* REG_ASSERT */
-  "invalid repeat counts in {}",     /* BADBR      */
-  "pattern error",                   /* BADPAT     */
-  "? * + invalid",                   /* BADRPT     */
-  "unbalanced {}",                   /* EBRACE     */
-  "unbalanced []",                   /* EBRACK     */
-  "collation error - not relevant",  /* ECOLLATE   */
-  "bad class",                       /* ECTYPE     */
-  "bad escape sequence",             /* EESCAPE    */
-  "empty expression",                /* EMPTY      */
-  "unbalanced ()",                   /* EPAREN     */
-  "bad range inside []",             /* ERANGE     */
-  "expression too big",              /* ESIZE      */
-  "failed to get memory",            /* ESPACE     */
-  "bad back reference",              /* ESUBREG    */
-  "bad argument",                    /* INVARG     */
-  "match failed"                     /* NOMATCH    */
-};
+/* Texts corresponding to POSIX error codes, starting at REG_ASSERT. They are
+in a single string so that a shared library needs no relocations for them. Each
+text ends with \0, which includes the last one, so that the whole string ends
+with \0\0. */
+
+static const char pstring[] =
+  "internal error\0"                 /* REG_ASSERT */
+  "invalid repeat counts in {}\0"    /* BADBR      */
+  "pattern error\0"                  /* BADPAT     */
+  "? * + invalid\0"                  /* BADRPT     */
+  "unbalanced {}\0"                  /* EBRACE     */
+  "unbalanced []\0"                  /* EBRACK     */
+  "collation error - not relevant\0" /* ECOLLATE   */
+  "bad class\0"                      /* ECTYPE     */
+  "bad escape sequence\0"            /* EESCAPE    */
+  "empty expression\0"               /* EMPTY      */
+  "unbalanced ()\0"                  /* EPAREN     */
+  "bad range inside []\0"            /* ERANGE     */
+  "expression too big\0"             /* ESIZE      */
+  "failed to get memory\0"           /* ESPACE     */
+  "bad back reference\0"             /* ESUBREG    */
+  "bad argument\0"                   /* INVARG     */
+  "match failed\0";                  /* NOMATCH    */
 
 static int message_len(const char *message, int offset)
 {
@@ -183,12 +184,13 @@ PCRE2POSIX_EXP_DEFN size_t PCRE2_CALL_CONVENTION
 pcre2_regerror(int errcode, const regex_t *preg, char *errbuf,
   size_t errbuf_size)
 {
-int ret;
-const char *message;
+int ret, n;
+const char *message = pstring;
 size_t len = 0; /* keeps 0 if snprintf is used */
 
-message = (errcode <= 0 || errcode >= (int)(sizeof(pstring)/sizeof(char *)))?
-  "unknown error code" : pstring[errcode];
+for (n = errcode; n > 1 && *message != 0; n--)
+  while (*message++ != 0) {};
+if (errcode <= 0 || *message == 0) message = "unknown error code";
 
 if (preg != NULL && (int)preg->re_erroffset != -1)
   {
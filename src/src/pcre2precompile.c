@@ -0,0 +1,744 @@
+/*************************************************
+*            pcre2precompile program             *
+*************************************************/
+
+/* This program compiles a list of patterns at build time and writes out the
+result of pcre2_serialize_encode() as C source, so that the compiled patterns
+can be linked into an application and restored at run time by
+pcre2_serialize_decode(), without parsing and compiling them again. Because
+serialized patterns can be decoded only by the same version of PCRE2, built for
+the same code unit width, link size, and pointer size, this program must be
+linked with the same libraries as the application that uses its output.
+
+           Copyright (c) 2024 University of Cambridge
+
+-----------------------------------------------------------------------------
+Redistribution and use in source and binary forms, with or without
+modification, are permitted provided that the following conditions are met:
+
+    * Redistributions of source code must retain the above copyright notice,
+      this list of conditions and the following disclaimer.
+
+    * Redistributions in binary form must reproduce the above copyright
+      notice, this list of conditions and the following disclaimer in the
+      documentation and/or other materials provided with the distribution.
+
+    * Neither the name of the University of Cambridge nor the names of its
+      contributors may be used to endorse or promote products derived from
+      this software without specific prior written permission.
+
+THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE
+LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+POSSIBILITY OF SUCH DAMAGE.
+-----------------------------------------------------------------------------
+*/
+
+#ifdef HAVE_CONFIG_H
+#include "config.h"
+#endif
+
+#include <ctype.h>
+#include <errno.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+/* All the code unit widths that have been built are supported, so the
+width-specific function names are used explicitly. */
+
+#define PCRE2_CODE_UNIT_WIDTH 0
+#include "pcre2.h"
+
+#define MAX_PATTERN_LINE 65536
+#define DEFAULT_NAME "pcre2_patterns"
+#define BYTES_PER_LINE 12
+
+typedef struct patline {
+  uint32_t *units;        /* Pattern as code points */
+  size_t length;          /* Number of code points */
+  char *text;             /* Pattern as it appeared in the file */
+  unsigned long line;     /* Line number in the file */
+} patline;
+
+static const char *pattern_file;
+static int width = 8;
+
+
+
+/*************************************************
+*                Usage message                   *
+*************************************************/
+
+static void
+usage(void)
+{
+fprintf(stderr,
+  "Usage: pcre2precompile [options] <pattern file> <output.c> [<output.h>]\n"
+  "Each line of the pattern file, other than empty lines and lines that\n"
+  "start with #, is a pattern. Write \\# for a pattern that starts with #.\n"
+  "Options:\n"
+  "  -i        compile caseless (PCRE2_CASELESS)\n"
+  "  -m        compile multiline (PCRE2_MULTILINE)\n"
+  "  -n <name> name of the generated symbols (default " DEFAULT_NAME ")\n"
+  "  -s        dot matches newline (PCRE2_DOTALL)\n"
+  "  -u        compile in UTF mode (PCRE2_UTF)\n"
+  "  -U        compile in UTF and UCP mode (PCRE2_UTF|PCRE2_UCP)\n"
+  "  -w <n>    code unit width: 8, 16 or 32 (default 8)\n"
+  "  -x        extended syntax (PCRE2_EXTENDED)\n");
+}
+
+
+
+/*************************************************
+*          Decode a line of the pattern file     *
+*************************************************/
+
+/* The file is read as UTF-8 so that patterns with non-ASCII characters can be
+given for the 16-bit and 32-bit libraries. A byte that does not start a valid
+UTF-8 sequence is taken as a single character with its own value. The 8-bit
+library is given the bytes of the line unchanged.
+
+Arguments:
+  s          the line, without its terminator
+  length     its length
+  out        where to put the code points (at least length of them)
+
+Returns:     the number of code points
+*/
+
+static size_t
+decode_line(const unsigned char *s, size_t length, uint32_t *out)
+{
+size_t n = 0;
+size_t i = 0;
+
+while (i < length)
+  {
+  uint32_t c = s[i];
+  int extra = (c >= 0xf0 && c < 0xf8)? 3 : (c >= 0xe0)? 2 : (c >= 0xc0)? 1 : 0;
+  int k;
+
+  if (c >= 0xf8) extra = 0;
+  if (extra == 0 || i + extra >= length)
+    {
+    out[n++] = c;
+    i++;
+    continue;
+    }
+
+  c &= 0x3f >> extra;
+  for (k = 1; k <= extra; k++)
+    {
+    if ((s[i+k] & 0xc0) != 0x80) break;
+    c = (c << 6) | (s[i+k] & 0x3f);
+    }
+
+  if (k <= extra)
+    {
+    out[n++] = s[i++];
+    continue;
+    }
+
+  out[n++] = c;
+  i += extra + 1;
+  }
+
+return n;
+}
+
+
+
+/*************************************************
+*            Read the pattern file               *
+*************************************************/
+
+/*
+Arguments:
+  f          the open file
+  count      where to return the number of patterns, or -1 on error
+
+Returns:     a vector of patterns, or NULL if there are none
+*/
+
+static patline *
+read_patterns(FILE *f, int *count)
+{
+char *buffer = malloc(MAX_PATTERN_LINE + 2);
+patline *pats = NULL;
+int size = 0;
+unsigned long line = 0;
+
+*count = 0;
+if (buffer == NULL) goto NOMEMORY;
+
+while (fgets(buffer, MAX_PATTERN_LINE + 2, f) != NULL)
+  {
+  size_t length = strlen(buffer);
+  patline *p;
+
+  line++;
+  if (length > MAX_PATTERN_LINE)
+    {
+    fprintf(stderr, "pcre2precompile: %s:%lu: line is too long\n",
+      pattern_file, line);
+    goto FAILED;
+    }
+
+  while (length > 0 &&
+    (buffer[length-1] == '\n' || buffer[length-1] == '\r'))
+    length--;
+  buffer[length] = 0;
+  if (length == 0 || buffer[0] == '#') continue;
+
+  if (*count >= size)
+    {
+    patline *new_pats;
+    size = (size == 0)? 64 : size * 2;
+    new_pats = realloc(pats, size * sizeof(patline));
+    if (new_pats == NULL) goto NOMEMORY;
+    pats = new_pats;
+    }
+
+  p = pats + *count;
+  p->line = line;
+  p->text = malloc(length + 1);
+  p->units = malloc(length * sizeof(uint32_t));
+  if (p->text == NULL || p->units == NULL)
+    {
+    free(p->text);
+    free(p->units);
+    goto NOMEMORY;
+    }
+  memcpy(p->text, buffer, length + 1);
+  p->length = decode_line((unsigned char *)buffer, length, p->units);
+  (*count)++;
+  }
+
+free(buffer);
+return pats;
+
+NOMEMORY:
+fprintf(stderr, "pcre2precompile: malloc failed\n");
+
+FAILED:
+while (*count > 0)
+  {
+  (*count)--;
+  free(pats[*count].text);
+  free(pats[*count].units);
+  }
+free(pats);
+free(buffer);
+*count = -1;
+return NULL;
+}
+
+
+
+/*************************************************
+*     Report a compile error for a pattern       *
+*************************************************/
+
+static void
+compile_error(const patline *p, const char *message, size_t offset)
+{
+fprintf(stderr, "pcre2precompile: %s:%lu: error at offset %lu: %s\n",
+  pattern_file, p->line, (unsigned long)offset, message);
+}
+
+
+
+/*************************************************
+*     Compile and serialize for each width       *
+*************************************************/
+
+/* There is one of these functions for each code unit width that has been
+built. Each converts the patterns to its own code units, compiles them, and
+serializes the result.
+
+Arguments:
+  pats       the patterns
+  count      the number of patterns
+  options    compile options
+  bytes      where to return the serialized data
+  size       where to return its size
+
+Returns:     0 on success, 1 on failure
+*/
+
+#ifdef SUPPORT_PCRE2_8
+static int
+encode_8(patline *pats, int count, uint32_t options, uint8_t **bytes,
+  PCRE2_SIZE *size)
+{
+int i, rc = 0;
+pcre2_code_8 **codes = calloc(count, sizeof(pcre2_code_8 *));
+
+if (codes == NULL) return 1;
+
+for (i = 0; i < count; i++)
+  {
+  patline *p = pats + i;
+  PCRE2_SIZE erroffset;
+  int errcode;
+
+  codes[i] = pcre2_compile_8((PCRE2_SPTR8)p->text, PCRE2_ZERO_TERMINATED,
+    options, &errcode, &erroffset, NULL);
+
+  if (codes[i] == NULL)
+    {
+    PCRE2_UCHAR8 message[256];
+    pcre2_get_error_message_8(errcode, message, sizeof(message));
+    compile_error(p, (char *)message, erroffset);
+    rc = 1;
+    break;
+    }
+  }
+
+if (rc == 0 && pcre2_serialize_encode_8((const pcre2_code_8 **)codes, count,
+    bytes, size, NULL) < 0)
+  rc = 1;
+
+for (i = 0; i < count; i++) pcre2_code_free_8(codes[i]);
+free(codes);
+return rc;
+}
+#endif  /* SUPPORT_PCRE2_8 */
+
+
+#ifdef SUPPORT_PCRE2_16
+static int
+encode_16(patline *pats, int count, uint32_t options, uint8_t **bytes,
+  PCRE2_SIZE *size)
+{
+int i, rc = 0;
+pcre2_code_16 **codes = calloc(count, sizeof(pcre2_code_16 *));
+
+if (codes == NULL) return 1;
+
+for (i = 0; i < count; i++)
+  {
+  patline *p = pats + i;
+  PCRE2_UCHAR16 *pattern = malloc(2 * p->length * sizeof(PCRE2_UCHAR16) + 1);
+  PCRE2_SIZE erroffset;
+  size_t j, n = 0;
+  int errcode;
+
+  if (pattern == NULL) { rc = 1; break; }
+
+  /* Characters above 0xffff are written as surrogate pairs */
+
+  for (j = 0; j < p->length; j++)
+    {
+    uint32_t c = p->units[j];
+    if (c > 0xffff)
+      {
+      c -= 0x10000;
+      pattern[n++] = (PCRE2_UCHAR16)(0xd800 | (c >> 10));
+      pattern[n++] = (PCRE2_UCHAR16)(0xdc00 | (c & 0x3ff));
+      }
+    else pattern[n++] = (PCRE2_UCHAR16)c;
+    }
+
+  codes[i] = pcre2_compile_16(pattern, n, options, &errcode, &erroffset,
+    NULL);
+  free(pattern);
+
+  if (codes[i] == NULL)
+    {
+    PCRE2_UCHAR16 message16[256];
+    char message[256];
+    int k, len = pcre2_get_error_message_16(errcode, message16, 256);
+    for (k = 0; k < len; k++) message[k] = (char)message16[k];
+    message[(len < 0)? 0 : len] = 0;
+    compile_error(p, message, erroffset);
+    rc = 1;
+    break;
+    }
+  }
+
+if (rc == 0 && pcre2_serialize_encode_16((const pcre2_code_16 **)codes, count,
+    bytes, size, NULL) < 0)
+  rc = 1;
+
+for (i = 0; i < count; i++) pcre2_code_free_16(codes[i]);
+free(codes);
+return rc;
+}
+#endif  /* SUPPORT_PCRE2_16 */
+
+
+#ifdef SUPPORT_PCRE2_32
+static int
+encode_32(patline *pats, int count, uint32_t options, uint8_t **bytes,
+  PCRE2_SIZE *size)
+{
+int i, rc = 0;
+pcre2_code_32 **codes = calloc(count, sizeof(pcre2_code_32 *));
+
+if (codes == NULL) return 1;
+
+for (i = 0; i < count; i++)
+  {
+  patline *p = pats + i;
+  PCRE2_SIZE erroffset;
+  int errcode;
+
+  codes[i] = pcre2_compile_32((PCRE2_SPTR32)p->units, p->length, options,
+    &errcode, &erroffset, NULL);
+
+  if (codes[i] == NULL)
+    {
+    PCRE2_UCHAR32 message32[256];
+    char message[256];
+    int k, len = pcre2_get_error_message_32(errcode, message32, 256);
+    for (k = 0; k < len; k++) message[k] = (char)message32[k];
+    message[(len < 0)? 0 : len] = 0;
+    compile_error(p, message, erroffset);
+    rc = 1;
+    break;
+    }
+  }
+
+if (rc == 0 && pcre2_serialize_encode_32((const pcre2_code_32 **)codes, count,
+    bytes, size, NULL) < 0)
+  rc = 1;
+
+for (i = 0; i < count; i++) pcre2_code_free_32(codes[i]);
+free(codes);
+return rc;
+}
+#endif  /* SUPPORT_PCRE2_32 */
+
+
+
+/*************************************************
+*        Check the version of the library        *
+*************************************************/
+
+/* Serialized data can be decoded only by the version of PCRE2 that encoded
+it. The version recorded in the generated files is that of the headers this
+program was compiled with, so refuse to run if the library that has been
+loaded is a different one (for example, a system copy of PCRE2 found instead
+of the one installed alongside this program).
+
+Arguments:   none
+Returns:     TRUE if the library matches the headers
+*/
+
+static int
+check_library_version(void)
+{
+uint32_t units[32];
+char version[32];
+int i, major, minor;
+int n = -1;
+
+switch(width)
+  {
+#ifdef SUPPORT_PCRE2_8
+  case 8: n = pcre2_config_8(PCRE2_CONFIG_VERSION, units); break;
+#endif
+#ifdef SUPPORT_PCRE2_16
+  case 16: n = pcre2_config_16(PCRE2_CONFIG_VERSION, units); break;
+#endif
+#ifdef SUPPORT_PCRE2_32
+  case 32: n = pcre2_config_32(PCRE2_CONFIG_VERSION, units); break;
+#endif
+  }
+
+for (i = 0; i < n && i < (int)sizeof(version) - 1; i++)
+  version[i] = (char)((width == 8)? ((uint8_t *)units)[i] :
+    (width == 16)? ((uint16_t *)units)[i] : units[i]);
+version[i] = 0;
+
+if (sscanf(version, "%d.%d", &major, &minor) == 2 && major == PCRE2_MAJOR &&
+    minor == PCRE2_MINOR) return 1;
+fprintf(stderr, "pcre2precompile: built for PCRE2 %d.%d, but the %d-bit "
+  "library loaded is version %s\n", PCRE2_MAJOR, PCRE2_MINOR, width, version);
+return 0;
+}
+
+
+
+/*************************************************
+*           Write the generated source           *
+*************************************************/
+
+/* The bytes are wrapped in a union so that they are aligned as the header of
+the serialized data requires. A <name>_decode() function is added, which checks
+that the library it is linked with is the version of PCRE2 that was used here
+before decoding the patterns; otherwise it returns PCRE2_ERROR_BADMODE, as
+pcre2_serialize_decode() would.
+
+Arguments:
+  f          the output file
+  name       the symbol name
+  bytes      the serialized data
+  size       its size
+  count      the number of patterns
+
+Returns:     nothing
+*/
+
+static void
+write_source(FILE *f, const char *name, const uint8_t *bytes, PCRE2_SIZE size,
+  int count)
+{
+PCRE2_SIZE i;
+
+fprintf(f, "/* Generated by pcre2precompile from %s for the %d-bit library.\n"
+  "Do not edit. */\n\n", pattern_file, width);
+fprintf(f, "#include <stddef.h>\n\n");
+fprintf(f, "#undef PCRE2_CODE_UNIT_WIDTH\n#define PCRE2_CODE_UNIT_WIDTH 0\n"
+  "#include <pcre2.h>\n\n");
+fprintf(f, "static const union {\n  unsigned char bytes[%lu];\n"
+  "  double align;\n  } %s_data = {{\n", (unsigned long)size, name);
+
+for (i = 0; i < size; i++)
+  fprintf(f, "%s0x%02x%s", (i % BYTES_PER_LINE == 0)? "  " : "",
+    bytes[i], (i == size - 1)? "\n" :
+      (i % BYTES_PER_LINE == BYTES_PER_LINE - 1)? ",\n" : ",");
+
+fprintf(f, "  }};\n\n");
+fprintf(f, "const unsigned char *const %s = %s_data.bytes;\n", name, name);
+fprintf(f, "const size_t %s_size = %lu;\n", name, (unsigned long)size);
+fprintf(f, "const int %s_count = %d;\n\n", name, count);
+
+fprintf(f, "int\n%s_decode(pcre2_code_%d **codes, "
+  "pcre2_general_context_%d *gcontext)\n{\n", name, width, width);
+fprintf(f, "static const char expected[] = \"%d.%d \";\n", PCRE2_MAJOR,
+  PCRE2_MINOR);
+fprintf(f, "PCRE2_UCHAR%d version[32];\nint i;\n\n", width);
+fprintf(f, "if (pcre2_config_%d(PCRE2_CONFIG_VERSION, version) < 0)\n"
+  "  return PCRE2_ERROR_BADMODE;\n", width);
+fprintf(f, "for (i = 0; expected[i] != 0; i++)\n"
+  "  if (version[i] != (PCRE2_UCHAR%d)expected[i]) "
+  "return PCRE2_ERROR_BADMODE;\n", width);
+fprintf(f, "return pcre2_serialize_decode_%d(codes, %s_count, %s, gcontext);\n"
+  "}\n", width, name, name);
+}
+
+
+
+/*************************************************
+*           Write the generated header           *
+*************************************************/
+
+/* The header lists the patterns in a comment so that their index numbers can
+be seen. It records the version of PCRE2 that encoded them, and stops the
+compilation if it is included after a pcre2.h from another version.
+
+Arguments:
+  f          the output file
+  name       the symbol name
+  pats       the patterns
+  count      the number of patterns
+
+Returns:     nothing
+*/
+
+static void
+write_header(FILE *f, const char *name, patline *pats, int count)
+{
+int i;
+
+fprintf(f, "/* Generated by pcre2precompile from %s for the %d-bit library.\n"
+  "Do not edit.\n\n", pattern_file, width);
+fprintf(f, "Encoded by PCRE2 %d.%d. Decode with %s_decode(codes, NULL), which\n"
+  "checks that the library is the same version and then calls\n"
+  "pcre2_serialize_decode(codes, %s_count, %s, NULL).\n"
+  "The patterns are:\n\n", PCRE2_MAJOR, PCRE2_MINOR, name, name, name);
+
+for (i = 0; i < count; i++)
+  {
+  char *s;
+  fprintf(f, "  %4d: ", i);
+  for (s = pats[i].text; *s != 0; s++)
+    {
+    if (s[0] == '*' && s[1] == '/') fprintf(f, "*\\");
+    else fputc(*s, f);
+    }
+  fputc('\n', f);
+  }
+
+fprintf(f, "*/\n\n");
+fprintf(f, "#ifndef %s_H\n#define %s_H\n\n", name, name);
+fprintf(f, "#include <stddef.h>\n\n");
+fprintf(f, "#ifdef __cplusplus\nextern \"C\" {\n#endif\n\n");
+fprintf(f, "#define %s_COUNT %d\n", name, count);
+fprintf(f, "#define %s_PCRE2_MAJOR %d\n#define %s_PCRE2_MINOR %d\n\n", name,
+  PCRE2_MAJOR, name, PCRE2_MINOR);
+fprintf(f, "#if defined PCRE2_MAJOR && (PCRE2_MAJOR != %d || PCRE2_MINOR != %d)\n"
+  "#error \"%s.h was generated by PCRE2 %d.%d\"\n#endif\n\n", PCRE2_MAJOR,
+  PCRE2_MINOR, name, PCRE2_MAJOR, PCRE2_MINOR);
+fprintf(f, "struct pcre2_real_code_%d;\nstruct pcre2_real_general_context_%d;\n\n",
+  width, width);
+fprintf(f, "extern const unsigned char *const %s;\n", name);
+fprintf(f, "extern const size_t %s_size;\n", name);
+fprintf(f, "extern const int %s_count;\n\n", name);
+fprintf(f, "extern int %s_decode(struct pcre2_real_code_%d **,\n"
+  "  struct pcre2_real_general_context_%d *);\n\n", name, width, width);
+fprintf(f, "#ifdef __cplusplus\n}\n#endif\n\n#endif\n");
+}
+
+
+
+/*************************************************
+*                Main program                    *
+*************************************************/
+
+int
+main(int argc, char **argv)
+{
+const char *name = DEFAULT_NAME;
+const char *s;
+uint32_t options = 0;
+uint8_t *bytes = NULL;
+PCRE2_SIZE size = 0;
+patline *pats;
+int i, count, rc;
+FILE *f;
+
+for (i = 1; i < argc && argv[i][0] == '-' && argv[i][1] != 0; i++)
+  {
+  const char *arg = argv[i];
+  if (strcmp(arg, "-i") == 0) options |= PCRE2_CASELESS;
+  else if (strcmp(arg, "-m") == 0) options |= PCRE2_MULTILINE;
+  else if (strcmp(arg, "-s") == 0) options |= PCRE2_DOTALL;
+  else if (strcmp(arg, "-u") == 0) options |= PCRE2_UTF;
+  else if (strcmp(arg, "-U") == 0) options |= PCRE2_UTF|PCRE2_UCP;
+  else if (strcmp(arg, "-x") == 0) options |= PCRE2_EXTENDED;
+  else if (strcmp(arg, "-n") == 0 && i + 1 < argc) name = argv[++i];
+  else if (strcmp(arg, "-w") == 0 && i + 1 < argc) width = atoi(argv[++i]);
+  else
+    {
+    usage();
+    return 2;
+    }
+  }
+
+if (argc - i < 2 || argc - i > 3)
+  {
+  usage();
+  return 2;
+  }
+
+if (!isalpha((unsigned char)name[0]) && name[0] != '_')
+  {
+  fprintf(stderr, "pcre2precompile: \"%s\" is not a C identifier\n", name);
+  return 2;
+  }
+for (s = name + 1; *s != 0; s++)
+  {
+  if (!isalnum((unsigned char)*s) && *s != '_')
+    {
+    fprintf(stderr, "pcre2precompile: \"%s\" is not a C identifier\n", name);
+    return 2;
+    }
+  }
+
+pattern_file = argv[i];
+f = fopen(pattern_file, "rb");
+if (f == NULL)
+  {
+  fprintf(stderr, "pcre2precompile: failed to open %s: %s\n", pattern_file,
+    strerror(errno));
+  return 2;
+  }
+pats = read_patterns(f, &count);
+fclose(f);
+if (count < 0) return 2;
+if (count == 0)
+  {
+  fprintf(stderr, "pcre2precompile: %s contains no patterns\n", pattern_file);
+  return 2;
+  }
+
+switch(width)
+  {
+#ifdef SUPPORT_PCRE2_8
+  case 8:
+  rc = encode_8(pats, count, options, &bytes, &size);
+  break;
+#endif
+
+#ifdef SUPPORT_PCRE2_16
+  case 16:
+  rc = encode_16(pats, count, options, &bytes, &size);
+  break;
+#endif
+
+#ifdef SUPPORT_PCRE2_32
+  case 32:
+  rc = encode_32(pats, count, options, &bytes, &size);
+  break;
+#endif
+
+  default:
+  fprintf(stderr, "pcre2precompile: the %d-bit library is not available\n",
+    width);
+  return 2;
+  }
+
+if (rc == 0 && !check_library_version()) rc = 3;
+
+if (rc == 0)
+  {
+  f = fopen(argv[i+1], "wb");
+  if (f == NULL) rc = 2; else
+    {
+    write_source(f, name, bytes, size, count);
+    if (fclose(f) != 0) rc = 2;
+    }
+  }
+
+if (rc == 0 && i + 2 < argc)
+  {
+  f = fopen(argv[i+2], "wb");
+  if (f == NULL) rc = 2; else
+    {
+    write_header(f, name, pats, count);
+    if (fclose(f) != 0) rc = 2;
+    }
+  }
+
+if (rc == 2)
+  fprintf(stderr, "pcre2precompile: failed to write output: %s\n",
+    strerror(errno));
+
+/* The serialized bytes can be freed by any of the libraries, so use whichever
+one made them. */
+
+if (bytes != NULL) switch(width)
+  {
+#ifdef SUPPORT_PCRE2_8
+  case 8: pcre2_serialize_free_8(bytes); break;
+#endif
+#ifdef SUPPORT_PCRE2_16
+  case 16: pcre2_serialize_free_16(bytes); break;
+#endif
+#ifdef SUPPORT_PCRE2_32
+  case 32: pcre2_serialize_free_32(bytes); break;
+#endif
+  }
+
+for (i = 0; i < count; i++)
+  {
+  free(pats[i].text);
+  free(pats[i].units);
+  }
+free(pats);
+
+return (rc == 0)? 0 : (rc == 1)? 1 : 2;
+}
+
+/* End of pcre2precompile.c */
@@ -680,6 +680,8 @@ static modstruct modlist[] = {
   { "callout_none",                MOD_DAT,  MOD_CTL, CTL_CALLOUT_NONE,           DO(control) },
   { "caseless",                    MOD_PATP, MOD_OPT, PCRE2_CASELESS,             PO(options) },
   { "caseless_restrict",           MOD_CTC,  MOD_OPT, PCRE2_EXTRA_CASELESS_RESTRICT, CO(extra_options) },
+  { "class_maps",                  MOD_CTC,  MOD_OPTMZ, PCRE2_CLASS_MAPS,         0 },
+  { "class_maps_off",              MOD_CTC,  MOD_OPTMZ, PCRE2_CLASS_MAPS_OFF,     0 },
   { "convert",                     MOD_PAT,  MOD_CON, 0,                          PO(convert_type) },
   { "convert_glob_escape",         MOD_PAT,  MOD_CHR, 0,                          PO(convert_glob_escape) },
   { "convert_glob_separator",      MOD_PAT,  MOD_CHR, 0,                          PO(convert_glob_separator) },
@@ -927,6 +929,25 @@ table itself easier to read. */
 #define BACKSLASH_C 1
 #endif
 
+/* The Unicode tables may have been built without some of their columns; the
+library and this program are then compiled with PCRE2_UCD_OMIT_xxx macros. */
+
+#if defined SUPPORT_UNICODE && !defined PCRE2_UCD_OMIT_SCRIPTS
+#define UCD_HAS_SCRIPTS 1
+#else
+#define UCD_HAS_SCRIPTS 0
+#endif
+#if defined SUPPORT_UNICODE && !defined PCRE2_UCD_OMIT_BIDI
+#define UCD_HAS_BIDI 1
+#else
+#define UCD_HAS_BIDI 0
+#endif
+#if defined SUPPORT_UNICODE && !defined PCRE2_UCD_OMIT_BPROPS
+#define UCD_HAS_BPROPS 1
+#else
+#define UCD_HAS_BPROPS 0
+#endif
+
 typedef struct coptstruct {
   const char *name;
   uint32_t    type;
@@ -946,6 +967,7 @@ static coptstruct coptlist[] = {
   { "bsr",         CONF_BSR, PCRE2_CONFIG_BSR },
   { "ebcdic",      CONF_FIX, SUPPORT_EBCDIC },
   { "ebcdic-nl",   CONF_FIZ, EBCDIC_NL },
+  { "instrumentation", CONF_INT, PCRE2_CONFIG_INSTRUMENTATION },
   { "jit",         CONF_INT, PCRE2_CONFIG_JIT },
   { "jitusable",   CONF_JU,  0 },
   { "linksize",    CONF_INT, PCRE2_CONFIG_LINKSIZE },
@@ -953,6 +975,9 @@ static coptstruct coptlist[] = {
   { "pcre2-16",    CONF_FIX, SUPPORT_16 },
   { "pcre2-32",    CONF_FIX, SUPPORT_32 },
   { "pcre2-8",     CONF_FIX, SUPPORT_8 },
+  { "ucd-bidi",    CONF_FIX, UCD_HAS_BIDI },
+  { "ucd-bprops",  CONF_FIX, UCD_HAS_BPROPS },
+  { "ucd-scripts", CONF_FIX, UCD_HAS_SCRIPTS },
   { "unicode",     CONF_INT, PCRE2_CONFIG_UNICODE }
 };
 
@@ -4464,13 +4489,15 @@ static void
 show_optimize_flags(uint32_t flags, const char *before, const char *after)
 {
 if (flags == 0) fprintf(outfile, "%s<none>%s", before, after);
-else fprintf(outfile, "%s%s%s%s%s%s%s",
+else fprintf(outfile, "%s%s%s%s%s%s%s%s%s",
   before,
   ((flags & PCRE2_OPTIM_AUTO_POSSESS) != 0) ? "auto_possess" : "",
   ((flags & PCRE2_OPTIM_AUTO_POSSESS) != 0 && (flags >> 1) != 0) ? "," : "",
   ((flags & PCRE2_OPTIM_DOTSTAR_ANCHOR) != 0) ? "dotstar_anchor" : "",
   ((flags & PCRE2_OPTIM_DOTSTAR_ANCHOR) != 0 && (flags >> 2) != 0) ? "," : "",
   ((flags & PCRE2_OPTIM_START_OPTIMIZE) != 0) ? "start_optimize" : "",
+  ((flags & PCRE2_OPTIM_START_OPTIMIZE) != 0 && (flags >> 3) != 0) ? "," : "",
+  ((flags & PCRE2_OPTIM_CLASS_MAPS) != 0) ? "class_maps" : "",
   after);
 }
 
@@ -8918,6 +8945,7 @@ printf("     backslash-C    use of \\C is enabled [0, 1]\n");
 printf("     bsr            \\R type [ANYCRLF, ANY]\n");
 printf("     ebcdic         compiled for EBCDIC character code [0,1]\n");
 printf("     ebcdic-nl      NL code if compiled for EBCDIC\n");
+printf("     instrumentation  match instrumentation enabled [0, 1]\n");
 printf("     jit            just-in-time compiler supported [0, 1]\n");
 printf("     jitusable      test JIT usability [0, 1, 2, 3]\n");
 printf("     linksize       internal link size [2, 3, 4]\n");
@@ -9084,6 +9112,10 @@ if (optval != 0)
   printf("  UTF and UCP support (");
   print_unicode_version(stdout);
   printf(")\n");
+  if (!UCD_HAS_SCRIPTS || !UCD_HAS_BIDI || !UCD_HAS_BPROPS)
+    printf("    Omitted from the Unicode tables:%s%s%s\n",
+      UCD_HAS_SCRIPTS? "" : " scripts", UCD_HAS_BIDI? "" : " bidi",
+      UCD_HAS_BPROPS? "" : " bprops");
   }
 else printf("  No Unicode support\n");
 
@@ -9128,6 +9160,8 @@ printf("  \\R matches %s\n",
                                  "all Unicode newlines");
 (void)PCRE2_CONFIG(PCRE2_CONFIG_NEVER_BACKSLASH_C, &optval);
 printf("  \\C is %ssupported\n", optval? "not ":"");
+(void)PCRE2_CONFIG(PCRE2_CONFIG_INSTRUMENTATION, &optval);
+if (optval != 0) printf("  Match instrumentation is enabled\n");
 (void)PCRE2_CONFIG(PCRE2_CONFIG_LINKSIZE, &optval);
 printf("  Internal link size = %d\n", optval);
 (void)PCRE2_CONFIG(PCRE2_CONFIG_PARENSLIMIT, &optval);
@@ -0,0 +1,116 @@
+#include <dlfcn.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <sys/wait.h>
+#include <time.h>
+#include <unistd.h>
+
+#define PCRE2_CODE_UNIT_WIDTH 8
+#include <pcre2.h>
+
+/* What loading the 8-bit library costs a short-lived process: each of many
+   child processes dlopen()s the library named on the command line, looks up
+   pcre2_compile_8 and compiles one pattern, timing the two steps. This program
+   does not link with the library itself, so every child starts without it.
+   One line of JSON is printed for lazy binding and one for RTLD_NOW, with the
+   fastest and the median times in microseconds, so that builds with different
+   link options (see the relro, hash_style and symbolic_functions options) can
+   be compared. */
+
+#define PROCESSES 200
+
+typedef pcre2_code *(*compile_function)(PCRE2_SPTR, PCRE2_SIZE, uint32_t, int *, PCRE2_SIZE *,
+                                        pcre2_compile_context *);
+typedef void (*free_function)(pcre2_code *);
+
+static double microseconds(const struct timespec *start, const struct timespec *end) {
+    return (end->tv_sec - start->tv_sec) * 1e6 + (end->tv_nsec - start->tv_nsec) / 1e3;
+}
+
+/* Runs in the child: times[0] is the dlopen() time, times[1] that of the first compile */
+static int load_and_compile(const char *library, int mode, double times[2]) {
+    struct timespec t0, t1, t2;
+    void *handle;
+    compile_function compile;
+    free_function code_free;
+    pcre2_code *re;
+    int errcode;
+    PCRE2_SIZE erroffset;
+
+    clock_gettime(CLOCK_MONOTONIC, &t0);
+    handle = dlopen(library, mode);
+    clock_gettime(CLOCK_MONOTONIC, &t1);
+    if (handle == NULL)
+        return 1;
+    compile = (compile_function)dlsym(handle, "pcre2_compile_8");
+    code_free = (free_function)dlsym(handle, "pcre2_code_free_8");
+    if (compile == NULL || code_free == NULL)
+        return 1;
+    re = compile((PCRE2_SPTR)"(\\d+)-(\\d+)", PCRE2_ZERO_TERMINATED, 0, &errcode, &erroffset, NULL);
+    clock_gettime(CLOCK_MONOTONIC, &t2);
+    if (re == NULL)
+        return 1;
+    code_free(re);
+    times[0] = microseconds(&t0, &t1);
+    times[1] = microseconds(&t1, &t2);
+    return 0;
+}
+
+static int compare(const void *a, const void *b) {
+    double x = *(const double *)a, y = *(const double *)b;
+    return x < y ? -1 : x > y;
+}
+
+static int run(const char *library, int mode, const char *name) {
+    static double dlopen_times[PROCESSES], compile_times[PROCESSES];
+    int i;
+
+    for (i = 0; i < PROCESSES; i++) {
+        double times[2];
+        int fds[2], status;
+        pid_t pid;
+        ssize_t got;
+
+        if (pipe(fds) != 0)
+            return 1;
+        pid = fork();
+        if (pid < 0)
+            return 1;
+        if (pid == 0) {
+            close(fds[0]);
+            if (load_and_compile(library, mode, times) != 0 || write(fds[1], times, sizeof(times)) != sizeof(times))
+                _exit(1);
+            _exit(0);
+        }
+        close(fds[1]);
+        got = read(fds[0], times, sizeof(times));
+        close(fds[0]);
+        if (waitpid(pid, &status, 0) != pid || !WIFEXITED(status) || WEXITSTATUS(status) != 0 ||
+            got != sizeof(times)) {
+            printf("load failed: %s\n", library);
+            return 1;
+        }
+        dlopen_times[i] = times[0];
+        compile_times[i] = times[1];
+    }
+
+    qsort(dlopen_times, PROCESSES, sizeof(double), compare);
+    qsort(compile_times, PROCESSES, sizeof(double), compare);
+    printf("{\"binding\": \"%s\", \"processes\": %d, \"dlopen_us_min\": %.1f, \"dlopen_us_median\": %.1f, "
+           "\"compile_us_min\": %.1f, \"compile_us_median\": %.1f}\n",
+           name, PROCESSES, dlopen_times[0], dlopen_times[PROCESSES / 2], compile_times[0],
+           compile_times[PROCESSES / 2]);
+    return 0;
+}
+
+int main(int argc, char** argv) {
+    if (argc != 2) {
+        printf("usage: bench_load <path of libpcre2-8>\n");
+        return EXIT_FAILURE;
+    }
+    if (run(argv[1], RTLD_LAZY, "lazy") != 0)
+        return EXIT_FAILURE;
+    if (run(argv[1], RTLD_NOW, "now") != 0)
+        return EXIT_FAILURE;
+    return EXIT_SUCCESS;
+}
@@ -0,0 +1,258 @@
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+/* PCRE2_CODE_UNIT_WIDTH is set by CMakeLists.txt: 8, 16 or 32 */
+#include <pcre2.h>
+
+/* A short, fixed benchmark: each pattern is matched repeatedly against a
+   generated subject, once interpreted and once JIT-compiled (if the library
+   has JIT). Every run prints one line of JSON, so the output can be collected
+   and compared between builds. The subjects are the same for every width, so
+   each run must find the expected number of matches. One subject is ASCII;
+   the UTF patterns on it show what Unicode property lookups cost. The other
+   mixes scripts and cases, for caseless UTF matching. The third is chat text
+   with emoji, for grapheme clusters, and the fourth is user names, for script
+   runs. */
+
+#define SUBJECT_LINES 2000
+#define ITERATIONS    20
+
+enum { ASCII_SUBJECT, MIXED_SUBJECT, CHAT_SUBJECT, NAMES_SUBJECT };
+
+static const struct {
+    const char *pattern;
+    long expected;
+    uint32_t options;
+    int subject;
+} patterns[] = {
+    { "conan", 897, 0, ASCII_SUBJECT },
+    { "[a-z]+ing\\b", 2558, 0, ASCII_SUBJECT },
+    { "(\\d+)-(\\d+)-(\\d+)", 850, 0, ASCII_SUBJECT },
+    { "(?i)PACKAGE\\s+\\w+", 769, 0, ASCII_SUBJECT },
+    { "^.*error.*$", 712, 0, ASCII_SUBJECT },
+    { "\\p{L}+ing\\b", 2558, PCRE2_UTF | PCRE2_UCP, ASCII_SUBJECT },
+    { "(?i)PACKAGE\\s+\\w+", 769, PCRE2_UTF | PCRE2_UCP, ASCII_SUBJECT },
+    { "(?i)\\b(\\w+) \\1\\b", 1280, PCRE2_UTF | PCRE2_UCP, MIXED_SUBJECT },
+    { "(?i)\xd0\xba\xd0\xb8\xd1\x80\xd0\xb8\xd0\xbb\xd0\xbb\xd0\xb8\xd1\x86\xd0\xb0", 1831, PCRE2_UTF | PCRE2_UCP, MIXED_SUBJECT },
+    { "(?i)kelvin\\s+\\w+", 1634, PCRE2_UTF | PCRE2_UCP, MIXED_SUBJECT },
+    { "\\X{1,40}", 1173, PCRE2_UTF, CHAT_SUBJECT },
+    { "(*sr:[a-z ]+)", 3307, PCRE2_UTF | PCRE2_UCP, ASCII_SUBJECT },
+    { "\\b(*asr:\\w+)\\b", 8448, PCRE2_UTF | PCRE2_UCP, NAMES_SUBJECT },
+};
+
+static const char *const ascii_words[] = {
+    "building", "the", "conan", "package", "for", "pcre2", "with", "error",
+    "2024-05-17", "testing", "width", "regular", "expression", "matching",
+};
+
+/* UTF-8: Greek, Cyrillic, German, a titlecase digraph and the Kelvin sign */
+static const char *const mixed_words[] = {
+    "\xce\x95\xce\xbb\xce\xbb\xce\xb7\xce\xbd\xce\xb9\xce\xba\xce\xac",
+    "\xce\x95\xce\x9b\xce\x9b\xce\x97\xce\x9d\xce\x99\xce\x9a\xce\x86",
+    "\xd0\xba\xd0\xb8\xd1\x80\xd0\xb8\xd0\xbb\xd0\xbb\xd0\xb8\xd1\x86\xd0\xb0",
+    "\xd0\x9a\xd0\x98\xd0\xa0\xd0\x98\xd0\x9b\xd0\x9b\xd0\x98\xd0\xa6\xd0\x90",
+    "\xc3\x84rger", "\xc3\xa4RGER", "Stra\xc3\x9f" "e", "conan", "CONAN",
+    "\xc7\x85" "emal", "\xc7\x86" "EMAL", "\xe2\x84\xaa" "elvin", "kelvin",
+};
+
+/* UTF-8: chat messages with emoji modifier, ZWJ and flag sequences */
+static const char *const chat_words[] = {
+    "ok", "lol", "see you", "\xf0\x9f\x91\x8d\xf0\x9f\x8f\xbd",
+    "\xf0\x9f\x91\xa8\xe2\x80\x8d\xf0\x9f\x91\xa9\xe2\x80\x8d\xf0\x9f\x91\xa7",
+    "\xf0\x9f\x87\xa9\xf0\x9f\x87\xaa\xf0\x9f\x87\xab\xf0\x9f\x87\xb7",
+    "\xe2\x9d\xa4\xef\xb8\x8f", "cafe\xcc\x81", "\xf0\x9f\x98\x82\xf0\x9f\x98\x82",
+    "\xd0\xbf\xd1\x80\xd0\xb8\xd0\xb2\xd0\xb5\xd1\x82",
+};
+
+/* UTF-8: user names in several scripts, some of which mix scripts or digit
+   sets and so are not script runs */
+static const char *const name_words[] = {
+    "john_doe42", "ivan_petrov_1987",
+    "\xd0\xb8\xd0\xb2\xd0\xb0\xd0\xbd_\xd0\xbf\xd0\xb5\xd1\x82\xd1\x80\xd0\xbe\xd0\xb2",
+    "\xce\xb1\xce\xbb\xce\xb5\xce\xbe\xce\xb1\xce\xbd\xce\xb4\xcf\x81\xce\xbf\xcf\x82",
+    "\xe5\xb1\xb1\xe7\x94\xb0\xe5\xa4\xaa\xe9\x83\x8e",
+    "\xe3\x82\x84\xe3\x81\xbe\xe3\x81\xa0_\xe3\x81\x9f\xe3\x82\x8d\xe3\x81\x86",
+    "\xea\xb9\x80\xec\xb2\xa0\xec\x88\x98", "\xd1\x80\xd0\xb0" "ypal",
+    "user\xd9\xa3\xd9\xa4\xd9\xa5", "user\xd9\xa3\xd9\xa4" "5",
+};
+
+#define NUMBER_OF(array) (sizeof(array) / sizeof(array[0]))
+
+/* Converts UTF-8 to the library's code units; UTF-16 needs surrogates */
+static PCRE2_UCHAR *to_code_units(const char *s, size_t len, size_t *length) {
+    PCRE2_UCHAR *out = (PCRE2_UCHAR *)malloc((len + 1) * sizeof(PCRE2_UCHAR));
+    size_t n = 0;
+    if (out == NULL)
+        return NULL;
+#if PCRE2_CODE_UNIT_WIDTH == 8
+    memcpy(out, s, len);
+    n = len;
+#else
+    {
+        const unsigned char *p = (const unsigned char *)s;
+        const unsigned char *end = p + len;
+        while (p < end) {
+            uint32_t c = *p++;
+            int extra = c >= 0xf0 ? 3 : c >= 0xe0 ? 2 : c >= 0xc0 ? 1 : 0;
+            if (extra > 0)
+                c &= 0x3f >> extra;
+            for (; extra > 0 && p < end; extra--)
+                c = (c << 6) | (*p++ & 0x3f);
+#if PCRE2_CODE_UNIT_WIDTH == 16
+            if (c > 0xffff) {
+                out[n++] = (PCRE2_UCHAR)(0xd7c0 + (c >> 10));
+                c = 0xdc00 + (c & 0x3ff);
+            }
+#endif
+            out[n++] = (PCRE2_UCHAR)c;
+        }
+    }
+#endif
+    out[n] = 0;
+    if (length != NULL)
+        *length = n;
+    return out;
+}
+
+static char *make_subject(const char *const *words, size_t nwords, size_t *length) {
+    size_t longest = 0;
+    size_t len = 0;
+    unsigned int seed = 12345;
+    int line, w;
+    char *s;
+    for (w = 0; w < (int)nwords; w++)
+        if (strlen(words[w]) > longest)
+            longest = strlen(words[w]);
+    s = (char *)malloc(SUBJECT_LINES * 6 * (longest + 1) + 1);
+    if (s == NULL)
+        return NULL;
+    for (line = 0; line < SUBJECT_LINES; line++) {
+        for (w = 0; w < 6; w++) {
+            const char *word;
+            seed = seed * 1103515245u + 12345u;
+            word = words[(seed >> 16) % nwords];
+            len += (size_t)sprintf(s + len, w ? " %s" : "%s", word);
+        }
+        s[len++] = '\n';
+    }
+    *length = len;
+    return s;
+}
+
+/* Backslashes are the only characters in the patterns that need escaping */
+static void print_head(const char *pattern, uint32_t options, int jit) {
+    printf("{\"width\": %d, \"jit\": %s, \"utf\": %s, \"pattern\": \"", PCRE2_CODE_UNIT_WIDTH,
+           jit ? "true" : "false", (options & PCRE2_UTF) ? "true" : "false");
+    for (; *pattern != 0; pattern++)
+        printf(*pattern == '\\' ? "\\\\" : "%c", *pattern);
+    printf("\"");
+}
+
+/* Returns the number of matches found in one pass, or -1 on error. A UTF
+   subject is checked by the first call only, as pcre2demo does. */
+static long match_all(pcre2_code *re, PCRE2_SPTR subject, PCRE2_SIZE length, pcre2_match_data *md) {
+    PCRE2_SIZE offset = 0;
+    uint32_t match_options = 0;
+    long count = 0;
+    while (offset <= length) {
+        PCRE2_SIZE *ovector;
+        int rc = pcre2_match(re, subject, length, offset, match_options, md, NULL);
+        match_options = PCRE2_NO_UTF_CHECK;
+        if (rc == PCRE2_ERROR_NOMATCH)
+            break;
+        if (rc < 0)
+            return -1;
+        count++;
+        ovector = pcre2_get_ovector_pointer(md);
+        offset = ovector[1] > ovector[0] ? ovector[1] : ovector[1] + 1;
+    }
+    return count;
+}
+
+static int run(const char *pattern, long expected, uint32_t options, int jit, PCRE2_SPTR subject, PCRE2_SIZE length) {
+    PCRE2_UCHAR *wpattern = to_code_units(pattern, strlen(pattern), NULL);
+    pcre2_code *re;
+    pcre2_match_data *md;
+    int errcode, i;
+    PCRE2_SIZE erroffset;
+    long matches = 0;
+    clock_t start;
+    double seconds;
+
+    if (wpattern == NULL)
+        return 1;
+    re = pcre2_compile(wpattern, PCRE2_ZERO_TERMINATED, PCRE2_MULTILINE | options, &errcode, &erroffset, NULL);
+    free(wpattern);
+    if (re == NULL) {
+        /* A package built with a reduced ucd_tables option lacks some properties */
+        if (errcode == PCRE2_ERROR_UNKNOWN_UNICODE_PROPERTY || errcode == PCRE2_ERROR_SCRIPT_RUN_NOT_AVAILABLE ||
+            errcode == PCRE2_ERROR_SCRIPT_RUN_NO_SCRIPT_DATA) {
+            print_head(pattern, options, jit);
+            printf(", \"skipped\": true}\n");
+            return 0;
+        }
+        printf("compile failed: %s (error %d)\n", pattern, errcode);
+        return 1;
+    }
+    if (jit && pcre2_jit_compile(re, PCRE2_JIT_COMPLETE) != 0) {
+        print_head(pattern, options, jit);
+        printf(", \"skipped\": true}\n");
+        pcre2_code_free(re);
+        return 0;
+    }
+    md = pcre2_match_data_create_from_pattern(re, NULL);
+
+    start = clock();
+    for (i = 0; i < ITERATIONS; i++) {
+        matches = match_all(re, subject, length, md);
+        if (matches < 0)
+            break;
+    }
+    seconds = (double)(clock() - start) / CLOCKS_PER_SEC;
+
+    pcre2_match_data_free(md);
+    pcre2_code_free(re);
+    if (matches != expected) {
+        printf("match failed: %s (%ld matches, expected %ld)\n", pattern, matches, expected);
+        return 1;
+    }
+
+    print_head(pattern, options, jit);
+    printf(", \"iterations\": %d, \"subject_units\": %lu, \"matches\": %ld, \"seconds\": %.6f, \"mb_per_s\": %.2f}\n",
+           ITERATIONS, (unsigned long)length, matches, seconds,
+           seconds > 0 ? (double)length * ITERATIONS / seconds / 1e6 : 0.0);
+    return 0;
+}
+
+int main(int argc, char** argv) {
+    static const char *const *const words[] = { ascii_words, mixed_words, chat_words, name_words };
+    static const size_t nwords[] = { NUMBER_OF(ascii_words), NUMBER_OF(mixed_words), NUMBER_OF(chat_words),
+                                     NUMBER_OF(name_words) };
+    PCRE2_UCHAR *subjects[4] = { NULL, NULL, NULL, NULL };
+    size_t lengths[4];
+    uint32_t have_jit = 0;
+    size_t p;
+    int jit, rc = 0;
+
+    for (p = 0; p < NUMBER_OF(subjects); p++) {
+        size_t length;
+        char *text = make_subject(words[p], nwords[p], &length);
+        if (text == NULL || (subjects[p] = to_code_units(text, length, &lengths[p])) == NULL) {
+            printf("out of memory\n");
+            return EXIT_FAILURE;
+        }
+        free(text);
+    }
+    pcre2_config(PCRE2_CONFIG_JIT, &have_jit);
+
+    for (p = 0; p < NUMBER_OF(patterns); p++)
+        for (jit = 0; jit <= (int)have_jit; jit++)
+            rc |= run(patterns[p].pattern, patterns[p].expected, patterns[p].options, jit,
+                      subjects[patterns[p].subject], lengths[patterns[p].subject]);
+
+    for (p = 0; p < NUMBER_OF(subjects); p++)
+        free(subjects[p]);
+    return rc ? EXIT_FAILURE : EXIT_SUCCESS;
+}
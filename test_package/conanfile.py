@@ -1,23 +1,40 @@
-from conans import ConanFile, CMake
+from conan import ConanFile, tools
+import os
 
 
 class PackageTestConan(ConanFile):
     settings = "os", "compiler", "build_type", "arch"
-    generators = "cmake"
+    generators = "CMakeDeps", "CMakeToolchain", "VirtualRunEnv"
+
+    def layout(self):
+        tools.cmake.cmake_layout(self)
+
+    def requirements(self):
+        self.requires(self.tested_reference_str)
 
     def build(self):
-        cmake = CMake(self)
-        cmake.verbose = True
+        cmake = tools.cmake.CMake(self)
         cmake.configure()
         cmake.build()
 
-    def imports(self):
-        self.copy("*.pdb", dst="bin", src="bin")
-        self.copy("*.dll", dst="bin", src="bin")
-        self.copy("*.so.*", dst="bin", src="lib")
+    def _run_bin(self, name, *args):
+        cmd = " ".join([os.path.join(self.cpp.build.bindir, name)] + list(args))
+        self.run(cmd, env="conanrun")
 
     def test(self):
-        if self.settings.os == "Windows" and self.settings.compiler == "Visual Studio":
-            self.run("ctest --verbose --build-config %s" % self.settings.build_type)
-        else:
-            self.run("ctest --verbose")
+        if not tools.build.can_run(self):
+            return
+        options = self.dependencies["pcre2"].options
+        if options.build_pcre2_8:
+            self._run_bin("test_pcre2")
+            self._run_bin("test_pcre2_posix")
+            if options.get_safe("build_pcre2precompile"):
+                self._run_bin("test_pcre2_precompiled")
+        # One line of JSON per width, pattern and JIT mode
+        for width in (8, 16, 32):
+            if options.get_safe("build_pcre2_%d" % width):
+                self._run_bin("bench_pcre2_%d" % width)
+        # Per-process cost of loading the shared library, one line of JSON per binding mode
+        library = os.path.join(self.dependencies["pcre2"].package_folder, "lib", "libpcre2-8.so")
+        if options.build_pcre2_8 and options.shared and os.path.isfile(library):
+            self._run_bin("bench_load", f'"{library}"')
@@ -0,0 +1,25 @@
+#include <stdio.h>
+#include <stdlib.h>
+
+#include <pcre2posix.h>
+
+int main(int argc, char** argv) {
+
+    regex_t re;
+    regmatch_t pmatch[1];
+    const char *subject = "conan";
+
+    if (regcomp(&re, "\\w+", REG_EXTENDED) != 0) {
+        printf("regcomp failed\n");
+        return EXIT_FAILURE;
+    }
+    if (regexec(&re, subject, 1, pmatch, 0) != 0) {
+        printf("regexec failed\n");
+        regfree(&re);
+        return EXIT_FAILURE;
+    }
+    printf("posix match: %.*s\n", (int)(pmatch[0].rm_eo - pmatch[0].rm_so), subject + pmatch[0].rm_so);
+    regfree(&re);
+
+    return EXIT_SUCCESS;
+}
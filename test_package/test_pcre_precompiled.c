@@ -0,0 +1,36 @@
+#include <stdio.h>
+#include <stdlib.h>
+
+#define PCRE2_CODE_UNIT_WIDTH 8
+#include <pcre2.h>
+
+#include "test_patterns.h"
+
+int main(int argc, char** argv) {
+
+    pcre2_code *codes[test_patterns_COUNT];
+    pcre2_match_data *match_data;
+    PCRE2_SIZE* ovector;
+    const char *subject = "conan 10-45";
+    int rc, i;
+
+    rc = test_patterns_decode(codes, NULL);
+    if (rc != test_patterns_COUNT) {
+        printf("test_patterns_decode failed: %d\n", rc);
+        return EXIT_FAILURE;
+    }
+
+    for (i = 0; i < rc; i++) {
+        match_data = pcre2_match_data_create_from_pattern(codes[i], NULL);
+        if (pcre2_match(codes[i], (PCRE2_SPTR)subject, PCRE2_ZERO_TERMINATED, 0, 0, match_data, NULL) < 0) {
+            printf("precompiled pattern %d did not match\n", i);
+            return EXIT_FAILURE;
+        }
+        ovector = pcre2_get_ovector_pointer(match_data);
+        printf("precompiled match %d: %.*s\n", i, (int)(ovector[1] - ovector[0]), subject + ovector[0]);
+        pcre2_match_data_free(match_data);
+        pcre2_code_free(codes[i]);
+    }
+
+    return EXIT_SUCCESS;
+}